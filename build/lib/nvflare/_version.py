@@ -0,0 +1,21 @@
+
+# This file was generated by 'versioneer.py' (0.21) from
+# revision-control system data, or from the parent directory name of an
+# unpacked source archive. Distribution tarballs contain a pre-generated copy
+# of this file.
+
+import json
+
+version_json = '''
+{
+ "date": "2026-10-18T10:50:36+0000",
+ "dirty": false,
+ "error": null,
+ "full-revisionid": "75c58cf9fc13a1ceaf840407b6a63d33d2e9b5b0",
+ "version": "0+untagged.52.g75c58cf"
+}
+'''  # END VERSION_JSON
+
+
+def get_versions():
+    return json.loads(version_json)
@@ -0,0 +1,261 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import sqlite3
+import threading
+from enum import Enum
+from typing import Iterable, List, Optional, Set
+
+from nvflare.apis.job_def import JobMetaKey, get_job_meta_study
+
+_SCHEMA_VERSION = "1"
+_INFO_VERSION = "version"
+_INFO_BUILT = "built"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    job_id_key TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    status TEXT,
+    submitter TEXT,
+    study TEXT NOT NULL,
+    submit_time REAL NOT NULL,
+    meta TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, submit_time);
+CREATE INDEX IF NOT EXISTS jobs_study ON jobs (study, submit_time);
+CREATE INDEX IF NOT EXISTS jobs_submitter ON jobs (submitter, submit_time);
+CREATE INDEX IF NOT EXISTS jobs_submit_time ON jobs (submit_time);
+"""
+
+_INSERT = "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def _to_values(values) -> Optional[list]:
+    if values is None:
+        return None
+    if isinstance(values, (str, Enum)) or not isinstance(values, Iterable):
+        values = [values]
+    return [v.value if isinstance(v, Enum) else v for v in values]
+
+
+def _submit_time(meta: dict) -> float:
+    submit_time = meta.get(JobMetaKey.SUBMIT_TIME.value)
+    return float(submit_time) if isinstance(submit_time, (int, float)) else 0.0
+
+
+def _to_row(meta: dict) -> tuple:
+    job_id = meta[JobMetaKey.JOB_ID.value]
+    return (
+        job_id,
+        job_id.lower(),
+        (meta.get(JobMetaKey.JOB_NAME.value) or "").lower(),
+        meta.get(JobMetaKey.STATUS.value),
+        meta.get(JobMetaKey.SUBMITTER_NAME.value),
+        get_job_meta_study(meta),
+        _submit_time(meta),
+        json.dumps(meta),
+    )
+
+
+def match_job_meta(
+    meta: dict,
+    status=None,
+    submitter: Optional[str] = None,
+    study: Optional[str] = None,
+    job_id_prefix: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    submitted_after: Optional[float] = None,
+    submitted_before: Optional[float] = None,
+) -> bool:
+    """Check whether the job meta matches the query conditions. See JobMetaIndex.query for the conditions."""
+    statuses = _to_values(status)
+    if statuses is not None and meta.get(JobMetaKey.STATUS.value) not in statuses:
+        return False
+    if submitter is not None and meta.get(JobMetaKey.SUBMITTER_NAME.value) != submitter:
+        return False
+    if study is not None and get_job_meta_study(meta) != study:
+        return False
+    if job_id_prefix and not (meta.get(JobMetaKey.JOB_ID.value) or "").lower().startswith(job_id_prefix.lower()):
+        return False
+    if name_prefix and not (meta.get(JobMetaKey.JOB_NAME.value) or "").lower().startswith(name_prefix.lower()):
+        return False
+    submit_time = _submit_time(meta)
+    if submitted_after is not None and submit_time < submitted_after:
+        return False
+    if submitted_before is not None and submit_time >= submitted_before:
+        return False
+    return True
+
+
+class JobMetaIndex:
+    def __init__(self, db_path: str):
+        """An SQLite index of job metas.
+
+        The index keeps a copy of the meta of every job in the job store, so jobs can be looked up by status,
+        submitter, study and submit time without reading the meta of every job from the store.
+
+        The index is only a cache of the job store: it is not "built" until it's loaded with the metas of all jobs
+        in the store, and it can be rebuilt from the store at any time.
+
+        Args:
+            db_path: path of the SQLite database file
+        """
+        self.db_path = db_path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                row = conn.execute("SELECT value FROM index_info WHERE key = ?", (_INFO_VERSION,)).fetchone()
+                if not row or row[0] != _SCHEMA_VERSION:
+                    # unknown layout - the content will be reloaded from the store
+                    conn.execute("DELETE FROM index_info")
+                    conn.execute("INSERT INTO index_info VALUES (?, ?)", (_INFO_VERSION, _SCHEMA_VERSION))
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def is_built(self) -> bool:
+        with self._lock:
+            row = self._get_conn().execute("SELECT value FROM index_info WHERE key = ?", (_INFO_BUILT,)).fetchone()
+            return bool(row)
+
+    def invalidate(self):
+        """Mark the index as not built, so it is rebuilt from the store before it's used again."""
+        with self._lock:
+            self._get_conn().execute("DELETE FROM index_info WHERE key = ?", (_INFO_BUILT,))
+
+    def rebuild(self, metas: Iterable[dict]) -> int:
+        """Replace the content of the index with the specified job metas.
+
+        Args:
+            metas: metas of all jobs in the store
+
+        Returns: number of jobs in the index
+        """
+        rows = [_to_row(meta) for meta in metas]
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM jobs")
+                conn.executemany(_INSERT, rows)
+                conn.execute("INSERT OR REPLACE INTO index_info VALUES (?, ?)", (_INFO_BUILT, "1"))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def put(self, meta: dict):
+        """Add the job meta to the index, or replace the existing meta of the job."""
+        row = _to_row(meta)
+        with self._lock:
+            self._get_conn().execute(_INSERT, row)
+
+    def remove(self, job_id: str):
+        with self._lock:
+            self._get_conn().execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def job_ids(self) -> Set[str]:
+        with self._lock:
+            return {row[0] for row in self._get_conn().execute("SELECT job_id FROM jobs")}
+
+    def query(
+        self,
+        status=None,
+        submitter: Optional[str] = None,
+        study: Optional[str] = None,
+        job_id_prefix: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        submitted_after: Optional[float] = None,
+        submitted_before: Optional[float] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[dict]:
+        """Get metas of the jobs that match all the specified conditions, ordered by submit time.
+
+        Args:
+            status: a status or a list of statuses of the jobs
+            submitter: name of the submitter of the jobs
+            study: study of the jobs
+            job_id_prefix: case-insensitive prefix of the job IDs
+            name_prefix: case-insensitive prefix of the job names
+            submitted_after: min submit time (inclusive) of the jobs
+            submitted_before: max submit time (exclusive) of the jobs
+            newest_first: whether to return the most recently submitted jobs first
+            limit: max number of jobs to return. None means no limit.
+            offset: number of matching jobs to skip
+
+        Returns: list of job metas
+        """
+        conditions = []
+        params = []
+        statuses = _to_values(status)
+        if statuses is not None:
+            if not statuses:
+                return []
+            conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if submitter is not None:
+            conditions.append("submitter = ?")
+            params.append(submitter)
+        if study is not None:
+            conditions.append("study = ?")
+            params.append(study)
+        if job_id_prefix:
+            conditions.append("substr(job_id_key, 1, ?) = ?")
+            params.extend([len(job_id_prefix), job_id_prefix.lower()])
+        if name_prefix:
+            conditions.append("substr(name_key, 1, ?) = ?")
+            params.extend([len(name_prefix), name_prefix.lower()])
+        if submitted_after is not None:
+            conditions.append("submit_time >= ?")
+            params.append(submitted_after)
+        if submitted_before is not None:
+            conditions.append("submit_time < ?")
+            params.append(submitted_before)
+
+        sql = "SELECT meta FROM jobs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        order = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY submit_time {order}, job_id {order}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
+
+        with self._lock:
+            rows = self._get_conn().execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
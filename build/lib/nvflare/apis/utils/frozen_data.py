@@ -0,0 +1,134 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+import sys
+import threading
+from enum import Enum
+from typing import Any
+
+import numpy as np
+
+from nvflare.apis.shareable import Shareable
+
+# values of these types cannot be modified in place, so they are shared as is
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), Enum, np.generic, frozenset)
+
+# arrays that are made read-only by frozen data: id(array) => [array, number of FrozenData objects]
+_locked_arrays = {}
+_locked_arrays_lock = threading.Lock()
+
+
+def _lock_array(arr: np.ndarray) -> bool:
+    with _locked_arrays_lock:
+        entry = _locked_arrays.get(id(arr))
+        if entry:
+            entry[1] += 1
+            return True
+
+        if not arr.flags.writeable:
+            # already read-only: nothing to restore
+            return False
+
+        arr.flags.writeable = False
+        _locked_arrays[id(arr)] = [arr, 1]
+        return True
+
+
+def _unlock_array(arr: np.ndarray):
+    with _locked_arrays_lock:
+        entry = _locked_arrays.get(id(arr))
+        if not entry:
+            return
+
+        entry[1] -= 1
+        if entry[1] <= 0:
+            _locked_arrays.pop(id(arr))
+            try:
+                arr.flags.writeable = True
+            except ValueError:
+                # the base of the array was made read-only by its owner
+                pass
+
+
+class FrozenData:
+    def __init__(self, source: Shareable):
+        """A read-only view of a Shareable, created without copying its arrays and tensors.
+
+        The containers (dicts, lists and tuples) of the source are copied, so entries added to or replaced in the
+        source are not seen by the view. NumPy arrays are shared as read-only views, and the source arrays are
+        made read-only until the view is released: in-place modification of them raises an error instead of
+        changing the data seen by the view. Torch tensors are shared as is: they cannot be made read-only, so
+        their in-place modifications are detected with is_intact(). Other objects are deep-copied.
+
+        Args:
+            source: the Shareable to be frozen
+        """
+        self._locked_arrays = []
+        self._tensor_versions = []  # list of (tensor, version when frozen)
+        self._released = False
+        self.data = self._freeze(source)
+
+    def _freeze(self, value: Any):
+        if isinstance(value, _IMMUTABLE_TYPES):
+            return value
+
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                # elements are references to mutable objects
+                return copy.deepcopy(value)
+            if _lock_array(value):
+                self._locked_arrays.append(value)
+            view = value.view()
+            view.flags.writeable = False
+            return view
+
+        # torch is not imported here: if it is not imported by the app, the data cannot have tensors
+        torch = sys.modules.get("torch")
+        if torch is not None and isinstance(value, torch.Tensor):
+            tensor = value.detach()
+            self._tensor_versions.append((tensor, tensor._version))
+            return tensor
+
+        if isinstance(value, dict):
+            frozen = copy.copy(value)
+            for k, v in value.items():
+                frozen[k] = self._freeze(v)
+            return frozen
+
+        if type(value) is list:
+            return [self._freeze(v) for v in value]
+
+        if type(value) is tuple:
+            return tuple(self._freeze(v) for v in value)
+
+        return copy.deepcopy(value)
+
+    def is_intact(self) -> bool:
+        """Check whether the tensors of the data were modified in place since the data was frozen.
+
+        Returns: whether the data is intact
+        """
+        return all(t._version == v for t, v in self._tensor_versions)
+
+    def release(self):
+        """Release the source arrays, so they can be modified in place again.
+
+        The view keeps its read-only arrays.
+        """
+        if self._released:
+            return
+        self._released = True
+        for arr in self._locked_arrays:
+            _unlock_array(arr)
+        self._locked_arrays.clear()
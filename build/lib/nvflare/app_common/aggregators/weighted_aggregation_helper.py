@@ -0,0 +1,582 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+from nvflare.app_common.utils.sparse_array import SparseArray
+
+
+def _is_aggregatable_metric_value(v: Any) -> bool:
+    """Return True if the metric value supports weighted aggregation (v * weight and addition).
+
+    Boolean values are considered aggregatable and treated as binary values
+    (`True=1.0`, `False=0.0`) when averaged.
+    """
+    if v is None:
+        return False
+    if isinstance(v, (dict, list, set, tuple, str)):
+        return False
+    # Bool metrics are treated as binary values (True=1, False=0) and averaged.
+    if isinstance(v, (int, float, bool)):
+        return True
+    try:
+        _ = v * 1.0
+        _ = v + v
+        return True
+    except (TypeError, ValueError, AttributeError):
+        return False
+
+
+def filter_aggregatable_metrics(
+    metrics: Optional[Dict[str, Any]],
+    warn_skipped: Optional[Callable[[str, str], None]] = None,
+    warned_metric_keys: Optional[Set[str]] = None,
+) -> Dict[str, Any]:
+    """Return metric entries that support weighted aggregation.
+
+    Note:
+        Boolean metric values are included and aggregate as binary rates.
+
+    Args:
+        metrics: Dict of metric name -> value.
+        warn_skipped: Optional callback invoked as warn_skipped(key, type_name) for skipped metrics.
+        warned_metric_keys: Optional set of keys already warned about. If provided, warnings are emitted
+            at most once per key and newly warned keys are added to this set.
+    """
+    if not metrics:
+        return {}
+
+    filtered = {}
+    for key, value in metrics.items():
+        if _is_aggregatable_metric_value(value):
+            filtered[key] = value
+            continue
+        if warn_skipped is None:
+            continue
+        if warned_metric_keys is None or key not in warned_metric_keys:
+            warn_skipped(key, type(value).__name__)
+            if warned_metric_keys is not None:
+                warned_metric_keys.add(key)
+    return filtered
+
+
+def _materialize(v):
+    # Disk-streamed payloads may pass lazy refs
+    # instead of in-memory tensors. If present, materialize() loads
+    # the tensor from disk before weighted aggregation math.
+    materialize_fn = getattr(v, "materialize", None)
+    if callable(materialize_fn):
+        return materialize_fn()
+    return v
+
+
+def _is_pytorch_tensor(tensor):
+    """Check if tensor is a PyTorch tensor with in-place operation support."""
+    return hasattr(tensor, "add_") and hasattr(tensor, "mul_") and hasattr(tensor, "clone")
+
+
+class _FlatGroup:
+    """Values of the same framework, dtype and device that are aggregated in one contiguous buffer."""
+
+    def __init__(self, sample):
+        self.is_tensor = _is_pytorch_tensor(sample)
+        self.dtype = sample.dtype
+        self.device = sample.device if self.is_tensor else None
+        self.keys: List[str] = []
+        self.shapes = []
+        self.sizes: List[int] = []
+        self.size = 0
+        self.scratch = None
+
+    @staticmethod
+    def group_id(v):
+        """Get the id of the group the value belongs to, or None if the value cannot be aggregated flat."""
+        if isinstance(v, np.ndarray):
+            if v.dtype.kind == "f":
+                return "np", v.dtype
+        elif _is_pytorch_tensor(v):
+            if v.is_floating_point() and not v.is_sparse:
+                return "pt", v.dtype, v.device
+        return None
+
+    def add_key(self, key: str, v):
+        n = v.numel() if self.is_tensor else v.size
+        self.keys.append(key)
+        self.shapes.append(tuple(v.shape))
+        self.sizes.append(n)
+        self.size += n
+
+    def new_buffer(self):
+        if self.is_tensor:
+            import torch
+
+            return torch.empty(self.size, dtype=self.dtype, device=self.device)
+        return np.empty(self.size, dtype=self.dtype)
+
+    def flatten(self, data: dict, out):
+        """Copy the values of the group's keys in the data into the flat buffer with one concatenation."""
+        values = list(map(data.__getitem__, self.keys))
+        if self.is_tensor:
+            import torch
+
+            values = [v if isinstance(v, torch.Tensor) else _materialize(v) for v in values]
+            # torch.cat would resize the output, or cast the values, instead of failing
+            for v, shape in zip(values, self.shapes):
+                if tuple(v.shape) != shape or v.dtype != self.dtype:
+                    raise ValueError(f"expect a tensor of shape {shape} and dtype {self.dtype}")
+            torch.cat([v.ravel() for v in values], out=out)
+        else:
+            # axis=None flattens the arrays as part of the concatenation
+            np.concatenate(values, axis=None, out=out)
+
+    def split(self, buffer) -> dict:
+        """Get the value of each key from the flat buffer."""
+        if self.is_tensor:
+            # tensors sharing one storage cannot be saved individually (e.g. by safetensors), so each is copied
+            parts = [p.view(shape).clone() for p, shape in zip(buffer.split(self.sizes), self.shapes)]
+        else:
+            parts = [p.reshape(shape) for p, shape in zip(np.split(buffer, np.cumsum(self.sizes[:-1])), self.shapes)]
+        return dict(zip(self.keys, parts))
+
+
+class _FlatLayout:
+    """The key layout of the contributions, built from the first contribution of a round.
+
+    The exclude_vars regex is evaluated once when the layout is built, not for every contribution.
+    """
+
+    def __init__(self, data: dict, exclude_vars):
+        self.keys = frozenset(data.keys())
+        self.sparse_keys = frozenset(k for k, v in data.items() if isinstance(v, SparseArray))
+        self.order: List[str] = []
+        self.groups: Dict[Any, _FlatGroup] = {}
+        self.other_keys: List[str] = []
+        for k, v in data.items():
+            if exclude_vars is not None and exclude_vars.search(k):
+                continue
+            self.order.append(k)
+            v = _materialize(v)
+            gid = _FlatGroup.group_id(v)
+            if gid is None:
+                self.other_keys.append(k)
+                continue
+            group = self.groups.get(gid)
+            if group is None:
+                group = _FlatGroup(v)
+                self.groups[gid] = group
+            group.add_key(k, v)
+
+    def matches(self, data: dict) -> bool:
+        # sparse values are aggregated per key, so they must be at the same keys as in the layout
+        if data.keys() != self.keys:
+            return False
+        if frozenset(k for k, v in data.items() if isinstance(v, SparseArray)) != self.sparse_keys:
+            return False
+
+        # values of another shape or dtype would be silently reshaped or cast by the concatenation
+        for gid, group in self.groups.items():
+            for k, shape in zip(group.keys, group.shapes):
+                v = data[k]
+                if callable(getattr(v, "materialize", None)):
+                    # lazy refs are only loaded when flattened, which fails if their size differs
+                    continue
+                if _FlatGroup.group_id(v) != gid or tuple(v.shape) != shape:
+                    return False
+        return True
+
+
+class WeightedAggregationHelper(object):
+    def __init__(self, exclude_vars: Optional[str] = None, weigh_by_local_iter: bool = True, flat_buffer: bool = False):
+        """Perform weighted aggregation.
+
+        Args:
+            exclude_vars (str, optional): regex string to match excluded vars during aggregation. Defaults to None.
+            weigh_by_local_iter (bool, optional): Whether to weight the contributions by the number of iterations
+                performed in local training in the current round. Defaults to `True`.
+                Setting it to `False` can be useful in applications such as homomorphic encryption to reduce
+                the number of computations on encrypted ciphertext.
+                The aggregated sum will still be divided by the provided weights and `aggregation_weights` for the
+                resulting weighted sum to be valid.
+            flat_buffer (bool, optional): Whether to aggregate floating-point NumPy arrays and PyTorch tensors in
+                one contiguous buffer per dtype (and device). The key layout is built from the first contribution,
+                and each later contribution is accumulated with one vectorized multiply-add over the whole buffer
+                instead of one operation per key. This needs one extra model-sized scratch buffer. Other values,
+                and contributions whose keys differ from the layout, are aggregated per key. Defaults to `False`.
+
+        `SparseArray` values (e.g. from the `SparsifyUpdate` filter) are added into the dense total of their key.
+        """
+        super().__init__()
+        self.lock = threading.Lock()
+        self.exclude_vars = re.compile(exclude_vars) if exclude_vars else None
+        self.weigh_by_local_iter = weigh_by_local_iter
+        self.flat_buffer = flat_buffer
+        self.layout: Optional[_FlatLayout] = None
+        self.reset_stats()
+        self.total = dict()
+        self.counts = dict()
+        self.history = list()
+
+    def reset_stats(self):
+        self.total = dict()
+        self.counts = dict()
+        self.history = list()
+        # flat buffers of the layout groups and their sum of weights; the layout itself is kept for the next round
+        self.flat_total = None
+        self.flat_count = 0
+
+    @staticmethod
+    def _is_pytorch_tensor(tensor):
+        """Check if tensor is a PyTorch tensor with in-place operation support."""
+        return _is_pytorch_tensor(tensor)
+
+    def _add_flat(self, data, weight, source_formats: Optional[Dict[str, str]] = None) -> bool:
+        """Accumulate the contribution into the flat buffers.
+
+        Returns: whether the contribution was accumulated; False if it does not match the layout.
+        """
+        if self.flat_total is None:
+            if self.history:
+                # the earlier contributions of this round are aggregated per key
+                return False
+            if self.layout is None or not self.layout.matches(data):
+                self.layout = _FlatLayout(data, self.exclude_vars)
+        elif not self.layout.matches(data):
+            return False
+
+        groups = self.layout.groups.values()
+        alpha = weight if self.weigh_by_local_iter else 1.0
+        if self.flat_total is None:
+            totals = [g.new_buffer() for g in groups]
+            try:
+                for g, total in zip(groups, totals):
+                    g.flatten(data, total)
+            except (RuntimeError, TypeError, ValueError):
+                # e.g. a lazy ref of another size: this round is aggregated per key
+                return False
+            if alpha != 1.0:
+                for total in totals:
+                    total *= alpha
+            self.flat_total = totals
+        else:
+            # flatten all groups before accumulating so a failure leaves the totals intact
+            try:
+                for g in groups:
+                    if g.scratch is None:
+                        g.scratch = g.new_buffer()
+                    g.flatten(data, g.scratch)
+            except (RuntimeError, TypeError, ValueError):
+                return False
+
+            for g, total in zip(groups, self.flat_total):
+                if g.is_tensor:
+                    total.add_(g.scratch, alpha=alpha)
+                else:
+                    if alpha != 1.0:
+                        np.multiply(g.scratch, alpha, out=g.scratch)
+                    np.add(total, g.scratch, out=total)
+
+        self.flat_count += weight
+        for k in self.layout.other_keys:
+            self._add_item(k, _materialize(data[k]), weight, source_formats)
+        return True
+
+    def _unflatten(self):
+        """Move the flat totals into per-key totals so the following contributions can be added per key."""
+        if self.flat_total is None:
+            return
+        flat = {}
+        for g, total in zip(self.layout.groups.values(), self.flat_total):
+            flat.update(g.split(total))
+        for k in flat:
+            self.counts[k] = self.flat_count
+        # keep the key order of the contributions
+        self.total = {k: flat[k] if k in flat else self.total[k] for k in self.layout.order}
+        self.flat_total = None
+        self.flat_count = 0
+
+    def add(self, data, weight, contributor_name, contribution_round, source_formats: Optional[Dict[str, str]] = None):
+        """Compute weighted sum and sum of weights.
+
+        Args:
+            data: dict of the params to add
+            weight: weight of the contribution
+            contributor_name: name of the contributor
+            contribution_round: round of the contribution
+            source_formats: optional dict of param name -> "numpy" or "torch", the format that `SparseArray` params
+                had before they were sparsified (see `SparsifyUpdate`). The totals of "torch" params are tensors.
+        """
+        with self.lock:
+            if not (self.flat_buffer and self._add_flat(data, weight, source_formats)):
+                self._unflatten()
+                for k, v in data.items():
+                    if self.exclude_vars is not None and self.exclude_vars.search(k):
+                        continue
+                    self._add_item(k, _materialize(v), weight, source_formats)
+
+            self.history.append(
+                {
+                    "contributor_name": contributor_name,
+                    "round": contribution_round,
+                    "weight": weight,
+                }
+            )
+
+    def _add_sparse_item(self, k, v: SparseArray, weight, source_format: Optional[str] = None):
+        # the kept values are added into the dense total: the contribution is never densified
+        current_total = self.total.get(k, None)
+        if current_total is None:
+            current_total = np.zeros(v.shape, dtype=v.dtype)
+            if source_format == "torch":
+                import torch
+
+                # the param was a tensor: keep the total a tensor like the totals of the dense tensor params
+                current_total = torch.from_numpy(current_total)
+            self.total[k] = current_total
+            self.counts[k] = weight
+        else:
+            self.counts[k] = self.counts[k] + weight
+        v.add_to(current_total, weight if self.weigh_by_local_iter else 1.0)
+
+    def _add_item(self, k, v, weight, source_formats: Optional[Dict[str, str]] = None):
+        if isinstance(v, SparseArray):
+            self._add_sparse_item(k, v, weight, source_formats.get(k) if source_formats else None)
+            return
+
+        current_total = self.total.get(k, None)
+        if current_total is None:
+            # First contribution: initialize accumulator
+            # We must create a copy to avoid mutating caller's input tensors
+            if self._is_pytorch_tensor(v):
+                if self.weigh_by_local_iter:
+                    # Weigh by local iter: create weighted copy (multiply by weight)
+                    self.total[k] = v.mul(weight)
+                else:
+                    self.total[k] = v.clone()
+            else:
+                # Fallback for non-PyTorch tensors
+                if self.weigh_by_local_iter:
+                    # Multiply creates a new array/tensor, no aliasing issue
+                    self.total[k] = v * weight
+                else:
+                    # For HE mode: try to copy to avoid aliasing
+                    # But encrypted tensors can't be copied (requires secret key)
+                    try:
+                        self.total[k] = v.copy() if hasattr(v, "copy") else v
+                    except (ValueError, RuntimeError):
+                        # Encrypted tensor copy failed, use reference (safe, immutable)
+                        self.total[k] = v
+            self.counts[k] = weight
+        else:
+            # Subsequent contributions: use in-place operations
+            if self._is_pytorch_tensor(v) and self._is_pytorch_tensor(current_total):
+                if self.weigh_by_local_iter:
+                    # Weigh by local iter: weighted accumulation
+                    self.total[k].add_(v, alpha=weight)
+                else:
+                    self.total[k].add_(v)
+            else:
+                # Fallback for non-PyTorch tensors
+                if self.weigh_by_local_iter:
+                    self.total[k] = current_total + v * weight
+                else:
+                    self.total[k] = current_total + v
+            self.counts[k] = self.counts[k] + weight
+
+    def get_result(self):
+        """Divide weighted sum by sum of weights."""
+        with self.lock:
+            aggregated_dict = {}
+            if self.flat_total is not None:
+                for g, total in zip(self.layout.groups.values(), self.flat_total):
+                    if g.is_tensor:
+                        total.div_(self.flat_count)
+                    else:
+                        total *= 1.0 / self.flat_count
+                    aggregated_dict.update(g.split(total))
+
+            for k, v in self.total.items():
+                if self._is_pytorch_tensor(v):
+                    # For PyTorch tensors, use in-place division to avoid creating a copy
+                    aggregated_dict[k] = v.div_(self.counts[k])
+                else:
+                    # Fallback for non-PyTorch tensors (including encrypted tensors)
+                    aggregated_dict[k] = v * (1.0 / self.counts[k])
+
+            if self.flat_total is not None:
+                # keep the key order of the contributions
+                aggregated_dict = {k: aggregated_dict[k] for k in self.layout.order if k in aggregated_dict}
+
+            self.reset_stats()
+            return aggregated_dict
+
+    def get_history(self):
+        return self.history
+
+    def get_len(self):
+        return len(self.get_history())
+
+    def close(self):
+        """Nothing to release: this is for the same interface as `ShardedWeightedAggregationHelper`."""
+        pass
+
+
+def _value_size(v) -> int:
+    nbytes = getattr(v, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    numel = getattr(v, "numel", None)
+    if callable(numel):
+        return numel()
+    return 1
+
+
+class ShardedWeightedAggregationHelper(object):
+    def __init__(
+        self,
+        num_shards: int,
+        exclude_vars: Optional[str] = None,
+        weigh_by_local_iter: bool = True,
+        flat_buffer: bool = False,
+    ):
+        """Perform weighted aggregation with the keys partitioned into shards that are aggregated in parallel.
+
+        Each shard is a WeightedAggregationHelper with its own lock, and is folded in by its own worker, so one
+        contribution is aggregated on multiple cores (NumPy and PyTorch release the GIL for large operations).
+        Concurrent contributions start at different shards, and a caller folds in the shards of its contribution
+        that no worker has picked up yet, so multiple contributions are folded in at the same time, on different
+        shards. Keys are assigned to the shards when first seen, balanced by their sizes.
+
+        The worker threads are started when needed, and stopped by `close`.
+
+        Args:
+            num_shards (int): number of shards.
+            exclude_vars (str, optional): regex string to match excluded vars during aggregation. Defaults to None.
+            weigh_by_local_iter (bool, optional): Whether to weight the contributions by the number of iterations
+                performed in local training in the current round. Defaults to `True`.
+            flat_buffer (bool, optional): Whether each shard aggregates in flat buffers.
+                See `WeightedAggregationHelper`. Defaults to `False`.
+        """
+        super().__init__()
+        if not isinstance(num_shards, int) or num_shards < 1:
+            raise ValueError(f"num_shards must be a positive int but got {num_shards}")
+
+        self.num_shards = num_shards
+        self.shards = [
+            WeightedAggregationHelper(
+                exclude_vars=exclude_vars, weigh_by_local_iter=weigh_by_local_iter, flat_buffer=flat_buffer
+            )
+            for _ in range(num_shards)
+        ]
+        self.lock = threading.Lock()
+        self.key_shards: Dict[str, int] = {}
+        self.key_order: List[str] = []
+        self.shard_loads = [0] * num_shards
+        self.executor = None
+        self.history = list()
+        self._next_start = 0
+
+    def reset_stats(self):
+        with self.lock:
+            for shard in self.shards:
+                shard.reset_stats()
+            self.history = list()
+
+    def _partition(self, data: dict) -> List[tuple]:
+        """Split the data by shard. Returns the (shard, part) pairs, starting at a different shard for each call."""
+        parts = [{} for _ in range(self.num_shards)]
+        with self.lock:
+            for k, v in data.items():
+                i = self.key_shards.get(k)
+                if i is None:
+                    i = self.shard_loads.index(min(self.shard_loads))
+                    self.shard_loads[i] += _value_size(v)
+                    self.key_shards[k] = i
+                    self.key_order.append(k)
+                parts[i][k] = v
+            if self.executor is None and self.num_shards > 1:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.num_shards - 1, thread_name_prefix="sharded_aggregation"
+                )
+            # concurrent contributions start at different shards, so their callers don't wait on the same one
+            start = self._next_start
+            self._next_start = (start + 1) % self.num_shards
+        order = list(range(start, self.num_shards)) + list(range(start))
+        return [(self.shards[i], parts[i]) for i in order if parts[i]]
+
+    def add(self, data, weight, contributor_name, contribution_round, source_formats: Optional[Dict[str, str]] = None):
+        """Compute weighted sum and sum of weights. See `WeightedAggregationHelper.add`."""
+        work = self._partition(data)
+        pending = [
+            (
+                shard,
+                part,
+                self.executor.submit(shard.add, part, weight, contributor_name, contribution_round, source_formats),
+            )
+            for shard, part in work[1:]
+        ]
+        if work:
+            # the caller folds in one shard itself
+            shard, part = work[0]
+            shard.add(part, weight, contributor_name, contribution_round, source_formats)
+        for shard, part, f in pending:
+            if f.cancel():
+                # no worker has picked it up (e.g. they are busy with other contributions): fold it in here
+                shard.add(part, weight, contributor_name, contribution_round, source_formats)
+            else:
+                f.result()
+
+        with self.lock:
+            self.history.append(
+                {
+                    "contributor_name": contributor_name,
+                    "round": contribution_round,
+                    "weight": weight,
+                }
+            )
+
+    def get_result(self):
+        """Divide weighted sum by sum of weights."""
+        with self.lock:
+            results = {}
+            if self.executor is None:
+                shard_results = [shard.get_result() for shard in self.shards]
+            else:
+                shard_results = self.executor.map(WeightedAggregationHelper.get_result, self.shards)
+            for r in shard_results:
+                results.update(r)
+            self.history = list()
+            # keep the key order of the contributions
+            return {k: results[k] for k in self.key_order if k in results}
+
+    def get_history(self):
+        return self.history
+
+    def get_len(self):
+        return len(self.get_history())
+
+    def close(self):
+        """Stop the worker threads, e.g. at the end of a round. Must not be called while contributions are added.
+
+        The helper can still be used: the workers are started again when needed.
+        """
+        with self.lock:
+            executor = self.executor
+            self.executor = None
+        if executor:
+            executor.shutdown(wait=True)
@@ -0,0 +1,20 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nvflare.app_common.ccwf.cse_client_ctl import CrossSiteEvalClientController
+from nvflare.app_common.ccwf.cse_server_ctl import CrossSiteEvalServerController
+from nvflare.app_common.ccwf.cyclic_client_ctl import CyclicClientController
+from nvflare.app_common.ccwf.cyclic_server_ctl import CyclicServerController
+from nvflare.app_common.ccwf.swarm_client_ctl import SwarmClientController
+from nvflare.app_common.ccwf.swarm_server_ctl import SwarmServerController
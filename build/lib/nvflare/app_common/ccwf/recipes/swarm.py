@@ -0,0 +1,30 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Re-export from new location for backward compatibility
+# These classes require PyTorch, so import is optional
+from nvflare.fuel.utils.import_utils import optional_import
+
+BaseSwarmLearningRecipe, _ = optional_import(
+    "nvflare.app_opt.pt.recipes.swarm",
+    name="BaseSwarmLearningRecipe",
+    descriptor="PyTorch is required for {}",
+)
+SwarmLearningRecipe, _ = optional_import(
+    "nvflare.app_opt.pt.recipes.swarm",
+    name="SwarmLearningRecipe",
+    descriptor="PyTorch is required for {}",
+)
+
+__all__ = ["BaseSwarmLearningRecipe", "SwarmLearningRecipe"]
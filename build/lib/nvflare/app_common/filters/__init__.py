@@ -0,0 +1,21 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .densify_update import DensifyUpdate
+from .exclude_vars import ExcludeVars
+from .percentile_privacy import PercentilePrivacy
+from .sparsify_update import SparsifyUpdate
+from .svt_privacy import SVTPrivacy
+
+__all__ = ["PercentilePrivacy", "SVTPrivacy", "ExcludeVars", "SparsifyUpdate", "DensifyUpdate"]
@@ -0,0 +1,59 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Union
+
+from nvflare.apis.dxo import DXO, DataKind
+from nvflare.apis.dxo_filter import DXOFilter
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.app_common.filters.sparsify_update import SPARSE_SOURCE_FORMAT
+from nvflare.app_common.utils.sparse_array import SparseArray
+
+
+class DensifyUpdate(DXOFilter):
+    def __init__(self):
+        """Convert the `SparseArray` params of WEIGHT_DIFF updates made by `SparsifyUpdate` back to dense arrays.
+
+        Params that were PyTorch tensors are converted back to (CPU) tensors. This filter is not needed in front of
+        aggregators based on the WeightedAggregationHelper, which aggregate sparse params directly.
+        """
+        super().__init__(supported_data_kinds=[DataKind.WEIGHT_DIFF], data_kinds_to_filter=[DataKind.WEIGHT_DIFF])
+
+    def process_dxo(self, dxo: DXO, shareable: Shareable, fl_ctx: FLContext) -> Union[None, DXO]:
+        """Replace the sparse params of the update with dense ones.
+
+        Args:
+            dxo (DXO): WEIGHT_DIFF DXO to be densified
+            shareable: the shareable that the dxo belongs to
+            fl_ctx (FLContext): only used for logging
+
+        Returns: the DXO with dense params, or None if it has no sparse params
+        """
+        source_formats = dxo.get_meta_prop(SPARSE_SOURCE_FORMAT) or {}
+        sparse_names = [name for name, v in dxo.data.items() if isinstance(v, SparseArray)]
+        if not sparse_names:
+            return None
+
+        for name in sparse_names:
+            dense = dxo.data[name].to_dense()
+            if source_formats.get(name) == "torch":
+                import torch
+
+                dense = torch.from_numpy(dense)
+            dxo.data[name] = dense
+
+        dxo.remove_meta_props([SPARSE_SOURCE_FORMAT])
+        self.log_debug(fl_ctx, f"Densified {len(sparse_names)} params")
+        return dxo
@@ -0,0 +1,234 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from io import BytesIO
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from nvflare.app_common.np.np_raw_format import byte_view, decode_arrays, encode_arrays, is_raw_format
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.streaming.cacheable import CacheableObject, ItemConsumer
+from nvflare.fuel.f3.streaming.download_service import download_object
+from nvflare.fuel.f3.streaming.obj_downloader import ObjectDownloader
+from nvflare.fuel.f3.streaming.ranged_item import RangedItemAssembler, encode_ranged_item, is_ranged_item, split_ranges
+
+_TWO_MB = 2 * 1024 * 1024
+
+
+class ArrayDownloadable(CacheableObject):
+
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        max_chunk_size: int,
+        raw_format: bool = False,
+        split_large_arrays: bool = False,
+    ):
+        """Constructor of ArrayDownloadable.
+
+        Args:
+            arrays: the arrays to be downloaded
+            max_chunk_size: max number of bytes for each chunk
+            raw_format: whether to encode the arrays in the raw buffer format; if False, npz is used. Only set
+                this if all receivers understand the raw format
+            split_large_arrays: whether to send arrays larger than max_chunk_size as multiple ranged items, in the
+                raw format only. Only set this if all receivers understand ranged items
+
+        Notes: in the raw format, an array larger than max_chunk_size is sent as multiple ranged items, each
+        carrying one byte range of the array, so the array is never serialized or buffered as a whole.
+        """
+        self.keys = list(arrays.keys())
+        self.raw_format = raw_format
+        self.split_large_arrays = split_large_arrays
+
+        # each item is (key, start, end); start and end are None if the whole array is sent in one item
+        self.items = []
+        for key, arr in arrays.items():
+            if self._should_split(arr, max_chunk_size):
+                self.items.extend((key, start, end) for start, end in split_ranges(arr.nbytes, max_chunk_size))
+            else:
+                self.items.append((key, None, None))
+        super().__init__(arrays, max_chunk_size)
+
+    def _should_split(self, arr, max_chunk_size: int) -> bool:
+        return (
+            self.raw_format
+            and self.split_large_arrays
+            and max_chunk_size > 0
+            and isinstance(arr, np.ndarray)
+            and arr.nbytes > max_chunk_size
+            and not arr.dtype.hasobject
+            and (arr.flags.c_contiguous or arr.flags.f_contiguous)
+        )
+
+    def get_item_count(self) -> int:
+        return len(self.items)
+
+    def produce_item(self, index: int) -> bytes:
+        key, start, end = self.items[index]
+        if start is not None:
+            arr = self.base_obj[key]
+            view, order = byte_view(arr)
+            meta = [np.lib.format.dtype_to_descr(arr.dtype), list(arr.shape), order]
+            return encode_ranged_item(key, meta, view.nbytes, start, view[start:end])
+
+        arrays_to_send = {key: self.base_obj[key]}
+        if self.raw_format:
+            return encode_arrays(arrays_to_send)
+
+        stream = BytesIO()
+        np.savez(allow_pickle=False, file=stream, **arrays_to_send)
+        return stream.getvalue()
+
+
+class ArrayConsumer(ItemConsumer):
+
+    def __init__(self, arrays_received_cb, cb_kwargs):
+        ItemConsumer.__init__(self)
+        self.arrays_received_cb = arrays_received_cb
+        self.cb_kwargs = cb_kwargs
+        if arrays_received_cb is not None and not callable(arrays_received_cb):
+            raise ValueError("arrays_received_cb must be callable")
+        self.assembler = RangedItemAssembler()
+
+    @staticmethod
+    def _allocate(key: str, meta, total_size: int):
+        descr, shape, order = meta
+        arr = np.empty(shape, dtype=np.lib.format.descr_to_dtype(descr), order=order)
+        view, _ = byte_view(arr)
+        if view.nbytes != total_size:
+            raise ValueError(f"size of array '{key}' is {view.nbytes} but expected {total_size}")
+
+        def _write(start: int, data):
+            view[start : start + len(data)] = np.frombuffer(data, dtype=np.uint8)
+
+        return arr, _write
+
+    @staticmethod
+    def _to_dict(item: bytes) -> dict:
+        if is_raw_format(item):
+            # the received arrays are given to the app, which may modify them like arrays loaded from npz.
+            # They are only copied if the item is read-only: received frames are writable, so normally they are not.
+            return decode_arrays(item, writeable=True)
+
+        # npz item from a sender that does not use the raw format
+        result = {}
+        stream = BytesIO(item)
+        with np.load(stream, allow_pickle=False) as npz_obj:
+            for k in npz_obj.files:
+                result[k] = npz_obj[k]
+        return result
+
+    def consume_items(self, items: List[Any], result: Any) -> Any:
+        assert isinstance(items, list)
+        if result is None:
+            result = {}
+
+        arrays = {}
+        for item in items:
+            if is_ranged_item(item):
+                key, arr = self.assembler.add(item, self._allocate)
+                if arr is not None:
+                    arrays[key] = arr
+                continue
+
+            td = self._to_dict(item)
+            if not isinstance(td, dict):
+                raise ValueError("cannot load received bytes to arrays")
+            arrays.update(td)
+
+        if not arrays:
+            # only ranges of incomplete arrays were received
+            return result
+
+        if self.arrays_received_cb is not None:
+            cb_result = self.arrays_received_cb(arrays, **self.cb_kwargs)
+            if isinstance(cb_result, dict):
+                result.update(cb_result)
+        else:
+            result.update(arrays)
+        return result
+
+    def download_completed(self, ref_id: str):
+        incomplete = self.assembler.incomplete_keys()
+        if incomplete:
+            self.download_failed(ref_id, f"incomplete arrays {incomplete}")
+            return
+        super().download_completed(ref_id)
+
+
+def add_arrays(
+    downloader: ObjectDownloader,
+    arrays: dict[str, np.ndarray],
+    max_chunk_size: int = _TWO_MB,
+    raw_format: bool = False,
+    split_large_arrays: bool = False,
+) -> str:
+    """Add arrays to be downloaded to the specified downloader.
+
+    Args:
+        downloader: the downloader to add arrays to.
+        arrays: arrays to be downloaded
+        max_chunk_size: max chunk size
+        raw_format: whether to send the arrays in the raw buffer format instead of npz. Only set this if all
+            receivers understand the raw format
+        split_large_arrays: whether to send arrays larger than max_chunk_size as multiple ranged items
+
+    Returns: reference id for the arrays.
+
+    """
+    obj = ArrayDownloadable(arrays, max_chunk_size, raw_format, split_large_arrays)
+    return downloader.add_object(obj)
+
+
+def download_arrays(
+    from_fqcn: str,
+    ref_id: str,
+    per_request_timeout: float,
+    cell: Cell,
+    secure=False,
+    optional=False,
+    abort_signal=None,
+    arrays_received_cb=None,
+    progress_cb=None,
+    **cb_kwargs,
+) -> Tuple[str, Optional[dict[str, np.ndarray]]]:
+    """Download the referenced arrays from the source.
+
+    Args:
+        from_fqcn: FQCN of the data source.
+        ref_id: reference ID of the arrays to be downloaded.
+        per_request_timeout: timeout for requests sent to the data source.
+        cell: cell to be used for communicating to the data source.
+        secure: P2P private mode for communication
+        optional: suppress log messages of communication
+        abort_signal: signal for aborting download.
+        arrays_received_cb: the callback to be called when one set of arrays are received
+
+    Returns: tuple of (error message if any, downloaded state dict).
+
+    """
+    consumer = ArrayConsumer(arrays_received_cb, cb_kwargs)
+    download_object(
+        from_fqcn=from_fqcn,
+        ref_id=ref_id,
+        consumer=consumer,
+        per_request_timeout=per_request_timeout,
+        cell=cell,
+        secure=secure,
+        optional=optional,
+        abort_signal=abort_signal,
+        progress_cb=progress_cb,
+    )
+    return consumer.error, consumer.result
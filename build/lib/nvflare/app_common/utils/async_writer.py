@@ -0,0 +1,89 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import queue
+import threading
+from typing import Callable, Optional
+
+from nvflare.fuel.utils.log_utils import get_obj_logger
+from nvflare.fuel.utils.validation_utils import check_positive_int
+from nvflare.security.logging import secure_format_exception
+
+
+class AsyncWriter:
+    def __init__(self, max_pending: int = 1, name: str = "async_writer"):
+        """Runs write jobs (e.g. model persistence) one by one on a background thread.
+
+        Jobs are run in the order they are submitted. At most max_pending jobs can wait to be run: submit() blocks
+        until there is room, so a slow writer holds back the producer instead of piling up copies of the data.
+
+        Args:
+            max_pending: max number of jobs that wait to be run
+            name: name of the writer thread
+        """
+        check_positive_int("max_pending", max_pending)
+        self.logger = get_obj_logger(self)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._error_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, job: Callable, *args, **kwargs):
+        """Submit a job to be run on the writer thread.
+
+        Args:
+            job: the function to be called
+            *args: args of the job
+            **kwargs: kwargs of the job
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("the writer is already shut down")
+        self._queue.put((job, args, kwargs))
+
+    def flush(self):
+        """Wait until all submitted jobs are done.
+
+        Raises: the first exception raised by the jobs since the last flush, if any
+        """
+        self._queue.join()
+        with self._error_lock:
+            error, self._error = self._error, None
+        if error:
+            raise error
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """Stop the writer thread after the submitted jobs are done.
+
+        Args:
+            timeout: max time to wait for the jobs. None means to wait until they are done.
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                job, args, kwargs = item
+                job(*args, **kwargs)
+            except Exception as e:
+                self.logger.error(f"error running write job: {secure_format_exception(e)}")
+                with self._error_lock:
+                    if not self._error:
+                        self._error = e
+            finally:
+                self._queue.task_done()
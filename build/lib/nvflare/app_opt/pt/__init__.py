@@ -0,0 +1,25 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nvflare.app_opt.pt.ditto import PTDittoHelper
+from nvflare.app_opt.pt.fedopt import PTFedOptModelShareableGenerator
+from nvflare.app_opt.pt.fedproxloss import PTFedProxLoss
+from nvflare.app_opt.pt.file_model_locator import PTFileModelLocator
+from nvflare.app_opt.pt.file_model_persistor import PTFileModelPersistor
+from nvflare.app_opt.pt.he_model_reader_writer import HEPTModelReaderWriter
+from nvflare.app_opt.pt.model_persistence_format_manager import PTModelPersistenceFormatManager
+from nvflare.app_opt.pt.model_reader_writer import PTModelReaderWriter
+from nvflare.app_opt.pt.multi_process_executor import PTMultiProcessExecutor
+from nvflare.app_opt.pt.scaffold import PTScaffoldHelper, get_lr_values
+from nvflare.app_opt.pt.utils import feed_vars
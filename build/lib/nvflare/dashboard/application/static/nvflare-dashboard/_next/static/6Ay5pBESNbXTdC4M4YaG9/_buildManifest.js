@@ -0,0 +1 @@
+self.__BUILD_MANIFEST=function(s,a,e,c,t){return{__rewrites:{afterFiles:[],beforeFiles:[],fallback:[]},"/":[s,a,e,c,"static/chunks/pages/index-961ed8209bb51cd8.js"],"/_error":["static/chunks/pages/_error-db5aa87e21083627.js"],"/downloads":[s,a,"static/chunks/640-7e918cbf7273a989.js","static/chunks/pages/downloads-79d7107d32a02eb8.js"],"/logout":["static/chunks/pages/logout-b47903a262deab58.js"],"/project-admin-dashboard":[s,a,t,"static/chunks/pages/project-admin-dashboard-464f6c96200c7270.js"],"/project-configuration":[s,e,"static/chunks/403-a2b771cacc4bf7cb.js","static/chunks/pages/project-configuration-42713d1aa2abe5f8.js"],"/registration-form":[s,a,e,c,"static/chunks/pages/registration-form-77850dfdd8822d28.js"],"/server-config":[s,e,"static/chunks/pages/server-config-2a60dc76fac8c5f1.js"],"/site-dashboard":[s,a,t,"static/chunks/pages/site-dashboard-f1b2a4369ffd3165.js"],"/user-dashboard":[s,a,e,"static/chunks/pages/user-dashboard-cbef52f53708dc56.js"],sortedPages:["/","/_app","/_error","/downloads","/logout","/project-admin-dashboard","/project-configuration","/registration-form","/server-config","/site-dashboard","/user-dashboard"]}}("static/chunks/234-1ab4559e3cb619d3.js","static/chunks/539-50d9b33199618994.js","static/chunks/787-e467f23eeb544086.js","static/chunks/390-b4e88de26d6532e7.js","static/chunks/983-a5d2f540606f7e11.js"),self.__BUILD_MANIFEST_CB&&self.__BUILD_MANIFEST_CB();
\ No newline at end of file
@@ -0,0 +1,1079 @@
+(self.webpackChunk_N_E=self.webpackChunk_N_E||[]).push([[403],{15897:function(e,t,r){"use strict";t.__esModule=!0;var n=r(67294);i(n);var a=i(r(45697)),o=i(r(47815));function i(e){return e&&e.__esModule?e:{default:e}}function c(e,t){if(!(e instanceof t))throw TypeError("Cannot call a class as a function")}function s(e,t){if(!e)throw ReferenceError("this hasn't been initialised - super() hasn't been called");return t&&("object"==typeof t||"function"==typeof t)?t:e}function u(e,t){if("function"!=typeof t&&null!==t)throw TypeError("Super expression must either be null or a function, not "+typeof t);e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,enumerable:!1,writable:!0,configurable:!0}}),t&&(Object.setPrototypeOf?Object.setPrototypeOf(e,t):e.__proto__=t)}i(r(42473)),t.default=function(e,t){var r,i,l="__create-react-context-"+(0,o.default)()+"__",d=function(e){function r(){c(this,r);for(var t,n,a,o,i=arguments.length,u=Array(i),l=0;l<i;l++)u[l]=arguments[l];return t=n=s(this,e.call.apply(e,[this].concat(u))),n.emitter=(a=n.props.value,o=[],{on:function(e){o.push(e)},off:function(e){o=o.filter(function(t){return t!==e})},get:function(){return a},set:function(e,t){a=e,o.forEach(function(e){return e(a,t)})}}),s(n,t)}return u(r,e),r.prototype.getChildContext=function(){var e;return(e={})[l]=this.emitter,e},r.prototype.componentWillReceiveProps=function(e){if(this.props.value!==e.value){var r=this.props.value,n=e.value,a=void 0;(r===n?0!==r||1/r==1/n:r!=r&&n!=n)?a=0:0!=(a=("function"==typeof t?t(r,n):1073741823)|0)&&this.emitter.set(e.value,a)}},r.prototype.render=function(){return this.props.children},r}(n.Component);d.childContextTypes=((r={})[l]=a.default.object.isRequired,r);var p=function(t){function r(){var e,n;c(this,r);for(var a=arguments.length,o=Array(a),i=0;i<a;i++)o[i]=arguments[i];return e=n=s(this,t.call.apply(t,[this].concat(o))),n.state={value:n.getValue()},n.onUpdate=function(e,t){((0|n.observedBits)&t)!=0&&n.setState({value:n.getValue()})},s(n,e)}return u(r,t),r.prototype.componentWillReceiveProps=function(e){var t=e.observedBits;this.observedBits=null==t?1073741823:t},r.prototype.componentDidMount=function(){this.context[l]&&this.context[l].on(this.onUpdate);var e=this.props.observedBits;this.observedBits=null==e?1073741823:e},r.prototype.componentWillUnmount=function(){this.context[l]&&this.context[l].off(this.onUpdate)},r.prototype.getValue=function(){return this.context[l]?this.context[l].get():e},r.prototype.render=function(){var e;return(Array.isArray(e=this.props.children)?e[0]:e)(this.state.value)},r}(n.Component);return p.contextTypes=((i={})[l]=a.default.object,i),{Provider:d,Consumer:p}},e.exports=t.default},88740:function(e,t,r){"use strict";t.__esModule=!0;var n=o(r(67294)),a=o(r(15897));function o(e){return e&&e.__esModule?e:{default:e}}t.default=n.default.createContext||a.default,e.exports=t.default},35827:function(e,t,r){"use strict";var n=this&&this.__createBinding||(Object.create?function(e,t,r,n){void 0===n&&(n=r);var a=Object.getOwnPropertyDescriptor(t,r);(!a||("get"in a?!t.__esModule:a.writable||a.configurable))&&(a={enumerable:!0,get:function(){return t[r]}}),Object.defineProperty(e,n,a)}:function(e,t,r,n){void 0===n&&(n=r),e[n]=t[r]}),a=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),o=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var r in e)"default"!==r&&Object.prototype.hasOwnProperty.call(e,r)&&n(t,e,r);return a(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.DateRangePicker=void 0;let c=o(r(67294)),s=i(r(57299)),u=r(7347),l=o(r(9198)),d=r(85444),p=r(78795),f=["January","February","March","April","May","June","July","August","September","October","November","December"],h=(0,c.forwardRef)((e,t)=>{let{value:r,onClick:n,placeholder:a,isOpen:o}=e;return c.default.createElement(p.SelectDateButton,{type:"button",onClick:n,ref:t,isOpen:o},c.default.createElement("div",{className:"left"},c.default.createElement(s.default,{name:"TimeCalendar",variant:"solid"}),c.default.createElement("span",{className:r?"":"placeholder"},r||a)),c.default.createElement("div",{className:"right"},c.default.createElement(s.default,{name:"ArrowCaretDown",size:"small"})))});h.displayName="DefaultCustomInput";let m=({date:e,decreaseMonth:t,increaseMonth:r,prevMonthButtonDisabled:n,nextMonthButtonDisabled:a})=>c.default.createElement(p.RDPCustomHeaderContainer,null,c.default.createElement(p.FlexWrapper,null,c.default.createElement(p.MonthButton,{type:"button",onClick:t,disabled:n},c.default.createElement(s.default,{name:"ArrowCaretDoubleLeft",size:"small"})),c.default.createElement(p.MonthButton,{type:"button",onClick:t,disabled:n},c.default.createElement(s.default,{name:"ArrowCaretLeft",size:"small"}))),c.default.createElement("p",null,f[e.getMonth()]," ",e.getFullYear()),c.default.createElement(p.FlexWrapper,null,c.default.createElement(p.MonthButton,{type:"button",onClick:r,disabled:a},c.default.createElement(s.default,{name:"ArrowCaretRight",size:"small"})),c.default.createElement(p.MonthButton,{type:"button",onClick:r,disabled:a,style:{marginRight:"0"}},c.default.createElement(s.default,{name:"ArrowCaretDoubleRight",size:"small"}))));m.displayName="ReactDatePickerCustomHeader";let y=({className:e,children:t})=>c.default.createElement(p.DatePickerContainer,null,c.default.createElement(l.CalendarContainer,{className:e},c.default.createElement("div",{style:{position:"relative"}},t)));function v({dateFormat:e="MM-dd-yyyy",label:t="Select Date",maxDate:r,minDate:n,onChange:a,placeholderText:o="MM-DD-YYYY",isClearable:i=!1,selected:s}){let f=(0,c.useContext)(u.KaizenThemeContext),[v,g]=(0,c.useState)(s),[b,w]=(0,c.useState)(!1);return c.default.createElement(c.default.Fragment,null,c.default.createElement(p.DatePickerGlobal,null),c.default.createElement(d.ThemeProvider,{theme:f},c.default.createElement(p.FlexWrapper,{"data-testid":"kui-datePicker"},c.default.createElement(p.FlexWrapperColumn,null,c.default.createElement(p.Label,null,t),c.default.createElement(l.default,{calendarContainer:y,customInput:c.default.createElement(h,{isOpen:b}),dateFormat:e,minDate:n,maxDate:r,onCalendarClose:()=>w(!1),onCalendarOpen:()=>w(!0),onChange:e=>{g(e),a(e)},placeholderText:o,renderCustomHeader:m,selected:v,todayButton:"Today",isClearable:i})))))}y.displayName="ReactDatePickerContainer",v.displayName="DatePicker";let g=({children:e,dateFormat:t="MM-dd-yyyy",endDate:r,endLabel:n="End Date",maxEndDate:a,maxStartDate:o,minEndDate:i,minStartDate:s,onEndChange:f,onStartChange:v,placeholderText:g="MM-DD-YYYY",startDate:b,startLabel:w="Start Date",isClearable:k=!1})=>{let _=(0,c.useContext)(u.KaizenThemeContext),[D,x]=(0,c.useState)(b),[C,S]=(0,c.useState)(r),[T,P]=(0,c.useState)(!1),[E,Z]=(0,c.useState)(!1);return c.default.createElement(c.default.Fragment,null,c.default.createElement(p.DatePickerGlobal,null),c.default.createElement(d.ThemeProvider,{theme:_},c.default.createElement(p.FlexWrapperColumn,null,c.default.createElement(p.Label,null,w),c.default.createElement(l.default,{calendarContainer:y,customInput:c.default.createElement(h,{isOpen:T}),dateFormat:t,endDate:C,maxDate:o,minDate:s,onCalendarClose:()=>P(!1),onCalendarOpen:()=>P(!0),onChange:e=>{x(e),v(e)},placeholderText:g,renderCustomHeader:m,selected:D,selectsStart:!0,startDate:D,todayButton:"Today",isClearable:k})),c.default.createElement("div",{className:"children-container"},e),c.default.createElement(p.FlexWrapperColumn,null,c.default.createElement(p.Label,null,n),c.default.createElement(l.default,{calendarContainer:y,customInput:c.default.createElement(h,{isOpen:E}),dateFormat:t,endDate:C,maxDate:a,minDate:i||D,onCalendarClose:()=>Z(!1),onCalendarOpen:()=>Z(!0),onChange:e=>{S(e),f(e)},placeholderText:g,renderCustomHeader:m,selected:C,selectsEnd:!0,startDate:D,todayButton:"Today",isClearable:k}))))};t.DateRangePicker=g,g.displayName="DateRangePicker",t.default=v},78795:function(e,t,r){"use strict";var n=this&&this.__createBinding||(Object.create?function(e,t,r,n){void 0===n&&(n=r);var a=Object.getOwnPropertyDescriptor(t,r);(!a||("get"in a?!t.__esModule:a.writable||a.configurable))&&(a={enumerable:!0,get:function(){return t[r]}}),Object.defineProperty(e,n,a)}:function(e,t,r,n){void 0===n&&(n=r),e[n]=t[r]}),a=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),o=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var r in e)"default"!==r&&Object.prototype.hasOwnProperty.call(e,r)&&n(t,e,r);return a(t,e),t};Object.defineProperty(t,"__esModule",{value:!0}),t.Label=t.FlexWrapperColumn=t.FlexWrapper=t.SelectDateButton=t.MonthButton=t.RDPCustomHeaderContainer=t.DatePickerContainer=t.DatePickerGlobal=void 0;let i=o(r(85444));t.DatePickerGlobal=(0,i.createGlobalStyle)`
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle,
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle,
+  .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__month-read-view--down-arrow,
+  .react-datepicker__month-year-read-view--down-arrow {
+    margin-left: -8px;
+    position: absolute;
+  }
+
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle,
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle,
+  .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__month-read-view--down-arrow,
+  .react-datepicker__month-year-read-view--down-arrow,
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle::before,
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle::before,
+  .react-datepicker__year-read-view--down-arrow::before,
+  .react-datepicker__month-read-view--down-arrow::before,
+  .react-datepicker__month-year-read-view--down-arrow::before {
+    box-sizing: content-box;
+    position: absolute;
+    border: 8px solid transparent;
+    height: 0;
+    width: 1px;
+  }
+
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle::before,
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle::before,
+  .react-datepicker__year-read-view--down-arrow::before,
+  .react-datepicker__month-read-view--down-arrow::before,
+  .react-datepicker__month-year-read-view--down-arrow::before {
+    content: '';
+    z-index: -1;
+    border-width: 8px;
+    left: -8px;
+    border-bottom-color: #aeaeae;
+  }
+
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle {
+    top: 0;
+    margin-top: -8px;
+  }
+
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle,
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle::before {
+    border-top: none;
+    border-bottom-color: #f0f0f0;
+  }
+
+  .react-datepicker-popper[data-placement^='bottom'] .react-datepicker__triangle::before {
+    top: -1px;
+    border-bottom-color: #aeaeae;
+  }
+
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle,
+  .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__month-read-view--down-arrow,
+  .react-datepicker__month-year-read-view--down-arrow {
+    bottom: 0;
+    margin-bottom: -8px;
+  }
+
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle,
+  .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__month-read-view--down-arrow,
+  .react-datepicker__month-year-read-view--down-arrow,
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle::before,
+  .react-datepicker__year-read-view--down-arrow::before,
+  .react-datepicker__month-read-view--down-arrow::before,
+  .react-datepicker__month-year-read-view--down-arrow::before {
+    border-bottom: none;
+    border-top-color: #fff;
+  }
+
+  .react-datepicker-popper[data-placement^='top'] .react-datepicker__triangle::before,
+  .react-datepicker__year-read-view--down-arrow::before,
+  .react-datepicker__month-read-view--down-arrow::before,
+  .react-datepicker__month-year-read-view--down-arrow::before {
+    bottom: -1px;
+    border-top-color: #aeaeae;
+  }
+
+  .react-datepicker-wrapper {
+    display: flex;
+    padding: 0;
+    border: 0;
+  }
+
+  .react-datepicker {
+    font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif;
+    font-size: 0.8rem;
+    background-color: #fff;
+    color: #000;
+    border: 1px solid #aeaeae;
+    border-radius: 0.3rem;
+    display: inline-block;
+    position: relative;
+  }
+
+  .react-datepicker--time-only .react-datepicker__triangle {
+    left: 35px;
+  }
+
+  .react-datepicker--time-only .react-datepicker__time-container {
+    border-left: 0;
+  }
+
+  .react-datepicker--time-only .react-datepicker__time,
+  .react-datepicker--time-only .react-datepicker__time-box {
+    border-bottom-left-radius: 0.3rem;
+    border-bottom-right-radius: 0.3rem;
+  }
+
+  .react-datepicker__triangle {
+    position: absolute;
+    left: 50px;
+  }
+
+  .react-datepicker-popper {
+    z-index: 100000;
+  }
+
+  .react-datepicker-popper[data-placement^='bottom'] {
+    margin-top: 10px;
+  }
+
+  .react-datepicker-popper[data-placement='bottom-end'] .react-datepicker__triangle,
+  .react-datepicker-popper[data-placement='top-end'] .react-datepicker__triangle {
+    left: auto;
+    right: 50px;
+  }
+
+  .react-datepicker-popper[data-placement^='top'] {
+    margin-bottom: 10px;
+  }
+
+  .react-datepicker-popper[data-placement^='right'] {
+    margin-left: 8px;
+  }
+
+  .react-datepicker-popper[data-placement^='right'] .react-datepicker__triangle {
+    left: auto;
+    right: 42px;
+  }
+
+  .react-datepicker-popper[data-placement^='left'] {
+    margin-right: 8px;
+  }
+
+  .react-datepicker-popper[data-placement^='left'] .react-datepicker__triangle {
+    left: 42px;
+    right: auto;
+  }
+
+  .react-datepicker__header {
+    text-align: center;
+    background-color: #f0f0f0;
+    border-bottom: 1px solid #aeaeae;
+    border-top-left-radius: 0.3rem;
+    padding-top: 8px;
+    position: relative;
+  }
+
+  .react-datepicker__header--time {
+    padding-bottom: 8px;
+    padding-left: 5px;
+    padding-right: 5px;
+  }
+
+  .react-datepicker__header--time:not(.react-datepicker__header--time--only) {
+    border-top-left-radius: 0;
+  }
+
+  .react-datepicker__header:not(.react-datepicker__header--has-time-select) {
+    border-top-right-radius: 0.3rem;
+  }
+
+  .react-datepicker__year-dropdown-container--select,
+  .react-datepicker__month-dropdown-container--select,
+  .react-datepicker__month-year-dropdown-container--select,
+  .react-datepicker__year-dropdown-container--scroll,
+  .react-datepicker__month-dropdown-container--scroll,
+  .react-datepicker__month-year-dropdown-container--scroll {
+    display: inline-block;
+    margin: 0 2px;
+  }
+
+  .react-datepicker__current-month,
+  .react-datepicker-time__header,
+  .react-datepicker-year-header {
+    margin-top: 0;
+    color: #000;
+    font-weight: bold;
+    font-size: 0.944rem;
+  }
+
+  .react-datepicker-time__header {
+    text-overflow: ellipsis;
+    white-space: nowrap;
+    overflow: hidden;
+  }
+
+  .react-datepicker__navigation {
+    background: none;
+    line-height: 1.7rem;
+    text-align: center;
+    cursor: pointer;
+    position: absolute;
+    top: 10px;
+    width: 0;
+    padding: 0;
+    border: 0.45rem solid transparent;
+    z-index: 1;
+    height: 10px;
+    width: 10px;
+    text-indent: -999em;
+    overflow: hidden;
+  }
+
+  .react-datepicker__navigation--previous {
+    left: 10px;
+    border-right-color: #ccc;
+  }
+
+  .react-datepicker__navigation--previous:hover {
+    border-right-color: #b3b3b3;
+  }
+
+  .react-datepicker__navigation--previous--disabled,
+  .react-datepicker__navigation--previous--disabled:hover {
+    border-right-color: #e6e6e6;
+    cursor: default;
+  }
+
+  .react-datepicker__navigation--next {
+    right: 10px;
+    border-left-color: #ccc;
+  }
+
+  .react-datepicker__navigation--next--with-time:not(.react-datepicker__navigation--next--with-today-button) {
+    right: 95px;
+  }
+
+  .react-datepicker__navigation--next:hover {
+    border-left-color: #b3b3b3;
+  }
+
+  .react-datepicker__navigation--next--disabled,
+  .react-datepicker__navigation--next--disabled:hover {
+    border-left-color: #e6e6e6;
+    cursor: default;
+  }
+
+  .react-datepicker__navigation--years {
+    position: relative;
+    top: 0;
+    display: block;
+    margin-left: auto;
+    margin-right: auto;
+  }
+
+  .react-datepicker__navigation--years-previous {
+    top: 4px;
+    border-top-color: #ccc;
+  }
+
+  .react-datepicker__navigation--years-previous:hover {
+    border-top-color: #b3b3b3;
+  }
+
+  .react-datepicker__navigation--years-upcoming {
+    top: -4px;
+    border-bottom-color: #ccc;
+  }
+
+  .react-datepicker__navigation--years-upcoming:hover {
+    border-bottom-color: #b3b3b3;
+  }
+
+  .react-datepicker__month-container {
+    float: left;
+  }
+
+  .react-datepicker__year {
+    margin: 0.4rem;
+    text-align: center;
+  }
+
+  .react-datepicker__year-wrapper {
+    display: flex;
+    flex-wrap: wrap;
+    max-width: 180px;
+  }
+
+  .react-datepicker__year .react-datepicker__year-text {
+    display: inline-block;
+    width: 4rem;
+    margin: 2px;
+  }
+
+  .react-datepicker__month {
+    margin: 0.4rem;
+    text-align: center;
+  }
+
+  .react-datepicker__month .react-datepicker__month-text,
+  .react-datepicker__month .react-datepicker__quarter-text {
+    display: inline-block;
+    width: 4rem;
+    margin: 2px;
+  }
+
+  .react-datepicker__input-time-container {
+    clear: both;
+    width: 100%;
+    float: left;
+    margin: 5px 0 10px 15px;
+    text-align: left;
+  }
+
+  .react-datepicker__input-time-container .react-datepicker-time__caption {
+    display: inline-block;
+  }
+
+  .react-datepicker__input-time-container
+    .react-datepicker-time__input-container {
+    display: inline-block;
+  }
+
+  .react-datepicker__input-time-container
+    .react-datepicker-time__input-container
+    .react-datepicker-time__input {
+    display: inline-block;
+    margin-left: 10px;
+  }
+
+  .react-datepicker__input-time-container
+    .react-datepicker-time__input-container
+    .react-datepicker-time__input
+    input {
+    width: auto;
+  }
+
+  .react-datepicker__input-time-container
+    .react-datepicker-time__input-container
+    .react-datepicker-time__input
+    input[type='time']::-webkit-inner-spin-button,
+  .react-datepicker__input-time-container
+    .react-datepicker-time__input-container
+    .react-datepicker-time__input
+    input[type='time']::-webkit-outer-spin-button {
+    -webkit-appearance: none;
+    margin: 0;
+  }
+
+  .react-datepicker__input-time-container
+    .react-datepicker-time__input-container
+    .react-datepicker-time__input
+    input[type='time'] {
+    -moz-appearance: textfield;
+  }
+
+  .react-datepicker__input-time-container
+    .react-datepicker-time__input-container
+    .react-datepicker-time__delimiter {
+    margin-left: 5px;
+    display: inline-block;
+  }
+
+  .react-datepicker__time-container {
+    float: right;
+    border-left: 1px solid #aeaeae;
+    width: 85px;
+  }
+
+  .react-datepicker__time-container--with-today-button {
+    display: inline;
+    border: 1px solid #aeaeae;
+    border-radius: 0.3rem;
+    position: absolute;
+    right: -72px;
+    top: 0;
+  }
+
+  .react-datepicker__time-container .react-datepicker__time {
+    position: relative;
+    background: white;
+    border-bottom-right-radius: 0.3rem;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box {
+    width: 85px;
+    overflow-x: hidden;
+    margin: 0 auto;
+    text-align: center;
+    border-bottom-right-radius: 0.3rem;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box
+    ul.react-datepicker__time-list {
+    list-style: none;
+    margin: 0;
+    height: calc(195px + (1.7rem / 2));
+    overflow-y: scroll;
+    padding-right: 0px;
+    padding-left: 0px;
+    width: 100%;
+    box-sizing: content-box;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box
+    ul.react-datepicker__time-list
+    li.react-datepicker__time-list-item {
+    height: 30px;
+    padding: 5px 10px;
+    white-space: nowrap;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box
+    ul.react-datepicker__time-list
+    li.react-datepicker__time-list-item:hover {
+    cursor: pointer;
+    background-color: #f0f0f0;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box
+    ul.react-datepicker__time-list
+    li.react-datepicker__time-list-item--selected {
+    background-color: #216ba5;
+    color: white;
+    font-weight: bold;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box
+    ul.react-datepicker__time-list
+    li.react-datepicker__time-list-item--selected:hover {
+    background-color: #216ba5;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box
+    ul.react-datepicker__time-list
+    li.react-datepicker__time-list-item--disabled {
+    color: #ccc;
+  }
+
+  .react-datepicker__time-container
+    .react-datepicker__time
+    .react-datepicker__time-box
+    ul.react-datepicker__time-list
+    li.react-datepicker__time-list-item--disabled:hover {
+    cursor: default;
+    background-color: transparent;
+  }
+
+  .react-datepicker__week-number {
+    color: #ccc;
+    display: inline-block;
+    width: 1.7rem;
+    line-height: 1.7rem;
+    text-align: center;
+    margin: 0.166rem;
+  }
+
+  .react-datepicker__week-number.react-datepicker__week-number--clickable {
+    cursor: pointer;
+  }
+
+  .react-datepicker__week-number.react-datepicker__week-number--clickable:hover {
+    border-radius: 0.3rem;
+    background-color: #f0f0f0;
+  }
+
+  .react-datepicker__day-names,
+  .react-datepicker__week {
+    white-space: nowrap;
+  }
+
+  .react-datepicker__day-name,
+  .react-datepicker__day,
+  .react-datepicker__time-name {
+    color: #000;
+    display: inline-block;
+    width: 1.7rem;
+    line-height: 1.7rem;
+    text-align: center;
+    margin: 0.166rem;
+  }
+
+  .react-datepicker__month--selected,
+  .react-datepicker__month--in-selecting-range,
+  .react-datepicker__month--in-range,
+  .react-datepicker__quarter--selected,
+  .react-datepicker__quarter--in-selecting-range,
+  .react-datepicker__quarter--in-range {
+    border-radius: 0.3rem;
+    background-color: #216ba5;
+    color: #fff;
+  }
+
+  .react-datepicker__month--selected:hover,
+  .react-datepicker__month--in-selecting-range:hover,
+  .react-datepicker__month--in-range:hover,
+  .react-datepicker__quarter--selected:hover,
+  .react-datepicker__quarter--in-selecting-range:hover,
+  .react-datepicker__quarter--in-range:hover {
+    background-color: #1d5d90;
+  }
+
+  .react-datepicker__month--disabled,
+  .react-datepicker__quarter--disabled {
+    color: #ccc;
+    pointer-events: none;
+  }
+
+  .react-datepicker__month--disabled:hover,
+  .react-datepicker__quarter--disabled:hover {
+    cursor: default;
+    background-color: transparent;
+  }
+
+  .react-datepicker__day,
+  .react-datepicker__month-text,
+  .react-datepicker__quarter-text,
+  .react-datepicker__year-text {
+    cursor: pointer;
+  }
+
+  .react-datepicker__day:hover,
+  .react-datepicker__month-text:hover,
+  .react-datepicker__quarter-text:hover,
+  .react-datepicker__year-text:hover {
+    border-radius: 0.3rem;
+    background-color: #f0f0f0;
+  }
+
+  .react-datepicker__day--today,
+  .react-datepicker__month-text--today,
+  .react-datepicker__quarter-text--today,
+  .react-datepicker__year-text--today {
+    font-weight: bold;
+  }
+
+  .react-datepicker__day--highlighted,
+  .react-datepicker__month-text--highlighted,
+  .react-datepicker__quarter-text--highlighted,
+  .react-datepicker__year-text--highlighted {
+    border-radius: 0.3rem;
+    background-color: #3dcc4a;
+    color: #fff;
+  }
+
+  .react-datepicker__day--highlighted:hover,
+  .react-datepicker__month-text--highlighted:hover,
+  .react-datepicker__quarter-text--highlighted:hover,
+  .react-datepicker__year-text--highlighted:hover {
+    background-color: #32be3f;
+  }
+
+  .react-datepicker__day--highlighted-custom-1,
+  .react-datepicker__month-text--highlighted-custom-1,
+  .react-datepicker__quarter-text--highlighted-custom-1,
+  .react-datepicker__year-text--highlighted-custom-1 {
+    color: magenta;
+  }
+
+  .react-datepicker__day--highlighted-custom-2,
+  .react-datepicker__month-text--highlighted-custom-2,
+  .react-datepicker__quarter-text--highlighted-custom-2,
+  .react-datepicker__year-text--highlighted-custom-2 {
+    color: green;
+  }
+
+  .react-datepicker__day--selected,
+  .react-datepicker__day--in-selecting-range,
+  .react-datepicker__day--in-range,
+  .react-datepicker__month-text--selected,
+  .react-datepicker__month-text--in-selecting-range,
+  .react-datepicker__month-text--in-range,
+  .react-datepicker__quarter-text--selected,
+  .react-datepicker__quarter-text--in-selecting-range,
+  .react-datepicker__quarter-text--in-range,
+  .react-datepicker__year-text--selected,
+  .react-datepicker__year-text--in-selecting-range,
+  .react-datepicker__year-text--in-range {
+    border-radius: 0.3rem;
+    background-color: #216ba5;
+    color: #fff;
+  }
+
+  .react-datepicker__day--selected:hover,
+  .react-datepicker__day--in-selecting-range:hover,
+  .react-datepicker__day--in-range:hover,
+  .react-datepicker__month-text--selected:hover,
+  .react-datepicker__month-text--in-selecting-range:hover,
+  .react-datepicker__month-text--in-range:hover,
+  .react-datepicker__quarter-text--selected:hover,
+  .react-datepicker__quarter-text--in-selecting-range:hover,
+  .react-datepicker__quarter-text--in-range:hover,
+  .react-datepicker__year-text--selected:hover,
+  .react-datepicker__year-text--in-selecting-range:hover,
+  .react-datepicker__year-text--in-range:hover {
+    background-color: #1d5d90;
+  }
+
+  .react-datepicker__day--keyboard-selected,
+  .react-datepicker__month-text--keyboard-selected,
+  .react-datepicker__quarter-text--keyboard-selected,
+  .react-datepicker__year-text--keyboard-selected {
+    border-radius: 0.3rem;
+    background-color: #2a87d0;
+    color: #fff;
+  }
+
+  .react-datepicker__day--keyboard-selected:hover,
+  .react-datepicker__month-text--keyboard-selected:hover,
+  .react-datepicker__quarter-text--keyboard-selected:hover,
+  .react-datepicker__year-text--keyboard-selected:hover {
+    background-color: #1d5d90;
+  }
+
+  .react-datepicker__day--in-selecting-range,
+  .react-datepicker__month-text--in-selecting-range,
+  .react-datepicker__quarter-text--in-selecting-range,
+  .react-datepicker__year-text--in-selecting-range {
+    background-color: rgba(33, 107, 165, 0.5);
+  }
+
+  .react-datepicker__month--selecting-range .react-datepicker__day--in-range,
+  .react-datepicker__month--selecting-range .react-datepicker__month-text--in-range,
+  .react-datepicker__month--selecting-range .react-datepicker__quarter-text--in-range,
+  .react-datepicker__month--selecting-range
+    .react-datepicker__year-text--in-range {
+    background-color: #f0f0f0;
+    color: #000;
+  }
+
+  .react-datepicker__day--disabled,
+  .react-datepicker__month-text--disabled,
+  .react-datepicker__quarter-text--disabled,
+  .react-datepicker__year-text--disabled {
+    cursor: default;
+    color: #ccc;
+  }
+
+  .react-datepicker__day--disabled:hover,
+  .react-datepicker__month-text--disabled:hover,
+  .react-datepicker__quarter-text--disabled:hover,
+  .react-datepicker__year-text--disabled:hover {
+    background-color: transparent;
+  }
+
+  .react-datepicker__month-text.react-datepicker__month--selected:hover,
+  .react-datepicker__month-text.react-datepicker__month--in-range:hover,
+  .react-datepicker__month-text.react-datepicker__quarter--selected:hover,
+  .react-datepicker__month-text.react-datepicker__quarter--in-range:hover,
+  .react-datepicker__quarter-text.react-datepicker__month--selected:hover,
+  .react-datepicker__quarter-text.react-datepicker__month--in-range:hover,
+  .react-datepicker__quarter-text.react-datepicker__quarter--selected:hover,
+  .react-datepicker__quarter-text.react-datepicker__quarter--in-range:hover {
+    background-color: #216ba5;
+  }
+
+  .react-datepicker__month-text:hover,
+  .react-datepicker__quarter-text:hover {
+    background-color: #f0f0f0;
+  }
+
+  .react-datepicker__input-container {
+    position: relative;
+    display: inline-block;
+    width: 100%;
+  }
+
+  .react-datepicker__year-read-view,
+  .react-datepicker__month-read-view,
+  .react-datepicker__month-year-read-view {
+    border: 1px solid transparent;
+    border-radius: 0.3rem;
+  }
+
+  .react-datepicker__year-read-view:hover,
+  .react-datepicker__month-read-view:hover,
+  .react-datepicker__month-year-read-view:hover {
+    cursor: pointer;
+  }
+
+  .react-datepicker__year-read-view:hover .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__year-read-view:hover .react-datepicker__month-read-view--down-arrow,
+  .react-datepicker__month-read-view:hover .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__month-read-view:hover .react-datepicker__month-read-view--down-arrow,
+  .react-datepicker__month-year-read-view:hover .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__month-year-read-view:hover .react-datepicker__month-read-view--down-arrow {
+    border-top-color: #b3b3b3;
+  }
+
+  .react-datepicker__year-read-view--down-arrow,
+  .react-datepicker__month-read-view--down-arrow,
+  .react-datepicker__month-year-read-view--down-arrow {
+    border-top-color: #ccc;
+    float: right;
+    margin-left: 20px;
+    top: 8px;
+    position: relative;
+    border-width: 0.45rem;
+  }
+
+  .react-datepicker__year-dropdown,
+  .react-datepicker__month-dropdown,
+  .react-datepicker__month-year-dropdown {
+    background-color: #f0f0f0;
+    position: absolute;
+    width: 50%;
+    left: 25%;
+    top: 30px;
+    z-index: 1;
+    text-align: center;
+    border-radius: 0.3rem;
+    border: 1px solid #aeaeae;
+  }
+
+  .react-datepicker__year-dropdown:hover,
+  .react-datepicker__month-dropdown:hover,
+  .react-datepicker__month-year-dropdown:hover {
+    cursor: pointer;
+  }
+
+  .react-datepicker__year-dropdown--scrollable,
+  .react-datepicker__month-dropdown--scrollable,
+  .react-datepicker__month-year-dropdown--scrollable {
+    height: 150px;
+    overflow-y: scroll;
+  }
+
+  .react-datepicker__year-option,
+  .react-datepicker__month-option,
+  .react-datepicker__month-year-option {
+    line-height: 20px;
+    width: 100%;
+    display: block;
+    margin-left: auto;
+    margin-right: auto;
+  }
+
+  .react-datepicker__year-option:first-of-type,
+  .react-datepicker__month-option:first-of-type,
+  .react-datepicker__month-year-option:first-of-type {
+    border-top-left-radius: 0.3rem;
+    border-top-right-radius: 0.3rem;
+  }
+
+  .react-datepicker__year-option:last-of-type,
+  .react-datepicker__month-option:last-of-type,
+  .react-datepicker__month-year-option:last-of-type {
+    -webkit-user-select: none;
+    -moz-user-select: none;
+    -ms-user-select: none;
+    user-select: none;
+    border-bottom-left-radius: 0.3rem;
+    border-bottom-right-radius: 0.3rem;
+  }
+
+  .react-datepicker__year-option:hover,
+  .react-datepicker__month-option:hover,
+  .react-datepicker__month-year-option:hover {
+    background-color: #ccc;
+  }
+
+  .react-datepicker__year-option:hover .react-datepicker__navigation--years-upcoming,
+  .react-datepicker__month-option:hover .react-datepicker__navigation--years-upcoming,
+  .react-datepicker__month-year-option:hover .react-datepicker__navigation--years-upcoming {
+    border-bottom-color: #b3b3b3;
+  }
+
+  .react-datepicker__year-option:hover .react-datepicker__navigation--years-previous,
+  .react-datepicker__month-option:hover .react-datepicker__navigation--years-previous,
+  .react-datepicker__month-year-option:hover .react-datepicker__navigation--years-previous {
+    border-top-color: #b3b3b3;
+  }
+
+  .react-datepicker__year-option--selected,
+  .react-datepicker__month-option--selected,
+  .react-datepicker__month-year-option--selected {
+    position: absolute;
+    left: 15px;
+  }
+
+  .react-datepicker__close-icon {
+    cursor: pointer;
+    background-color: transparent;
+    border: 0;
+    outline: 0;
+    padding: 0px 6px 0px 0px;
+    position: absolute;
+    top: 0;
+    right: 0;
+    height: 100%;
+    display: table-cell;
+    vertical-align: middle;
+  }
+
+  .react-datepicker__close-icon::after {
+    cursor: pointer;
+    background-color: #216ba5;
+    color: #fff;
+    border-radius: 50%;
+    height: 16px;
+    width: 16px;
+    padding: 2px;
+    font-size: 12px;
+    line-height: 1;
+    text-align: center;
+    display: table-cell;
+    vertical-align: middle;
+    content: '\\00d7';
+  }
+
+  .react-datepicker__today-button {
+    background: #f0f0f0;
+    border-top: 1px solid #aeaeae;
+    cursor: pointer;
+    text-align: center;
+    font-weight: bold;
+    padding: 5px 0;
+    clear: left;
+  }
+
+  .react-datepicker__portal {
+    position: fixed;
+    width: 100vw;
+    height: 100vh;
+    background-color: rgba(0, 0, 0, 0.8);
+    left: 0;
+    top: 0;
+    justify-content: center;
+    align-items: center;
+    display: flex;
+    z-index: 2147483647;
+  }
+
+  .react-datepicker__portal .react-datepicker__day-name,
+  .react-datepicker__portal .react-datepicker__day,
+  .react-datepicker__portal .react-datepicker__time-name {
+    width: 3rem;
+    line-height: 3rem;
+  }
+
+  @media (max-width: 400px), (max-height: 550px) {
+    .react-datepicker__portal .react-datepicker__day-name,
+    .react-datepicker__portal .react-datepicker__day,
+    .react-datepicker__portal .react-datepicker__time-name {
+      width: 2rem;
+      line-height: 2rem;
+    }
+  }
+
+  .react-datepicker__portal .react-datepicker__current-month,
+  .react-datepicker__portal .react-datepicker-time__header {
+    font-size: 1.44rem;
+  }
+
+  .react-datepicker__portal .react-datepicker__navigation {
+    border: 0.81rem solid transparent;
+  }
+
+  .react-datepicker__portal .react-datepicker__navigation--previous {
+    border-right-color: #ccc;
+  }
+
+  .react-datepicker__portal .react-datepicker__navigation--previous:hover {
+    border-right-color: #b3b3b3;
+  }
+
+  .react-datepicker__portal .react-datepicker__navigation--previous--disabled,
+  .react-datepicker__portal .react-datepicker__navigation--previous--disabled:hover {
+    border-right-color: #e6e6e6;
+    cursor: default;
+  }
+
+  .react-datepicker__portal .react-datepicker__navigation--next {
+    border-left-color: #ccc;
+  }
+
+  .react-datepicker__portal .react-datepicker__navigation--next:hover {
+    border-left-color: #b3b3b3;
+  }
+
+  .react-datepicker__portal .react-datepicker__navigation--next--disabled,
+  .react-datepicker__portal .react-datepicker__navigation--next--disabled:hover {
+    border-left-color: #e6e6e6;
+    cursor: default;
+  }
+
+  .react-datepicker__close-icon {
+    right: 30px;
+  }
+  
+  
+`,t.DatePickerContainer=i.default.div`
+  background: ${e=>e.theme.colors.datePicker.background};
+  box-shadow: ${e=>"enterpriseDark"===e.theme.name?e.theme.elevation.lowest:e.theme.elevation.mid};
+  border-radius: 3px;
+
+  .react-datepicker {
+    font-size: 0.8rem;
+    background-color: ${e=>e.theme.colors.datePicker.background};
+    border: none;
+
+    .react-datepicker__header {
+      background-color: ${e=>e.theme.colors.datePicker.background};
+      border-bottom: none;
+      padding: 0;
+
+      .react-datepicker__day-names {
+        display: flex;
+        justify-content: space-evenly;
+
+        .react-datepicker__day-name {
+          color: ${e=>e.theme.colors.datePicker.day.selected.foreground};
+        }
+      }
+    }
+
+    .react-datepicker__month-container {
+      margin: 0 ${e=>e.theme.spacing.two};
+    }
+
+    .react-datepicker__today-button {
+      background-color: ${e=>e.theme.colors.datePicker.background};
+    }
+
+    .react-datepicker__month {
+      margin: 0;
+    }
+
+    .react-datepicker__day-name,
+    .react-datepicker__day,
+    .react-datepicker__time-name {
+      display: inline-block;
+      line-height: 1.7rem;
+      margin: 0.166rem;
+      text-align: center;
+      width: 1.7rem;
+    }
+
+    .react-datepicker__day {
+      height: ${e=>e.theme.spacing.eight};
+      width: ${e=>e.theme.spacing.eight};
+      color: ${e=>e.theme.colors.datePicker.day.color};
+      margin: 0;
+
+      &:hover {
+        border-radius: initial;
+      }
+    }
+
+    .react-datepicker__day--outside-month {
+      visibility: hidden;
+    }
+
+    .react-datepicker__day--disabled {
+      color: rgba(158, 158, 158, 0.3);
+      cursor: not-allowed;
+    }
+
+    .react-datepicker__day--in-range,
+    .react-datepicker__day--in-selecting-range {
+      background-color: rgba(224, 224, 224, 0.2);
+      border-radius: inherit;
+
+      &:hover {
+        background-color: ${e=>e.theme.colors.datePicker.day.selected.hover};
+      }
+    }
+
+    .react-datepicker__day--range-start {
+      background-color: ${e=>e.theme.colors.datePicker.day.selected.background};
+      color: ${e=>e.theme.colors.datePicker.day.selected.foreground};
+    }
+
+    .react-datepicker__day--selected,
+    .react-datepicker__day--keyboard-selected {
+      background-color: ${e=>e.theme.colors.datePicker.day.selected.background};
+      color: ${e=>e.theme.colors.datePicker.day.selected.foreground};
+      border-radius: 0;
+    }
+
+    .react-datepicker__today-button {
+      border-top: 1px solid
+        ${e=>e.theme.colors.datePicker.today.border};
+      color: ${e=>e.theme.colors.datePicker.today.color};
+      margin: 0 ${e=>e.theme.spacing.two};
+      padding: ${e=>e.theme.spacing.three} 0;
+    }
+  }
+`,t.RDPCustomHeaderContainer=i.default.div`
+  border-bottom: 1px solid
+    ${e=>e.theme.colors.datePicker.header.border};
+  color: ${e=>e.theme.colors.datePicker.header.color};
+  display: flex;
+  justify-content: space-between;
+`,t.MonthButton=i.default.button`
+  background: none;
+  border: none;
+  color: inherit;
+  margin-right: ${e=>e.theme.spacing.three};
+  padding: 0;
+  font: inherit;
+  outline: none;
+`,t.SelectDateButton=i.default.button`
+  background: ${e=>e.theme.colors.datePicker.selectDate.background};
+  border: 1px solid
+    ${e=>e.isOpen?e.theme.colors.datePicker.selectDate.border.open:e.theme.colors.datePicker.selectDate.border.closed};
+  box-sizing: border-box;
+
+  height: 32px;
+  width: 240px;
+  padding: 0 ${e=>e.theme.spacing.two};
+
+  display: flex;
+  justify-content: space-between;
+  align-items: center;
+
+  .left,
+  .right {
+    display: flex;
+    align-items: center;
+  }
+
+  .left {
+    > span {
+      color: ${e=>e.theme.colors.datePicker.selectDate.left.color};
+
+      &.placeholder {
+        color: ${e=>e.theme.colors.datePicker.selectDate.left.placeholderColor};
+      }
+    }
+
+    > svg {
+      margin-right: ${e=>e.theme.spacing.two};
+    }
+  }
+
+  .right {
+    padding-left: ${e=>e.theme.spacing.two};
+    height: 60%;
+    border-left: 2px solid
+      ${e=>e.theme.colors.datePicker.selectDate.right.border};
+  }
+`,t.FlexWrapper=i.default.div`
+  display: flex;
+  .react-datepicker__close-icon::after {
+    background-color: ${e=>e.theme.colors.datePicker.background};
+    color: ${e=>e.theme.colors.datePicker.close.color};
+  }
+`,t.FlexWrapperColumn=(0,i.default)(t.FlexWrapper)`
+  flex-direction: column;
+  .react-datepicker__close-icon::after {
+    background-color: ${e=>e.theme.colors.datePicker.close.background};
+    color: ${e=>e.theme.colors.datePicker.close.color};
+  }
+`,t.Label=i.default.p`
+  font-size: ${e=>e.theme.typography.size.small};
+  margin: 0 0 ${e=>e.theme.spacing.one};
+`},21924:function(e,t,r){"use strict";var n=r(40210),a=r(55559),o=a(n("String.prototype.indexOf"));e.exports=function(e,t){var r=n(e,!!t);return"function"==typeof r&&o(e,".prototype.")>-1?a(r):r}},55559:function(e,t,r){"use strict";var n=r(58612),a=r(40210),o=r(67771),i=r(14453),c=a("%Function.prototype.apply%"),s=a("%Function.prototype.call%"),u=a("%Reflect.apply%",!0)||n.call(s,c),l=r(24429),d=a("%Math.max%");e.exports=function(e){if("function"!=typeof e)throw new i("a function is required");var t=u(n,s,arguments);return o(t,1+d(0,e.length-(arguments.length-1)),!0)};var p=function(){return u(n,c,arguments)};l?l(e.exports,"apply",{value:p}):e.exports.apply=p},12296:function(e,t,r){"use strict";var n=r(24429),a=r(33464),o=r(14453),i=r(27296);e.exports=function(e,t,r){if(!e||"object"!=typeof e&&"function"!=typeof e)throw new o("`obj` must be an object or a function`");if("string"!=typeof t&&"symbol"!=typeof t)throw new o("`property` must be a string or a symbol`");if(arguments.length>3&&"boolean"!=typeof arguments[3]&&null!==arguments[3])throw new o("`nonEnumerable`, if provided, must be a boolean or null");if(arguments.length>4&&"boolean"!=typeof arguments[4]&&null!==arguments[4])throw new o("`nonWritable`, if provided, must be a boolean or null");if(arguments.length>5&&"boolean"!=typeof arguments[5]&&null!==arguments[5])throw new o("`nonConfigurable`, if provided, must be a boolean or null");if(arguments.length>6&&"boolean"!=typeof arguments[6])throw new o("`loose`, if provided, must be a boolean");var c=arguments.length>3?arguments[3]:null,s=arguments.length>4?arguments[4]:null,u=arguments.length>5?arguments[5]:null,l=arguments.length>6&&arguments[6],d=!!i&&i(e,t);if(n)n(e,t,{configurable:null===u&&d?d.configurable:!u,enumerable:null===c&&d?d.enumerable:!c,value:r,writable:null===s&&d?d.writable:!s});else if(!l&&(c||s||u))throw new a("This environment does not support defining a property as non-configurable, non-writable, or non-enumerable.");else e[t]=r}},4289:function(e,t,r){"use strict";var n=r(82215),a="function"==typeof Symbol&&"symbol"==typeof Symbol("foo"),o=Object.prototype.toString,i=Array.prototype.concat,c=r(12296),s=r(31044)(),u=function(e,t,r,n){if(t in e){if(!0===n){if(e[t]===r)return}else if(!("function"==typeof n&&"[object Function]"===o.call(n))||!n())return}s?c(e,t,r,!0):c(e,t,r)},l=function(e,t){var r=arguments.length>2?arguments[2]:{},o=n(t);a&&(o=i.call(o,Object.getOwnPropertySymbols(t)));for(var c=0;c<o.length;c+=1)u(e,o[c],t[o[c]],r[o[c]])};l.supportsDescriptors=!!s,e.exports=l},24429:function(e,t,r){"use strict";var n=r(40210)("%Object.defineProperty%",!0)||!1;if(n)try{n({},"a",{value:1})}catch(e){n=!1}e.exports=n},53981:function(e){"use strict";e.exports=EvalError},81648:function(e){"use strict";e.exports=Error},24726:function(e){"use strict";e.exports=RangeError},26712:function(e){"use strict";e.exports=ReferenceError},33464:function(e){"use strict";e.exports=SyntaxError},14453:function(e){"use strict";e.exports=TypeError},43915:function(e){"use strict";e.exports=URIError},17648:function(e){"use strict";var t=Object.prototype.toString,r=Math.max,n=function(e,t){for(var r=[],n=0;n<e.length;n+=1)r[n]=e[n];for(var a=0;a<t.length;a+=1)r[a+e.length]=t[a];return r},a=function(e,t){for(var r=[],n=t||0,a=0;n<e.length;n+=1,a+=1)r[a]=e[n];return r},o=function(e,t){for(var r="",n=0;n<e.length;n+=1)r+=e[n],n+1<e.length&&(r+=t);return r};e.exports=function(e){var i,c=this;if("function"!=typeof c||"[object Function]"!==t.apply(c))throw TypeError("Function.prototype.bind called on incompatible "+c);for(var s=a(arguments,1),u=r(0,c.length-s.length),l=[],d=0;d<u;d++)l[d]="$"+d;if(i=Function("binder","return function ("+o(l,",")+"){ return binder.apply(this,arguments); }")(function(){if(this instanceof i){var t=c.apply(this,n(s,arguments));return Object(t)===t?t:this}return c.apply(e,n(s,arguments))}),c.prototype){var p=function(){};p.prototype=c.prototype,i.prototype=new p,p.prototype=null}return i}},58612:function(e,t,r){"use strict";var n=r(17648);e.exports=Function.prototype.bind||n},25972:function(e){"use strict";var t=function(){return"string"==typeof(function(){}).name},r=Object.getOwnPropertyDescriptor;if(r)try{r([],"length")}catch(e){r=null}t.functionsHaveConfigurableNames=function(){if(!t()||!r)return!1;var e=r(function(){},"name");return!!e&&!!e.configurable};var n=Function.prototype.bind;t.boundFunctionsHaveNames=function(){return t()&&"function"==typeof n&&""!==(function(){}).bind().name},e.exports=t},40210:function(e,t,r){"use strict";var n,a=r(81648),o=r(53981),i=r(24726),c=r(26712),s=r(33464),u=r(14453),l=r(43915),d=Function,p=function(e){try{return d('"use strict"; return ('+e+").constructor;")()}catch(e){}},f=Object.getOwnPropertyDescriptor;if(f)try{f({},"")}catch(e){f=null}var h=function(){throw new u},m=f?function(){try{return arguments.callee,h}catch(e){try{return f(arguments,"callee").get}catch(e){return h}}}():h,y=r(41405)(),v=r(28185)(),g=Object.getPrototypeOf||(v?function(e){return e.__proto__}:null),b={},w="undefined"!=typeof Uint8Array&&g?g(Uint8Array):n,k={__proto__:null,"%AggregateError%":"undefined"==typeof AggregateError?n:AggregateError,"%Array%":Array,"%ArrayBuffer%":"undefined"==typeof ArrayBuffer?n:ArrayBuffer,"%ArrayIteratorPrototype%":y&&g?g([][Symbol.iterator]()):n,"%AsyncFromSyncIteratorPrototype%":n,"%AsyncFunction%":b,"%AsyncGenerator%":b,"%AsyncGeneratorFunction%":b,"%AsyncIteratorPrototype%":b,"%Atomics%":"undefined"==typeof Atomics?n:Atomics,"%BigInt%":"undefined"==typeof BigInt?n:BigInt,"%BigInt64Array%":"undefined"==typeof BigInt64Array?n:BigInt64Array,"%BigUint64Array%":"undefined"==typeof BigUint64Array?n:BigUint64Array,"%Boolean%":Boolean,"%DataView%":"undefined"==typeof DataView?n:DataView,"%Date%":Date,"%decodeURI%":decodeURI,"%decodeURIComponent%":decodeURIComponent,"%encodeURI%":encodeURI,"%encodeURIComponent%":encodeURIComponent,"%Error%":a,"%eval%":eval,"%EvalError%":o,"%Float32Array%":"undefined"==typeof Float32Array?n:Float32Array,"%Float64Array%":"undefined"==typeof Float64Array?n:Float64Array,"%FinalizationRegistry%":"undefined"==typeof FinalizationRegistry?n:FinalizationRegistry,"%Function%":d,"%GeneratorFunction%":b,"%Int8Array%":"undefined"==typeof Int8Array?n:Int8Array,"%Int16Array%":"undefined"==typeof Int16Array?n:Int16Array,"%Int32Array%":"undefined"==typeof Int32Array?n:Int32Array,"%isFinite%":isFinite,"%isNaN%":isNaN,"%IteratorPrototype%":y&&g?g(g([][Symbol.iterator]())):n,"%JSON%":"object"==typeof JSON?JSON:n,"%Map%":"undefined"==typeof Map?n:Map,"%MapIteratorPrototype%":"undefined"!=typeof Map&&y&&g?g(new Map()[Symbol.iterator]()):n,"%Math%":Math,"%Number%":Number,"%Object%":Object,"%parseFloat%":parseFloat,"%parseInt%":parseInt,"%Promise%":"undefined"==typeof Promise?n:Promise,"%Proxy%":"undefined"==typeof Proxy?n:Proxy,"%RangeError%":i,"%ReferenceError%":c,"%Reflect%":"undefined"==typeof Reflect?n:Reflect,"%RegExp%":RegExp,"%Set%":"undefined"==typeof Set?n:Set,"%SetIteratorPrototype%":"undefined"!=typeof Set&&y&&g?g(new Set()[Symbol.iterator]()):n,"%SharedArrayBuffer%":"undefined"==typeof SharedArrayBuffer?n:SharedArrayBuffer,"%String%":String,"%StringIteratorPrototype%":y&&g?g(""[Symbol.iterator]()):n,"%Symbol%":y?Symbol:n,"%SyntaxError%":s,"%ThrowTypeError%":m,"%TypedArray%":w,"%TypeError%":u,"%Uint8Array%":"undefined"==typeof Uint8Array?n:Uint8Array,"%Uint8ClampedArray%":"undefined"==typeof Uint8ClampedArray?n:Uint8ClampedArray,"%Uint16Array%":"undefined"==typeof Uint16Array?n:Uint16Array,"%Uint32Array%":"undefined"==typeof Uint32Array?n:Uint32Array,"%URIError%":l,"%WeakMap%":"undefined"==typeof WeakMap?n:WeakMap,"%WeakRef%":"undefined"==typeof WeakRef?n:WeakRef,"%WeakSet%":"undefined"==typeof WeakSet?n:WeakSet};if(g)try{null.error}catch(e){var _=g(g(e));k["%Error.prototype%"]=_}var D=function e(t){var r;if("%AsyncFunction%"===t)r=p("async function () {}");else if("%GeneratorFunction%"===t)r=p("function* () {}");else if("%AsyncGeneratorFunction%"===t)r=p("async function* () {}");else if("%AsyncGenerator%"===t){var n=e("%AsyncGeneratorFunction%");n&&(r=n.prototype)}else if("%AsyncIteratorPrototype%"===t){var a=e("%AsyncGenerator%");a&&g&&(r=g(a.prototype))}return k[t]=r,r},x={__proto__:null,"%ArrayBufferPrototype%":["ArrayBuffer","prototype"],"%ArrayPrototype%":["Array","prototype"],"%ArrayProto_entries%":["Array","prototype","entries"],"%ArrayProto_forEach%":["Array","prototype","forEach"],"%ArrayProto_keys%":["Array","prototype","keys"],"%ArrayProto_values%":["Array","prototype","values"],"%AsyncFunctionPrototype%":["AsyncFunction","prototype"],"%AsyncGenerator%":["AsyncGeneratorFunction","prototype"],"%AsyncGeneratorPrototype%":["AsyncGeneratorFunction","prototype","prototype"],"%BooleanPrototype%":["Boolean","prototype"],"%DataViewPrototype%":["DataView","prototype"],"%DatePrototype%":["Date","prototype"],"%ErrorPrototype%":["Error","prototype"],"%EvalErrorPrototype%":["EvalError","prototype"],"%Float32ArrayPrototype%":["Float32Array","prototype"],"%Float64ArrayPrototype%":["Float64Array","prototype"],"%FunctionPrototype%":["Function","prototype"],"%Generator%":["GeneratorFunction","prototype"],"%GeneratorPrototype%":["GeneratorFunction","prototype","prototype"],"%Int8ArrayPrototype%":["Int8Array","prototype"],"%Int16ArrayPrototype%":["Int16Array","prototype"],"%Int32ArrayPrototype%":["Int32Array","prototype"],"%JSONParse%":["JSON","parse"],"%JSONStringify%":["JSON","stringify"],"%MapPrototype%":["Map","prototype"],"%NumberPrototype%":["Number","prototype"],"%ObjectPrototype%":["Object","prototype"],"%ObjProto_toString%":["Object","prototype","toString"],"%ObjProto_valueOf%":["Object","prototype","valueOf"],"%PromisePrototype%":["Promise","prototype"],"%PromiseProto_then%":["Promise","prototype","then"],"%Promise_all%":["Promise","all"],"%Promise_reject%":["Promise","reject"],"%Promise_resolve%":["Promise","resolve"],"%RangeErrorPrototype%":["RangeError","prototype"],"%ReferenceErrorPrototype%":["ReferenceError","prototype"],"%RegExpPrototype%":["RegExp","prototype"],"%SetPrototype%":["Set","prototype"],"%SharedArrayBufferPrototype%":["SharedArrayBuffer","prototype"],"%StringPrototype%":["String","prototype"],"%SymbolPrototype%":["Symbol","prototype"],"%SyntaxErrorPrototype%":["SyntaxError","prototype"],"%TypedArrayPrototype%":["TypedArray","prototype"],"%TypeErrorPrototype%":["TypeError","prototype"],"%Uint8ArrayPrototype%":["Uint8Array","prototype"],"%Uint8ClampedArrayPrototype%":["Uint8ClampedArray","prototype"],"%Uint16ArrayPrototype%":["Uint16Array","prototype"],"%Uint32ArrayPrototype%":["Uint32Array","prototype"],"%URIErrorPrototype%":["URIError","prototype"],"%WeakMapPrototype%":["WeakMap","prototype"],"%WeakSetPrototype%":["WeakSet","prototype"]},C=r(58612),S=r(48824),T=C.call(Function.call,Array.prototype.concat),P=C.call(Function.apply,Array.prototype.splice),E=C.call(Function.call,String.prototype.replace),Z=C.call(Function.call,String.prototype.slice),M=C.call(Function.call,RegExp.prototype.exec),O=/[^%.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|%$))/g,N=/\\(\\)?/g,Y=function(e){var t=Z(e,0,1),r=Z(e,-1);if("%"===t&&"%"!==r)throw new s("invalid intrinsic syntax, expected closing `%`");if("%"===r&&"%"!==t)throw new s("invalid intrinsic syntax, expected opening `%`");var n=[];return E(e,O,function(e,t,r,a){n[n.length]=r?E(a,N,"$1"):t||e}),n},A=function(e,t){var r,n=e;if(S(x,n)&&(n="%"+(r=x[n])[0]+"%"),S(k,n)){var a=k[n];if(a===b&&(a=D(n)),void 0===a&&!t)throw new u("intrinsic "+e+" exists, but is not available. Please file an issue!");return{alias:r,name:n,value:a}}throw new s("intrinsic "+e+" does not exist!")};e.exports=function(e,t){if("string"!=typeof e||0===e.length)throw new u("intrinsic name must be a non-empty string");if(arguments.length>1&&"boolean"!=typeof t)throw new u('"allowMissing" argument must be a boolean');if(null===M(/^%?[^%]*%?$/,e))throw new s("`%` may not be present anywhere but at the beginning and end of the intrinsic name");var r=Y(e),n=r.length>0?r[0]:"",a=A("%"+n+"%",t),o=a.name,i=a.value,c=!1,l=a.alias;l&&(n=l[0],P(r,T([0,1],l)));for(var d=1,p=!0;d<r.length;d+=1){var h=r[d],m=Z(h,0,1),y=Z(h,-1);if(('"'===m||"'"===m||"`"===m||'"'===y||"'"===y||"`"===y)&&m!==y)throw new s("property names with quotes must have matching quotes");if("constructor"!==h&&p||(c=!0),n+="."+h,S(k,o="%"+n+"%"))i=k[o];else if(null!=i){if(!(h in i)){if(!t)throw new u("base intrinsic for "+e+" exists, but the property is not available.");return}if(f&&d+1>=r.length){var v=f(i,h);i=(p=!!v)&&"get"in v&&!("originalValue"in v.get)?v.get:i[h]}else p=S(i,h),i=i[h];p&&!c&&(k[o]=i)}}return i}},27296:function(e,t,r){"use strict";var n=r(40210)("%Object.getOwnPropertyDescriptor%",!0);if(n)try{n([],"length")}catch(e){n=null}e.exports=n},47815:function(e,t,r){"use strict";var n="__global_unique_id__";e.exports=function(){return r.g[n]=(r.g[n]||0)+1}},31044:function(e,t,r){"use strict";var n=r(24429),a=function(){return!!n};a.hasArrayLengthDefineBug=function(){if(!n)return null;try{return 1!==n([],"length",{value:1}).length}catch(e){return!0}},e.exports=a},28185:function(e){"use strict";var t={__proto__:null,foo:{}},r=Object;e.exports=function(){return({__proto__:t}).foo===t.foo&&!(t instanceof r)}},41405:function(e,t,r){"use strict";var n="undefined"!=typeof Symbol&&Symbol,a=r(55419);e.exports=function(){return"function"==typeof n&&"function"==typeof Symbol&&"symbol"==typeof n("foo")&&"symbol"==typeof Symbol("bar")&&a()}},55419:function(e){"use strict";e.exports=function(){if("function"!=typeof Symbol||"function"!=typeof Object.getOwnPropertySymbols)return!1;if("symbol"==typeof Symbol.iterator)return!0;var e={},t=Symbol("test"),r=Object(t);if("string"==typeof t||"[object Symbol]"!==Object.prototype.toString.call(t)||"[object Symbol]"!==Object.prototype.toString.call(r))return!1;for(t in e[t]=42,e)return!1;if("function"==typeof Object.keys&&0!==Object.keys(e).length||"function"==typeof Object.getOwnPropertyNames&&0!==Object.getOwnPropertyNames(e).length)return!1;var n=Object.getOwnPropertySymbols(e);if(1!==n.length||n[0]!==t||!Object.prototype.propertyIsEnumerable.call(e,t))return!1;if("function"==typeof Object.getOwnPropertyDescriptor){var a=Object.getOwnPropertyDescriptor(e,t);if(42!==a.value||!0!==a.enumerable)return!1}return!0}},96410:function(e,t,r){"use strict";var n=r(55419);e.exports=function(){return n()&&!!Symbol.toStringTag}},48824:function(e,t,r){"use strict";var n=Function.prototype.call,a=Object.prototype.hasOwnProperty,o=r(58612);e.exports=o.call(n,a)},82584:function(e,t,r){"use strict";var n=r(96410)(),a=r(21924)("Object.prototype.toString"),o=function(e){return(!n||!e||"object"!=typeof e||!(Symbol.toStringTag in e))&&"[object Arguments]"===a(e)},i=function(e){return!!o(e)||null!==e&&"object"==typeof e&&"number"==typeof e.length&&e.length>=0&&"[object Array]"!==a(e)&&"[object Function]"===a(e.callee)},c=function(){return o(arguments)}();o.isLegacyArguments=i,e.exports=c?o:i},18923:function(e,t,r){"use strict";var n=Date.prototype.getDay,a=function(e){try{return n.call(e),!0}catch(e){return!1}},o=Object.prototype.toString,i=r(96410)();e.exports=function(e){return"object"==typeof e&&null!==e&&(i?a(e):"[object Date]"===o.call(e))}},98420:function(e,t,r){"use strict";var n,a,o,i,c=r(21924),s=r(96410)();if(s){n=c("Object.prototype.hasOwnProperty"),a=c("RegExp.prototype.exec"),o={};var u=function(){throw o};i={toString:u,valueOf:u},"symbol"==typeof Symbol.toPrimitive&&(i[Symbol.toPrimitive]=u)}var l=c("Object.prototype.toString"),d=Object.getOwnPropertyDescriptor;e.exports=s?function(e){if(!e||"object"!=typeof e)return!1;var t=d(e,"lastIndex");if(!(t&&n(t,"value")))return!1;try{a(e,i)}catch(e){return e===o}}:function(e){return!!e&&("object"==typeof e||"function"==typeof e)&&"[object RegExp]"===l(e)}},86573:function(e,t,r){"use strict";r.d(t,{Z:function(){return l}});var n,a={lessThanXSeconds:{one:"less than a second",other:"less than {{count}} seconds"},xSeconds:{one:"1 second",other:"{{count}} seconds"},halfAMinute:"half a minute",lessThanXMinutes:{one:"less than a minute",other:"less than {{count}} minutes"},xMinutes:{one:"1 minute",other:"{{count}} minutes"},aboutXHours:{one:"about 1 hour",other:"about {{count}} hours"},xHours:{one:"1 hour",other:"{{count}} hours"},xDays:{one:"1 day",other:"{{count}} days"},aboutXWeeks:{one:"about 1 week",other:"about {{count}} weeks"},xWeeks:{one:"1 week",other:"{{count}} weeks"},aboutXMonths:{one:"about 1 month",other:"about {{count}} months"},xMonths:{one:"1 month",other:"{{count}} months"},aboutXYears:{one:"about 1 year",other:"about {{count}} years"},xYears:{one:"1 year",other:"{{count}} years"},overXYears:{one:"over 1 year",other:"over {{count}} years"},almostXYears:{one:"almost 1 year",other:"almost {{count}} years"}};function o(e){return function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},r=t.width?String(t.width):e.defaultWidth;return e.formats[r]||e.formats[e.defaultWidth]}}var i={date:o({formats:{full:"EEEE, MMMM do, y",long:"MMMM do, y",medium:"MMM d, y",short:"MM/dd/yyyy"},defaultWidth:"full"}),time:o({formats:{full:"h:mm:ss a zzzz",long:"h:mm:ss a z",medium:"h:mm:ss a",short:"h:mm a"},defaultWidth:"full"}),dateTime:o({formats:{full:"{{date}} 'at' {{time}}",long:"{{date}} 'at' {{time}}",medium:"{{date}}, {{time}}",short:"{{date}}, {{time}}"},defaultWidth:"full"})},c={lastWeek:"'last' eeee 'at' p",yesterday:"'yesterday at' p",today:"'today at' p",tomorrow:"'tomorrow at' p",nextWeek:"eeee 'at' p",other:"P"};function s(e){return function(t,r){var n;if("formatting"===(null!=r&&r.context?String(r.context):"standalone")&&e.formattingValues){var a=e.defaultFormattingWidth||e.defaultWidth,o=null!=r&&r.width?String(r.width):a;n=e.formattingValues[o]||e.formattingValues[a]}else{var i=e.defaultWidth,c=null!=r&&r.width?String(r.width):e.defaultWidth;n=e.values[c]||e.values[i]}return n[e.argumentCallback?e.argumentCallback(t):t]}}function u(e){return function(t){var r,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},a=n.width,o=a&&e.matchPatterns[a]||e.matchPatterns[e.defaultMatchWidth],i=t.match(o);if(!i)return null;var c=i[0],s=a&&e.parsePatterns[a]||e.parsePatterns[e.defaultParseWidth],u=Array.isArray(s)?function(e,t){for(var r=0;r<e.length;r++)if(t(e[r]))return r}(s,function(e){return e.test(c)}):function(e,t){for(var r in e)if(e.hasOwnProperty(r)&&t(e[r]))return r}(s,function(e){return e.test(c)});return r=e.valueCallback?e.valueCallback(u):u,{value:r=n.valueCallback?n.valueCallback(r):r,rest:t.slice(c.length)}}}var l={code:"en-US",formatDistance:function(e,t,r){var n,o=a[e];return(n="string"==typeof o?o:1===t?o.one:o.other.replace("{{count}}",t.toString()),null!=r&&r.addSuffix)?r.comparison&&r.comparison>0?"in "+n:n+" ago":n},formatLong:i,formatRelative:function(e,t,r,n){return c[e]},localize:{ordinalNumber:function(e,t){var r=Number(e),n=r%100;if(n>20||n<10)switch(n%10){case 1:return r+"st";case 2:return r+"nd";case 3:return r+"rd"}return r+"th"},era:s({values:{narrow:["B","A"],abbreviated:["BC","AD"],wide:["Before Christ","Anno Domini"]},defaultWidth:"wide"}),quarter:s({values:{narrow:["1","2","3","4"],abbreviated:["Q1","Q2","Q3","Q4"],wide:["1st quarter","2nd quarter","3rd quarter","4th quarter"]},defaultWidth:"wide",argumentCallback:function(e){return e-1}}),month:s({values:{narrow:["J","F","M","A","M","J","J","A","S","O","N","D"],abbreviated:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],wide:["January","February","March","April","May","June","July","August","September","October","November","December"]},defaultWidth:"wide"}),day:s({values:{narrow:["S","M","T","W","T","F","S"],short:["Su","Mo","Tu","We","Th","Fr","Sa"],abbreviated:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],wide:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"]},defaultWidth:"wide"}),dayPeriod:s({values:{narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"}},defaultWidth:"wide",formattingValues:{narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"}},defaultFormattingWidth:"wide"})},match:{ordinalNumber:(n={matchPattern:/^(\d+)(th|st|nd|rd)?/i,parsePattern:/\d+/i,valueCallback:function(e){return parseInt(e,10)}},function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=e.match(n.matchPattern);if(!r)return null;var a=r[0],o=e.match(n.parsePattern);if(!o)return null;var i=n.valueCallback?n.valueCallback(o[0]):o[0];return{value:i=t.valueCallback?t.valueCallback(i):i,rest:e.slice(a.length)}}),era:u({matchPatterns:{narrow:/^(b|a)/i,abbreviated:/^(b\.?\s?c\.?|b\.?\s?c\.?\s?e\.?|a\.?\s?d\.?|c\.?\s?e\.?)/i,wide:/^(before christ|before common era|anno domini|common era)/i},defaultMatchWidth:"wide",parsePatterns:{any:[/^b/i,/^(a|c)/i]},defaultParseWidth:"any"}),quarter:u({matchPatterns:{narrow:/^[1234]/i,abbreviated:/^q[1234]/i,wide:/^[1234](th|st|nd|rd)? quarter/i},defaultMatchWidth:"wide",parsePatterns:{any:[/1/i,/2/i,/3/i,/4/i]},defaultParseWidth:"any",valueCallback:function(e){return e+1}}),month:u({matchPatterns:{narrow:/^[jfmasond]/i,abbreviated:/^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/i,wide:/^(january|february|march|april|may|june|july|august|september|october|november|december)/i},defaultMatchWidth:"wide",parsePatterns:{narrow:[/^j/i,/^f/i,/^m/i,/^a/i,/^m/i,/^j/i,/^j/i,/^a/i,/^s/i,/^o/i,/^n/i,/^d/i],any:[/^ja/i,/^f/i,/^mar/i,/^ap/i,/^may/i,/^jun/i,/^jul/i,/^au/i,/^s/i,/^o/i,/^n/i,/^d/i]},defaultParseWidth:"any"}),day:u({matchPatterns:{narrow:/^[smtwf]/i,short:/^(su|mo|tu|we|th|fr|sa)/i,abbreviated:/^(sun|mon|tue|wed|thu|fri|sat)/i,wide:/^(sunday|monday|tuesday|wednesday|thursday|friday|saturday)/i},defaultMatchWidth:"wide",parsePatterns:{narrow:[/^s/i,/^m/i,/^t/i,/^w/i,/^t/i,/^f/i,/^s/i],any:[/^su/i,/^m/i,/^tu/i,/^w/i,/^th/i,/^f/i,/^sa/i]},defaultParseWidth:"any"}),dayPeriod:u({matchPatterns:{narrow:/^(a|p|mi|n|(in the|at) (morning|afternoon|evening|night))/i,any:/^([ap]\.?\s?m\.?|midnight|noon|(in the|at) (morning|afternoon|evening|night))/i},defaultMatchWidth:"any",parsePatterns:{any:{am:/^a/i,pm:/^p/i,midnight:/^mi/i,noon:/^no/i,morning:/morning/i,afternoon:/afternoon/i,evening:/evening/i,night:/night/i}},defaultParseWidth:"any"})},options:{weekStartsOn:0,firstWeekContainsDate:1}}},19461:function(e,t,r){"use strict";r.d(t,{j:function(){return a}});var n={};function a(){return n}},81330:function(e,t){"use strict";var r=function(e,t){switch(e){case"P":return t.date({width:"short"});case"PP":return t.date({width:"medium"});case"PPP":return t.date({width:"long"});default:return t.date({width:"full"})}},n=function(e,t){switch(e){case"p":return t.time({width:"short"});case"pp":return t.time({width:"medium"});case"ppp":return t.time({width:"long"});default:return t.time({width:"full"})}};t.Z={p:n,P:function(e,t){var a,o=e.match(/(P+)(p+)?/)||[],i=o[1],c=o[2];if(!c)return r(e,t);switch(i){case"P":a=t.dateTime({width:"short"});break;case"PP":a=t.dateTime({width:"medium"});break;case"PPP":a=t.dateTime({width:"long"});break;default:a=t.dateTime({width:"full"})}return a.replace("{{date}}",r(i,t)).replace("{{time}}",n(c,t))}}},19116:function(e,t,r){"use strict";function n(e){var t=new Date(Date.UTC(e.getFullYear(),e.getMonth(),e.getDate(),e.getHours(),e.getMinutes(),e.getSeconds(),e.getMilliseconds()));return t.setUTCFullYear(e.getFullYear()),e.getTime()-t.getTime()}r.d(t,{Z:function(){return n}})},89767:function(e,t,r){"use strict";r.d(t,{Z:function(){return c}});var n=r(27760),a=r(62973),o=r(81089),i=r(3805);function c(e){(0,i.Z)(1,arguments);var t=(0,n.default)(e);return Math.round(((0,a.Z)(t).getTime()-(function(e){(0,i.Z)(1,arguments);var t=(0,o.Z)(e),r=new Date(0);return r.setUTCFullYear(t,0,4),r.setUTCHours(0,0,0,0),(0,a.Z)(r)})(t).getTime())/6048e5)+1}},81089:function(e,t,r){"use strict";r.d(t,{Z:function(){return i}});var n=r(27760),a=r(3805),o=r(62973);function i(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e),r=t.getUTCFullYear(),i=new Date(0);i.setUTCFullYear(r+1,0,4),i.setUTCHours(0,0,0,0);var c=(0,o.Z)(i),s=new Date(0);s.setUTCFullYear(r,0,4),s.setUTCHours(0,0,0,0);var u=(0,o.Z)(s);return t.getTime()>=c.getTime()?r+1:t.getTime()>=u.getTime()?r:r-1}},70220:function(e,t,r){"use strict";r.d(t,{Z:function(){return u}});var n=r(27760),a=r(86183),o=r(21383),i=r(3805),c=r(37993),s=r(19461);function u(e,t){(0,i.Z)(1,arguments);var r=(0,n.default)(e);return Math.round(((0,a.Z)(r,t).getTime()-(function(e,t){(0,i.Z)(1,arguments);var r,n,u,l,d,p,f,h,m=(0,s.j)(),y=(0,c.Z)(null!==(r=null!==(n=null!==(u=null!==(l=null==t?void 0:t.firstWeekContainsDate)&&void 0!==l?l:null==t?void 0:null===(d=t.locale)||void 0===d?void 0:null===(p=d.options)||void 0===p?void 0:p.firstWeekContainsDate)&&void 0!==u?u:m.firstWeekContainsDate)&&void 0!==n?n:null===(f=m.locale)||void 0===f?void 0:null===(h=f.options)||void 0===h?void 0:h.firstWeekContainsDate)&&void 0!==r?r:1),v=(0,o.Z)(e,t),g=new Date(0);return g.setUTCFullYear(v,0,y),g.setUTCHours(0,0,0,0),(0,a.Z)(g,t)})(r,t).getTime())/6048e5)+1}},21383:function(e,t,r){"use strict";r.d(t,{Z:function(){return s}});var n=r(27760),a=r(3805),o=r(86183),i=r(37993),c=r(19461);function s(e,t){(0,a.Z)(1,arguments);var r,s,u,l,d,p,f,h,m=(0,n.default)(e),y=m.getUTCFullYear(),v=(0,c.j)(),g=(0,i.Z)(null!==(r=null!==(s=null!==(u=null!==(l=null==t?void 0:t.firstWeekContainsDate)&&void 0!==l?l:null==t?void 0:null===(d=t.locale)||void 0===d?void 0:null===(p=d.options)||void 0===p?void 0:p.firstWeekContainsDate)&&void 0!==u?u:v.firstWeekContainsDate)&&void 0!==s?s:null===(f=v.locale)||void 0===f?void 0:null===(h=f.options)||void 0===h?void 0:h.firstWeekContainsDate)&&void 0!==r?r:1);if(!(g>=1&&g<=7))throw RangeError("firstWeekContainsDate must be between 1 and 7 inclusively");var b=new Date(0);b.setUTCFullYear(y+1,0,g),b.setUTCHours(0,0,0,0);var w=(0,o.Z)(b,t),k=new Date(0);k.setUTCFullYear(y,0,g),k.setUTCHours(0,0,0,0);var _=(0,o.Z)(k,t);return m.getTime()>=w.getTime()?y+1:m.getTime()>=_.getTime()?y:y-1}},1495:function(e,t,r){"use strict";r.d(t,{Do:function(){return i},Iu:function(){return o},qp:function(){return c}});var n=["D","DD"],a=["YY","YYYY"];function o(e){return -1!==n.indexOf(e)}function i(e){return -1!==a.indexOf(e)}function c(e,t,r){if("YYYY"===e)throw RangeError("Use `yyyy` instead of `YYYY` (in `".concat(t,"`) for formatting years to the input `").concat(r,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"));if("YY"===e)throw RangeError("Use `yy` instead of `YY` (in `".concat(t,"`) for formatting years to the input `").concat(r,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"));if("D"===e)throw RangeError("Use `d` instead of `D` (in `".concat(t,"`) for formatting days of the month to the input `").concat(r,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"));if("DD"===e)throw RangeError("Use `dd` instead of `DD` (in `".concat(t,"`) for formatting days of the month to the input `").concat(r,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"))}},3805:function(e,t,r){"use strict";function n(e,t){if(t.length<e)throw TypeError(e+" argument"+(e>1?"s":"")+" required, but only "+t.length+" present")}r.d(t,{Z:function(){return n}})},62973:function(e,t,r){"use strict";r.d(t,{Z:function(){return o}});var n=r(27760),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e),r=t.getUTCDay();return t.setUTCDate(t.getUTCDate()-((r<1?7:0)+r-1)),t.setUTCHours(0,0,0,0),t}},86183:function(e,t,r){"use strict";r.d(t,{Z:function(){return c}});var n=r(27760),a=r(3805),o=r(37993),i=r(19461);function c(e,t){(0,a.Z)(1,arguments);var r,c,s,u,l,d,p,f,h=(0,i.j)(),m=(0,o.Z)(null!==(r=null!==(c=null!==(s=null!==(u=null==t?void 0:t.weekStartsOn)&&void 0!==u?u:null==t?void 0:null===(l=t.locale)||void 0===l?void 0:null===(d=l.options)||void 0===d?void 0:d.weekStartsOn)&&void 0!==s?s:h.weekStartsOn)&&void 0!==c?c:null===(p=h.locale)||void 0===p?void 0:null===(f=p.options)||void 0===f?void 0:f.weekStartsOn)&&void 0!==r?r:0);if(!(m>=0&&m<=6))throw RangeError("weekStartsOn must be between 0 and 6 inclusively");var y=(0,n.default)(e),v=y.getUTCDay();return y.setUTCDate(y.getUTCDate()-((v<m?7:0)+v-m)),y.setUTCHours(0,0,0,0),y}},37993:function(e,t,r){"use strict";function n(e){if(null===e||!0===e||!1===e)return NaN;var t=Number(e);return isNaN(t)?t:t<0?Math.ceil(t):Math.floor(t)}r.d(t,{Z:function(){return n}})},84153:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,n.Z)(t);return isNaN(i)?new Date(NaN):(i&&r.setDate(r.getDate()+i),r)}},25832:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(19811),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,n.Z)(t);return(0,a.Z)(e,36e5*r)}},19811:function(e,t,r){"use strict";r.d(t,{Z:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){return(0,o.Z)(2,arguments),new Date((0,a.default)(e).getTime()+(0,n.Z)(t))}},60218:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(19811),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,n.Z)(t);return(0,a.Z)(e,6e4*r)}},90579:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,n.Z)(t);if(isNaN(i))return new Date(NaN);if(!i)return r;var c=r.getDate(),s=new Date(r.getTime());return(s.setMonth(r.getMonth()+i+1,0),c>=s.getDate())?s:(r.setFullYear(s.getFullYear(),s.getMonth(),c),r)}},76755:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(84153),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,n.Z)(t);return(0,a.default)(e,7*r)}},41609:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(90579),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,n.Z)(t);return(0,a.default)(e,12*r)}},70356:function(e,t,r){"use strict";r.d(t,{qk:function(){return o},vh:function(){return a},yJ:function(){return n}});var n=6e4,a=36e5,o=1e3},59061:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(19116),a=r(13065),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,a.default)(t);return Math.round((r.getTime()-(0,n.Z)(r)-(i.getTime()-(0,n.Z)(i)))/864e5)}},31961:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return 12*(r.getFullYear()-o.getFullYear())+(r.getMonth()-o.getMonth())}},91315:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(74982),a=r(19116),o=r(3805);function i(e,t,r){(0,o.Z)(2,arguments);var i=(0,n.default)(e,r),c=(0,n.default)(t,r);return Math.round((i.getTime()-(0,a.Z)(i)-(c.getTime()-(0,a.Z)(c)))/6048e5)}},4061:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getFullYear()-o.getFullYear()}},74113:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e);return t.setHours(23,59,59,999),t}},27076:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e),r=t.getMonth();return t.setFullYear(t.getFullYear(),r+1,0),t.setHours(23,59,59,999),t}},70633:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return c}});var n=r(19461),a=r(27760),o=r(37993),i=r(3805);function c(e,t){(0,i.Z)(1,arguments);var r,c,s,u,l,d,p,f,h=(0,n.j)(),m=(0,o.Z)(null!==(r=null!==(c=null!==(s=null!==(u=null==t?void 0:t.weekStartsOn)&&void 0!==u?u:null==t?void 0:null===(l=t.locale)||void 0===l?void 0:null===(d=l.options)||void 0===d?void 0:d.weekStartsOn)&&void 0!==s?s:h.weekStartsOn)&&void 0!==c?c:null===(p=h.locale)||void 0===p?void 0:null===(f=p.options)||void 0===f?void 0:f.weekStartsOn)&&void 0!==r?r:0);if(!(m>=0&&m<=6))throw RangeError("weekStartsOn must be between 0 and 6 inclusively");var y=(0,a.default)(e),v=y.getDay();return y.setDate(y.getDate()+((v<m?-7:0)+6-(v-m))),y.setHours(23,59,59,999),y}},98276:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return E}});var n=r(11204),a=r(16766),o=r(27760),i=r(3805),c=r(89767),s=r(81089),u=r(70220),l=r(21383);function d(e,t){for(var r=Math.abs(e).toString();r.length<t;)r="0"+r;return(e<0?"-":"")+r}var p={y:function(e,t){var r=e.getUTCFullYear(),n=r>0?r:1-r;return d("yy"===t?n%100:n,t.length)},M:function(e,t){var r=e.getUTCMonth();return"M"===t?String(r+1):d(r+1,2)},d:function(e,t){return d(e.getUTCDate(),t.length)},h:function(e,t){return d(e.getUTCHours()%12||12,t.length)},H:function(e,t){return d(e.getUTCHours(),t.length)},m:function(e,t){return d(e.getUTCMinutes(),t.length)},s:function(e,t){return d(e.getUTCSeconds(),t.length)},S:function(e,t){var r=t.length;return d(Math.floor(e.getUTCMilliseconds()*Math.pow(10,r-3)),t.length)}},f={midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"};function h(e,t){var r=e>0?"-":"+",n=Math.abs(e),a=Math.floor(n/60),o=n%60;return 0===o?r+String(a):r+String(a)+(t||"")+d(o,2)}function m(e,t){return e%60==0?(e>0?"-":"+")+d(Math.abs(e)/60,2):y(e,t)}function y(e,t){var r=Math.abs(e);return(e>0?"-":"+")+d(Math.floor(r/60),2)+(t||"")+d(r%60,2)}var v={G:function(e,t,r){var n=e.getUTCFullYear()>0?1:0;switch(t){case"G":case"GG":case"GGG":return r.era(n,{width:"abbreviated"});case"GGGGG":return r.era(n,{width:"narrow"});default:return r.era(n,{width:"wide"})}},y:function(e,t,r){if("yo"===t){var n=e.getUTCFullYear();return r.ordinalNumber(n>0?n:1-n,{unit:"year"})}return p.y(e,t)},Y:function(e,t,r,n){var a=(0,l.Z)(e,n),o=a>0?a:1-a;return"YY"===t?d(o%100,2):"Yo"===t?r.ordinalNumber(o,{unit:"year"}):d(o,t.length)},R:function(e,t){return d((0,s.Z)(e),t.length)},u:function(e,t){return d(e.getUTCFullYear(),t.length)},Q:function(e,t,r){var n=Math.ceil((e.getUTCMonth()+1)/3);switch(t){case"Q":return String(n);case"QQ":return d(n,2);case"Qo":return r.ordinalNumber(n,{unit:"quarter"});case"QQQ":return r.quarter(n,{width:"abbreviated",context:"formatting"});case"QQQQQ":return r.quarter(n,{width:"narrow",context:"formatting"});default:return r.quarter(n,{width:"wide",context:"formatting"})}},q:function(e,t,r){var n=Math.ceil((e.getUTCMonth()+1)/3);switch(t){case"q":return String(n);case"qq":return d(n,2);case"qo":return r.ordinalNumber(n,{unit:"quarter"});case"qqq":return r.quarter(n,{width:"abbreviated",context:"standalone"});case"qqqqq":return r.quarter(n,{width:"narrow",context:"standalone"});default:return r.quarter(n,{width:"wide",context:"standalone"})}},M:function(e,t,r){var n=e.getUTCMonth();switch(t){case"M":case"MM":return p.M(e,t);case"Mo":return r.ordinalNumber(n+1,{unit:"month"});case"MMM":return r.month(n,{width:"abbreviated",context:"formatting"});case"MMMMM":return r.month(n,{width:"narrow",context:"formatting"});default:return r.month(n,{width:"wide",context:"formatting"})}},L:function(e,t,r){var n=e.getUTCMonth();switch(t){case"L":return String(n+1);case"LL":return d(n+1,2);case"Lo":return r.ordinalNumber(n+1,{unit:"month"});case"LLL":return r.month(n,{width:"abbreviated",context:"standalone"});case"LLLLL":return r.month(n,{width:"narrow",context:"standalone"});default:return r.month(n,{width:"wide",context:"standalone"})}},w:function(e,t,r,n){var a=(0,u.Z)(e,n);return"wo"===t?r.ordinalNumber(a,{unit:"week"}):d(a,t.length)},I:function(e,t,r){var n=(0,c.Z)(e);return"Io"===t?r.ordinalNumber(n,{unit:"week"}):d(n,t.length)},d:function(e,t,r){return"do"===t?r.ordinalNumber(e.getUTCDate(),{unit:"date"}):p.d(e,t)},D:function(e,t,r){var n=function(e){(0,i.Z)(1,arguments);var t=(0,o.default)(e),r=t.getTime();return t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0),Math.floor((r-t.getTime())/864e5)+1}(e);return"Do"===t?r.ordinalNumber(n,{unit:"dayOfYear"}):d(n,t.length)},E:function(e,t,r){var n=e.getUTCDay();switch(t){case"E":case"EE":case"EEE":return r.day(n,{width:"abbreviated",context:"formatting"});case"EEEEE":return r.day(n,{width:"narrow",context:"formatting"});case"EEEEEE":return r.day(n,{width:"short",context:"formatting"});default:return r.day(n,{width:"wide",context:"formatting"})}},e:function(e,t,r,n){var a=e.getUTCDay(),o=(a-n.weekStartsOn+8)%7||7;switch(t){case"e":return String(o);case"ee":return d(o,2);case"eo":return r.ordinalNumber(o,{unit:"day"});case"eee":return r.day(a,{width:"abbreviated",context:"formatting"});case"eeeee":return r.day(a,{width:"narrow",context:"formatting"});case"eeeeee":return r.day(a,{width:"short",context:"formatting"});default:return r.day(a,{width:"wide",context:"formatting"})}},c:function(e,t,r,n){var a=e.getUTCDay(),o=(a-n.weekStartsOn+8)%7||7;switch(t){case"c":return String(o);case"cc":return d(o,t.length);case"co":return r.ordinalNumber(o,{unit:"day"});case"ccc":return r.day(a,{width:"abbreviated",context:"standalone"});case"ccccc":return r.day(a,{width:"narrow",context:"standalone"});case"cccccc":return r.day(a,{width:"short",context:"standalone"});default:return r.day(a,{width:"wide",context:"standalone"})}},i:function(e,t,r){var n=e.getUTCDay(),a=0===n?7:n;switch(t){case"i":return String(a);case"ii":return d(a,t.length);case"io":return r.ordinalNumber(a,{unit:"day"});case"iii":return r.day(n,{width:"abbreviated",context:"formatting"});case"iiiii":return r.day(n,{width:"narrow",context:"formatting"});case"iiiiii":return r.day(n,{width:"short",context:"formatting"});default:return r.day(n,{width:"wide",context:"formatting"})}},a:function(e,t,r){var n=e.getUTCHours()/12>=1?"pm":"am";switch(t){case"a":case"aa":return r.dayPeriod(n,{width:"abbreviated",context:"formatting"});case"aaa":return r.dayPeriod(n,{width:"abbreviated",context:"formatting"}).toLowerCase();case"aaaaa":return r.dayPeriod(n,{width:"narrow",context:"formatting"});default:return r.dayPeriod(n,{width:"wide",context:"formatting"})}},b:function(e,t,r){var n,a=e.getUTCHours();switch(n=12===a?f.noon:0===a?f.midnight:a/12>=1?"pm":"am",t){case"b":case"bb":return r.dayPeriod(n,{width:"abbreviated",context:"formatting"});case"bbb":return r.dayPeriod(n,{width:"abbreviated",context:"formatting"}).toLowerCase();case"bbbbb":return r.dayPeriod(n,{width:"narrow",context:"formatting"});default:return r.dayPeriod(n,{width:"wide",context:"formatting"})}},B:function(e,t,r){var n,a=e.getUTCHours();switch(n=a>=17?f.evening:a>=12?f.afternoon:a>=4?f.morning:f.night,t){case"B":case"BB":case"BBB":return r.dayPeriod(n,{width:"abbreviated",context:"formatting"});case"BBBBB":return r.dayPeriod(n,{width:"narrow",context:"formatting"});default:return r.dayPeriod(n,{width:"wide",context:"formatting"})}},h:function(e,t,r){if("ho"===t){var n=e.getUTCHours()%12;return 0===n&&(n=12),r.ordinalNumber(n,{unit:"hour"})}return p.h(e,t)},H:function(e,t,r){return"Ho"===t?r.ordinalNumber(e.getUTCHours(),{unit:"hour"}):p.H(e,t)},K:function(e,t,r){var n=e.getUTCHours()%12;return"Ko"===t?r.ordinalNumber(n,{unit:"hour"}):d(n,t.length)},k:function(e,t,r){var n=e.getUTCHours();return(0===n&&(n=24),"ko"===t)?r.ordinalNumber(n,{unit:"hour"}):d(n,t.length)},m:function(e,t,r){return"mo"===t?r.ordinalNumber(e.getUTCMinutes(),{unit:"minute"}):p.m(e,t)},s:function(e,t,r){return"so"===t?r.ordinalNumber(e.getUTCSeconds(),{unit:"second"}):p.s(e,t)},S:function(e,t){return p.S(e,t)},X:function(e,t,r,n){var a=(n._originalDate||e).getTimezoneOffset();if(0===a)return"Z";switch(t){case"X":return m(a);case"XXXX":case"XX":return y(a);default:return y(a,":")}},x:function(e,t,r,n){var a=(n._originalDate||e).getTimezoneOffset();switch(t){case"x":return m(a);case"xxxx":case"xx":return y(a);default:return y(a,":")}},O:function(e,t,r,n){var a=(n._originalDate||e).getTimezoneOffset();switch(t){case"O":case"OO":case"OOO":return"GMT"+h(a,":");default:return"GMT"+y(a,":")}},z:function(e,t,r,n){var a=(n._originalDate||e).getTimezoneOffset();switch(t){case"z":case"zz":case"zzz":return"GMT"+h(a,":");default:return"GMT"+y(a,":")}},t:function(e,t,r,n){return d(Math.floor((n._originalDate||e).getTime()/1e3),t.length)},T:function(e,t,r,n){return d((n._originalDate||e).getTime(),t.length)}},g=r(81330),b=r(19116),w=r(1495),k=r(37993),_=r(19461),D=r(86573),x=/[yYQqMLwIdDecihHKkms]o|(\w)\1*|''|'(''|[^'])+('|$)|./g,C=/P+p+|P+|p+|''|'(''|[^'])+('|$)|./g,S=/^'([^]*?)'?$/,T=/''/g,P=/[a-zA-Z]/;function E(e,t,r){(0,i.Z)(2,arguments);var c,s,u,l,d,p,f,h,m,y,E,Z,M,O,N,Y,A,I,F=String(t),L=(0,_.j)(),R=null!==(c=null!==(s=null==r?void 0:r.locale)&&void 0!==s?s:L.locale)&&void 0!==c?c:D.Z,j=(0,k.Z)(null!==(u=null!==(l=null!==(d=null!==(p=null==r?void 0:r.firstWeekContainsDate)&&void 0!==p?p:null==r?void 0:null===(f=r.locale)||void 0===f?void 0:null===(h=f.options)||void 0===h?void 0:h.firstWeekContainsDate)&&void 0!==d?d:L.firstWeekContainsDate)&&void 0!==l?l:null===(m=L.locale)||void 0===m?void 0:null===(y=m.options)||void 0===y?void 0:y.firstWeekContainsDate)&&void 0!==u?u:1);if(!(j>=1&&j<=7))throw RangeError("firstWeekContainsDate must be between 1 and 7 inclusively");var U=(0,k.Z)(null!==(E=null!==(Z=null!==(M=null!==(O=null==r?void 0:r.weekStartsOn)&&void 0!==O?O:null==r?void 0:null===(N=r.locale)||void 0===N?void 0:null===(Y=N.options)||void 0===Y?void 0:Y.weekStartsOn)&&void 0!==M?M:L.weekStartsOn)&&void 0!==Z?Z:null===(A=L.locale)||void 0===A?void 0:null===(I=A.options)||void 0===I?void 0:I.weekStartsOn)&&void 0!==E?E:0);if(!(U>=0&&U<=6))throw RangeError("weekStartsOn must be between 0 and 6 inclusively");if(!R.localize)throw RangeError("locale must contain localize property");if(!R.formatLong)throw RangeError("locale must contain formatLong property");var W=(0,o.default)(e);if(!(0,n.default)(W))throw RangeError("Invalid time value");var H=(0,b.Z)(W),B=(0,a.Z)(W,H),q={firstWeekContainsDate:j,weekStartsOn:U,locale:R,_originalDate:W};return F.match(C).map(function(e){var t=e[0];return"p"===t||"P"===t?(0,g.Z[t])(e,R.formatLong):e}).join("").match(x).map(function(n){if("''"===n)return"'";var a,o=n[0];if("'"===o)return(a=n.match(S))?a[1].replace(T,"'"):n;var i=v[o];if(i)return!(null!=r&&r.useAdditionalWeekYearTokens)&&(0,w.Do)(n)&&(0,w.qp)(n,t,String(e)),!(null!=r&&r.useAdditionalDayOfYearTokens)&&(0,w.Iu)(n)&&(0,w.qp)(n,t,String(e)),i(B,n,R.localize,q);if(o.match(P))throw RangeError("Format string contains an unescaped latin alphabet character `"+o+"`");return n}).join("")}},93929:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getDate()}},65178:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getDay()}},78074:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getHours()}},76183:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return c}});var n=r(27760),a=r(74982),o=r(3805);function i(e){return(0,o.Z)(1,arguments),(0,a.default)(e,{weekStartsOn:1})}function c(e){(0,o.Z)(1,arguments);var t=(0,n.default)(e);return Math.round((i(t).getTime()-(function(e){(0,o.Z)(1,arguments);var t=function(e){(0,o.Z)(1,arguments);var t=(0,n.default)(e),r=t.getFullYear(),a=new Date(0);a.setFullYear(r+1,0,4),a.setHours(0,0,0,0);var c=i(a),s=new Date(0);s.setFullYear(r,0,4),s.setHours(0,0,0,0);var u=i(s);return t.getTime()>=c.getTime()?r+1:t.getTime()>=u.getTime()?r:r-1}(e),r=new Date(0);return r.setFullYear(t,0,4),r.setHours(0,0,0,0),i(r)})(t).getTime())/6048e5)+1}},3788:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getMinutes()}},68496:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getMonth()}},10855:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),Math.floor((0,n.default)(e).getMonth()/3)+1}},47653:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getSeconds()}},84561:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getTime()}},71065:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){return(0,a.Z)(1,arguments),(0,n.default)(e).getFullYear()}},7550:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getTime()>o.getTime()}},56885:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getTime()<o.getTime()}},82522:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(47478),a=r(3805);function o(e){return(0,a.Z)(1,arguments),e instanceof Date||"object"===(0,n.Z)(e)&&"[object Date]"===Object.prototype.toString.call(e)}},68897:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getTime()===o.getTime()}},82107:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(13065),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getTime()===o.getTime()}},74463:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getFullYear()===o.getFullYear()&&r.getMonth()===o.getMonth()}},69329:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(87573),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getTime()===o.getTime()}},56610:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e),o=(0,n.default)(t);return r.getFullYear()===o.getFullYear()}},11204:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(82522),a=r(27760),o=r(3805);function i(e){return(0,o.Z)(1,arguments),(!!(0,n.default)(e)||"number"==typeof e)&&!isNaN(Number((0,a.default)(e)))}},69175:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e,t){(0,a.Z)(2,arguments);var r=(0,n.default)(e).getTime(),o=(0,n.default)(t.start).getTime(),i=(0,n.default)(t.end).getTime();if(!(o<=i))throw RangeError("Invalid interval");return r>=o&&r<=i}},60030:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(47478),a=r(27760),o=r(3805);function i(e){var t,r;if((0,o.Z)(1,arguments),e&&"function"==typeof e.forEach)t=e;else{if("object"!==(0,n.Z)(e)||null===e)return new Date(NaN);t=Array.prototype.slice.call(e)}return t.forEach(function(e){var t=(0,a.default)(e);(void 0===r||r<t||isNaN(Number(t)))&&(r=t)}),r||new Date(NaN)}},16640:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(47478),a=r(27760),o=r(3805);function i(e){var t,r;if((0,o.Z)(1,arguments),e&&"function"==typeof e.forEach)t=e;else{if("object"!==(0,n.Z)(e)||null===e)return new Date(NaN);t=Array.prototype.slice.call(e)}return t.forEach(function(e){var t=(0,a.default)(e);(void 0===r||r>t||isNaN(t.getDate()))&&(r=t)}),r||new Date(NaN)}},71835:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return eE}});var n=r(47478),a=r(40181);function o(e,t){var r="undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(!r){if(Array.isArray(e)||(r=(0,a.Z)(e))||t&&e&&"number"==typeof e.length){r&&(e=r);var n=0,o=function(){};return{s:o,n:function(){return n>=e.length?{done:!0}:{done:!1,value:e[n++]}},e:function(e){throw e},f:o}}throw TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var i,c=!0,s=!1;return{s:function(){r=r.call(e)},n:function(){var e=r.next();return c=e.done,e},e:function(e){s=!0,i=e},f:function(){try{c||null==r.return||r.return()}finally{if(s)throw i}}}}var i=r(86573),c=r(16766),s=r(27760),u=r(81330),l=r(19116),d=r(1495),p=r(37993),f=r(3805),h=r(97326),m=r(60136),y=r(18486),v=r(15671),g=r(43144),b=r(4942),w=function(){function e(){(0,v.Z)(this,e),(0,b.Z)(this,"priority",void 0),(0,b.Z)(this,"subPriority",0)}return(0,g.Z)(e,[{key:"validate",value:function(e,t){return!0}}]),e}(),k=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(e,n,a,o,i){var c;return(0,v.Z)(this,r),(c=t.call(this)).value=e,c.validateValue=n,c.setValue=a,c.priority=o,i&&(c.subPriority=i),c}return(0,g.Z)(r,[{key:"validate",value:function(e,t){return this.validateValue(e,this.value,t)}},{key:"set",value:function(e,t,r){return this.setValue(e,t,this.value,r)}}]),r}(w),_=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",10),(0,b.Z)((0,h.Z)(e),"subPriority",-1),e}return(0,g.Z)(r,[{key:"set",value:function(e,t){if(t.timestampIsSet)return e;var r=new Date(0);return r.setFullYear(e.getUTCFullYear(),e.getUTCMonth(),e.getUTCDate()),r.setHours(e.getUTCHours(),e.getUTCMinutes(),e.getUTCSeconds(),e.getUTCMilliseconds()),r}}]),r}(w),D=function(){function e(){(0,v.Z)(this,e),(0,b.Z)(this,"incompatibleTokens",void 0),(0,b.Z)(this,"priority",void 0),(0,b.Z)(this,"subPriority",void 0)}return(0,g.Z)(e,[{key:"run",value:function(e,t,r,n){var a=this.parse(e,t,r,n);return a?{setter:new k(a.value,this.validate,this.set,this.priority,this.subPriority),rest:a.rest}:null}},{key:"validate",value:function(e,t,r){return!0}}]),e}(),x=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",140),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["R","u","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"G":case"GG":case"GGG":return r.era(e,{width:"abbreviated"})||r.era(e,{width:"narrow"});case"GGGGG":return r.era(e,{width:"narrow"});default:return r.era(e,{width:"wide"})||r.era(e,{width:"abbreviated"})||r.era(e,{width:"narrow"})}}},{key:"set",value:function(e,t,r){return t.era=r,e.setUTCFullYear(r,0,1),e.setUTCHours(0,0,0,0),e}}]),r}(D),C=r(70356),S={month:/^(1[0-2]|0?\d)/,date:/^(3[0-1]|[0-2]?\d)/,dayOfYear:/^(36[0-6]|3[0-5]\d|[0-2]?\d?\d)/,week:/^(5[0-3]|[0-4]?\d)/,hour23h:/^(2[0-3]|[0-1]?\d)/,hour24h:/^(2[0-4]|[0-1]?\d)/,hour11h:/^(1[0-1]|0?\d)/,hour12h:/^(1[0-2]|0?\d)/,minute:/^[0-5]?\d/,second:/^[0-5]?\d/,singleDigit:/^\d/,twoDigits:/^\d{1,2}/,threeDigits:/^\d{1,3}/,fourDigits:/^\d{1,4}/,anyDigitsSigned:/^-?\d+/,singleDigitSigned:/^-?\d/,twoDigitsSigned:/^-?\d{1,2}/,threeDigitsSigned:/^-?\d{1,3}/,fourDigitsSigned:/^-?\d{1,4}/},T={basicOptionalMinutes:/^([+-])(\d{2})(\d{2})?|Z/,basic:/^([+-])(\d{2})(\d{2})|Z/,basicOptionalSeconds:/^([+-])(\d{2})(\d{2})((\d{2}))?|Z/,extended:/^([+-])(\d{2}):(\d{2})|Z/,extendedOptionalSeconds:/^([+-])(\d{2}):(\d{2})(:(\d{2}))?|Z/};function P(e,t){return e?{value:t(e.value),rest:e.rest}:e}function E(e,t){var r=t.match(e);return r?{value:parseInt(r[0],10),rest:t.slice(r[0].length)}:null}function Z(e,t){var r=t.match(e);if(!r)return null;if("Z"===r[0])return{value:0,rest:t.slice(1)};var n="+"===r[1]?1:-1,a=r[2]?parseInt(r[2],10):0,o=r[3]?parseInt(r[3],10):0,i=r[5]?parseInt(r[5],10):0;return{value:n*(a*C.vh+o*C.yJ+i*C.qk),rest:t.slice(r[0].length)}}function M(e){return E(S.anyDigitsSigned,e)}function O(e,t){switch(e){case 1:return E(S.singleDigit,t);case 2:return E(S.twoDigits,t);case 3:return E(S.threeDigits,t);case 4:return E(S.fourDigits,t);default:return E(RegExp("^\\d{1,"+e+"}"),t)}}function N(e,t){switch(e){case 1:return E(S.singleDigitSigned,t);case 2:return E(S.twoDigitsSigned,t);case 3:return E(S.threeDigitsSigned,t);case 4:return E(S.fourDigitsSigned,t);default:return E(RegExp("^-?\\d{1,"+e+"}"),t)}}function Y(e){switch(e){case"morning":return 4;case"evening":return 17;case"pm":case"noon":case"afternoon":return 12;default:return 0}}function A(e,t){var r,n=t>0,a=n?t:1-t;if(a<=50)r=e||100;else{var o=a+50;r=e+100*Math.floor(o/100)-(e>=o%100?100:0)}return n?r:1-r}function I(e){return e%400==0||e%4==0&&e%100!=0}var F=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",130),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["Y","R","u","w","I","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){var n=function(e){return{year:e,isTwoDigitYear:"yy"===t}};switch(t){case"y":return P(O(4,e),n);case"yo":return P(r.ordinalNumber(e,{unit:"year"}),n);default:return P(O(t.length,e),n)}}},{key:"validate",value:function(e,t){return t.isTwoDigitYear||t.year>0}},{key:"set",value:function(e,t,r){var n=e.getUTCFullYear();if(r.isTwoDigitYear){var a=A(r.year,n);return e.setUTCFullYear(a,0,1),e.setUTCHours(0,0,0,0),e}var o="era"in t&&1!==t.era?1-r.year:r.year;return e.setUTCFullYear(o,0,1),e.setUTCHours(0,0,0,0),e}}]),r}(D),L=r(21383),R=r(86183),j=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",130),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["y","R","u","Q","q","M","L","I","d","D","i","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){var n=function(e){return{year:e,isTwoDigitYear:"YY"===t}};switch(t){case"Y":return P(O(4,e),n);case"Yo":return P(r.ordinalNumber(e,{unit:"year"}),n);default:return P(O(t.length,e),n)}}},{key:"validate",value:function(e,t){return t.isTwoDigitYear||t.year>0}},{key:"set",value:function(e,t,r,n){var a=(0,L.Z)(e,n);if(r.isTwoDigitYear){var o=A(r.year,a);return e.setUTCFullYear(o,0,n.firstWeekContainsDate),e.setUTCHours(0,0,0,0),(0,R.Z)(e,n)}var i="era"in t&&1!==t.era?1-r.year:r.year;return e.setUTCFullYear(i,0,n.firstWeekContainsDate),e.setUTCHours(0,0,0,0),(0,R.Z)(e,n)}}]),r}(D),U=r(62973),W=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",130),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["G","y","Y","u","Q","q","M","L","w","d","D","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t){return"R"===t?N(4,e):N(t.length,e)}},{key:"set",value:function(e,t,r){var n=new Date(0);return n.setUTCFullYear(r,0,4),n.setUTCHours(0,0,0,0),(0,U.Z)(n)}}]),r}(D),H=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",130),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["G","y","Y","R","w","I","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t){return"u"===t?N(4,e):N(t.length,e)}},{key:"set",value:function(e,t,r){return e.setUTCFullYear(r,0,1),e.setUTCHours(0,0,0,0),e}}]),r}(D),B=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",120),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["Y","R","q","M","L","w","I","d","D","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"Q":case"QQ":return O(t.length,e);case"Qo":return r.ordinalNumber(e,{unit:"quarter"});case"QQQ":return r.quarter(e,{width:"abbreviated",context:"formatting"})||r.quarter(e,{width:"narrow",context:"formatting"});case"QQQQQ":return r.quarter(e,{width:"narrow",context:"formatting"});default:return r.quarter(e,{width:"wide",context:"formatting"})||r.quarter(e,{width:"abbreviated",context:"formatting"})||r.quarter(e,{width:"narrow",context:"formatting"})}}},{key:"validate",value:function(e,t){return t>=1&&t<=4}},{key:"set",value:function(e,t,r){return e.setUTCMonth((r-1)*3,1),e.setUTCHours(0,0,0,0),e}}]),r}(D),q=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",120),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["Y","R","Q","M","L","w","I","d","D","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"q":case"qq":return O(t.length,e);case"qo":return r.ordinalNumber(e,{unit:"quarter"});case"qqq":return r.quarter(e,{width:"abbreviated",context:"standalone"})||r.quarter(e,{width:"narrow",context:"standalone"});case"qqqqq":return r.quarter(e,{width:"narrow",context:"standalone"});default:return r.quarter(e,{width:"wide",context:"standalone"})||r.quarter(e,{width:"abbreviated",context:"standalone"})||r.quarter(e,{width:"narrow",context:"standalone"})}}},{key:"validate",value:function(e,t){return t>=1&&t<=4}},{key:"set",value:function(e,t,r){return e.setUTCMonth((r-1)*3,1),e.setUTCHours(0,0,0,0),e}}]),r}(D),$=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["Y","R","q","Q","L","w","I","D","i","e","c","t","T"]),(0,b.Z)((0,h.Z)(e),"priority",110),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){var n=function(e){return e-1};switch(t){case"M":return P(E(S.month,e),n);case"MM":return P(O(2,e),n);case"Mo":return P(r.ordinalNumber(e,{unit:"month"}),n);case"MMM":return r.month(e,{width:"abbreviated",context:"formatting"})||r.month(e,{width:"narrow",context:"formatting"});case"MMMMM":return r.month(e,{width:"narrow",context:"formatting"});default:return r.month(e,{width:"wide",context:"formatting"})||r.month(e,{width:"abbreviated",context:"formatting"})||r.month(e,{width:"narrow",context:"formatting"})}}},{key:"validate",value:function(e,t){return t>=0&&t<=11}},{key:"set",value:function(e,t,r){return e.setUTCMonth(r,1),e.setUTCHours(0,0,0,0),e}}]),r}(D),Q=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",110),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["Y","R","q","Q","M","w","I","D","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){var n=function(e){return e-1};switch(t){case"L":return P(E(S.month,e),n);case"LL":return P(O(2,e),n);case"Lo":return P(r.ordinalNumber(e,{unit:"month"}),n);case"LLL":return r.month(e,{width:"abbreviated",context:"standalone"})||r.month(e,{width:"narrow",context:"standalone"});case"LLLLL":return r.month(e,{width:"narrow",context:"standalone"});default:return r.month(e,{width:"wide",context:"standalone"})||r.month(e,{width:"abbreviated",context:"standalone"})||r.month(e,{width:"narrow",context:"standalone"})}}},{key:"validate",value:function(e,t){return t>=0&&t<=11}},{key:"set",value:function(e,t,r){return e.setUTCMonth(r,1),e.setUTCHours(0,0,0,0),e}}]),r}(D),K=r(70220),z=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",100),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["y","R","u","q","Q","M","L","I","d","D","i","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"w":return E(S.week,e);case"wo":return r.ordinalNumber(e,{unit:"week"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=1&&t<=53}},{key:"set",value:function(e,t,r,n){return(0,R.Z)(function(e,t,r){(0,f.Z)(2,arguments);var n=(0,s.default)(e),a=(0,p.Z)(t),o=(0,K.Z)(n,r)-a;return n.setUTCDate(n.getUTCDate()-7*o),n}(e,r,n),n)}}]),r}(D),G=r(89767),V=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",100),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["y","Y","u","q","Q","M","L","w","d","D","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"I":return E(S.week,e);case"Io":return r.ordinalNumber(e,{unit:"week"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=1&&t<=53}},{key:"set",value:function(e,t,r){return(0,U.Z)(function(e,t){(0,f.Z)(2,arguments);var r=(0,s.default)(e),n=(0,p.Z)(t),a=(0,G.Z)(r)-n;return r.setUTCDate(r.getUTCDate()-7*a),r}(e,r))}}]),r}(D),X=[31,28,31,30,31,30,31,31,30,31,30,31],J=[31,29,31,30,31,30,31,31,30,31,30,31],ee=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",90),(0,b.Z)((0,h.Z)(e),"subPriority",1),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["Y","R","q","Q","w","I","D","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"d":return E(S.date,e);case"do":return r.ordinalNumber(e,{unit:"date"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){var r=I(e.getUTCFullYear()),n=e.getUTCMonth();return r?t>=1&&t<=J[n]:t>=1&&t<=X[n]}},{key:"set",value:function(e,t,r){return e.setUTCDate(r),e.setUTCHours(0,0,0,0),e}}]),r}(D),et=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",90),(0,b.Z)((0,h.Z)(e),"subpriority",1),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["Y","R","q","Q","M","L","w","I","d","E","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"D":case"DD":return E(S.dayOfYear,e);case"Do":return r.ordinalNumber(e,{unit:"date"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return I(e.getUTCFullYear())?t>=1&&t<=366:t>=1&&t<=365}},{key:"set",value:function(e,t,r){return e.setUTCMonth(0,r),e.setUTCHours(0,0,0,0),e}}]),r}(D),er=r(19461);function en(e,t,r){(0,f.Z)(2,arguments);var n,a,o,i,c,u,l,d,h=(0,er.j)(),m=(0,p.Z)(null!==(n=null!==(a=null!==(o=null!==(i=null==r?void 0:r.weekStartsOn)&&void 0!==i?i:null==r?void 0:null===(c=r.locale)||void 0===c?void 0:null===(u=c.options)||void 0===u?void 0:u.weekStartsOn)&&void 0!==o?o:h.weekStartsOn)&&void 0!==a?a:null===(l=h.locale)||void 0===l?void 0:null===(d=l.options)||void 0===d?void 0:d.weekStartsOn)&&void 0!==n?n:0);if(!(m>=0&&m<=6))throw RangeError("weekStartsOn must be between 0 and 6 inclusively");var y=(0,s.default)(e),v=(0,p.Z)(t),g=y.getUTCDay();return y.setUTCDate(y.getUTCDate()+(((v%7+7)%7<m?7:0)+v-g)),y}var ea=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",90),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["D","i","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"E":case"EE":case"EEE":return r.day(e,{width:"abbreviated",context:"formatting"})||r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"});case"EEEEE":return r.day(e,{width:"narrow",context:"formatting"});case"EEEEEE":return r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"});default:return r.day(e,{width:"wide",context:"formatting"})||r.day(e,{width:"abbreviated",context:"formatting"})||r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"})}}},{key:"validate",value:function(e,t){return t>=0&&t<=6}},{key:"set",value:function(e,t,r,n){return(e=en(e,r,n)).setUTCHours(0,0,0,0),e}}]),r}(D),eo=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",90),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["y","R","u","q","Q","M","L","I","d","D","E","i","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r,n){var a=function(e){return(e+n.weekStartsOn+6)%7+7*Math.floor((e-1)/7)};switch(t){case"e":case"ee":return P(O(t.length,e),a);case"eo":return P(r.ordinalNumber(e,{unit:"day"}),a);case"eee":return r.day(e,{width:"abbreviated",context:"formatting"})||r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"});case"eeeee":return r.day(e,{width:"narrow",context:"formatting"});case"eeeeee":return r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"});default:return r.day(e,{width:"wide",context:"formatting"})||r.day(e,{width:"abbreviated",context:"formatting"})||r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"})}}},{key:"validate",value:function(e,t){return t>=0&&t<=6}},{key:"set",value:function(e,t,r,n){return(e=en(e,r,n)).setUTCHours(0,0,0,0),e}}]),r}(D),ei=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",90),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["y","R","u","q","Q","M","L","I","d","D","E","i","e","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r,n){var a=function(e){return(e+n.weekStartsOn+6)%7+7*Math.floor((e-1)/7)};switch(t){case"c":case"cc":return P(O(t.length,e),a);case"co":return P(r.ordinalNumber(e,{unit:"day"}),a);case"ccc":return r.day(e,{width:"abbreviated",context:"standalone"})||r.day(e,{width:"short",context:"standalone"})||r.day(e,{width:"narrow",context:"standalone"});case"ccccc":return r.day(e,{width:"narrow",context:"standalone"});case"cccccc":return r.day(e,{width:"short",context:"standalone"})||r.day(e,{width:"narrow",context:"standalone"});default:return r.day(e,{width:"wide",context:"standalone"})||r.day(e,{width:"abbreviated",context:"standalone"})||r.day(e,{width:"short",context:"standalone"})||r.day(e,{width:"narrow",context:"standalone"})}}},{key:"validate",value:function(e,t){return t>=0&&t<=6}},{key:"set",value:function(e,t,r,n){return(e=en(e,r,n)).setUTCHours(0,0,0,0),e}}]),r}(D),ec=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",90),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["y","Y","u","q","Q","M","L","w","d","D","E","e","c","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){var n=function(e){return 0===e?7:e};switch(t){case"i":case"ii":return O(t.length,e);case"io":return r.ordinalNumber(e,{unit:"day"});case"iii":return P(r.day(e,{width:"abbreviated",context:"formatting"})||r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"}),n);case"iiiii":return P(r.day(e,{width:"narrow",context:"formatting"}),n);case"iiiiii":return P(r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"}),n);default:return P(r.day(e,{width:"wide",context:"formatting"})||r.day(e,{width:"abbreviated",context:"formatting"})||r.day(e,{width:"short",context:"formatting"})||r.day(e,{width:"narrow",context:"formatting"}),n)}}},{key:"validate",value:function(e,t){return t>=1&&t<=7}},{key:"set",value:function(e,t,r){return(e=function(e,t){(0,f.Z)(2,arguments);var r=(0,p.Z)(t);r%7==0&&(r-=7);var n=(0,s.default)(e),a=((r%7+7)%7<1?7:0)+r-n.getUTCDay();return n.setUTCDate(n.getUTCDate()+a),n}(e,r)).setUTCHours(0,0,0,0),e}}]),r}(D),es=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",80),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["b","B","H","k","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"a":case"aa":case"aaa":return r.dayPeriod(e,{width:"abbreviated",context:"formatting"})||r.dayPeriod(e,{width:"narrow",context:"formatting"});case"aaaaa":return r.dayPeriod(e,{width:"narrow",context:"formatting"});default:return r.dayPeriod(e,{width:"wide",context:"formatting"})||r.dayPeriod(e,{width:"abbreviated",context:"formatting"})||r.dayPeriod(e,{width:"narrow",context:"formatting"})}}},{key:"set",value:function(e,t,r){return e.setUTCHours(Y(r),0,0,0),e}}]),r}(D),eu=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",80),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["a","B","H","k","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"b":case"bb":case"bbb":return r.dayPeriod(e,{width:"abbreviated",context:"formatting"})||r.dayPeriod(e,{width:"narrow",context:"formatting"});case"bbbbb":return r.dayPeriod(e,{width:"narrow",context:"formatting"});default:return r.dayPeriod(e,{width:"wide",context:"formatting"})||r.dayPeriod(e,{width:"abbreviated",context:"formatting"})||r.dayPeriod(e,{width:"narrow",context:"formatting"})}}},{key:"set",value:function(e,t,r){return e.setUTCHours(Y(r),0,0,0),e}}]),r}(D),el=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",80),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["a","b","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"B":case"BB":case"BBB":return r.dayPeriod(e,{width:"abbreviated",context:"formatting"})||r.dayPeriod(e,{width:"narrow",context:"formatting"});case"BBBBB":return r.dayPeriod(e,{width:"narrow",context:"formatting"});default:return r.dayPeriod(e,{width:"wide",context:"formatting"})||r.dayPeriod(e,{width:"abbreviated",context:"formatting"})||r.dayPeriod(e,{width:"narrow",context:"formatting"})}}},{key:"set",value:function(e,t,r){return e.setUTCHours(Y(r),0,0,0),e}}]),r}(D),ed=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",70),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["H","K","k","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"h":return E(S.hour12h,e);case"ho":return r.ordinalNumber(e,{unit:"hour"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=1&&t<=12}},{key:"set",value:function(e,t,r){var n=e.getUTCHours()>=12;return n&&r<12?e.setUTCHours(r+12,0,0,0):n||12!==r?e.setUTCHours(r,0,0,0):e.setUTCHours(0,0,0,0),e}}]),r}(D),ep=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",70),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["a","b","h","K","k","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"H":return E(S.hour23h,e);case"Ho":return r.ordinalNumber(e,{unit:"hour"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=0&&t<=23}},{key:"set",value:function(e,t,r){return e.setUTCHours(r,0,0,0),e}}]),r}(D),ef=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",70),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["h","H","k","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"K":return E(S.hour11h,e);case"Ko":return r.ordinalNumber(e,{unit:"hour"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=0&&t<=11}},{key:"set",value:function(e,t,r){return e.getUTCHours()>=12&&r<12?e.setUTCHours(r+12,0,0,0):e.setUTCHours(r,0,0,0),e}}]),r}(D),eh=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",70),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["a","b","h","H","K","t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"k":return E(S.hour24h,e);case"ko":return r.ordinalNumber(e,{unit:"hour"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=1&&t<=24}},{key:"set",value:function(e,t,r){return e.setUTCHours(r<=24?r%24:r,0,0,0),e}}]),r}(D),em=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",60),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"m":return E(S.minute,e);case"mo":return r.ordinalNumber(e,{unit:"minute"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=0&&t<=59}},{key:"set",value:function(e,t,r){return e.setUTCMinutes(r,0,0),e}}]),r}(D),ey=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",50),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t,r){switch(t){case"s":return E(S.second,e);case"so":return r.ordinalNumber(e,{unit:"second"});default:return O(t.length,e)}}},{key:"validate",value:function(e,t){return t>=0&&t<=59}},{key:"set",value:function(e,t,r){return e.setUTCSeconds(r,0),e}}]),r}(D),ev=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",30),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["t","T"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t){return P(O(t.length,e),function(e){return Math.floor(e*Math.pow(10,-t.length+3))})}},{key:"set",value:function(e,t,r){return e.setUTCMilliseconds(r),e}}]),r}(D),eg=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",10),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["t","T","x"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t){switch(t){case"X":return Z(T.basicOptionalMinutes,e);case"XX":return Z(T.basic,e);case"XXXX":return Z(T.basicOptionalSeconds,e);case"XXXXX":return Z(T.extendedOptionalSeconds,e);default:return Z(T.extended,e)}}},{key:"set",value:function(e,t,r){return t.timestampIsSet?e:new Date(e.getTime()-r)}}]),r}(D),eb=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",10),(0,b.Z)((0,h.Z)(e),"incompatibleTokens",["t","T","X"]),e}return(0,g.Z)(r,[{key:"parse",value:function(e,t){switch(t){case"x":return Z(T.basicOptionalMinutes,e);case"xx":return Z(T.basic,e);case"xxxx":return Z(T.basicOptionalSeconds,e);case"xxxxx":return Z(T.extendedOptionalSeconds,e);default:return Z(T.extended,e)}}},{key:"set",value:function(e,t,r){return t.timestampIsSet?e:new Date(e.getTime()-r)}}]),r}(D),ew=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",40),(0,b.Z)((0,h.Z)(e),"incompatibleTokens","*"),e}return(0,g.Z)(r,[{key:"parse",value:function(e){return M(e)}},{key:"set",value:function(e,t,r){return[new Date(1e3*r),{timestampIsSet:!0}]}}]),r}(D),ek=function(e){(0,m.Z)(r,e);var t=(0,y.Z)(r);function r(){var e;(0,v.Z)(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return e=t.call.apply(t,[this].concat(a)),(0,b.Z)((0,h.Z)(e),"priority",20),(0,b.Z)((0,h.Z)(e),"incompatibleTokens","*"),e}return(0,g.Z)(r,[{key:"parse",value:function(e){return M(e)}},{key:"set",value:function(e,t,r){return[new Date(r),{timestampIsSet:!0}]}}]),r}(D),e_={G:new x,y:new F,Y:new j,R:new W,u:new H,Q:new B,q:new q,M:new $,L:new Q,w:new z,I:new V,d:new ee,D:new et,E:new ea,e:new eo,c:new ei,i:new ec,a:new es,b:new eu,B:new el,h:new ed,H:new ep,K:new ef,k:new eh,m:new em,s:new ey,S:new ev,X:new eg,x:new eb,t:new ew,T:new ek},eD=/[yYQqMLwIdDecihHKkms]o|(\w)\1*|''|'(''|[^'])+('|$)|./g,ex=/P+p+|P+|p+|''|'(''|[^'])+('|$)|./g,eC=/^'([^]*?)'?$/,eS=/''/g,eT=/\S/,eP=/[a-zA-Z]/;function eE(e,t,r,a){(0,f.Z)(3,arguments);var h=String(e),m=String(t),y=(0,er.j)(),v=null!==(w=null!==(k=null==a?void 0:a.locale)&&void 0!==k?k:y.locale)&&void 0!==w?w:i.Z;if(!v.match)throw RangeError("locale must contain match property");var g=(0,p.Z)(null!==(D=null!==(x=null!==(C=null!==(S=null==a?void 0:a.firstWeekContainsDate)&&void 0!==S?S:null==a?void 0:null===(T=a.locale)||void 0===T?void 0:null===(P=T.options)||void 0===P?void 0:P.firstWeekContainsDate)&&void 0!==C?C:y.firstWeekContainsDate)&&void 0!==x?x:null===(E=y.locale)||void 0===E?void 0:null===(Z=E.options)||void 0===Z?void 0:Z.firstWeekContainsDate)&&void 0!==D?D:1);if(!(g>=1&&g<=7))throw RangeError("firstWeekContainsDate must be between 1 and 7 inclusively");var b=(0,p.Z)(null!==(M=null!==(O=null!==(N=null!==(Y=null==a?void 0:a.weekStartsOn)&&void 0!==Y?Y:null==a?void 0:null===(A=a.locale)||void 0===A?void 0:null===(I=A.options)||void 0===I?void 0:I.weekStartsOn)&&void 0!==N?N:y.weekStartsOn)&&void 0!==O?O:null===(F=y.locale)||void 0===F?void 0:null===(L=F.options)||void 0===L?void 0:L.weekStartsOn)&&void 0!==M?M:0);if(!(b>=0&&b<=6))throw RangeError("weekStartsOn must be between 0 and 6 inclusively");if(""===m)return""===h?(0,s.default)(r):new Date(NaN);var w,k,D,x,C,S,T,P,E,Z,M,O,N,Y,A,I,F,L,R,j={firstWeekContainsDate:g,weekStartsOn:b,locale:v},U=[new _],W=m.match(ex).map(function(e){var t=e[0];return t in u.Z?(0,u.Z[t])(e,v.formatLong):e}).join("").match(eD),H=[],B=o(W);try{for(B.s();!(R=B.n()).done;){var q=function(){var t=R.value;!(null!=a&&a.useAdditionalWeekYearTokens)&&(0,d.Do)(t)&&(0,d.qp)(t,m,e),!(null!=a&&a.useAdditionalDayOfYearTokens)&&(0,d.Iu)(t)&&(0,d.qp)(t,m,e);var r=t[0],n=e_[r];if(n){var o=n.incompatibleTokens;if(Array.isArray(o)){var i=H.find(function(e){return o.includes(e.token)||e.token===r});if(i)throw RangeError("The format string mustn't contain `".concat(i.fullToken,"` and `").concat(t,"` at the same time"))}else if("*"===n.incompatibleTokens&&H.length>0)throw RangeError("The format string mustn't contain `".concat(t,"` and any other token at the same time"));H.push({token:r,fullToken:t});var c=n.run(h,t,v.match,j);if(!c)return{v:new Date(NaN)};U.push(c.setter),h=c.rest}else{if(r.match(eP))throw RangeError("Format string contains an unescaped latin alphabet character `"+r+"`");if("''"===t?t="'":"'"===r&&(t=t.match(eC)[1].replace(eS,"'")),0!==h.indexOf(t))return{v:new Date(NaN)};h=h.slice(t.length)}}();if("object"===(0,n.Z)(q))return q.v}}catch(e){B.e(e)}finally{B.f()}if(h.length>0&&eT.test(h))return new Date(NaN);var $=U.map(function(e){return e.priority}).sort(function(e,t){return t-e}).filter(function(e,t,r){return r.indexOf(e)===t}).map(function(e){return U.filter(function(t){return t.priority===e}).sort(function(e,t){return t.subPriority-e.subPriority})}).map(function(e){return e[0]}),Q=(0,s.default)(r);if(isNaN(Q.getTime()))return new Date(NaN);var K,z=(0,c.Z)(Q,(0,l.Z)(Q)),G={},V=o($);try{for(V.s();!(K=V.n()).done;){var X=K.value;if(!X.validate(z,j))return new Date(NaN);var J=X.set(z,G,j);Array.isArray(J)?(z=J[0],function(e,t){if(null==e)throw TypeError("assign requires that input parameter not be null or undefined");for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r]);return e}(G,J[1])):z=J}}catch(e){V.e(e)}finally{V.f()}return z}},38814:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(70356),a=r(3805),o=r(37993);function i(e,t){(0,a.Z)(1,arguments);var r,i,m,y=(0,o.Z)(null!==(r=null==t?void 0:t.additionalDigits)&&void 0!==r?r:2);if(2!==y&&1!==y&&0!==y)throw RangeError("additionalDigits must be 0, 1 or 2");if(!("string"==typeof e||"[object String]"===Object.prototype.toString.call(e)))return new Date(NaN);var v=function(e){var t,r={},n=e.split(c.dateTimeDelimiter);if(n.length>2)return r;if(/:/.test(n[0])?t=n[0]:(r.date=n[0],t=n[1],c.timeZoneDelimiter.test(r.date)&&(r.date=e.split(c.timeZoneDelimiter)[0],t=e.substr(r.date.length,e.length))),t){var a=c.timezone.exec(t);a?(r.time=t.replace(a[1],""),r.timezone=a[1]):r.time=t}return r}(e);if(v.date){var g=function(e,t){var r=RegExp("^(?:(\\d{4}|[+-]\\d{"+(4+t)+"})|(\\d{2}|[+-]\\d{"+(2+t)+"})$)"),n=e.match(r);if(!n)return{year:NaN,restDateString:""};var a=n[1]?parseInt(n[1]):null,o=n[2]?parseInt(n[2]):null;return{year:null===o?a:100*o,restDateString:e.slice((n[1]||n[2]).length)}}(v.date,y);i=function(e,t){if(null===t)return new Date(NaN);var r,n,a=e.match(s);if(!a)return new Date(NaN);var o=!!a[4],i=d(a[1]),c=d(a[2])-1,u=d(a[3]),l=d(a[4]),p=d(a[5])-1;if(o)return l>=1&&l<=53&&p>=0&&p<=6?((r=new Date(0)).setUTCFullYear(t,0,4),n=r.getUTCDay()||7,r.setUTCDate(r.getUTCDate()+((l-1)*7+p+1-n)),r):new Date(NaN);var m=new Date(0);return c>=0&&c<=11&&u>=1&&u<=(f[c]||(h(t)?29:28))&&i>=1&&i<=(h(t)?366:365)?(m.setUTCFullYear(t,c,Math.max(i,u)),m):new Date(NaN)}(g.restDateString,g.year)}if(!i||isNaN(i.getTime()))return new Date(NaN);var b=i.getTime(),w=0;if(v.time&&isNaN(w=function(e){var t=e.match(u);if(!t)return NaN;var r=p(t[1]),a=p(t[2]),o=p(t[3]);return(24===r?0===a&&0===o:o>=0&&o<60&&a>=0&&a<60&&r>=0&&r<25)?r*n.vh+a*n.yJ+1e3*o:NaN}(v.time)))return new Date(NaN);if(v.timezone){if(isNaN(m=function(e){if("Z"===e)return 0;var t=e.match(l);if(!t)return 0;var r="+"===t[1]?-1:1,a=parseInt(t[2]),o=t[3]&&parseInt(t[3])||0;return o>=0&&o<=59?r*(a*n.vh+o*n.yJ):NaN}(v.timezone)))return new Date(NaN)}else{var k=new Date(b+w),_=new Date(0);return _.setFullYear(k.getUTCFullYear(),k.getUTCMonth(),k.getUTCDate()),_.setHours(k.getUTCHours(),k.getUTCMinutes(),k.getUTCSeconds(),k.getUTCMilliseconds()),_}return new Date(b+w+m)}var c={dateTimeDelimiter:/[T ]/,timeZoneDelimiter:/[Z ]/i,timezone:/([Z+-].*)$/},s=/^-?(?:(\d{3})|(\d{2})(?:-?(\d{2}))?|W(\d{2})(?:-?(\d{1}))?|)$/,u=/^(\d{2}(?:[.,]\d*)?)(?::?(\d{2}(?:[.,]\d*)?))?(?::?(\d{2}(?:[.,]\d*)?))?$/,l=/^([+-])(\d{2})(?::?(\d{2}))?$/;function d(e){return e?parseInt(e):1}function p(e){return e&&parseFloat(e.replace(",","."))||0}var f=[31,null,31,30,31,30,31,31,30,31,30,31];function h(e){return e%400==0||e%4==0&&e%100!=0}},91679:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,n.Z)(t);return r.setHours(i),r}},62310:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,n.Z)(t);return r.setMinutes(i),r}},2682:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,n.Z)(t),c=r.getFullYear(),s=r.getDate(),u=new Date(0);u.setFullYear(c,i,15),u.setHours(0,0,0,0);var l=function(e){(0,o.Z)(1,arguments);var t=(0,a.default)(e),r=t.getFullYear(),n=t.getMonth(),i=new Date(0);return i.setFullYear(r,n+1,0),i.setHours(0,0,0,0),i.getDate()}(u);return r.setMonth(i,Math.min(s,l)),r}},12520:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return c}});var n=r(37993),a=r(27760),o=r(2682),i=r(3805);function c(e,t){(0,i.Z)(2,arguments);var r=(0,a.default)(e),c=(0,n.Z)(t),s=Math.floor(r.getMonth()/3)+1;return(0,o.default)(r,r.getMonth()+3*(c-s))}},97567:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,n.Z)(t);return r.setSeconds(i),r}},7452:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(27760),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,a.default)(e),i=(0,n.Z)(t);return isNaN(r.getTime())?new Date(NaN):(r.setFullYear(i),r)}},13065:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e);return t.setHours(0,0,0,0),t}},31816:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e);return t.setDate(1),t.setHours(0,0,0,0),t}},87573:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e),r=t.getMonth();return t.setMonth(r-r%3,1),t.setHours(0,0,0,0),t}},74982:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return c}});var n=r(27760),a=r(37993),o=r(3805),i=r(19461);function c(e,t){(0,o.Z)(1,arguments);var r,c,s,u,l,d,p,f,h=(0,i.j)(),m=(0,a.Z)(null!==(r=null!==(c=null!==(s=null!==(u=null==t?void 0:t.weekStartsOn)&&void 0!==u?u:null==t?void 0:null===(l=t.locale)||void 0===l?void 0:null===(d=l.options)||void 0===d?void 0:d.weekStartsOn)&&void 0!==s?s:h.weekStartsOn)&&void 0!==c?c:null===(p=h.locale)||void 0===p?void 0:null===(f=p.options)||void 0===f?void 0:f.weekStartsOn)&&void 0!==r?r:0);if(!(m>=0&&m<=6))throw RangeError("weekStartsOn must be between 0 and 6 inclusively");var y=(0,n.default)(e),v=y.getDay();return y.setDate(y.getDate()-((v<m?7:0)+v-m)),y.setHours(0,0,0,0),y}},58328:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(27760),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=(0,n.default)(e),r=new Date(0);return r.setFullYear(t.getFullYear(),0,1),r.setHours(0,0,0,0),r}},25353:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(84153),a=r(3805),o=r(37993);function i(e,t){(0,a.Z)(2,arguments);var r=(0,o.Z)(t);return(0,n.default)(e,-r)}},70826:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(25832),a=r(3805),o=r(37993);function i(e,t){(0,a.Z)(2,arguments);var r=(0,o.Z)(t);return(0,n.default)(e,-r)}},16766:function(e,t,r){"use strict";r.d(t,{Z:function(){return i}});var n=r(19811),a=r(3805),o=r(37993);function i(e,t){(0,a.Z)(2,arguments);var r=(0,o.Z)(t);return(0,n.Z)(e,-r)}},42835:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(60218),a=r(3805),o=r(37993);function i(e,t){(0,a.Z)(2,arguments);var r=(0,o.Z)(t);return(0,n.default)(e,-r)}},36048:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(90579),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,n.Z)(t);return(0,a.default)(e,-r)}},19762:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(76755),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,n.Z)(t);return(0,a.default)(e,-r)}},83321:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return i}});var n=r(37993),a=r(41609),o=r(3805);function i(e,t){(0,o.Z)(2,arguments);var r=(0,n.Z)(t);return(0,a.default)(e,-r)}},27760:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return o}});var n=r(47478),a=r(3805);function o(e){(0,a.Z)(1,arguments);var t=Object.prototype.toString.call(e);return e instanceof Date||"object"===(0,n.Z)(e)&&"[object Date]"===t?new Date(e.getTime()):"number"==typeof e||"[object Number]"===t?new Date(e):(("string"==typeof e||"[object String]"===t)&&"undefined"!=typeof console&&(console.warn("Starting with v2.0.0-beta.1 date-fns doesn't accept strings as date arguments. Please use `parseISO` to parse strings. See: https://github.com/date-fns/date-fns/blob/master/docs/upgradeGuide.md#string-arguments"),console.warn(Error().stack)),new Date(NaN))}},24244:function(e){"use strict";var t=function(e){return e!=e};e.exports=function(e,r){return 0===e&&0===r?1/e==1/r:!!(e===r||t(e)&&t(r))}},20609:function(e,t,r){"use strict";var n=r(4289),a=r(55559),o=r(24244),i=r(75624),c=r(52281),s=a(i(),Object);n(s,{getPolyfill:i,implementation:o,shim:c}),e.exports=s},75624:function(e,t,r){"use strict";var n=r(24244);e.exports=function(){return"function"==typeof Object.is?Object.is:n}},52281:function(e,t,r){"use strict";var n=r(75624),a=r(4289);e.exports=function(){var e=n();return a(Object,{is:e},{is:function(){return Object.is!==e}}),e}},18987:function(e,t,r){"use strict";var n;if(!Object.keys){var a=Object.prototype.hasOwnProperty,o=Object.prototype.toString,i=r(21414),c=Object.prototype.propertyIsEnumerable,s=!c.call({toString:null},"toString"),u=c.call(function(){},"prototype"),l=["toString","toLocaleString","valueOf","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","constructor"],d=function(e){var t=e.constructor;return t&&t.prototype===e},p={$applicationCache:!0,$console:!0,$external:!0,$frame:!0,$frameElement:!0,$frames:!0,$innerHeight:!0,$innerWidth:!0,$onmozfullscreenchange:!0,$onmozfullscreenerror:!0,$outerHeight:!0,$outerWidth:!0,$pageXOffset:!0,$pageYOffset:!0,$parent:!0,$scrollLeft:!0,$scrollTop:!0,$scrollX:!0,$scrollY:!0,$self:!0,$webkitIndexedDB:!0,$webkitStorageInfo:!0,$window:!0},f=function(){if("undefined"==typeof window)return!1;for(var e in window)try{if(!p["$"+e]&&a.call(window,e)&&null!==window[e]&&"object"==typeof window[e])try{d(window[e])}catch(e){return!0}}catch(e){return!0}return!1}(),h=function(e){if("undefined"==typeof window||!f)return d(e);try{return d(e)}catch(e){return!1}};n=function(e){var t=null!==e&&"object"==typeof e,r="[object Function]"===o.call(e),n=i(e),c=t&&"[object String]"===o.call(e),d=[];if(!t&&!r&&!n)throw TypeError("Object.keys called on a non-object");var p=u&&r;if(c&&e.length>0&&!a.call(e,0))for(var f=0;f<e.length;++f)d.push(String(f));if(n&&e.length>0)for(var m=0;m<e.length;++m)d.push(String(m));else for(var y in e)!(p&&"prototype"===y)&&a.call(e,y)&&d.push(String(y));if(s)for(var v=h(e),g=0;g<l.length;++g)!(v&&"constructor"===l[g])&&a.call(e,l[g])&&d.push(l[g]);return d}}e.exports=n},82215:function(e,t,r){"use strict";var n=Array.prototype.slice,a=r(21414),o=Object.keys,i=o?function(e){return o(e)}:r(18987),c=Object.keys;i.shim=function(){return Object.keys?!function(){var e=Object.keys(arguments);return e&&e.length===arguments.length}(1,2)&&(Object.keys=function(e){return a(e)?c(n.call(e)):c(e)}):Object.keys=i,Object.keys||i},e.exports=i},21414:function(e){"use strict";var t=Object.prototype.toString;e.exports=function(e){var r=t.call(e),n="[object Arguments]"===r;return n||(n="[object Array]"!==r&&null!==e&&"object"==typeof e&&"number"==typeof e.length&&e.length>=0&&"[object Function]"===t.call(e.callee)),n}},92703:function(e,t,r){"use strict";var n=r(50414);function a(){}function o(){}o.resetWarningCache=a,e.exports=function(){function e(e,t,r,a,o,i){if(i!==n){var c=Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw c.name="Invariant Violation",c}}function t(){return e}e.isRequired=e;var r={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:o,resetWarningCache:a};return r.PropTypes=r,r}},45697:function(e,t,r){e.exports=r(92703)()},50414:function(e){"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},9198:function(e,t,r){!function(e,t,n,a,o,i,c,s,u,l,d,p,f,h,m,y,v,g,b,w,k,_,D,x,C,S,T,P,E,Z,M,O,N,Y,A,I,F,L,R,j,U,W,H,B,q,$,Q,K,z,G,V,X,J,ee,et,er,en,ea,eo,ei,ec,es,eu){"use strict";function el(e){return e&&"object"==typeof e&&"default"in e?e:{default:e}}var ed=el(t),ep=el(a),ef=el(o),eh=el(i),em=el(c),ey=el(s),ev=el(u),eg=el(l),eb=el(d),ew=el(p),ek=el(f),e_=el(y),eD=el(v),ex=el(g),eC=el(b),eS=el(w),eT=el(k),eP=el(_),eE=el(D),eZ=el(x),eM=el(C),eO=el(S),eN=el(T),eY=el(P),eA=el(E),eI=el(Z),eF=el(M),eL=el(O),eR=el(N),ej=el(Y),eU=el(A),eW=el(I),eH=el(F),eB=el(L),eq=el(R),e$=el(U),eQ=el(W),eK=el(H),ez=el(B),eG=el(q),eV=el($),eX=el(Q),eJ=el(G),e0=el(V),e1=el(X),e2=el(J),e3=el(ee),e7=el(et),e6=el(er),e5=el(en),e4=el(ea),e8=el(eo),e9=el(ei),te=el(ec),tt=el(eu);function tr(e){return(tr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function tn(e,t){if(!(e instanceof t))throw TypeError("Cannot call a class as a function")}function ta(e,t){for(var r=0;r<t.length;r++){var n=t[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(e,n.key,n)}}function to(e,t,r){return t&&ta(e.prototype,t),r&&ta(e,r),e}function ti(e,t,r){return t in e?Object.defineProperty(e,t,{value:r,enumerable:!0,configurable:!0,writable:!0}):e[t]=r,e}function tc(){return(tc=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}function ts(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}function tu(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?ts(Object(r),!0).forEach(function(t){ti(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):ts(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}function tl(e,t){if("function"!=typeof t&&null!==t)throw TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&tp(e,t)}function td(e){return(td=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function tp(e,t){return(tp=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}function tf(e){if(void 0===e)throw ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function th(e){var t=function(){if("undefined"==typeof Reflect||!Reflect.construct||Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch(e){return!1}}();return function(){var r,n=td(e);return r=t?Reflect.construct(n,arguments,td(this).constructor):n.apply(this,arguments),r&&("object"==typeof r||"function"==typeof r)?r:tf(this)}}function tm(e,t){(null==t||t>e.length)&&(t=e.length);for(var r=0,n=Array(t);r<t;r++)n[r]=e[r];return n}function ty(e,t){switch(e){case"P":return t.date({width:"short"});case"PP":return t.date({width:"medium"});case"PPP":return t.date({width:"long"});default:return t.date({width:"full"})}}function tv(e,t){switch(e){case"p":return t.time({width:"short"});case"pp":return t.time({width:"medium"});case"ppp":return t.time({width:"long"});default:return t.time({width:"full"})}}var tg={p:tv,P:function(e,t){var r,n=e.match(/(P+)(p+)?/),a=n[1],o=n[2];if(!o)return ty(e,t);switch(a){case"P":r=t.dateTime({width:"short"});break;case"PP":r=t.dateTime({width:"medium"});break;case"PPP":r=t.dateTime({width:"long"});break;default:r=t.dateTime({width:"full"})}return r.replace("{{date}}",ty(a,t)).replace("{{time}}",tv(o,t))}},tb=/P+p+|P+|p+|''|'(''|[^'])+('|$)|./g;function tw(e){var t=e?"string"==typeof e||e instanceof String?e9.default(e):e4.default(e):new Date;return tk(t)?t:null}function tk(e){return eh.default(e)&&e7.default(e,new Date("1/1/1000"))}function t_(e,t,r){if("en"===r)return em.default(e,t,{awareOfUnicodeTokens:!0});var n=tY(r);return r&&!n&&console.warn('A locale object was not found for the provided string ["'.concat(r,'"].')),!n&&tN()&&tY(tN())&&(n=tY(tN())),em.default(e,t,{locale:n||null,awareOfUnicodeTokens:!0})}function tD(e,t){var r=t.hour,n=t.minute,a=t.second;return eL.default(eF.default(eI.default(e,void 0===a?0:a),void 0===n?0:n),void 0===r?0:r)}function tx(e,t){var r=tY(t||tN());return eK.default(e,{locale:r})}function tC(e){return ez.default(e)}function tS(e){return eV.default(e)}function tT(e,t){return e&&t?e2.default(e,t):!e&&!t}function tP(e,t){return e&&t?e1.default(e,t):!e&&!t}function tE(e,t){return e&&t?e3.default(e,t):!e&&!t}function tZ(e,t){return e&&t?e0.default(e,t):!e&&!t}function tM(e,t){return e&&t?eJ.default(e,t):!e&&!t}function tO(e,t,r){var n,a=eQ.default(t),o=eX.default(r);try{n=e5.default(e,{start:a,end:o})}catch(e){n=!1}return n}function tN(){return("undefined"!=typeof window?window:r.g).__localeId__}function tY(e){if("string"==typeof e){var t="undefined"!=typeof window?window:r.g;return t.__localeData__?t.__localeData__[e]:null}return e}function tA(e,t){return t_(eR.default(tw(),e),"LLLL",t)}function tI(e,t){return t_(eR.default(tw(),e),"LLL",t)}function tF(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.maxDate,a=t.excludeDates,o=t.includeDates,i=t.filterDate;return tR(e,{minDate:r,maxDate:n})||a&&a.some(function(t){return tZ(e,t)})||o&&!o.some(function(t){return tZ(e,t)})||i&&!i(tw(e))||!1}function tL(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.excludeDates;return r&&r.some(function(t){return tZ(e,t)})||!1}function tR(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.maxDate;return r&&0>eB.default(e,r)||n&&eB.default(e,n)>0}function tj(e,t){return t.some(function(t){return eP.default(t)===eP.default(e)&&eT.default(t)===eT.default(e)})}function tU(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.excludeTimes,n=t.includeTimes,a=t.filterTime;return r&&tj(e,r)||n&&!tj(e,n)||a&&!a(e)||!1}function tW(e,t){var r=t.minTime,n=t.maxTime;if(!r||!n)throw Error("Both minTime and maxTime props required");var a,o=tw(),i=eL.default(eF.default(o,eT.default(e)),eP.default(e)),c=eL.default(eF.default(o,eT.default(r)),eP.default(r)),s=eL.default(eF.default(o,eT.default(n)),eP.default(n));try{a=!e5.default(i,{start:c,end:s})}catch(e){a=!1}return a}function tH(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.includeDates,a=ex.default(e,1);return r&&eq.default(r,a)>0||n&&n.every(function(e){return eq.default(e,a)>0})||!1}function tB(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.maxDate,n=t.includeDates,a=ew.default(e,1);return r&&eq.default(a,r)>0||n&&n.every(function(e){return eq.default(a,e)>0})||!1}function tq(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.includeDates,a=eC.default(e,1);return r&&e$.default(r,a)>0||n&&n.every(function(e){return e$.default(e,a)>0})||!1}function t$(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.maxDate,n=t.includeDates,a=ek.default(e,1);return r&&e$.default(a,r)>0||n&&n.every(function(e){return e$.default(a,e)>0})||!1}function tQ(e){var t=e.minDate,r=e.includeDates;if(r&&t){var n=r.filter(function(e){return eB.default(e,t)>=0});return eW.default(n)}return r?eW.default(r):t}function tK(e){var t=e.maxDate,r=e.includeDates;if(r&&t){var n=r.filter(function(e){return 0>=eB.default(e,t)});return eH.default(n)}return r?eH.default(r):t}function tz(){for(var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"react-datepicker__day--highlighted",r=new Map,n=0,a=e.length;n<a;n++){var o=e[n];if(ef.default(o)){var i=t_(o,"MM.dd.yyyy"),c=r.get(i)||[];c.includes(t)||(c.push(t),r.set(i,c))}else if("object"===tr(o)){var s=Object.keys(o),u=s[0],l=o[s[0]];if("string"==typeof u&&l.constructor===Array)for(var d=0,p=l.length;d<p;d++){var f=t_(l[d],"MM.dd.yyyy"),h=r.get(f)||[];h.includes(u)||(h.push(u),r.set(f,h))}}}return r}function tG(e){return e<10?"0".concat(e):"".concat(e)}function tV(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:12,r=Math.ceil(eY.default(e)/t)*t;return{startPeriod:r-(t-1),endPeriod:r}}var tX=function(e){tl(r,e);var t=th(r);function r(e){tn(this,r),ti(tf(n=t.call(this,e)),"renderOptions",function(){var e=n.props.year,t=n.state.yearsList.map(function(t){return ed.default.createElement("div",{className:e===t?"react-datepicker__year-option react-datepicker__year-option--selected_year":"react-datepicker__year-option",key:t,onClick:n.onChange.bind(tf(n),t)},e===t?ed.default.createElement("span",{className:"react-datepicker__year-option--selected"},"✓"):"",t)}),r=n.props.minDate?eY.default(n.props.minDate):null,a=n.props.maxDate?eY.default(n.props.maxDate):null;return a&&n.state.yearsList.find(function(e){return e===a})||t.unshift(ed.default.createElement("div",{className:"react-datepicker__year-option",key:"upcoming",onClick:n.incrementYears},ed.default.createElement("a",{className:"react-datepicker__navigation react-datepicker__navigation--years react-datepicker__navigation--years-upcoming"}))),r&&n.state.yearsList.find(function(e){return e===r})||t.push(ed.default.createElement("div",{className:"react-datepicker__year-option",key:"previous",onClick:n.decrementYears},ed.default.createElement("a",{className:"react-datepicker__navigation react-datepicker__navigation--years react-datepicker__navigation--years-previous"}))),t}),ti(tf(n),"onChange",function(e){n.props.onChange(e)}),ti(tf(n),"handleClickOutside",function(){n.props.onCancel()}),ti(tf(n),"shiftYears",function(e){var t=n.state.yearsList.map(function(t){return t+e});n.setState({yearsList:t})}),ti(tf(n),"incrementYears",function(){return n.shiftYears(1)}),ti(tf(n),"decrementYears",function(){return n.shiftYears(-1)});var n,a=e.yearDropdownItemNumber,o=e.scrollableYearDropdown;return n.state={yearsList:function(e,t,r,n){for(var a=[],o=0;o<2*t+1;o++){var i=e+t-o,c=!0;r&&(c=eY.default(r)<=i),n&&c&&(c=eY.default(n)>=i),c&&a.push(i)}return a}(n.props.year,a||(o?10:5),n.props.minDate,n.props.maxDate)},n}return to(r,[{key:"render",value:function(){var e=ep.default({"react-datepicker__year-dropdown":!0,"react-datepicker__year-dropdown--scrollable":this.props.scrollableYearDropdown});return ed.default.createElement("div",{className:e},this.renderOptions())}}]),r}(ed.default.Component),tJ=te.default(tX),t0=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"state",{dropdownVisible:!1}),ti(tf(e),"renderSelectOptions",function(){for(var t=e.props.minDate?eY.default(e.props.minDate):1900,r=e.props.maxDate?eY.default(e.props.maxDate):2100,n=[],a=t;a<=r;a++)n.push(ed.default.createElement("option",{key:a,value:a},a));return n}),ti(tf(e),"onSelectChange",function(t){e.onChange(t.target.value)}),ti(tf(e),"renderSelectMode",function(){return ed.default.createElement("select",{value:e.props.year,className:"react-datepicker__year-select",onChange:e.onSelectChange},e.renderSelectOptions())}),ti(tf(e),"renderReadView",function(t){return ed.default.createElement("div",{key:"read",style:{visibility:t?"visible":"hidden"},className:"react-datepicker__year-read-view",onClick:function(t){return e.toggleDropdown(t)}},ed.default.createElement("span",{className:"react-datepicker__year-read-view--down-arrow"}),ed.default.createElement("span",{className:"react-datepicker__year-read-view--selected-year"},e.props.year))}),ti(tf(e),"renderDropdown",function(){return ed.default.createElement(tJ,{key:"dropdown",year:e.props.year,onChange:e.onChange,onCancel:e.toggleDropdown,minDate:e.props.minDate,maxDate:e.props.maxDate,scrollableYearDropdown:e.props.scrollableYearDropdown,yearDropdownItemNumber:e.props.yearDropdownItemNumber})}),ti(tf(e),"renderScrollMode",function(){var t=e.state.dropdownVisible,r=[e.renderReadView(!t)];return t&&r.unshift(e.renderDropdown()),r}),ti(tf(e),"onChange",function(t){e.toggleDropdown(),t!==e.props.year&&e.props.onChange(t)}),ti(tf(e),"toggleDropdown",function(t){e.setState({dropdownVisible:!e.state.dropdownVisible},function(){e.props.adjustDateOnChange&&e.handleYearChange(e.props.date,t)})}),ti(tf(e),"handleYearChange",function(t,r){e.onSelect(t,r),e.setOpen()}),ti(tf(e),"onSelect",function(t,r){e.props.onSelect&&e.props.onSelect(t,r)}),ti(tf(e),"setOpen",function(){e.props.setOpen&&e.props.setOpen(!0)}),e}return to(r,[{key:"render",value:function(){var e;switch(this.props.dropdownMode){case"scroll":e=this.renderScrollMode();break;case"select":e=this.renderSelectMode()}return ed.default.createElement("div",{className:"react-datepicker__year-dropdown-container react-datepicker__year-dropdown-container--".concat(this.props.dropdownMode)},e)}}]),r}(ed.default.Component),t1=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"renderOptions",function(){return e.props.monthNames.map(function(t,r){return ed.default.createElement("div",{className:e.props.month===r?"react-datepicker__month-option react-datepicker__month-option--selected_month":"react-datepicker__month-option",key:t,onClick:e.onChange.bind(tf(e),r)},e.props.month===r?ed.default.createElement("span",{className:"react-datepicker__month-option--selected"},"✓"):"",t)})}),ti(tf(e),"onChange",function(t){return e.props.onChange(t)}),ti(tf(e),"handleClickOutside",function(){return e.props.onCancel()}),e}return to(r,[{key:"render",value:function(){return ed.default.createElement("div",{className:"react-datepicker__month-dropdown"},this.renderOptions())}}]),r}(ed.default.Component),t2=te.default(t1),t3=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"state",{dropdownVisible:!1}),ti(tf(e),"renderSelectOptions",function(e){return e.map(function(e,t){return ed.default.createElement("option",{key:t,value:t},e)})}),ti(tf(e),"renderSelectMode",function(t){return ed.default.createElement("select",{value:e.props.month,className:"react-datepicker__month-select",onChange:function(t){return e.onChange(t.target.value)}},e.renderSelectOptions(t))}),ti(tf(e),"renderReadView",function(t,r){return ed.default.createElement("div",{key:"read",style:{visibility:t?"visible":"hidden"},className:"react-datepicker__month-read-view",onClick:e.toggleDropdown},ed.default.createElement("span",{className:"react-datepicker__month-read-view--down-arrow"}),ed.default.createElement("span",{className:"react-datepicker__month-read-view--selected-month"},r[e.props.month]))}),ti(tf(e),"renderDropdown",function(t){return ed.default.createElement(t2,{key:"dropdown",month:e.props.month,monthNames:t,onChange:e.onChange,onCancel:e.toggleDropdown})}),ti(tf(e),"renderScrollMode",function(t){var r=e.state.dropdownVisible,n=[e.renderReadView(!r,t)];return r&&n.unshift(e.renderDropdown(t)),n}),ti(tf(e),"onChange",function(t){e.toggleDropdown(),t!==e.props.month&&e.props.onChange(t)}),ti(tf(e),"toggleDropdown",function(){return e.setState({dropdownVisible:!e.state.dropdownVisible})}),e}return to(r,[{key:"render",value:function(){var e,t=this,r=[0,1,2,3,4,5,6,7,8,9,10,11].map(this.props.useShortMonthInDropdown?function(e){return tI(e,t.props.locale)}:function(e){return tA(e,t.props.locale)});switch(this.props.dropdownMode){case"scroll":e=this.renderScrollMode(r);break;case"select":e=this.renderSelectMode(r)}return ed.default.createElement("div",{className:"react-datepicker__month-dropdown-container react-datepicker__month-dropdown-container--".concat(this.props.dropdownMode)},e)}}]),r}(ed.default.Component),t7=function(e){tl(r,e);var t=th(r);function r(e){var n;return tn(this,r),ti(tf(n=t.call(this,e)),"renderOptions",function(){return n.state.monthYearsList.map(function(e){var t=eA.default(e),r=tT(n.props.date,e)&&tP(n.props.date,e);return ed.default.createElement("div",{className:r?"react-datepicker__month-year-option --selected_month-year":"react-datepicker__month-year-option",key:t,onClick:n.onChange.bind(tf(n),t)},r?ed.default.createElement("span",{className:"react-datepicker__month-year-option--selected"},"✓"):"",t_(e,n.props.dateFormat,n.props.locale))})}),ti(tf(n),"onChange",function(e){return n.props.onChange(e)}),ti(tf(n),"handleClickOutside",function(){n.props.onCancel()}),n.state={monthYearsList:function(e,t){for(var r=[],n=tC(e),a=tC(t);!e7.default(n,a);)r.push(tw(n)),n=ew.default(n,1);return r}(n.props.minDate,n.props.maxDate)},n}return to(r,[{key:"render",value:function(){var e=ep.default({"react-datepicker__month-year-dropdown":!0,"react-datepicker__month-year-dropdown--scrollable":this.props.scrollableMonthYearDropdown});return ed.default.createElement("div",{className:e},this.renderOptions())}}]),r}(ed.default.Component),t6=te.default(t7),t5=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"state",{dropdownVisible:!1}),ti(tf(e),"renderSelectOptions",function(){for(var t=tC(e.props.minDate),r=tC(e.props.maxDate),n=[];!e7.default(t,r);){var a=eA.default(t);n.push(ed.default.createElement("option",{key:a,value:a},t_(t,e.props.dateFormat,e.props.locale))),t=ew.default(t,1)}return n}),ti(tf(e),"onSelectChange",function(t){e.onChange(t.target.value)}),ti(tf(e),"renderSelectMode",function(){return ed.default.createElement("select",{value:eA.default(tC(e.props.date)),className:"react-datepicker__month-year-select",onChange:e.onSelectChange},e.renderSelectOptions())}),ti(tf(e),"renderReadView",function(t){var r=t_(e.props.date,e.props.dateFormat,e.props.locale);return ed.default.createElement("div",{key:"read",style:{visibility:t?"visible":"hidden"},className:"react-datepicker__month-year-read-view",onClick:function(t){return e.toggleDropdown(t)}},ed.default.createElement("span",{className:"react-datepicker__month-year-read-view--down-arrow"}),ed.default.createElement("span",{className:"react-datepicker__month-year-read-view--selected-month-year"},r))}),ti(tf(e),"renderDropdown",function(){return ed.default.createElement(t6,{key:"dropdown",date:e.props.date,dateFormat:e.props.dateFormat,onChange:e.onChange,onCancel:e.toggleDropdown,minDate:e.props.minDate,maxDate:e.props.maxDate,scrollableMonthYearDropdown:e.props.scrollableMonthYearDropdown,locale:e.props.locale})}),ti(tf(e),"renderScrollMode",function(){var t=e.state.dropdownVisible,r=[e.renderReadView(!t)];return t&&r.unshift(e.renderDropdown()),r}),ti(tf(e),"onChange",function(t){e.toggleDropdown();var r=tw(parseInt(t));tT(e.props.date,r)&&tP(e.props.date,r)||e.props.onChange(r)}),ti(tf(e),"toggleDropdown",function(){return e.setState({dropdownVisible:!e.state.dropdownVisible})}),e}return to(r,[{key:"render",value:function(){var e;switch(this.props.dropdownMode){case"scroll":e=this.renderScrollMode();break;case"select":e=this.renderSelectMode()}return ed.default.createElement("div",{className:"react-datepicker__month-year-dropdown-container react-datepicker__month-year-dropdown-container--".concat(this.props.dropdownMode)},e)}}]),r}(ed.default.Component),t4=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"dayEl",ed.default.createRef()),ti(tf(e),"handleClick",function(t){!e.isDisabled()&&e.props.onClick&&e.props.onClick(t)}),ti(tf(e),"handleMouseEnter",function(t){!e.isDisabled()&&e.props.onMouseEnter&&e.props.onMouseEnter(t)}),ti(tf(e),"handleOnKeyDown",function(t){" "===t.key&&(t.preventDefault(),t.key="Enter"),e.props.handleOnKeyDown(t)}),ti(tf(e),"isSameDay",function(t){return tZ(e.props.day,t)}),ti(tf(e),"isKeyboardSelected",function(){return!e.props.disabledKeyboardNavigation&&!e.isSameDay(e.props.selected)&&e.isSameDay(e.props.preSelection)}),ti(tf(e),"isDisabled",function(){return tF(e.props.day,e.props)}),ti(tf(e),"isExcluded",function(){return tL(e.props.day,e.props)}),ti(tf(e),"getHighLightedClass",function(t){var r=e.props,n=r.day,a=r.highlightDates;if(!a)return!1;var o=t_(n,"MM.dd.yyyy");return a.get(o)}),ti(tf(e),"isInRange",function(){var t=e.props,r=t.day,n=t.startDate,a=t.endDate;return!(!n||!a)&&tO(r,n,a)}),ti(tf(e),"isInSelectingRange",function(){var t=e.props,r=t.day,n=t.selectsStart,a=t.selectsEnd,o=t.selectsRange,i=t.selectingDate,c=t.startDate,s=t.endDate;return!(!(n||a||o)||!i||e.isDisabled())&&(n&&s&&(e6.default(i,s)||tM(i,s))?tO(r,i,s):(a&&c&&(e7.default(i,c)||tM(i,c))||!(!o||!c||s||!e7.default(i,c)&&!tM(i,c)))&&tO(r,c,i))}),ti(tf(e),"isSelectingRangeStart",function(){if(!e.isInSelectingRange())return!1;var t=e.props,r=t.day,n=t.selectingDate,a=t.startDate;return tZ(r,t.selectsStart?n:a)}),ti(tf(e),"isSelectingRangeEnd",function(){if(!e.isInSelectingRange())return!1;var t=e.props,r=t.day,n=t.selectingDate,a=t.endDate;return tZ(r,t.selectsEnd?n:a)}),ti(tf(e),"isRangeStart",function(){var t=e.props,r=t.day,n=t.startDate,a=t.endDate;return!(!n||!a)&&tZ(n,r)}),ti(tf(e),"isRangeEnd",function(){var t=e.props,r=t.day,n=t.startDate,a=t.endDate;return!(!n||!a)&&tZ(a,r)}),ti(tf(e),"isWeekend",function(){var t=eE.default(e.props.day);return 0===t||6===t}),ti(tf(e),"isOutsideMonth",function(){return void 0!==e.props.month&&e.props.month!==eO.default(e.props.day)}),ti(tf(e),"getClassNames",function(t){var r=e.props.dayClassName?e.props.dayClassName(t):void 0;return ep.default("react-datepicker__day",r,"react-datepicker__day--"+t_(e.props.day,"ddd",void 0),{"react-datepicker__day--disabled":e.isDisabled(),"react-datepicker__day--excluded":e.isExcluded(),"react-datepicker__day--selected":e.isSameDay(e.props.selected),"react-datepicker__day--keyboard-selected":e.isKeyboardSelected(),"react-datepicker__day--range-start":e.isRangeStart(),"react-datepicker__day--range-end":e.isRangeEnd(),"react-datepicker__day--in-range":e.isInRange(),"react-datepicker__day--in-selecting-range":e.isInSelectingRange(),"react-datepicker__day--selecting-range-start":e.isSelectingRangeStart(),"react-datepicker__day--selecting-range-end":e.isSelectingRangeEnd(),"react-datepicker__day--today":e.isSameDay(tw()),"react-datepicker__day--weekend":e.isWeekend(),"react-datepicker__day--outside-month":e.isOutsideMonth()},e.getHighLightedClass("react-datepicker__day--highlighted"))}),ti(tf(e),"getAriaLabel",function(){var t=e.props,r=t.day,n=t.ariaLabelPrefixWhenEnabled,a=t.ariaLabelPrefixWhenDisabled,o=e.isDisabled()||e.isExcluded()?void 0===a?"Not available":a:void 0===n?"Choose":n;return"".concat(o," ").concat(t_(r,"PPPP"))}),ti(tf(e),"getTabIndex",function(t,r){var n=t||e.props.selected,a=r||e.props.preSelection;return e.isKeyboardSelected()||e.isSameDay(n)&&tZ(a,n)?0:-1}),ti(tf(e),"handleFocusDay",function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},r=!1;0===e.getTabIndex()&&!t.isInputFocused&&e.isSameDay(e.props.preSelection)&&(document.activeElement&&document.activeElement!==document.body||(r=!0),e.props.inline&&!e.props.shouldFocusDayInline&&(r=!1),e.props.containerRef&&e.props.containerRef.current&&e.props.containerRef.current.contains(document.activeElement)&&document.activeElement.classList.contains("react-datepicker__day")&&(r=!0)),r&&e.dayEl.current.focus({preventScroll:!0})}),ti(tf(e),"renderDayContents",function(){return e.isOutsideMonth()&&(e.props.monthShowsDuplicateDaysEnd&&10>eZ.default(e.props.day)||e.props.monthShowsDuplicateDaysStart&&eZ.default(e.props.day)>20)?null:e.props.renderDayContents?e.props.renderDayContents(eZ.default(e.props.day),e.props.day):eZ.default(e.props.day)}),ti(tf(e),"render",function(){return ed.default.createElement("div",{ref:e.dayEl,className:e.getClassNames(e.props.day),onKeyDown:e.handleOnKeyDown,onClick:e.handleClick,onMouseEnter:e.handleMouseEnter,tabIndex:e.getTabIndex(),"aria-label":e.getAriaLabel(),role:"button","aria-disabled":e.isDisabled()},e.renderDayContents())}),e}return to(r,[{key:"componentDidMount",value:function(){this.handleFocusDay()}},{key:"componentDidUpdate",value:function(e){this.handleFocusDay(e)}}]),r}(ed.default.Component),t8=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"handleClick",function(t){e.props.onClick&&e.props.onClick(t)}),e}return to(r,[{key:"render",value:function(){var e=this.props,t=e.weekNumber,r=e.ariaLabelPrefix,n={"react-datepicker__week-number":!0,"react-datepicker__week-number--clickable":!!e.onClick};return ed.default.createElement("div",{className:ep.default(n),"aria-label":"".concat(void 0===r?"week ":r," ").concat(this.props.weekNumber),onClick:this.handleClick},t)}}]),r}(ed.default.Component),t9=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"handleDayClick",function(t,r){e.props.onDayClick&&e.props.onDayClick(t,r)}),ti(tf(e),"handleDayMouseEnter",function(t){e.props.onDayMouseEnter&&e.props.onDayMouseEnter(t)}),ti(tf(e),"handleWeekClick",function(t,r,n){"function"==typeof e.props.onWeekSelect&&e.props.onWeekSelect(t,r,n),e.props.shouldCloseOnSelect&&e.props.setOpen(!1)}),ti(tf(e),"formatWeekNumber",function(t){var r;return e.props.formatWeekNumber?e.props.formatWeekNumber(t):(r=tN()&&tY(tN()),eM.default(t,r?{locale:r}:null))}),ti(tf(e),"renderDays",function(){var t=tx(e.props.day,e.props.locale),r=[],n=e.formatWeekNumber(t);if(e.props.showWeekNumber){var a=e.props.onWeekSelect?e.handleWeekClick.bind(tf(e),t,n):void 0;r.push(ed.default.createElement(t8,{key:"W",weekNumber:n,onClick:a,ariaLabelPrefix:e.props.ariaLabelPrefix}))}return r.concat([0,1,2,3,4,5,6].map(function(r){var n=eg.default(t,r);return ed.default.createElement(t4,{ariaLabelPrefixWhenEnabled:e.props.chooseDayAriaLabelPrefix,ariaLabelPrefixWhenDisabled:e.props.disabledDayAriaLabelPrefix,key:n.valueOf(),day:n,month:e.props.month,onClick:e.handleDayClick.bind(tf(e),n),onMouseEnter:e.handleDayMouseEnter.bind(tf(e),n),minDate:e.props.minDate,maxDate:e.props.maxDate,excludeDates:e.props.excludeDates,includeDates:e.props.includeDates,highlightDates:e.props.highlightDates,selectingDate:e.props.selectingDate,filterDate:e.props.filterDate,preSelection:e.props.preSelection,selected:e.props.selected,selectsStart:e.props.selectsStart,selectsEnd:e.props.selectsEnd,selectsRange:e.props.selectsRange,startDate:e.props.startDate,endDate:e.props.endDate,dayClassName:e.props.dayClassName,renderDayContents:e.props.renderDayContents,disabledKeyboardNavigation:e.props.disabledKeyboardNavigation,handleOnKeyDown:e.props.handleOnKeyDown,isInputFocused:e.props.isInputFocused,containerRef:e.props.containerRef,inline:e.props.inline,shouldFocusDayInline:e.props.shouldFocusDayInline,monthShowsDuplicateDaysEnd:e.props.monthShowsDuplicateDaysEnd,monthShowsDuplicateDaysStart:e.props.monthShowsDuplicateDaysStart})}))}),e}return to(r,[{key:"render",value:function(){return ed.default.createElement("div",{className:"react-datepicker__week"},this.renderDays())}}],[{key:"defaultProps",get:function(){return{shouldCloseOnSelect:!0}}}]),r}(ed.default.Component),re=function(e){tl(r,e);var t=th(r);function r(){tn(this,r);for(var e,n,a=arguments.length,o=Array(a),i=0;i<a;i++)o[i]=arguments[i];return ti(tf(e=t.call.apply(t,[this].concat(o))),"MONTH_REFS",((function(e){if(Array.isArray(e))return tm(e)})(n=Array(12))||function(e){if("undefined"!=typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(n)||function(e,t){if(e){if("string"==typeof e)return tm(e,void 0);var r=Object.prototype.toString.call(e).slice(8,-1);if("Object"===r&&e.constructor&&(r=e.constructor.name),"Map"===r||"Set"===r)return Array.from(e);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return tm(e,void 0)}}(n)||function(){throw TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()).map(function(){return ed.default.createRef()})),ti(tf(e),"isDisabled",function(t){return tF(t,e.props)}),ti(tf(e),"isExcluded",function(t){return tL(t,e.props)}),ti(tf(e),"handleDayClick",function(t,r){e.props.onDayClick&&e.props.onDayClick(t,r,e.props.orderInDisplay)}),ti(tf(e),"handleDayMouseEnter",function(t){e.props.onDayMouseEnter&&e.props.onDayMouseEnter(t)}),ti(tf(e),"handleMouseLeave",function(){e.props.onMouseLeave&&e.props.onMouseLeave()}),ti(tf(e),"isRangeStartMonth",function(t){var r=e.props,n=r.day,a=r.startDate,o=r.endDate;return!(!a||!o)&&tP(eR.default(n,t),a)}),ti(tf(e),"isRangeStartQuarter",function(t){var r=e.props,n=r.day,a=r.startDate,o=r.endDate;return!(!a||!o)&&tE(ej.default(n,t),a)}),ti(tf(e),"isRangeEndMonth",function(t){var r=e.props,n=r.day,a=r.startDate,o=r.endDate;return!(!a||!o)&&tP(eR.default(n,t),o)}),ti(tf(e),"isRangeEndQuarter",function(t){var r=e.props,n=r.day,a=r.startDate,o=r.endDate;return!(!a||!o)&&tE(ej.default(n,t),o)}),ti(tf(e),"isWeekInMonth",function(t){var r=e.props.day,n=eg.default(t,6);return tP(t,r)||tP(n,r)}),ti(tf(e),"renderWeeks",function(){for(var t=[],r=e.props.fixedHeight,n=tx(tC(e.props.day),e.props.locale),a=0,o=!1;t.push(ed.default.createElement(t9,{ariaLabelPrefix:e.props.weekAriaLabelPrefix,chooseDayAriaLabelPrefix:e.props.chooseDayAriaLabelPrefix,disabledDayAriaLabelPrefix:e.props.disabledDayAriaLabelPrefix,key:a,day:n,month:eO.default(e.props.day),onDayClick:e.handleDayClick,onDayMouseEnter:e.handleDayMouseEnter,onWeekSelect:e.props.onWeekSelect,formatWeekNumber:e.props.formatWeekNumber,locale:e.props.locale,minDate:e.props.minDate,maxDate:e.props.maxDate,excludeDates:e.props.excludeDates,includeDates:e.props.includeDates,inline:e.props.inline,shouldFocusDayInline:e.props.shouldFocusDayInline,highlightDates:e.props.highlightDates,selectingDate:e.props.selectingDate,filterDate:e.props.filterDate,preSelection:e.props.preSelection,selected:e.props.selected,selectsStart:e.props.selectsStart,selectsEnd:e.props.selectsEnd,selectsRange:e.props.selectsRange,showWeekNumber:e.props.showWeekNumbers,startDate:e.props.startDate,endDate:e.props.endDate,dayClassName:e.props.dayClassName,setOpen:e.props.setOpen,shouldCloseOnSelect:e.props.shouldCloseOnSelect,disabledKeyboardNavigation:e.props.disabledKeyboardNavigation,renderDayContents:e.props.renderDayContents,handleOnKeyDown:e.props.handleOnKeyDown,isInputFocused:e.props.isInputFocused,containerRef:e.props.containerRef,monthShowsDuplicateDaysEnd:e.props.monthShowsDuplicateDaysEnd,monthShowsDuplicateDaysStart:e.props.monthShowsDuplicateDaysStart})),!o;){a++,n=eb.default(n,1);var i=r&&a>=6,c=!r&&!e.isWeekInMonth(n);if(i||c){if(!e.props.peekNextMonth)break;o=!0}}return t}),ti(tf(e),"onMonthClick",function(t,r){e.handleDayClick(tC(eR.default(e.props.day,r)),t)}),ti(tf(e),"handleMonthNavigation",function(t,r){e.isDisabled(r)||e.isExcluded(r)||(e.props.setPreSelection(r),e.MONTH_REFS[t].current&&e.MONTH_REFS[t].current.focus())}),ti(tf(e),"onMonthKeyDown",function(t,r){var n=t.key;if(!e.props.disabledKeyboardNavigation)switch(n){case"Enter":e.onMonthClick(t,r),e.props.setPreSelection(e.props.selected);break;case"ArrowRight":e.handleMonthNavigation(11===r?0:r+1,ew.default(e.props.preSelection,1));break;case"ArrowLeft":e.handleMonthNavigation(0===r?11:r-1,ex.default(e.props.preSelection,1))}}),ti(tf(e),"onQuarterClick",function(t,r){var n;e.handleDayClick((n=ej.default(e.props.day,r),eG.default(n)),t)}),ti(tf(e),"getMonthClassNames",function(t){var r,n,a,o,i,c=e.props,s=c.day,u=c.startDate,l=c.endDate,d=c.selected,p=c.minDate,f=c.maxDate,h=c.preSelection,m=c.monthClassName,y=m?m(s):void 0;return ep.default("react-datepicker__month-text","react-datepicker__month-".concat(t),y,{"react-datepicker__month--disabled":(p||f)&&function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.maxDate,a=t.excludeDates,o=t.includeDates,i=t.filterDate;return tR(e,{minDate:r,maxDate:n})||a&&a.some(function(t){return tP(e,t)})||o&&!o.some(function(t){return tP(e,t)})||i&&!i(tw(e))||!1}(eR.default(s,t),e.props),"react-datepicker__month--selected":eO.default(s)===t&&eY.default(s)===eY.default(d),"react-datepicker__month-text--keyboard-selected":eO.default(h)===t,"react-datepicker__month--in-range":(r=eY.default(u),n=eO.default(u),a=eY.default(l),o=eO.default(l),i=eY.default(s),r===a&&r===i?n<=t&&t<=o:r<a?i===r&&n<=t||i===a&&o>=t||i<a&&i>r:void 0),"react-datepicker__month--range-start":e.isRangeStartMonth(t),"react-datepicker__month--range-end":e.isRangeEndMonth(t)})}),ti(tf(e),"getTabIndex",function(t){var r=eO.default(e.props.preSelection);return e.props.disabledKeyboardNavigation||t!==r?"-1":"0"}),ti(tf(e),"getAriaLabel",function(t){var r=e.props,n=r.ariaLabelPrefix,a=r.disabledDayAriaLabelPrefix,o=r.day,i=eR.default(o,t),c=e.isDisabled(i)||e.isExcluded(i)?void 0===a?"Not available":a:void 0===n?"Choose":n;return"".concat(c," ").concat(t_(i,"MMMM yyyy"))}),ti(tf(e),"getQuarterClassNames",function(t){var r,n,a,o,i,c=e.props,s=c.day,u=c.startDate,l=c.endDate,d=c.selected,p=c.minDate,f=c.maxDate;return ep.default("react-datepicker__quarter-text","react-datepicker__quarter-".concat(t),{"react-datepicker__quarter--disabled":(p||f)&&function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.maxDate,a=t.excludeDates,o=t.includeDates,i=t.filterDate;return tR(e,{minDate:r,maxDate:n})||a&&a.some(function(t){return tE(e,t)})||o&&!o.some(function(t){return tE(e,t)})||i&&!i(tw(e))||!1}(ej.default(s,t),e.props),"react-datepicker__quarter--selected":eN.default(s)===t&&eY.default(s)===eY.default(d),"react-datepicker__quarter--in-range":(r=eY.default(u),n=eN.default(u),a=eY.default(l),o=eN.default(l),i=eY.default(s),r===a&&r===i?n<=t&&t<=o:r<a?i===r&&n<=t||i===a&&o>=t||i<a&&i>r:void 0),"react-datepicker__quarter--range-start":e.isRangeStartQuarter(t),"react-datepicker__quarter--range-end":e.isRangeEndQuarter(t)})}),ti(tf(e),"renderMonths",function(){var t=e.props,r=t.showFullMonthYearPicker,n=t.showTwoColumnMonthYearPicker,a=t.showFourColumnMonthYearPicker,o=t.locale;return(a?[[0,1,2,3],[4,5,6,7],[8,9,10,11]]:n?[[0,1],[2,3],[4,5],[6,7],[8,9],[10,11]]:[[0,1,2],[3,4,5],[6,7,8],[9,10,11]]).map(function(t,n){return ed.default.createElement("div",{className:"react-datepicker__month-wrapper",key:n},t.map(function(t,n){return ed.default.createElement("div",{ref:e.MONTH_REFS[t],key:n,onClick:function(r){e.onMonthClick(r,t)},onKeyDown:function(r){e.onMonthKeyDown(r,t)},tabIndex:e.getTabIndex(t),className:e.getMonthClassNames(t),role:"button","aria-label":e.getAriaLabel(t)},r?tA(t,o):tI(t,o))}))})}),ti(tf(e),"renderQuarters",function(){return ed.default.createElement("div",{className:"react-datepicker__quarter-wrapper"},[1,2,3,4].map(function(t,r){var n;return ed.default.createElement("div",{key:r,onClick:function(r){e.onQuarterClick(r,t)},className:e.getQuarterClassNames(t)},(n=e.props.locale,t_(ej.default(tw(),t),"QQQ",n)))}))}),ti(tf(e),"getClassNames",function(){var t=e.props;t.day;var r=t.selectingDate,n=t.selectsStart,a=t.selectsEnd,o=t.showMonthYearPicker,i=t.showQuarterYearPicker;return ep.default("react-datepicker__month",{"react-datepicker__month--selecting-range":r&&(n||a)},{"react-datepicker__monthPicker":o},{"react-datepicker__quarterPicker":i})}),e}return to(r,[{key:"render",value:function(){var e=this.props,t=e.showMonthYearPicker,r=e.showQuarterYearPicker,n=e.day,a=e.ariaLabelPrefix;return ed.default.createElement("div",{className:this.getClassNames(),onMouseLeave:this.handleMouseLeave,"aria-label":"".concat(void 0===a?"month ":a," ").concat(t_(n,"yyyy-MM"))},t?this.renderMonths():r?this.renderQuarters():this.renderWeeks())}}]),r}(ed.default.Component),rt=function(e){tl(r,e);var t=th(r);function r(){var e;tn(this,r);for(var n=arguments.length,a=Array(n),o=0;o<n;o++)a[o]=arguments[o];return ti(tf(e=t.call.apply(t,[this].concat(a))),"state",{height:null}),ti(tf(e),"handleClick",function(t){(e.props.minTime||e.props.maxTime)&&tW(t,e.props)||(e.props.excludeTimes||e.props.includeTimes||e.props.filterTime)&&tU(t,e.props)||e.props.onChange(t)}),ti(tf(e),"liClasses",function(t,r,n){var a=["react-datepicker__time-list-item",e.props.timeClassName?e.props.timeClassName(t,r,n):void 0];return e.props.selected&&r===eP.default(t)&&n===eT.default(t)&&a.push("react-datepicker__time-list-item--selected"),((e.props.minTime||e.props.maxTime)&&tW(t,e.props)||(e.props.excludeTimes||e.props.includeTimes||e.props.filterTime)&&tU(t,e.props))&&a.push("react-datepicker__time-list-item--disabled"),e.props.injectTimes&&(60*eP.default(t)+eT.default(t))%e.props.intervals!=0&&a.push("react-datepicker__time-list-item--injected"),a.join(" ")}),ti(tf(e),"renderTimes",function(){for(var t,r=[],n=e.props.format?e.props.format:"p",a=e.props.intervals,o=(t=tw(e.props.selected),eQ.default(t)),i=1440/a,c=e.props.injectTimes&&e.props.injectTimes.sort(function(e,t){return e-t}),s=e.props.selected||e.props.openToDate||tw(),u=eP.default(s),l=eT.default(s),d=eL.default(eF.default(o,l),u),p=0;p<i;p++){var f=ey.default(o,p*a);if(r.push(f),c){var h=function(e,t,r,n,a){for(var o=a.length,i=[],c=0;c<o;c++){var s=ey.default(ev.default(e,eP.default(a[c])),eT.default(a[c])),u=ey.default(e,(r+1)*n);e7.default(s,t)&&e6.default(s,u)&&i.push(a[c])}return i}(o,f,p,a,c);r=r.concat(h)}}return r.map(function(t,r){return ed.default.createElement("li",{key:r,onClick:e.handleClick.bind(tf(e),t),className:e.liClasses(t,u,l),ref:function(r){(e6.default(t,d)||tM(t,d))&&(e.centerLi=r)},tabIndex:"0"},t_(t,n,e.props.locale))})}),e}return to(r,[{key:"componentDidMount",value:function(){this.list.scrollTop=r.calcCenterPosition(this.props.monthRef?this.props.monthRef.clientHeight-this.header.clientHeight:this.list.clientHeight,this.centerLi),this.props.monthRef&&this.header&&this.setState({height:this.props.monthRef.clientHeight-this.header.clientHeight})}},{key:"render",value:function(){var e=this,t=this.state.height;return ed.default.createElement("div",{className:"react-datepicker__time-container ".concat(this.props.todayButton?"react-datepicker__time-container--with-today-button":"")},ed.default.createElement("div",{className:"react-datepicker__header react-datepicker__header--time ".concat(this.props.showTimeSelectOnly?"react-datepicker__header--time--only":""),ref:function(t){e.header=t}},ed.default.createElement("div",{className:"react-datepicker-time__header"},this.props.timeCaption)),ed.default.createElement("div",{className:"react-datepicker__time"},ed.default.createElement("div",{className:"react-datepicker__time-box"},ed.default.createElement("ul",{className:"react-datepicker__time-list",ref:function(t){e.list=t},style:t?{height:t}:{},tabIndex:"0"},this.renderTimes()))))}}],[{key:"defaultProps",get:function(){return{intervals:30,onTimeChange:function(){},todayButton:null,timeCaption:"Time"}}}]),r}(ed.default.Component);ti(rt,"calcCenterPosition",function(e,t){return t.offsetTop-(e/2-t.clientHeight/2)});var rr=function(e){tl(r,e);var t=th(r);function r(e){var n;return tn(this,r),ti(tf(n=t.call(this,e)),"handleYearClick",function(e,t){n.props.onDayClick&&n.props.onDayClick(e,t)}),ti(tf(n),"isSameDay",function(e,t){return tZ(e,t)}),ti(tf(n),"isKeyboardSelected",function(e){var t=tS(eU.default(n.props.date,e));return!n.props.disabledKeyboardNavigation&&!n.props.inline&&!tZ(t,tS(n.props.selected))&&tZ(t,tS(n.props.preSelection))}),ti(tf(n),"onYearClick",function(e,t){var r=n.props.date;n.handleYearClick(tS(eU.default(r,t)),e)}),ti(tf(n),"getYearClassNames",function(e){var t=n.props,r=t.minDate,a=t.maxDate,o=t.selected;return ep.default("react-datepicker__year-text",{"react-datepicker__year-text--selected":e===eY.default(o),"react-datepicker__year-text--disabled":(r||a)&&function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.maxDate;return tR(new Date(e,0,1),{minDate:r,maxDate:n})||!1}(e,n.props),"react-datepicker__year-text--keyboard-selected":n.isKeyboardSelected(e),"react-datepicker__year-text--today":e===eY.default(tw())})}),n}return to(r,[{key:"render",value:function(){for(var e=this,t=[],r=this.props,n=tV(r.date,r.yearItemNumber),a=n.startPeriod,o=n.endPeriod,i=function(r){t.push(ed.default.createElement("div",{onClick:function(t){e.onYearClick(t,r)},className:e.getYearClassNames(r),key:r},r))},c=a;c<=o;c++)i(c);return ed.default.createElement("div",{className:"react-datepicker__year"},ed.default.createElement("div",{className:"react-datepicker__year-wrapper"},t))}}]),r}(ed.default.Component),rn=function(e){tl(r,e);var t=th(r);function r(e){var n;return tn(this,r),ti(tf(n=t.call(this,e)),"onTimeChange",function(e){n.setState({time:e});var t=new Date;t.setHours(e.split(":")[0]),t.setMinutes(e.split(":")[1]),n.props.onChange(t)}),ti(tf(n),"renderTimeInput",function(){var e=n.state.time,t=n.props,r=t.date,a=t.timeString,o=t.customTimeInput;return o?ed.default.cloneElement(o,{date:r,value:e,onChange:n.onTimeChange}):ed.default.createElement("input",{type:"time",className:"react-datepicker-time__input",placeholder:"Time",name:"time-input",required:!0,value:e,onChange:function(e){n.onTimeChange(e.target.value||a)}})}),n.state={time:n.props.timeString},n}return to(r,[{key:"render",value:function(){return ed.default.createElement("div",{className:"react-datepicker__input-time-container"},ed.default.createElement("div",{className:"react-datepicker-time__caption"},this.props.timeInputLabel),ed.default.createElement("div",{className:"react-datepicker-time__input-container"},ed.default.createElement("div",{className:"react-datepicker-time__input"},this.renderTimeInput())))}}],[{key:"getDerivedStateFromProps",value:function(e,t){return e.timeString!==t.time?{time:e.timeString}:null}}]),r}(ed.default.Component);function ra(e){var t=e.className,r=e.children,n=e.showPopperArrow,a=e.arrowProps;return ed.default.createElement("div",{className:t},n&&ed.default.createElement("div",tc({className:"react-datepicker__triangle"},void 0===a?{}:a)),r)}var ro=["react-datepicker__year-select","react-datepicker__month-select","react-datepicker__month-year-select"],ri=function(e){tl(r,e);var t=th(r);function r(e){var n;return tn(this,r),ti(tf(n=t.call(this,e)),"handleClickOutside",function(e){n.props.onClickOutside(e)}),ti(tf(n),"setClickOutsideRef",function(){return n.containerRef.current}),ti(tf(n),"handleDropdownFocus",function(e){(function(){var e=((arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}).className||"").split(/\s+/);return ro.some(function(t){return e.indexOf(t)>=0})})(e.target)&&n.props.onDropdownFocus()}),ti(tf(n),"getDateInView",function(){var e=n.props,t=e.preSelection,r=e.selected,a=e.openToDate,o=tQ(n.props),i=tK(n.props),c=tw();return a||r||t||(o&&e6.default(c,o)?o:i&&e7.default(c,i)?i:c)}),ti(tf(n),"increaseMonth",function(){n.setState(function(e){var t=e.date;return{date:ew.default(t,1)}},function(){return n.handleMonthChange(n.state.date)})}),ti(tf(n),"decreaseMonth",function(){n.setState(function(e){var t=e.date;return{date:ex.default(t,1)}},function(){return n.handleMonthChange(n.state.date)})}),ti(tf(n),"handleDayClick",function(e,t,r){n.props.onSelect(e,t,r),n.props.setPreSelection&&n.props.setPreSelection(e)}),ti(tf(n),"handleDayMouseEnter",function(e){n.setState({selectingDate:e}),n.props.onDayMouseEnter&&n.props.onDayMouseEnter(e)}),ti(tf(n),"handleMonthMouseLeave",function(){n.setState({selectingDate:null}),n.props.onMonthMouseLeave&&n.props.onMonthMouseLeave()}),ti(tf(n),"handleYearChange",function(e){n.props.onYearChange&&n.props.onYearChange(e),n.props.adjustDateOnChange&&(n.props.onSelect&&n.props.onSelect(e),n.props.setOpen&&n.props.setOpen(!0)),n.props.setPreSelection&&n.props.setPreSelection(e)}),ti(tf(n),"handleMonthChange",function(e){n.props.onMonthChange&&n.props.onMonthChange(e),n.props.adjustDateOnChange&&(n.props.onSelect&&n.props.onSelect(e),n.props.setOpen&&n.props.setOpen(!0)),n.props.setPreSelection&&n.props.setPreSelection(e)}),ti(tf(n),"handleMonthYearChange",function(e){n.handleYearChange(e),n.handleMonthChange(e)}),ti(tf(n),"changeYear",function(e){n.setState(function(t){var r=t.date;return{date:eU.default(r,e)}},function(){return n.handleYearChange(n.state.date)})}),ti(tf(n),"changeMonth",function(e){n.setState(function(t){var r=t.date;return{date:eR.default(r,e)}},function(){return n.handleMonthChange(n.state.date)})}),ti(tf(n),"changeMonthYear",function(e){n.setState(function(t){var r=t.date;return{date:eU.default(eR.default(r,eO.default(e)),eY.default(e))}},function(){return n.handleMonthYearChange(n.state.date)})}),ti(tf(n),"header",function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:n.state.date,t=tx(e,n.props.locale),r=[];return n.props.showWeekNumbers&&r.push(ed.default.createElement("div",{key:"W",className:"react-datepicker__day-name"},n.props.weekLabel||"#")),r.concat([0,1,2,3,4,5,6].map(function(e){var r=eg.default(t,e),a=n.formatWeekday(r,n.props.locale),o=n.props.weekDayClassName?n.props.weekDayClassName(r):void 0;return ed.default.createElement("div",{key:e,className:ep.default("react-datepicker__day-name",o)},a)}))}),ti(tf(n),"formatWeekday",function(e,t){return n.props.formatWeekDay?(0,n.props.formatWeekDay)(t_(e,"EEEE",t)):n.props.useWeekdaysShort?t_(e,"EEE",t):t_(e,"EEEEEE",t)}),ti(tf(n),"decreaseYear",function(){n.setState(function(e){var t=e.date;return{date:eC.default(t,n.props.showYearPicker?n.props.yearItemNumber:1)}},function(){return n.handleYearChange(n.state.date)})}),ti(tf(n),"renderPreviousButton",function(){if(!n.props.renderCustomHeader){var e;switch(!0){case n.props.showMonthYearPicker:e=tq(n.state.date,n.props);break;case n.props.showYearPicker:e=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.minDate,n=t.yearItemNumber,a=void 0===n?12:n,o=tV(tS(eC.default(e,a)),a).endPeriod,i=r&&eY.default(r);return i&&i>o||!1}(n.state.date,n.props);break;default:e=tH(n.state.date,n.props)}if((n.props.forceShowMonthNavigation||n.props.showDisabledMonthNavigation||!e)&&!n.props.showTimeSelectOnly){var t=["react-datepicker__navigation","react-datepicker__navigation--previous"],r=n.decreaseMonth;(n.props.showMonthYearPicker||n.props.showQuarterYearPicker||n.props.showYearPicker)&&(r=n.decreaseYear),e&&n.props.showDisabledMonthNavigation&&(t.push("react-datepicker__navigation--previous--disabled"),r=null);var a=n.props.showMonthYearPicker||n.props.showQuarterYearPicker||n.props.showYearPicker,o=n.props,i=o.previousMonthAriaLabel,c=o.previousYearAriaLabel;return ed.default.createElement("button",{type:"button",className:t.join(" "),onClick:r,"aria-label":a?void 0===c?"Previous Year":c:void 0===i?"Previous Month":i},a?n.props.previousYearButtonLabel:n.props.previousMonthButtonLabel)}}}),ti(tf(n),"increaseYear",function(){n.setState(function(e){var t=e.date;return{date:ek.default(t,n.props.showYearPicker?n.props.yearItemNumber:1)}},function(){return n.handleYearChange(n.state.date)})}),ti(tf(n),"renderNextButton",function(){if(!n.props.renderCustomHeader){var e;switch(!0){case n.props.showMonthYearPicker:e=t$(n.state.date,n.props);break;case n.props.showYearPicker:e=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=t.maxDate,n=t.yearItemNumber,a=void 0===n?12:n,o=tV(ek.default(e,a),a).startPeriod,i=r&&eY.default(r);return i&&i<o||!1}(n.state.date,n.props);break;default:e=tB(n.state.date,n.props)}if((n.props.forceShowMonthNavigation||n.props.showDisabledMonthNavigation||!e)&&!n.props.showTimeSelectOnly){var t=["react-datepicker__navigation","react-datepicker__navigation--next"];n.props.showTimeSelect&&t.push("react-datepicker__navigation--next--with-time"),n.props.todayButton&&t.push("react-datepicker__navigation--next--with-today-button");var r=n.increaseMonth;(n.props.showMonthYearPicker||n.props.showQuarterYearPicker||n.props.showYearPicker)&&(r=n.increaseYear),e&&n.props.showDisabledMonthNavigation&&(t.push("react-datepicker__navigation--next--disabled"),r=null);var a=n.props.showMonthYearPicker||n.props.showQuarterYearPicker||n.props.showYearPicker,o=n.props,i=o.nextMonthAriaLabel,c=o.nextYearAriaLabel;return ed.default.createElement("button",{type:"button",className:t.join(" "),onClick:r,"aria-label":a?void 0===c?"Next Year":c:void 0===i?"Next Month":i},a?n.props.nextYearButtonLabel:n.props.nextMonthButtonLabel)}}}),ti(tf(n),"renderCurrentMonth",function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:n.state.date,t=["react-datepicker__current-month"];return n.props.showYearDropdown&&t.push("react-datepicker__current-month--hasYearDropdown"),n.props.showMonthDropdown&&t.push("react-datepicker__current-month--hasMonthDropdown"),n.props.showMonthYearDropdown&&t.push("react-datepicker__current-month--hasMonthYearDropdown"),ed.default.createElement("div",{className:t.join(" ")},t_(e,n.props.dateFormat,n.props.locale))}),ti(tf(n),"renderYearDropdown",function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];if(n.props.showYearDropdown&&!e)return ed.default.createElement(t0,{adjustDateOnChange:n.props.adjustDateOnChange,date:n.state.date,onSelect:n.props.onSelect,setOpen:n.props.setOpen,dropdownMode:n.props.dropdownMode,onChange:n.changeYear,minDate:n.props.minDate,maxDate:n.props.maxDate,year:eY.default(n.state.date),scrollableYearDropdown:n.props.scrollableYearDropdown,yearDropdownItemNumber:n.props.yearDropdownItemNumber})}),ti(tf(n),"renderMonthDropdown",function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];if(n.props.showMonthDropdown&&!e)return ed.default.createElement(t3,{dropdownMode:n.props.dropdownMode,locale:n.props.locale,onChange:n.changeMonth,month:eO.default(n.state.date),useShortMonthInDropdown:n.props.useShortMonthInDropdown})}),ti(tf(n),"renderMonthYearDropdown",function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];if(n.props.showMonthYearDropdown&&!e)return ed.default.createElement(t5,{dropdownMode:n.props.dropdownMode,locale:n.props.locale,dateFormat:n.props.dateFormat,onChange:n.changeMonthYear,minDate:n.props.minDate,maxDate:n.props.maxDate,date:n.state.date,scrollableMonthYearDropdown:n.props.scrollableMonthYearDropdown})}),ti(tf(n),"renderTodayButton",function(){if(n.props.todayButton&&!n.props.showTimeSelectOnly)return ed.default.createElement("div",{className:"react-datepicker__today-button",onClick:function(e){return n.props.onSelect(eQ.default(tw()),e)}},n.props.todayButton)}),ti(tf(n),"renderDefaultHeader",function(e){var t=e.monthDate,r=e.i;return ed.default.createElement("div",{className:"react-datepicker__header ".concat(n.props.showTimeSelect?"react-datepicker__header--has-time-select":"")},n.renderCurrentMonth(t),ed.default.createElement("div",{className:"react-datepicker__header__dropdown react-datepicker__header__dropdown--".concat(n.props.dropdownMode),onFocus:n.handleDropdownFocus},n.renderMonthDropdown(0!==r),n.renderMonthYearDropdown(0!==r),n.renderYearDropdown(0!==r)),ed.default.createElement("div",{className:"react-datepicker__day-names"},n.header(t)))}),ti(tf(n),"renderCustomHeader",function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.monthDate,r=e.i;if(n.props.showTimeSelect&&!n.state.monthContainer||n.props.showTimeSelectOnly)return null;var a=tH(n.state.date,n.props),o=tB(n.state.date,n.props),i=tq(n.state.date,n.props),c=t$(n.state.date,n.props),s=!n.props.showMonthYearPicker&&!n.props.showQuarterYearPicker&&!n.props.showYearPicker;return ed.default.createElement("div",{className:"react-datepicker__header react-datepicker__header--custom",onFocus:n.props.onDropdownFocus},n.props.renderCustomHeader(tu(tu({},n.state),{},{customHeaderCount:r,changeMonth:n.changeMonth,changeYear:n.changeYear,decreaseMonth:n.decreaseMonth,increaseMonth:n.increaseMonth,decreaseYear:n.decreaseYear,increaseYear:n.increaseYear,prevMonthButtonDisabled:a,nextMonthButtonDisabled:o,prevYearButtonDisabled:i,nextYearButtonDisabled:c})),s&&ed.default.createElement("div",{className:"react-datepicker__day-names"},n.header(t)))}),ti(tf(n),"renderYearHeader",function(){var e=n.state.date,t=n.props,r=t.showYearPicker,a=tV(e,t.yearItemNumber),o=a.startPeriod,i=a.endPeriod;return ed.default.createElement("div",{className:"react-datepicker__header react-datepicker-year-header"},r?"".concat(o," - ").concat(i):eY.default(e))}),ti(tf(n),"renderHeader",function(e){switch(!0){case void 0!==n.props.renderCustomHeader:return n.renderCustomHeader(e);case n.props.showMonthYearPicker||n.props.showQuarterYearPicker||n.props.showYearPicker:return n.renderYearHeader(e);default:return n.renderDefaultHeader(e)}}),ti(tf(n),"renderMonths",function(){if(!n.props.showTimeSelectOnly&&!n.props.showYearPicker){for(var e=[],t=n.props.showPreviousMonths?n.props.monthsShown-1:0,r=ex.default(n.state.date,t),a=0;a<n.props.monthsShown;++a){var o=a-n.props.monthSelectedIn,i=ew.default(r,o),c="month-".concat(a),s=a<n.props.monthsShown-1,u=a>0;e.push(ed.default.createElement("div",{key:c,ref:function(e){n.monthContainer=e},className:"react-datepicker__month-container"},n.renderHeader({monthDate:i,i:a}),ed.default.createElement(re,{chooseDayAriaLabelPrefix:n.props.chooseDayAriaLabelPrefix,disabledDayAriaLabelPrefix:n.props.disabledDayAriaLabelPrefix,weekAriaLabelPrefix:n.props.weekAriaLabelPrefix,onChange:n.changeMonthYear,day:i,dayClassName:n.props.dayClassName,monthClassName:n.props.monthClassName,onDayClick:n.handleDayClick,handleOnKeyDown:n.props.handleOnKeyDown,onDayMouseEnter:n.handleDayMouseEnter,onMouseLeave:n.handleMonthMouseLeave,onWeekSelect:n.props.onWeekSelect,orderInDisplay:a,formatWeekNumber:n.props.formatWeekNumber,locale:n.props.locale,minDate:n.props.minDate,maxDate:n.props.maxDate,excludeDates:n.props.excludeDates,highlightDates:n.props.highlightDates,selectingDate:n.state.selectingDate,includeDates:n.props.includeDates,inline:n.props.inline,shouldFocusDayInline:n.props.shouldFocusDayInline,fixedHeight:n.props.fixedHeight,filterDate:n.props.filterDate,preSelection:n.props.preSelection,setPreSelection:n.props.setPreSelection,selected:n.props.selected,selectsStart:n.props.selectsStart,selectsEnd:n.props.selectsEnd,selectsRange:n.props.selectsRange,showWeekNumbers:n.props.showWeekNumbers,startDate:n.props.startDate,endDate:n.props.endDate,peekNextMonth:n.props.peekNextMonth,setOpen:n.props.setOpen,shouldCloseOnSelect:n.props.shouldCloseOnSelect,renderDayContents:n.props.renderDayContents,disabledKeyboardNavigation:n.props.disabledKeyboardNavigation,showMonthYearPicker:n.props.showMonthYearPicker,showFullMonthYearPicker:n.props.showFullMonthYearPicker,showTwoColumnMonthYearPicker:n.props.showTwoColumnMonthYearPicker,showFourColumnMonthYearPicker:n.props.showFourColumnMonthYearPicker,showYearPicker:n.props.showYearPicker,showQuarterYearPicker:n.props.showQuarterYearPicker,isInputFocused:n.props.isInputFocused,containerRef:n.containerRef,monthShowsDuplicateDaysEnd:s,monthShowsDuplicateDaysStart:u})))}return e}}),ti(tf(n),"renderYears",function(){if(!n.props.showTimeSelectOnly)return n.props.showYearPicker?ed.default.createElement("div",{className:"react-datepicker__year--container"},n.renderHeader(),ed.default.createElement(rr,tc({onDayClick:n.handleDayClick,date:n.state.date},n.props))):void 0}),ti(tf(n),"renderTimeSection",function(){if(n.props.showTimeSelect&&(n.state.monthContainer||n.props.showTimeSelectOnly))return ed.default.createElement(rt,{selected:n.props.selected,openToDate:n.props.openToDate,onChange:n.props.onTimeChange,timeClassName:n.props.timeClassName,format:n.props.timeFormat,includeTimes:n.props.includeTimes,intervals:n.props.timeIntervals,minTime:n.props.minTime,maxTime:n.props.maxTime,excludeTimes:n.props.excludeTimes,filterTime:n.props.filterTime,timeCaption:n.props.timeCaption,todayButton:n.props.todayButton,showMonthDropdown:n.props.showMonthDropdown,showMonthYearDropdown:n.props.showMonthYearDropdown,showYearDropdown:n.props.showYearDropdown,withPortal:n.props.withPortal,monthRef:n.state.monthContainer,injectTimes:n.props.injectTimes,locale:n.props.locale,showTimeSelectOnly:n.props.showTimeSelectOnly})}),ti(tf(n),"renderInputTimeSection",function(){var e=new Date(n.props.selected),t=tk(e)&&n.props.selected?"".concat(tG(e.getHours()),":").concat(tG(e.getMinutes())):"";if(n.props.showTimeInput)return ed.default.createElement(rn,{date:e,timeString:t,timeInputLabel:n.props.timeInputLabel,onChange:n.props.onTimeChange,customTimeInput:n.props.customTimeInput})}),n.containerRef=ed.default.createRef(),n.state={date:n.getDateInView(),selectingDate:null,monthContainer:null},n}return to(r,[{key:"componentDidMount",value:function(){this.props.showTimeSelect&&(this.assignMonthContainer=void this.setState({monthContainer:this.monthContainer}))}},{key:"componentDidUpdate",value:function(e){this.props.preSelection&&!tZ(this.props.preSelection,e.preSelection)?this.setState({date:this.props.preSelection}):this.props.openToDate&&!tZ(this.props.openToDate,e.openToDate)&&this.setState({date:this.props.openToDate})}},{key:"render",value:function(){var e=this.props.container||ra;return ed.default.createElement("div",{ref:this.containerRef},ed.default.createElement(e,{className:ep.default("react-datepicker",this.props.className,{"react-datepicker--time-only":this.props.showTimeSelectOnly}),showPopperArrow:this.props.showPopperArrow,arrowProps:this.props.arrowProps},this.renderPreviousButton(),this.renderNextButton(),this.renderMonths(),this.renderYears(),this.renderTodayButton(),this.renderTimeSection(),this.renderInputTimeSection(),this.props.children))}}],[{key:"defaultProps",get:function(){return{onDropdownFocus:function(){},monthsShown:1,monthSelectedIn:0,forceShowMonthNavigation:!1,timeCaption:"Time",previousYearButtonLabel:"Previous Year",nextYearButtonLabel:"Next Year",previousMonthButtonLabel:"Previous Month",nextMonthButtonLabel:"Next Month",customTimeInput:null,yearItemNumber:12}}}]),r}(ed.default.Component),rc=function(e){return!e.disabled&&-1!==e.tabIndex},rs=function(e){tl(r,e);var t=th(r);function r(e){var n;return tn(this,r),ti(tf(n=t.call(this,e)),"getTabChildren",function(){return Array.prototype.slice.call(n.tabLoopRef.current.querySelectorAll("[tabindex], a, button, input, select, textarea"),1,-1).filter(rc)}),ti(tf(n),"handleFocusStart",function(e){var t=n.getTabChildren();t&&t.length>1&&t[t.length-1].focus()}),ti(tf(n),"handleFocusEnd",function(e){var t=n.getTabChildren();t&&t.length>1&&t[0].focus()}),n.tabLoopRef=ed.default.createRef(),n}return to(r,[{key:"render",value:function(){return this.props.enableTabLoop?ed.default.createElement("div",{className:"react-datepicker__tab-loop",ref:this.tabLoopRef},ed.default.createElement("div",{className:"react-datepicker__tab-loop__start",tabIndex:"0",onFocus:this.handleFocusStart}),this.props.children,ed.default.createElement("div",{className:"react-datepicker__tab-loop__end",tabIndex:"0",onFocus:this.handleFocusEnd})):this.props.children}}],[{key:"defaultProps",get:function(){return{enableTabLoop:!0}}}]),r}(ed.default.Component),ru=function(e){tl(r,e);var t=th(r);function r(e){var n;return tn(this,r),(n=t.call(this,e)).el=document.createElement("div"),n}return to(r,[{key:"componentDidMount",value:function(){this.portalRoot=document.getElementById(this.props.portalId),this.portalRoot||(this.portalRoot=document.createElement("div"),this.portalRoot.setAttribute("id",this.props.portalId),document.body.appendChild(this.portalRoot)),this.portalRoot.appendChild(this.el)}},{key:"componentWillUnmount",value:function(){this.portalRoot.removeChild(this.el)}},{key:"render",value:function(){return tt.default.createPortal(this.props.children,this.el)}}]),r}(ed.default.Component),rl=function(e){tl(r,e);var t=th(r);function r(){return tn(this,r),t.apply(this,arguments)}return to(r,[{key:"render",value:function(){var e,t=this.props,r=t.className,n=t.wrapperClassName,a=t.hidePopper,o=t.popperComponent,i=t.popperModifiers,c=t.popperPlacement,s=t.popperProps,u=t.targetComponent,l=t.enableTabLoop,d=t.popperOnKeyDown,p=t.portalId;if(!a){var f=ep.default("react-datepicker-popper",r);e=ed.default.createElement(es.Popper,tc({modifiers:i,placement:c},s),function(e){var t=e.ref,r=e.style,n=e.placement,a=e.arrowProps;return ed.default.createElement(rs,{enableTabLoop:l},ed.default.createElement("div",{ref:t,style:r,className:f,"data-placement":n,onKeyDown:d},ed.default.cloneElement(o,{arrowProps:a})))})}this.props.popperContainer&&(e=ed.default.createElement(this.props.popperContainer,{},e)),p&&!a&&(e=ed.default.createElement(ru,{portalId:p},e));var h=ep.default("react-datepicker-wrapper",n);return ed.default.createElement(es.Manager,{className:"react-datepicker-manager"},ed.default.createElement(es.Reference,null,function(e){var t=e.ref;return ed.default.createElement("div",{ref:t,className:h},u)}),e)}}],[{key:"defaultProps",get:function(){return{hidePopper:!0,popperModifiers:{preventOverflow:{enabled:!0,escapeWithReference:!0,boundariesElement:"viewport"}},popperProps:{},popperPlacement:"bottom-start"}}}]),r}(ed.default.Component),rd="react-datepicker-ignore-onclickoutside",rp=te.default(ri),rf="Date input not valid.",rh=function(e){tl(r,e);var t=th(r);function r(e){var n;return tn(this,r),ti(tf(n=t.call(this,e)),"getPreSelection",function(){return n.props.openToDate?n.props.openToDate:n.props.selectsEnd&&n.props.startDate?n.props.startDate:n.props.selectsStart&&n.props.endDate?n.props.endDate:tw()}),ti(tf(n),"calcInitialState",function(){var e=n.getPreSelection(),t=tQ(n.props),r=tK(n.props),a=t&&e6.default(e,eQ.default(t))?t:r&&e7.default(e,eX.default(r))?r:e;return{open:n.props.startOpen||!1,preventFocus:!1,preSelection:n.props.selected?n.props.selected:a,highlightDates:tz(n.props.highlightDates),focused:!1,shouldFocusDayInline:!1}}),ti(tf(n),"clearPreventFocusTimeout",function(){n.preventFocusTimeout&&clearTimeout(n.preventFocusTimeout)}),ti(tf(n),"setFocus",function(){n.input&&n.input.focus&&n.input.focus({preventScroll:!0})}),ti(tf(n),"setBlur",function(){n.input&&n.input.blur&&n.input.blur(),n.cancelFocusInput()}),ti(tf(n),"setOpen",function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];n.setState({open:e,preSelection:e&&n.state.open?n.state.preSelection:n.calcInitialState().preSelection,lastPreSelectChange:ry},function(){e||n.setState(function(e){return{focused:!!t&&e.focused}},function(){t||n.setBlur(),n.setState({inputValue:null})})})}),ti(tf(n),"inputOk",function(){return ef.default(n.state.preSelection)}),ti(tf(n),"isCalendarOpen",function(){return void 0===n.props.open?n.state.open&&!n.props.disabled&&!n.props.readOnly:n.props.open}),ti(tf(n),"handleFocus",function(e){n.state.preventFocus||(n.props.onFocus(e),n.props.preventOpenOnFocus||n.props.readOnly||n.setOpen(!0)),n.setState({focused:!0})}),ti(tf(n),"cancelFocusInput",function(){clearTimeout(n.inputFocusTimeout),n.inputFocusTimeout=null}),ti(tf(n),"deferFocusInput",function(){n.cancelFocusInput(),n.inputFocusTimeout=setTimeout(function(){return n.setFocus()},1)}),ti(tf(n),"handleDropdownFocus",function(){n.cancelFocusInput()}),ti(tf(n),"handleBlur",function(e){(!n.state.open||n.props.withPortal||n.props.showTimeInput)&&n.props.onBlur(e),n.setState({focused:!1})}),ti(tf(n),"handleCalendarClickOutside",function(e){n.props.inline||n.setOpen(!1),n.props.onClickOutside(e),n.props.withPortal&&e.preventDefault()}),ti(tf(n),"handleChange",function(){for(var e=arguments.length,t=Array(e),r=0;r<e;r++)t[r]=arguments[r];var a=t[0];if(!n.props.onChangeRaw||(n.props.onChangeRaw.apply(tf(n),t),"function"==typeof a.isDefaultPrevented&&!a.isDefaultPrevented())){n.setState({inputValue:a.target.value,lastPreSelectChange:rm});var o,i,c,s,u,l,d,p=(o=a.target.value,i=n.props.dateFormat,c=n.props.locale,s=n.props.strictParsing,u=null,l=tY(c)||tY(tN()),d=!0,Array.isArray(i)?(i.forEach(function(e){var t=e8.default(o,e,new Date,{locale:l});s&&(d=tk(t)&&o===em.default(t,e,{awareOfUnicodeTokens:!0})),tk(t)&&d&&(u=t)}),u):(u=e8.default(o,i,new Date,{locale:l}),s?d=tk(u)&&o===em.default(u,i,{awareOfUnicodeTokens:!0}):tk(u)||(i=i.match(tb).map(function(e){var t=e[0];return"p"===t||"P"===t?l?(0,tg[t])(e,l.formatLong):t:e}).join(""),o.length>0&&(u=e8.default(o,i.slice(0,o.length),new Date)),tk(u)||(u=new Date(o))),tk(u)&&d?u:null));!p&&a.target.value||n.setSelected(p,a,!0)}}),ti(tf(n),"handleSelect",function(e,t,r){n.setState({preventFocus:!0},function(){return n.preventFocusTimeout=setTimeout(function(){return n.setState({preventFocus:!1})},50),n.preventFocusTimeout}),n.props.onChangeRaw&&n.props.onChangeRaw(t),n.setSelected(e,t,!1,r),!n.props.shouldCloseOnSelect||n.props.showTimeSelect?n.setPreSelection(e):n.props.inline||n.setOpen(!1)}),ti(tf(n),"setSelected",function(e,t,r,a){var o=e;if(null===o||!tF(o,n.props)){var i=n.props,c=i.onChange,s=i.selectsRange,u=i.startDate,l=i.endDate;if(!tM(n.props.selected,o)||n.props.allowSameDay||s){if(null!==o&&(!n.props.selected||r&&(n.props.showTimeSelect||n.props.showTimeSelectOnly||n.props.showTimeInput)||(o=tD(o,{hour:eP.default(n.props.selected),minute:eT.default(n.props.selected),second:eS.default(n.props.selected)})),n.props.inline||n.setState({preSelection:o}),n.props.focusSelectedMonth||n.setState({monthSelectedIn:a})),s){var d=u&&!l,p=u&&l;u||l?d&&c(e6.default(o,u)?[o,null]:[u,o],t):c([o,null],t),p&&c([o,null],t)}else c(o,t)}r||(n.props.onSelect(o,t),n.setState({inputValue:null}))}}),ti(tf(n),"setPreSelection",function(e){var t=void 0!==n.props.minDate,r=void 0!==n.props.maxDate,a=!0;if(e){var o=eQ.default(e);if(t&&r)a=tO(e,n.props.minDate,n.props.maxDate);else if(t){var i=eQ.default(n.props.minDate);a=e7.default(e,i)||tM(o,i)}else if(r){var c=eX.default(n.props.maxDate);a=e6.default(e,c)||tM(o,c)}}a&&n.setState({preSelection:e})}),ti(tf(n),"handleTimeChange",function(e){var t=tD(n.props.selected?n.props.selected:n.getPreSelection(),{hour:eP.default(e),minute:eT.default(e)});n.setState({preSelection:t}),n.props.onChange(t),n.props.shouldCloseOnSelect&&n.setOpen(!1),n.props.showTimeInput&&n.setOpen(!0),n.setState({inputValue:null})}),ti(tf(n),"onInputClick",function(){n.props.disabled||n.props.readOnly||n.setOpen(!0),n.props.onInputClick()}),ti(tf(n),"onInputKeyDown",function(e){n.props.onKeyDown(e);var t=e.key;if(n.state.open||n.props.inline||n.props.preventOpenOnFocus){if(n.state.open){if("ArrowDown"===t||"ArrowUp"===t){e.preventDefault();var r=n.calendar.componentNode&&n.calendar.componentNode.querySelector('.react-datepicker__day[tabindex="0"]');return void(r&&r.focus({preventScroll:!0}))}var a=tw(n.state.preSelection);"Enter"===t?(e.preventDefault(),n.inputOk()&&n.state.lastPreSelectChange===ry?(n.handleSelect(a,e),n.props.shouldCloseOnSelect||n.setPreSelection(a)):n.setOpen(!1)):"Escape"===t&&(e.preventDefault(),n.setOpen(!1)),n.inputOk()||n.props.onInputError({code:1,msg:rf})}}else"ArrowDown"!==t&&"ArrowUp"!==t&&"Enter"!==t||n.onInputClick()}),ti(tf(n),"onDayKeyDown",function(e){n.props.onKeyDown(e);var t,r=e.key,a=tw(n.state.preSelection);if("Enter"===r)e.preventDefault(),n.handleSelect(a,e),n.props.shouldCloseOnSelect||n.setPreSelection(a);else if("Escape"===r)e.preventDefault(),n.setOpen(!1),n.inputOk()||n.props.onInputError({code:1,msg:rf});else if(!n.props.disabledKeyboardNavigation){switch(r){case"ArrowLeft":t=e_.default(a,1);break;case"ArrowRight":t=eg.default(a,1);break;case"ArrowUp":t=eD.default(a,1);break;case"ArrowDown":t=eb.default(a,1);break;case"PageUp":t=ex.default(a,1);break;case"PageDown":t=ew.default(a,1);break;case"Home":t=eC.default(a,1);break;case"End":t=ek.default(a,1)}if(!t)return void(n.props.onInputError&&n.props.onInputError({code:1,msg:rf}));if(e.preventDefault(),n.setState({lastPreSelectChange:ry}),n.props.adjustDateOnChange&&n.setSelected(t),n.setPreSelection(t),n.props.inline){var o=eO.default(a),i=eO.default(t),c=eY.default(a),s=eY.default(t);o!==i||c!==s?n.setState({shouldFocusDayInline:!0}):n.setState({shouldFocusDayInline:!1})}}}),ti(tf(n),"onPopperKeyDown",function(e){"Escape"===e.key&&(e.preventDefault(),n.setState({preventFocus:!0},function(){n.setOpen(!1),setTimeout(function(){n.setFocus(),n.setState({preventFocus:!1})})}))}),ti(tf(n),"onClearClick",function(e){e&&e.preventDefault&&e.preventDefault(),n.props.onChange(null,e),n.setState({inputValue:null})}),ti(tf(n),"clear",function(){n.onClearClick()}),ti(tf(n),"onScroll",function(e){"boolean"==typeof n.props.closeOnScroll&&n.props.closeOnScroll?e.target!==document&&e.target!==document.documentElement&&e.target!==document.body||n.setOpen(!1):"function"==typeof n.props.closeOnScroll&&n.props.closeOnScroll(e)&&n.setOpen(!1)}),ti(tf(n),"renderCalendar",function(){return n.props.inline||n.isCalendarOpen()?ed.default.createElement(rp,{ref:function(e){n.calendar=e},locale:n.props.locale,chooseDayAriaLabelPrefix:n.props.chooseDayAriaLabelPrefix,disabledDayAriaLabelPrefix:n.props.disabledDayAriaLabelPrefix,weekAriaLabelPrefix:n.props.weekAriaLabelPrefix,adjustDateOnChange:n.props.adjustDateOnChange,setOpen:n.setOpen,shouldCloseOnSelect:n.props.shouldCloseOnSelect,dateFormat:n.props.dateFormatCalendar,useWeekdaysShort:n.props.useWeekdaysShort,formatWeekDay:n.props.formatWeekDay,dropdownMode:n.props.dropdownMode,selected:n.props.selected,preSelection:n.state.preSelection,onSelect:n.handleSelect,onWeekSelect:n.props.onWeekSelect,openToDate:n.props.openToDate,minDate:n.props.minDate,maxDate:n.props.maxDate,selectsStart:n.props.selectsStart,selectsEnd:n.props.selectsEnd,selectsRange:n.props.selectsRange,startDate:n.props.startDate,endDate:n.props.endDate,excludeDates:n.props.excludeDates,filterDate:n.props.filterDate,onClickOutside:n.handleCalendarClickOutside,formatWeekNumber:n.props.formatWeekNumber,highlightDates:n.state.highlightDates,includeDates:n.props.includeDates,includeTimes:n.props.includeTimes,injectTimes:n.props.injectTimes,inline:n.props.inline,shouldFocusDayInline:n.state.shouldFocusDayInline,peekNextMonth:n.props.peekNextMonth,showMonthDropdown:n.props.showMonthDropdown,showPreviousMonths:n.props.showPreviousMonths,useShortMonthInDropdown:n.props.useShortMonthInDropdown,showMonthYearDropdown:n.props.showMonthYearDropdown,showWeekNumbers:n.props.showWeekNumbers,showYearDropdown:n.props.showYearDropdown,withPortal:n.props.withPortal,forceShowMonthNavigation:n.props.forceShowMonthNavigation,showDisabledMonthNavigation:n.props.showDisabledMonthNavigation,scrollableYearDropdown:n.props.scrollableYearDropdown,scrollableMonthYearDropdown:n.props.scrollableMonthYearDropdown,todayButton:n.props.todayButton,weekLabel:n.props.weekLabel,outsideClickIgnoreClass:rd,fixedHeight:n.props.fixedHeight,monthsShown:n.props.monthsShown,monthSelectedIn:n.state.monthSelectedIn,onDropdownFocus:n.handleDropdownFocus,onMonthChange:n.props.onMonthChange,onYearChange:n.props.onYearChange,dayClassName:n.props.dayClassName,weekDayClassName:n.props.weekDayClassName,monthClassName:n.props.monthClassName,timeClassName:n.props.timeClassName,showTimeSelect:n.props.showTimeSelect,showTimeSelectOnly:n.props.showTimeSelectOnly,onTimeChange:n.handleTimeChange,timeFormat:n.props.timeFormat,timeIntervals:n.props.timeIntervals,minTime:n.props.minTime,maxTime:n.props.maxTime,excludeTimes:n.props.excludeTimes,filterTime:n.props.filterTime,timeCaption:n.props.timeCaption,className:n.props.calendarClassName,container:n.props.calendarContainer,yearItemNumber:n.props.yearItemNumber,yearDropdownItemNumber:n.props.yearDropdownItemNumber,previousMonthButtonLabel:n.props.previousMonthButtonLabel,nextMonthButtonLabel:n.props.nextMonthButtonLabel,previousYearButtonLabel:n.props.previousYearButtonLabel,nextYearButtonLabel:n.props.nextYearButtonLabel,timeInputLabel:n.props.timeInputLabel,disabledKeyboardNavigation:n.props.disabledKeyboardNavigation,renderCustomHeader:n.props.renderCustomHeader,popperProps:n.props.popperProps,renderDayContents:n.props.renderDayContents,onDayMouseEnter:n.props.onDayMouseEnter,onMonthMouseLeave:n.props.onMonthMouseLeave,showTimeInput:n.props.showTimeInput,showMonthYearPicker:n.props.showMonthYearPicker,showFullMonthYearPicker:n.props.showFullMonthYearPicker,showTwoColumnMonthYearPicker:n.props.showTwoColumnMonthYearPicker,showFourColumnMonthYearPicker:n.props.showFourColumnMonthYearPicker,showYearPicker:n.props.showYearPicker,showQuarterYearPicker:n.props.showQuarterYearPicker,showPopperArrow:n.props.showPopperArrow,excludeScrollbar:n.props.excludeScrollbar,handleOnKeyDown:n.onDayKeyDown,isInputFocused:n.state.focused,customTimeInput:n.props.customTimeInput,setPreSelection:n.setPreSelection},n.props.children):null}),ti(tf(n),"renderDateInput",function(){var e,t,r,a,o,i=ep.default(n.props.className,ti({},rd,n.state.open)),c=n.props.customInput||ed.default.createElement("input",{type:"text"}),s=n.props.customInputRef||"ref",u="string"==typeof n.props.value?n.props.value:"string"==typeof n.state.inputValue?n.state.inputValue:(t=n.props.selected,a=(r=n.props).dateFormat,o=r.locale,t&&t_(t,Array.isArray(a)?a[0]:a,o)||"");return ed.default.cloneElement(c,(ti(e={},s,function(e){n.input=e}),ti(e,"value",u),ti(e,"onBlur",n.handleBlur),ti(e,"onChange",n.handleChange),ti(e,"onClick",n.onInputClick),ti(e,"onFocus",n.handleFocus),ti(e,"onKeyDown",n.onInputKeyDown),ti(e,"id",n.props.id),ti(e,"name",n.props.name),ti(e,"autoFocus",n.props.autoFocus),ti(e,"placeholder",n.props.placeholderText),ti(e,"disabled",n.props.disabled),ti(e,"autoComplete",n.props.autoComplete),ti(e,"className",ep.default(c.props.className,i)),ti(e,"title",n.props.title),ti(e,"readOnly",n.props.readOnly),ti(e,"required",n.props.required),ti(e,"tabIndex",n.props.tabIndex),ti(e,"aria-describedby",n.props.ariaDescribedBy),ti(e,"aria-invalid",n.props.ariaInvalid),ti(e,"aria-labelledby",n.props.ariaLabelledBy),ti(e,"aria-required",n.props.ariaRequired),e))}),ti(tf(n),"renderClearButton",function(){var e=n.props,t=e.isClearable,r=e.selected,a=e.clearButtonTitle,o=e.clearButtonClassName,i=e.ariaLabelClose;return t&&null!=r?ed.default.createElement("button",{type:"button",className:"react-datepicker__close-icon ".concat(o),"aria-label":void 0===i?"Close":i,onClick:n.onClearClick,title:a,tabIndex:-1}):null}),n.state=n.calcInitialState(),n}return to(r,[{key:"componentDidMount",value:function(){window.addEventListener("scroll",this.onScroll,!0)}},{key:"componentDidUpdate",value:function(e,t){var r,n;e.inline&&(r=e.selected,n=this.props.selected,r&&n?eO.default(r)!==eO.default(n)||eY.default(r)!==eY.default(n):r!==n)&&this.setPreSelection(this.props.selected),void 0!==this.state.monthSelectedIn&&e.monthsShown!==this.props.monthsShown&&this.setState({monthSelectedIn:0}),e.highlightDates!==this.props.highlightDates&&this.setState({highlightDates:tz(this.props.highlightDates)}),t.focused||tM(e.selected,this.props.selected)||this.setState({inputValue:null}),t.open!==this.state.open&&(!1===t.open&&!0===this.state.open&&this.props.onCalendarOpen(),!0===t.open&&!1===this.state.open&&this.props.onCalendarClose())}},{key:"componentWillUnmount",value:function(){this.clearPreventFocusTimeout(),window.removeEventListener("scroll",this.onScroll,!0)}},{key:"render",value:function(){var e=this.renderCalendar();return this.props.inline&&!this.props.withPortal?e:this.props.withPortal?ed.default.createElement("div",null,this.props.inline?null:ed.default.createElement("div",{className:"react-datepicker__input-container"},this.renderDateInput(),this.renderClearButton()),this.state.open||this.props.inline?ed.default.createElement("div",{className:"react-datepicker__portal"},e):null):ed.default.createElement(rl,{className:this.props.popperClassName,wrapperClassName:this.props.wrapperClassName,hidePopper:!this.isCalendarOpen(),portalId:this.props.portalId,popperModifiers:this.props.popperModifiers,targetComponent:ed.default.createElement("div",{className:"react-datepicker__input-container"},this.renderDateInput(),this.renderClearButton()),popperContainer:this.props.popperContainer,popperComponent:e,popperPlacement:this.props.popperPlacement,popperProps:this.props.popperProps,popperOnKeyDown:this.onPopperKeyDown,enableTabLoop:this.props.enableTabLoop})}}],[{key:"defaultProps",get:function(){return{allowSameDay:!1,dateFormat:"MM/dd/yyyy",dateFormatCalendar:"LLLL yyyy",onChange:function(){},disabled:!1,disabledKeyboardNavigation:!1,dropdownMode:"scroll",onFocus:function(){},onBlur:function(){},onKeyDown:function(){},onInputClick:function(){},onSelect:function(){},onClickOutside:function(){},onMonthChange:function(){},onCalendarOpen:function(){},onCalendarClose:function(){},preventOpenOnFocus:!1,onYearChange:function(){},onInputError:function(){},monthsShown:1,readOnly:!1,withPortal:!1,shouldCloseOnSelect:!0,showTimeSelect:!1,showTimeInput:!1,showPreviousMonths:!1,showMonthYearPicker:!1,showFullMonthYearPicker:!1,showTwoColumnMonthYearPicker:!1,showFourColumnMonthYearPicker:!1,showYearPicker:!1,showQuarterYearPicker:!1,strictParsing:!1,timeIntervals:30,timeCaption:"Time",previousMonthButtonLabel:"Previous Month",nextMonthButtonLabel:"Next Month",previousYearButtonLabel:"Previous Year",nextYearButtonLabel:"Next Year",timeInputLabel:"Time",enableTabLoop:!0,yearItemNumber:12,renderDayContents:function(e){return e},focusSelectedMonth:!1,showPopperArrow:!0,excludeScrollbar:!0,customTimeInput:null}}}]),r}(ed.default.Component),rm="input",ry="navigate";e.CalendarContainer=ra,e.default=rh,e.getDefaultLocale=tN,e.registerLocale=function(e,t){var n="undefined"!=typeof window?window:r.g;n.__localeData__||(n.__localeData__={}),n.__localeData__[e]=t},e.setDefaultLocale=function(e){("undefined"!=typeof window?window:r.g).__localeId__=e},Object.defineProperty(e,"__esModule",{value:!0})}(t,r(67294),r(45697),r(93967),r(82522),r(11204),r(98276),r(60218),r(25832),r(84153),r(76755),r(90579),r(41609),r(42835),r(70826),r(25353),r(19762),r(36048),r(83321),r(47653),r(3788),r(78074),r(65178),r(93929),r(76183),r(68496),r(10855),r(71065),r(84561),r(97567),r(62310),r(91679),r(2682),r(12520),r(7452),r(16640),r(60030),r(59061),r(31961),r(91315),r(4061),r(13065),r(74982),r(31816),r(87573),r(58328),r(74113),r(70633),r(27076),r(68897),r(82107),r(74463),r(56610),r(69329),r(7550),r(56885),r(69175),r(27760),r(71835),r(38814),r(58949),r(37004),r(73935))},58949:function(e,t,r){"use strict";r.r(t),r.d(t,{IGNORE_CLASS_NAME:function(){return h}});var n,a,o=r(67294),i=r(73935);function c(e,t){return(c=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}function s(e){if(void 0===e)throw ReferenceError("this hasn't been initialised - super() hasn't been called");return e}var u=function(){if("undefined"!=typeof window&&"function"==typeof window.addEventListener){var e=!1,t=Object.defineProperty({},"passive",{get:function(){e=!0}}),r=function(){};return window.addEventListener("testPassiveEventSupport",r,t),window.removeEventListener("testPassiveEventSupport",r,t),e}},l=(void 0===n&&(n=0),function(){return++n}),d={},p={},f=["touchstart","touchmove"],h="ignore-react-onclickoutside";function m(e,t){var r={};return -1!==f.indexOf(t)&&a&&(r.passive=!e.props.preventDefault),r}t.default=function(e,t){var r,n,f=e.displayName||e.name||"Component";return n=r=function(r){function n(e){var n;return(n=r.call(this,e)||this).__outsideClickHandler=function(e){if("function"==typeof n.__clickOutsideHandlerProp){n.__clickOutsideHandlerProp(e);return}var t=n.getInstance();if("function"==typeof t.props.handleClickOutside){t.props.handleClickOutside(e);return}if("function"==typeof t.handleClickOutside){t.handleClickOutside(e);return}throw Error("WrappedComponent: "+f+" lacks a handleClickOutside(event) function for processing outside click events.")},n.__getComponentNode=function(){var e=n.getInstance();return t&&"function"==typeof t.setClickOutsideRef?t.setClickOutsideRef()(e):"function"==typeof e.setClickOutsideRef?e.setClickOutsideRef():(0,i.findDOMNode)(e)},n.enableOnClickOutside=function(){if("undefined"!=typeof document&&!p[n._uid]){void 0===a&&(a=u()),p[n._uid]=!0;var e=n.props.eventTypes;e.forEach||(e=[e]),d[n._uid]=function(e){null!==n.componentNode&&!(n.initTimeStamp>e.timeStamp)&&(n.props.preventDefault&&e.preventDefault(),n.props.stopPropagation&&e.stopPropagation(),!(n.props.excludeScrollbar&&(document.documentElement.clientWidth<=e.clientX||document.documentElement.clientHeight<=e.clientY)))&&function(e,t,r){if(e===t)return!0;for(;e.parentNode||e.host;){var n;if(e.parentNode&&((n=e)===t||(n.correspondingElement?n.correspondingElement.classList.contains(r):n.classList.contains(r))))return!0;e=e.parentNode||e.host}return e}(e.composed&&e.composedPath&&e.composedPath().shift()||e.target,n.componentNode,n.props.outsideClickIgnoreClass)===document&&n.__outsideClickHandler(e)},e.forEach(function(e){document.addEventListener(e,d[n._uid],m(s(n),e))})}},n.disableOnClickOutside=function(){delete p[n._uid];var e=d[n._uid];if(e&&"undefined"!=typeof document){var t=n.props.eventTypes;t.forEach||(t=[t]),t.forEach(function(t){return document.removeEventListener(t,e,m(s(n),t))}),delete d[n._uid]}},n.getRef=function(e){return n.instanceRef=e},n._uid=l(),n.initTimeStamp=performance.now(),n}n.prototype=Object.create(r.prototype),n.prototype.constructor=n,c(n,r);var h=n.prototype;return h.getInstance=function(){if(e.prototype&&!e.prototype.isReactComponent)return this;var t=this.instanceRef;return t.getInstance?t.getInstance():t},h.componentDidMount=function(){if("undefined"!=typeof document&&document.createElement){var e=this.getInstance();if(t&&"function"==typeof t.handleClickOutside&&(this.__clickOutsideHandlerProp=t.handleClickOutside(e),"function"!=typeof this.__clickOutsideHandlerProp))throw Error("WrappedComponent: "+f+" lacks a function for processing outside click events specified by the handleClickOutside config option.");this.componentNode=this.__getComponentNode(),this.props.disableOnClickOutside||this.enableOnClickOutside()}},h.componentDidUpdate=function(){this.componentNode=this.__getComponentNode()},h.componentWillUnmount=function(){this.disableOnClickOutside()},h.render=function(){var t=this.props;t.excludeScrollbar;var r=function(e,t){if(null==e)return{};var r,n,a={},o=Object.keys(e);for(n=0;n<o.length;n++)t.indexOf(r=o[n])>=0||(a[r]=e[r]);return a}(t,["excludeScrollbar"]);return e.prototype&&e.prototype.isReactComponent?r.ref=this.getRef:r.wrappedRef=this.getRef,r.disableOnClickOutside=this.disableOnClickOutside,r.enableOnClickOutside=this.enableOnClickOutside,(0,o.createElement)(e,r)},n}(o.Component),r.displayName="OnClickOutside("+f+")",r.defaultProps={eventTypes:["mousedown","touchstart"],excludeScrollbar:t&&t.excludeScrollbar||!1,outsideClickIgnoreClass:h,preventDefault:!1,stopPropagation:!1},r.getClass=function(){return e.getClass?e.getClass():e},n}},37004:function(e,t,r){"use strict";r.r(t),r.d(t,{Manager:function(){return ed},Popper:function(){return eb},Reference:function(){return eD},placements:function(){return eg}});var n=r(63366),a=r(87462),o=r(94578),i=r(97326),c=r(4942),s=r(39853),u=r.n(s),l=r(67294),d="undefined"!=typeof window&&"undefined"!=typeof document&&"undefined"!=typeof navigator,p=function(){for(var e=["Edge","Trident","Firefox"],t=0;t<e.length;t+=1)if(d&&navigator.userAgent.indexOf(e[t])>=0)return 1;return 0}(),f=d&&window.Promise?function(e){var t=!1;return function(){t||(t=!0,window.Promise.resolve().then(function(){t=!1,e()}))}}:function(e){var t=!1;return function(){t||(t=!0,setTimeout(function(){t=!1,e()},p))}};function h(e){return e&&"[object Function]"===({}).toString.call(e)}function m(e,t){if(1!==e.nodeType)return[];var r=e.ownerDocument.defaultView.getComputedStyle(e,null);return t?r[t]:r}function y(e){return"HTML"===e.nodeName?e:e.parentNode||e.host}function v(e){if(!e)return document.body;switch(e.nodeName){case"HTML":case"BODY":return e.ownerDocument.body;case"#document":return e.body}var t=m(e),r=t.overflow,n=t.overflowX,a=t.overflowY;return/(auto|scroll|overlay)/.test(r+a+n)?e:v(y(e))}function g(e){return e&&e.referenceNode?e.referenceNode:e}var b=d&&!!(window.MSInputMethodContext&&document.documentMode),w=d&&/MSIE 10/.test(navigator.userAgent);function k(e){return 11===e?b:10===e?w:b||w}function _(e){if(!e)return document.documentElement;for(var t=k(10)?document.body:null,r=e.offsetParent||null;r===t&&e.nextElementSibling;)r=(e=e.nextElementSibling).offsetParent;var n=r&&r.nodeName;return n&&"BODY"!==n&&"HTML"!==n?-1!==["TH","TD","TABLE"].indexOf(r.nodeName)&&"static"===m(r,"position")?_(r):r:e?e.ownerDocument.documentElement:document.documentElement}function D(e){return null!==e.parentNode?D(e.parentNode):e}function x(e,t){if(!e||!e.nodeType||!t||!t.nodeType)return document.documentElement;var r,n=e.compareDocumentPosition(t)&Node.DOCUMENT_POSITION_FOLLOWING,a=n?e:t,o=n?t:e,i=document.createRange();i.setStart(a,0),i.setEnd(o,0);var c=i.commonAncestorContainer;if(e!==c&&t!==c||a.contains(o))return"BODY"!==(r=c.nodeName)&&("HTML"===r||_(c.firstElementChild)===c)?c:_(c);var s=D(e);return s.host?x(s.host,t):x(e,D(t).host)}function C(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"top",r="top"===t?"scrollTop":"scrollLeft",n=e.nodeName;if("BODY"===n||"HTML"===n){var a=e.ownerDocument.documentElement;return(e.ownerDocument.scrollingElement||a)[r]}return e[r]}function S(e,t){var r="x"===t?"Left":"Top";return parseFloat(e["border"+r+"Width"])+parseFloat(e["border"+("Left"===r?"Right":"Bottom")+"Width"])}function T(e,t,r,n){return Math.max(t["offset"+e],t["scroll"+e],r["client"+e],r["offset"+e],r["scroll"+e],k(10)?parseInt(r["offset"+e])+parseInt(n["margin"+("Height"===e?"Top":"Left")])+parseInt(n["margin"+("Height"===e?"Bottom":"Right")]):0)}function P(e){var t=e.body,r=e.documentElement,n=k(10)&&getComputedStyle(r);return{height:T("Height",t,r,n),width:T("Width",t,r,n)}}var E=function(e,t){if(!(e instanceof t))throw TypeError("Cannot call a class as a function")},Z=function(){function e(e,t){for(var r=0;r<t.length;r++){var n=t[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(e,n.key,n)}}return function(t,r,n){return r&&e(t.prototype,r),n&&e(t,n),t}}(),M=function(e,t,r){return t in e?Object.defineProperty(e,t,{value:r,enumerable:!0,configurable:!0,writable:!0}):e[t]=r,e},O=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e};function N(e){return O({},e,{right:e.left+e.width,bottom:e.top+e.height})}function Y(e){var t={};try{if(k(10)){t=e.getBoundingClientRect();var r=C(e,"top"),n=C(e,"left");t.top+=r,t.left+=n,t.bottom+=r,t.right+=n}else t=e.getBoundingClientRect()}catch(e){}var a={left:t.left,top:t.top,width:t.right-t.left,height:t.bottom-t.top},o="HTML"===e.nodeName?P(e.ownerDocument):{},i=o.width||e.clientWidth||a.width,c=o.height||e.clientHeight||a.height,s=e.offsetWidth-i,u=e.offsetHeight-c;if(s||u){var l=m(e);s-=S(l,"x"),u-=S(l,"y"),a.width-=s,a.height-=u}return N(a)}function A(e,t){var r=arguments.length>2&&void 0!==arguments[2]&&arguments[2],n=k(10),a="HTML"===t.nodeName,o=Y(e),i=Y(t),c=v(e),s=m(t),u=parseFloat(s.borderTopWidth),l=parseFloat(s.borderLeftWidth);r&&a&&(i.top=Math.max(i.top,0),i.left=Math.max(i.left,0));var d=N({top:o.top-i.top-u,left:o.left-i.left-l,width:o.width,height:o.height});if(d.marginTop=0,d.marginLeft=0,!n&&a){var p=parseFloat(s.marginTop),f=parseFloat(s.marginLeft);d.top-=u-p,d.bottom-=u-p,d.left-=l-f,d.right-=l-f,d.marginTop=p,d.marginLeft=f}return(n&&!r?t.contains(c):t===c&&"BODY"!==c.nodeName)&&(d=function(e,t){var r=arguments.length>2&&void 0!==arguments[2]&&arguments[2],n=C(t,"top"),a=C(t,"left"),o=r?-1:1;return e.top+=n*o,e.bottom+=n*o,e.left+=a*o,e.right+=a*o,e}(d,t)),d}function I(e){if(!e||!e.parentElement||k())return document.documentElement;for(var t=e.parentElement;t&&"none"===m(t,"transform");)t=t.parentElement;return t||document.documentElement}function F(e,t,r,n){var a=arguments.length>4&&void 0!==arguments[4]&&arguments[4],o={top:0,left:0},i=a?I(e):x(e,g(t));if("viewport"===n)o=function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],r=e.ownerDocument.documentElement,n=A(e,r),a=Math.max(r.clientWidth,window.innerWidth||0),o=Math.max(r.clientHeight,window.innerHeight||0),i=t?0:C(r),c=t?0:C(r,"left");return N({top:i-n.top+n.marginTop,left:c-n.left+n.marginLeft,width:a,height:o})}(i,a);else{var c=void 0;"scrollParent"===n?"BODY"===(c=v(y(t))).nodeName&&(c=e.ownerDocument.documentElement):c="window"===n?e.ownerDocument.documentElement:n;var s=A(c,i,a);if("HTML"===c.nodeName&&!function e(t){var r=t.nodeName;if("BODY"===r||"HTML"===r)return!1;if("fixed"===m(t,"position"))return!0;var n=y(t);return!!n&&e(n)}(i)){var u=P(e.ownerDocument),l=u.height,d=u.width;o.top+=s.top-s.marginTop,o.bottom=l+s.top,o.left+=s.left-s.marginLeft,o.right=d+s.left}else o=s}var p="number"==typeof(r=r||0);return o.left+=p?r:r.left||0,o.top+=p?r:r.top||0,o.right-=p?r:r.right||0,o.bottom-=p?r:r.bottom||0,o}function L(e,t,r,n,a){var o=arguments.length>5&&void 0!==arguments[5]?arguments[5]:0;if(-1===e.indexOf("auto"))return e;var i=F(r,n,o,a),c={top:{width:i.width,height:t.top-i.top},right:{width:i.right-t.right,height:i.height},bottom:{width:i.width,height:i.bottom-t.bottom},left:{width:t.left-i.left,height:i.height}},s=Object.keys(c).map(function(e){var t;return O({key:e},c[e],{area:(t=c[e]).width*t.height})}).sort(function(e,t){return t.area-e.area}),u=s.filter(function(e){var t=e.width,n=e.height;return t>=r.clientWidth&&n>=r.clientHeight}),l=u.length>0?u[0].key:s[0].key,d=e.split("-")[1];return l+(d?"-"+d:"")}function R(e,t,r){var n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:null,a=n?I(t):x(t,g(r));return A(r,a,n)}function j(e){var t=e.ownerDocument.defaultView.getComputedStyle(e),r=parseFloat(t.marginTop||0)+parseFloat(t.marginBottom||0),n=parseFloat(t.marginLeft||0)+parseFloat(t.marginRight||0);return{width:e.offsetWidth+n,height:e.offsetHeight+r}}function U(e){var t={left:"right",right:"left",bottom:"top",top:"bottom"};return e.replace(/left|right|bottom|top/g,function(e){return t[e]})}function W(e,t,r){r=r.split("-")[0];var n=j(e),a={width:n.width,height:n.height},o=-1!==["right","left"].indexOf(r),i=o?"top":"left",c=o?"left":"top",s=o?"height":"width";return a[i]=t[i]+t[s]/2-n[s]/2,r===c?a[c]=t[c]-n[o?"width":"height"]:a[c]=t[U(c)],a}function H(e,t){return Array.prototype.find?e.find(t):e.filter(t)[0]}function B(e,t,r){return(void 0===r?e:e.slice(0,function(e,t,r){if(Array.prototype.findIndex)return e.findIndex(function(e){return e[t]===r});var n=H(e,function(e){return e[t]===r});return e.indexOf(n)}(e,"name",r))).forEach(function(e){e.function&&console.warn("`modifier.function` is deprecated, use `modifier.fn`!");var r=e.function||e.fn;e.enabled&&h(r)&&(t.offsets.popper=N(t.offsets.popper),t.offsets.reference=N(t.offsets.reference),t=r(t,e))}),t}function q(){if(!this.state.isDestroyed){var e={instance:this,styles:{},arrowStyles:{},attributes:{},flipped:!1,offsets:{}};e.offsets.reference=R(this.state,this.popper,this.reference,this.options.positionFixed),e.placement=L(this.options.placement,e.offsets.reference,this.popper,this.reference,this.options.modifiers.flip.boundariesElement,this.options.modifiers.flip.padding),e.originalPlacement=e.placement,e.positionFixed=this.options.positionFixed,e.offsets.popper=W(this.popper,e.offsets.reference,e.placement),e.offsets.popper.position=this.options.positionFixed?"fixed":"absolute",e=B(this.modifiers,e),this.state.isCreated?this.options.onUpdate(e):(this.state.isCreated=!0,this.options.onCreate(e))}}function $(e,t){return e.some(function(e){var r=e.name;return e.enabled&&r===t})}function Q(e){for(var t=[!1,"ms","Webkit","Moz","O"],r=e.charAt(0).toUpperCase()+e.slice(1),n=0;n<t.length;n++){var a=t[n],o=a?""+a+r:e;if(void 0!==document.body.style[o])return o}return null}function K(){return this.state.isDestroyed=!0,$(this.modifiers,"applyStyle")&&(this.popper.removeAttribute("x-placement"),this.popper.style.position="",this.popper.style.top="",this.popper.style.left="",this.popper.style.right="",this.popper.style.bottom="",this.popper.style.willChange="",this.popper.style[Q("transform")]=""),this.disableEventListeners(),this.options.removeOnDestroy&&this.popper.parentNode.removeChild(this.popper),this}function z(e){var t=e.ownerDocument;return t?t.defaultView:window}function G(){if(!this.state.eventsEnabled){var e,t,r,n;this.state=(e=this.reference,this.options,t=this.state,r=this.scheduleUpdate,t.updateBound=r,z(e).addEventListener("resize",t.updateBound,{passive:!0}),!function e(t,r,n,a){var o="BODY"===t.nodeName,i=o?t.ownerDocument.defaultView:t;i.addEventListener(r,n,{passive:!0}),o||e(v(i.parentNode),r,n,a),a.push(i)}(n=v(e),"scroll",t.updateBound,t.scrollParents),t.scrollElement=n,t.eventsEnabled=!0,t)}}function V(){if(this.state.eventsEnabled){var e,t;cancelAnimationFrame(this.scheduleUpdate),this.state=(e=this.reference,t=this.state,z(e).removeEventListener("resize",t.updateBound),t.scrollParents.forEach(function(e){e.removeEventListener("scroll",t.updateBound)}),t.updateBound=null,t.scrollParents=[],t.scrollElement=null,t.eventsEnabled=!1,t)}}function X(e){return""!==e&&!isNaN(parseFloat(e))&&isFinite(e)}function J(e,t){Object.keys(t).forEach(function(r){var n="";-1!==["width","height","top","right","bottom","left"].indexOf(r)&&X(t[r])&&(n="px"),e.style[r]=t[r]+n})}var ee=d&&/Firefox/i.test(navigator.userAgent);function et(e,t,r){var n=H(e,function(e){return e.name===t}),a=!!n&&e.some(function(e){return e.name===r&&e.enabled&&e.order<n.order});if(!a){var o="`"+t+"`";console.warn("`"+r+"` modifier is required by "+o+" modifier in order to work, be sure to include it before "+o+"!")}return a}var er=["auto-start","auto","auto-end","top-start","top","top-end","right-start","right","right-end","bottom-end","bottom","bottom-start","left-end","left","left-start"],en=er.slice(3);function ea(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],r=en.indexOf(e),n=en.slice(r+1).concat(en.slice(0,r));return t?n.reverse():n}var eo={FLIP:"flip",CLOCKWISE:"clockwise",COUNTERCLOCKWISE:"counterclockwise"},ei=function(){function e(t,r){var n=this,a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};E(this,e),this.scheduleUpdate=function(){return requestAnimationFrame(n.update)},this.update=f(this.update.bind(this)),this.options=O({},e.Defaults,a),this.state={isDestroyed:!1,isCreated:!1,scrollParents:[]},this.reference=t&&t.jquery?t[0]:t,this.popper=r&&r.jquery?r[0]:r,this.options.modifiers={},Object.keys(O({},e.Defaults.modifiers,a.modifiers)).forEach(function(t){n.options.modifiers[t]=O({},e.Defaults.modifiers[t]||{},a.modifiers?a.modifiers[t]:{})}),this.modifiers=Object.keys(this.options.modifiers).map(function(e){return O({name:e},n.options.modifiers[e])}).sort(function(e,t){return e.order-t.order}),this.modifiers.forEach(function(e){e.enabled&&h(e.onLoad)&&e.onLoad(n.reference,n.popper,n.options,e,n.state)}),this.update();var o=this.options.eventsEnabled;o&&this.enableEventListeners(),this.state.eventsEnabled=o}return Z(e,[{key:"update",value:function(){return q.call(this)}},{key:"destroy",value:function(){return K.call(this)}},{key:"enableEventListeners",value:function(){return G.call(this)}},{key:"disableEventListeners",value:function(){return V.call(this)}}]),e}();ei.Utils=("undefined"!=typeof window?window:r.g).PopperUtils,ei.placements=er,ei.Defaults={placement:"bottom",positionFixed:!1,eventsEnabled:!0,removeOnDestroy:!1,onCreate:function(){},onUpdate:function(){},modifiers:{shift:{order:100,enabled:!0,fn:function(e){var t=e.placement,r=t.split("-")[0],n=t.split("-")[1];if(n){var a=e.offsets,o=a.reference,i=a.popper,c=-1!==["bottom","top"].indexOf(r),s=c?"left":"top",u=c?"width":"height",l={start:M({},s,o[s]),end:M({},s,o[s]+o[u]-i[u])};e.offsets.popper=O({},i,l[n])}return e}},offset:{order:200,enabled:!0,fn:function(e,t){var r,n,a,o,i,c=t.offset,s=e.placement,u=e.offsets,l=u.popper,d=u.reference,p=s.split("-")[0],f=void 0;return X(+c)?f=[+c,0]:(r=[0,0],n=-1!==["right","left"].indexOf(p),o=(a=c.split(/(\+|\-)/).map(function(e){return e.trim()})).indexOf(H(a,function(e){return -1!==e.search(/,|\s/)})),a[o]&&-1===a[o].indexOf(",")&&console.warn("Offsets separated by white space(s) are deprecated, use a comma (,) instead."),i=/\s*,\s*|\s+/,(-1!==o?[a.slice(0,o).concat([a[o].split(i)[0]]),[a[o].split(i)[1]].concat(a.slice(o+1))]:[a]).map(function(e,t){var r=(1===t?!n:n)?"height":"width",a=!1;return e.reduce(function(e,t){return""===e[e.length-1]&&-1!==["+","-"].indexOf(t)?(e[e.length-1]=t,a=!0,e):a?(e[e.length-1]+=t,a=!1,e):e.concat(t)},[]).map(function(e){return function(e,t,r,n){var a=e.match(/((?:\-|\+)?\d*\.?\d*)(.*)/),o=+a[1],i=a[2];if(!o)return e;if(0===i.indexOf("%")){var c=void 0;return N("%p"===i?r:n)[t]/100*o}return"vh"!==i&&"vw"!==i?o:("vh"===i?Math.max(document.documentElement.clientHeight,window.innerHeight||0):Math.max(document.documentElement.clientWidth,window.innerWidth||0))/100*o}(e,r,l,d)})}).forEach(function(e,t){e.forEach(function(n,a){X(n)&&(r[t]+=n*("-"===e[a-1]?-1:1))})}),f=r),"left"===p?(l.top+=f[0],l.left-=f[1]):"right"===p?(l.top+=f[0],l.left+=f[1]):"top"===p?(l.left+=f[0],l.top-=f[1]):"bottom"===p&&(l.left+=f[0],l.top+=f[1]),e.popper=l,e},offset:0},preventOverflow:{order:300,enabled:!0,fn:function(e,t){var r=t.boundariesElement||_(e.instance.popper);e.instance.reference===r&&(r=_(r));var n=Q("transform"),a=e.instance.popper.style,o=a.top,i=a.left,c=a[n];a.top="",a.left="",a[n]="";var s=F(e.instance.popper,e.instance.reference,t.padding,r,e.positionFixed);a.top=o,a.left=i,a[n]=c,t.boundaries=s;var u=t.priority,l=e.offsets.popper,d={primary:function(e){var r=l[e];return l[e]<s[e]&&!t.escapeWithReference&&(r=Math.max(l[e],s[e])),M({},e,r)},secondary:function(e){var r="right"===e?"left":"top",n=l[r];return l[e]>s[e]&&!t.escapeWithReference&&(n=Math.min(l[r],s[e]-("right"===e?l.width:l.height))),M({},r,n)}};return u.forEach(function(e){var t=-1!==["left","top"].indexOf(e)?"primary":"secondary";l=O({},l,d[t](e))}),e.offsets.popper=l,e},priority:["left","right","top","bottom"],padding:5,boundariesElement:"scrollParent"},keepTogether:{order:400,enabled:!0,fn:function(e){var t=e.offsets,r=t.popper,n=t.reference,a=e.placement.split("-")[0],o=Math.floor,i=-1!==["top","bottom"].indexOf(a),c=i?"right":"bottom",s=i?"left":"top";return r[c]<o(n[s])&&(e.offsets.popper[s]=o(n[s])-r[i?"width":"height"]),r[s]>o(n[c])&&(e.offsets.popper[s]=o(n[c])),e}},arrow:{order:500,enabled:!0,fn:function(e,t){if(!et(e.instance.modifiers,"arrow","keepTogether"))return e;var r,n=t.element;if("string"==typeof n){if(!(n=e.instance.popper.querySelector(n)))return e}else if(!e.instance.popper.contains(n))return console.warn("WARNING: `arrow.element` must be child of its popper element!"),e;var a=e.placement.split("-")[0],o=e.offsets,i=o.popper,c=o.reference,s=-1!==["left","right"].indexOf(a),u=s?"height":"width",l=s?"Top":"Left",d=l.toLowerCase(),p=s?"bottom":"right",f=j(n)[u];c[p]-f<i[d]&&(e.offsets.popper[d]-=i[d]-(c[p]-f)),c[d]+f>i[p]&&(e.offsets.popper[d]+=c[d]+f-i[p]),e.offsets.popper=N(e.offsets.popper);var h=c[d]+c[u]/2-f/2,y=m(e.instance.popper),v=parseFloat(y["margin"+l]),g=parseFloat(y["border"+l+"Width"]),b=h-e.offsets.popper[d]-v-g;return b=Math.max(Math.min(i[u]-f,b),0),e.arrowElement=n,e.offsets.arrow=(M(r={},d,Math.round(b)),M(r,s?"left":"top",""),r),e},element:"[x-arrow]"},flip:{order:600,enabled:!0,fn:function(e,t){if($(e.instance.modifiers,"inner")||e.flipped&&e.placement===e.originalPlacement)return e;var r=F(e.instance.popper,e.instance.reference,t.padding,t.boundariesElement,e.positionFixed),n=e.placement.split("-")[0],a=U(n),o=e.placement.split("-")[1]||"",i=[];switch(t.behavior){case eo.FLIP:i=[n,a];break;case eo.CLOCKWISE:i=ea(n);break;case eo.COUNTERCLOCKWISE:i=ea(n,!0);break;default:i=t.behavior}return i.forEach(function(c,s){if(n!==c||i.length===s+1)return e;a=U(n=e.placement.split("-")[0]);var u,l=e.offsets.popper,d=e.offsets.reference,p=Math.floor,f="left"===n&&p(l.right)>p(d.left)||"right"===n&&p(l.left)<p(d.right)||"top"===n&&p(l.bottom)>p(d.top)||"bottom"===n&&p(l.top)<p(d.bottom),h=p(l.left)<p(r.left),m=p(l.right)>p(r.right),y=p(l.top)<p(r.top),v=p(l.bottom)>p(r.bottom),g="left"===n&&h||"right"===n&&m||"top"===n&&y||"bottom"===n&&v,b=-1!==["top","bottom"].indexOf(n),w=!!t.flipVariations&&(b&&"start"===o&&h||b&&"end"===o&&m||!b&&"start"===o&&y||!b&&"end"===o&&v),k=!!t.flipVariationsByContent&&(b&&"start"===o&&m||b&&"end"===o&&h||!b&&"start"===o&&v||!b&&"end"===o&&y),_=w||k;(f||g||_)&&(e.flipped=!0,(f||g)&&(n=i[s+1]),_&&(o="end"===(u=o)?"start":"start"===u?"end":u),e.placement=n+(o?"-"+o:""),e.offsets.popper=O({},e.offsets.popper,W(e.instance.popper,e.offsets.reference,e.placement)),e=B(e.instance.modifiers,e,"flip"))}),e},behavior:"flip",padding:5,boundariesElement:"viewport",flipVariations:!1,flipVariationsByContent:!1},inner:{order:700,enabled:!1,fn:function(e){var t=e.placement,r=t.split("-")[0],n=e.offsets,a=n.popper,o=n.reference,i=-1!==["left","right"].indexOf(r),c=-1===["top","left"].indexOf(r);return a[i?"left":"top"]=o[r]-(c?a[i?"width":"height"]:0),e.placement=U(t),e.offsets.popper=N(a),e}},hide:{order:800,enabled:!0,fn:function(e){if(!et(e.instance.modifiers,"hide","preventOverflow"))return e;var t=e.offsets.reference,r=H(e.instance.modifiers,function(e){return"preventOverflow"===e.name}).boundaries;if(t.bottom<r.top||t.left>r.right||t.top>r.bottom||t.right<r.left){if(!0===e.hide)return e;e.hide=!0,e.attributes["x-out-of-boundaries"]=""}else{if(!1===e.hide)return e;e.hide=!1,e.attributes["x-out-of-boundaries"]=!1}return e}},computeStyle:{order:850,enabled:!0,fn:function(e,t){var r,n,a,o,i,c,s,u,l,d,p,f,h=t.x,m=t.y,y=e.offsets.popper,v=H(e.instance.modifiers,function(e){return"applyStyle"===e.name}).gpuAcceleration;void 0!==v&&console.warn("WARNING: `gpuAcceleration` option moved to `computeStyle` modifier and will not be supported in future versions of Popper.js!");var g=void 0!==v?v:t.gpuAcceleration,b=_(e.instance.popper),w=Y(b),k={position:y.position},D=(r=window.devicePixelRatio<2||!ee,a=(n=e.offsets).popper,o=n.reference,i=Math.round,c=function(e){return e},s=i(o.width),u=i(a.width),l=-1!==["left","right"].indexOf(e.placement),d=-1!==e.placement.indexOf("-"),p=r?l||d||s%2==u%2?i:Math.floor:c,f=r?i:c,{left:p(s%2==1&&u%2==1&&!d&&r?a.left-1:a.left),top:f(a.top),bottom:f(a.bottom),right:p(a.right)}),x="bottom"===h?"top":"bottom",C="right"===m?"left":"right",S=Q("transform"),T=void 0,P=void 0;P="bottom"===x?"HTML"===b.nodeName?-b.clientHeight+D.bottom:-w.height+D.bottom:D.top,T="right"===C?"HTML"===b.nodeName?-b.clientWidth+D.right:-w.width+D.right:D.left,g&&S?(k[S]="translate3d("+T+"px, "+P+"px, 0)",k[x]=0,k[C]=0,k.willChange="transform"):(k[x]=P*("bottom"===x?-1:1),k[C]=T*("right"===C?-1:1),k.willChange=x+", "+C);var E={"x-placement":e.placement};return e.attributes=O({},E,e.attributes),e.styles=O({},k,e.styles),e.arrowStyles=O({},e.offsets.arrow,e.arrowStyles),e},gpuAcceleration:!0,x:"bottom",y:"right"},applyStyle:{order:900,enabled:!0,fn:function(e){return J(e.instance.popper,e.styles),function(e,t){Object.keys(t).forEach(function(r){!1!==t[r]?e.setAttribute(r,t[r]):e.removeAttribute(r)})}(e.instance.popper,e.attributes),e.arrowElement&&Object.keys(e.arrowStyles).length&&J(e.arrowElement,e.arrowStyles),e},onLoad:function(e,t,r,n,a){var o=R(a,t,e,r.positionFixed),i=L(r.placement,o,t,e,r.modifiers.flip.boundariesElement,r.modifiers.flip.padding);return t.setAttribute("x-placement",i),J(t,{position:r.positionFixed?"fixed":"absolute"}),r},gpuAcceleration:void 0}}};var ec=r(88740),es=r.n(ec),eu=es()(),el=es()(),ed=function(e){function t(){for(var t,r=arguments.length,n=Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=e.call.apply(e,[this].concat(n))||this,(0,c.Z)((0,i.Z)((0,i.Z)(t)),"referenceNode",void 0),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"setReferenceNode",function(e){e&&t.referenceNode!==e&&(t.referenceNode=e,t.forceUpdate())}),t}(0,o.Z)(t,e);var r=t.prototype;return r.componentWillUnmount=function(){this.referenceNode=null},r.render=function(){return l.createElement(eu.Provider,{value:this.referenceNode},l.createElement(el.Provider,{value:this.setReferenceNode},this.props.children))},t}(l.Component),ep=function(e){return Array.isArray(e)?e[0]:e},ef=function(e){if("function"==typeof e){for(var t=arguments.length,r=Array(t>1?t-1:0),n=1;n<t;n++)r[n-1]=arguments[n];return e.apply(void 0,r)}},eh=function(e,t){if("function"==typeof e)return ef(e,t);null!=e&&(e.current=t)},em={position:"absolute",top:0,left:0,opacity:0,pointerEvents:"none"},ey={},ev=function(e){function t(){for(var t,r=arguments.length,n=Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=e.call.apply(e,[this].concat(n))||this,(0,c.Z)((0,i.Z)((0,i.Z)(t)),"state",{data:void 0,placement:void 0}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"popperInstance",void 0),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"popperNode",null),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"arrowNode",null),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"setPopperNode",function(e){e&&t.popperNode!==e&&(eh(t.props.innerRef,e),t.popperNode=e,t.updatePopperInstance())}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"setArrowNode",function(e){t.arrowNode=e}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"updateStateModifier",{enabled:!0,order:900,fn:function(e){var r=e.placement;return t.setState({data:e,placement:r}),e}}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"getOptions",function(){return{placement:t.props.placement,eventsEnabled:t.props.eventsEnabled,positionFixed:t.props.positionFixed,modifiers:(0,a.Z)({},t.props.modifiers,{arrow:(0,a.Z)({},t.props.modifiers&&t.props.modifiers.arrow,{enabled:!!t.arrowNode,element:t.arrowNode}),applyStyle:{enabled:!1},updateStateModifier:t.updateStateModifier})}}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"getPopperStyle",function(){return t.popperNode&&t.state.data?(0,a.Z)({position:t.state.data.offsets.popper.position},t.state.data.styles):em}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"getPopperPlacement",function(){return t.state.data?t.state.placement:void 0}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"getArrowStyle",function(){return t.arrowNode&&t.state.data?t.state.data.arrowStyles:ey}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"getOutOfBoundariesState",function(){return t.state.data?t.state.data.hide:void 0}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"destroyPopperInstance",function(){t.popperInstance&&(t.popperInstance.destroy(),t.popperInstance=null)}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"updatePopperInstance",function(){t.destroyPopperInstance();var e=(0,i.Z)((0,i.Z)(t)).popperNode,r=t.props.referenceElement;r&&e&&(t.popperInstance=new ei(r,e,t.getOptions()))}),(0,c.Z)((0,i.Z)((0,i.Z)(t)),"scheduleUpdate",function(){t.popperInstance&&t.popperInstance.scheduleUpdate()}),t}(0,o.Z)(t,e);var r=t.prototype;return r.componentDidUpdate=function(e,t){this.props.placement===e.placement&&this.props.referenceElement===e.referenceElement&&this.props.positionFixed===e.positionFixed&&u()(this.props.modifiers,e.modifiers,{strict:!0})?this.props.eventsEnabled!==e.eventsEnabled&&this.popperInstance&&(this.props.eventsEnabled?this.popperInstance.enableEventListeners():this.popperInstance.disableEventListeners()):this.updatePopperInstance(),t.placement!==this.state.placement&&this.scheduleUpdate()},r.componentWillUnmount=function(){eh(this.props.innerRef,null),this.destroyPopperInstance()},r.render=function(){return ep(this.props.children)({ref:this.setPopperNode,style:this.getPopperStyle(),placement:this.getPopperPlacement(),outOfBoundaries:this.getOutOfBoundariesState(),scheduleUpdate:this.scheduleUpdate,arrowProps:{ref:this.setArrowNode,style:this.getArrowStyle()}})},t}(l.Component);(0,c.Z)(ev,"defaultProps",{placement:"bottom",eventsEnabled:!0,referenceElement:void 0,positionFixed:!1});var eg=ei.placements;function eb(e){var t=e.referenceElement,r=(0,n.Z)(e,["referenceElement"]);return l.createElement(eu.Consumer,null,function(e){return l.createElement(ev,(0,a.Z)({referenceElement:void 0!==t?t:e},r))})}var ew=r(42473),ek=r.n(ew),e_=function(e){function t(){for(var t,r=arguments.length,n=Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=e.call.apply(e,[this].concat(n))||this,(0,c.Z)((0,i.Z)((0,i.Z)(t)),"refHandler",function(e){eh(t.props.innerRef,e),ef(t.props.setReferenceNode,e)}),t}(0,o.Z)(t,e);var r=t.prototype;return r.componentWillUnmount=function(){eh(this.props.innerRef,null)},r.render=function(){return ek()(!!this.props.setReferenceNode,"`Reference` should not be used outside of a `Manager` component."),ep(this.props.children)({ref:this.refHandler})},t}(l.Component);function eD(e){return l.createElement(el.Consumer,null,function(t){return l.createElement(e_,(0,a.Z)({setReferenceNode:t},e))})}},39853:function(e,t,r){var n=r(82215),a=r(82584),o=r(20609),i=r(98420),c=r(2847),s=r(18923),u=Date.prototype.getTime;function l(e){return!!e&&"object"==typeof e&&"number"==typeof e.length&&"function"==typeof e.copy&&"function"==typeof e.slice&&(!(e.length>0)||"number"==typeof e[0])}e.exports=function e(t,r,d){var p=d||{};return(p.strict?!!o(t,r):t===r)||(t&&r&&("object"==typeof t||"object"==typeof r)?function(t,r,o){if(typeof t!=typeof r||null==t||null==r||t.prototype!==r.prototype||a(t)!==a(r))return!1;var d,p,f=i(t),h=i(r);if(f!==h)return!1;if(f||h)return t.source===r.source&&c(t)===c(r);if(s(t)&&s(r))return u.call(t)===u.call(r);var m=l(t),y=l(r);if(m!==y)return!1;if(m||y){if(t.length!==r.length)return!1;for(d=0;d<t.length;d++)if(t[d]!==r[d])return!1;return!0}if(typeof t!=typeof r)return!1;try{var v=n(t),g=n(r)}catch(e){return!1}if(v.length!==g.length)return!1;for(v.sort(),g.sort(),d=v.length-1;d>=0;d--)if(v[d]!=g[d])return!1;for(d=v.length-1;d>=0;d--)if(!e(t[p=v[d]],r[p],o))return!1;return!0}(t,r,p):p.strict?o(t,r):t==r)}},53697:function(e,t,r){"use strict";var n=r(58052),a=r(14453),o=Object;e.exports=n(function(){if(this==null||this!==o(this))throw new a("RegExp.prototype.flags getter called on non-object");var e="";return this.hasIndices&&(e+="d"),this.global&&(e+="g"),this.ignoreCase&&(e+="i"),this.multiline&&(e+="m"),this.dotAll&&(e+="s"),this.unicode&&(e+="u"),this.unicodeSets&&(e+="v"),this.sticky&&(e+="y"),e},"get flags",!0)},2847:function(e,t,r){"use strict";var n=r(4289),a=r(55559),o=r(53697),i=r(71721),c=r(32753),s=a(i());n(s,{getPolyfill:i,implementation:o,shim:c}),e.exports=s},71721:function(e,t,r){"use strict";var n=r(53697),a=r(4289).supportsDescriptors,o=Object.getOwnPropertyDescriptor;e.exports=function(){if(a&&"gim"===/a/mig.flags){var e=o(RegExp.prototype,"flags");if(e&&"function"==typeof e.get&&"boolean"==typeof RegExp.prototype.dotAll&&"boolean"==typeof RegExp.prototype.hasIndices){var t="",r={};if(Object.defineProperty(r,"hasIndices",{get:function(){t+="d"}}),Object.defineProperty(r,"sticky",{get:function(){t+="y"}}),"dy"===t)return e.get}}return n}},32753:function(e,t,r){"use strict";var n=r(4289).supportsDescriptors,a=r(71721),o=Object.getOwnPropertyDescriptor,i=Object.defineProperty,c=TypeError,s=Object.getPrototypeOf,u=/a/;e.exports=function(){if(!n||!s)throw new c("RegExp.prototype.flags requires a true ES5 environment that supports property descriptors");var e=a(),t=s(u),r=o(t,"flags");return r&&r.get===e||i(t,"flags",{configurable:!0,enumerable:!1,get:e}),e}},67771:function(e,t,r){"use strict";var n=r(40210),a=r(12296),o=r(31044)(),i=r(27296),c=r(14453),s=n("%Math.floor%");e.exports=function(e,t){if("function"!=typeof e)throw new c("`fn` is not a function");if("number"!=typeof t||t<0||t>4294967295||s(t)!==t)throw new c("`length` must be a positive 32-bit integer");var r=arguments.length>2&&!!arguments[2],n=!0,u=!0;if("length"in e&&i){var l=i(e,"length");l&&!l.configurable&&(n=!1),l&&!l.writable&&(u=!1)}return(n||u||!r)&&(o?a(e,"length",t,!0,!0):a(e,"length",t)),e}},58052:function(e,t,r){"use strict";var n=r(12296),a=r(31044)(),o=r(25972).functionsHaveConfigurableNames(),i=r(14453);e.exports=function(e,t){if("function"!=typeof e)throw new i("`fn` is not a function");var r=arguments.length>2&&!!arguments[2];return(!r||o)&&(a?n(e,"name",t,!0,!0):n(e,"name",t)),e}},42473:function(e){"use strict";e.exports=function(){}},50029:function(e,t,r){"use strict";function n(e,t,r,n,a,o,i){try{var c=e[o](i),s=c.value}catch(e){r(e);return}c.done?t(s):Promise.resolve(s).then(n,a)}function a(e){return function(){var t=this,r=arguments;return new Promise(function(a,o){var i=e.apply(t,r);function c(e){n(i,a,o,c,s,"next",e)}function s(e){n(i,a,o,c,s,"throw",e)}c(void 0)})}}r.d(t,{Z:function(){return a}})}}]);
\ No newline at end of file
@@ -0,0 +1,1067 @@
+(self.webpackChunk_N_E=self.webpackChunk_N_E||[]).push([[539],{30038:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=void 0;let l=a(n(67294)),u=n(73935),s=a(n(85444)),c=i(n(93967)),d=i(n(5801)),f=i(n(72605)),p=n(7347),g=i(n(97972));t.Styles=g.default;let m=(0,s.default)(f.default)`
+  ${e=>g.default.modal(e.theme)}
+  ${e=>e.width?`width: ${e.width}px;`:""}
+  ${e=>e.height?`height: ${e.height}px;`:""}
+`;m.displayName="Modal";let b=s.default.div`
+  ${e=>g.default.backdrop(e.theme)}
+`;b.displayName="Backdrop";let h=(0,s.default)(d.default)`
+  ${g.default.closeButton}
+`;h.displayName="CloseButton",t.default=function({backdrop:e=!0,children:t,className:n,closeButton:r=!0,closeOnBackdropClick:o=!0,closeEcapeKey:a=!0,destructiveButtonText:i,footer:f,height:g,onClose:v=()=>{},onDestructiveButtonClick:y=()=>{},onPrimaryButtonClick:w=()=>{},onSecondaryButtonClick:S=()=>{},open:C=!1,primaryButtonText:x,secondaryButtonText:E,size:R="medium",subtitle:k,title:_,width:O}){let P=(0,l.useContext)(p.KaizenThemeContext),[A,T]=(0,l.useState)(C),[I,$]=(0,l.useState)(!1),z=(0,l.useCallback)(e=>{"keyCode"in e&&27===e.keyCode&&a&&(T(!1),v())},[v,T]);(0,l.useEffect)(()=>($(!0),window.addEventListener("keydown",z),()=>{$(!1),window.removeEventListener("keydown",z)}),[]),(0,l.useEffect)(()=>{T(C)},[C]);let F=(0,c.default)("modal-backdrop",{open:A}),j=(0,c.default)(n,R,{open:A,custom:O||g});return l.default.createElement(l.default.Fragment,null,I&&(0,u.createPortal)(l.default.createElement(s.ThemeProvider,{theme:P},e&&l.default.createElement(b,{className:F,onClick:()=>{o&&(T(!1),v())}}),l.default.createElement(m,{className:j,testId:"kui-modal",elevation:"high",height:g,width:O},(_||r)&&l.default.createElement("div",{className:"modal-title-bar"},r&&l.default.createElement(h,{className:"modal-close-button",icon:{name:"ActionsClose",variant:"solid"},shape:"square",variant:"link",onClick:()=>{T(!1),v()}}),_&&l.default.createElement("div",{className:"modal-title"},_)),k&&l.default.createElement("div",{className:"modal-subtitle"},k),l.default.createElement("div",{className:"modal-content"},t&&l.default.Children.map(t,e=>l.default.isValidElement(e)?l.default.cloneElement(e):l.default.createElement(l.default.Fragment,null))),f&&l.default.createElement("div",{className:"modal-footer"},f),!f&&(x||i||E)&&l.default.createElement("div",{className:"modal-footer"},x&&l.default.createElement(d.default,{className:"modal-primary-button",type:"primary",onClick:e=>{T(!1),w(e),v()}},x),!x&&i&&l.default.createElement(d.default,{className:"modal-destructive-button",type:"critical",onClick:e=>{T(!1),y(e),v()}},i),E&&l.default.createElement(d.default,{className:"modal-secondary-button",type:"secondary",variant:"outline",onClick:e=>{T(!1),S(e),v()}},E)))),document.body))}},97972:function(e,t,n){"use strict";Object.defineProperty(t,"__esModule",{value:!0});let r=n(49123),o=n(85444),a=(0,o.css)`
+  hyphens: auto;
+  overflow-wrap: break-word;
+`,i=`
+  flex: 0;
+`;t.default={modal:e=>`
+  box-sizing: border-box;
+  display: flex;
+  flex-direction: column;
+  left: 50%;
+  opacity: 0;
+  overflow: hidden;
+  padding: ${e.spacing.four};
+  transform: scale(0.8,0.8) translate(-60%, -60%);
+  position: fixed;
+  top: 50%;
+  transform-origin: 50% 50%;
+  transition: opacity 0.15s linear, visibility 0.15s linear, transform 0.15s linear;
+  will-change: opacity, visibility, transform;
+  visibility: hidden;
+  z-index: 100;
+
+  &.open {
+    opacity: 1;
+    transform: scale(1,1) translate(-50%, -50%);
+    visibility: visible;
+  }
+
+  &:not(.custom) {
+    max-height: 70vh;
+    
+    &.small {
+      width: 20vw;
+      min-width: 15rem;
+    }
+
+    &.medium {
+      width: 30vw;
+      min-width: 22rem;
+    }
+
+    &.large {
+      width: 50vw;
+      min-width: 37rem;
+    }
+  }
+
+  .modal-title-bar {
+    align-items: flex-start;
+    display: flex;
+    flex-direction: row-reverse;
+    margin-bottom: ${e.spacing.six};
+  }
+
+  .modal-title {
+    ${a};
+    color: ${e.colors.modal.title.foreground};
+    flex: 1;
+    font-family: ${e.typography.font.brand};
+    font-size: 1.5rem;
+    font-weight: ${e.typography.weight.medium};
+    overflow-wrap: anywhere;
+  }
+
+  .modal-close-button {
+    margin-top: -0.5rem;
+    margin-right: -0.5rem;
+
+    .button-icon {
+      fill: ${e.colors.modal.closeButton} !important;
+    }
+  }
+
+  .modal-subtitle {
+    ${a};
+    font-family: ${e.typography.font.body};
+    font-size: 1rem;
+    margin-bottom: ${e.spacing.six};
+  }
+
+  .modal-content {
+    font-family: ${e.typography.font.body};
+    flex: 1;
+    overflow: auto;
+  }
+
+  .modal-footer {
+    display: flex;
+    flex-direction: row-reverse;
+    margin-top: ${e.spacing.eight};
+
+    > * {
+      margin-left: ${e.spacing.two};
+    }
+  }
+`,backdrop:e=>`
+  background-color: ${(0,r.transparentize)(.4,e.colors.modal.backdrop)};
+  visibility: hidden;
+  transition: opacity 0.15s linear, visibility 0.15s linear;
+  opacity: 0;
+  position: fixed;
+  left: 0;
+  right: 0;
+  top: 0;
+  bottom: 0;
+  will-change: opacity, visibility;
+  z-index: 80;
+
+  &.open {
+    visibility: visible;
+    opacity: 1;
+  }
+`,closeButton:i}},5229:function(e,t,n){"use strict";var r=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let o=r(n(67294)),a=r(n(85444)),i=r(n(5801)),l=r(n(51214)),u=a.default.div`
+  ${e=>l.default.pages(e.theme)}
+`;u.displayName="CaretPages",t.default=function({changePage:e,currentInputValue:t,currentKey:n,handleBlur:r,hasNext:a,hasPrev:l,onKeyUp:s,totalPages:c}){return o.default.createElement(u,{"data-testid":"paginationNavigation"},o.default.createElement(i.default,{className:"caret-double-left",disabled:!l,icon:{name:"ArrowCaretDoubleLeft",size:"smaller",variant:"solid"},onClick:()=>e("FIRST"),size:"small",variant:"link"}),o.default.createElement(i.default,{className:"caret-left",disabled:!l,icon:{name:"ArrowCaretLeft",size:"smaller",variant:"solid"},onClick:()=>e("PREV"),size:"small",variant:"link"}),o.default.createElement("div",{"data-testid":"page-state"},o.default.createElement("input",{className:"page-input",onBlur:r,onKeyUp:s,type:"text",key:n,defaultValue:t}),o.default.createElement("span",null," of ",c)),o.default.createElement(i.default,{className:"caret-right",disabled:!a,icon:{name:"ArrowCaretRight",size:"smaller",variant:"solid"},onClick:()=>e("NEXT"),size:"small",variant:"link"}),o.default.createElement(i.default,{className:"caret-double-right",disabled:!a,icon:{name:"ArrowCaretDoubleRight",size:"smaller",variant:"solid"},onClick:()=>e("LAST"),size:"small",variant:"link"}))}},28829:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=void 0;let l=a(n(67294)),u=a(n(85444)),s=i(n(32754)),c=n(7347),d=i(n(5229)),f=i(n(51214));t.Styles=f.default;let p=[{value:25,label:"25"},{value:50,label:"50"},{value:100,label:"100"}],g=u.default.div`
+  ${e=>f.default.pagination(e.theme)}
+`;g.displayName="Pagination";let m=u.default.div`
+  ${e=>f.default.results(e.theme)}
+`;function b({currentPage:e,pageSize:t,totalRecords:n},r){let o=Math.floor((n-1)/t)+1,a=Math.min(1,o),i=e;i>o?i=o:i<a&&(i=a);let l=i>1,u=i<o;return r&&r.pageSize!==t&&(i=a),{currentPage:i,totalRecords:n,totalPages:o,pageSize:t,hasNext:u,hasPrevious:l}}function h(e,t){if("external"===t.type)return b(t,e);if("jump"===t.type)return b(Object.assign(Object.assign({},e),{currentPage:t.pageNumber}));if("pageSize"===t.type)return b(Object.assign(Object.assign({},e),{pageSize:t.pageSize}));if("navigate"===t.type){if("FIRST"===t.move)return b(Object.assign(Object.assign({},e),{currentPage:0}));if("LAST"===t.move)return b(Object.assign(Object.assign({},e),{currentPage:e.totalPages}));if("NEXT"===t.move)return b(Object.assign(Object.assign({},e),{currentPage:e.currentPage+1}));if("PREV"===t.move)return b(Object.assign(Object.assign({},e),{currentPage:e.currentPage-1}))}return e}function v(e){let t=(0,l.useRef)(null);return(0,l.useEffect)(()=>{t.current=e},[e]),t.current}m.displayName="ResultsPerPage",t.default=function({className:e,current:t,handlePageChange:n,handlePageSize:r,options:o=p,pageSize:a=25,total:i}){let f=(0,l.useContext)(c.KaizenThemeContext),[{pageSize:y,currentPage:w,totalPages:S,hasPrevious:C,hasNext:x},E]=(0,l.useReducer)(h,{pageSize:a,totalRecords:i,currentPage:t},b),[R,k]=(0,l.useState)(""),_=v(w),O=v(y),P=v(!1),A=v(a),T=v(t);(0,l.useEffect)(()=>{null!==P&&E({type:"external",totalRecords:i,pageSize:a!==A?a:y,currentPage:t!==T?t:w})},[i,a,t,P,w,y,T,A]),(0,l.useEffect)(()=>{null!==_&&_!==w&&n(Math.max(0,w-1))},[w,_,n]),(0,l.useEffect)(()=>{null!==O&&O!==y&&r(y)},[y,O,r]);let I=(0,l.useCallback)(e=>{let{value:t}=Array.isArray(e)?e[0]:e;E({type:"pageSize",pageSize:t})},[E]),$=(0,l.useCallback)(e=>{let{value:t}=e.currentTarget,n=Number(t);!Number.isInteger(n)||"key"in e&&"Enter"!==e.key||E({type:"jump",pageNumber:n}),"key"in e&&"Enter"!==e.key||k(`${t||Math.random()}`)},[E]);return l.default.createElement(u.ThemeProvider,{theme:f},l.default.createElement(g,{className:e,current:w,"data-testid":"kui-pagination",handlePageChange:n,handlePageSize:r,pageSize:y,role:"navigation",total:S},l.default.createElement(m,{"data-testid":"kui-pagination-resultsPerPage"},"Display",l.default.createElement(s.default,{className:"select-page-size",clearable:!1,defaultValue:{value:y,label:String(y)},menuPlacement:"auto",onChange:I,options:o,searchable:!1,value:{value:y,label:String(y)}}),"results per page"),l.default.createElement("div",{className:"pages-container"},l.default.createElement(d.default,{changePage:e=>E({type:"navigate",move:e}),currentInputValue:w,currentKey:`${w}|${R}`,handleBlur:$,hasNext:x,hasPrev:C,onKeyUp:$,totalPages:S}))))}},51214:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={pagination:e=>`
+  display: flex;
+  justify-content: space-between;
+  font-family: ${e.typography.font.brand};
+  width: 100%;
+
+  .pages-container {
+    display: flex;
+    flex-direction: column;
+    align-items: flex-end;
+    flex-shrink: 0;
+  }
+`,pages:e=>`
+  display: flex;
+  align-items: center;
+
+  .page-number-button {
+    display: inline-block;
+    box-shadow: ${e.colors.pagination.button.number.shadow};
+    border: 1px solid ${e.colors.pagination.button.number.border};
+    border-radius: 2px;
+    color: ${e.colors.pagination.button.number.foreground};
+    margin: 0 2px 4px 0;
+    background-color: ${e.colors.pagination.button.number.background};
+    height: 32px;
+    min-width: 32px;
+
+    &:focus {
+      outline: none;
+    }
+
+    cursor: pointer;
+
+    &.selected {
+      border: 1px solid ${e.colors.pagination.button.number.selected.border};
+      border-radius: 2px;
+      background-color:  ${e.colors.pagination.button.number.selected.background};
+      box-shadow: ${e.colors.pagination.button.number.selected.shadow};
+    }
+  }
+
+  input, span {
+    color: ${e.colors.pagination.input.foreground};
+    font-family: ${e.typography.font.brand};
+    font-size: ${e.typography.size.normal};
+    text-align: center;
+  }
+
+  input {
+    background-color: ${e.colors.pagination.input.background};
+    border: solid 1px ${e.colors.pagination.input.border};
+    color: ${e.colors.pagination.input.foreground};
+    outline: none;
+    height: 32px;
+    width: 32px;
+    border-radius: 2px;
+  }
+
+  > button {
+    background-color: unset;
+
+    &.disabled.primary.link,
+    :not(.disabled).primary.link {
+      padding: 3px;
+    }
+  }
+
+  svg {
+    fill: ${e.colors.pagination.button.caret.fill};
+  }
+`,results:e=>`
+  align-items: center;
+  color: ${e.colors.pagination.input.foreground};
+  font-family: ${e.typography.font.brand};
+  display: flex;
+  font-size: ${e.typography.size.normal};
+  flex-shrink: 0;
+
+  .select-page-size {
+    margin: 0 ${e.spacing.one};
+    max-width: 90px;
+    .value-children > div:first-of-type {
+      color: ${e.colors.pagination.input.foreground};
+    }
+  }
+`}},17982:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let l=a(n(67294)),u=i(n(85444)),s=u.default.div`
+  display: inline-flex;
+  flex-direction: ${e=>e.inline?"row":"column"};
+  ${e=>e.inline&&"width: 100%;"}
+
+  & > *:not(:last-of-type) {
+    ${e=>e.inline?"margin-right: 15px;":"margin-bottom: 15px;"}
+  }
+`;s.displayName="RadioGroup",t.default=function({name:e,children:t,onChange:n,inline:r,className:o,selected:a}){let[i,u]=(0,l.useState)(void 0!==a?a:null),c=e=>{u(e.target.value||e.target.id),n&&n(e)};return l.default.createElement(s,{className:o,inline:r},l.default.Children.map(t,t=>l.default.isValidElement(t)&&l.default.cloneElement(t,{name:e,checked:(t.props.value||t.props.id)===i,onChange:c})))}},18885:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=t.RadioGroup=void 0;let l=a(n(67294)),u=a(n(85444)),s=n(7347),c=i(n(90878)),d=i(n(93967)),f=i(n(2559));t.Styles=f.default;let p=i(n(17982));t.RadioGroup=p.default;let g=u.default.div`
+  ${e=>f.default.radio(e.theme)}
+`;g.displayName="Radio",t.default=function({checked:e=!1,className:t,disabled:n=!1,id:r,label:o,name:a,value:i,onChange:f=()=>{}}){let p=(0,l.useContext)(s.KaizenThemeContext),[m,b]=(0,l.useState)(e),[h,v]=(0,l.useState)(!1);(0,l.useEffect)(()=>{b(e)},[e]);let y=(0,d.default)(t,{disabled:n,"has-focus":h,checked:m});return l.default.createElement(u.ThemeProvider,{theme:p},l.default.createElement(g,{className:y,"data-testid":"kui-radio",disabled:n},l.default.createElement("label",{htmlFor:r},l.default.createElement("input",{id:r,name:null!=a?a:r,type:"radio",disabled:n,checked:m,onChange:e=>{b(e.target.checked),f(e)},onFocus:()=>v(!0),onBlur:()=>v(!1),value:i}),l.default.createElement("div",{className:"radio-display"}),o&&l.default.createElement(c.default,{className:"radio-text",textStyle:"optionLabel"},o))))}},2559:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={radio:e=>`
+  position: relative;
+  display: inline-flex;
+  opacity: 1;
+
+  &.disabled {
+    .radio-display,
+    label,
+    input {
+      cursor: not-allowed;
+    }
+
+    .radio-display {
+      background: ${e.colors.formField.disabled.background};
+      border-color: ${e.colors.formField.disabled.border};
+    }
+  }
+
+  &.has-focus .radio-display {
+    border-color: ${e.colors.radio.focus.border}
+  }
+
+  &.checked .radio-display::after {
+    background-color: ${e.colors.formField.enabled.checked}
+  }
+
+  &.disabled.checked .radio-display::after {
+    background-color: ${e.colors.formField.disabled.checked};
+  }
+
+  .radio-display {
+    position: relative;
+    display: inline-block;
+    box-sizing: border-box;
+    width: 14px;
+    height: 14px;
+    pointer-events: none;
+    flex-shrink: 0;
+    border-radius: 50%;
+    background-color: ${e.colors.formField.enabled.background};
+    border: 1px solid ${e.colors.formField.enabled.border};
+    cursor: pointer;
+
+    &::after {
+      position: absolute;
+      top: 0;
+      right: 0;
+      bottom: 0;
+      left: 0;
+      border-radius: 50%;
+      display: inline-block;
+      width: 100%;
+      height: 100%;
+      margin: auto;
+      content: '';
+      transform: scale(0.6);
+      vertical-align: middle;
+      background: transparent;
+      transition: background 0.2s ease-out;
+    }
+
+    .checked &::after {
+      background-color: ${e.colors.radio.check.background}
+    }
+  }
+  
+  label {
+    display: flex;
+    margin-right: ${e.spacing.one};
+    align-items: center;
+    cursor: pointer;
+  }
+
+  input {
+    position: absolute;
+    opacity: 0;
+    cursor: pointer;
+  }
+
+  .radio-text {
+    color: ${e.colors.radio.foreground};
+    font-family: ${e.typography.font.body};
+    margin-left: ${e.spacing.two};
+  }
+`}},77:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.STATUS_SUBTITLE=t.STATUS_TITLE=t.STATUS_ICONS=t.STATUS_WARNING=t.STATUS_SUCCESS=t.STATUS_NO_RESULTS=t.STATUS_INFO=t.STATUS_LOADING=t.STATUS_ERROR=void 0,t.STATUS_ERROR="error",t.STATUS_LOADING="loading",t.STATUS_INFO="info",t.STATUS_NO_RESULTS="noResults",t.STATUS_SUCCESS="success",t.STATUS_WARNING="warning",t.STATUS_ICONS={[t.STATUS_ERROR]:"CloudError",[t.STATUS_INFO]:"MessengerCircleExclamation",[t.STATUS_NO_RESULTS]:"ActionsFilter",[t.STATUS_SUCCESS]:"CloudCheckmark",[t.STATUS_WARNING]:"CloudWarning"},t.STATUS_TITLE={[t.STATUS_ERROR]:"Something went wrong.",[t.STATUS_LOADING]:"Loading...",[t.STATUS_NO_RESULTS]:"No results found.",[t.STATUS_SUCCESS]:"Success",[t.STATUS_WARNING]:"Warning"},t.STATUS_SUBTITLE={[t.STATUS_ERROR]:"Please try again later. If you feel this is in error, contact your administrator.",[t.STATUS_LOADING]:"Please wait.",[t.STATUS_NO_RESULTS]:"Try changing your options."},t.default={STATUS_ERROR:t.STATUS_ERROR,STATUS_ICONS:t.STATUS_ICONS,STATUS_INFO:t.STATUS_INFO,STATUS_LOADING:t.STATUS_LOADING,STATUS_NO_RESULTS:t.STATUS_NO_RESULTS,STATUS_SUBTITLE:t.STATUS_SUBTITLE,STATUS_SUCCESS:t.STATUS_SUCCESS,STATUS_TITLE:t.STATUS_TITLE,STATUS_WARNING:t.STATUS_WARNING}},6427:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=t.resultConstants=void 0;let l=a(n(67294)),u=a(n(85444)),s=i(n(57299)),c=a(n(5801)),d=i(n(66379)),f=n(7347),p=i(n(90878)),g=a(n(77)),m=i(n(81185));t.Styles=m.default;let b=u.default.div`
+  ${e=>m.default.details(e.theme)}
+`;b.displayName="Details";let h=u.default.div`
+  ${e=>m.default.result(e.theme)}
+`;h.displayName="Result";let v=u.default.div`
+  ${e=>m.default.statusIcon(e.theme,e.statusBackgroundColor)}
+`;v.displayName="StatusIcon",t.resultConstants=g,t.default=function({actions:e,children:t,icon:n,status:r="info",statusBackgroundColor:o,className:a,subTitle:i,title:m}){var y;let w=(0,l.useContext)(f.KaizenThemeContext);return l.default.createElement(u.ThemeProvider,{theme:w},l.default.createElement(h,{className:a,"data-testid":"kui-result"},r===g.STATUS_LOADING?l.default.createElement(d.default,{size:"large"}):l.default.createElement(v,{statusBackgroundColor:null!=o?o:w.colors.result.statusBackground},l.default.createElement(s.default,Object.assign({color:w.colors.result.statusForeground,name:null!==(y=g.STATUS_ICONS[r])&&void 0!==y?y:g.STATUS_ICONS.info,size:80},n))),l.default.createElement(p.default,{tag:"h2",textStyle:"h2"},null!=m?m:g.STATUS_TITLE[r]),(i||g.STATUS_SUBTITLE[r])&&l.default.createElement(p.default,{tag:"p",textStyle:"p1"},null!=i?i:g.STATUS_SUBTITLE[r]),e&&l.default.createElement(c.ButtonGroup,null,Array.isArray(e)?e.map((e,t)=>l.default.createElement(c.default,Object.assign({key:t},e))):l.default.createElement(c.default,Object.assign({},e))),t&&l.default.createElement(b,null,t)))}},81185:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={details:e=>`
+  background: ${e.colors.result.detailsBackground};
+  box-sizing: border-box;
+  margin-top: ${e.spacing.five};
+  padding: ${e.spacing.five};
+  width: 100%;
+`,result:e=>`
+  align-items: center;
+  background: ${e.colors.result.background};
+  border: 1px solid ${e.colors.result.border};
+  box-sizing: border-box;
+  display: flex;
+  flex-direction: column;
+  padding: ${e.spacing.eight};
+  width: 100%;
+
+  > h2 {
+    margin: ${e.spacing.six} 0 0 0;
+  }
+`,statusIcon:(e,t)=>`
+  background: ${t};
+  box-sizing: unset;
+  border-radius: 50%;
+  display: flex;
+  opacity: 0.8;
+  overflow: visible;
+  padding: ${e.spacing.seven};
+`}},66379:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let l=a(n(67294)),u=i(n(93967)),s=a(n(85444)),c=n(49123),d=n(7347),f=(0,s.keyframes)`
+  0% { opacity: 0.1; }
+  30% { opacity: 1; }
+  100% { opacity: 0.1; }
+`,p=s.default.div`
+  display: flex;
+  flex-direction: column;
+  align-items: center;
+`;p.displayName="Spinner";let g=s.default.div`
+  display: flex;
+`;g.displayName="SpinnerRow";let m=s.default.div`
+  width: 0;
+  height: 0;
+  margin: 0 ${e=>-(e.size/2)}px;
+  border-left: ${e=>e.size}px solid transparent;
+  border-right: ${e=>e.size}px solid transparent;
+  border-bottom: ${e=>1.8*e.size}px solid
+    ${e=>e.theme.colors.spinner.color};
+  animation: ${f} ${e=>`${e.time}s`} infinite;
+  filter: drop-shadow(
+    0 0 ${e=>1.5*e.size}px
+      ${e=>(0,c.transparentize)(.4,e.theme.colors.spinner.glow)}
+  );
+
+  ${e=>"down"===e.direction&&"transform: rotate(180deg);"}
+
+  animation-delay: ${e=>`${-(e.time/("inner"===e.side?6:18))*e.number}s`};
+`;m.displayName="SpinnerArrow";let b={tiny:4,small:8,medium:12,large:16};t.default=function({className:e,size:t="medium",time:n=1}){let r=(0,l.useContext)(d.KaizenThemeContext),o=(0,u.default)("kaizen-ui-loader",e),a="string"==typeof t?b[t]:t;return l.default.createElement(s.ThemeProvider,{theme:r},l.default.createElement(p,{className:o,"data-testid":"kui-spinner",size:a},l.default.createElement(g,null,l.default.createElement(m,{direction:"up",side:"outer",size:a,number:18,time:n}),l.default.createElement(m,{direction:"down",side:"outer",size:a,number:17,time:n}),l.default.createElement(m,{direction:"up",side:"outer",size:a,number:16,time:n})),l.default.createElement(g,null,l.default.createElement(m,{direction:"up",side:"outer",size:a,number:18,time:n}),l.default.createElement(m,{direction:"down",side:"outer",size:a,number:17,time:n}),l.default.createElement(m,{direction:"up",side:"outer",size:a,number:16,time:n}),l.default.createElement(m,{direction:"down",side:"outer",size:a,number:15,time:n}),l.default.createElement(m,{direction:"up",side:"outer",size:a,number:14,time:n})),l.default.createElement(g,null,l.default.createElement(m,{direction:"up",side:"outer",size:a,number:1,time:n}),l.default.createElement(m,{direction:"down",side:"outer",size:a,number:2,time:n}),l.default.createElement(m,{direction:"up",side:"inner",size:a,number:6,time:n}),l.default.createElement(m,{direction:"down",side:"inner",size:a,number:5,time:n}),l.default.createElement(m,{direction:"up",side:"inner",size:a,number:4,time:n}),l.default.createElement(m,{direction:"down",side:"outer",size:a,number:13,time:n}),l.default.createElement(m,{direction:"up",side:"outer",size:a,number:12,time:n})),l.default.createElement(g,null,l.default.createElement(m,{direction:"down",side:"outer",size:a,number:3,time:n}),l.default.createElement(m,{direction:"up",side:"outer",size:a,number:4,time:n}),l.default.createElement(m,{direction:"down",side:"inner",size:a,number:1,time:n}),l.default.createElement(m,{direction:"up",side:"inner",size:a,number:2,time:n}),l.default.createElement(m,{direction:"down",side:"inner",size:a,number:3,time:n}),l.default.createElement(m,{direction:"up",side:"outer",size:a,number:11,time:n}),l.default.createElement(m,{direction:"down",side:"outer",size:a,number:10,time:n}))))}},75168:function(e,t,n){"use strict";var r=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let o=r(n(67294)),a=r(n(85444)),i=r(n(5801)),l=r(n(57299)),u=r(n(24777)),s=n(25394),c=r(n(91656)),d=a.default.div`
+  ${e=>c.default.bulkActions(e.theme)}
+`;d.displayName="BulkActions";let f=a.default.div`
+  ${e=>c.default.portal(e.theme)}
+`;f.displayName="BulkActionsPortal";let p=(0,a.default)(u.default)`
+  ${e=>c.default.portalFilter(e.theme)}
+`;p.displayName="BulkActionsPortalFilter";let g=a.default.button`
+  ${e=>c.default.bulkAction(e.theme,e.critical,e.disabled)}
+`;g.displayName="BulkAction",t.default=({bulkActions:e,selectedFlatRows:t,toggleAllRowsSelected:n})=>{let[r,a]=o.default.useState(void 0),[u,c]=o.default.useState(""),[m,b]=o.default.useState(!1),h=e=>{e.stopPropagation(),b(e=>!e)};return o.default.createElement(s.RelativePortal,{origin:"top-left",anchor:"top-left",onOutsideClick:h,Parent:o.default.createElement(d,null,o.default.createElement(i.default,{icon:{placement:"right",name:m?"ArrowCaretUp":"ArrowCaretDown",variant:"regular"},onClick:h,type:(null==r?void 0:r.critical)?"critical":"secondary",variant:"outline"},r?r.label:"Bulk Actions"),o.default.createElement(i.default,{disabled:0===t.length||!r||r.disabled,onClick:()=>{r&&(r.onClick({rows:t,values:t.map(e=>e.values)}),n(!1))},type:(null==r?void 0:r.critical)?"critical":"primary"},"Apply"))},m&&o.default.createElement(f,{onClick:e=>e.stopPropagation()},o.default.createElement(p,{onChange:e=>c(e.target.value),placeholder:"Filter actions",value:u}),e.filter(e=>String(e.label).toLowerCase().includes(String(u).toLowerCase())).map(e=>o.default.createElement(g,{disabled:e.disabled,critical:e.critical||!1,onClick:t=>{a(e),h(t)},type:"button"},e.icon&&o.default.createElement(l.default,Object.assign({},e.icon)),e.label))))}},95723:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let l=a(n(67294)),u=n(79521),s=i(n(85444)),c=n(25394),d=i(n(62256)),f=i(n(91656)),p="Global",g=s.default.div`
+  ${e=>f.default.globalSearch(e.theme)}
+`;g.displayName="GlobalSearch",t.default=({disableGlobalFilter:e,filters:t,globalFilter:n,globalFilterKey:r,globalSearchPlaceholder:o="Search...",setAllFilters:a,setGlobalFilter:i,setFilter:s})=>{let f=(0,u.useAsyncDebounce)(e=>i(e),200),m=l.default.useMemo(()=>{let e=({id:e,index:t=0,value:n})=>{let o=Array.isArray(n)?n[t]:n,a="object"==typeof o?o.label||o.value:o,l=Array.isArray(n)&&n.length>0?n.filter((e,n)=>n!==t):void 0;return{color:e===p?"gray":"green",id:e,onClear:e===p?()=>i(void 0):()=>s(e,l),value:e===p?`${null!=r?r:(0,c.camelCaseToHuman)(e)}: ${a}`:`${(0,c.camelCaseToHuman)(e)}: ${a}`}},o=t.flatMap(t=>Array.isArray(t.value)?t.value.map((n,r)=>e(Object.assign(Object.assign({},t),{index:r}))):e(t));return n&&o.push(e({id:p,value:n})),o},[t,n,r,s,i]),b=(0,l.useCallback)(e=>{0===e.length&&(i(void 0),t.length>0&&a([])),e.forEach(e=>"string"==typeof e&&f(e))},[t,i,a,f]);return l.default.createElement(g,null,l.default.createElement(d.default,{disableInput:e,icon:{name:"ActionsFilter",variant:"solid"},inline:!0,onChange:b,placeholder:o,showClearButton:!0,values:m}))}},91828:function(e,t,n){"use strict";var r=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let o=r(n(67294)),a=r(n(85444)),i=r(n(91656)),l=a.default.div`
+  ${e=>i.default.results(e.theme)}
+`;l.displayName="Results",t.default=({pageCount:e,pageIndex:t,pageSize:n,rowsLength:r,totalResults:a})=>{let i;let u=n*(t+1);return i=a||(e?`~${e*n}`:r),o.default.createElement(l,{className:"results"},`Showing ${n*t+1} - ${u>i?i:u} of ${i}`)}},55730:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let l=i(n(67294)),u=i(n(85444)),s=a(n(13258)),c=i(n(91656)),d=(0,u.default)(s.default)`
+  ${c.default.rowButton}
+`;d.displayName="RowActionsComponent",t.default=({onOpen:e,row:t,rowActions:n,width:r=200})=>{let o=Array.isArray(n)?n:n({row:t,values:t.values});return l.default.createElement(d,{onOpen:e?()=>e({row:t,values:t.values}):void 0,position:"top-right",width:r},o.map(e=>{let n="info"===e.type?s.ActionMenuInfo:s.ActionMenuItem;return n="divider"===e.type?s.ActionMenuDivider:n,l.default.createElement(n,Object.assign({},e,{onClick:()=>e.onClick({row:t,values:t.values})}))}))}},73305:function(e,t,n){"use strict";var r=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let o=r(n(67294)),a=r(n(85444)),i=r(n(5801)),l=r(n(40398)),u=r(n(24777)),s=n(25394),c=r(n(91656)),d=a.default.div`
+  ${e=>c.default.settings(e.theme)}
+`;d.displayName="Settings";let f=(0,a.default)(i.default)`
+  ${e=>c.default.settingsButton(e.theme)}
+`;f.displayName="SettingsButton";let p=a.default.div`
+  ${e=>c.default.portal(e.theme)}
+`;p.displayName="SettingsPortal";let g=a.default.div`
+  ${e=>c.default.settingsVisibilityActions(e.theme)}
+`;g.displayName="SettingsVisibilityActions";let m=a.default.div`
+  ${e=>c.default.settingsResizingActions(e.theme)}
+`;m.displayName="SettingsResizingActions";let b=(0,a.default)(u.default)`
+  ${e=>c.default.portalFilter(e.theme)}
+`;b.displayName="SettingsPortalFilter";let h=(0,a.default)(l.default)`
+  ${e=>c.default.settingCheckbox(e.theme)}
+`;function v(e,t){return String((0,s.camelCaseToHuman)(t)).toLowerCase().includes(String(e).toLowerCase())}h.displayName="SettingCheckbox",t.default=({allColumns:e,columnResizing:t,defaultHiddenColumns:n,disableResizing:r,hiddenColumns:a,resetResizing:l,setHiddenColumns:u,toggleHideAllColumns:c})=>{let[y,w]=o.default.useState(""),[S,C]=o.default.useState(!1),x=e=>{e.stopPropagation(),C(e=>!e)},E=e.filter(e=>!1===e.disableColumnHiding).filter(e=>v(y,e.id)||v(y,e.exportValue)).map(e=>({label:e.Header&&"string"==typeof e.Header?e.Header:(0,s.camelCaseToHuman)(e.id),checked:e.getToggleHiddenProps().checked,toggleHidden:e.toggleHidden})),R=!1;return n&&a&&!(0,s.primitiveArrayEquals)(n,a)?R=!0:!n&&(null==a?void 0:a.length)&&(R=!0),t&&!(0,s.isEmptyObject)(null==t?void 0:t.columnWidths)&&(R=!0),o.default.createElement(s.RelativePortal,{origin:"top-right",anchor:"top-right",onOutsideClick:x,Parent:o.default.createElement(d,null,o.default.createElement(f,{icon:{name:"SettingsCog",variant:"regular"},onClick:x,type:"secondary",variant:"link"}),R&&o.default.createElement("span",{className:"badge"})),width:250},S&&o.default.createElement(p,{onClick:e=>e.stopPropagation()},o.default.createElement(b,{onChange:e=>w(e.target.value),placeholder:"Filter columns",value:y}),E.map(({checked:e,label:t,toggleHidden:n})=>o.default.createElement(h,{key:t,checked:e,label:t,onChange:()=>n(e)})),o.default.createElement(g,null,n&&o.default.createElement(i.default,{onClick:()=>c(!1),size:"small",type:"secondary",variant:"link"},"Show All"),o.default.createElement(i.default,{onClick:()=>u(n||[]),size:"small",type:"secondary",variant:"outline"},"Reset")),!r&&o.default.createElement(m,null,o.default.createElement("hr",null),o.default.createElement(i.default,{disabled:(0,s.isEmptyObject)(null==t?void 0:t.columnWidths),onClick:l,size:"small",type:"secondary",variant:"outline"},"Reset Column Widths"))))}},12170:function(e,t,n){"use strict";var r=this&&this.__rest||function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&0>t.indexOf(r)&&(n[r]=e[r]);if(null!=e&&"function"==typeof Object.getOwnPropertySymbols)for(var o=0,r=Object.getOwnPropertySymbols(e);o<r.length;o++)0>t.indexOf(r[o])&&Object.prototype.propertyIsEnumerable.call(e,r[o])&&(n[r[o]]=e[r[o]]);return n},o=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=o(n(67294)),i=o(n(85444)),l=o(n(57299)),u=n(7347),s=o(n(91656)),c=i.default.div`
+  ${e=>s.default.sort(e.theme)}
+`;t.default=e=>{var{isSorted:t,isSortedDesc:n}=e,o=r(e,["isSorted","isSortedDesc"]);let i=a.default.useContext(u.KaizenThemeContext);return a.default.createElement(c,Object.assign({},o),a.default.createElement("div",{className:"icons"},a.default.createElement(l.default,{color:t&&!n?i.colors.table.header.sortActive:i.colors.table.header.sortInActive,name:"ArrowCaretUp",size:"smaller",variant:t&&!n?"solid":"regular"}),a.default.createElement(l.default,{color:n?i.colors.table.header.sortActive:i.colors.table.header.sortInActive,name:"ArrowCaretDown",size:"smaller",variant:n?"solid":"regular"})))}},98297:function(e,t,n){"use strict";var r=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let o=r(n(67294)),a=r(n(85444)),i=n(25394),l=n(88084),u=r(n(91656)),s=a.default.div`
+  ${e=>u.default.extendedRow(e.theme,e.minWidth)}
+`;s.displayName="ExtendedRow";let c=a.default.div`
+  ${e=>u.default.td(e.theme,e.canClick,e.columnId)}
+`;c.displayName="Td";let d=a.default.div`
+  ${e=>u.default.tr(e.theme)}
+`;d.displayName="Tr",t.default=({ExpandedRowComponent:e,prepareRow:t,rowOnClick:n,rows:r,totalColumnsWidth:a,getColumnProps:u,getCellProps:f,getRowProps:p})=>o.default.createElement(o.default.Fragment,null,r.map(r=>{t(r);let g=(0,i.hashString)(JSON.stringify(r.original));return o.default.createElement(o.default.Fragment,{key:`table-row-${g}-container`},o.default.createElement(d,Object.assign({},r.getRowProps([{style:{minWidth:a}},p(r)]),{key:`table-row-${g}`}),r.cells.map(e=>o.default.createElement(c,Object.assign({},e.getCellProps([{canClick:!e.column.disableRowOnClick&&!!n,columnId:e.column.id},{className:e.column.className,style:e.column.style},u(e.column),f(e)]),{key:`table-row-${g}-cell-${e.column.id}`,onClick:!e.column.disableRowOnClick&&n?()=>{"function"==typeof n?n({row:e.row,values:e.row.values}):n===l.EXPAND_ROW_ON_CLICK?r.toggleRowExpanded():n===l.SELECT_ROW_ON_CLICK&&r.toggleRowSelected()}:void 0,title:e.value}),e.render("Cell")))),r.isExpanded&&e&&o.default.createElement(s,{minWidth:a},o.default.createElement(e,{row:r})))}))},59688:function(e,t,n){"use strict";var r=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.HeaderFilter=void 0;let o=r(n(67294)),a=r(n(85444)),i=r(n(57299)),l=n(7347),u=n(25394),s=r(n(12170)),c=r(n(91656)),d=a.default.div`
+  ${c.default.cellOverflow}
+`;d.displayName="Header";let f=a.default.div`
+  ${e=>c.default.headerFilterComponent(e.theme)}
+`;f.displayName="HeaderFilterComponent";let p=a.default.div`
+  ${c.default.headerFilterIcon}
+`;p.displayName="HeaderFilterIcon";let g=a.default.div`
+  ${e=>c.default.headerFilterPortal(e.theme)}
+`;g.displayName="HeaderFilterPortal";let m=a.default.div`
+  ${e=>c.default.resizer(e.theme)}
+`;m.displayName="Resizer";let b=a.default.div`
+  ${e=>c.default.th(e.theme,e.id)}
+`;b.displayName="Th";let h=a.default.div`
+  ${e=>c.default.trh(e.theme)}
+`;h.displayName="Tr",t.HeaderFilter=({column:e})=>{let t=o.default.useContext(l.KaizenThemeContext),[n,r]=o.default.useState(!1),a=()=>r(e=>!e);return o.default.createElement(u.RelativePortal,{anchor:"top-left",onOutsideClick:a,origin:"top-left",Parent:o.default.createElement(f,null,o.default.createElement("button",{onClick:e=>{e.stopPropagation(),a()},type:"button"},o.default.createElement(d,null,e.render("Header")),o.default.createElement(p,null,o.default.createElement(i.default,{color:e.filterValue?t.colors.table.header.columnFilterIndicatorActive:t.colors.table.header.columnFilterIndicator,name:"ActionsFilterSquare",size:"small",variant:e.filterValue?"solid":"regular"})))),parentClassName:"filter-parent",portalClassName:"filter-portal",width:e.filterWidth},n&&o.default.createElement(g,{onClick:e=>e.stopPropagation()},e.render("Filter")))},t.default=({getColumnProps:e,getHeaderProps:n,headerGroups:r,totalColumnsWidth:a})=>o.default.createElement(o.default.Fragment,null,r.map(r=>o.default.createElement(h,Object.assign({},r.getHeaderGroupProps({style:{minWidth:a}})),r.headers.map(r=>o.default.createElement(b,Object.assign({},r.getHeaderProps([{id:r.id},{className:r.className,style:r.style},e(r),n(r)]),{title:r.exportValue}),r.canFilter?o.default.createElement(t.HeaderFilter,{column:r}):r.render("Header"),r.canSort&&o.default.createElement(s.default,Object.assign({},r.getSortByToggleProps(),{isSorted:r.isSorted,isSortedDesc:r.isSortedDesc})),r.canResize&&o.default.createElement(m,Object.assign({},r.getResizerProps())))))))},99544:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let l=i(n(67294)),u=i(n(85444)),s=a(n(6427)),c=i(n(98297)),d=i(n(59688)),f=i(n(91656)),p=u.default.div`
+  ${e=>f.default.table(e.theme)}
+`;p.displayName="Table",t.default=({tableInstance:e,tableProps:t})=>l.default.createElement(p,Object.assign({},e.getTableProps({style:{minWidth:e.totalColumnsWidth}})),l.default.createElement(d.default,{getColumnProps:t.getColumnProps,getHeaderProps:t.getHeaderProps,headerGroups:e.headerGroups,totalColumnsWidth:e.totalColumnsWidth}),0!==e.page.length||t.fetching?l.default.createElement(c.default,{ExpandedRowComponent:t.ExpandedRowComponent,prepareRow:e.prepareRow,rowOnClick:t.rowOnClick,rows:e.page,totalColumnsWidth:e.totalColumnsWidth,getColumnProps:t.getColumnProps,getCellProps:t.getCellProps,getRowProps:t.getRowProps}):l.default.createElement(s.default,{status:s.resultConstants.STATUS_NO_RESULTS}))},88084:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.DEFAULT_INITIAL_STATE=t.INITIAL_PAGE_INDEX=t.INITIAL_PAGE_SIZE=t.GO_TO_PAGE=t.SELECT_SINGLE_ROW=t.SELECT_ROW_ON_CLICK=t.EXPAND_ROW_ON_CLICK=t.ROW_CLICKED_SELECT_NONE=t.ROW_CLICKED_SELECT_ALL=t.LOCAL_STORAGE_KEY=void 0,t.LOCAL_STORAGE_KEY="kui::table::",t.ROW_CLICKED_SELECT_ALL="selectAll",t.ROW_CLICKED_SELECT_NONE="selectNone",t.EXPAND_ROW_ON_CLICK="expandRow",t.SELECT_ROW_ON_CLICK="selectRow",t.SELECT_SINGLE_ROW="selectSingleRow",t.GO_TO_PAGE="gotoPage",t.INITIAL_PAGE_SIZE=25,t.INITIAL_PAGE_INDEX=0,t.DEFAULT_INITIAL_STATE={pageIndex:t.INITIAL_PAGE_INDEX,pageSize:t.INITIAL_PAGE_SIZE,sortBy:[]},t.default={DEFAULT_INITIAL_STATE:t.DEFAULT_INITIAL_STATE,EXPAND_ROW_ON_CLICK:t.EXPAND_ROW_ON_CLICK,INITIAL_PAGE_INDEX:t.INITIAL_PAGE_INDEX,INITIAL_PAGE_SIZE:t.INITIAL_PAGE_SIZE,LOCAL_STORAGE_KEY:t.LOCAL_STORAGE_KEY,ROW_CLICKED_SELECT_ALL:t.ROW_CLICKED_SELECT_ALL,ROW_CLICKED_SELECT_NONE:t.ROW_CLICKED_SELECT_NONE,SELECT_ROW_ON_CLICK:t.SELECT_ROW_ON_CLICK}},57539:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__awaiter||function(e,t,n,r){return new(n||(n=Promise))(function(o,a){function i(e){try{u(r.next(e))}catch(e){a(e)}}function l(e){try{u(r.throw(e))}catch(e){a(e)}}function u(e){var t;e.done?o(e.value):((t=e.value)instanceof n?t:new n(function(e){e(t)})).then(i,l)}u((r=r.apply(e,t||[])).next())})},l=this&&this.__rest||function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&0>t.indexOf(r)&&(n[r]=e[r]);if(null!=e&&"function"==typeof Object.getOwnPropertySymbols)for(var o=0,r=Object.getOwnPropertySymbols(e);o<r.length;o++)0>t.indexOf(r[o])&&Object.prototype.propertyIsEnumerable.call(e,r[o])&&(n[r[o]]=e[r[o]]);return n},u=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=t.tableConstants=void 0;let s=a(n(67294)),c=a(n(85444)),d=n(79521),f=u(n(5801)),p=u(n(40398)),g=u(n(28829)),m=u(n(30038)),b=u(n(18885)),h=a(n(6427)),v=u(n(66379)),y=n(7347),w=u(n(24777)),S=n(25394),C=a(n(88084));t.tableConstants=C;let x=u(n(10532)),E=u(n(42630)),R=u(n(75168)),k=u(n(95723)),_=u(n(91828)),O=u(n(55730)),P=u(n(73305)),A=u(n(99544)),T=u(n(91656));t.Styles=T.default;let I=n(88084),$=c.default.div`
+  ${T.default.cellOverflow}
+`,z=(0,c.default)(w.default)`
+  ${T.default.columnFilterTextbox}
+`;z.displayName="ColumnFilterTextbox";let F=c.default.div`
+  ${({align:e="flex-start"})=>T.default.columnThird({align:e})}
+`;F.displayName="ColumnThird";let j=(0,c.default)(f.default)`
+  ${T.default.rowButton}
+`;j.displayName="ExpandRowButton";let N=c.default.div`
+  ${e=>T.default.header(e.theme,e.minWidth)}
+`;N.displayName="Header";let B=(0,c.default)(g.default)`
+  ${e=>T.default.pagination(e.theme,e.minWidth)}
+`;B.displayName="Pagination";let L=c.default.div`
+  ${T.default.tableContainer}
+`;L.displayName="TableContainer";let G=Object.assign(Object.assign({},C),h.resultConstants),M={disableColumnHiding:!1,disableExport:!1,disableGlobalFilter:!1,disableFilters:!1,disableResizing:!1,disableRowOnClick:!1,disableSortBy:!1,Cell:({value:e})=>s.default.createElement($,null,e?String(e):"\xa0"),Filter:({column:{filterValue:e,setFilter:t}})=>{let[n,r]=s.default.useState(e),o=(0,d.useAsyncDebounce)(e=>t(e),700);return s.default.createElement(z,{value:n,onChange:e=>{r(e.target.value),o(e.target.value)},onKeyDown:e=>{if("Enter"===e.key){let{value:n}=e.target;r(n),t(n)}}})},Header:({column:e})=>s.default.createElement($,null,(0,S.camelCaseToHuman)(e.id)),minWidth:40,width:150},W=[d.useFlexLayout,d.useResizeColumns,d.useGlobalFilter,d.useFilters,d.useSortBy,d.useExpanded,d.usePagination,d.useRowSelect,E.default,x.default],D=[{value:25,label:"25"},{value:50,label:"50"},{value:100,label:"100"}],H=()=>({}),U=()=>{},V=({exportData:e,open:t,setOpen:n})=>{let[r,o]=s.default.useState("data"),a=(0,s.useCallback)(()=>{e(r),n(!1),o("data")},[r,n,o,e]),i=(0,s.useCallback)(e=>{"keyCode"in e&&13===e.keyCode&&a()},[a]);return s.default.useEffect(()=>(window.addEventListener("keydown",i),()=>window.removeEventListener("keydown",i)),[i]),s.default.createElement(m.default,{footer:s.default.createElement(s.default.Fragment,null,s.default.createElement(f.default,{onClick:a},"Export"),s.default.createElement(f.default,{onClick:()=>n(!1),type:"secondary",variant:"outline"},"Cancel")),open:t,onClose:()=>n(!1),title:"Export Table"},s.default.createElement(w.default,{autoFocus:!0,label:"Filename",onChange:e=>o(e.target.value),value:r}))};t.default=function(e){var t,n,r,{autoResetExpanded:o=!0,autoResetFilters:a=!0,autoResetGlobalFilter:u=!0,autoResetHiddenColumns:g=!0,autoResetPage:m=!0,autoResetSelectedRows:w=!0,autoResetSortBy:S=!0,bulkActions:C,className:x,columns:E,data:T,DataViewComponent:$=A.default,disableColumnHiding:z=!1,disableExport:K=!1,disableFilters:Z=!1,disableGlobalFilter:q=!1,disablePagination:X=!1,disableResizing:Q=!1,disableSortBy:J=!1,ExpandedRowComponent:Y,expandedRowExport:ee,fetchData:et,fetching:en=!1,getCellProps:er=H,getColumnProps:eo=H,getHeaderProps:ea=H,getRowProps:ei=H,globalFilter:el,globalFilterKey:eu,globalSearchPlaceholder:es,id:ec,initialState:ed,pageCount:ef,paginationPageSizeOptions:ep=D,rowActions:eg,rowActionsMenuOnOpen:em,rowActionsMenuWidth:eb,rowOnSelect:eh,rowSelectSingle:ev,status:ey,totalResults:ew,stateReducer:eS}=e,eC=l(e,["autoResetExpanded","autoResetFilters","autoResetGlobalFilter","autoResetHiddenColumns","autoResetPage","autoResetSelectedRows","autoResetSortBy","bulkActions","className","columns","data","DataViewComponent","disableColumnHiding","disableExport","disableFilters","disableGlobalFilter","disablePagination","disableResizing","disableSortBy","ExpandedRowComponent","expandedRowExport","fetchData","fetching","getCellProps","getColumnProps","getHeaderProps","getRowProps","globalFilter","globalFilterKey","globalSearchPlaceholder","id","initialState","pageCount","paginationPageSizeOptions","rowActions","rowActionsMenuOnOpen","rowActionsMenuWidth","rowOnSelect","rowSelectSingle","status","totalResults","stateReducer"]);let ex=s.default.useContext(y.KaizenThemeContext),[eE,eR]=s.default.useState(!1),ek=(0,d.useTable)(Object.assign({autoResetExpanded:o,autoResetFilters:a,autoResetGlobalFilter:u,autoResetHiddenColumns:g,autoResetPage:m,autoResetSelectedRows:w,autoResetSortBy:S,columns:E,globalFilter:null!=el?el:void 0,data:T,defaultColumn:M,disableFilters:Z,disableGlobalFilter:q,disableResizing:Q,disableSortBy:J,expandedRowExport:ee,expandSubRows:!1,id:ec,initialState:Object.assign(Object.assign(Object.assign({},G.DEFAULT_INITIAL_STATE),{pageSize:X?T.length:G.INITIAL_PAGE_SIZE}),ed),manualFilters:!!et,manualGlobalFilter:!!et,manualPagination:!!ef,manualSortBy:!!et,pageCount:null!=ef?ef:void 0,paginationPageSizeOptions:ep,rowActions:eg,stateReducer:(e,t,n)=>{let r=e;switch(t.type){case I.SELECT_SINGLE_ROW:r=Object.assign(Object.assign({},n),{selectedRowIds:t.selectedRowIds});break;case I.GO_TO_PAGE:r=Object.assign(Object.assign({},e),{pageIndex:null==t?void 0:t.pageIndex})}return"function"==typeof eS&&(r=eS(r,t,n)),r}},eC),...W,e=>{e.allColumns.push(e=>{let t=(null!=C?C:eh)?[{canHide:!1,Cell:({row:e,selectedFlatRows:t})=>s.default.createElement(s.default.Fragment,null,ev?s.default.createElement(b.default,Object.assign({},e.getToggleRowSelectedProps({onChange:()=>{ek.dispatch({type:I.SELECT_SINGLE_ROW,selectedRowIds:{[e.id]:!0}}),eh&&eh({rowClicked:e})}}),{id:`table-row-select-single-${e.index}`,name:"table-row-select-single"})):s.default.createElement(p.default,Object.assign({},e.getToggleRowSelectedProps({onChange:()=>i(this,void 0,void 0,function*(){yield e.toggleRowSelected(),eh&&eh({rowClicked:e,selectedFlatRows:e.isSelected?[...t,e]:t.filter(({id:t})=>e.id!==t)})})})))),disableColumnHiding:!0,disableExport:!0,disableFilters:!0,disableGlobalFilter:!0,disableResizing:!0,disableRowOnClick:!0,disableSortBy:!0,Header:({getToggleAllPageRowsSelectedProps:e,page:t,toggleAllPageRowsSelected:n})=>s.default.createElement(s.default.Fragment,null,ev?null:s.default.createElement(p.default,Object.assign({},e({onChange:()=>i(this,void 0,void 0,function*(){yield n();let{checked:r}=e();eh&&eh({rowClicked:r?G.ROW_CLICKED_SELECT_ALL:G.ROW_CLICKED_SELECT_NONE,selectedFlatRows:r?t:[]})})})))),id:"bulkActions",maxWidth:35,minWidth:35,width:35},...e]:e;return Y&&t.push({canHide:!1,Cell:({row:e})=>s.default.createElement(j,Object.assign({},e.getToggleRowExpandedProps(),{icon:{name:e.isExpanded?"ArrowCaretUp":"ArrowCaretDown",variant:"regular"},type:"secondary",variant:"link"})),disableColumnHiding:!0,disableExport:!ee,disableFilters:!0,disableGlobalFilter:!0,disableResizing:!0,disableRowOnClick:!0,disableSortBy:!0,Header:()=>s.default.createElement(s.default.Fragment,null),id:"rowExpander",maxWidth:46,minWidth:46,width:46}),eg&&t.push({canHide:!1,Cell:({row:e})=>s.default.createElement(O.default,{onOpen:em,row:e,rowActions:eg,width:eb}),disableColumnHiding:!0,disableExport:!0,disableFilters:!0,disableGlobalFilter:!0,disableResizing:!0,disableRowOnClick:!0,disableSortBy:!0,Header:()=>s.default.createElement(s.default.Fragment,null),id:"rowActions",maxWidth:46,minWidth:46,width:46}),t})});s.default.useEffect(()=>{et&&et({filters:ek.state.filters,globalFilter:ek.state.globalFilter,pageIndex:ek.state.pageIndex,pageSize:ek.state.pageSize,sortBy:ek.state.sortBy})},[et,ek.state.filters,ek.state.globalFilter,ek.state.pageIndex,ek.state.pageSize,ek.state.sortBy]);let e_=!Q||!z,eO=(!!C||!X||e_)&&!ey,eP=JSON.stringify(ek.state.filters),eA=(0,s.useMemo)(()=>ek.state.filters,[eP]);return s.default.createElement(c.ThemeProvider,{theme:ex},s.default.createElement(L,{className:x,"data-testid":"kui-table"},ey&&s.default.createElement(h.default,{status:ey}),eO&&s.default.createElement(N,{minWidth:ek.totalColumnsWidth},!Z&&s.default.createElement(k.default,{disableGlobalFilter:q,filters:eA,globalFilter:ek.state.globalFilter,globalFilterKey:eu,globalSearchPlaceholder:es,setAllFilters:null!==(t=ek.setAllFilters)&&void 0!==t?t:U,setGlobalFilter:null!==(n=ek.setGlobalFilter)&&void 0!==n?n:U,setFilter:null!==(r=ek.setFilter)&&void 0!==r?r:U}),s.default.createElement(F,null,Array.isArray(C)&&!ev&&s.default.createElement(R.default,Object.assign({},ek,{bulkActions:C}))),s.default.createElement(F,{align:"center"},en&&s.default.createElement(v.default,{size:"tiny"})),s.default.createElement(F,{align:"flex-end"},!X&&s.default.createElement(_.default,{pageCount:ef,pageIndex:ek.state.pageIndex,pageSize:ek.state.pageSize,rowsLength:ek.rows.length,totalResults:ew}),e_&&s.default.createElement(P.default,Object.assign({},ek,{columnResizing:ek.state.columnResizing,defaultHiddenColumns:null==ed?void 0:ed.hiddenColumns,disableResizing:Q,hiddenColumns:ek.state.hiddenColumns})),!K&&s.default.createElement(f.default,{icon:{name:"ActionsDownload",variant:"regular"},onClick:()=>eR(!0),type:"secondary",variant:"link"}))),!ey&&s.default.createElement($,{tableInstance:ek,tableProps:Object.assign({ExpandedRowComponent:Y,expandedRowExport:ee,fetching:en,getCellProps:er,getColumnProps:eo,getHeaderProps:ea,getRowProps:ei,id:ec,status:ey},eC)}),!ey&&!X&&s.default.createElement(B,{current:ek.state.pageIndex+1,handlePageChange:ek.gotoPage,handlePageSize:ek.setPageSize,minWidth:ek.totalColumnsWidth,pageSize:ek.state.pageSize,options:ep,total:null!=ew?ew:ek.pageOptions.length*ek.state.pageSize}),!ey&&!K&&eE&&s.default.createElement(V,{exportData:ek.exportData,open:eE,setOpen:eR})))}},10532:function(e,t,n){"use strict";Object.defineProperty(t,"__esModule",{value:!0});let r=n(79521),o=n(88084),a=e=>`${o.LOCAL_STORAGE_KEY}${e}`;function i(e,t,n,o){if(t.type===r.actions.init&&"string"==typeof(null==o?void 0:o.id)){let t=window.localStorage.getItem(a(null==o?void 0:o.id)),n=t?JSON.parse(t):{};return Object.assign(Object.assign({},e),n)}return e}function l(e){let{id:t,plugins:n,state:o}=e;(0,r.ensurePluginOrder)(n,["useColumnVisibility","useResizeColumns"],"useLocalStorage"),t&&window.localStorage.setItem(a(t),JSON.stringify(o))}let u=e=>{e.stateReducers.push(i),e.useInstance.push(l)};u.pluginName="useLocalStorage",t.default=u},42630:function(e,t,n){"use strict";var r=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let o=r(n(67294)),a=n(79521),i=n(25394),l=({columns:e,data:t})=>new Blob([e.map(e=>e.exportValue).join(","),"\n",t.map(e=>e.map(e=>e).join()).join("\n")],{type:"text/csv"}),u=(e,t)=>{let n="string"==typeof e.Header?e.Header:(0,i.camelCaseToHuman)(e.id);return"rowExpander"===e.id&&t&&(n=t.header),n},s=(e,t,n)=>{let r=(0,i.sanitizeForCsv)(t.values[e.id]);return"rowExpander"===e.id&&n&&(r=n.getExportValue(t)),r};function c(e){let{rows:t,allColumns:n,disableExport:r,expandedRowExport:c,plugins:d}=e;(0,a.ensurePluginOrder)(d,["useColumnOrder","useColumnVisibility","useFilters","useSortBy","useExpanded"],"useTableExport"),n.forEach(e=>{let t=!0!==e.disableExport&&!0!==r;e.canExport=t,e.exportValue=u(e,c)}),Object.assign(e,{exportData:o.default.useCallback((e="data")=>{let r=n.filter(e=>e.canExport&&e.isVisible),o=t.map(e=>r.map(t=>s(t,e,c))),a=l({columns:r,data:o});a&&(0,i.downloadFileFromBlob)(a,e,"csv")},[t,n,c])})}let d=e=>{e.useInstance.push(c)};d.pluginName="useTableExport",t.default=d},91656:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0});let n=`
+  overflow: hidden;
+  white-space: nowrap;
+  overflow: hidden;
+  text-overflow: ellipsis;
+`,r=`
+  margin: 0;
+`,o=`
+  border: none;
+
+  button {
+    border: none;
+  }
+`,a=`
+  align-items: center;
+  cursor: pointer;
+  display: flex;
+`,i=`
+  width: 100%;
+`;t.default={bulkAction:(e,t=!1,n=!1)=>`
+  align-items: center;
+  appearance: none;
+  background: ${e.colors.table.header.actionBackground};
+  border: none;
+  color: ${e.colors.table.header.actionForeground};
+  display: flex;
+  font-size: ${e.typography.size.normal};
+  padding: ${e.spacing.two} ${e.spacing.four};
+  text-align: left;
+  transition: background 0.15s ease-in-out;
+
+  &:hover {
+    background: ${e.colors.table.header.actionHoverBackground};
+    color: ${e.colors.table.header.actionHoverForeground};
+    cursor: pointer;
+  }
+
+  &> svg {
+    margin-right: ${e.spacing.two};
+  }
+
+  ${n?`
+    color: ${e.colors.table.header.actionDisabled};
+    cursor: not-allowed;
+
+    &:hover {
+      cursor: not-allowed;
+      background: transparent;
+      color: ${e.colors.table.header.actionDisabled};
+    }
+  `:""}
+
+  ${t?`
+    color: ${e.colors.red700};
+
+    &:hover {
+      background: ${e.colors.red500};
+      color: ${e.colors.lightGray000};
+    }
+  `:""}
+`,bulkActions:e=>`
+  display: flex;
+
+  button:first-of-type {
+    margin-right: ${e.spacing.two};
+  }
+`,cellOverflow:n,columnFilterTextbox:r,columnThird:({align:e})=>`
+  align-items: center;
+  display: flex;
+  justify-content: ${e||"flex-start"};
+  width: calc(100% / 3);
+  width: ${"center"===e?"10%":"45%"};
+`,rowButton:o,extendedRow:(e,t)=>`
+  background: ${e.colors.table.body.backgroundExpandedRow};
+  border: 1px solid ${e.colors.table.body.border};
+  border-top: none;
+  box-shadow: ${e.elevation.mid} inset;
+  display: flex;
+  min-width: ${t}px;
+`,globalSearch:e=>`
+  margin-bottom: ${e.spacing.three};
+  width: 100%;
+`,header:(e,t)=>`
+  align-items: center;
+  display: flex;
+  flex-wrap: wrap;
+  margin-bottom: ${e.spacing.two};
+  min-width: ${t}px;
+`,headerFilterComponent:e=>`
+  display: flex;
+  width: 100%;
+  ${n}
+
+  button {
+    align-items: center;
+    appearance: none;
+    background: transparent;
+    border: none;
+    color: inherit;
+    display: flex;
+    font-family: inherit;
+    font: inherit;
+    gap: 0 ${e.spacing.two};
+    justify-content: space-between;
+    margin: 0;
+    padding: 0;
+    text-transform: inherit;
+    width: 100%;
+    ${n}
+
+    &:focus {
+      outline: none;
+    }
+
+    &:hover {
+      text-decoration: underline;
+      cursor: pointer;
+    }
+
+    &> svg {
+      width: 100%;
+    }
+  }
+`,headerFilterIcon:a,headerFilterPortal:e=>`
+  background: ${e.colors.table.body.background};
+  border-radius: 0.25rem;
+  box-shadow: ${e.elevation.low};
+  margin-top: ${e.spacing.four};
+  padding: ${e.spacing.four};
+`,pagination:(e,t)=>`
+  margin-top: ${e.spacing.four};
+  min-width: ${t}px;
+`,portal:e=>`
+  background: ${e.colors.table.header.actionBackground};
+  border-radius: 0.25rem;
+  box-shadow: ${e.elevation.low};
+  display: flex;
+  flex-direction: column;
+  margin-top: ${e.spacing.four};
+  padding-bottom: ${e.spacing.two};
+`,portalFilter:e=>`
+  margin: ${e.spacing.four} ${e.spacing.four} ${e.spacing.two} ${e.spacing.four};
+`,resizer:e=>`
+  background-image: linear-gradient(${e.colors.table.header.resizer}, ${e.colors.table.header.resizer});
+  background-position: center center;
+  background-repeat: no-repeat;
+  background-size: 1px 100%;
+  height: 30px;
+  padding: 0 0.40rem;
+  position: absolute;
+  right: 0;
+  top: 9px;
+  touch-action: none;
+  width: 1px;
+  z-index: 1;
+`,results:e=>`
+  font-size: ${e.typography.size.normal};
+`,settingCheckbox:e=>`
+  background: ${e.colors.table.header.actionBackground};
+  color: ${e.colors.table.header.actionForeground};
+  padding: ${e.spacing.two} ${e.spacing.four};
+  transition: background 0.15s ease-in-out;
+
+  &:hover {
+    cursor: pointer;
+    background: ${e.colors.table.header.actionHoverBackground};
+    color: ${e.colors.table.header.actionHoverForeground};
+  }
+`,settings:e=>`
+  position: relative;
+
+  .badge {
+    position: absolute;
+    top: 6px;
+    right: 6px;
+    height: 8px;
+    width: 8px;
+    background-color: ${e.colors.green500};
+    border-radius: 50%;
+    display: inline-block;
+  }
+`,settingsButton:e=>`
+  margin-left: ${e.spacing.four};
+`,settingsResizingActions:e=>`
+  margin: ${e.spacing.two} ${e.spacing.four};
+
+  > button {
+    margin-top: ${e.spacing.four};
+    width: 100%;
+  }
+`,settingsVisibilityActions:e=>`
+  display: flex;
+  justify-content: flex-end;
+  margin: ${e.spacing.two} ${e.spacing.four} 0 ${e.spacing.four};
+`,sort:e=>`
+  align-items: center;
+  cursor: pointer;
+  display: flex;
+
+  .icons {
+    display: flex;
+    flex-direction: column;
+    padding-left: ${e.spacing.two};
+  }
+`,table:e=>`
+  font-size: ${e.typography.size.small};
+`,tableContainer:i,td:(e,t,n)=>`
+  color: ${e.colors.table.body.foreground};
+  display: flex;
+  font-family: ${e.typography.font.body};
+  line-height: normal;
+  overflow: hidden;
+  padding: ${"rowActions"===n||"rowExpander"===n?"0":e.spacing.four};
+  text-overflow: ellipsis;
+  white-space: nowrap;
+
+  ${t?`
+    cursor: pointer;
+  `:""}
+
+  ${"rowExpander"===n?`
+    align-items: center;
+    justify-content: center;
+  `:""}
+`,th:(e,t)=>`
+  align-items: center;
+  color: ${e.colors.table.header.foreground};
+  display: flex;
+  font-family: ${e.typography.font.brand};
+  line-height: normal;
+  overflow: hidden;
+  padding: ${"rowActions"===t||"rowExpander"===t?0:e.spacing.four};
+  text-overflow: ellipsis;
+  text-transform: uppercase;
+  white-space: nowrap;
+
+  > .filter-parent,
+  > .filter-parent > div {
+    width: 100%;
+    ${n}
+  }
+`,trh:e=>`
+  background: ${e.colors.table.header.background};
+`,tr:e=>`
+  background: ${e.colors.table.body.background};
+  border: 1px solid ${e.colors.table.body.border};
+  border-top: 0;
+
+  &:hover {
+    background: ${e.colors.table.body.backgroundHover};
+  }
+`}},62256:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=void 0;let l=a(n(67294)),u=a(n(85444)),s=n(7347),c=i(n(5801)),d=i(n(57299)),f=i(n(58440)),p=i(n(90878)),g=n(13258),m=i(n(63130));t.Styles=m.default;let b=()=>{},h=(0,u.default)(c.default)`
+  ${e=>m.default.clearButton(e.theme,e.inline)}
+`,v=u.default.div`
+  ${e=>m.default.iconContainer(e.theme,e.inline)}
+`,y=u.default.div`
+  ${m.default.tagEditorWrapperWithLabel()}
+`;y.displayName="TagEditorWrapperWithLabel";let w=(0,u.default)(p.default)`
+  ${e=>m.default.tagEditorLabel(e.theme)}
+`;w.displayName="TagEditorLabel";let S=u.default.div`
+  ${e=>m.default.tagEditorContainer(e.theme,e.inline,e.showClearButton,e.withIcon)}
+`;S.displayName="TagEditorContainer";let C=u.default.div`
+  ${e=>m.default.tagContainer(e.theme,e.disableInput,e.inline)}
+`;C.displayName="TagContainer";let x=u.default.input`
+  ${e=>m.default.tagInput(e.theme,e.inline)}
+`;function E(e){return"string"==typeof e?{value:e}:e}function R(e,t){return e.length===t.length&&e.every((e,n)=>E(e).value===E(t[n]).value)}x.displayName="TagInput",t.default=function({disableTagAddition:e=!1,color:t,disableInput:n,icon:r,inline:o,inputValue:a,label:i,menuItems:c,menuWidth:p,onChange:m,onInput:k,placeholder:_,showClearButton:O,values:P}){let A=(0,l.useContext)(s.KaizenThemeContext),T=(0,l.useRef)(null),[I,$]=(0,l.useState)(null!=P?P:[]),z=(0,l.useRef)(),F=null!=a,j=(0,l.useRef)(),N=(0,l.useRef)(),B=(0,l.useRef)();j.current=k,N.current=m,(0,l.useEffect)(()=>{var e,t,n;void 0===z.current?z.current=null!=P?P:null:R(null!==(e=z.current)&&void 0!==e?e:[],null!=P?P:[])?void 0!==B.current&&R(null!==(t=B.current)&&void 0!==t?t:[],null!=I?I:[])||(B.current=I,null===(n=N.current)||void 0===n||n.call(N,I)):(z.current=null!=P?P:null,$(null!=P?P:[]))},[I,P]),(0,l.useEffect)(()=>{o&&T.current&&(T.current.scrollLeft=T.current.scrollWidth-T.current.clientWidth)},[o,I]);let L=(0,l.useCallback)(t=>{var n;if(("Enter"===t.key||"Tab"===t.key)&&!e&&t.currentTarget.value.trim().length){let e=t.currentTarget.value;$(t=>t.some(t=>e===E(t).value)?t:[...t,e]),t.preventDefault(),t.currentTarget.value="",null===(n=j.current)||void 0===n||n.call(j,"",t)}},[e]),G=(0,l.useCallback)(e=>{var t;null===(t=j.current)||void 0===t||t.call(j,e.currentTarget.value,e)},[]),M=(0,l.useCallback)(e=>{let t=E(e);$(e=>e.filter(e=>E(e).value!==t.value))},[$]);return l.default.createElement(u.ThemeProvider,{theme:A},l.default.createElement(y,null,i&&l.default.createElement(w,{textStyle:"label"},i),l.default.createElement(S,{"data-testid":"kui-tagEditor",inline:!!o,showClearButton:!!O,withIcon:!!r},r&&l.default.createElement(v,{inline:!!o},l.default.createElement(d.default,Object.assign({size:"medium"},r))),I.length>0&&l.default.createElement(C,{disableInput:!!n,inline:!!o,ref:T},I.map(e=>{let n;let r=E(e);if(c){let e=c.type===l.default.Fragment?c.props.children:c;n=l.default.createElement(l.default.Fragment,null,l.default.createElement(g.ActionMenuItem,{icon:{name:"ActionsTrash"},label:"Remove",onClick:()=>M(r)}),e)}return"hasMenu"in r&&!r.hasMenu&&(n=void 0),l.default.createElement(f.default,Object.assign({key:`tag-${r.value}`,clearable:!n,color:t,menuItems:n,menuWidth:p,onClear:()=>M(r)},r),r.value)})),!n&&l.default.createElement(x,Object.assign({inline:!!o,onKeyDown:L,placeholder:_},F?{onChange:b,onInput:G,value:a}:{})),O&&l.default.createElement(h,{disabled:0===I.length,icon:{name:"ActionsClose",variant:"solid"},inline:!!o,onClick:()=>$([]),size:"tiny",type:"secondary",variant:"link"}))))}},63130:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={clearButton:(e,t)=>`  
+  position: absolute;
+  right: ${e.spacing.two};
+  top: ${e.spacing.two};
+
+  &.small.icon {
+    padding: 0;
+  }
+
+  ${t?`
+    position: initial;
+    margin-left: auto;
+  `:""}
+`,iconContainer:(e,t)=>`
+  & > svg {
+    left: ${e.spacing.two};
+    position: absolute;
+    top: ${e.spacing.three};
+  }
+
+  ${t?`
+    margin-right: ${e.spacing.two};
+    height: 16px;
+    width: 16px;
+
+    & > svg {
+      box-sizing: content-box;
+      left: unset;
+      position: initial;
+      top: unset;
+    }
+  `:""}
+`,tagEditorContainer:(e,t,n,r)=>`
+  background-color: ${e.colors.tagEditor.background};
+  border: 1px solid ${e.colors.tagEditor.border};
+  box-sizing: border-box;
+  padding: ${e.spacing.two};
+  width: 100%;
+
+  ${n&&!t?`padding-right: ${e.spacing.seven};`:""}
+  ${r&&!t?`padding-left: ${e.spacing.seven};`:""}
+  ${t?`
+    align-items: center;
+    display: flex;
+  `:""}
+`,tagContainer:(e,t,n)=>`
+  display: flex;
+  flex-wrap: wrap;
+  gap: ${e.spacing.one};
+
+  ${t||n?"":`margin-bottom: ${e.spacing.two};`}
+
+  ${n?`
+    flex-wrap: nowrap;
+    margin-right: ${e.spacing.two};
+    overflow-x: auto;
+    scroll-behavior: smooth;
+  `:""}
+`,tagEditorLabel:e=>`
+  margin: ${e.spacing.one} 0;
+`,tagEditorWrapperWithLabel:()=>`
+  display: flex;
+  flex-direction: column;
+  flex: 1;
+  position: relative;
+  width: 100%;
+`,tagInput:(e,t)=>`
+  background: transparent;
+  border: 0;
+  color: ${e.colors.textbox.normal.foreground};
+  outline: none;
+  width: 100%;
+
+  &::placeholder {
+    color: ${e.colors.textbox.placeholder};
+    text-overflow: ellipsis;
+  }
+
+  &[placeholder] {
+    text-overflow: ellipsis;
+  }
+
+  ${t?`
+    flex: 1;
+    margin-top: unset;
+    min-width: 240px;
+    width: unset;
+  `:""}
+`}},58440:function(e,t,n){"use strict";var r=this&&this.__createBinding||(Object.create?function(e,t,n,r){void 0===r&&(r=n);var o=Object.getOwnPropertyDescriptor(t,n);(!o||("get"in o?!t.__esModule:o.writable||o.configurable))&&(o={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,o)}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]}),o=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)"default"!==n&&Object.prototype.hasOwnProperty.call(e,n)&&r(t,e,n);return o(t,e),t},i=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=void 0;let l=a(n(67294)),u=a(n(85444)),s=n(7347),c=i(n(13258)),d=i(n(93967)),f=i(n(57299)),p=i(n(15637));t.Styles=p.default;let g=u.default.button`
+  ${e=>p.default.tagButton(e.theme)}
+`;g.displayName="TagButton";let m=u.default.div`
+  ${e=>p.default.tag(e.theme)}
+`;m.displayName="Tag";let b=u.default.button`
+  ${e=>p.default.tagButton(e.theme)}
+  ${e=>p.default.menuButton(e.theme)}
+  padding: 4px 6px;
+`;b.displayName="MenuButton";let h=u.default.button`
+  ${e=>p.default.tagButton(e.theme)}
+  ${e=>p.default.clearButton(e.theme)}
+  padding: 4px 6px;
+`;h.displayName="ClearButton",t.default=function({children:e,className:t,clearable:n=!1,clickable:r=!0,color:o="gray",icon:a,menuItems:i,menuWidth:p,onClear:v,onClick:y,variant:w="solid",value:S}){var C,x,E;let R=(0,l.useContext)(s.KaizenThemeContext),k=(0,d.default)(t,o,w,{clearable:n,clickable:r}),_=(0,d.default)(o,w,{clickable:r}),O=(0,d.default)("tag-text",{clickable:r});return l.default.createElement(u.ThemeProvider,{theme:R},i&&"outline"!==w&&l.default.createElement(m,{className:k,"data-testid":"kui-tag"},l.default.createElement("span",{className:O},e),l.default.createElement(c.default,{data:{tag:e,value:S},parentElement:l.default.createElement(b,{type:"button",className:_},l.default.createElement(f.default,{name:"ArrowCaretDown",variant:"solid",size:8,color:R.colors.tag[o].solid.foreground})),width:p},i)),n&&!i&&"outline"!==w&&l.default.createElement(m,{className:k,"data-testid":"kui-tag"},l.default.createElement("span",{className:O},e),l.default.createElement(h,{className:_,type:"button",onClick:()=>null==v?void 0:v(e,S)},l.default.createElement(f.default,{name:"ActionsClose",variant:"solid",size:8,color:R.colors.tag[o].solid.foreground}))),(!n&&!i||"outline"===w)&&l.default.createElement(g,{className:k,"data-testid":"kui-tag",onClick:()=>null==y?void 0:y(e,S)},l.default.createElement("span",{className:"outline-wrapper"},e,"outline"===w&&!!a&&l.default.createElement(f.default,{className:(0,d.default)("tag-icon",a.className),name:a.name,color:null!==(C=a.color)&&void 0!==C?C:R.colors.tag[o].outline.foreground,variant:null!==(x=a.variant)&&void 0!==x?x:"solid",size:null!==(E=a.size)&&void 0!==E?E:"medium"}))))}},15637:function(e,t,n){"use strict";Object.defineProperty(t,"__esModule",{value:!0});let r=n(49123);t.default={tag:e=>`
+  align-items: center;
+  border-radius: ${e.spacing.one};
+  cursor: pointer;
+  display: flex;
+  font-family: ${e.typography.font.body};
+  font-size: ${e.spacing.three};
+  font-weight: ${e.typography.weight.semiBold};
+  transition: all 0.15s ease-in-out;
+  width: fit-content;
+
+  .tag-text {
+    padding: ${e.spacing.one} ${e.spacing.two};
+    white-space: nowrap;
+
+    &:not(.clickable) { cursor: default; }
+  }
+
+  &.gray {
+    &.solid {
+      background-color: ${e.colors.tag.gray.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.gray.solid.foreground};
+      outline: 0;
+    }
+  }
+
+  &.red {
+    &.solid {
+      background-color: ${e.colors.tag.red.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.red.solid.foreground};
+      outline: 0;
+    }
+  }
+
+  &.orange {
+    &.solid {
+      background-color: ${e.colors.tag.orange.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.orange.solid.foreground};
+      outline: 0;
+    }
+  }
+
+  &.green {
+    &.solid {
+      background-color: ${e.colors.tag.green.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.green.solid.foreground};
+      outline: 0;
+    }
+  }
+
+  &.darkGreen {
+    &.solid {
+      background-color: ${e.colors.tag.darkGreen.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.darkGreen.solid.foreground};
+      outline: 0;
+    }
+  }
+
+  &.teal {
+    &.solid {
+      background-color: ${e.colors.tag.teal.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.teal.solid.foreground};
+      outline: 0;
+    }
+  }
+
+  &.blue {
+    &.solid {
+      background-color: ${e.colors.tag.blue.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.blue.solid.foreground};
+      outline: 0;
+    }
+  }
+
+  &.purple {
+    &.solid {
+      background-color: ${e.colors.tag.purple.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.purple.solid.foreground};
+      outline: 0;
+    }
+  }
+`,tagButton:e=>`
+  border-radius: ${e.spacing.one};
+  cursor: pointer;
+  font-family: ${e.typography.font.body};
+  font-size: ${e.spacing.three};
+  font-weight: ${e.typography.weight.semiBold};
+  padding: ${e.spacing.one} ${e.spacing.two};
+  transition: all 0.15s ease-in-out;
+
+  .outline-wrapper {
+    display: flex;
+    align-items: center;
+  }
+
+  .tag-icon {
+    margin-left: ${e.spacing.two};
+  }
+
+  &.gray {
+    &.solid {
+      background-color: ${e.colors.tag.gray.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.gray.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.gray.solid.hover.background}; }
+      &:not(.clickable) { cursor: default;  }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.gray.outline.background)};
+      border: 1px solid ${e.colors.tag.gray.outline.border};
+      color: ${e.colors.tag.gray.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.gray.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+
+  &.red {
+    &.solid {
+      background-color: ${e.colors.tag.red.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.red.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.red.solid.hover.background}; }
+      &:not(.clickable) { cursor: default; }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.red.outline.background)};
+      border: 1px solid ${e.colors.tag.red.outline.border};
+      color: ${e.colors.tag.red.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.red.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+
+  &.orange {
+    &.solid {
+      background-color: ${e.colors.tag.orange.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.orange.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.orange.solid.hover.background}; }
+      &:not(.clickable) { cursor: default; }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.orange.outline.background)};
+      border: 1px solid ${e.colors.tag.orange.outline.border};
+      color: ${e.colors.tag.orange.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.orange.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+
+  &.green {
+    &.solid {
+      background-color: ${e.colors.tag.green.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.green.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.green.solid.hover.background}; }
+      &:not(.clickable) { cursor: default; }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.green.outline.background)};
+      border: 1px solid ${e.colors.tag.green.outline.border};
+      color: ${e.colors.tag.green.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.green.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+
+  &.darkGreen {
+    &.solid {
+      background-color: ${e.colors.tag.darkGreen.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.darkGreen.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.darkGreen.solid.hover.background}; }
+      &:not(.clickable) { cursor: default; }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.darkGreen.outline.background)};
+      border: 1px solid ${e.colors.tag.darkGreen.outline.border};
+      color: ${e.colors.tag.darkGreen.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.darkGreen.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+
+  &.teal {
+    &.solid {
+      background-color: ${e.colors.tag.teal.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.teal.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.teal.solid.hover.background}; }
+      &:not(.clickable) { cursor: default; }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.teal.outline.background)};
+      border: 1px solid ${e.colors.tag.teal.outline.border};
+      color: ${e.colors.tag.teal.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.teal.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+
+  &.blue {
+    &.solid {
+      background-color: ${e.colors.tag.blue.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.blue.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.blue.solid.hover.background}; }
+      &:not(.clickable) { cursor: default; }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.blue.outline.background)};
+      border: 1px solid ${e.colors.tag.blue.outline.border};
+      color: ${e.colors.tag.blue.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.blue.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+
+  &.purple {
+    &.solid {
+      background-color: ${e.colors.tag.purple.solid.normal.background};
+      border: 0;
+      color: ${e.colors.tag.purple.solid.foreground};
+      outline: 0;
+      &:not(.clearable).clickable:hover { background-color: ${e.colors.tag.purple.solid.hover.background}; }
+      &:not(.clickable) { cursor: default; }
+    }
+
+    &.outline {
+      background-color: ${(0,r.transparentize)(1,e.colors.tag.purple.outline.background)};
+      border: 1px solid ${e.colors.tag.purple.outline.border};
+      color: ${e.colors.tag.purple.outline.foreground};
+      outline: 0;
+      &.clickable:hover { background-color: ${(0,r.transparentize)(.7,e.colors.tag.purple.outline.background)}; }
+      &:not(.clickable) { cursor: default; }
+    }
+  }
+`,clearButton:e=>`
+  border-radius: 0 ${e.spacing.one} ${e.spacing.one} 0;
+`,menuButton:e=>`
+  border-radius: 0 ${e.spacing.one} ${e.spacing.one} 0;
+`}},49123:function(e,t,n){"use strict";n.r(t),n.d(t,{adjustHue:function(){return eN},animation:function(){return e9},backgroundImages:function(){return e3},backgrounds:function(){return te},between:function(){return D},border:function(){return tn},borderColor:function(){return tr},borderRadius:function(){return to},borderStyle:function(){return ta},borderWidth:function(){return ti},buttons:function(){return tc},clearFix:function(){return H},complement:function(){return eB},cover:function(){return U},cssVar:function(){return S},darken:function(){return eG},desaturate:function(){return eM},directionalProperty:function(){return E},easeIn:function(){return B},easeInOut:function(){return G},easeOut:function(){return W},ellipsis:function(){return V},em:function(){return P},fluidRange:function(){return Z},fontFace:function(){return J},getContrast:function(){return eD},getLuminance:function(){return eW},getValueAndUnit:function(){return T},grayscale:function(){return eH},hiDPI:function(){return et},hideText:function(){return Y},hideVisually:function(){return ee},hsl:function(){return eT},hslToColorString:function(){return eU},hsla:function(){return eI},important:function(){return function e(t,n){if("object"!=typeof t||null===t)throw new m(75,typeof t);var r={};return Object.keys(t).forEach(function(o){"object"==typeof t[o]&&null!==t[o]?r[o]=e(t[o],n):!n||n&&(n===o||n.indexOf(o)>=0)?r[o]=t[o]+" !important":r[o]=t[o]}),r}},invert:function(){return eV},lighten:function(){return eK},linearGradient:function(){return er},margin:function(){return td},math:function(){return y},meetsContrastGuidelines:function(){return eZ},mix:function(){return eq},modularScale:function(){return $},normalize:function(){return eo},opacify:function(){return eX},padding:function(){return tf},parseToHsl:function(){return ek},parseToRgb:function(){return eR},position:function(){return tg},radialGradient:function(){return ea},readableColor:function(){return eY},rem:function(){return z},remToPx:function(){return j},retinaImage:function(){return ei},rgb:function(){return e$},rgbToColorString:function(){return e0},rgba:function(){return ez},saturate:function(){return e1},setHue:function(){return e5},setLightness:function(){return e2},setSaturation:function(){return e4},shade:function(){return e6},size:function(){return tm},stripUnit:function(){return _},textInputs:function(){return tv},timingFunctions:function(){return eu},tint:function(){return e8},toColorString:function(){return eF},transitions:function(){return ty},transparentize:function(){return e7},triangle:function(){return ed},wordWrap:function(){return ef}});var r,o,a=n(87462),i=n(97326),l=n(94578),u=n(61120),s=n(89611),c=n(78814);function d(e){var t="function"==typeof Map?new Map:void 0;return(d=function(e){if(null===e||!function(e){try{return -1!==Function.toString.call(e).indexOf("[native code]")}catch(t){return"function"==typeof e}}(e))return e;if("function"!=typeof e)throw TypeError("Super expression must either be null or a function");if(void 0!==t){if(t.has(e))return t.get(e);t.set(e,n)}function n(){return function(e,t,n){if((0,c.Z)())return Reflect.construct.apply(null,arguments);var r=[null];r.push.apply(r,t);var o=new(e.bind.apply(e,r));return n&&(0,s.Z)(o,n.prototype),o}(e,arguments,(0,u.Z)(this).constructor)}return n.prototype=Object.create(e.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),(0,s.Z)(n,e)})(e)}function f(e,t){return t||(t=e.slice(0)),e.raw=t,e}function p(){var e;return e=arguments.length-1,e<0||arguments.length<=e?void 0:arguments[e]}var g={symbols:{"*":{infix:{symbol:"*",f:function(e,t){return e*t},notation:"infix",precedence:4,rightToLeft:0,argCount:2},symbol:"*",regSymbol:"\\*"},"/":{infix:{symbol:"/",f:function(e,t){return e/t},notation:"infix",precedence:4,rightToLeft:0,argCount:2},symbol:"/",regSymbol:"/"},"+":{infix:{symbol:"+",f:function(e,t){return e+t},notation:"infix",precedence:2,rightToLeft:0,argCount:2},prefix:{symbol:"+",f:p,notation:"prefix",precedence:3,rightToLeft:0,argCount:1},symbol:"+",regSymbol:"\\+"},"-":{infix:{symbol:"-",f:function(e,t){return e-t},notation:"infix",precedence:2,rightToLeft:0,argCount:2},prefix:{symbol:"-",f:function(e){return-e},notation:"prefix",precedence:3,rightToLeft:0,argCount:1},symbol:"-",regSymbol:"-"},",":{infix:{symbol:",",f:function(){return Array.of.apply(Array,arguments)},notation:"infix",precedence:1,rightToLeft:0,argCount:2},symbol:",",regSymbol:","},"(":{prefix:{symbol:"(",f:p,notation:"prefix",precedence:0,rightToLeft:0,argCount:1},symbol:"(",regSymbol:"\\("},")":{postfix:{symbol:")",f:void 0,notation:"postfix",precedence:0,rightToLeft:0,argCount:1},symbol:")",regSymbol:"\\)"},min:{func:{symbol:"min",f:function(){return Math.min.apply(Math,arguments)},notation:"func",precedence:0,rightToLeft:0,argCount:1},symbol:"min",regSymbol:"min\\b"},max:{func:{symbol:"max",f:function(){return Math.max.apply(Math,arguments)},notation:"func",precedence:0,rightToLeft:0,argCount:1},symbol:"max",regSymbol:"max\\b"}}},m=function(e){function t(t){var n;return n=e.call(this,"An error occurred. See https://github.com/styled-components/polished/blob/main/src/internalHelpers/errors.md#"+t+" for more information.")||this,(0,i.Z)(n)}return(0,l.Z)(t,e),t}(d(Error)),b=/((?!\w)a|na|hc|mc|dg|me[r]?|xe|ni(?![a-zA-Z])|mm|cp|tp|xp|q(?!s)|hv|xamv|nimv|wv|sm|s(?!\D|$)|ged|darg?|nrut)/g;function h(e,t){var n,r=e.pop();return t.push(r.f.apply(r,(n=[]).concat.apply(n,t.splice(-r.argCount)))),r.precedence}function v(e){return e.split("").reverse().join("")}function y(e,t){var n=v(e),r=n.match(b);if(r&&!r.every(function(e){return e===r[0]}))throw new m(41);return""+function(e,t){var n,r,o=((n={}).symbols=t?(0,a.Z)({},g.symbols,t.symbols):(0,a.Z)({},g.symbols),n),i=[o.symbols["("].prefix],l=[],u=RegExp("\\d+(?:\\.\\d+)?|"+Object.keys(o.symbols).map(function(e){return o.symbols[e]}).sort(function(e,t){return t.symbol.length-e.symbol.length}).map(function(e){return e.regSymbol}).join("|")+"|(\\S)","g");u.lastIndex=0;var s=!1;do{var c=(r=u.exec(e))||[")",void 0],d=c[0],f=c[1],p=o.symbols[d],b=p&&!p.prefix&&!p.func,v=!p||!p.postfix&&!p.infix;if(f||(s?v:b))throw new m(37,r?r.index:e.length,e);if(s){var y=p.postfix||p.infix;do{var w=i[i.length-1];if((y.precedence-w.precedence||w.rightToLeft)>0)break}while(h(i,l));s="postfix"===y.notation,")"!==y.symbol&&(i.push(y),s&&h(i,l))}else if(p){if(i.push(p.prefix||p.func),p.func&&(!(r=u.exec(e))||"("!==r[0]))throw new m(38,r?r.index:e.length,e)}else l.push(+d),s=!0}while(r&&i.length);if(i.length)throw new m(39,r?r.index:e.length,e);if(!r)return l.pop();throw new m(40,r?r.index:e.length,e)}(v(n.replace(b,"")),t)+(r?v(r[0]):"")}var w=/--[\S]*/g;function S(e,t){var n;if(!e||!e.match(w))throw new m(73);if("undefined"!=typeof document&&null!==document.documentElement&&(n=getComputedStyle(document.documentElement).getPropertyValue(e)),n)return n.trim();if(t)return t;throw new m(74)}function C(e){return e.charAt(0).toUpperCase()+e.slice(1)}var x=["Top","Right","Bottom","Left"];function E(e){for(var t=arguments.length,n=Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];var o=n[0],a=n[1],i=void 0===a?o:a,l=n[2],u=n[3];return function(e,t){for(var n={},r=0;r<t.length;r+=1)(t[r]||0===t[r])&&(n[function(e,t){if(!e)return t.toLowerCase();var n=e.split("-");if(n.length>1)return n.splice(1,0,t),n.reduce(function(e,t){return""+e+C(t)});var r=e.replace(/([a-z])([A-Z])/g,"$1"+t+"$2");return e===r?""+e+t:r}(e,x[r])]=t[r]);return n}(e,[o,i,void 0===l?o:l,void 0===u?i:u])}function R(e,t){return e.substr(-t.length)===t}var k=/^([+-]?(?:\d+|\d*\.\d+))([a-z]*|%)$/;function _(e){return"string"!=typeof e?e:e.match(k)?parseFloat(e):e}var O=function(e){return function(t,n){void 0===n&&(n="16px");var r=t,o=n;if("string"==typeof t){if(!R(t,"px"))throw new m(69,e,t);r=_(t)}if("string"==typeof n){if(!R(n,"px"))throw new m(70,e,n);o=_(n)}if("string"==typeof r)throw new m(71,t,e);if("string"==typeof o)throw new m(72,n,e);return""+r/o+e}},P=O("em"),A=/^([+-]?(?:\d+|\d*\.\d+))([a-z]*|%)$/;function T(e){if("string"!=typeof e)return[e,""];var t=e.match(A);return t?[parseFloat(e),t[2]]:[e,void 0]}var I={minorSecond:1.067,majorSecond:1.125,minorThird:1.2,majorThird:1.25,perfectFourth:1.333,augFourth:1.414,perfectFifth:1.5,minorSixth:1.6,goldenSection:1.618,majorSixth:1.667,minorSeventh:1.778,majorSeventh:1.875,octave:2,majorTenth:2.5,majorEleventh:2.667,majorTwelfth:3,doubleOctave:4};function $(e,t,n){if(void 0===t&&(t="1em"),void 0===n&&(n=1.333),"number"!=typeof e)throw new m(42);if("string"==typeof n&&!I[n])throw new m(43);var r="string"==typeof t?T(t):[t,""],o=r[0],a=r[1],i="string"==typeof n?I[n]:n;if("string"==typeof o)throw new m(44,t);return""+o*Math.pow(i,e)+(a||"")}var z=O("rem");function F(e){var t=T(e);if("px"===t[1])return parseFloat(e);if("%"===t[1])return parseFloat(e)/100*16;throw new m(78,t[1])}function j(e,t){var n=T(e);if("rem"!==n[1]&&""!==n[1])throw new m(77,n[1]);var r=t?F(t):function(){if("undefined"!=typeof document&&null!==document.documentElement){var e=getComputedStyle(document.documentElement).fontSize;return e?F(e):16}return 16}();return n[0]*r+"px"}var N={back:"cubic-bezier(0.600, -0.280, 0.735, 0.045)",circ:"cubic-bezier(0.600,  0.040, 0.980, 0.335)",cubic:"cubic-bezier(0.550,  0.055, 0.675, 0.190)",expo:"cubic-bezier(0.950,  0.050, 0.795, 0.035)",quad:"cubic-bezier(0.550,  0.085, 0.680, 0.530)",quart:"cubic-bezier(0.895,  0.030, 0.685, 0.220)",quint:"cubic-bezier(0.755,  0.050, 0.855, 0.060)",sine:"cubic-bezier(0.470,  0.000, 0.745, 0.715)"};function B(e){return N[e.toLowerCase().trim()]}var L={back:"cubic-bezier(0.680, -0.550, 0.265, 1.550)",circ:"cubic-bezier(0.785,  0.135, 0.150, 0.860)",cubic:"cubic-bezier(0.645,  0.045, 0.355, 1.000)",expo:"cubic-bezier(1.000,  0.000, 0.000, 1.000)",quad:"cubic-bezier(0.455,  0.030, 0.515, 0.955)",quart:"cubic-bezier(0.770,  0.000, 0.175, 1.000)",quint:"cubic-bezier(0.860,  0.000, 0.070, 1.000)",sine:"cubic-bezier(0.445,  0.050, 0.550, 0.950)"};function G(e){return L[e.toLowerCase().trim()]}var M={back:"cubic-bezier(0.175,  0.885, 0.320, 1.275)",cubic:"cubic-bezier(0.215,  0.610, 0.355, 1.000)",circ:"cubic-bezier(0.075,  0.820, 0.165, 1.000)",expo:"cubic-bezier(0.190,  1.000, 0.220, 1.000)",quad:"cubic-bezier(0.250,  0.460, 0.450, 0.940)",quart:"cubic-bezier(0.165,  0.840, 0.440, 1.000)",quint:"cubic-bezier(0.230,  1.000, 0.320, 1.000)",sine:"cubic-bezier(0.390,  0.575, 0.565, 1.000)"};function W(e){return M[e.toLowerCase().trim()]}function D(e,t,n,r){void 0===n&&(n="320px"),void 0===r&&(r="1200px");var o=T(e),a=o[0],i=o[1],l=T(t),u=l[0],s=l[1],c=T(n),d=c[0],f=c[1],p=T(r),g=p[0],b=p[1];if("number"!=typeof d||"number"!=typeof g||!f||!b||f!==b)throw new m(47);if("number"!=typeof a||"number"!=typeof u||i!==s)throw new m(48);if(i!==f||s!==b)throw new m(76);var h=(a-u)/(d-g);return"calc("+(u-h*g).toFixed(2)+(i||"")+" + "+(100*h).toFixed(2)+"vw)"}function H(e){void 0===e&&(e="&");var t,n=e+"::after";return(t={})[n]={clear:"both",content:'""',display:"table"},t}function U(e){return void 0===e&&(e=0),{position:"absolute",top:e,right:e,bottom:e,left:e}}function V(e,t){void 0===t&&(t=1);var n={display:"inline-block",maxWidth:e||"100%",overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap",wordWrap:"normal"};return t>1?(0,a.Z)({},n,{WebkitBoxOrient:"vertical",WebkitLineClamp:t,display:"-webkit-box",whiteSpace:"normal"}):n}function K(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}function Z(e,t,n){if(void 0===t&&(t="320px"),void 0===n&&(n="1200px"),!Array.isArray(e)&&"object"!=typeof e||null===e)throw new m(49);if(Array.isArray(e)){for(var r,o,i,l,u={},s={},c=function(e,t){var n="undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(n)return(n=n.call(e)).next.bind(n);if(Array.isArray(e)||(n=function(e,t){if(e){if("string"==typeof e)return K(e,void 0);var n=Object.prototype.toString.call(e).slice(8,-1);if("Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return K(e,void 0)}}(e))){n&&(e=n);var r=0;return function(){return r>=e.length?{done:!0}:{done:!1,value:e[r++]}}}throw TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}(e);!(l=c()).done;){var d,f,p=l.value;if(!p.prop||!p.fromSize||!p.toSize)throw new m(50);s[p.prop]=p.fromSize,u["@media (min-width: "+t+")"]=(0,a.Z)({},u["@media (min-width: "+t+")"],((d={})[p.prop]=D(p.fromSize,p.toSize,t,n),d)),u["@media (min-width: "+n+")"]=(0,a.Z)({},u["@media (min-width: "+n+")"],((f={})[p.prop]=p.toSize,f))}return(0,a.Z)({},s,u)}if(!e.prop||!e.fromSize||!e.toSize)throw new m(51);return(i={})[e.prop]=e.fromSize,i["@media (min-width: "+t+")"]=((r={})[e.prop]=D(e.fromSize,e.toSize,t,n),r),i["@media (min-width: "+n+")"]=((o={})[e.prop]=e.toSize,o),i}var q=/^\s*data:([a-z]+\/[a-z-]+(;[a-z-]+=[a-z-]+)?)?(;charset=[a-z0-9-]+)?(;base64)?,[a-z0-9!$&',()*+,;=\-._~:@/?%\s]*\s*$/i,X={woff:"woff",woff2:"woff2",ttf:"truetype",otf:"opentype",eot:"embedded-opentype",svg:"svg",svgz:"svg"};function Q(e,t){return t?' format("'+X[e]+'")':""}function J(e){var t,n,r=e.fontFamily,o=e.fontFilePath,a=e.fontStretch,i=e.fontStyle,l=e.fontVariant,u=e.fontWeight,s=e.fileFormats,c=void 0===s?["eot","woff2","woff","ttf","svg"]:s,d=e.formatHint,f=e.localFonts,p=void 0===f?[r]:f,g=e.unicodeRange,b=e.fontDisplay,h=e.fontVariationSettings,v=e.fontFeatureSettings;if(!r)throw new m(55);if(!o&&!p)throw new m(52);if(p&&!Array.isArray(p))throw new m(53);if(!Array.isArray(c))throw new m(54);return JSON.parse(JSON.stringify({"@font-face":{fontFamily:r,src:(t=void 0!==d&&d,n=[],p&&n.push(p.map(function(e){return'local("'+e+'")'}).join(", ")),o&&n.push(o.replace(/\s+/g," ").match(q)?'url("'+o+'")'+Q(c[0],t):c.map(function(e){return'url("'+o+"."+e+'")'+Q(e,t)}).join(", ")),n.join(", ")),unicodeRange:g,fontStretch:a,fontStyle:i,fontVariant:l,fontWeight:u,fontDisplay:b,fontVariationSettings:h,fontFeatureSettings:v}}))}function Y(){return{textIndent:"101%",overflow:"hidden",whiteSpace:"nowrap"}}function ee(){return{border:"0",clip:"rect(0 0 0 0)",height:"1px",margin:"-1px",overflow:"hidden",padding:"0",position:"absolute",whiteSpace:"nowrap",width:"1px"}}function et(e){return void 0===e&&(e=1.3),"\n    @media only screen and (-webkit-min-device-pixel-ratio: "+e+"),\n    only screen and (min--moz-device-pixel-ratio: "+e+"),\n    only screen and (-o-min-device-pixel-ratio: "+e+"/1),\n    only screen and (min-resolution: "+Math.round(96*e)+"dpi),\n    only screen and (min-resolution: "+e+"dppx)\n  "}function en(e){for(var t="",n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];for(var a=0;a<e.length;a+=1)if(t+=e[a],a===r.length-1&&r[a]){var i=r.filter(function(e){return!!e});i.length>1?t=t.slice(0,-1)+", "+r[a]:1===i.length&&(t+=""+r[a])}else r[a]&&(t+=r[a]+" ");return t.trim()}function er(e){var t=e.colorStops,n=e.fallback,o=e.toDirection;if(!t||t.length<2)throw new m(56);return{backgroundColor:n||t[0].replace(/,\s+/g,",").split(" ")[0].replace(/,(?=\S)/g,", "),backgroundImage:en(r||(r=f(["linear-gradient(","",")"])),void 0===o?"":o,t.join(", ").replace(/,(?=\S)/g,", "))}}function eo(){var e;return[((e={html:{lineHeight:"1.15",textSizeAdjust:"100%"},body:{margin:"0"},main:{display:"block"},h1:{fontSize:"2em",margin:"0.67em 0"},hr:{boxSizing:"content-box",height:"0",overflow:"visible"},pre:{fontFamily:"monospace, monospace",fontSize:"1em"},a:{backgroundColor:"transparent"},"abbr[title]":{borderBottom:"none",textDecoration:"underline"}})["b,\n    strong"]={fontWeight:"bolder"},e["code,\n    kbd,\n    samp"]={fontFamily:"monospace, monospace",fontSize:"1em"},e.small={fontSize:"80%"},e["sub,\n    sup"]={fontSize:"75%",lineHeight:"0",position:"relative",verticalAlign:"baseline"},e.sub={bottom:"-0.25em"},e.sup={top:"-0.5em"},e.img={borderStyle:"none"},e["button,\n    input,\n    optgroup,\n    select,\n    textarea"]={fontFamily:"inherit",fontSize:"100%",lineHeight:"1.15",margin:"0"},e["button,\n    input"]={overflow:"visible"},e["button,\n    select"]={textTransform:"none"},e['button,\n    html [type="button"],\n    [type="reset"],\n    [type="submit"]']={WebkitAppearance:"button"},e['button::-moz-focus-inner,\n    [type="button"]::-moz-focus-inner,\n    [type="reset"]::-moz-focus-inner,\n    [type="submit"]::-moz-focus-inner']={borderStyle:"none",padding:"0"},e['button:-moz-focusring,\n    [type="button"]:-moz-focusring,\n    [type="reset"]:-moz-focusring,\n    [type="submit"]:-moz-focusring']={outline:"1px dotted ButtonText"},e.fieldset={padding:"0.35em 0.625em 0.75em"},e.legend={boxSizing:"border-box",color:"inherit",display:"table",maxWidth:"100%",padding:"0",whiteSpace:"normal"},e.progress={verticalAlign:"baseline"},e.textarea={overflow:"auto"},e['[type="checkbox"],\n    [type="radio"]']={boxSizing:"border-box",padding:"0"},e['[type="number"]::-webkit-inner-spin-button,\n    [type="number"]::-webkit-outer-spin-button']={height:"auto"},e['[type="search"]']={WebkitAppearance:"textfield",outlineOffset:"-2px"},e['[type="search"]::-webkit-search-decoration']={WebkitAppearance:"none"},e["::-webkit-file-upload-button"]={WebkitAppearance:"button",font:"inherit"},e.details={display:"block"},e.summary={display:"list-item"},e.template={display:"none"},e["[hidden]"]={display:"none"},e),{"abbr[title]":{textDecoration:"underline dotted"}}]}function ea(e){var t=e.colorStops,n=e.extent,r=e.fallback,a=e.position,i=e.shape;if(!t||t.length<2)throw new m(57);return{backgroundColor:r||t[0].split(" ")[0],backgroundImage:en(o||(o=f(["radial-gradient(","","","",")"])),void 0===a?"":a,void 0===i?"":i,void 0===n?"":n,t.join(", "))}}function ei(e,t,n,r,o){if(void 0===n&&(n="png"),void 0===o&&(o="_2x"),!e)throw new m(58);var i,l=n.replace(/^\./,""),u=r?r+"."+l:""+e+o+"."+l;return(i={backgroundImage:"url("+e+"."+l+")"})[et()]=(0,a.Z)({backgroundImage:"url("+u+")"},t?{backgroundSize:t}:{}),i}var el={easeInBack:"cubic-bezier(0.600, -0.280, 0.735, 0.045)",easeInCirc:"cubic-bezier(0.600,  0.040, 0.980, 0.335)",easeInCubic:"cubic-bezier(0.550,  0.055, 0.675, 0.190)",easeInExpo:"cubic-bezier(0.950,  0.050, 0.795, 0.035)",easeInQuad:"cubic-bezier(0.550,  0.085, 0.680, 0.530)",easeInQuart:"cubic-bezier(0.895,  0.030, 0.685, 0.220)",easeInQuint:"cubic-bezier(0.755,  0.050, 0.855, 0.060)",easeInSine:"cubic-bezier(0.470,  0.000, 0.745, 0.715)",easeOutBack:"cubic-bezier(0.175,  0.885, 0.320, 1.275)",easeOutCubic:"cubic-bezier(0.215,  0.610, 0.355, 1.000)",easeOutCirc:"cubic-bezier(0.075,  0.820, 0.165, 1.000)",easeOutExpo:"cubic-bezier(0.190,  1.000, 0.220, 1.000)",easeOutQuad:"cubic-bezier(0.250,  0.460, 0.450, 0.940)",easeOutQuart:"cubic-bezier(0.165,  0.840, 0.440, 1.000)",easeOutQuint:"cubic-bezier(0.230,  1.000, 0.320, 1.000)",easeOutSine:"cubic-bezier(0.390,  0.575, 0.565, 1.000)",easeInOutBack:"cubic-bezier(0.680, -0.550, 0.265, 1.550)",easeInOutCirc:"cubic-bezier(0.785,  0.135, 0.150, 0.860)",easeInOutCubic:"cubic-bezier(0.645,  0.045, 0.355, 1.000)",easeInOutExpo:"cubic-bezier(1.000,  0.000, 0.000, 1.000)",easeInOutQuad:"cubic-bezier(0.455,  0.030, 0.515, 0.955)",easeInOutQuart:"cubic-bezier(0.770,  0.000, 0.175, 1.000)",easeInOutQuint:"cubic-bezier(0.860,  0.000, 0.070, 1.000)",easeInOutSine:"cubic-bezier(0.445,  0.050, 0.550, 0.950)"};function eu(e){return el[e]}var es=function(e,t,n){var r=""+n[0]+(n[1]||""),o=""+n[0]/2+(n[1]||""),a=""+t[0]+(t[1]||""),i=""+t[0]/2+(t[1]||"");switch(e){case"top":return"0 "+o+" "+a+" "+o;case"topLeft":return r+" "+a+" 0 0";case"left":return i+" "+r+" "+i+" 0";case"bottomLeft":return r+" 0 0 "+a;case"bottom":return a+" "+o+" 0 "+o;case"bottomRight":return"0 0 "+r+" "+a;case"right":return i+" 0 "+i+" "+r;default:return"0 "+r+" "+a+" 0"}},ec=function(e,t){switch(e){case"top":case"bottomRight":return{borderBottomColor:t};case"right":case"bottomLeft":return{borderLeftColor:t};case"bottom":case"topLeft":return{borderTopColor:t};case"left":case"topRight":return{borderRightColor:t};default:throw new m(59)}};function ed(e){var t=e.pointingDirection,n=e.height,r=e.width,o=e.foregroundColor,i=e.backgroundColor,l=T(r),u=T(n);if(isNaN(u[0])||isNaN(l[0]))throw new m(60);return(0,a.Z)({width:"0",height:"0",borderColor:void 0===i?"transparent":i},ec(t,o),{borderStyle:"solid",borderWidth:es(t,u,l)})}function ef(e){void 0===e&&(e="break-word");var t="break-word"===e?"break-all":e;return{overflowWrap:e,wordWrap:e,wordBreak:t}}function ep(e){return Math.round(255*e)}function eg(e,t,n){return ep(e)+","+ep(t)+","+ep(n)}function em(e,t,n,r){if(void 0===r&&(r=eg),0===t)return r(n,n,n);var o=(e%360+360)%360/60,a=(1-Math.abs(2*n-1))*t,i=a*(1-Math.abs(o%2-1)),l=0,u=0,s=0;o>=0&&o<1?(l=a,u=i):o>=1&&o<2?(l=i,u=a):o>=2&&o<3?(u=a,s=i):o>=3&&o<4?(u=i,s=a):o>=4&&o<5?(l=i,s=a):o>=5&&o<6&&(l=a,s=i);var c=n-a/2;return r(l+c,u+c,s+c)}var eb={aliceblue:"f0f8ff",antiquewhite:"faebd7",aqua:"00ffff",aquamarine:"7fffd4",azure:"f0ffff",beige:"f5f5dc",bisque:"ffe4c4",black:"000",blanchedalmond:"ffebcd",blue:"0000ff",blueviolet:"8a2be2",brown:"a52a2a",burlywood:"deb887",cadetblue:"5f9ea0",chartreuse:"7fff00",chocolate:"d2691e",coral:"ff7f50",cornflowerblue:"6495ed",cornsilk:"fff8dc",crimson:"dc143c",cyan:"00ffff",darkblue:"00008b",darkcyan:"008b8b",darkgoldenrod:"b8860b",darkgray:"a9a9a9",darkgreen:"006400",darkgrey:"a9a9a9",darkkhaki:"bdb76b",darkmagenta:"8b008b",darkolivegreen:"556b2f",darkorange:"ff8c00",darkorchid:"9932cc",darkred:"8b0000",darksalmon:"e9967a",darkseagreen:"8fbc8f",darkslateblue:"483d8b",darkslategray:"2f4f4f",darkslategrey:"2f4f4f",darkturquoise:"00ced1",darkviolet:"9400d3",deeppink:"ff1493",deepskyblue:"00bfff",dimgray:"696969",dimgrey:"696969",dodgerblue:"1e90ff",firebrick:"b22222",floralwhite:"fffaf0",forestgreen:"228b22",fuchsia:"ff00ff",gainsboro:"dcdcdc",ghostwhite:"f8f8ff",gold:"ffd700",goldenrod:"daa520",gray:"808080",green:"008000",greenyellow:"adff2f",grey:"808080",honeydew:"f0fff0",hotpink:"ff69b4",indianred:"cd5c5c",indigo:"4b0082",ivory:"fffff0",khaki:"f0e68c",lavender:"e6e6fa",lavenderblush:"fff0f5",lawngreen:"7cfc00",lemonchiffon:"fffacd",lightblue:"add8e6",lightcoral:"f08080",lightcyan:"e0ffff",lightgoldenrodyellow:"fafad2",lightgray:"d3d3d3",lightgreen:"90ee90",lightgrey:"d3d3d3",lightpink:"ffb6c1",lightsalmon:"ffa07a",lightseagreen:"20b2aa",lightskyblue:"87cefa",lightslategray:"789",lightslategrey:"789",lightsteelblue:"b0c4de",lightyellow:"ffffe0",lime:"0f0",limegreen:"32cd32",linen:"faf0e6",magenta:"f0f",maroon:"800000",mediumaquamarine:"66cdaa",mediumblue:"0000cd",mediumorchid:"ba55d3",mediumpurple:"9370db",mediumseagreen:"3cb371",mediumslateblue:"7b68ee",mediumspringgreen:"00fa9a",mediumturquoise:"48d1cc",mediumvioletred:"c71585",midnightblue:"191970",mintcream:"f5fffa",mistyrose:"ffe4e1",moccasin:"ffe4b5",navajowhite:"ffdead",navy:"000080",oldlace:"fdf5e6",olive:"808000",olivedrab:"6b8e23",orange:"ffa500",orangered:"ff4500",orchid:"da70d6",palegoldenrod:"eee8aa",palegreen:"98fb98",paleturquoise:"afeeee",palevioletred:"db7093",papayawhip:"ffefd5",peachpuff:"ffdab9",peru:"cd853f",pink:"ffc0cb",plum:"dda0dd",powderblue:"b0e0e6",purple:"800080",rebeccapurple:"639",red:"f00",rosybrown:"bc8f8f",royalblue:"4169e1",saddlebrown:"8b4513",salmon:"fa8072",sandybrown:"f4a460",seagreen:"2e8b57",seashell:"fff5ee",sienna:"a0522d",silver:"c0c0c0",skyblue:"87ceeb",slateblue:"6a5acd",slategray:"708090",slategrey:"708090",snow:"fffafa",springgreen:"00ff7f",steelblue:"4682b4",tan:"d2b48c",teal:"008080",thistle:"d8bfd8",tomato:"ff6347",turquoise:"40e0d0",violet:"ee82ee",wheat:"f5deb3",white:"fff",whitesmoke:"f5f5f5",yellow:"ff0",yellowgreen:"9acd32"},eh=/^#[a-fA-F0-9]{6}$/,ev=/^#[a-fA-F0-9]{8}$/,ey=/^#[a-fA-F0-9]{3}$/,ew=/^#[a-fA-F0-9]{4}$/,eS=/^rgb\(\s*(\d{1,3})\s*(?:,)?\s*(\d{1,3})\s*(?:,)?\s*(\d{1,3})\s*\)$/i,eC=/^rgb(?:a)?\(\s*(\d{1,3})\s*(?:,)?\s*(\d{1,3})\s*(?:,)?\s*(\d{1,3})\s*(?:,|\/)\s*([-+]?\d*[.]?\d+[%]?)\s*\)$/i,ex=/^hsl\(\s*(\d{0,3}[.]?[0-9]+(?:deg)?)\s*(?:,)?\s*(\d{1,3}[.]?[0-9]?)%\s*(?:,)?\s*(\d{1,3}[.]?[0-9]?)%\s*\)$/i,eE=/^hsl(?:a)?\(\s*(\d{0,3}[.]?[0-9]+(?:deg)?)\s*(?:,)?\s*(\d{1,3}[.]?[0-9]?)%\s*(?:,)?\s*(\d{1,3}[.]?[0-9]?)%\s*(?:,|\/)\s*([-+]?\d*[.]?\d+[%]?)\s*\)$/i;function eR(e){if("string"!=typeof e)throw new m(3);var t=function(e){if("string"!=typeof e)return e;var t=e.toLowerCase();return eb[t]?"#"+eb[t]:e}(e);if(t.match(eh))return{red:parseInt(""+t[1]+t[2],16),green:parseInt(""+t[3]+t[4],16),blue:parseInt(""+t[5]+t[6],16)};if(t.match(ev)){var n=parseFloat((parseInt(""+t[7]+t[8],16)/255).toFixed(2));return{red:parseInt(""+t[1]+t[2],16),green:parseInt(""+t[3]+t[4],16),blue:parseInt(""+t[5]+t[6],16),alpha:n}}if(t.match(ey))return{red:parseInt(""+t[1]+t[1],16),green:parseInt(""+t[2]+t[2],16),blue:parseInt(""+t[3]+t[3],16)};if(t.match(ew)){var r=parseFloat((parseInt(""+t[4]+t[4],16)/255).toFixed(2));return{red:parseInt(""+t[1]+t[1],16),green:parseInt(""+t[2]+t[2],16),blue:parseInt(""+t[3]+t[3],16),alpha:r}}var o=eS.exec(t);if(o)return{red:parseInt(""+o[1],10),green:parseInt(""+o[2],10),blue:parseInt(""+o[3],10)};var a=eC.exec(t.substring(0,50));if(a)return{red:parseInt(""+a[1],10),green:parseInt(""+a[2],10),blue:parseInt(""+a[3],10),alpha:parseFloat(""+a[4])>1?parseFloat(""+a[4])/100:parseFloat(""+a[4])};var i=ex.exec(t);if(i){var l="rgb("+em(parseInt(""+i[1],10),parseInt(""+i[2],10)/100,parseInt(""+i[3],10)/100)+")",u=eS.exec(l);if(!u)throw new m(4,t,l);return{red:parseInt(""+u[1],10),green:parseInt(""+u[2],10),blue:parseInt(""+u[3],10)}}var s=eE.exec(t.substring(0,50));if(s){var c="rgb("+em(parseInt(""+s[1],10),parseInt(""+s[2],10)/100,parseInt(""+s[3],10)/100)+")",d=eS.exec(c);if(!d)throw new m(4,t,c);return{red:parseInt(""+d[1],10),green:parseInt(""+d[2],10),blue:parseInt(""+d[3],10),alpha:parseFloat(""+s[4])>1?parseFloat(""+s[4])/100:parseFloat(""+s[4])}}throw new m(5)}function ek(e){return function(e){var t,n=e.red/255,r=e.green/255,o=e.blue/255,a=Math.max(n,r,o),i=Math.min(n,r,o),l=(a+i)/2;if(a===i)return void 0!==e.alpha?{hue:0,saturation:0,lightness:l,alpha:e.alpha}:{hue:0,saturation:0,lightness:l};var u=a-i,s=l>.5?u/(2-a-i):u/(a+i);switch(a){case n:t=(r-o)/u+(r<o?6:0);break;case r:t=(o-n)/u+2;break;default:t=(n-r)/u+4}return(t*=60,void 0!==e.alpha)?{hue:t,saturation:s,lightness:l,alpha:e.alpha}:{hue:t,saturation:s,lightness:l}}(eR(e))}var e_=function(e){return 7===e.length&&e[1]===e[2]&&e[3]===e[4]&&e[5]===e[6]?"#"+e[1]+e[3]+e[5]:e};function eO(e){var t=e.toString(16);return 1===t.length?"0"+t:t}function eP(e){return eO(Math.round(255*e))}function eA(e,t,n){return e_("#"+eP(e)+eP(t)+eP(n))}function eT(e,t,n){if("number"==typeof e&&"number"==typeof t&&"number"==typeof n)return em(e,t,n,eA);if("object"==typeof e&&void 0===t&&void 0===n)return em(e.hue,e.saturation,e.lightness,eA);throw new m(1)}function eI(e,t,n,r){if("number"==typeof e&&"number"==typeof t&&"number"==typeof n&&"number"==typeof r)return r>=1?em(e,t,n,eA):"rgba("+em(e,t,n)+","+r+")";if("object"==typeof e&&void 0===t&&void 0===n&&void 0===r)return e.alpha>=1?em(e.hue,e.saturation,e.lightness,eA):"rgba("+em(e.hue,e.saturation,e.lightness)+","+e.alpha+")";throw new m(2)}function e$(e,t,n){if("number"==typeof e&&"number"==typeof t&&"number"==typeof n)return e_("#"+eO(e)+eO(t)+eO(n));if("object"==typeof e&&void 0===t&&void 0===n)return e_("#"+eO(e.red)+eO(e.green)+eO(e.blue));throw new m(6)}function ez(e,t,n,r){if("string"==typeof e&&"number"==typeof t){var o=eR(e);return"rgba("+o.red+","+o.green+","+o.blue+","+t+")"}if("number"==typeof e&&"number"==typeof t&&"number"==typeof n&&"number"==typeof r)return r>=1?e$(e,t,n):"rgba("+e+","+t+","+n+","+r+")";if("object"==typeof e&&void 0===t&&void 0===n&&void 0===r)return e.alpha>=1?e$(e.red,e.green,e.blue):"rgba("+e.red+","+e.green+","+e.blue+","+e.alpha+")";throw new m(7)}function eF(e){if("object"!=typeof e)throw new m(8);if("number"==typeof e.red&&"number"==typeof e.green&&"number"==typeof e.blue&&"number"==typeof e.alpha)return ez(e);if("number"==typeof e.red&&"number"==typeof e.green&&"number"==typeof e.blue&&("number"!=typeof e.alpha||void 0===e.alpha))return e$(e);if("number"==typeof e.hue&&"number"==typeof e.saturation&&"number"==typeof e.lightness&&"number"==typeof e.alpha)return eI(e);if("number"==typeof e.hue&&"number"==typeof e.saturation&&"number"==typeof e.lightness&&("number"!=typeof e.alpha||void 0===e.alpha))return eT(e);throw new m(8)}function ej(e){return function e(t,n,r){return function(){var o=r.concat(Array.prototype.slice.call(arguments));return o.length>=n?t.apply(this,o):e(t,n,o)}}(e,e.length,[])}var eN=ej(function(e,t){if("transparent"===t)return t;var n=ek(t);return eF((0,a.Z)({},n,{hue:n.hue+parseFloat(e)}))});function eB(e){if("transparent"===e)return e;var t=ek(e);return eF((0,a.Z)({},t,{hue:(t.hue+180)%360}))}function eL(e,t,n){return Math.max(e,Math.min(t,n))}var eG=ej(function(e,t){if("transparent"===t)return t;var n=ek(t);return eF((0,a.Z)({},n,{lightness:eL(0,1,n.lightness-parseFloat(e))}))}),eM=ej(function(e,t){if("transparent"===t)return t;var n=ek(t);return eF((0,a.Z)({},n,{saturation:eL(0,1,n.saturation-parseFloat(e))}))});function eW(e){if("transparent"===e)return 0;var t=eR(e),n=Object.keys(t).map(function(e){var n=t[e]/255;return n<=.03928?n/12.92:Math.pow((n+.055)/1.055,2.4)});return parseFloat((.2126*n[0]+.7152*n[1]+.0722*n[2]).toFixed(3))}function eD(e,t){var n=eW(e),r=eW(t);return parseFloat((n>r?(n+.05)/(r+.05):(r+.05)/(n+.05)).toFixed(2))}function eH(e){return"transparent"===e?e:eF((0,a.Z)({},ek(e),{saturation:0}))}function eU(e){if("object"==typeof e&&"number"==typeof e.hue&&"number"==typeof e.saturation&&"number"==typeof e.lightness)return e.alpha&&"number"==typeof e.alpha?eI({hue:e.hue,saturation:e.saturation,lightness:e.lightness,alpha:e.alpha}):eT({hue:e.hue,saturation:e.saturation,lightness:e.lightness});throw new m(45)}function eV(e){if("transparent"===e)return e;var t=eR(e);return eF((0,a.Z)({},t,{red:255-t.red,green:255-t.green,blue:255-t.blue}))}var eK=ej(function(e,t){if("transparent"===t)return t;var n=ek(t);return eF((0,a.Z)({},n,{lightness:eL(0,1,n.lightness+parseFloat(e))}))});function eZ(e,t){var n=eD(e,t);return{AA:n>=4.5,AALarge:n>=3,AAA:n>=7,AAALarge:n>=4.5}}var eq=ej(function(e,t,n){if("transparent"===t)return n;if("transparent"===n)return t;if(0===e)return n;var r=eR(t),o=(0,a.Z)({},r,{alpha:"number"==typeof r.alpha?r.alpha:1}),i=eR(n),l=(0,a.Z)({},i,{alpha:"number"==typeof i.alpha?i.alpha:1}),u=o.alpha-l.alpha,s=2*parseFloat(e)-1,c=((s*u==-1?s:s+u)/(1+s*u)+1)/2,d=1-c;return ez({red:Math.floor(o.red*c+l.red*d),green:Math.floor(o.green*c+l.green*d),blue:Math.floor(o.blue*c+l.blue*d),alpha:o.alpha*parseFloat(e)+l.alpha*(1-parseFloat(e))})}),eX=ej(function(e,t){if("transparent"===t)return t;var n=eR(t),r="number"==typeof n.alpha?n.alpha:1;return ez((0,a.Z)({},n,{alpha:eL(0,1,(100*r+100*parseFloat(e))/100)}))}),eQ="#000",eJ="#fff";function eY(e,t,n,r){void 0===t&&(t=eQ),void 0===n&&(n=eJ),void 0===r&&(r=!0);var o=eW(e)>.179,a=o?t:n;return!r||eD(e,a)>=4.5?a:o?eQ:eJ}function e0(e){if("object"==typeof e&&"number"==typeof e.red&&"number"==typeof e.green&&"number"==typeof e.blue)return"number"==typeof e.alpha?ez({red:e.red,green:e.green,blue:e.blue,alpha:e.alpha}):e$({red:e.red,green:e.green,blue:e.blue});throw new m(46)}var e1=ej(function(e,t){if("transparent"===t)return t;var n=ek(t);return eF((0,a.Z)({},n,{saturation:eL(0,1,n.saturation+parseFloat(e))}))}),e5=ej(function(e,t){return"transparent"===t?t:eF((0,a.Z)({},ek(t),{hue:parseFloat(e)}))}),e2=ej(function(e,t){return"transparent"===t?t:eF((0,a.Z)({},ek(t),{lightness:parseFloat(e)}))}),e4=ej(function(e,t){return"transparent"===t?t:eF((0,a.Z)({},ek(t),{saturation:parseFloat(e)}))}),e6=ej(function(e,t){return"transparent"===t?t:eq(parseFloat(e),"rgb(0, 0, 0)",t)}),e8=ej(function(e,t){return"transparent"===t?t:eq(parseFloat(e),"rgb(255, 255, 255)",t)}),e7=ej(function(e,t){if("transparent"===t)return t;var n=eR(t),r="number"==typeof n.alpha?n.alpha:1;return ez((0,a.Z)({},n,{alpha:eL(0,1,+(100*r-100*parseFloat(e)).toFixed(2)/100)}))});function e9(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=Array.isArray(t[0]);if(!r&&t.length>8)throw new m(64);return{animation:t.map(function(e){if(r&&!Array.isArray(e)||!r&&Array.isArray(e))throw new m(65);if(Array.isArray(e)&&e.length>8)throw new m(66);return Array.isArray(e)?e.join(" "):e}).join(", ")}}function e3(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return{backgroundImage:t.join(", ")}}function te(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return{background:t.join(", ")}}var tt=["top","right","bottom","left"];function tn(e){for(var t,n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return"string"==typeof e&&tt.indexOf(e)>=0?((t={})["border"+C(e)+"Width"]=r[0],t["border"+C(e)+"Style"]=r[1],t["border"+C(e)+"Color"]=r[2],t):(r.unshift(e),{borderWidth:r[0],borderStyle:r[1],borderColor:r[2]})}function tr(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return E.apply(void 0,["borderColor"].concat(t))}function to(e,t){var n,r,o=C(e);if(!t&&0!==t)throw new m(62);if("Top"===o||"Bottom"===o)return(n={})["border"+o+"RightRadius"]=t,n["border"+o+"LeftRadius"]=t,n;if("Left"===o||"Right"===o)return(r={})["borderTop"+o+"Radius"]=t,r["borderBottom"+o+"Radius"]=t,r;throw new m(63)}function ta(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return E.apply(void 0,["borderStyle"].concat(t))}function ti(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return E.apply(void 0,["borderWidth"].concat(t))}function tl(e,t,n){if(!t)throw new m(67);if(0===e.length)return t("");for(var r,o=[],a=0;a<e.length;a+=1){if(n&&0>n.indexOf(e[a]))throw new m(68);o.push(t((r=e[a])?":"+r:""))}return o.join(",")}var tu=[void 0,null,"active","focus","hover"];function ts(e){return"button"+e+',\n  input[type="button"]'+e+',\n  input[type="reset"]'+e+',\n  input[type="submit"]'+e}function tc(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return tl(t,ts,tu)}function td(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return E.apply(void 0,["margin"].concat(t))}function tf(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return E.apply(void 0,["padding"].concat(t))}var tp=["absolute","fixed","relative","static","sticky"];function tg(e){for(var t=arguments.length,n=Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return tp.indexOf(e)>=0&&e?(0,a.Z)({},E.apply(void 0,[""].concat(n)),{position:e}):E.apply(void 0,["",e].concat(n))}function tm(e,t){return void 0===t&&(t=e),{height:e,width:t}}var tb=[void 0,null,"active","focus","hover"];function th(e){return'input[type="color"]'+e+',\n    input[type="date"]'+e+',\n    input[type="datetime"]'+e+',\n    input[type="datetime-local"]'+e+',\n    input[type="email"]'+e+',\n    input[type="month"]'+e+',\n    input[type="number"]'+e+',\n    input[type="password"]'+e+',\n    input[type="search"]'+e+',\n    input[type="tel"]'+e+',\n    input[type="text"]'+e+',\n    input[type="time"]'+e+',\n    input[type="url"]'+e+',\n    input[type="week"]'+e+",\n    input:not([type])"+e+",\n    textarea"+e}function tv(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return tl(t,th,tb)}function ty(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];if(!Array.isArray(t[0])||2!==t.length)return{transition:t.join(", ")};var r=t[1];if("string"!=typeof r)throw new m(61);return{transition:t[0].map(function(e){return e+" "+r}).join(", ")}}},40217:function(e,t,n){!function(e,t){"use strict";function n(e,t,n,r,o,a,i){try{var l=e[a](i),u=l.value}catch(e){return void n(e)}l.done?t(u):Promise.resolve(u).then(r,o)}function r(e){return function(){var t=this,r=arguments;return new Promise(function(o,a){var i=e.apply(t,r);function l(e){n(i,o,a,l,u,"next",e)}function u(e){n(i,o,a,l,u,"throw",e)}l(void 0)})}}function o(){return(o=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function a(e,t){if(null==e)return{};var n,r,o={},a=Object.keys(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}function i(e){var t=function(e,t){if("object"!=typeof e||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=typeof r)return r;throw TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==typeof t?t:String(t)}t=t&&Object.prototype.hasOwnProperty.call(t,"default")?t.default:t;var l={init:"init"},u=function(e){var t=e.value;return void 0===t?"":t},s=function(){return t.createElement(t.Fragment,null,"\xa0")},c={Cell:u,width:150,minWidth:0,maxWidth:Number.MAX_SAFE_INTEGER};function d(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.reduce(function(e,t){var n=t.style,r=t.className;return e=o({},e,{},a(t,["style","className"])),n&&(e.style=e.style?o({},e.style||{},{},n||{}):n),r&&(e.className=e.className?e.className+" "+r:r),""===e.className&&delete e.className,e},{})}var f=function(e,t){return void 0===t&&(t={}),function(n){return void 0===n&&(n={}),[].concat(e,[n]).reduce(function(e,r){return function e(t,n,r){return"function"==typeof n?e({},n(t,r)):Array.isArray(n)?d.apply(void 0,[t].concat(n)):d(t,n)}(e,r,o({},t,{userProps:n}))},{})}},p=function(e,t,n,r){return void 0===n&&(n={}),e.reduce(function(e,t){return t(e,n)},t)},g=function(e,t,n){return void 0===n&&(n={}),e.forEach(function(e){e(t,n)})};function m(e,t,n,r){e.findIndex(function(e){return e.pluginName===n}),t.forEach(function(t){e.findIndex(function(e){return e.pluginName===t})})}function b(e,t){return"function"==typeof e?e(t):e}function h(e){var n=t.useRef();return n.current=e,t.useCallback(function(){return n.current},[])}var v="undefined"!=typeof document?t.useLayoutEffect:t.useEffect;function y(e,n){var r=t.useRef(!1);v(function(){r.current&&e(),r.current=!0},n)}function w(e,t,n){return void 0===n&&(n={}),function(r,a){void 0===a&&(a={});var i="string"==typeof r?t[r]:r;if(void 0===i)throw console.info(t),Error("Renderer Error ☝️");return S(i,o({},e,{column:t},n,{},a))}}function S(e,n){var r;return"function"==typeof e&&(r=Object.getPrototypeOf(e)).prototype&&r.prototype.isReactComponent||"function"==typeof e||"object"==typeof e&&"symbol"==typeof e.$$typeof&&["react.memo","react.forward_ref"].includes(e.$$typeof.description)?t.createElement(e,n):e}function C(e){return O(e,"columns")}function x(e){var t=e.id,n=e.accessor,r=e.Header;if("string"==typeof n){t=t||n;var o=n.split(".");n=function(e){return function(e,t,n){if(!t)return e;var r,o,a="function"==typeof t?t:JSON.stringify(t),i=R.get(a)||(r=(function e(t,n){if(void 0===n&&(n=[]),Array.isArray(t))for(var r=0;r<t.length;r+=1)e(t[r],n);else n.push(t);return n})(t).map(function(e){return String(e).replace(".","_")}).join(".").replace(z,".").replace(F,"").split("."),R.set(a,r),r);try{o=i.reduce(function(e,t){return e[t]},e)}catch(e){}return void 0!==o?o:void 0}(e,o)}}if(!t&&"string"==typeof r&&r&&(t=r),!t&&e.columns)throw console.error(e),Error('A column ID (or unique "Header" value) is required!');if(!t)throw console.error(e),Error("A column ID (or string accessor) is required!");return Object.assign(e,{id:t,accessor:n}),e}function E(e,t){if(!t)throw Error();return Object.assign(e,o({Header:s,Footer:s},c,{},t,{},e)),Object.assign(e,{originalWidth:e.width}),e}var R=new Map;function k(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];for(var r=0;r<t.length;r+=1)if(void 0!==t[r])return t[r]}function _(e){if("function"==typeof e)return e}function O(e,t){var n=[];return function e(r){r.forEach(function(r){r[t]?e(r[t]):n.push(r)})}(e),n}function P(e,t){var n=t.manualExpandedKey,r=t.expanded,o=t.expandSubRows,a=void 0===o||o,i=[];return e.forEach(function(e){return function e(t,o){void 0===o&&(o=!0),t.isExpanded=t.original&&t.original[n]||r[t.id],t.canExpand=t.subRows&&!!t.subRows.length,o&&i.push(t),t.subRows&&t.subRows.length&&t.isExpanded&&t.subRows.forEach(function(t){return e(t,a)})}(e)}),i}function A(e,t,n){return _(e)||t[e]||n[e]||n.text}function T(e,t,n){return e?e(t,n):void 0===t}function I(){throw Error("React-Table: You have not called prepareRow(row) one or more rows you are attempting to render.")}var $=null,z=/\[/g,F=/\]/g,j=function(e){return o({role:"table"},e)},N=function(e){return o({role:"rowgroup"},e)},B=function(e,t){var n=t.column;return o({key:"header_"+n.id,colSpan:n.totalVisibleHeaderCount,role:"columnheader"},e)},L=function(e,t){var n=t.column;return o({key:"footer_"+n.id,colSpan:n.totalVisibleHeaderCount},e)},G=function(e,t){return o({key:"headerGroup_"+t.index,role:"row"},e)},M=function(e,t){return o({key:"footerGroup_"+t.index},e)},W=function(e,t){return o({key:"row_"+t.row.id,role:"row"},e)},D=function(e,t){var n=t.cell;return o({key:"cell_"+n.row.id+"_"+n.column.id,role:"cell"},e)};l.resetHiddenColumns="resetHiddenColumns",l.toggleHideColumn="toggleHideColumn",l.setHiddenColumns="setHiddenColumns",l.toggleHideAllColumns="toggleHideAllColumns";var H=function(e){e.getToggleHiddenProps=[U],e.getToggleHideAllColumnsProps=[V],e.stateReducers.push(K),e.useInstanceBeforeDimensions.push(Z),e.headerGroupsDeps.push(function(e,t){return[].concat(e,[t.instance.state.hiddenColumns])}),e.useInstance.push(q)};H.pluginName="useColumnVisibility";var U=function(e,t){var n=t.column;return[e,{onChange:function(e){n.toggleHidden(!e.target.checked)},style:{cursor:"pointer"},checked:n.isVisible,title:"Toggle Column Visible"}]},V=function(e,t){var n=t.instance;return[e,{onChange:function(e){n.toggleHideAllColumns(!e.target.checked)},style:{cursor:"pointer"},checked:!n.allColumnsHidden&&!n.state.hiddenColumns.length,title:"Toggle All Columns Hidden",indeterminate:!n.allColumnsHidden&&n.state.hiddenColumns.length}]};function K(e,t,n,r){if(t.type===l.init)return o({hiddenColumns:[]},e);if(t.type===l.resetHiddenColumns)return o({},e,{hiddenColumns:r.initialState.hiddenColumns||[]});if(t.type===l.toggleHideColumn){var a=(void 0!==t.value?t.value:!e.hiddenColumns.includes(t.columnId))?[].concat(e.hiddenColumns,[t.columnId]):e.hiddenColumns.filter(function(e){return e!==t.columnId});return o({},e,{hiddenColumns:a})}return t.type===l.setHiddenColumns?o({},e,{hiddenColumns:b(t.value,e.hiddenColumns)}):t.type===l.toggleHideAllColumns?o({},e,{hiddenColumns:(void 0!==t.value?t.value:!e.hiddenColumns.length)?r.allColumns.map(function(e){return e.id}):[]}):void 0}function Z(e){var n=e.headers,r=e.state.hiddenColumns;t.useRef(!1).current;var o=0;n.forEach(function(e){return o+=function e(t,n){t.isVisible=n&&!r.includes(t.id);var o=0;return t.headers&&t.headers.length?t.headers.forEach(function(n){return o+=e(n,t.isVisible)}):o=t.isVisible?1:0,t.totalVisibleHeaderCount=o,o}(e,!0)})}function q(e){var n=e.columns,r=e.flatHeaders,o=e.dispatch,a=e.allColumns,i=e.getHooks,u=e.state.hiddenColumns,s=e.autoResetHiddenColumns,c=h(e),d=a.length===u.length,p=t.useCallback(function(e,t){return o({type:l.toggleHideColumn,columnId:e,value:t})},[o]),g=t.useCallback(function(e){return o({type:l.setHiddenColumns,value:e})},[o]),m=t.useCallback(function(e){return o({type:l.toggleHideAllColumns,value:e})},[o]),b=f(i().getToggleHideAllColumnsProps,{instance:c()});r.forEach(function(e){e.toggleHidden=function(t){o({type:l.toggleHideColumn,columnId:e.id,value:t})},e.getToggleHiddenProps=f(i().getToggleHiddenProps,{instance:c(),column:e})});var v=h(void 0===s||s);y(function(){v()&&o({type:l.resetHiddenColumns})},[o,n]),Object.assign(e,{allColumnsHidden:d,toggleHideColumn:p,setHiddenColumns:g,toggleHideAllColumns:m,getToggleHideAllColumnsProps:b})}var X={},Q={},J=function(e,t,n){return e},Y=function(e,t){return e.subRows||[]},ee=function(e,t,n){return""+(n?[n.id,t].join("."):t)},et=function(e){return e};function en(e){var t=e.initialState,n=e.defaultColumn,r=e.getSubRows,i=e.getRowId,l=e.stateReducer,u=e.useControlledState;return o({},a(e,["initialState","defaultColumn","getSubRows","getRowId","stateReducer","useControlledState"]),{initialState:void 0===t?X:t,defaultColumn:void 0===n?Q:n,getSubRows:void 0===r?Y:r,getRowId:void 0===i?ee:i,stateReducer:void 0===l?J:l,useControlledState:void 0===u?et:u})}l.resetExpanded="resetExpanded",l.toggleRowExpanded="toggleRowExpanded",l.toggleAllRowsExpanded="toggleAllRowsExpanded";var er=function(e){e.getToggleAllRowsExpandedProps=[eo],e.getToggleRowExpandedProps=[ea],e.stateReducers.push(ei),e.useInstance.push(el),e.prepareRow.push(eu)};er.pluginName="useExpanded";var eo=function(e,t){var n=t.instance;return[e,{onClick:function(e){n.toggleAllRowsExpanded()},style:{cursor:"pointer"},title:"Toggle All Rows Expanded"}]},ea=function(e,t){var n=t.row;return[e,{onClick:function(){n.toggleRowExpanded()},style:{cursor:"pointer"},title:"Toggle Row Expanded"}]};function ei(e,t,n,r){if(t.type===l.init)return o({expanded:{}},e);if(t.type===l.resetExpanded)return o({},e,{expanded:r.initialState.expanded||{}});if(t.type===l.toggleAllRowsExpanded){var u=t.value,s=r.isAllRowsExpanded,c=r.rowsById;if(void 0!==u?u:!s){var d={};return Object.keys(c).forEach(function(e){d[e]=!0}),o({},e,{expanded:d})}return o({},e,{expanded:{}})}if(t.type===l.toggleRowExpanded){var f,p=t.id,g=t.value,m=e.expanded[p],b=void 0!==g?g:!m;if(!m&&b)return o({},e,{expanded:o({},e.expanded,((f={})[p]=!0,f))});if(m&&!b){var h=e.expanded;return h[p],o({},e,{expanded:a(h,[p].map(i))})}return e}}function el(e){var n=e.data,r=e.rows,o=e.rowsById,a=e.manualExpandedKey,i=void 0===a?"expanded":a,u=e.paginateExpandedRows,s=void 0===u||u,c=e.expandSubRows,d=void 0===c||c,p=e.autoResetExpanded,g=e.getHooks,b=e.plugins,v=e.state.expanded,w=e.dispatch;m(b,["useSortBy","useGroupBy","usePivotColumns","useGlobalFilter"],"useExpanded");var S=h(void 0===p||p),C=!!(Object.keys(o).length&&Object.keys(v).length);C&&Object.keys(o).some(function(e){return!v[e]})&&(C=!1),y(function(){S()&&w({type:l.resetExpanded})},[w,n]);var x=t.useCallback(function(e,t){w({type:l.toggleRowExpanded,id:e,value:t})},[w]),E=t.useCallback(function(e){return w({type:l.toggleAllRowsExpanded,value:e})},[w]),R=t.useMemo(function(){return s?P(r,{manualExpandedKey:i,expanded:v,expandSubRows:d}):r},[s,r,i,v,d]),k=t.useMemo(function(){var e;return e=0,Object.keys(v).forEach(function(t){var n=t.split(".");e=Math.max(e,n.length)}),e},[v]),_=h(e);Object.assign(e,{preExpandedRows:r,expandedRows:R,rows:R,expandedDepth:k,isAllRowsExpanded:C,toggleRowExpanded:x,toggleAllRowsExpanded:E,getToggleAllRowsExpandedProps:f(g().getToggleAllRowsExpandedProps,{instance:_()})})}function eu(e,t){var n=t.instance.getHooks,r=t.instance;e.toggleRowExpanded=function(t){return r.toggleRowExpanded(e.id,t)},e.getToggleRowExpandedProps=f(n().getToggleRowExpandedProps,{instance:r,row:e})}var es=function(e,t,n){return e=e.filter(function(e){return t.some(function(t){return String(e.values[t]).toLowerCase().includes(String(n).toLowerCase())})})};es.autoRemove=function(e){return!e};var ec=function(e,t,n){return e.filter(function(e){return t.some(function(t){var r=e.values[t];return void 0===r||String(r).toLowerCase()===String(n).toLowerCase()})})};ec.autoRemove=function(e){return!e};var ed=function(e,t,n){return e.filter(function(e){return t.some(function(t){var r=e.values[t];return void 0===r||String(r)===String(n)})})};ed.autoRemove=function(e){return!e};var ef=function(e,t,n){return e.filter(function(e){return t.some(function(t){return e.values[t].includes(n)})})};ef.autoRemove=function(e){return!e||!e.length};var ep=function(e,t,n){return e.filter(function(e){return t.some(function(t){var r=e.values[t];return r&&r.length&&n.every(function(e){return r.includes(e)})})})};ep.autoRemove=function(e){return!e||!e.length};var eg=function(e,t,n){return e.filter(function(e){return t.some(function(t){var r=e.values[t];return r&&r.length&&n.some(function(e){return r.includes(e)})})})};eg.autoRemove=function(e){return!e||!e.length};var em=function(e,t,n){return e.filter(function(e){return t.some(function(t){var r=e.values[t];return n.includes(r)})})};em.autoRemove=function(e){return!e||!e.length};var eb=function(e,t,n){return e.filter(function(e){return t.some(function(t){return e.values[t]===n})})};eb.autoRemove=function(e){return void 0===e};var eh=function(e,t,n){return e.filter(function(e){return t.some(function(t){return e.values[t]==n})})};eh.autoRemove=function(e){return null==e};var ev=function(e,t,n){var r=n||[],o=r[0],a=r[1];if((o="number"==typeof o?o:-1/0)>(a="number"==typeof a?a:1/0)){var i=o;o=a,a=i}return e.filter(function(e){return t.some(function(t){var n=e.values[t];return n>=o&&n<=a})})};ev.autoRemove=function(e){return!e||"number"!=typeof e[0]&&"number"!=typeof e[1]};var ey=Object.freeze({__proto__:null,text:es,exactText:ec,exactTextCase:ed,includes:ef,includesAll:ep,includesSome:eg,includesValue:em,exact:eb,equals:eh,between:ev});l.resetFilters="resetFilters",l.setFilter="setFilter",l.setAllFilters="setAllFilters";var ew=function(e){e.stateReducers.push(eS),e.useInstance.push(eC)};function eS(e,t,n,r){if(t.type===l.init)return o({filters:[]},e);if(t.type===l.resetFilters)return o({},e,{filters:r.initialState.filters||[]});if(t.type===l.setFilter){var a=t.columnId,i=t.filterValue,u=r.allColumns,s=r.filterTypes,c=u.find(function(e){return e.id===a});if(!c)throw Error("React-Table: Could not find a column with id: "+a);var d=A(c.filter,s||{},ey),f=e.filters.find(function(e){return e.id===a}),p=b(i,f&&f.value);return T(d.autoRemove,p,c)?o({},e,{filters:e.filters.filter(function(e){return e.id!==a})}):o({},e,f?{filters:e.filters.map(function(e){return e.id===a?{id:a,value:p}:e})}:{filters:[].concat(e.filters,[{id:a,value:p}])})}if(t.type===l.setAllFilters){var g=t.filters,m=r.allColumns,h=r.filterTypes;return o({},e,{filters:b(g,e.filters).filter(function(e){var t=m.find(function(t){return t.id===e.id});return!T(A(t.filter,h||{},ey).autoRemove,e.value,t)})})}}function eC(e){var n=e.data,r=e.rows,o=e.flatRows,a=e.rowsById,i=e.allColumns,u=e.filterTypes,s=e.manualFilters,c=e.defaultCanFilter,d=void 0!==c&&c,f=e.disableFilters,p=e.state.filters,g=e.dispatch,m=e.autoResetFilters,b=t.useCallback(function(e,t){g({type:l.setFilter,columnId:e,filterValue:t})},[g]),v=t.useCallback(function(e){g({type:l.setAllFilters,filters:e})},[g]);i.forEach(function(e){var t=e.id,n=e.accessor,r=e.defaultCanFilter,o=e.disableFilters;e.canFilter=n?k(!0!==o&&void 0,!0!==f&&void 0,!0):k(r,d,!1),e.setFilter=function(t){return b(e.id,t)};var a=p.find(function(e){return e.id===t});e.filterValue=a&&a.value});var w=t.useMemo(function(){if(s||!p.length)return[r,o,a];var e=[],t={};return[function n(r,o){void 0===o&&(o=0);var a=r;return(a=p.reduce(function(e,t){var n=t.id,r=t.value,a=i.find(function(e){return e.id===n});if(!a)return e;0===o&&(a.preFilteredRows=e);var l=A(a.filter,u||{},ey);return l?(a.filteredRows=l(e,[n],r),a.filteredRows):(console.warn("Could not find a valid 'column.filter' for column with the ID: "+a.id+"."),e)},r)).forEach(function(r){e.push(r),t[r.id]=r,r.subRows&&(r.subRows=r.subRows&&r.subRows.length>0?n(r.subRows,o+1):r.subRows)}),a}(r),e,t]},[s,p,r,o,a,i,u]),S=w[0],C=w[1],x=w[2];t.useMemo(function(){i.filter(function(e){return!p.find(function(t){return t.id===e.id})}).forEach(function(e){e.preFilteredRows=S,e.filteredRows=S})},[S,p,i]);var E=h(void 0===m||m);y(function(){E()&&g({type:l.resetFilters})},[g,s?null:n]),Object.assign(e,{preFilteredRows:r,preFilteredFlatRows:o,preFilteredRowsById:a,filteredRows:S,filteredFlatRows:C,filteredRowsById:x,rows:S,flatRows:C,rowsById:x,setFilter:b,setAllFilters:v})}ew.pluginName="useFilters",l.resetGlobalFilter="resetGlobalFilter",l.setGlobalFilter="setGlobalFilter";var ex=function(e){e.stateReducers.push(eE),e.useInstance.push(eR)};function eE(e,t,n,r){if(t.type===l.resetGlobalFilter)return o({},e,{globalFilter:r.initialState.globalFilter||void 0});if(t.type===l.setGlobalFilter){var i=t.filterValue,u=r.userFilterTypes,s=A(r.globalFilter,u||{},ey),c=b(i,e.globalFilter);return T(s.autoRemove,c)?(e.globalFilter,a(e,["globalFilter"])):o({},e,{globalFilter:c})}}function eR(e){var n=e.data,r=e.rows,o=e.flatRows,a=e.rowsById,i=e.allColumns,u=e.filterTypes,s=e.globalFilter,c=e.manualGlobalFilter,d=e.state.globalFilter,f=e.dispatch,p=e.autoResetGlobalFilter,g=e.disableGlobalFilter,m=t.useCallback(function(e){f({type:l.setGlobalFilter,filterValue:e})},[f]),b=t.useMemo(function(){if(c||void 0===d)return[r,o,a];var e=[],t={},n=A(s,u||{},ey);if(!n)return console.warn("Could not find a valid 'globalFilter' option."),r;i.forEach(function(e){var t=e.disableGlobalFilter;e.canFilter=k(!0!==t&&void 0,!0!==g&&void 0,!0)});var l=i.filter(function(e){return!0===e.canFilter});return[function r(o){return(o=n(o,l.map(function(e){return e.id}),d)).forEach(function(n){e.push(n),t[n.id]=n,n.subRows=n.subRows&&n.subRows.length?r(n.subRows):n.subRows}),o}(r),e,t]},[c,d,s,u,i,r,o,a,g]),v=b[0],w=b[1],S=b[2],C=h(void 0===p||p);y(function(){C()&&f({type:l.resetGlobalFilter})},[f,c?null:n]),Object.assign(e,{preGlobalFilteredRows:r,preGlobalFilteredFlatRows:o,preGlobalFilteredRowsById:a,globalFilteredRows:v,globalFilteredFlatRows:w,globalFilteredRowsById:S,rows:v,flatRows:w,rowsById:S,setGlobalFilter:m,disableGlobalFilter:g})}function ek(e,t){return t.reduce(function(e,t){return e+("number"==typeof t?t:0)},0)}ex.pluginName="useGlobalFilter";var e_=Object.freeze({__proto__:null,sum:ek,min:function(e){var t=e[0]||0;return e.forEach(function(e){"number"==typeof e&&(t=Math.min(t,e))}),t},max:function(e){var t=e[0]||0;return e.forEach(function(e){"number"==typeof e&&(t=Math.max(t,e))}),t},minMax:function(e){var t=e[0]||0,n=e[0]||0;return e.forEach(function(e){"number"==typeof e&&(t=Math.min(t,e),n=Math.max(n,e))}),t+".."+n},average:function(e){return ek(0,e)/e.length},median:function(e){if(!e.length)return null;var t=Math.floor(e.length/2),n=[].concat(e).sort(function(e,t){return e-t});return e.length%2!=0?n[t]:(n[t-1]+n[t])/2},unique:function(e){return Array.from(new Set(e).values())},uniqueCount:function(e){return new Set(e).size},count:function(e){return e.length}}),eO=[],eP={};l.resetGroupBy="resetGroupBy",l.setGroupBy="setGroupBy",l.toggleGroupBy="toggleGroupBy";var eA=function(e){e.getGroupByToggleProps=[eT],e.stateReducers.push(eI),e.visibleColumnsDeps.push(function(e,t){return[].concat(e,[t.instance.state.groupBy])}),e.visibleColumns.push(e$),e.useInstance.push(eF),e.prepareRow.push(ej)};eA.pluginName="useGroupBy";var eT=function(e,t){var n=t.header;return[e,{onClick:n.canGroupBy?function(e){e.persist(),n.toggleGroupBy()}:void 0,style:{cursor:n.canGroupBy?"pointer":void 0},title:"Toggle GroupBy"}]};function eI(e,t,n,r){if(t.type===l.init)return o({groupBy:[]},e);if(t.type===l.resetGroupBy)return o({},e,{groupBy:r.initialState.groupBy||[]});if(t.type===l.setGroupBy)return o({},e,{groupBy:t.value});if(t.type===l.toggleGroupBy){var a=t.columnId,i=t.value,u=void 0!==i?i:!e.groupBy.includes(a);return o({},e,u?{groupBy:[].concat(e.groupBy,[a])}:{groupBy:e.groupBy.filter(function(e){return e!==a})})}}function e$(e,t){var n=t.instance.state.groupBy;return(e=[].concat(n.map(function(t){return e.find(function(e){return e.id===t})}).filter(Boolean),e.filter(function(e){return!n.includes(e.id)}))).forEach(function(e){e.isGrouped=n.includes(e.id),e.groupedIndex=n.indexOf(e.id)}),e}var ez={};function eF(e){var n=e.data,r=e.rows,o=e.flatRows,a=e.rowsById,i=e.allColumns,u=e.flatHeaders,s=e.groupByFn,c=void 0===s?eN:s,d=e.manualGroupBy,p=e.aggregations,g=void 0===p?ez:p,b=e.plugins,v=e.state.groupBy,w=e.dispatch,S=e.autoResetGroupBy,C=e.disableGroupBy,x=e.defaultCanGroupBy,E=e.getHooks;m(b,["useColumnOrder","useFilters"],"useGroupBy");var R=h(e);i.forEach(function(t){var n=t.accessor,r=t.defaultGroupBy,o=t.disableGroupBy;t.canGroupBy=n?k(t.canGroupBy,!0!==o&&void 0,!0!==C&&void 0,!0):k(t.canGroupBy,r,x,!1),t.canGroupBy&&(t.toggleGroupBy=function(){return e.toggleGroupBy(t.id)}),t.Aggregated=t.Aggregated||t.Cell});var _=t.useCallback(function(e,t){w({type:l.toggleGroupBy,columnId:e,value:t})},[w]),P=t.useCallback(function(e){w({type:l.setGroupBy,value:e})},[w]);u.forEach(function(e){e.getGroupByToggleProps=f(E().getGroupByToggleProps,{instance:R(),header:e})});var A=t.useMemo(function(){if(d||!v.length)return[r,o,a,eO,eP,o,a];var e=v.filter(function(e){return i.find(function(t){return t.id===e})}),t=[],n={},l=[],u={},s=[],f={},p=function r(o,a,d){if(void 0===a&&(a=0),a===e.length)return o;var p=e[a];return Object.entries(c(o,p)).map(function(o,c){var m,b,h=o[0],v=o[1],y=p+":"+h,w=r(v,a+1,y=d?d+">"+y:y),S=a?O(v,"leafRows"):v,C={id:y,isGrouped:!0,groupByID:p,groupByVal:h,values:(m=a,b={},i.forEach(function(t){if(e.includes(t.id))b[t.id]=v[0]?v[0].values[t.id]:null;else{var n="function"==typeof t.aggregate?t.aggregate:g[t.aggregate]||e_[t.aggregate];if(n){var r=v.map(function(e){return e.values[t.id]}),o=S.map(function(e){var n=e.values[t.id];if(!m&&t.aggregateValue){var r="function"==typeof t.aggregateValue?t.aggregateValue:g[t.aggregateValue]||e_[t.aggregateValue];if(!r)throw console.info({column:t}),Error("React Table: Invalid column.aggregateValue option for column listed above");n=r(n,e,t)}return n});b[t.id]=n(o,r)}else{if(t.aggregate)throw console.info({column:t}),Error("React Table: Invalid column.aggregate option for column listed above");b[t.id]=null}}}),b),subRows:w,leafRows:S,depth:a,index:c};return w.forEach(function(e){t.push(e),n[e.id]=e,e.isGrouped?(l.push(e),u[e.id]=e):(s.push(e),f[e.id]=e)}),C})}(r);return p.forEach(function(e){t.push(e),n[e.id]=e,e.isGrouped?(l.push(e),u[e.id]=e):(s.push(e),f[e.id]=e)}),[p,t,n,l,u,s,f]},[d,v,r,o,a,i,g,c]),T=A[0],I=A[1],$=A[2],z=A[3],F=A[4],j=A[5],N=A[6],B=h(void 0===S||S);y(function(){B()&&w({type:l.resetGroupBy})},[w,d?null:n]),Object.assign(e,{preGroupedRows:r,preGroupedFlatRow:o,preGroupedRowsById:a,groupedRows:T,groupedFlatRows:I,groupedRowsById:$,onlyGroupedFlatRows:z,onlyGroupedRowsById:F,nonGroupedFlatRows:j,nonGroupedRowsById:N,rows:T,flatRows:I,rowsById:$,toggleGroupBy:_,setGroupBy:P})}function ej(e){e.allCells.forEach(function(t){var n;t.isGrouped=t.column.isGrouped&&t.column.id===e.groupByID,t.isPlaceholder=!t.isGrouped&&t.column.isGrouped,t.isAggregated=!t.isGrouped&&!t.isPlaceholder&&(null==(n=e.subRows)?void 0:n.length)})}function eN(e,t){return e.reduce(function(e,n,r){var o=""+n.values[t];return e[o]=Array.isArray(e[o])?e[o]:[],e[o].push(n),e},{})}var eB=/([0-9]+)/gm;function eL(e,t){return e===t?0:e>t?1:-1}function eG(e,t,n){return[e.values[n],t.values[n]]}function eM(e){return"number"==typeof e?isNaN(e)||e===1/0||e===-1/0?"":String(e):"string"==typeof e?e:""}var eW=Object.freeze({__proto__:null,alphanumeric:function(e,t,n){var r=eG(e,t,n),o=r[0],a=r[1];for(o=eM(o),a=eM(a),o=o.split(eB).filter(Boolean),a=a.split(eB).filter(Boolean);o.length&&a.length;){var i=o.shift(),l=a.shift(),u=parseInt(i,10),s=parseInt(l,10),c=[u,s].sort();if(isNaN(c[0])){if(i>l)return 1;if(l>i)return -1}else{if(isNaN(c[1]))return isNaN(u)?-1:1;if(u>s)return 1;if(s>u)return -1}}return o.length-a.length},datetime:function(e,t,n){var r=eG(e,t,n),o=r[0],a=r[1];return eL(o=o.getTime(),a=a.getTime())},basic:function(e,t,n){var r=eG(e,t,n);return eL(r[0],r[1])},string:function(e,t,n){var r=eG(e,t,n),o=r[0],a=r[1];for(o=o.split("").filter(Boolean),a=a.split("").filter(Boolean);o.length&&a.length;){var i=o.shift(),l=a.shift(),u=i.toLowerCase(),s=l.toLowerCase();if(u>s)return 1;if(s>u)return -1;if(i>l)return 1;if(l>i)return -1}return o.length-a.length},number:function(e,t,n){var r=eG(e,t,n),o=r[0],a=r[1],i=/[^0-9.]/gi;return eL(o=Number(String(o).replace(i,"")),a=Number(String(a).replace(i,"")))}});l.resetSortBy="resetSortBy",l.setSortBy="setSortBy",l.toggleSortBy="toggleSortBy",l.clearSortBy="clearSortBy",c.sortType="alphanumeric",c.sortDescFirst=!1;var eD=function(e){e.getSortByToggleProps=[eH],e.stateReducers.push(eU),e.useInstance.push(eV)};eD.pluginName="useSortBy";var eH=function(e,t){var n=t.instance,r=t.column,o=n.isMultiSortEvent,a=void 0===o?function(e){return e.shiftKey}:o;return[e,{onClick:r.canSort?function(e){e.persist(),r.toggleSortBy(void 0,!n.disableMultiSort&&a(e))}:void 0,style:{cursor:r.canSort?"pointer":void 0},title:r.canSort?"Toggle SortBy":void 0}]};function eU(e,t,n,r){if(t.type===l.init)return o({sortBy:[]},e);if(t.type===l.resetSortBy)return o({},e,{sortBy:r.initialState.sortBy||[]});if(t.type===l.clearSortBy)return o({},e,{sortBy:e.sortBy.filter(function(e){return e.id!==t.columnId})});if(t.type===l.setSortBy)return o({},e,{sortBy:t.sortBy});if(t.type===l.toggleSortBy){var a,i=t.columnId,u=t.desc,s=t.multi,c=r.allColumns,d=r.disableMultiSort,f=r.disableSortRemove,p=r.disableMultiRemove,g=r.maxMultiSortColCount,m=void 0===g?Number.MAX_SAFE_INTEGER:g,b=e.sortBy,h=c.find(function(e){return e.id===i}).sortDescFirst,v=b.find(function(e){return e.id===i}),y=b.findIndex(function(e){return e.id===i}),w=null!=u,S=[];return"toggle"!=(a=!d&&s?v?"toggle":"add":y!==b.length-1||1!==b.length?"replace":v?"toggle":"replace")||f||w||s&&p||!(v&&v.desc&&!h||!v.desc&&h)||(a="remove"),"replace"===a?S=[{id:i,desc:w?u:h}]:"add"===a?(S=[].concat(b,[{id:i,desc:w?u:h}])).splice(0,S.length-m):"toggle"===a?S=b.map(function(e){return e.id===i?o({},e,{desc:w?u:!v.desc}):e}):"remove"===a&&(S=b.filter(function(e){return e.id!==i})),o({},e,{sortBy:S})}}function eV(e){var n=e.data,r=e.rows,o=e.flatRows,a=e.allColumns,i=e.orderByFn,u=void 0===i?eK:i,s=e.sortTypes,c=e.manualSortBy,d=e.defaultCanSort,p=e.disableSortBy,g=e.flatHeaders,b=e.state.sortBy,v=e.dispatch,w=e.plugins,S=e.getHooks,C=e.autoResetSortBy;m(w,["useFilters","useGlobalFilter","useGroupBy","usePivotColumns"],"useSortBy");var x=t.useCallback(function(e){v({type:l.setSortBy,sortBy:e})},[v]),E=t.useCallback(function(e,t,n){v({type:l.toggleSortBy,columnId:e,desc:t,multi:n})},[v]),R=h(e);g.forEach(function(e){var t=e.accessor,n=e.canSort,r=e.disableSortBy,o=e.id,a=t?k(!0!==r&&void 0,!0!==p&&void 0,!0):k(d,n,!1);e.canSort=a,e.canSort&&(e.toggleSortBy=function(t,n){return E(e.id,t,n)},e.clearSortBy=function(){v({type:l.clearSortBy,columnId:e.id})}),e.getSortByToggleProps=f(S().getSortByToggleProps,{instance:R(),column:e});var i=b.find(function(e){return e.id===o});e.isSorted=!!i,e.sortedIndex=b.findIndex(function(e){return e.id===o}),e.isSortedDesc=e.isSorted?i.desc:void 0});var O=t.useMemo(function(){if(c||!b.length)return[r,o];var e=[],t=b.filter(function(e){return a.find(function(t){return t.id===e.id})});return[function n(r){var o=u(r,t.map(function(e){var t=a.find(function(t){return t.id===e.id});if(!t)throw Error("React-Table: Could not find a column with id: "+e.id+" while sorting");var n=t.sortType,r=_(n)||(s||{})[n]||eW[n];if(!r)throw Error("React-Table: Could not find a valid sortType of '"+n+"' for column '"+e.id+"'.");return function(t,n){return r(t,n,e.id,e.desc)}}),t.map(function(e){var t=a.find(function(t){return t.id===e.id});return t&&t.sortInverted?e.desc:!e.desc}));return o.forEach(function(t){e.push(t),t.subRows&&0!==t.subRows.length&&(t.subRows=n(t.subRows))}),o}(r),e]},[c,b,r,o,a,u,s]),P=O[0],A=O[1],T=h(void 0===C||C);y(function(){T()&&v({type:l.resetSortBy})},[c?null:n]),Object.assign(e,{preSortedRows:r,preSortedFlatRows:o,sortedRows:P,sortedFlatRows:A,rows:P,flatRows:A,setSortBy:x,toggleSortBy:E})}function eK(e,t,n){return[].concat(e).sort(function(e,r){for(var o=0;o<t.length;o+=1){var a=t[o],i=!1===n[o]||"desc"===n[o],l=a(e,r);if(0!==l)return i?-l:l}return n[0]?e.index-r.index:r.index-e.index})}l.resetPage="resetPage",l.gotoPage="gotoPage",l.setPageSize="setPageSize";var eZ=function(e){e.stateReducers.push(eq),e.useInstance.push(eX)};function eq(e,t,n,r){if(t.type===l.init)return o({pageSize:10,pageIndex:0},e);if(t.type===l.resetPage)return o({},e,{pageIndex:r.initialState.pageIndex||0});if(t.type===l.gotoPage){var a=r.pageCount,i=r.page,u=b(t.pageIndex,e.pageIndex),s=!1;return u>e.pageIndex?s=-1===a?i.length>=e.pageSize:u<a:u<e.pageIndex&&(s=u>-1),s?o({},e,{pageIndex:u}):e}if(t.type===l.setPageSize){var c=t.pageSize,d=e.pageSize*e.pageIndex;return o({},e,{pageIndex:Math.floor(d/c),pageSize:c})}}function eX(e){var n=e.rows,r=e.autoResetPage,o=e.manualExpandedKey,a=void 0===o?"expanded":o,i=e.plugins,u=e.pageCount,s=e.paginateExpandedRows,c=void 0===s||s,d=e.expandSubRows,f=void 0===d||d,p=e.state,g=p.pageSize,b=p.pageIndex,v=p.expanded,w=p.globalFilter,S=p.filters,C=p.groupBy,x=p.sortBy,E=e.dispatch,R=e.data,k=e.manualPagination;m(i,["useGlobalFilter","useFilters","useGroupBy","useSortBy","useExpanded"],"usePagination");var _=h(void 0===r||r);y(function(){_()&&E({type:l.resetPage})},[E,k?null:R,w,S,C,x]);var O=k?u:Math.ceil(n.length/g),A=t.useMemo(function(){return O>0?[].concat(Array(O)).fill(null).map(function(e,t){return t}):[]},[O]),T=t.useMemo(function(){var e;if(k)e=n;else{var t=g*b;e=n.slice(t,t+g)}return c?e:P(e,{manualExpandedKey:a,expanded:v,expandSubRows:f})},[f,v,a,k,b,g,c,n]),I=b>0,$=-1===O?T.length>=g:b<O-1,z=t.useCallback(function(e){E({type:l.gotoPage,pageIndex:e})},[E]),F=t.useCallback(function(){return z(function(e){return e-1})},[z]),j=t.useCallback(function(){return z(function(e){return e+1})},[z]);Object.assign(e,{pageOptions:A,pageCount:O,page:T,canPreviousPage:I,canNextPage:$,gotoPage:z,previousPage:F,nextPage:j,setPageSize:t.useCallback(function(e){E({type:l.setPageSize,pageSize:e})},[E])})}eZ.pluginName="usePagination",l.resetPivot="resetPivot",l.togglePivot="togglePivot";var eQ=function(e){e.getPivotToggleProps=[eY],e.stateReducers.push(e0),e.useInstanceAfterData.push(e1),e.allColumns.push(e5),e.accessValue.push(e2),e.materializedColumns.push(e4),e.materializedColumnsDeps.push(e6),e.visibleColumns.push(e8),e.visibleColumnsDeps.push(e7),e.useInstance.push(e9),e.prepareRow.push(e3)};eQ.pluginName="usePivotColumns";var eJ=[],eY=function(e,t){var n=t.header;return[e,{onClick:n.canPivot?function(e){e.persist(),n.togglePivot()}:void 0,style:{cursor:n.canPivot?"pointer":void 0},title:"Toggle Pivot"}]};function e0(e,t,n,r){if(t.type===l.init)return o({pivotColumns:eJ},e);if(t.type===l.resetPivot)return o({},e,{pivotColumns:r.initialState.pivotColumns||eJ});if(t.type===l.togglePivot){var a=t.columnId,i=t.value,u=void 0!==i?i:!e.pivotColumns.includes(a);return o({},e,u?{pivotColumns:[].concat(e.pivotColumns,[a])}:{pivotColumns:e.pivotColumns.filter(function(e){return e!==a})})}}function e1(e){e.allColumns.forEach(function(t){t.isPivotSource=e.state.pivotColumns.includes(t.id)})}function e5(e,t){var n=t.instance;return e.forEach(function(e){e.isPivotSource=n.state.pivotColumns.includes(e.id),e.uniqueValues=new Set}),e}function e2(e,t){var n=t.column;return n.uniqueValues&&void 0!==e&&n.uniqueValues.add(e),e}function e4(e,t){var n=t.instance,r=n.allColumns,a=n.state;if(!a.pivotColumns.length||!a.groupBy||!a.groupBy.length)return e;var i=a.pivotColumns.map(function(e){return r.find(function(t){return t.id===e})}).filter(Boolean),l=r.filter(function(e){return!e.isPivotSource&&!a.groupBy.includes(e.id)&&!a.pivotColumns.includes(e.id)});return[].concat(e,C(function e(t,n,r){void 0===t&&(t=0),void 0===r&&(r=[]);var a=i[t];return a?Array.from(a.uniqueValues).sort().map(function(i){var l=o({},a,{Header:a.PivotHeader||"string"==typeof a.header?a.Header+": "+i:i,isPivotGroup:!0,parent:n,depth:t,id:n?n.id+"."+a.id+"."+i:a.id+"."+i,pivotValue:i});return l.columns=e(t+1,l,[].concat(r,[function(e){return e.values[a.id]===i}])),l}):l.map(function(e){return o({},e,{canPivot:!1,isPivoted:!0,parent:n,depth:t,id:""+(n?n.id+"."+e.id:e.id),accessor:function(t,n,o){if(r.every(function(e){return e(o)}))return o.values[e.id]}})})}()))}function e6(e,t){var n=t.instance.state;return[].concat(e,[n.pivotColumns,n.groupBy])}function e8(e,t){var n=t.instance.state;return e=e.filter(function(e){return!e.isPivotSource}),n.pivotColumns.length&&n.groupBy&&n.groupBy.length&&(e=e.filter(function(e){return e.isGrouped||e.isPivoted})),e}function e7(e,t){var n=t.instance;return[].concat(e,[n.state.pivotColumns,n.state.groupBy])}function e9(e){var t=e.columns,n=e.allColumns,r=e.flatHeaders,o=e.getHooks,a=e.plugins,i=e.dispatch,u=e.autoResetPivot,s=e.manaulPivot,c=e.disablePivot,d=e.defaultCanPivot;m(a,["useGroupBy"],"usePivotColumns");var p=h(e);n.forEach(function(t){var n=t.accessor,r=t.defaultPivot,o=t.disablePivot;t.canPivot=n?k(t.canPivot,!0!==o&&void 0,!0!==c&&void 0,!0):k(t.canPivot,r,d,!1),t.canPivot&&(t.togglePivot=function(){return e.togglePivot(t.id)}),t.Aggregated=t.Aggregated||t.Cell}),r.forEach(function(e){e.getPivotToggleProps=f(o().getPivotToggleProps,{instance:p(),header:e})});var g=h(void 0===u||u);y(function(){g()&&i({type:l.resetPivot})},[i,s?null:t]),Object.assign(e,{togglePivot:function(e,t){i({type:l.togglePivot,columnId:e,value:t})}})}function e3(e){e.allCells.forEach(function(e){e.isPivoted=e.column.isPivoted})}l.resetSelectedRows="resetSelectedRows",l.toggleAllRowsSelected="toggleAllRowsSelected",l.toggleRowSelected="toggleRowSelected",l.toggleAllPageRowsSelected="toggleAllPageRowsSelected";var te=function(e){e.getToggleRowSelectedProps=[tt],e.getToggleAllRowsSelectedProps=[tn],e.getToggleAllPageRowsSelectedProps=[tr],e.stateReducers.push(to),e.useInstance.push(ta),e.prepareRow.push(ti)};te.pluginName="useRowSelect";var tt=function(e,t){var n=t.instance,r=t.row,o=n.manualRowSelectedKey;return[e,{onChange:function(e){r.toggleRowSelected(e.target.checked)},style:{cursor:"pointer"},checked:!(!r.original||!r.original[void 0===o?"isSelected":o])||r.isSelected,title:"Toggle Row Selected",indeterminate:r.isSomeSelected}]},tn=function(e,t){var n=t.instance;return[e,{onChange:function(e){n.toggleAllRowsSelected(e.target.checked)},style:{cursor:"pointer"},checked:n.isAllRowsSelected,title:"Toggle All Rows Selected",indeterminate:!!(!n.isAllRowsSelected&&Object.keys(n.state.selectedRowIds).length)}]},tr=function(e,t){var n=t.instance;return[e,{onChange:function(e){n.toggleAllPageRowsSelected(e.target.checked)},style:{cursor:"pointer"},checked:n.isAllPageRowsSelected,title:"Toggle All Current Page Rows Selected",indeterminate:!!(!n.isAllPageRowsSelected&&n.page.some(function(e){var t=e.id;return n.state.selectedRowIds[t]}))}]};function to(e,t,n,r){if(t.type===l.init)return o({selectedRowIds:{}},e);if(t.type===l.resetSelectedRows)return o({},e,{selectedRowIds:r.initialState.selectedRowIds||{}});if(t.type===l.toggleAllRowsSelected){var a=t.value,i=r.isAllRowsSelected,u=r.rowsById,s=r.nonGroupedRowsById,c=void 0===s?u:s,d=Object.assign({},e.selectedRowIds);return(void 0!==a?a:!i)?Object.keys(c).forEach(function(e){d[e]=!0}):Object.keys(c).forEach(function(e){delete d[e]}),o({},e,{selectedRowIds:d})}if(t.type===l.toggleRowSelected){var f=t.id,p=t.value,g=r.rowsById,m=r.selectSubRows,b=void 0===m||m,h=r.getSubRows,v=e.selectedRowIds[f],y=void 0!==p?p:!v;if(v===y)return e;var w=o({},e.selectedRowIds);return function e(t){var n=g[t];if(n.isGrouped||(y?w[t]=!0:delete w[t]),b&&h(n))return h(n).forEach(function(t){return e(t.id)})}(f),o({},e,{selectedRowIds:w})}if(t.type===l.toggleAllPageRowsSelected){var S=t.value,C=r.page,x=r.rowsById,E=r.selectSubRows,R=void 0===E||E,k=r.isAllPageRowsSelected,_=r.getSubRows,O=void 0!==S?S:!k,P=o({},e.selectedRowIds);return C.forEach(function(e){return function e(t){var n=x[t];if(n.isGrouped||(O?P[t]=!0:delete P[t]),R&&_(n))return _(n).forEach(function(t){return e(t.id)})}(e.id)}),o({},e,{selectedRowIds:P})}return e}function ta(e){var n=e.data,r=e.rows,o=e.getHooks,a=e.plugins,i=e.rowsById,u=e.nonGroupedRowsById,s=void 0===u?i:u,c=e.autoResetSelectedRows,d=e.state.selectedRowIds,p=e.selectSubRows,g=void 0===p||p,b=e.dispatch,v=e.page,w=e.getSubRows;m(a,["useFilters","useGroupBy","useSortBy","useExpanded","usePagination"],"useRowSelect");var S=t.useMemo(function(){var e=[];return r.forEach(function(t){var n=g?function e(t,n,r){if(n[t.id])return!0;var o=r(t);if(o&&o.length){var a=!0,i=!1;return o.forEach(function(t){i&&!a||(e(t,n,r)?i=!0:a=!1)}),!!a||!!i&&null}return!1}(t,d,w):!!d[t.id];t.isSelected=!!n,t.isSomeSelected=null===n,n&&e.push(t)}),e},[r,g,d,w]),C=!!(Object.keys(s).length&&Object.keys(d).length),x=C;C&&Object.keys(s).some(function(e){return!d[e]})&&(C=!1),C||v&&v.length&&v.some(function(e){return!d[e.id]})&&(x=!1);var E=h(void 0===c||c);y(function(){E()&&b({type:l.resetSelectedRows})},[b,n]);var R=t.useCallback(function(e){return b({type:l.toggleAllRowsSelected,value:e})},[b]),k=t.useCallback(function(e){return b({type:l.toggleAllPageRowsSelected,value:e})},[b]),_=t.useCallback(function(e,t){return b({type:l.toggleRowSelected,id:e,value:t})},[b]),O=h(e);Object.assign(e,{selectedFlatRows:S,isAllRowsSelected:C,isAllPageRowsSelected:x,toggleRowSelected:_,toggleAllRowsSelected:R,getToggleAllRowsSelectedProps:f(o().getToggleAllRowsSelectedProps,{instance:O()}),getToggleAllPageRowsSelectedProps:f(o().getToggleAllPageRowsSelectedProps,{instance:O()}),toggleAllPageRowsSelected:k})}function ti(e,t){var n=t.instance;e.toggleRowSelected=function(t){return n.toggleRowSelected(e.id,t)},e.getToggleRowSelectedProps=f(n.getHooks().getToggleRowSelectedProps,{instance:n,row:e})}var tl=function(e){return{}},tu=function(e){return{}};l.setRowState="setRowState",l.setCellState="setCellState",l.resetRowState="resetRowState";var ts=function(e){e.stateReducers.push(tc),e.useInstance.push(td),e.prepareRow.push(tf)};function tc(e,t,n,r){var a=r.initialRowStateAccessor,i=void 0===a?tl:a,u=r.initialCellStateAccessor,s=r.rowsById;if(t.type===l.init)return o({rowState:{}},e);if(t.type===l.resetRowState)return o({},e,{rowState:r.initialState.rowState||{}});if(t.type===l.setRowState){var c,d=t.rowId,f=t.value,p=void 0!==e.rowState[d]?e.rowState[d]:i(s[d]);return o({},e,{rowState:o({},e.rowState,((c={})[d]=b(f,p),c))})}if(t.type===l.setCellState){var g,m,h,v,y,w=t.rowId,S=t.columnId,C=t.value,x=void 0!==e.rowState[w]?e.rowState[w]:i(s[w]),E=void 0!==(null==x?void 0:null==(g=x.cellState)?void 0:g[S])?x.cellState[S]:(void 0===u?tu:u)(null==(m=s[w])?void 0:null==(h=m.cells)?void 0:h.find(function(e){return e.column.id===S}));return o({},e,{rowState:o({},e.rowState,((y={})[w]=o({},x,{cellState:o({},x.cellState||{},((v={})[S]=b(C,E),v))}),y))})}}function td(e){var n=e.autoResetRowState,r=e.data,o=e.dispatch,a=t.useCallback(function(e,t){return o({type:l.setRowState,rowId:e,value:t})},[o]),i=t.useCallback(function(e,t,n){return o({type:l.setCellState,rowId:e,columnId:t,value:n})},[o]),u=h(void 0===n||n);y(function(){u()&&o({type:l.resetRowState})},[r]),Object.assign(e,{setRowState:a,setCellState:i})}function tf(e,t){var n=t.instance,r=n.initialRowStateAccessor,o=n.initialCellStateAccessor,a=void 0===o?tu:o,i=n.state.rowState;e&&(e.state=void 0!==i[e.id]?i[e.id]:(void 0===r?tl:r)(e),e.setState=function(t){return n.setRowState(e.id,t)},e.cells.forEach(function(t){e.state.cellState||(e.state.cellState={}),t.state=void 0!==e.state.cellState[t.column.id]?e.state.cellState[t.column.id]:a(t),t.setState=function(r){return n.setCellState(e.id,t.column.id,r)}}))}ts.pluginName="useRowState",l.resetColumnOrder="resetColumnOrder",l.setColumnOrder="setColumnOrder";var tp=function(e){e.stateReducers.push(tg),e.visibleColumnsDeps.push(function(e,t){return[].concat(e,[t.instance.state.columnOrder])}),e.visibleColumns.push(tm),e.useInstance.push(tb)};function tg(e,t,n,r){return t.type===l.init?o({columnOrder:[]},e):t.type===l.resetColumnOrder?o({},e,{columnOrder:r.initialState.columnOrder||[]}):t.type===l.setColumnOrder?o({},e,{columnOrder:b(t.columnOrder,e.columnOrder)}):void 0}function tm(e,t){var n=t.instance.state.columnOrder;if(!n||!n.length)return e;for(var r=[].concat(n),o=[].concat(e),a=[];o.length&&r.length;)!function(){var e=r.shift(),t=o.findIndex(function(t){return t.id===e});t>-1&&a.push(o.splice(t,1)[0])}();return[].concat(a,o)}function tb(e){var n=e.dispatch;e.setColumnOrder=t.useCallback(function(e){return n({type:l.setColumnOrder,columnOrder:e})},[n])}tp.pluginName="useColumnOrder",c.canResize=!0,l.columnStartResizing="columnStartResizing",l.columnResizing="columnResizing",l.columnDoneResizing="columnDoneResizing",l.resetResize="resetResize";var th=function(e){e.getResizerProps=[tv],e.getHeaderProps.push({style:{position:"relative"}}),e.stateReducers.push(ty),e.useInstance.push(tS),e.useInstanceBeforeDimensions.push(tw)},tv=function(e,t){var n=t.instance,r=t.header,o=n.dispatch,a=function(e,t){var n,r=!1;if("touchstart"===e.type){if(e.touches&&e.touches.length>1)return;r=!0}var a=(n=[],function e(t){t.columns&&t.columns.length&&t.columns.map(e),n.push(t)}(t),n).map(function(e){return[e.id,e.totalWidth]}),i=r?Math.round(e.touches[0].clientX):e.clientX,u=function(e){o({type:l.columnResizing,clientX:e})},s=function(){return o({type:l.columnDoneResizing})},c={mouse:{moveEvent:"mousemove",moveHandler:function(e){return u(e.clientX)},upEvent:"mouseup",upHandler:function(e){document.removeEventListener("mousemove",c.mouse.moveHandler),document.removeEventListener("mouseup",c.mouse.upHandler),s()}},touch:{moveEvent:"touchmove",moveHandler:function(e){return e.cancelable&&(e.preventDefault(),e.stopPropagation()),u(e.touches[0].clientX),!1},upEvent:"touchend",upHandler:function(e){document.removeEventListener(c.touch.moveEvent,c.touch.moveHandler),document.removeEventListener(c.touch.upEvent,c.touch.moveHandler),s()}}},d=r?c.touch:c.mouse,f=!!function(){if("boolean"==typeof $)return $;var e=!1;try{var t={get passive(){return e=!0,!1}};window.addEventListener("test",null,t),window.removeEventListener("test",null,t)}catch(t){e=!1}return $=e}()&&{passive:!1};document.addEventListener(d.moveEvent,d.moveHandler,f),document.addEventListener(d.upEvent,d.upHandler,f),o({type:l.columnStartResizing,columnId:t.id,columnWidth:t.totalWidth,headerIdWidths:a,clientX:i})};return[e,{onMouseDown:function(e){return e.persist()||a(e,r)},onTouchStart:function(e){return e.persist()||a(e,r)},style:{cursor:"col-resize"},draggable:!1,role:"separator"}]};function ty(e,t){if(t.type===l.init)return o({columnResizing:{columnWidths:{}}},e);if(t.type===l.resetResize)return o({},e,{columnResizing:{columnWidths:{}}});if(t.type===l.columnStartResizing){var n=t.clientX,r=t.columnId,a=t.columnWidth,i=t.headerIdWidths;return o({},e,{columnResizing:o({},e.columnResizing,{startX:n,headerIdWidths:i,columnWidth:a,isResizingColumn:r})})}if(t.type===l.columnResizing){var u=t.clientX,s=e.columnResizing,c=s.startX,d=s.columnWidth,f=s.headerIdWidths,p=(u-c)/d,g={};return(void 0===f?[]:f).forEach(function(e){var t=e[0],n=e[1];g[t]=Math.max(n+n*p,0)}),o({},e,{columnResizing:o({},e.columnResizing,{columnWidths:o({},e.columnResizing.columnWidths,{},g)})})}return t.type===l.columnDoneResizing?o({},e,{columnResizing:o({},e.columnResizing,{startX:null,isResizingColumn:null})}):void 0}th.pluginName="useResizeColumns";var tw=function(e){var t=e.flatHeaders,n=e.disableResizing,r=e.getHooks,o=e.state.columnResizing,a=h(e);t.forEach(function(e){var t=k(!0!==e.disableResizing&&void 0,!0!==n&&void 0,!0);e.canResize=t,e.width=o.columnWidths[e.id]||e.originalWidth||e.width,e.isResizing=o.isResizingColumn===e.id,t&&(e.getResizerProps=f(r().getResizerProps,{instance:a(),header:e}))})};function tS(e){var n=e.plugins,r=e.dispatch,o=e.autoResetResize,a=e.columns;m(n,["useAbsoluteLayout"],"useResizeColumns");var i=h(void 0===o||o);y(function(){i()&&r({type:l.resetResize})},[a]),Object.assign(e,{resetResizing:t.useCallback(function(){return r({type:l.resetResize})},[r])})}var tC={position:"absolute",top:0},tx=function(e){e.getTableBodyProps.push(tE),e.getRowProps.push(tE),e.getHeaderGroupProps.push(tE),e.getFooterGroupProps.push(tE),e.getHeaderProps.push(function(e,t){var n=t.column;return[e,{style:o({},tC,{left:n.totalLeft+"px",width:n.totalWidth+"px"})}]}),e.getCellProps.push(function(e,t){var n=t.cell;return[e,{style:o({},tC,{left:n.column.totalLeft+"px",width:n.column.totalWidth+"px"})}]}),e.getFooterProps.push(function(e,t){var n=t.column;return[e,{style:o({},tC,{left:n.totalLeft+"px",width:n.totalWidth+"px"})}]})};tx.pluginName="useAbsoluteLayout";var tE=function(e,t){return[e,{style:{position:"relative",width:t.instance.totalColumnsWidth+"px"}}]},tR={display:"inline-block",boxSizing:"border-box"},tk=function(e,t){return[e,{style:{display:"flex",width:t.instance.totalColumnsWidth+"px"}}]},t_=function(e){e.getRowProps.push(tk),e.getHeaderGroupProps.push(tk),e.getFooterGroupProps.push(tk),e.getHeaderProps.push(function(e,t){var n=t.column;return[e,{style:o({},tR,{width:n.totalWidth+"px"})}]}),e.getCellProps.push(function(e,t){var n=t.cell;return[e,{style:o({},tR,{width:n.column.totalWidth+"px"})}]}),e.getFooterProps.push(function(e,t){var n=t.column;return[e,{style:o({},tR,{width:n.totalWidth+"px"})}]})};function tO(e){e.getTableProps.push(tP),e.getRowProps.push(tA),e.getHeaderGroupProps.push(tA),e.getFooterGroupProps.push(tA),e.getHeaderProps.push(tT),e.getCellProps.push(tI),e.getFooterProps.push(t$)}t_.pluginName="useBlockLayout",tO.pluginName="useFlexLayout";var tP=function(e,t){return[e,{style:{minWidth:t.instance.totalColumnsMinWidth+"px"}}]},tA=function(e,t){return[e,{style:{display:"flex",flex:"1 0 auto",minWidth:t.instance.totalColumnsMinWidth+"px"}}]},tT=function(e,t){var n=t.column;return[e,{style:{boxSizing:"border-box",flex:n.totalFlexWidth?n.totalFlexWidth+" 0 auto":void 0,minWidth:n.totalMinWidth+"px",width:n.totalWidth+"px"}}]},tI=function(e,t){var n=t.cell;return[e,{style:{boxSizing:"border-box",flex:n.column.totalFlexWidth+" 0 auto",minWidth:n.column.totalMinWidth+"px",width:n.column.totalWidth+"px"}}]},t$=function(e,t){var n=t.column;return[e,{style:{boxSizing:"border-box",flex:n.totalFlexWidth?n.totalFlexWidth+" 0 auto":void 0,minWidth:n.totalMinWidth+"px",width:n.totalWidth+"px"}}]};function tz(e){e.stateReducers.push(tN),e.getTableProps.push(tF),e.getHeaderProps.push(tj)}tz.pluginName="useGridLayout";var tF=function(e,t){return[e,{style:{display:"grid",gridTemplateColumns:t.instance.state.gridLayout.columnWidths.map(function(e){return e}).join(" ")}}]},tj=function(e,t){return[e,{id:"header-cell-"+t.column.id,style:{position:"sticky"}}]};function tN(e,t,n,r){if("init"===t.type)return o({gridLayout:{columnWidths:r.columns.map(function(){return"auto"})}},e);if("columnStartResizing"===t.type){var a=t.columnId,i=r.visibleColumns.findIndex(function(e){return e.id===a}),l=function(e){var t,n=null==(t=document.getElementById("header-cell-"+e))?void 0:t.offsetWidth;if(void 0!==n)return n}(a);return void 0!==l?o({},e,{gridLayout:o({},e.gridLayout,{columnId:a,columnIndex:i,startingWidth:l})}):e}if("columnResizing"===t.type){var u=e.gridLayout,s=u.columnIndex,c=u.startingWidth,d=u.columnWidths,f=c-(e.columnResizing.startX-t.clientX),p=[].concat(d);return p[s]=f+"px",o({},e,{gridLayout:o({},e.gridLayout,{columnWidths:p})})}}e._UNSTABLE_usePivotColumns=eQ,e.actions=l,e.defaultColumn=c,e.defaultGroupByFn=eN,e.defaultOrderByFn=eK,e.defaultRenderer=u,e.emptyRenderer=s,e.ensurePluginOrder=m,e.flexRender=S,e.functionalUpdate=b,e.loopHooks=g,e.makePropGetter=f,e.makeRenderer=w,e.reduceHooks=p,e.safeUseLayoutEffect=v,e.useAbsoluteLayout=tx,e.useAsyncDebounce=function(e,n){void 0===n&&(n=0);var o,a=t.useRef({}),i=h(e),l=h(n);return t.useCallback((o=r(regeneratorRuntime.mark(function e(){var t,n,o,u=arguments;return regeneratorRuntime.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:for(n=Array(t=u.length),o=0;o<t;o++)n[o]=u[o];return a.current.promise||(a.current.promise=new Promise(function(e,t){a.current.resolve=e,a.current.reject=t})),a.current.timeout&&clearTimeout(a.current.timeout),a.current.timeout=setTimeout(r(regeneratorRuntime.mark(function e(){return regeneratorRuntime.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return delete a.current.timeout,e.prev=1,e.t0=a.current,e.next=5,i().apply(void 0,n);case 5:e.t1=e.sent,e.t0.resolve.call(e.t0,e.t1),e.next=12;break;case 9:e.prev=9,e.t2=e.catch(1),a.current.reject(e.t2);case 12:return e.prev=12,delete a.current.promise,e.finish(12);case 15:case"end":return e.stop()}},e,null,[[1,9,12,15]])})),l()),e.abrupt("return",a.current.promise);case 5:case"end":return e.stop()}},e)})),function(){return o.apply(this,arguments)}),[i,l])},e.useBlockLayout=t_,e.useColumnOrder=tp,e.useExpanded=er,e.useFilters=ew,e.useFlexLayout=tO,e.useGetLatest=h,e.useGlobalFilter=ex,e.useGridLayout=tz,e.useGroupBy=eA,e.useMountedLayoutEffect=y,e.usePagination=eZ,e.useResizeColumns=th,e.useRowSelect=te,e.useRowState=ts,e.useSortBy=eD,e.useTable=function(e){for(var n=arguments.length,r=Array(n>1?n-1:0),a=1;a<n;a++)r[a-1]=arguments[a];e=en(e),r=[H].concat(r);var i=h(t.useRef({}).current);Object.assign(i(),o({},e,{plugins:r,hooks:{useOptions:[],stateReducers:[],useControlledState:[],columns:[],columnsDeps:[],allColumns:[],allColumnsDeps:[],accessValue:[],materializedColumns:[],materializedColumnsDeps:[],useInstanceAfterData:[],visibleColumns:[],visibleColumnsDeps:[],headerGroups:[],headerGroupsDeps:[],useInstanceBeforeDimensions:[],useInstance:[],prepareRow:[],getTableProps:[j],getTableBodyProps:[N],getHeaderGroupProps:[G],getFooterGroupProps:[M],getHeaderProps:[B],getFooterProps:[L],getRowProps:[W],getCellProps:[D],useFinalInstance:[]}})),r.filter(Boolean).forEach(function(e){e(i().hooks)});var u=h(i().hooks);i().getHooks=u,delete i().hooks,Object.assign(i(),p(u().useOptions,en(e)));var s=i(),c=s.data,d=s.columns,m=s.initialState,b=s.defaultColumn,v=s.getSubRows,y=s.getRowId,S=s.stateReducer,R=s.useControlledState,k=h(S),_=t.useCallback(function(e,t){if(!t.type)throw console.info({action:t}),Error("Unknown Action \uD83D\uDC46");return[].concat(u().stateReducers,Array.isArray(k())?k():[k()]).reduce(function(n,r){return r(n,t,e,i())||n},e)},[u,k,i]),O=t.useReducer(_,void 0,function(){return _(m,{type:l.init})}),P=O[0],A=O[1],T=p([].concat(u().useControlledState,[R]),P,{instance:i()});Object.assign(i(),{state:T,dispatch:A});var $=t.useMemo(function(){return function e(t,n,r){return void 0===r&&(r=0),t.map(function(t){return x(t=o({},t,{parent:n,depth:r})),t.columns&&(t.columns=e(t.columns,t,r+1)),t})}(p(u().columns,d,{instance:i()}))},[u,i,d].concat(p(u().columnsDeps,[],{instance:i()})));i().columns=$;var z=t.useMemo(function(){return p(u().allColumns,C($),{instance:i()}).map(x)},[$,u,i].concat(p(u().allColumnsDeps,[],{instance:i()})));i().allColumns=z;var F=t.useMemo(function(){for(var e=[],t=[],n={},r=[].concat(z);r.length;)(function(e){var t=e.data,n=e.rows,r=e.flatRows,o=e.rowsById,a=e.column,i=e.getRowId,l=e.getSubRows,u=e.accessValueHooks,s=e.getInstance;t.forEach(function(e,c){return function e(n,c,d,f,g){void 0===d&&(d=0);var m=i(n,c,f),b=o[m];if(b)b.subRows&&b.originalSubRows.forEach(function(t,n){return e(t,n,d+1,b)});else if((b={id:m,original:n,index:c,depth:d,cells:[{}]}).cells.map=I,b.cells.filter=I,b.cells.forEach=I,b.cells[0].getCellProps=I,b.values={},g.push(b),r.push(b),o[m]=b,b.originalSubRows=l(n,c),b.originalSubRows){var h=[];b.originalSubRows.forEach(function(t,n){return e(t,n,d+1,b,h)}),b.subRows=h}a.accessor&&(b.values[a.id]=a.accessor(n,c,b,g,t)),b.values[a.id]=p(u,b.values[a.id],{row:b,column:a,instance:s()})}(e,c,0,void 0,n)})})({data:c,rows:e,flatRows:t,rowsById:n,column:r.shift(),getRowId:y,getSubRows:v,accessValueHooks:u().accessValue,getInstance:i});return[e,t,n]},[z,c,y,v,u,i]),U=F[0],V=F[1],K=F[2];Object.assign(i(),{rows:U,initialRows:[].concat(U),flatRows:V,rowsById:K}),g(u().useInstanceAfterData,i());var Z=t.useMemo(function(){return p(u().visibleColumns,z,{instance:i()}).map(function(e){return E(e,b)})},[u,z,i,b].concat(p(u().visibleColumnsDeps,[],{instance:i()})));z=t.useMemo(function(){var e=[].concat(Z);return z.forEach(function(t){e.find(function(e){return e.id===t.id})||e.push(t)}),e},[z,Z]),i().allColumns=z;var q=t.useMemo(function(){return p(u().headerGroups,function(e,t,n){void 0===n&&(n=function(){return{}});for(var r=[],a=e,i=0,l=function(){return i++};a.length;)!function(){var e={headers:[]},i=[],u=a.some(function(e){return e.parent});a.forEach(function(r){var a,s=[].concat(i).reverse()[0];u&&(a=r.parent?o({},r.parent,{originalId:r.parent.id,id:r.parent.id+"_"+l(),headers:[r]},n(r)):E(o({originalId:r.id+"_placeholder",id:r.id+"_placeholder_"+l(),placeholderOf:r,headers:[r]},n(r)),t),s&&s.originalId===a.originalId?s.headers.push(r):i.push(a)),e.headers.push(r)}),r.push(e),a=i}();return r.reverse()}(Z,b),i())},[u,Z,b,i].concat(p(u().headerGroupsDeps,[],{instance:i()})));i().headerGroups=q;var X=t.useMemo(function(){return q.length?q[0].headers:[]},[q]);i().headers=X,i().flatHeaders=q.reduce(function(e,t){return[].concat(e,t.headers)},[]),g(u().useInstanceBeforeDimensions,i());var Q=Z.filter(function(e){return e.isVisible}).map(function(e){return e.id}).sort().join("_");Z=t.useMemo(function(){return Z.filter(function(e){return e.isVisible})},[Z,Q]),i().visibleColumns=Z;var J=function e(t,n){void 0===n&&(n=0);var r=0,o=0,a=0,i=0;return t.forEach(function(t){var l=t.headers;if(t.totalLeft=n,l&&l.length){var u=e(l,n),s=u[0],c=u[1],d=u[2],f=u[3];t.totalMinWidth=s,t.totalWidth=c,t.totalMaxWidth=d,t.totalFlexWidth=f}else t.totalMinWidth=t.minWidth,t.totalWidth=Math.min(Math.max(t.minWidth,t.width),t.maxWidth),t.totalMaxWidth=t.maxWidth,t.totalFlexWidth=t.canResize?t.totalWidth:0;t.isVisible&&(n+=t.totalWidth,r+=t.totalMinWidth,o+=t.totalWidth,a+=t.totalMaxWidth,i+=t.totalFlexWidth)}),[r,o,a,i]}(X),Y=J[0],ee=J[1],et=J[2];return i().totalColumnsMinWidth=Y,i().totalColumnsWidth=ee,i().totalColumnsMaxWidth=et,g(u().useInstance,i()),[].concat(i().flatHeaders,i().allColumns).forEach(function(e){e.render=w(i(),e),e.getHeaderProps=f(u().getHeaderProps,{instance:i(),column:e}),e.getFooterProps=f(u().getFooterProps,{instance:i(),column:e})}),i().headerGroups=t.useMemo(function(){return q.filter(function(e,t){return e.headers=e.headers.filter(function(e){return e.headers?function e(t){return t.filter(function(t){return t.headers?e(t.headers):t.isVisible}).length}(e.headers):e.isVisible}),!!e.headers.length&&(e.getHeaderGroupProps=f(u().getHeaderGroupProps,{instance:i(),headerGroup:e,index:t}),e.getFooterGroupProps=f(u().getFooterGroupProps,{instance:i(),headerGroup:e,index:t}),!0)})},[q,i,u]),i().footerGroups=[].concat(i().headerGroups).reverse(),i().prepareRow=t.useCallback(function(e){e.getRowProps=f(u().getRowProps,{instance:i(),row:e}),e.allCells=z.map(function(t){var n=e.values[t.id],r={column:t,row:e,value:n};return r.getCellProps=f(u().getCellProps,{instance:i(),cell:r}),r.render=w(i(),t,{row:e,cell:r,value:n}),r}),e.cells=Z.map(function(t){return e.allCells.find(function(e){return e.column.id===t.id})}),g(u().prepareRow,e,{instance:i()})},[u,i,z,Z]),i().getTableProps=f(u().getTableProps,{instance:i()}),i().getTableBodyProps=f(u().getTableBodyProps,{instance:i()}),g(u().useFinalInstance,i()),i()},Object.defineProperty(e,"__esModule",{value:!0})}(t,n(67294))},79521:function(e,t,n){e.exports=n(40217)}}]);
\ No newline at end of file
@@ -0,0 +1,69 @@
+(self.webpackChunk_N_E=self.webpackChunk_N_E||[]).push([[787],{36578:function(e,t,r){"use strict";var n=this&&this.__createBinding||(Object.create?function(e,t,r,n){void 0===n&&(n=r);var i=Object.getOwnPropertyDescriptor(t,r);(!i||("get"in i?!t.__esModule:i.writable||i.configurable))&&(i={enumerable:!0,get:function(){return t[r]}}),Object.defineProperty(e,n,i)}:function(e,t,r,n){void 0===n&&(n=r),e[n]=t[r]}),i=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),a=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var r in e)"default"!==r&&Object.prototype.hasOwnProperty.call(e,r)&&n(t,e,r);return i(t,e),t},o=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.Styles=void 0;let u=a(r(67294)),s=a(r(85444)),l=r(7347),c=o(r(5801)),f=o(r(90878)),h=o(r(57299)),p=o(r(93967)),d=o(r(68905));t.Styles=d.default;let v={critical:"ActionsCircleClose",info:"StatusCircleInformation",success:"StatusCircleCheck1",warning:"StatusWarning",passive:"StatusWarning"},y=s.default.div`
+  ${e=>e.elevation&&"none"!==e.elevation&&`box-shadow: ${e.theme.elevation[e.elevation]};`}
+  ${e=>d.default.banner(e.theme)}
+`;y.displayName="Banner";let m=(0,s.default)(h.default)`
+  ${e=>d.default.bannerIcon(e.theme)};
+`;m.displayName="BannerIcon";let b=(0,s.default)(c.default)`
+  ${e=>d.default.bannerCloseButton(e.theme)};
+`;b.displayName="BannerCloseButton",t.default=function({children:e,className:t,elevation:r="none",icon:n,onClose:i,rounded:a=!1,status:o="info",title:c}){var h;let d=(0,u.useContext)(l.KaizenThemeContext),g=(0,p.default)(t,o,{rounded:a}),_=d.colors.banner.foreground["passive"===o?"passive":"default"],F=null!==(h=null==n?void 0:n.name)&&void 0!==h?h:v[null!=o?o:"info"],E=_;return(null==n?void 0:n.color)!==void 0&&n.color&&(E=d.colors.banner.icon[n.color]),u.default.createElement(s.ThemeProvider,{theme:d},u.default.createElement(y,{className:g,"data-testid":"kui-banner",elevation:r,rounded:a,status:o},u.default.createElement(m,{className:(0,p.default)("banner-icon",null==n?void 0:n.className),name:F,color:E,variant:null==n?void 0:n.variant,size:(null==n?void 0:n.size)||"medium"}),u.default.createElement("div",{className:"content"},c&&u.default.createElement(f.default,{className:"title",textStyle:"h2",color:_},c),u.default.createElement(f.default,{className:"message",textStyle:"p2",color:_},e)),i&&u.default.createElement(b,{icon:{name:"ActionsClose",variant:"solid",color:_},variant:"link",onClick:i})))}},68905:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={banner:e=>`
+  position: relative;
+  display: flex;
+  padding: ${e.spacing.four};
+  
+  align-content: center;
+  justify-content: flex-start;
+  background-color: inherit;
+
+  color: ${e.colors.banner.foreground.default};
+  ${e.mixins.bodySmall}
+
+  &.rounded {
+    border-radius: 5px;
+  }
+
+  .banner-icon {
+    margin-right: ${e.spacing.four};
+    flex-shrink: 0;
+  }
+
+  .title {
+    color: ${e.colors.banner.foreground};
+    margin-bottom: ${e.spacing.one};
+  }
+
+  .content {
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+  }
+
+  &.passive {
+    background: ${e.colors.banner.background.passive};
+    color: ${e.colors.banner.foreground.passive};
+  }
+
+  &.critical {
+    background: linear-gradient(0.25turn, ${e.colors.banner.background.critical.from}, ${e.colors.banner.background.critical.to});
+  }
+  &.warning {
+    background: linear-gradient(0.25turn, ${e.colors.banner.background.warning.from}, ${e.colors.banner.background.warning.to});
+  }
+
+  &.success {
+    background: linear-gradient(0.25turn, ${e.colors.banner.background.success.from}, ${e.colors.banner.background.success.to});
+  }
+
+  &.info {
+    background: linear-gradient(0.25turn, ${e.colors.banner.background.info.from}, ${e.colors.banner.background.info.to});
+  }
+`,bannerIcon:e=>`
+  margin-right: ${e.spacing.two};
+`,bannerCloseButton:e=>`
+  position: absolute;
+  top: ${e.spacing.two};
+  right: 0;
+  margin-right: ${e.spacing.two};
+`}},73214:function(e,t,r){"use strict";r.d(t,{gN:function(){return rl},J9:function(){return ra}});var n,i,a,o=function(e){var t;return!!e&&"object"==typeof e&&"[object RegExp]"!==(t=Object.prototype.toString.call(e))&&"[object Date]"!==t&&e.$$typeof!==u},u="function"==typeof Symbol&&Symbol.for?Symbol.for("react.element"):60103;function s(e,t){return!1!==t.clone&&t.isMergeableObject(e)?c(Array.isArray(e)?[]:{},e,t):e}function l(e,t,r){return e.concat(t).map(function(e){return s(e,r)})}function c(e,t,r){(r=r||{}).arrayMerge=r.arrayMerge||l,r.isMergeableObject=r.isMergeableObject||o;var n,i,a=Array.isArray(t);return a!==Array.isArray(e)?s(t,r):a?r.arrayMerge(e,t,r):(i={},(n=r).isMergeableObject(e)&&Object.keys(e).forEach(function(t){i[t]=s(e[t],n)}),Object.keys(t).forEach(function(r){n.isMergeableObject(t[r])&&e[r]?i[r]=c(e[r],t[r],n):i[r]=s(t[r],n)}),i)}c.all=function(e,t){if(!Array.isArray(e))throw Error("first argument should be an array");return e.reduce(function(e,r){return c(e,r,t)},{})};var f=c,h="object"==typeof global&&global&&global.Object===Object&&global,p="object"==typeof self&&self&&self.Object===Object&&self,d=h||p||Function("return this")(),v=d.Symbol,y=Object.prototype,m=y.hasOwnProperty,b=y.toString,g=v?v.toStringTag:void 0,_=function(e){var t=m.call(e,g),r=e[g];try{e[g]=void 0;var n=!0}catch(e){}var i=b.call(e);return n&&(t?e[g]=r:delete e[g]),i},F=Object.prototype.toString,E=v?v.toStringTag:void 0,x=function(e){return null==e?void 0===e?"[object Undefined]":"[object Null]":E&&E in Object(e)?_(e):F.call(e)},O=function(e,t){return function(r){return e(t(r))}},j=O(Object.getPrototypeOf,Object),w=function(e){return null!=e&&"object"==typeof e},S=Object.prototype,T=Function.prototype.toString,A=S.hasOwnProperty,D=T.call(Object),k=function(e){if(!w(e)||"[object Object]"!=x(e))return!1;var t=j(e);if(null===t)return!0;var r=A.call(t,"constructor")&&t.constructor;return"function"==typeof r&&r instanceof r&&T.call(r)==D},$=function(e,t){return e===t||e!=e&&t!=t},C=function(e,t){for(var r=e.length;r--;)if($(e[r][0],t))return r;return -1},I=Array.prototype.splice;function R(e){var t=-1,r=null==e?0:e.length;for(this.clear();++t<r;){var n=e[t];this.set(n[0],n[1])}}R.prototype.clear=function(){this.__data__=[],this.size=0},R.prototype.delete=function(e){var t=this.__data__,r=C(t,e);return!(r<0)&&(r==t.length-1?t.pop():I.call(t,r,1),--this.size,!0)},R.prototype.get=function(e){var t=this.__data__,r=C(t,e);return r<0?void 0:t[r][1]},R.prototype.has=function(e){return C(this.__data__,e)>-1},R.prototype.set=function(e,t){var r=this.__data__,n=C(r,e);return n<0?(++this.size,r.push([e,t])):r[n][1]=t,this};var P=function(e){var t=typeof e;return null!=e&&("object"==t||"function"==t)},M=function(e){if(!P(e))return!1;var t=x(e);return"[object Function]"==t||"[object GeneratorFunction]"==t||"[object AsyncFunction]"==t||"[object Proxy]"==t},N=d["__core-js_shared__"],U=(n=/[^.]+$/.exec(N&&N.keys&&N.keys.IE_PROTO||""))?"Symbol(src)_1."+n:"",z=Function.prototype.toString,V=function(e){if(null!=e){try{return z.call(e)}catch(e){}try{return e+""}catch(e){}}return""},L=/^\[object .+?Constructor\]$/,B=Object.prototype,q=Function.prototype.toString,G=B.hasOwnProperty,Z=RegExp("^"+q.call(G).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$"),H=function(e,t){var r,n=null==e?void 0:e[t];return P(r=n)&&(!U||!(U in r))&&(M(r)?Z:L).test(V(r))?n:void 0},W=H(d,"Map"),Y=H(Object,"create"),K=Object.prototype.hasOwnProperty,J=Object.prototype.hasOwnProperty;function Q(e){var t=-1,r=null==e?0:e.length;for(this.clear();++t<r;){var n=e[t];this.set(n[0],n[1])}}Q.prototype.clear=function(){this.__data__=Y?Y(null):{},this.size=0},Q.prototype.delete=function(e){var t=this.has(e)&&delete this.__data__[e];return this.size-=t?1:0,t},Q.prototype.get=function(e){var t=this.__data__;if(Y){var r=t[e];return"__lodash_hash_undefined__"===r?void 0:r}return K.call(t,e)?t[e]:void 0},Q.prototype.has=function(e){var t=this.__data__;return Y?void 0!==t[e]:J.call(t,e)},Q.prototype.set=function(e,t){var r=this.__data__;return this.size+=this.has(e)?0:1,r[e]=Y&&void 0===t?"__lodash_hash_undefined__":t,this};var X=function(e){var t=typeof e;return"string"==t||"number"==t||"symbol"==t||"boolean"==t?"__proto__"!==e:null===e},ee=function(e,t){var r=e.__data__;return X(t)?r["string"==typeof t?"string":"hash"]:r.map};function et(e){var t=-1,r=null==e?0:e.length;for(this.clear();++t<r;){var n=e[t];this.set(n[0],n[1])}}function er(e){var t=this.__data__=new R(e);this.size=t.size}et.prototype.clear=function(){this.size=0,this.__data__={hash:new Q,map:new(W||R),string:new Q}},et.prototype.delete=function(e){var t=ee(this,e).delete(e);return this.size-=t?1:0,t},et.prototype.get=function(e){return ee(this,e).get(e)},et.prototype.has=function(e){return ee(this,e).has(e)},et.prototype.set=function(e,t){var r=ee(this,e),n=r.size;return r.set(e,t),this.size+=r.size==n?0:1,this},er.prototype.clear=function(){this.__data__=new R,this.size=0},er.prototype.delete=function(e){var t=this.__data__,r=t.delete(e);return this.size=t.size,r},er.prototype.get=function(e){return this.__data__.get(e)},er.prototype.has=function(e){return this.__data__.has(e)},er.prototype.set=function(e,t){var r=this.__data__;if(r instanceof R){var n=r.__data__;if(!W||n.length<199)return n.push([e,t]),this.size=++r.size,this;r=this.__data__=new et(n)}return r.set(e,t),this.size=r.size,this};var en=function(e,t){for(var r=-1,n=null==e?0:e.length;++r<n&&!1!==t(e[r],r,e););return e},ei=function(){try{var e=H(Object,"defineProperty");return e({},"",{}),e}catch(e){}}(),ea=function(e,t,r){"__proto__"==t&&ei?ei(e,t,{configurable:!0,enumerable:!0,value:r,writable:!0}):e[t]=r},eo=Object.prototype.hasOwnProperty,eu=function(e,t,r){var n=e[t];eo.call(e,t)&&$(n,r)&&(void 0!==r||t in e)||ea(e,t,r)},es=function(e,t,r,n){var i=!r;r||(r={});for(var a=-1,o=t.length;++a<o;){var u=t[a],s=n?n(r[u],e[u],u,r,e):void 0;void 0===s&&(s=e[u]),i?ea(r,u,s):eu(r,u,s)}return r},el=function(e,t){for(var r=-1,n=Array(e);++r<e;)n[r]=t(r);return n},ec=function(e){return w(e)&&"[object Arguments]"==x(e)},ef=Object.prototype,eh=ef.hasOwnProperty,ep=ef.propertyIsEnumerable,ed=ec(function(){return arguments}())?ec:function(e){return w(e)&&eh.call(e,"callee")&&!ep.call(e,"callee")},ev=Array.isArray,ey="object"==typeof exports&&exports&&!exports.nodeType&&exports,em=ey&&"object"==typeof module&&module&&!module.nodeType&&module,eb=em&&em.exports===ey?d.Buffer:void 0,eg=(eb?eb.isBuffer:void 0)||function(){return!1},e_=/^(?:0|[1-9]\d*)$/,eF=function(e,t){var r=typeof e;return!!(t=null==t?9007199254740991:t)&&("number"==r||"symbol"!=r&&e_.test(e))&&e>-1&&e%1==0&&e<t},eE=function(e){return"number"==typeof e&&e>-1&&e%1==0&&e<=9007199254740991},ex={};ex["[object Float32Array]"]=ex["[object Float64Array]"]=ex["[object Int8Array]"]=ex["[object Int16Array]"]=ex["[object Int32Array]"]=ex["[object Uint8Array]"]=ex["[object Uint8ClampedArray]"]=ex["[object Uint16Array]"]=ex["[object Uint32Array]"]=!0,ex["[object Arguments]"]=ex["[object Array]"]=ex["[object ArrayBuffer]"]=ex["[object Boolean]"]=ex["[object DataView]"]=ex["[object Date]"]=ex["[object Error]"]=ex["[object Function]"]=ex["[object Map]"]=ex["[object Number]"]=ex["[object Object]"]=ex["[object RegExp]"]=ex["[object Set]"]=ex["[object String]"]=ex["[object WeakMap]"]=!1;var eO=function(e){return function(t){return e(t)}},ej="object"==typeof exports&&exports&&!exports.nodeType&&exports,ew=ej&&"object"==typeof module&&module&&!module.nodeType&&module,eS=ew&&ew.exports===ej&&h.process,eT=function(){try{var e=ew&&ew.require&&ew.require("util").types;if(e)return e;return eS&&eS.binding&&eS.binding("util")}catch(e){}}(),eA=eT&&eT.isTypedArray,eD=eA?eO(eA):function(e){return w(e)&&eE(e.length)&&!!ex[x(e)]},ek=Object.prototype.hasOwnProperty,e$=function(e,t){var r=ev(e),n=!r&&ed(e),i=!r&&!n&&eg(e),a=!r&&!n&&!i&&eD(e),o=r||n||i||a,u=o?el(e.length,String):[],s=u.length;for(var l in e)(t||ek.call(e,l))&&!(o&&("length"==l||i&&("offset"==l||"parent"==l)||a&&("buffer"==l||"byteLength"==l||"byteOffset"==l)||eF(l,s)))&&u.push(l);return u},eC=Object.prototype,eI=function(e){var t=e&&e.constructor;return e===("function"==typeof t&&t.prototype||eC)},eR=O(Object.keys,Object),eP=Object.prototype.hasOwnProperty,eM=function(e){if(!eI(e))return eR(e);var t=[];for(var r in Object(e))eP.call(e,r)&&"constructor"!=r&&t.push(r);return t},eN=function(e){return null!=e&&eE(e.length)&&!M(e)},eU=function(e){return eN(e)?e$(e):eM(e)},ez=function(e){var t=[];if(null!=e)for(var r in Object(e))t.push(r);return t},eV=Object.prototype.hasOwnProperty,eL=function(e){if(!P(e))return ez(e);var t=eI(e),r=[];for(var n in e)"constructor"==n&&(t||!eV.call(e,n))||r.push(n);return r},eB=function(e){return eN(e)?e$(e,!0):eL(e)},eq="object"==typeof exports&&exports&&!exports.nodeType&&exports,eG=eq&&"object"==typeof module&&module&&!module.nodeType&&module,eZ=eG&&eG.exports===eq?d.Buffer:void 0,eH=eZ?eZ.allocUnsafe:void 0,eW=function(e,t){if(t)return e.slice();var r=e.length,n=eH?eH(r):new e.constructor(r);return e.copy(n),n},eY=function(e,t){var r=-1,n=e.length;for(t||(t=Array(n));++r<n;)t[r]=e[r];return t},eK=function(e,t){for(var r=-1,n=null==e?0:e.length,i=0,a=[];++r<n;){var o=e[r];t(o,r,e)&&(a[i++]=o)}return a},eJ=function(){return[]},eQ=Object.prototype.propertyIsEnumerable,eX=Object.getOwnPropertySymbols,e0=eX?function(e){return null==e?[]:eK(eX(e=Object(e)),function(t){return eQ.call(e,t)})}:eJ,e1=function(e,t){for(var r=-1,n=t.length,i=e.length;++r<n;)e[i+r]=t[r];return e},e2=Object.getOwnPropertySymbols?function(e){for(var t=[];e;)e1(t,e0(e)),e=j(e);return t}:eJ,e9=function(e,t,r){var n=t(e);return ev(e)?n:e1(n,r(e))},e6=function(e){return e9(e,eU,e0)},e7=function(e){return e9(e,eB,e2)},e8=H(d,"DataView"),e3=H(d,"Promise"),e5=H(d,"Set"),e4=H(d,"WeakMap"),te="[object Map]",tt="[object Promise]",tr="[object Set]",tn="[object WeakMap]",ti="[object DataView]",ta=V(e8),to=V(W),tu=V(e3),ts=V(e5),tl=V(e4),tc=x;(e8&&tc(new e8(new ArrayBuffer(1)))!=ti||W&&tc(new W)!=te||e3&&tc(e3.resolve())!=tt||e5&&tc(new e5)!=tr||e4&&tc(new e4)!=tn)&&(tc=function(e){var t=x(e),r="[object Object]"==t?e.constructor:void 0,n=r?V(r):"";if(n)switch(n){case ta:return ti;case to:return te;case tu:return tt;case ts:return tr;case tl:return tn}return t});var tf=tc,th=Object.prototype.hasOwnProperty,tp=function(e){var t=e.length,r=new e.constructor(t);return t&&"string"==typeof e[0]&&th.call(e,"index")&&(r.index=e.index,r.input=e.input),r},td=d.Uint8Array,tv=function(e){var t=new e.constructor(e.byteLength);return new td(t).set(new td(e)),t},ty=function(e,t){var r=t?tv(e.buffer):e.buffer;return new e.constructor(r,e.byteOffset,e.byteLength)},tm=/\w*$/,tb=function(e){var t=new e.constructor(e.source,tm.exec(e));return t.lastIndex=e.lastIndex,t},tg=v?v.prototype:void 0,t_=tg?tg.valueOf:void 0,tF=function(e,t){var r=t?tv(e.buffer):e.buffer;return new e.constructor(r,e.byteOffset,e.length)},tE=function(e,t,r){var n=e.constructor;switch(t){case"[object ArrayBuffer]":return tv(e);case"[object Boolean]":case"[object Date]":return new n(+e);case"[object DataView]":return ty(e,r);case"[object Float32Array]":case"[object Float64Array]":case"[object Int8Array]":case"[object Int16Array]":case"[object Int32Array]":case"[object Uint8Array]":case"[object Uint8ClampedArray]":case"[object Uint16Array]":case"[object Uint32Array]":return tF(e,r);case"[object Map]":case"[object Set]":return new n;case"[object Number]":case"[object String]":return new n(e);case"[object RegExp]":return tb(e);case"[object Symbol]":return t_?Object(t_.call(e)):{}}},tx=Object.create,tO=function(){function e(){}return function(t){if(!P(t))return{};if(tx)return tx(t);e.prototype=t;var r=new e;return e.prototype=void 0,r}}(),tj=eT&&eT.isMap,tw=tj?eO(tj):function(e){return w(e)&&"[object Map]"==tf(e)},tS=eT&&eT.isSet,tT=tS?eO(tS):function(e){return w(e)&&"[object Set]"==tf(e)},tA="[object Arguments]",tD="[object Function]",tk="[object Object]",t$={};t$[tA]=t$["[object Array]"]=t$["[object ArrayBuffer]"]=t$["[object DataView]"]=t$["[object Boolean]"]=t$["[object Date]"]=t$["[object Float32Array]"]=t$["[object Float64Array]"]=t$["[object Int8Array]"]=t$["[object Int16Array]"]=t$["[object Int32Array]"]=t$["[object Map]"]=t$["[object Number]"]=t$[tk]=t$["[object RegExp]"]=t$["[object Set]"]=t$["[object String]"]=t$["[object Symbol]"]=t$["[object Uint8Array]"]=t$["[object Uint8ClampedArray]"]=t$["[object Uint16Array]"]=t$["[object Uint32Array]"]=!0,t$["[object Error]"]=t$[tD]=t$["[object WeakMap]"]=!1;var tC=function e(t,r,n,i,a,o){var u,s=1&r,l=2&r,c=4&r;if(n&&(u=a?n(t,i,a,o):n(t)),void 0!==u)return u;if(!P(t))return t;var f=ev(t);if(f){if(u=tp(t),!s)return eY(t,u)}else{var h,p,d,v,y=tf(t),m=y==tD||"[object GeneratorFunction]"==y;if(eg(t))return eW(t,s);if(y==tk||y==tA||m&&!a){if(u=l||m?{}:"function"!=typeof t.constructor||eI(t)?{}:tO(j(t)),!s)return l?(p=(h=u)&&es(t,eB(t),h),es(t,e2(t),p)):(v=(d=u)&&es(t,eU(t),d),es(t,e0(t),v))}else{if(!t$[y])return a?t:{};u=tE(t,y,s)}}o||(o=new er);var b=o.get(t);if(b)return b;o.set(t,u),tT(t)?t.forEach(function(i){u.add(e(i,r,n,i,t,o))}):tw(t)&&t.forEach(function(i,a){u.set(a,e(i,r,n,a,t,o))});var g=c?l?e7:e6:l?eB:eU,_=f?void 0:g(t);return en(_||t,function(i,a){_&&(i=t[a=i]),eu(u,a,e(i,r,n,a,t,o))}),u},tI=function(e){return tC(e,5)},tR=r(67294),tP=r(69590),tM=r.n(tP),tN=function(e,t){},tU=function(e){return tC(e,4)},tz=function(e,t){for(var r=-1,n=null==e?0:e.length,i=Array(n);++r<n;)i[r]=t(e[r],r,e);return i},tV=function(e){return"symbol"==typeof e||w(e)&&"[object Symbol]"==x(e)};function tL(e,t){if("function"!=typeof e||null!=t&&"function"!=typeof t)throw TypeError("Expected a function");var r=function r(){var n=arguments,i=t?t.apply(this,n):n[0],a=r.cache;if(a.has(i))return a.get(i);var o=e.apply(this,n);return r.cache=a.set(i,o)||a,o};return r.cache=new(tL.Cache||et),r}tL.Cache=et;var tB=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,tq=/\\(\\)?/g,tG=(a=(i=tL(function(e){var t=[];return 46===e.charCodeAt(0)&&t.push(""),e.replace(tB,function(e,r,n,i){t.push(n?i.replace(tq,"$1"):r||e)}),t},function(e){return 500===a.size&&a.clear(),e})).cache,i),tZ=1/0,tH=function(e){if("string"==typeof e||tV(e))return e;var t=e+"";return"0"==t&&1/e==-tZ?"-0":t},tW=1/0,tY=v?v.prototype:void 0,tK=tY?tY.toString:void 0,tJ=function e(t){if("string"==typeof t)return t;if(ev(t))return tz(t,e)+"";if(tV(t))return tK?tK.call(t):"";var r=t+"";return"0"==r&&1/t==-tW?"-0":r},tQ=function(e){return ev(e)?tz(e,tH):tV(e)?[e]:eY(tG(null==e?"":tJ(e)))};function tX(){return(tX=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}function t0(e,t){if(null==e)return{};var r,n,i={},a=Object.keys(e);for(n=0;n<a.length;n++)r=a[n],t.indexOf(r)>=0||(i[r]=e[r]);return i}function t1(e){if(void 0===e)throw ReferenceError("this hasn't been initialised - super() hasn't been called");return e}r(8679);var t2=(0,tR.createContext)(void 0);t2.displayName="FormikContext";var t9=t2.Provider;function t6(){var e=(0,tR.useContext)(t2);return e||tN(!1),e}t2.Consumer;var t7=function(e){return Array.isArray(e)&&0===e.length},t8=function(e){return"function"==typeof e},t3=function(e){return null!==e&&"object"==typeof e},t5=function(e){return"[object String]"===Object.prototype.toString.call(e)},t4=function(e){return 0===tR.Children.count(e)},re=function(e){return t3(e)&&t8(e.then)};function rt(e,t,r,n){void 0===n&&(n=0);for(var i=tQ(t);e&&n<i.length;)e=e[i[n++]];return n===i.length||e?void 0===e?r:e:r}function rr(e,t,r){for(var n=tU(e),i=n,a=0,o=tQ(t);a<o.length-1;a++){var u=o[a],s=rt(e,o.slice(0,a+1));if(s&&(t3(s)||Array.isArray(s)))i=i[u]=tU(s);else{var l=o[a+1];i=i[u]=String(Math.floor(Number(l)))===l&&Number(l)>=0?[]:{}}}return(0===a?e:i)[o[a]]===r?e:(void 0===r?delete i[o[a]]:i[o[a]]=r,0===a&&void 0===r&&delete n[o[a]],n)}var rn={},ri={};function ra(e){var t,r,n,i,a,o,u,s,l,c,h,p,d,v,y,m,b,g,_,F,E,x,O,j,w,S,T,A,D,$,C,I,R,P,M,N,U,z,V,L,B,q,G,Z,H,W,Y,K,J,Q,X,ee,et,er,en,ei=(r=void 0===(t=e.validateOnChange)||t,i=void 0===(n=e.validateOnBlur)||n,o=void 0!==(a=e.validateOnMount)&&a,u=e.isInitialValid,l=void 0!==(s=e.enableReinitialize)&&s,c=e.onSubmit,h=t0(e,["validateOnChange","validateOnBlur","validateOnMount","isInitialValid","enableReinitialize","onSubmit"]),p=tX({validateOnChange:r,validateOnBlur:i,validateOnMount:o,onSubmit:c},h),d=(0,tR.useRef)(p.initialValues),v=(0,tR.useRef)(p.initialErrors||rn),y=(0,tR.useRef)(p.initialTouched||ri),m=(0,tR.useRef)(p.initialStatus),b=(0,tR.useRef)(!1),g=(0,tR.useRef)({}),(0,tR.useEffect)(function(){return b.current=!0,function(){b.current=!1}},[]),_=(0,tR.useState)(0)[1],E=(F=(0,tR.useRef)({values:tI(p.initialValues),errors:tI(p.initialErrors)||rn,touched:tI(p.initialTouched)||ri,status:tI(p.initialStatus),isSubmitting:!1,isValidating:!1,submitCount:0})).current,x=(0,tR.useCallback)(function(e){var t=F.current;F.current=function(e,t){switch(t.type){case"SET_VALUES":return tX({},e,{values:t.payload});case"SET_TOUCHED":return tX({},e,{touched:t.payload});case"SET_ERRORS":if(tM()(e.errors,t.payload))return e;return tX({},e,{errors:t.payload});case"SET_STATUS":return tX({},e,{status:t.payload});case"SET_ISSUBMITTING":return tX({},e,{isSubmitting:t.payload});case"SET_ISVALIDATING":return tX({},e,{isValidating:t.payload});case"SET_FIELD_VALUE":return tX({},e,{values:rr(e.values,t.payload.field,t.payload.value)});case"SET_FIELD_TOUCHED":return tX({},e,{touched:rr(e.touched,t.payload.field,t.payload.value)});case"SET_FIELD_ERROR":return tX({},e,{errors:rr(e.errors,t.payload.field,t.payload.value)});case"RESET_FORM":return tX({},e,t.payload);case"SET_FORMIK_STATE":return t.payload(e);case"SUBMIT_ATTEMPT":return tX({},e,{touched:function e(t,r,n,i){void 0===n&&(n=new WeakMap),void 0===i&&(i={});for(var a=0,o=Object.keys(t);a<o.length;a++){var u=o[a],s=t[u];t3(s)?n.get(s)||(n.set(s,!0),i[u]=Array.isArray(s)?[]:{},e(s,r,n,i[u])):i[u]=r}return i}(e.values,!0),isSubmitting:!0,submitCount:e.submitCount+1});case"SUBMIT_FAILURE":case"SUBMIT_SUCCESS":return tX({},e,{isSubmitting:!1});default:return e}}(t,e),t!==F.current&&_(function(e){return e+1})},[]),O=(0,tR.useCallback)(function(e,t){return new Promise(function(r,n){var i=p.validate(e,t);null==i?r(rn):re(i)?i.then(function(e){r(e||rn)},function(e){n(e)}):r(i)})},[p.validate]),j=(0,tR.useCallback)(function(e,t){var r,n,i=p.validationSchema,a=t8(i)?i(t):i,o=t&&a.validateAt?a.validateAt(t,e):(void 0===r&&(r=!1),n=function e(t){var r=Array.isArray(t)?[]:{};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){var i=String(n);!0===Array.isArray(t[i])?r[i]=t[i].map(function(t){return!0===Array.isArray(t)||k(t)?e(t):""!==t?t:void 0}):k(t[i])?r[i]=e(t[i]):r[i]=""!==t[i]?t[i]:void 0}return r}(e),a[r?"validateSync":"validate"](n,{abortEarly:!1,context:n}));return new Promise(function(e,t){o.then(function(){e(rn)},function(r){"ValidationError"===r.name?e(function(e){var t={};if(e.inner){if(0===e.inner.length)return rr(t,e.path,e.message);for(var r=e.inner,n=Array.isArray(r),i=0,r=n?r:r[Symbol.iterator]();;){if(n){if(i>=r.length)break;a=r[i++]}else{if((i=r.next()).done)break;a=i.value}var a,o=a;rt(t,o.path)||(t=rr(t,o.path,o.message))}}return t}(r)):t(r)})})},[p.validationSchema]),w=(0,tR.useCallback)(function(e,t){return new Promise(function(r){return r(g.current[e].validate(t))})},[]),S=(0,tR.useCallback)(function(e){var t=Object.keys(g.current).filter(function(e){return t8(g.current[e].validate)});return Promise.all(t.length>0?t.map(function(t){return w(t,rt(e,t))}):[Promise.resolve("DO_NOT_DELETE_YOU_WILL_BE_FIRED")]).then(function(e){return e.reduce(function(e,r,n){return"DO_NOT_DELETE_YOU_WILL_BE_FIRED"===r||r&&(e=rr(e,t[n],r)),e},{})})},[w]),T=(0,tR.useCallback)(function(e){return Promise.all([S(e),p.validationSchema?j(e):{},p.validate?O(e):{}]).then(function(e){var t=e[0],r=e[1],n=e[2];return f.all([t,r,n],{arrayMerge:ro})})},[p.validate,p.validationSchema,S,O,j]),A=rs(function(e){return void 0===e&&(e=E.values),x({type:"SET_ISVALIDATING",payload:!0}),T(e).then(function(e){return b.current&&(x({type:"SET_ISVALIDATING",payload:!1}),x({type:"SET_ERRORS",payload:e})),e})}),(0,tR.useEffect)(function(){o&&!0===b.current&&tM()(d.current,p.initialValues)&&A(d.current)},[o,A]),D=(0,tR.useCallback)(function(e){var t=e&&e.values?e.values:d.current,r=e&&e.errors?e.errors:v.current?v.current:p.initialErrors||{},n=e&&e.touched?e.touched:y.current?y.current:p.initialTouched||{},i=e&&e.status?e.status:m.current?m.current:p.initialStatus;d.current=t,v.current=r,y.current=n,m.current=i;var a=function(){x({type:"RESET_FORM",payload:{isSubmitting:!!e&&!!e.isSubmitting,errors:r,touched:n,status:i,values:t,isValidating:!!e&&!!e.isValidating,submitCount:e&&e.submitCount&&"number"==typeof e.submitCount?e.submitCount:0}})};if(p.onReset){var o=p.onReset(E.values,K);re(o)?o.then(a):a()}else a()},[p.initialErrors,p.initialStatus,p.initialTouched,p.onReset]),(0,tR.useEffect)(function(){!0===b.current&&!tM()(d.current,p.initialValues)&&l&&(d.current=p.initialValues,D(),o&&A(d.current))},[l,p.initialValues,D,o,A]),(0,tR.useEffect)(function(){l&&!0===b.current&&!tM()(v.current,p.initialErrors)&&(v.current=p.initialErrors||rn,x({type:"SET_ERRORS",payload:p.initialErrors||rn}))},[l,p.initialErrors]),(0,tR.useEffect)(function(){l&&!0===b.current&&!tM()(y.current,p.initialTouched)&&(y.current=p.initialTouched||ri,x({type:"SET_TOUCHED",payload:p.initialTouched||ri}))},[l,p.initialTouched]),(0,tR.useEffect)(function(){l&&!0===b.current&&!tM()(m.current,p.initialStatus)&&(m.current=p.initialStatus,x({type:"SET_STATUS",payload:p.initialStatus}))},[l,p.initialStatus,p.initialTouched]),$=rs(function(e){if(g.current[e]&&t8(g.current[e].validate)){var t=rt(E.values,e),r=g.current[e].validate(t);return re(r)?(x({type:"SET_ISVALIDATING",payload:!0}),r.then(function(e){return e}).then(function(t){x({type:"SET_FIELD_ERROR",payload:{field:e,value:t}}),x({type:"SET_ISVALIDATING",payload:!1})})):(x({type:"SET_FIELD_ERROR",payload:{field:e,value:r}}),Promise.resolve(r))}return p.validationSchema?(x({type:"SET_ISVALIDATING",payload:!0}),j(E.values,e).then(function(e){return e}).then(function(t){x({type:"SET_FIELD_ERROR",payload:{field:e,value:rt(t,e)}}),x({type:"SET_ISVALIDATING",payload:!1})})):Promise.resolve()}),C=(0,tR.useCallback)(function(e,t){var r=t.validate;g.current[e]={validate:r}},[]),I=(0,tR.useCallback)(function(e){delete g.current[e]},[]),R=rs(function(e,t){return x({type:"SET_TOUCHED",payload:e}),(void 0===t?i:t)?A(E.values):Promise.resolve()}),P=(0,tR.useCallback)(function(e){x({type:"SET_ERRORS",payload:e})},[]),M=rs(function(e,t){var n=t8(e)?e(E.values):e;return x({type:"SET_VALUES",payload:n}),(void 0===t?r:t)?A(n):Promise.resolve()}),N=(0,tR.useCallback)(function(e,t){x({type:"SET_FIELD_ERROR",payload:{field:e,value:t}})},[]),U=rs(function(e,t,n){return x({type:"SET_FIELD_VALUE",payload:{field:e,value:t}}),(void 0===n?r:n)?A(rr(E.values,e,t)):Promise.resolve()}),z=(0,tR.useCallback)(function(e,t){var r,n=t,i=e;if(!t5(e)){e.persist&&e.persist();var a=e.target?e.target:e.currentTarget,o=a.type,u=a.name,s=a.id,l=a.value,c=a.checked,f=(a.outerHTML,a.options),h=a.multiple;n=t||u||s,i=/number|range/.test(o)?isNaN(r=parseFloat(l))?"":r:/checkbox/.test(o)?function(e,t,r){if("boolean"==typeof e)return!!t;var n=[],i=!1,a=-1;if(Array.isArray(e))n=e,i=(a=e.indexOf(r))>=0;else if(!r||"true"==r||"false"==r)return!!t;return t&&r&&!i?n.concat(r):i?n.slice(0,a).concat(n.slice(a+1)):n}(rt(E.values,n),c,l):f&&h?Array.from(f).filter(function(e){return e.selected}).map(function(e){return e.value}):l}n&&U(n,i)},[U,E.values]),V=rs(function(e){if(t5(e))return function(t){return z(t,e)};z(e)}),L=rs(function(e,t,r){return void 0===t&&(t=!0),x({type:"SET_FIELD_TOUCHED",payload:{field:e,value:t}}),(void 0===r?i:r)?A(E.values):Promise.resolve()}),B=(0,tR.useCallback)(function(e,t){e.persist&&e.persist();var r=e.target,n=r.name,i=r.id;r.outerHTML,L(t||n||i,!0)},[L]),q=rs(function(e){if(t5(e))return function(t){return B(t,e)};B(e)}),G=(0,tR.useCallback)(function(e){t8(e)?x({type:"SET_FORMIK_STATE",payload:e}):x({type:"SET_FORMIK_STATE",payload:function(){return e}})},[]),Z=(0,tR.useCallback)(function(e){x({type:"SET_STATUS",payload:e})},[]),H=(0,tR.useCallback)(function(e){x({type:"SET_ISSUBMITTING",payload:e})},[]),W=rs(function(){return x({type:"SUBMIT_ATTEMPT"}),A().then(function(e){var t,r=e instanceof Error;if(!r&&0===Object.keys(e).length){try{if(t=J(),void 0===t)return}catch(e){throw e}return Promise.resolve(t).then(function(e){return b.current&&x({type:"SUBMIT_SUCCESS"}),e}).catch(function(e){if(b.current)throw x({type:"SUBMIT_FAILURE"}),e})}if(b.current&&(x({type:"SUBMIT_FAILURE"}),r))throw e})}),Y=rs(function(e){e&&e.preventDefault&&t8(e.preventDefault)&&e.preventDefault(),e&&e.stopPropagation&&t8(e.stopPropagation)&&e.stopPropagation(),W().catch(function(e){console.warn("Warning: An unhandled error was caught from submitForm()",e)})}),K={resetForm:D,validateForm:A,validateField:$,setErrors:P,setFieldError:N,setFieldTouched:L,setFieldValue:U,setStatus:Z,setSubmitting:H,setTouched:R,setValues:M,setFormikState:G,submitForm:W},J=rs(function(){return c(E.values,K)}),Q=rs(function(e){e&&e.preventDefault&&t8(e.preventDefault)&&e.preventDefault(),e&&e.stopPropagation&&t8(e.stopPropagation)&&e.stopPropagation(),D()}),X=(0,tR.useCallback)(function(e){return{value:rt(E.values,e),error:rt(E.errors,e),touched:!!rt(E.touched,e),initialValue:rt(d.current,e),initialTouched:!!rt(y.current,e),initialError:rt(v.current,e)}},[E.errors,E.touched,E.values]),ee=(0,tR.useCallback)(function(e){return{setValue:function(t,r){return U(e,t,r)},setTouched:function(t,r){return L(e,t,r)},setError:function(t){return N(e,t)}}},[U,L,N]),et=(0,tR.useCallback)(function(e){var t=t3(e),r=t?e.name:e,n=rt(E.values,r),i={name:r,value:n,onChange:V,onBlur:q};if(t){var a=e.type,o=e.value,u=e.as,s=e.multiple;"checkbox"===a?void 0===o?i.checked=!!n:(i.checked=!!(Array.isArray(n)&&~n.indexOf(o)),i.value=o):"radio"===a?(i.checked=n===o,i.value=o):"select"===u&&s&&(i.value=i.value||[],i.multiple=!0)}return i},[q,V,E.values]),er=(0,tR.useMemo)(function(){return!tM()(d.current,E.values)},[d.current,E.values]),en=(0,tR.useMemo)(function(){return void 0!==u?er?E.errors&&0===Object.keys(E.errors).length:!1!==u&&t8(u)?u(p):u:E.errors&&0===Object.keys(E.errors).length},[u,er,E.errors,p]),tX({},E,{initialValues:d.current,initialErrors:v.current,initialTouched:y.current,initialStatus:m.current,handleBlur:q,handleChange:V,handleReset:Q,handleSubmit:Y,resetForm:D,setErrors:P,setFormikState:G,setFieldTouched:L,setFieldValue:U,setFieldError:N,setStatus:Z,setSubmitting:H,setTouched:R,setValues:M,submitForm:W,validateForm:A,validateField:$,isValid:en,dirty:er,unregisterField:I,registerField:C,getFieldProps:et,getFieldMeta:X,getFieldHelpers:ee,validateOnBlur:i,validateOnChange:r,validateOnMount:o})),ea=e.component,eo=e.children,eu=e.render,es=e.innerRef;return(0,tR.useImperativeHandle)(es,function(){return ei}),(0,tR.createElement)(t9,{value:ei},ea?(0,tR.createElement)(ea,ei):eu?eu(ei):eo?t8(eo)?eo(ei):t4(eo)?null:tR.Children.only(eo):null)}function ro(e,t,r){var n=e.slice();return t.forEach(function(t,i){if(void 0===n[i]){var a=!1!==r.clone&&r.isMergeableObject(t);n[i]=a?f(Array.isArray(t)?[]:{},t,r):t}else r.isMergeableObject(t)?n[i]=f(e[i],t,r):-1===e.indexOf(t)&&n.push(t)}),n}var ru="undefined"!=typeof window&&void 0!==window.document&&void 0!==window.document.createElement?tR.useLayoutEffect:tR.useEffect;function rs(e){var t=(0,tR.useRef)(e);return ru(function(){t.current=e}),(0,tR.useCallback)(function(){for(var e=arguments.length,r=Array(e),n=0;n<e;n++)r[n]=arguments[n];return t.current.apply(void 0,r)},[])}function rl(e){var t=e.validate,r=e.name,n=e.render,i=e.children,a=e.as,o=e.component,u=e.className,s=t0(e,["validate","name","render","children","as","component","className"]),l=t0(t6(),["validate","validationSchema"]),c=l.registerField,f=l.unregisterField;(0,tR.useEffect)(function(){return c(r,{validate:t}),function(){f(r)}},[c,f,r,t]);var h=l.getFieldProps(tX({name:r},s)),p=l.getFieldMeta(r),d={field:h,form:l};if(n)return n(tX({},d,{meta:p}));if(t8(i))return i(tX({},d,{meta:p}));if(o){if("string"==typeof o){var v=s.innerRef,y=t0(s,["innerRef"]);return(0,tR.createElement)(o,tX({ref:v},h,y,{className:u}),i)}return(0,tR.createElement)(o,tX({field:h,form:l},s,{className:u}),i)}var m=a||"input";if("string"==typeof m){var b=s.innerRef,g=t0(s,["innerRef"]);return(0,tR.createElement)(m,tX({ref:b},h,g,{className:u}),i)}return(0,tR.createElement)(m,tX({},h,s,{className:u}),i)}(0,tR.forwardRef)(function(e,t){var r=e.action,n=t0(e,["action"]),i=t6(),a=i.handleReset,o=i.handleSubmit;return(0,tR.createElement)("form",tX({onSubmit:o,ref:t,onReset:a,action:null!=r?r:"#"},n))}).displayName="Form";var rc=function(e,t,r){var n=rd(e),i=n[t];return n.splice(t,1),n.splice(r,0,i),n},rf=function(e,t,r){var n=rd(e),i=n[t];return n[t]=n[r],n[r]=i,n},rh=function(e,t,r){var n=rd(e);return n.splice(t,0,r),n},rp=function(e,t,r){var n=rd(e);return n[t]=r,n},rd=function(e){if(!e)return[];if(Array.isArray(e))return[].concat(e);var t=Object.keys(e).map(function(e){return parseInt(e)}).reduce(function(e,t){return t>e?t:e},0);return Array.from(tX({},e,{length:t+1}))},rv=function(e,t){var r="function"==typeof e?e:t;return function(e){return Array.isArray(e)||t3(e)?r(rd(e)):e}};(function(e){function t(t){var r;return(r=e.call(this,t)||this).updateArrayField=function(e,t,n){var i=r.props,a=i.name;(0,i.formik.setFormikState)(function(r){var i=rv(n,e),o=rv(t,e),u=rr(r.values,a,e(rt(r.values,a))),s=n?i(rt(r.errors,a)):void 0,l=t?o(rt(r.touched,a)):void 0;return t7(s)&&(s=void 0),t7(l)&&(l=void 0),tX({},r,{values:u,errors:n?rr(r.errors,a,s):r.errors,touched:t?rr(r.touched,a,l):r.touched})})},r.push=function(e){return r.updateArrayField(function(t){return[].concat(rd(t),[tI(e)])},!1,!1)},r.handlePush=function(e){return function(){return r.push(e)}},r.swap=function(e,t){return r.updateArrayField(function(r){return rf(r,e,t)},!0,!0)},r.handleSwap=function(e,t){return function(){return r.swap(e,t)}},r.move=function(e,t){return r.updateArrayField(function(r){return rc(r,e,t)},!0,!0)},r.handleMove=function(e,t){return function(){return r.move(e,t)}},r.insert=function(e,t){return r.updateArrayField(function(r){return rh(r,e,t)},function(t){return rh(t,e,null)},function(t){return rh(t,e,null)})},r.handleInsert=function(e,t){return function(){return r.insert(e,t)}},r.replace=function(e,t){return r.updateArrayField(function(r){return rp(r,e,t)},!1,!1)},r.handleReplace=function(e,t){return function(){return r.replace(e,t)}},r.unshift=function(e){var t=-1;return r.updateArrayField(function(r){var n=r?[e].concat(r):[e];return t=n.length,n},function(e){return e?[null].concat(e):[null]},function(e){return e?[null].concat(e):[null]}),t},r.handleUnshift=function(e){return function(){return r.unshift(e)}},r.handleRemove=function(e){return function(){return r.remove(e)}},r.handlePop=function(){return function(){return r.pop()}},r.remove=r.remove.bind(t1(r)),r.pop=r.pop.bind(t1(r)),r}t.prototype=Object.create(e.prototype),t.prototype.constructor=t,t.__proto__=e;var r=t.prototype;return r.componentDidUpdate=function(e){this.props.validateOnChange&&this.props.formik.validateOnChange&&!tM()(rt(e.formik.values,e.name),rt(this.props.formik.values,this.props.name))&&this.props.formik.validateForm(this.props.formik.values)},r.remove=function(e){var t;return this.updateArrayField(function(r){var n=r?rd(r):[];return t||(t=n[e]),t8(n.splice)&&n.splice(e,1),t8(n.every)&&n.every(function(e){return void 0===e})?[]:n},!0,!0),t},r.pop=function(){var e;return this.updateArrayField(function(t){var r=t.slice();return e||(e=r&&r.pop&&r.pop()),r},!0,!0),e},r.render=function(){var e={push:this.push,pop:this.pop,swap:this.swap,move:this.move,insert:this.insert,replace:this.replace,unshift:this.unshift,remove:this.remove,handlePush:this.handlePush,handlePop:this.handlePop,handleSwap:this.handleSwap,handleMove:this.handleMove,handleInsert:this.handleInsert,handleReplace:this.handleReplace,handleUnshift:this.handleUnshift,handleRemove:this.handleRemove},t=this.props,r=t.component,n=t.render,i=t.children,a=t.name,o=t0(t.formik,["validate","validationSchema"]),u=tX({},e,{form:o,name:a});return r?(0,tR.createElement)(r,u):n?n(u):i?"function"==typeof i?i(u):t4(i)?null:tR.Children.only(i):null},t})(tR.Component).defaultProps={validateOnChange:!0}},62663:function(e){e.exports=function(e,t,r,n){var i=-1,a=null==e?0:e.length;for(n&&a&&(r=e[++i]);++i<a;)r=t(r,e[i],i,e);return r}},44286:function(e){e.exports=function(e){return e.split("")}},49029:function(e){var t=/[^\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f]+/g;e.exports=function(e){return e.match(t)||[]}},78565:function(e){var t=Object.prototype.hasOwnProperty;e.exports=function(e,r){return null!=e&&t.call(e,r)}},18674:function(e){e.exports=function(e){return function(t){return null==e?void 0:e[t]}}},14259:function(e){e.exports=function(e,t,r){var n=-1,i=e.length;t<0&&(t=-t>i?0:i+t),(r=r>i?i:r)<0&&(r+=i),i=t>r?0:r-t>>>0,t>>>=0;for(var a=Array(i);++n<i;)a[n]=e[n+t];return a}},40180:function(e,t,r){var n=r(14259);e.exports=function(e,t,r){var i=e.length;return r=void 0===r?i:r,!t&&r>=i?e:n(e,t,r)}},98805:function(e,t,r){var n=r(40180),i=r(62689),a=r(83140),o=r(79833);e.exports=function(e){return function(t){var r=i(t=o(t))?a(t):void 0,u=r?r[0]:t.charAt(0),s=r?n(r,1).join(""):t.slice(1);return u[e]()+s}}},35393:function(e,t,r){var n=r(62663),i=r(53816),a=r(58748),o=RegExp("['’]","g");e.exports=function(e){return function(t){return n(a(i(t).replace(o,"")),e,"")}}},69389:function(e,t,r){var n=r(18674)({À:"A",Á:"A",Â:"A",Ã:"A",Ä:"A",Å:"A",à:"a",á:"a",â:"a",ã:"a",ä:"a",å:"a",Ç:"C",ç:"c",Ð:"D",ð:"d",È:"E",É:"E",Ê:"E",Ë:"E",è:"e",é:"e",ê:"e",ë:"e",Ì:"I",Í:"I",Î:"I",Ï:"I",ì:"i",í:"i",î:"i",ï:"i",Ñ:"N",ñ:"n",Ò:"O",Ó:"O",Ô:"O",Õ:"O",Ö:"O",Ø:"O",ò:"o",ó:"o",ô:"o",õ:"o",ö:"o",ø:"o",Ù:"U",Ú:"U",Û:"U",Ü:"U",ù:"u",ú:"u",û:"u",ü:"u",Ý:"Y",ý:"y",ÿ:"y",Æ:"Ae",æ:"ae",Þ:"Th",þ:"th",ß:"ss",Ā:"A",Ă:"A",Ą:"A",ā:"a",ă:"a",ą:"a",Ć:"C",Ĉ:"C",Ċ:"C",Č:"C",ć:"c",ĉ:"c",ċ:"c",č:"c",Ď:"D",Đ:"D",ď:"d",đ:"d",Ē:"E",Ĕ:"E",Ė:"E",Ę:"E",Ě:"E",ē:"e",ĕ:"e",ė:"e",ę:"e",ě:"e",Ĝ:"G",Ğ:"G",Ġ:"G",Ģ:"G",ĝ:"g",ğ:"g",ġ:"g",ģ:"g",Ĥ:"H",Ħ:"H",ĥ:"h",ħ:"h",Ĩ:"I",Ī:"I",Ĭ:"I",Į:"I",İ:"I",ĩ:"i",ī:"i",ĭ:"i",į:"i",ı:"i",Ĵ:"J",ĵ:"j",Ķ:"K",ķ:"k",ĸ:"k",Ĺ:"L",Ļ:"L",Ľ:"L",Ŀ:"L",Ł:"L",ĺ:"l",ļ:"l",ľ:"l",ŀ:"l",ł:"l",Ń:"N",Ņ:"N",Ň:"N",Ŋ:"N",ń:"n",ņ:"n",ň:"n",ŋ:"n",Ō:"O",Ŏ:"O",Ő:"O",ō:"o",ŏ:"o",ő:"o",Ŕ:"R",Ŗ:"R",Ř:"R",ŕ:"r",ŗ:"r",ř:"r",Ś:"S",Ŝ:"S",Ş:"S",Š:"S",ś:"s",ŝ:"s",ş:"s",š:"s",Ţ:"T",Ť:"T",Ŧ:"T",ţ:"t",ť:"t",ŧ:"t",Ũ:"U",Ū:"U",Ŭ:"U",Ů:"U",Ű:"U",Ų:"U",ũ:"u",ū:"u",ŭ:"u",ů:"u",ű:"u",ų:"u",Ŵ:"W",ŵ:"w",Ŷ:"Y",ŷ:"y",Ÿ:"Y",Ź:"Z",Ż:"Z",Ž:"Z",ź:"z",ż:"z",ž:"z",Ĳ:"IJ",ĳ:"ij",Œ:"Oe",œ:"oe",ŉ:"'n",ſ:"s"});e.exports=n},62689:function(e){var t=RegExp("[\\u200d\ud800-\udfff\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff\\ufe0e\\ufe0f]");e.exports=function(e){return t.test(e)}},93157:function(e){var t=/[a-z][A-Z]|[A-Z]{2}[a-z]|[0-9][a-zA-Z]|[a-zA-Z][0-9]|[^a-zA-Z0-9 ]/;e.exports=function(e){return t.test(e)}},83140:function(e,t,r){var n=r(44286),i=r(62689),a=r(676);e.exports=function(e){return i(e)?a(e):n(e)}},676:function(e){var t="\ud800-\udfff",r="[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]",n="\ud83c[\udffb-\udfff]",i="[^"+t+"]",a="(?:\ud83c[\udde6-\uddff]){2}",o="[\ud800-\udbff][\udc00-\udfff]",u="(?:"+r+"|"+n+")?",s="[\\ufe0e\\ufe0f]?",l="(?:\\u200d(?:"+[i,a,o].join("|")+")"+s+u+")*",c=RegExp(n+"(?="+n+")|(?:"+[i+r+"?",r,a,o,"["+t+"]"].join("|")+")"+(s+u+l),"g");e.exports=function(e){return e.match(c)||[]}},2757:function(e){var t="\ud800-\udfff",r="\\u2700-\\u27bf",n="a-z\\xdf-\\xf6\\xf8-\\xff",i="A-Z\\xc0-\\xd6\\xd8-\\xde",a="\\xac\\xb1\\xd7\\xf7\\x00-\\x2f\\x3a-\\x40\\x5b-\\x60\\x7b-\\xbf\\u2000-\\u206f \\t\\x0b\\f\\xa0\\ufeff\\n\\r\\u2028\\u2029\\u1680\\u180e\\u2000\\u2001\\u2002\\u2003\\u2004\\u2005\\u2006\\u2007\\u2008\\u2009\\u200a\\u202f\\u205f\\u3000",o="['’]",u="["+a+"]",s="["+n+"]",l="[^"+t+a+"\\d+"+r+n+i+"]",c="(?:\ud83c[\udde6-\uddff]){2}",f="[\ud800-\udbff][\udc00-\udfff]",h="["+i+"]",p="(?:"+s+"|"+l+")",d="(?:"+o+"(?:d|ll|m|re|s|t|ve))?",v="(?:"+o+"(?:D|LL|M|RE|S|T|VE))?",y="(?:[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]|\ud83c[\udffb-\udfff])?",m="[\\ufe0e\\ufe0f]?",b="(?:\\u200d(?:"+["[^"+t+"]",c,f].join("|")+")"+m+y+")*",g="(?:"+["["+r+"]",c,f].join("|")+")"+(m+y+b),_=RegExp([h+"?"+s+"+"+d+"(?="+[u,h,"$"].join("|")+")","(?:"+h+"|"+l+")+"+v+"(?="+[u,h+p,"$"].join("|")+")",h+"?"+p+"+"+d,h+"+"+v,"\\d*(?:1ST|2ND|3RD|(?![123])\\dTH)(?=\\b|[a-z_])","\\d*(?:1st|2nd|3rd|(?![123])\\dth)(?=\\b|[A-Z_])","\\d+",g].join("|"),"g");e.exports=function(e){return e.match(_)||[]}},68929:function(e,t,r){var n=r(48403),i=r(35393)(function(e,t,r){return t=t.toLowerCase(),e+(r?n(t):t)});e.exports=i},48403:function(e,t,r){var n=r(79833),i=r(11700);e.exports=function(e){return i(n(e).toLowerCase())}},53816:function(e,t,r){var n=r(69389),i=r(79833),a=/[\xc0-\xd6\xd8-\xf6\xf8-\xff\u0100-\u017f]/g,o=RegExp("[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]","g");e.exports=function(e){return(e=i(e))&&e.replace(a,n).replace(o,"")}},18721:function(e,t,r){var n=r(78565),i=r(222);e.exports=function(e,t){return null!=e&&i(e,t,n)}},67523:function(e,t,r){var n=r(89465),i=r(47816),a=r(67206);e.exports=function(e,t){var r={};return t=a(t,3),i(e,function(e,i,a){n(r,t(e,i,a),e)}),r}},66604:function(e,t,r){var n=r(89465),i=r(47816),a=r(67206);e.exports=function(e,t){var r={};return t=a(t,3),i(e,function(e,i,a){n(r,i,t(e,i,a))}),r}},11865:function(e,t,r){var n=r(35393)(function(e,t,r){return e+(r?"_":"")+t.toLowerCase()});e.exports=n},11700:function(e,t,r){var n=r(98805)("toUpperCase");e.exports=n},58748:function(e,t,r){var n=r(49029),i=r(93157),a=r(79833),o=r(2757);e.exports=function(e,t,r){return(e=a(e),void 0===(t=r?void 0:t))?i(e)?o(e):n(e):e.match(t)||[]}},55760:function(e){"use strict";function t(e){this._maxSize=e,this.clear()}t.prototype.clear=function(){this._size=0,this._values=Object.create(null)},t.prototype.get=function(e){return this._values[e]},t.prototype.set=function(e,t){return this._size>=this._maxSize&&this.clear(),!(e in this._values)&&this._size++,this._values[e]=t};var r=/[^.^\]^[]+|(?=\[\]|\.\.)/g,n=/^\d+$/,i=/^\d/,a=/[~`!#$%\^&*+=\-\[\]\\';,/{}|\\":<>\?]/g,o=/^\s*(['"]?)(.*?)(\1)\s*$/,u=new t(512),s=new t(512),l=new t(512);function c(e){return u.get(e)||u.set(e,f(e).map(function(e){return e.replace(o,"$2")}))}function f(e){return e.match(r)||[""]}function h(e){return"string"==typeof e&&e&&-1!==["'",'"'].indexOf(e.charAt(0))}e.exports={Cache:t,split:f,normalizePath:c,setter:function(e){var t=c(e);return s.get(e)||s.set(e,function(e,r){for(var n=0,i=t.length,a=e;n<i-1;){var o=t[n];if("__proto__"===o||"constructor"===o||"prototype"===o)return e;a=a[t[n++]]}a[t[n]]=r})},getter:function(e,t){var r=c(e);return l.get(e)||l.set(e,function(e){for(var n=0,i=r.length;n<i;){if(null==e&&t)return;e=e[r[n++]]}return e})},join:function(e){return e.reduce(function(e,t){return e+(h(t)||n.test(t)?"["+t+"]":(e?".":"")+t)},"")},forEach:function(e,t,r){!function(e,t,r){var o,u,s,l,c,f=e.length;for(s=0;s<f;s++){(u=e[s])&&(!h(o=u)&&(o.match(i)&&!o.match(n)||a.test(o))&&(u='"'+u+'"'),l=!(c=h(u))&&/^\d+$/.test(u),t.call(r,u,c,l,s,e))}}(Array.isArray(e)?e:f(e),t,r)}}},69590:function(e){"use strict";var t=Array.isArray,r=Object.keys,n=Object.prototype.hasOwnProperty,i="undefined"!=typeof Element;e.exports=function(e,a){try{return function e(a,o){if(a===o)return!0;if(a&&o&&"object"==typeof a&&"object"==typeof o){var u,s,l,c=t(a),f=t(o);if(c&&f){if((s=a.length)!=o.length)return!1;for(u=s;0!=u--;)if(!e(a[u],o[u]))return!1;return!0}if(c!=f)return!1;var h=a instanceof Date,p=o instanceof Date;if(h!=p)return!1;if(h&&p)return a.getTime()==o.getTime();var d=a instanceof RegExp,v=o instanceof RegExp;if(d!=v)return!1;if(d&&v)return a.toString()==o.toString();var y=r(a);if((s=y.length)!==r(o).length)return!1;for(u=s;0!=u--;)if(!n.call(o,y[u]))return!1;if(i&&a instanceof Element&&o instanceof Element)return a===o;for(u=s;0!=u--;)if(("_owner"!==(l=y[u])||!a.$$typeof)&&!e(a[l],o[l]))return!1;return!0}return a!=a&&o!=o}(e,a)}catch(e){if(e.message&&e.message.match(/stack|recursion/i)||-2146828260===e.number)return console.warn("Warning: react-fast-compare does not handle circular references.",e.name,e.message),!1;throw e}}},94633:function(e){function t(e,t){var r=e.length,n=Array(r),i={},a=r,o=function(e){for(var t=new Map,r=0,n=e.length;r<n;r++){var i=e[r];t.has(i[0])||t.set(i[0],new Set),t.has(i[1])||t.set(i[1],new Set),t.get(i[0]).add(i[1])}return t}(t),u=function(e){for(var t=new Map,r=0,n=e.length;r<n;r++)t.set(e[r],r);return t}(e);for(t.forEach(function(e){if(!u.has(e[0])||!u.has(e[1]))throw Error("Unknown node. There is an unknown node in the supplied edges.")});a--;)i[a]||function e(t,a,s){if(s.has(t)){var l;try{l=", node was:"+JSON.stringify(t)}catch(e){l=""}throw Error("Cyclic dependency"+l)}if(!u.has(t))throw Error("Found unknown node. Make sure to provided all involved nodes. Unknown node: "+JSON.stringify(t));if(!i[a]){i[a]=!0;var c=o.get(t)||new Set;if(a=(c=Array.from(c)).length){s.add(t);do{var f=c[--a];e(f,u.get(f),s)}while(a);s.delete(t)}n[--r]=t}}(e[a],a,new Set);return n}e.exports=function(e){return t(function(e){for(var t=new Set,r=0,n=e.length;r<n;r++){var i=e[r];t.add(i[0]),t.add(i[1])}return Array.from(t)}(e),e)},e.exports.array=t},74231:function(e,t,r){"use strict";r.d(t,{Ry:function(){return eb},iH:function(){return I},Z_:function(){return Y}});try{b=Map}catch(e){}try{g=Set}catch(e){}function n(e){return function e(t,r,i){if(!t||"object"!=typeof t||"function"==typeof t)return t;if(t.nodeType&&"cloneNode"in t)return t.cloneNode(!0);if(t instanceof Date)return new Date(t.getTime());if(t instanceof RegExp)return new RegExp(t);if(Array.isArray(t))return t.map(n);if(b&&t instanceof b)return new Map(Array.from(t.entries()));if(g&&t instanceof g)return new Set(Array.from(t.values()));if(t instanceof Object){r.push(t);var a=Object.create(t);for(var o in i.push(a),t){var u=r.findIndex(function(e){return e===t[o]});a[o]=u>-1?i[u]:e(t[o],r,i)}return a}return t}(e,[],[])}let i=Object.prototype.toString,a=Error.prototype.toString,o=RegExp.prototype.toString,u="undefined"!=typeof Symbol?Symbol.prototype.toString:()=>"",s=/^Symbol\((.*)\)(.*)$/;function l(e,t=!1){if(null==e||!0===e||!1===e)return""+e;let r=typeof e;if("number"===r)return e!=+e?"NaN":0===e&&1/e<0?"-0":""+e;if("string"===r)return t?`"${e}"`:e;if("function"===r)return"[Function "+(e.name||"anonymous")+"]";if("symbol"===r)return u.call(e).replace(s,"Symbol($1)");let n=i.call(e).slice(8,-1);return"Date"===n?isNaN(e.getTime())?""+e:e.toISOString(e):"Error"===n||e instanceof Error?"["+a.call(e)+"]":"RegExp"===n?o.call(e):null}function c(e,t){let r=l(e,t);return null!==r?r:JSON.stringify(e,function(e,r){let n=l(this[e],t);return null!==n?n:r},2)}let f={default:"${path} is invalid",required:"${path} is a required field",oneOf:"${path} must be one of the following values: ${values}",notOneOf:"${path} must not be one of the following values: ${values}",notType:({path:e,type:t,value:r,originalValue:n})=>{let i=null!=n&&n!==r,a=`${e} must be a \`${t}\` type, but the final value was: \`${c(r,!0)}\``+(i?` (cast from the value \`${c(n,!0)}\`).`:".");return null===r&&(a+='\n If "null" is intended as an empty value be sure to mark the schema as `.nullable()`'),a},defined:"${path} must be defined"},h={length:"${path} must be exactly ${length} characters",min:"${path} must be at least ${min} characters",max:"${path} must be at most ${max} characters",matches:'${path} must match the following: "${regex}"',email:"${path} must be a valid email",url:"${path} must be a valid URL",uuid:"${path} must be a valid UUID",trim:"${path} must be a trimmed string",lowercase:"${path} must be a lowercase string",uppercase:"${path} must be a upper case string"},p={min:"${path} must be greater than or equal to ${min}",max:"${path} must be less than or equal to ${max}",lessThan:"${path} must be less than ${less}",moreThan:"${path} must be greater than ${more}",positive:"${path} must be a positive number",negative:"${path} must be a negative number",integer:"${path} must be an integer"},d={min:"${path} field must be later than ${min}",max:"${path} field must be at earlier than ${max}"},v={isValue:"${path} field must be ${value}"},y={noUnknown:"${path} field has unspecified keys: ${unknown}"},m={min:"${path} field must have at least ${min} items",max:"${path} field must have less than or equal to ${max} items",length:"${path} must have ${length} items"};Object.assign(Object.create(null),{mixed:f,string:h,number:p,date:d,object:y,array:m,boolean:v});var b,g,_=r(18721),F=r.n(_),E=e=>e&&e.__isYupSchema__;class x{constructor(e,t){if(this.fn=void 0,this.refs=e,this.refs=e,"function"==typeof t){this.fn=t;return}if(!F()(t,"is"))throw TypeError("`is:` is required for `when()` conditions");if(!t.then&&!t.otherwise)throw TypeError("either `then:` or `otherwise:` is required for `when()` conditions");let{is:r,then:n,otherwise:i}=t,a="function"==typeof r?r:(...e)=>e.every(e=>e===r);this.fn=function(...e){let t=e.pop(),r=e.pop(),o=a(...e)?n:i;if(o)return"function"==typeof o?o(r):r.concat(o.resolve(t))}}resolve(e,t){let r=this.refs.map(e=>e.getValue(null==t?void 0:t.value,null==t?void 0:t.parent,null==t?void 0:t.context)),n=this.fn.apply(e,r.concat(e,t));if(void 0===n||n===e)return e;if(!E(n))throw TypeError("conditions must return a schema object");return n.resolve(t)}}function O(e){return null==e?[]:[].concat(e)}function j(){return(j=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}let w=/\$\{\s*(\w+)\s*\}/g;class S extends Error{static formatError(e,t){let r=t.label||t.path||"this";return(r!==t.path&&(t=j({},t,{path:r})),"string"==typeof e)?e.replace(w,(e,r)=>c(t[r])):"function"==typeof e?e(t):e}static isError(e){return e&&"ValidationError"===e.name}constructor(e,t,r,n){super(),this.value=void 0,this.path=void 0,this.type=void 0,this.errors=void 0,this.params=void 0,this.inner=void 0,this.name="ValidationError",this.value=t,this.path=r,this.type=n,this.errors=[],this.inner=[],O(e).forEach(e=>{S.isError(e)?(this.errors.push(...e.errors),this.inner=this.inner.concat(e.inner.length?e.inner:e)):this.errors.push(e)}),this.message=this.errors.length>1?`${this.errors.length} errors occurred`:this.errors[0],Error.captureStackTrace&&Error.captureStackTrace(this,S)}}let T=e=>{let t=!1;return(...r)=>{t||(t=!0,e(...r))}};function A(e,t){let{endEarly:r,tests:n,args:i,value:a,errors:o,sort:u,path:s}=e,l=T(t),c=n.length,f=[];if(o=o||[],!c)return o.length?l(new S(o,a,s)):l(null,a);for(let e=0;e<n.length;e++)(0,n[e])(i,function(e){if(e){if(!S.isError(e))return l(e,a);if(r)return e.value=a,l(e,a);f.push(e)}if(--c<=0){if(f.length&&(u&&f.sort(u),o.length&&f.push(...o),o=f),o.length){l(new S(o,a,s),a);return}l(null,a)}})}var D=r(66604),k=r.n(D),$=r(55760);let C={context:"$",value:"."};function I(e,t){return new R(e,t)}class R{constructor(e,t={}){if(this.key=void 0,this.isContext=void 0,this.isValue=void 0,this.isSibling=void 0,this.path=void 0,this.getter=void 0,this.map=void 0,"string"!=typeof e)throw TypeError("ref must be a string, got: "+e);if(this.key=e.trim(),""===e)throw TypeError("ref must be a non-empty string");this.isContext=this.key[0]===C.context,this.isValue=this.key[0]===C.value,this.isSibling=!this.isContext&&!this.isValue;let r=this.isContext?C.context:this.isValue?C.value:"";this.path=this.key.slice(r.length),this.getter=this.path&&(0,$.getter)(this.path,!0),this.map=t.map}getValue(e,t,r){let n=this.isContext?r:this.isValue?e:t;return this.getter&&(n=this.getter(n||{})),this.map&&(n=this.map(n)),n}cast(e,t){return this.getValue(e,null==t?void 0:t.parent,null==t?void 0:t.context)}resolve(){return this}describe(){return{type:"ref",key:this.key}}toString(){return`Ref(${this.key})`}static isRef(e){return e&&e.__isYupRef}}function P(){return(P=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}function M(e){function t(t,r){let n,{value:i,path:a="",label:o,options:u,originalValue:s,sync:l}=t,c=function(e,t){if(null==e)return{};var r,n,i={},a=Object.keys(e);for(n=0;n<a.length;n++)t.indexOf(r=a[n])>=0||(i[r]=e[r]);return i}(t,["value","path","label","options","originalValue","sync"]),{name:f,test:h,params:p,message:d}=e,{parent:v,context:y}=u;function m(e){return R.isRef(e)?e.getValue(i,v,y):e}function b(e={}){let t=k()(P({value:i,originalValue:s,label:o,path:e.path||a},p,e.params),m),r=new S(S.formatError(e.message||d,t),i,t.path,e.type||f);return r.params=t,r}let g=P({path:a,parent:v,type:f,createError:b,resolve:m,options:u,originalValue:s},c);if(!l){try{Promise.resolve(h.call(g,i,g)).then(e=>{S.isError(e)?r(e):e?r(null,e):r(b())}).catch(r)}catch(e){r(e)}return}try{var _;if(n=h.call(g,i,g),"function"==typeof(null==(_=n)?void 0:_.then))throw Error(`Validation test of type: "${g.type}" returned a Promise during a synchronous validate. This test will finish after the validate call has returned`)}catch(e){r(e);return}S.isError(n)?r(n):n?r(null,n):r(b())}return t.OPTIONS=e,t}R.prototype.__isYupRef=!0;let N=e=>e.substr(0,e.length-1).substr(1);class U{constructor(){this.list=void 0,this.refs=void 0,this.list=new Set,this.refs=new Map}get size(){return this.list.size+this.refs.size}describe(){let e=[];for(let t of this.list)e.push(t);for(let[,t]of this.refs)e.push(t.describe());return e}toArray(){return Array.from(this.list).concat(Array.from(this.refs.values()))}resolveAll(e){return this.toArray().reduce((t,r)=>t.concat(R.isRef(r)?e(r):r),[])}add(e){R.isRef(e)?this.refs.set(e.key,e):this.list.add(e)}delete(e){R.isRef(e)?this.refs.delete(e.key):this.list.delete(e)}clone(){let e=new U;return e.list=new Set(this.list),e.refs=new Map(this.refs),e}merge(e,t){let r=this.clone();return e.list.forEach(e=>r.add(e)),e.refs.forEach(e=>r.add(e)),t.list.forEach(e=>r.delete(e)),t.refs.forEach(e=>r.delete(e)),r}}function z(){return(z=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}class V{constructor(e){this.deps=[],this.tests=void 0,this.transforms=void 0,this.conditions=[],this._mutate=void 0,this._typeError=void 0,this._whitelist=new U,this._blacklist=new U,this.exclusiveTests=Object.create(null),this.spec=void 0,this.tests=[],this.transforms=[],this.withMutation(()=>{this.typeError(f.notType)}),this.type=(null==e?void 0:e.type)||"mixed",this.spec=z({strip:!1,strict:!1,abortEarly:!0,recursive:!0,nullable:!1,presence:"optional"},null==e?void 0:e.spec)}get _type(){return this.type}_typeCheck(e){return!0}clone(e){if(this._mutate)return e&&Object.assign(this.spec,e),this;let t=Object.create(Object.getPrototypeOf(this));return t.type=this.type,t._typeError=this._typeError,t._whitelistError=this._whitelistError,t._blacklistError=this._blacklistError,t._whitelist=this._whitelist.clone(),t._blacklist=this._blacklist.clone(),t.exclusiveTests=z({},this.exclusiveTests),t.deps=[...this.deps],t.conditions=[...this.conditions],t.tests=[...this.tests],t.transforms=[...this.transforms],t.spec=n(z({},this.spec,e)),t}label(e){let t=this.clone();return t.spec.label=e,t}meta(...e){if(0===e.length)return this.spec.meta;let t=this.clone();return t.spec.meta=Object.assign(t.spec.meta||{},e[0]),t}withMutation(e){let t=this._mutate;this._mutate=!0;let r=e(this);return this._mutate=t,r}concat(e){if(!e||e===this)return this;if(e.type!==this.type&&"mixed"!==this.type)throw TypeError(`You cannot \`concat()\` schema's of different types: ${this.type} and ${e.type}`);let t=e.clone(),r=z({},this.spec,t.spec);return t.spec=r,t._typeError||(t._typeError=this._typeError),t._whitelistError||(t._whitelistError=this._whitelistError),t._blacklistError||(t._blacklistError=this._blacklistError),t._whitelist=this._whitelist.merge(e._whitelist,e._blacklist),t._blacklist=this._blacklist.merge(e._blacklist,e._whitelist),t.tests=this.tests,t.exclusiveTests=this.exclusiveTests,t.withMutation(t=>{e.tests.forEach(e=>{t.test(e.OPTIONS)})}),t.transforms=[...this.transforms,...t.transforms],t}isType(e){return!!this.spec.nullable&&null===e||this._typeCheck(e)}resolve(e){let t=this;if(t.conditions.length){let r=t.conditions;(t=t.clone()).conditions=[],t=(t=r.reduce((t,r)=>r.resolve(t,e),t)).resolve(e)}return t}cast(e,t={}){let r=this.resolve(z({value:e},t)),n=r._cast(e,t);if(void 0!==e&&!1!==t.assert&&!0!==r.isType(n)){let i=c(e),a=c(n);throw TypeError(`The value of ${t.path||"field"} could not be cast to a value that satisfies the schema type: "${r._type}". 
+
+attempted value: ${i} 
+`+(a!==i?`result of cast: ${a}`:""))}return n}_cast(e,t){let r=void 0===e?e:this.transforms.reduce((t,r)=>r.call(this,t,e,this),e);return void 0===r&&(r=this.getDefault()),r}_validate(e,t={},r){let{sync:n,path:i,from:a=[],originalValue:o=e,strict:u=this.spec.strict,abortEarly:s=this.spec.abortEarly}=t,l=e;u||(l=this._cast(l,z({assert:!1},t)));let c={value:l,path:i,options:t,originalValue:o,schema:this,label:this.spec.label,sync:n,from:a},f=[];this._typeError&&f.push(this._typeError);let h=[];this._whitelistError&&h.push(this._whitelistError),this._blacklistError&&h.push(this._blacklistError),A({args:c,value:l,path:i,sync:n,tests:f,endEarly:s},e=>{if(e)return void r(e,l);A({tests:this.tests.concat(h),args:c,path:i,sync:n,value:l,endEarly:s},r)})}validate(e,t,r){let n=this.resolve(z({},t,{value:e}));return"function"==typeof r?n._validate(e,t,r):new Promise((r,i)=>n._validate(e,t,(e,t)=>{e?i(e):r(t)}))}validateSync(e,t){let r;return this.resolve(z({},t,{value:e}))._validate(e,z({},t,{sync:!0}),(e,t)=>{if(e)throw e;r=t}),r}isValid(e,t){return this.validate(e,t).then(()=>!0,e=>{if(S.isError(e))return!1;throw e})}isValidSync(e,t){try{return this.validateSync(e,t),!0}catch(e){if(S.isError(e))return!1;throw e}}_getDefault(){let e=this.spec.default;return null==e?e:"function"==typeof e?e.call(this):n(e)}getDefault(e){return this.resolve(e||{})._getDefault()}default(e){return 0==arguments.length?this._getDefault():this.clone({default:e})}strict(e=!0){let t=this.clone();return t.spec.strict=e,t}_isPresent(e){return null!=e}defined(e=f.defined){return this.test({message:e,name:"defined",exclusive:!0,test:e=>void 0!==e})}required(e=f.required){return this.clone({presence:"required"}).withMutation(t=>t.test({message:e,name:"required",exclusive:!0,test(e){return this.schema._isPresent(e)}}))}notRequired(){let e=this.clone({presence:"optional"});return e.tests=e.tests.filter(e=>"required"!==e.OPTIONS.name),e}nullable(e=!0){return this.clone({nullable:!1!==e})}transform(e){let t=this.clone();return t.transforms.push(e),t}test(...e){let t;if(void 0===(t=1===e.length?"function"==typeof e[0]?{test:e[0]}:e[0]:2===e.length?{name:e[0],test:e[1]}:{name:e[0],message:e[1],test:e[2]}).message&&(t.message=f.default),"function"!=typeof t.test)throw TypeError("`test` is a required parameters");let r=this.clone(),n=M(t),i=t.exclusive||t.name&&!0===r.exclusiveTests[t.name];if(t.exclusive&&!t.name)throw TypeError("Exclusive tests must provide a unique `name` identifying the test");return t.name&&(r.exclusiveTests[t.name]=!!t.exclusive),r.tests=r.tests.filter(e=>e.OPTIONS.name!==t.name||!i&&e.OPTIONS.test!==n.OPTIONS.test),r.tests.push(n),r}when(e,t){Array.isArray(e)||"string"==typeof e||(t=e,e=".");let r=this.clone(),n=O(e).map(e=>new R(e));return n.forEach(e=>{e.isSibling&&r.deps.push(e.key)}),r.conditions.push(new x(n,t)),r}typeError(e){let t=this.clone();return t._typeError=M({message:e,name:"typeError",test(e){return!!(void 0===e||this.schema.isType(e))||this.createError({params:{type:this.schema._type}})}}),t}oneOf(e,t=f.oneOf){let r=this.clone();return e.forEach(e=>{r._whitelist.add(e),r._blacklist.delete(e)}),r._whitelistError=M({message:t,name:"oneOf",test(e){if(void 0===e)return!0;let t=this.schema._whitelist,r=t.resolveAll(this.resolve);return!!r.includes(e)||this.createError({params:{values:t.toArray().join(", "),resolved:r}})}}),r}notOneOf(e,t=f.notOneOf){let r=this.clone();return e.forEach(e=>{r._blacklist.add(e),r._whitelist.delete(e)}),r._blacklistError=M({message:t,name:"notOneOf",test(e){let t=this.schema._blacklist,r=t.resolveAll(this.resolve);return!r.includes(e)||this.createError({params:{values:t.toArray().join(", "),resolved:r}})}}),r}strip(e=!0){let t=this.clone();return t.spec.strip=e,t}describe(){let e=this.clone(),{label:t,meta:r}=e.spec;return{meta:r,label:t,type:e.type,oneOf:e._whitelist.describe(),notOneOf:e._blacklist.describe(),tests:e.tests.map(e=>({name:e.OPTIONS.name,params:e.OPTIONS.params})).filter((e,t,r)=>r.findIndex(t=>t.name===e.name)===t)}}}for(let e of(V.prototype.__isYupSchema__=!0,["validate","validateSync"]))V.prototype[`${e}At`]=function(t,r,n={}){let{parent:i,parentPath:a,schema:o}=function(e,t,r,n=r){let i,a,o;return t?((0,$.forEach)(t,(u,s,l)=>{let c=s?N(u):u;if((e=e.resolve({context:n,parent:i,value:r})).innerType){let n=l?parseInt(c,10):0;if(r&&n>=r.length)throw Error(`Yup.reach cannot resolve an array item at index: ${u}, in the path: ${t}. because there is no value at that index. `);i=r,r=r&&r[n],e=e.innerType}if(!l){if(!e.fields||!e.fields[c])throw Error(`The schema does not contain the path: ${t}. (failed at: ${o} which is a type: "${e._type}")`);i=r,r=r&&r[c],e=e.fields[c]}a=c,o=s?"["+u+"]":"."+u}),{schema:e,parent:i,parentPath:a}):{parent:i,parentPath:t,schema:e}}(this,t,r,n.context);return o[e](i&&i[a],z({},n,{parent:i,path:t}))};for(let e of["equals","is"])V.prototype[e]=V.prototype.oneOf;for(let e of["not","nope"])V.prototype[e]=V.prototype.notOneOf;V.prototype.optional=V.prototype.notRequired,V.prototype;var L=e=>null==e;class B extends V{constructor(){super({type:"boolean"}),this.withMutation(()=>{this.transform(function(e){if(!this.isType(e)){if(/^(true|1)$/i.test(String(e)))return!0;if(/^(false|0)$/i.test(String(e)))return!1}return e})})}_typeCheck(e){return e instanceof Boolean&&(e=e.valueOf()),"boolean"==typeof e}isTrue(e=v.isValue){return this.test({message:e,name:"is-value",exclusive:!0,params:{value:"true"},test:e=>L(e)||!0===e})}isFalse(e=v.isValue){return this.test({message:e,name:"is-value",exclusive:!0,params:{value:"false"},test:e=>L(e)||!1===e})}}B.prototype;let q=/^((([a-z]|\d|[!#\$%&'\*\+\-\/=\?\^_`{\|}~]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])+(\.([a-z]|\d|[!#\$%&'\*\+\-\/=\?\^_`{\|}~]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])+)*)|((\x22)((((\x20|\x09)*(\x0d\x0a))?(\x20|\x09)+)?(([\x01-\x08\x0b\x0c\x0e-\x1f\x7f]|\x21|[\x23-\x5b]|[\x5d-\x7e]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(\\([\x01-\x09\x0b\x0c\x0d-\x7f]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF]))))*(((\x20|\x09)*(\x0d\x0a))?(\x20|\x09)+)?(\x22)))@((([a-z]|\d|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(([a-z]|\d|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])*([a-z]|\d|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])))\.)+(([a-z]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(([a-z]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])*([a-z]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])))$/i,G=/^((https?|ftp):)?\/\/(((([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(%[\da-f]{2})|[!\$&'\(\)\*\+,;=]|:)*@)?(((\d|[1-9]\d|1\d\d|2[0-4]\d|25[0-5])\.(\d|[1-9]\d|1\d\d|2[0-4]\d|25[0-5])\.(\d|[1-9]\d|1\d\d|2[0-4]\d|25[0-5])\.(\d|[1-9]\d|1\d\d|2[0-4]\d|25[0-5]))|((([a-z]|\d|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(([a-z]|\d|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])*([a-z]|\d|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])))\.)+(([a-z]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(([a-z]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])*([a-z]|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])))\.?)(:\d*)?)(\/((([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(%[\da-f]{2})|[!\$&'\(\)\*\+,;=]|:|@)+(\/(([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(%[\da-f]{2})|[!\$&'\(\)\*\+,;=]|:|@)*)*)?)?(\?((([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(%[\da-f]{2})|[!\$&'\(\)\*\+,;=]|:|@)|[\uE000-\uF8FF]|\/|\?)*)?(\#((([a-z]|\d|-|\.|_|~|[\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF])|(%[\da-f]{2})|[!\$&'\(\)\*\+,;=]|:|@)|\/|\?)*)?$/i,Z=/^(?:[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}|00000000-0000-0000-0000-000000000000)$/i,H=e=>L(e)||e===e.trim(),W=({}).toString();function Y(){return new K}class K extends V{constructor(){super({type:"string"}),this.withMutation(()=>{this.transform(function(e){if(this.isType(e)||Array.isArray(e))return e;let t=null!=e&&e.toString?e.toString():e;return t===W?e:t})})}_typeCheck(e){return e instanceof String&&(e=e.valueOf()),"string"==typeof e}_isPresent(e){return super._isPresent(e)&&!!e.length}length(e,t=h.length){return this.test({message:t,name:"length",exclusive:!0,params:{length:e},test(t){return L(t)||t.length===this.resolve(e)}})}min(e,t=h.min){return this.test({message:t,name:"min",exclusive:!0,params:{min:e},test(t){return L(t)||t.length>=this.resolve(e)}})}max(e,t=h.max){return this.test({name:"max",exclusive:!0,message:t,params:{max:e},test(t){return L(t)||t.length<=this.resolve(e)}})}matches(e,t){let r,n,i=!1;return t&&("object"==typeof t?{excludeEmptyString:i=!1,message:r,name:n}=t:r=t),this.test({name:n||"matches",message:r||h.matches,params:{regex:e},test:t=>L(t)||""===t&&i||-1!==t.search(e)})}email(e=h.email){return this.matches(q,{name:"email",message:e,excludeEmptyString:!0})}url(e=h.url){return this.matches(G,{name:"url",message:e,excludeEmptyString:!0})}uuid(e=h.uuid){return this.matches(Z,{name:"uuid",message:e,excludeEmptyString:!1})}ensure(){return this.default("").transform(e=>null===e?"":e)}trim(e=h.trim){return this.transform(e=>null!=e?e.trim():e).test({message:e,name:"trim",test:H})}lowercase(e=h.lowercase){return this.transform(e=>L(e)?e:e.toLowerCase()).test({message:e,name:"string_case",exclusive:!0,test:e=>L(e)||e===e.toLowerCase()})}uppercase(e=h.uppercase){return this.transform(e=>L(e)?e:e.toUpperCase()).test({message:e,name:"string_case",exclusive:!0,test:e=>L(e)||e===e.toUpperCase()})}}Y.prototype=K.prototype;let J=e=>e!=+e;class Q extends V{constructor(){super({type:"number"}),this.withMutation(()=>{this.transform(function(e){let t=e;if("string"==typeof t){if(""===(t=t.replace(/\s/g,"")))return NaN;t=+t}return this.isType(t)?t:parseFloat(t)})})}_typeCheck(e){return e instanceof Number&&(e=e.valueOf()),"number"==typeof e&&!J(e)}min(e,t=p.min){return this.test({message:t,name:"min",exclusive:!0,params:{min:e},test(t){return L(t)||t>=this.resolve(e)}})}max(e,t=p.max){return this.test({message:t,name:"max",exclusive:!0,params:{max:e},test(t){return L(t)||t<=this.resolve(e)}})}lessThan(e,t=p.lessThan){return this.test({message:t,name:"max",exclusive:!0,params:{less:e},test(t){return L(t)||t<this.resolve(e)}})}moreThan(e,t=p.moreThan){return this.test({message:t,name:"min",exclusive:!0,params:{more:e},test(t){return L(t)||t>this.resolve(e)}})}positive(e=p.positive){return this.moreThan(0,e)}negative(e=p.negative){return this.lessThan(0,e)}integer(e=p.integer){return this.test({name:"integer",message:e,test:e=>L(e)||Number.isInteger(e)})}truncate(){return this.transform(e=>L(e)?e:0|e)}round(e){var t;let r=["ceil","floor","round","trunc"];if("trunc"===(e=(null==(t=e)?void 0:t.toLowerCase())||"round"))return this.truncate();if(-1===r.indexOf(e.toLowerCase()))throw TypeError("Only valid options for round() are: "+r.join(", "));return this.transform(t=>L(t)?t:Math[e](t))}}Q.prototype;var X=/^(\d{4}|[+\-]\d{6})(?:-?(\d{2})(?:-?(\d{2}))?)?(?:[ T]?(\d{2}):?(\d{2})(?::?(\d{2})(?:[,\.](\d{1,}))?)?(?:(Z)|([+\-])(\d{2})(?::?(\d{2}))?)?)?$/;let ee=new Date(""),et=e=>"[object Date]"===Object.prototype.toString.call(e);function er(){return new en}class en extends V{constructor(){super({type:"date"}),this.withMutation(()=>{this.transform(function(e){return this.isType(e)?e:isNaN(e=function(e){var t,r,n=[1,4,5,6,7,10,11],i=0;if(r=X.exec(e)){for(var a,o=0;a=n[o];++o)r[a]=+r[a]||0;r[2]=(+r[2]||1)-1,r[3]=+r[3]||1,r[7]=r[7]?String(r[7]).substr(0,3):0,(void 0===r[8]||""===r[8])&&(void 0===r[9]||""===r[9])?t=+new Date(r[1],r[2],r[3],r[4],r[5],r[6],r[7]):("Z"!==r[8]&&void 0!==r[9]&&(i=60*r[10]+r[11],"+"===r[9]&&(i=0-i)),t=Date.UTC(r[1],r[2],r[3],r[4],r[5]+i,r[6],r[7]))}else t=Date.parse?Date.parse(e):NaN;return t}(e))?ee:new Date(e)})})}_typeCheck(e){return et(e)&&!isNaN(e.getTime())}prepareParam(e,t){let r;if(R.isRef(e))r=e;else{let n=this.cast(e);if(!this._typeCheck(n))throw TypeError(`\`${t}\` must be a Date or a value that can be \`cast()\` to a Date`);r=n}return r}min(e,t=d.min){let r=this.prepareParam(e,"min");return this.test({message:t,name:"min",exclusive:!0,params:{min:e},test(e){return L(e)||e>=this.resolve(r)}})}max(e,t=d.max){let r=this.prepareParam(e,"max");return this.test({message:t,name:"max",exclusive:!0,params:{max:e},test(e){return L(e)||e<=this.resolve(r)}})}}en.INVALID_DATE=ee,er.prototype=en.prototype,er.INVALID_DATE=ee;var ei=r(11865),ea=r.n(ei),eo=r(68929),eu=r.n(eo),es=r(67523),el=r.n(es),ec=r(94633),ef=r.n(ec);function eh(e,t){let r=1/0;return e.some((e,n)=>{var i;if((null==(i=t.path)?void 0:i.indexOf(e))!==-1)return r=n,!0}),r}function ep(e){return(t,r)=>eh(e,t)-eh(e,r)}function ed(){return(ed=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}let ev=e=>"[object Object]"===Object.prototype.toString.call(e),ey=ep([]);class em extends V{constructor(e){super({type:"object"}),this.fields=Object.create(null),this._sortErrors=ey,this._nodes=[],this._excludedEdges=[],this.withMutation(()=>{this.transform(function(e){if("string"==typeof e)try{e=JSON.parse(e)}catch(t){e=null}return this.isType(e)?e:null}),e&&this.shape(e)})}_typeCheck(e){return ev(e)||"function"==typeof e}_cast(e,t={}){var r;let n=super._cast(e,t);if(void 0===n)return this.getDefault();if(!this._typeCheck(n))return n;let i=this.fields,a=null!=(r=t.stripUnknown)?r:this.spec.noUnknown,o=this._nodes.concat(Object.keys(n).filter(e=>-1===this._nodes.indexOf(e))),u={},s=ed({},t,{parent:u,__validating:t.__validating||!1}),l=!1;for(let e of o){let r=i[e],o=F()(n,e);if(r){let i;let a=n[e];s.path=(t.path?`${t.path}.`:"")+e;let o="spec"in(r=r.resolve({value:a,context:t.context,parent:u}))?r.spec:void 0,c=null==o?void 0:o.strict;if(null==o?void 0:o.strip){l=l||e in n;continue}void 0!==(i=t.__validating&&c?n[e]:r.cast(n[e],s))&&(u[e]=i)}else o&&!a&&(u[e]=n[e]);u[e]!==n[e]&&(l=!0)}return l?u:n}_validate(e,t={},r){let n=[],{sync:i,from:a=[],originalValue:o=e,abortEarly:u=this.spec.abortEarly,recursive:s=this.spec.recursive}=t;a=[{schema:this,value:o},...a],t.__validating=!0,t.originalValue=o,t.from=a,super._validate(e,t,(e,l)=>{if(e){if(!S.isError(e)||u)return void r(e,l);n.push(e)}if(!s||!ev(l)){r(n[0]||null,l);return}o=o||l,A({sync:i,tests:this._nodes.map(e=>(r,n)=>{let i=-1===e.indexOf(".")?(t.path?`${t.path}.`:"")+e:`${t.path||""}["${e}"]`,u=this.fields[e];if(u&&"validate"in u){u.validate(l[e],ed({},t,{path:i,from:a,strict:!0,parent:l,originalValue:o[e]}),n);return}n(null)}),value:l,errors:n,endEarly:u,sort:this._sortErrors,path:t.path},r)})}clone(e){let t=super.clone(e);return t.fields=ed({},this.fields),t._nodes=this._nodes,t._excludedEdges=this._excludedEdges,t._sortErrors=this._sortErrors,t}concat(e){let t=super.concat(e),r=t.fields;for(let[e,t]of Object.entries(this.fields)){let n=r[e];void 0===n?r[e]=t:n instanceof V&&t instanceof V&&(r[e]=t.concat(n))}return t.withMutation(()=>t.shape(r,this._excludedEdges))}getDefaultFromShape(){let e={};return this._nodes.forEach(t=>{let r=this.fields[t];e[t]="default"in r?r.getDefault():void 0}),e}_getDefault(){return"default"in this.spec?super._getDefault():this._nodes.length?this.getDefaultFromShape():void 0}shape(e,t=[]){let r=this.clone(),n=Object.assign(r.fields,e);return r.fields=n,r._sortErrors=ep(Object.keys(n)),t.length&&(Array.isArray(t[0])||(t=[t]),r._excludedEdges=[...r._excludedEdges,...t]),r._nodes=function(e,t=[]){let r=[],n=new Set,i=new Set(t.map(([e,t])=>`${e}-${t}`));function a(e,t){let a=(0,$.split)(e)[0];n.add(a),i.has(`${t}-${a}`)||r.push([t,a])}for(let t in e)if(F()(e,t)){let r=e[t];n.add(t),R.isRef(r)&&r.isSibling?a(r.path,t):E(r)&&"deps"in r&&r.deps.forEach(e=>a(e,t))}return ef().array(Array.from(n),r).reverse()}(n,r._excludedEdges),r}pick(e){let t={};for(let r of e)this.fields[r]&&(t[r]=this.fields[r]);return this.clone().withMutation(e=>(e.fields={},e.shape(t)))}omit(e){let t=this.clone(),r=t.fields;for(let n of(t.fields={},e))delete r[n];return t.withMutation(()=>t.shape(r))}from(e,t,r){let n=(0,$.getter)(e,!0);return this.transform(i=>{if(null==i)return i;let a=i;return F()(i,e)&&(a=ed({},i),r||delete a[e],a[t]=n(i)),a})}noUnknown(e=!0,t=y.noUnknown){"string"==typeof e&&(t=e,e=!0);let r=this.test({name:"noUnknown",exclusive:!0,message:t,test(t){let r;if(null==t)return!0;let n=(r=Object.keys(this.schema.fields),Object.keys(t).filter(e=>-1===r.indexOf(e)));return!e||0===n.length||this.createError({params:{unknown:n.join(", ")}})}});return r.spec.noUnknown=e,r}unknown(e=!0,t=y.noUnknown){return this.noUnknown(!e,t)}transformKeys(e){return this.transform(t=>t&&el()(t,(t,r)=>e(r)))}camelCase(){return this.transformKeys(eu())}snakeCase(){return this.transformKeys(ea())}constantCase(){return this.transformKeys(e=>ea()(e).toUpperCase())}describe(){let e=super.describe();return e.fields=k()(this.fields,e=>e.describe()),e}}function eb(e){return new em(e)}function eg(){return(eg=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}eb.prototype=em.prototype;class e_ extends V{constructor(e){super({type:"array"}),this.innerType=void 0,this.innerType=e,this.withMutation(()=>{this.transform(function(e){if("string"==typeof e)try{e=JSON.parse(e)}catch(t){e=null}return this.isType(e)?e:null})})}_typeCheck(e){return Array.isArray(e)}get _subType(){return this.innerType}_cast(e,t){let r=super._cast(e,t);if(!this._typeCheck(r)||!this.innerType)return r;let n=!1,i=r.map((e,r)=>{let i=this.innerType.cast(e,eg({},t,{path:`${t.path||""}[${r}]`}));return i!==e&&(n=!0),i});return n?i:r}_validate(e,t={},r){var n,i;let a=[],o=t.sync,u=t.path,s=this.innerType,l=null!=(n=t.abortEarly)?n:this.spec.abortEarly,c=null!=(i=t.recursive)?i:this.spec.recursive,f=null!=t.originalValue?t.originalValue:e;super._validate(e,t,(e,n)=>{if(e){if(!S.isError(e)||l)return void r(e,n);a.push(e)}if(!c||!s||!this._typeCheck(n)){r(a[0]||null,n);return}f=f||n;let i=Array(n.length);for(let e=0;e<n.length;e++){let r=n[e],a=`${t.path||""}[${e}]`,o=eg({},t,{path:a,strict:!0,parent:n,index:e,originalValue:f[e]});i[e]=(e,t)=>s.validate(r,o,t)}A({sync:o,path:u,value:n,errors:a,endEarly:l,tests:i},r)})}clone(e){let t=super.clone(e);return t.innerType=this.innerType,t}concat(e){let t=super.concat(e);return t.innerType=this.innerType,e.innerType&&(t.innerType=t.innerType?t.innerType.concat(e.innerType):e.innerType),t}of(e){let t=this.clone();if(!E(e))throw TypeError("`array.of()` sub-schema must be a valid yup schema not: "+c(e));return t.innerType=e,t}length(e,t=m.length){return this.test({message:t,name:"length",exclusive:!0,params:{length:e},test(t){return L(t)||t.length===this.resolve(e)}})}min(e,t){return t=t||m.min,this.test({message:t,name:"min",exclusive:!0,params:{min:e},test(t){return L(t)||t.length>=this.resolve(e)}})}max(e,t){return t=t||m.max,this.test({message:t,name:"max",exclusive:!0,params:{max:e},test(t){return L(t)||t.length<=this.resolve(e)}})}ensure(){return this.default(()=>[]).transform((e,t)=>this._typeCheck(e)?e:null==t?[]:[].concat(t))}compact(e){let t=e?(t,r,n)=>!e(t,r,n):e=>!!e;return this.transform(e=>null!=e?e.filter(t):e)}describe(){let e=super.describe();return this.innerType&&(e.innerType=this.innerType.describe()),e}nullable(e=!0){return super.nullable(e)}defined(){return super.defined()}required(e){return super.required(e)}}e_.prototype},4730:function(e,t,r){"use strict";function n(e,t){if(null==e)return{};var r,n,i=function(e,t){if(null==e)return{};var r,n,i={},a=Object.keys(e);for(n=0;n<a.length;n++)r=a[n],t.indexOf(r)>=0||(i[r]=e[r]);return i}(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(n=0;n<a.length;n++)r=a[n],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(i[r]=e[r])}return i}r.d(t,{Z:function(){return n}})}}]);
\ No newline at end of file
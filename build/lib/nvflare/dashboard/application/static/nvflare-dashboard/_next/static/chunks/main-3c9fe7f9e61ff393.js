@@ -0,0 +1 @@
+(self.webpackChunk_N_E=self.webpackChunk_N_E||[]).push([[179],{85439:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"addBasePath",{enumerable:!0,get:function(){return a}});var n=r(26405),o=r(61063);function a(e,t){return(0,o.normalizePathTrailingSlash)((0,n.addPathPrefix)(e,"/nvflare-dashboard"))}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},23443:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"addLocale",{enumerable:!0,get:function(){return n}}),r(61063);var n=function(e){for(var t=arguments.length,r=Array(t>1?t-1:0),n=1;n<t;n++)r[n-1]=arguments[n];return e};("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},81493:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"getSocketUrl",{enumerable:!0,get:function(){return o}});var n=r(92803);function o(e){var t=(0,n.normalizedAssetPrefix)(e),r=function(e){var t=window.location.protocol;try{t=new URL(e).protocol}catch(e){}return"http:"===t?"ws:":"wss:"}(e||"");if(URL.canParse(t))return t.replace(/^http/,"ws");var o=window.location,a=o.hostname,i=o.port;return r+"//"+a+(i?":"+i:"")+t}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},56905:function(e,t,r){"use strict";function n(e,t){(null==t||t>e.length)&&(t=e.length);for(var r=0,n=Array(t);r<t;r++)n[r]=e[r];return n}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{addMessageListener:function(){return u},connectHMR:function(){return l},sendMessage:function(){return s}});var o,a=r(81493),i=[];function u(e){i.push(e)}function s(e){if(o&&o.readyState===o.OPEN)return o.send(e)}var c=0;function l(e){!function t(){function r(){if(o.onerror=null,o.onclose=null,o.close(),++c>25){window.location.reload();return}clearTimeout(u),u=setTimeout(t,c>5?5e3:1e3)}o&&o.close();var u,s=(0,a.getSocketUrl)(e.assetPrefix);(o=new window.WebSocket(""+s+e.path)).onopen=function(){c=0,window.console.log("[HMR] connected")},o.onerror=r,o.onclose=r,o.onmessage=function(e){var t,r=JSON.parse(e.data),o=function(e,t){var r="undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(!r){if(Array.isArray(e)||(r=function(e,t){if(e){if("string"==typeof e)return n(e,void 0);var r=Object.prototype.toString.call(e).slice(8,-1);if("Object"===r&&e.constructor&&(r=e.constructor.name),"Map"===r||"Set"===r)return Array.from(e);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return n(e,void 0)}}(e))){r&&(e=r);var o=0,a=function(){};return{s:a,n:function(){return o>=e.length?{done:!0}:{done:!1,value:e[o++]}},e:function(e){throw e},f:a}}throw TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var i,u=!0,s=!1;return{s:function(){r=r.call(e)},n:function(){var e=r.next();return u=e.done,e},e:function(e){s=!0,i=e},f:function(){try{u||null==r.return||r.return()}finally{if(s)throw i}}}}(i);try{for(o.s();!(t=o.n()).done;)(0,t.value)(r)}catch(e){o.e(e)}finally{o.f()}}}()}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},61139:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"detectDomainLocale",{enumerable:!0,get:function(){return r}});var r=function(){for(var e=arguments.length,t=Array(e),r=0;r<e;r++)t[r]=arguments[r]};("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},55638:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"hasBasePath",{enumerable:!0,get:function(){return o}});var n=r(69360);function o(e){return(0,n.pathHasPrefix)(e,"/nvflare-dashboard")}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},99695:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{DOMAttributeNames:function(){return n},default:function(){return i},isEqualNode:function(){return a}});var r,n={acceptCharset:"accept-charset",className:"class",htmlFor:"for",httpEquiv:"http-equiv",noModule:"noModule"};function o(e){var t=e.type,r=e.props,o=document.createElement(t);for(var a in r)if(r.hasOwnProperty(a)&&"children"!==a&&"dangerouslySetInnerHTML"!==a&&void 0!==r[a]){var i=n[a]||a.toLowerCase();"script"===t&&("async"===i||"defer"===i||"noModule"===i)?o[i]=!!r[a]:o.setAttribute(i,r[a])}var u=r.children,s=r.dangerouslySetInnerHTML;return s?o.innerHTML=s.__html||"":u&&(o.textContent="string"==typeof u?u:Array.isArray(u)?u.join(""):""),o}function a(e,t){if(e instanceof HTMLElement&&t instanceof HTMLElement){var r=t.getAttribute("nonce");if(r&&!e.getAttribute("nonce")){var n=t.cloneNode(!0);return n.setAttribute("nonce",""),n.nonce=r,r===e.nonce&&e.isEqualNode(n)}}return e.isEqualNode(t)}function i(){return{mountedInstances:new Set,updateHead:function(e){var t={};e.forEach(function(e){if("link"===e.type&&e.props["data-optimized-fonts"]){if(document.querySelector('style[data-href="'+e.props["data-href"]+'"]'))return;e.props.href=e.props["data-href"],e.props["data-href"]=void 0}var r=t[e.type]||[];r.push(e),t[e.type]=r});var n=t.title?t.title[0]:null,o="";if(n){var a=n.props.children;o="string"==typeof a?a:Array.isArray(a)?a.join(""):""}o!==document.title&&(document.title=o),["meta","base","link","style","script"].forEach(function(e){r(e,t[e]||[])})}}}r=function(e,t){for(var r,n=document.getElementsByTagName("head")[0],i=n.querySelector("meta[name=next-head-count]"),u=Number(i.content),s=[],c=0,l=i.previousElementSibling;c<u;c++,l=(null==l?void 0:l.previousElementSibling)||null)(null==l?void 0:null==(r=l.tagName)?void 0:r.toLowerCase())===e&&s.push(l);var f=t.map(o).filter(function(e){for(var t=0,r=s.length;t<r;t++)if(a(s[t],e))return s.splice(t,1),!1;return!0});s.forEach(function(e){var t;return null==(t=e.parentNode)?void 0:t.removeChild(e)}),f.forEach(function(e){return n.insertBefore(e,i)}),i.content=(u-s.length+f.length).toString()},("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},60352:function(e,t,r){"use strict";var n,o,a,i,u,s,c,l,f,d,p,h=r(64687),v=r(43171),m=r(20968),y=r(67752),b=r(23322),g=r(16089),_=r(55667),P=r(81961),x=r(67731);function O(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}function E(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?O(Object(r),!0).forEach(function(t){m(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):O(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{emitter:function(){return ee},hydrate:function(){return eO},initialize:function(){return ea},router:function(){return n},version:function(){return Z}});var S=r(38754),w=r(85893);r(40037);var j=S._(r(67294)),R=S._(r(20745)),T=r(20870),M=S._(r(53415)),A=r(21770),C=r(28589),I=r(43033),k=r(75606),L=r(41258),N=r(9642),D=r(37720),F=S._(r(99695)),B=S._(r(71981)),U=S._(r(90419)),H=r(31050),q=r(58194),W=r(80676),G=r(36769),z=r(72743),V=r(55638),K=r(45074),X=r(93726),Y=r(87861),$=S._(r(96713)),J=S._(r(65179)),Q=S._(r(62829)),Z="14.2.13",ee=(0,M.default)(),et=function(e){return[].slice.call(e)},er=void 0,en=!1,eo=function(e){_(i,e);var t,r=(t=function(){if("undefined"==typeof Reflect||!Reflect.construct||Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch(e){return!1}}(),function(){var e,r=x(i);return e=t?Reflect.construct(r,arguments,x(this).constructor):r.apply(this,arguments),P(this,e)});function i(){return b(this,i),r.apply(this,arguments)}return g(i,[{key:"componentDidCatch",value:function(e,t){this.props.fn(e,t)}},{key:"componentDidMount",value:function(){this.scrollToHash(),n.isSsr&&(o.isFallback||o.nextExport&&((0,I.isDynamicRoute)(n.pathname)||location.search||en)||o.props&&o.props.__N_SSG&&(location.search||en))&&n.replace(n.pathname+"?"+String((0,k.assign)((0,k.urlQueryToSearchParams)(n.query),new URLSearchParams(location.search))),a,{_h:1,shallow:!o.isFallback&&!en}).catch(function(e){if(!e.cancelled)throw e})}},{key:"componentDidUpdate",value:function(){this.scrollToHash()}},{key:"scrollToHash",value:function(){var e=location.hash;if(e=e&&e.substring(1)){var t=document.getElementById(e);t&&setTimeout(function(){return t.scrollIntoView()},0)}}},{key:"render",value:function(){return this.props.children}}]),i}(j.default.Component);function ea(e){return ei.apply(this,arguments)}function ei(){return(ei=y(h.mark(function e(t){var c,l;return h.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return void 0===t&&(t={}),J.default.onSpanEnd(Q.default),o=JSON.parse(document.getElementById("__NEXT_DATA__").textContent),window.__NEXT_DATA__=o,er=o.defaultLocale,c=o.assetPrefix||"",self.__next_set_public_path__(""+c+"/_next/"),(0,L.setConfig)({serverRuntimeConfig:{},publicRuntimeConfig:o.runtimeConfig||{}}),a=(0,N.getURL)(),(0,V.hasBasePath)(a)&&(a=(0,z.removeBasePath)(a)),o.scriptLoader&&(0,r(45125).initScriptLoader)(o.scriptLoader),i=new B.default(o.buildId,c),l=function(e){var t=v(e,2),r=t[0],n=t[1];return i.routeLoader.onEntrypoint(r,n)},window.__NEXT_P&&window.__NEXT_P.map(function(e){return setTimeout(function(){return l(e)},0)}),window.__NEXT_P=[],window.__NEXT_P.push=l,(s=(0,F.default)()).getIsSsr=function(){return n.isSsr},u=document.getElementById("__next"),e.abrupt("return",{assetPrefix:c});case 22:case"end":return e.stop()}},e)}))).apply(this,arguments)}function eu(e,t){return(0,w.jsx)(e,E({},t))}function es(e){var t,r=e.children,o=j.default.useMemo(function(){return(0,X.adaptForAppRouterInstance)(n)},[]);return(0,w.jsx)(eo,{fn:function(e){return el({App:f,err:e}).catch(function(e){return console.error("Error rendering page: ",e)})},children:(0,w.jsx)(K.AppRouterContext.Provider,{value:o,children:(0,w.jsx)(Y.SearchParamsContext.Provider,{value:(0,X.adaptForSearchParams)(n),children:(0,w.jsx)(X.PathnameContextProviderAdapter,{router:n,isAutoExport:null!=(t=self.__NEXT_DATA__.autoExport)&&t,children:(0,w.jsx)(Y.PathParamsContext.Provider,{value:(0,X.adaptForPathParams)(n),children:(0,w.jsx)(A.RouterContext.Provider,{value:(0,q.makePublicRouterInstance)(n),children:(0,w.jsx)(T.HeadManagerContext.Provider,{value:s,children:(0,w.jsx)(G.ImageConfigContext.Provider,{value:{deviceSizes:[640,750,828,1080,1200,1920,2048,3840],imageSizes:[16,32,48,64,96,128,256,384],path:"/nvflare-dashboard/_next/image",loader:"default",dangerouslyAllowSVG:!1,unoptimized:!0},children:r})})})})})})})})}var ec=function(e){return function(t){var r=E(E({},t),{},{Component:p,err:o.err,router:n});return(0,w.jsx)(es,{children:eu(e,r)})}};function el(e){var t=e.App,u=e.err;return console.error(u),console.error("A client-side exception has occurred, see here for more info: https://nextjs.org/docs/messages/client-side-exception-occurred"),i.loadPage("/_error").then(function(n){var o=n.page,a=n.styleSheets;return(null==c?void 0:c.Component)===o?r.e(880).then(r.t.bind(r,39880,23)).then(function(n){return r.e(745).then(r.t.bind(r,16745,23)).then(function(r){return t=r.default,e.App=t,n})}).then(function(e){return{ErrorComponent:e.default,styleSheets:[]}}):{ErrorComponent:o,styleSheets:a}}).then(function(r){var i,s=r.ErrorComponent,c=r.styleSheets,l=ec(t),f={Component:s,AppTree:l,router:n,ctx:{err:u,pathname:o.page,query:o.query,asPath:a,AppTree:l}};return Promise.resolve((null==(i=e.props)?void 0:i.err)?e.props:(0,N.loadGetInitialProps)(t,f)).then(function(t){return e_(E(E({},e),{},{err:u,Component:s,styleSheets:c,props:t}))})})}function ef(e){var t=e.callback;return j.default.useLayoutEffect(function(){return t()},[t]),null}var ed={navigationStart:"navigationStart",beforeRender:"beforeRender",afterRender:"afterRender",afterHydrate:"afterHydrate",routeChange:"routeChange"},ep={hydration:"Next.js-hydration",beforeHydration:"Next.js-before-hydration",routeChangeToRender:"Next.js-route-change-to-render",render:"Next.js-render"},eh=null,ev=!0;function em(){[ed.beforeRender,ed.afterHydrate,ed.afterRender,ed.routeChange].forEach(function(e){return performance.clearMarks(e)})}function ey(){N.ST&&(performance.mark(ed.afterHydrate),performance.getEntriesByName(ed.beforeRender,"mark").length&&(performance.measure(ep.beforeHydration,ed.navigationStart,ed.beforeRender),performance.measure(ep.hydration,ed.beforeRender,ed.afterHydrate)),d&&performance.getEntriesByName(ep.hydration).forEach(d),em())}function eb(){if(N.ST){performance.mark(ed.afterRender);var e=performance.getEntriesByName(ed.routeChange,"mark");e.length&&(performance.getEntriesByName(ed.beforeRender,"mark").length&&(performance.measure(ep.routeChangeToRender,e[0].name,ed.beforeRender),performance.measure(ep.render,ed.beforeRender,ed.afterRender),d&&(performance.getEntriesByName(ep.render).forEach(d),performance.getEntriesByName(ep.routeChangeToRender).forEach(d))),em(),[ep.routeChangeToRender,ep.render].forEach(function(e){return performance.clearMeasures(e)}))}}function eg(e){var t=e.callbacks,r=e.children;return j.default.useLayoutEffect(function(){return t.forEach(function(e){return e()})},[t]),j.default.useEffect(function(){(0,U.default)(d)},[]),r}function e_(e){var t,r,o,a,i=e.App,s=e.Component,f=e.props,d=e.err,p="initial"in e?void 0:e.styleSheets;s=s||c.Component;var h=E(E({},f=f||c.props),{},{Component:s,err:d,router:n});c=h;var v=!1,m=new Promise(function(e,t){l&&l(),a=function(){l=null,e()},l=function(){v=!0,l=null;var e=Error("Cancel rendering route");e.cancelled=!0,t(e)}});function y(){a()}!function(){if(p){var e=new Set(et(document.querySelectorAll("style[data-n-href]")).map(function(e){return e.getAttribute("data-n-href")})),t=document.querySelector("noscript[data-n-css]"),r=null==t?void 0:t.getAttribute("data-n-css");p.forEach(function(t){var n=t.href,o=t.text;if(!e.has(n)){var a=document.createElement("style");a.setAttribute("data-n-href",n),a.setAttribute("media","x"),r&&a.setAttribute("nonce",r),document.head.appendChild(a),a.appendChild(document.createTextNode(o))}})}}();var b=(0,w.jsxs)(w.Fragment,{children:[(0,w.jsx)(ef,{callback:function(){if(p&&!v){for(var t=new Set(p.map(function(e){return e.href})),r=et(document.querySelectorAll("style[data-n-href]")),n=r.map(function(e){return e.getAttribute("data-n-href")}),o=0;o<n.length;++o)t.has(n[o])?r[o].removeAttribute("media"):r[o].setAttribute("media","x");var a=document.querySelector("noscript[data-n-css]");a&&p.forEach(function(e){var t=e.href,r=document.querySelector('style[data-n-href="'+t+'"]');r&&(a.parentNode.insertBefore(r,a.nextSibling),a=r)}),et(document.querySelectorAll("link[data-n-p]")).forEach(function(e){e.parentNode.removeChild(e)})}if(e.scroll){var i=e.scroll,u=i.x,s=i.y;(0,C.handleSmoothScroll)(function(){window.scrollTo(u,s)})}}}),(0,w.jsxs)(es,{children:[eu(i,h),(0,w.jsx)(D.Portal,{type:"next-route-announcer",children:(0,w.jsx)(H.RouteAnnouncer,{})})]})]});return t=u,r=function(e){return(0,w.jsx)(eg,{callbacks:[e,y],children:(0,w.jsx)(j.default.StrictMode,{children:b})})},N.ST&&performance.mark(ed.beforeRender),o=r(ev?ey:eb),eh?(0,j.default.startTransition)(function(){eh.render(o)}):(eh=R.default.hydrateRoot(t,o,{onRecoverableError:$.default}),ev=!1),m}function eP(e){return ex.apply(this,arguments)}function ex(){return(ex=y(h.mark(function e(t){var r;return h.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:if(!(t.err&&(void 0===t.Component||!t.isHydratePass))){e.next=4;break}return e.next=3,el(t);case 3:return e.abrupt("return");case 4:return e.prev=4,e.next=7,e_(t);case 7:e.next=17;break;case 9:if(e.prev=9,e.t0=e.catch(4),!(r=(0,W.getProperError)(e.t0)).cancelled){e.next=14;break}throw r;case 14:return e.next=17,el(E(E({},t),{},{err:r}));case 17:case"end":return e.stop()}},e,null,[[4,9]])}))).apply(this,arguments)}function eO(e){return eE.apply(this,arguments)}function eE(){return(eE=y(h.mark(function e(t){var r,u,s,c,l,v;return h.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return r=o.err,e.prev=1,e.next=4,i.routeLoader.whenEntrypoint("/_app");case 4:if(!("error"in(u=e.sent))){e.next=7;break}throw u.error;case 7:s=u.component,c=u.exports,f=s,c&&c.reportWebVitals&&(d=function(e){var t,r=e.id,n=e.name,o=e.startTime,a=e.value,i=e.duration,u=e.entryType,s=e.entries,l=e.attribution,f=Date.now()+"-"+(Math.floor(Math.random()*(9e12-1))+1e12);s&&s.length&&(t=s[0].startTime);var d={id:r||f,name:n,startTime:o||t,value:null==a?i:a,label:"mark"===u||"measure"===u?"custom":"web-vital"};l&&(d.attribution=l),c.reportWebVitals(d)}),e.next=14;break;case 14:return e.next=16,i.routeLoader.whenEntrypoint(o.page);case 16:e.t0=e.sent;case 17:if(!("error"in(l=e.t0))){e.next=20;break}throw l.error;case 20:p=l.component,e.next=25;break;case 25:e.next=30;break;case 27:e.prev=27,e.t1=e.catch(1),r=(0,W.getProperError)(e.t1);case 30:if(!window.__NEXT_PRELOADREADY){e.next=34;break}return e.next=34,window.__NEXT_PRELOADREADY(o.dynamicIds);case 34:return n=(0,q.createRouter)(o.page,o.query,a,{initialProps:o.props,pageLoader:i,App:f,Component:p,wrapApp:ec,err:r,isFallback:!!o.isFallback,subscription:function(e,t,r){return eP(Object.assign({},e,{App:t,scroll:r}))},locale:o.locale,locales:o.locales,defaultLocale:er,domainLocales:o.domainLocales,isPreview:o.isPreview}),e.next=37,n._initialMatchesMiddlewarePromise;case 37:if(en=e.sent,v={App:f,initial:!0,Component:p,props:o.props,err:r,isHydratePass:!0},!(null==t?void 0:t.beforeRender)){e.next=42;break}return e.next=42,t.beforeRender();case 42:eP(v);case 43:case"end":return e.stop()}},e,null,[[1,27]])}))).apply(this,arguments)}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},45349:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),r(83069);var n=r(60352);window.next={version:n.version,get router(){return n.router},emitter:n.emitter},(0,n.initialize)({}).then(function(){return(0,n.hydrate)()}).catch(console.error),("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},61063:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"normalizePathTrailingSlash",{enumerable:!0,get:function(){return a}});var n=r(61105),o=r(12345),a=function(e){if(!e.startsWith("/"))return e;var t=(0,o.parsePath)(e),r=t.pathname,a=t.query,i=t.hash;return""+(0,n.removeTrailingSlash)(r)+a+i};("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},96713:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return o}});var n=r(92208);function o(e){var t="function"==typeof reportError?reportError:function(e){window.console.error(e)};(0,n.isBailoutToCSRError)(e)||t(e)}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},71981:function(e,t,r){"use strict";var n=r(23322),o=r(16089);Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return h}});var a=r(38754),i=r(85439),u=r(6287),s=a._(r(98389)),c=r(23443),l=r(43033),f=r(85261),d=r(61105),p=r(19311);r(16145);var h=function(){function e(t,r){n(this,e),this.routeLoader=(0,p.createRouteLoader)(r),this.buildId=t,this.assetPrefix=r,this.promisedSsgManifest=new Promise(function(e){window.__SSG_MANIFEST?e(window.__SSG_MANIFEST):window.__SSG_MANIFEST_CB=function(){e(window.__SSG_MANIFEST)}})}return o(e,[{key:"getPageList",value:function(){return(0,p.getClientBuildManifest)().then(function(e){return e.sortedPages})}},{key:"getMiddleware",value:function(){return window.__MIDDLEWARE_MATCHERS=[],window.__MIDDLEWARE_MATCHERS}},{key:"getDataHref",value:function(e){var t,r,n=e.asPath,o=e.href,a=e.locale,p=(0,f.parseRelativeUrl)(o),h=p.pathname,v=p.query,m=p.search,y=(0,f.parseRelativeUrl)(n).pathname,b=(0,d.removeTrailingSlash)(h);if("/"!==b[0])throw Error('Route name should start with a "/", got "'+b+'"');return t=e.skipInterpolation?y:(0,l.isDynamicRoute)(b)?(0,u.interpolateAs)(h,y,v).result:b,r=(0,s.default)((0,d.removeTrailingSlash)((0,c.addLocale)(t,a)),".json"),(0,i.addBasePath)("/_next/data/"+this.buildId+r+m,!0)}},{key:"_isSsg",value:function(e){return this.promisedSsgManifest.then(function(t){return t.has(e)})}},{key:"loadPage",value:function(e){return this.routeLoader.loadRoute(e).then(function(e){if("component"in e)return{page:e.component,mod:e.exports,styleSheets:e.styles.map(function(e){return{href:e.href,text:e.content}})};throw e.error})}},{key:"prefetch",value:function(e){return this.routeLoader.prefetch(e)}}]),e}();("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},90419:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return u}});var n,o=["CLS","FCP","FID","INP","LCP","TTFB"];location.href;var a=!1;function i(e){n&&n(e)}var u=function(e){if(n=e,!a){a=!0;for(var t=0;t<o.length;t++){var u=o[t];try{var s=void 0;s||(s=r(78018)),s["on"+u](i)}catch(e){console.warn("Failed to track "+u+" web-vital",e)}}}};("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},37720:function(e,t,r){"use strict";var n=r(43171);Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"Portal",{enumerable:!0,get:function(){return i}});var o=r(67294),a=r(73935),i=function(e){var t=e.children,r=e.type,i=n((0,o.useState)(null),2),u=i[0],s=i[1];return(0,o.useEffect)(function(){var e=document.createElement(r);return document.body.appendChild(e),s(e),function(){document.body.removeChild(e)}},[r]),u?(0,a.createPortal)(t,u):null};("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},72743:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"removeBasePath",{enumerable:!0,get:function(){return o}}),r(55638);var n="/nvflare-dashboard";function o(e){return 0===n.length||(e=e.slice(n.length)).startsWith("/")||(e="/"+e),e}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},22859:function(e,t,r){"use strict";function n(e,t){return e}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"removeLocale",{enumerable:!0,get:function(){return n}}),r(12345),("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},71650:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{cancelIdleCallback:function(){return n},requestIdleCallback:function(){return r}});var r="undefined"!=typeof self&&self.requestIdleCallback&&self.requestIdleCallback.bind(window)||function(e){var t=Date.now();return self.setTimeout(function(){e({didTimeout:!1,timeRemaining:function(){return Math.max(0,50-(Date.now()-t))}})},1)},n="undefined"!=typeof self&&self.cancelIdleCallback&&self.cancelIdleCallback.bind(window)||function(e){return clearTimeout(e)};("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},68364:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"resolveHref",{enumerable:!0,get:function(){return f}});var n=r(75606),o=r(92151),a=r(52395),i=r(9642),u=r(61063),s=r(25656),c=r(1777),l=r(6287);function f(e,t,r){var f,d="string"==typeof t?t:(0,o.formatWithValidation)(t),p=d.match(/^[a-zA-Z]{1,}:\/\//),h=p?d.slice(p[0].length):d;if((h.split("?",1)[0]||"").match(/(\/\/|\\)/)){console.error("Invalid href '"+d+"' passed to next/router in page: '"+e.pathname+"'. Repeated forward-slashes (//) or backslashes \\ are not valid in the href.");var v=(0,i.normalizeRepeatedSlashes)(h);d=(p?p[0]:"")+v}if(!(0,s.isLocalURL)(d))return r?[d]:d;try{f=new URL(d.startsWith("#")?e.asPath:e.pathname,"http://n")}catch(e){f=new URL("/","http://n")}try{var m=new URL(d,f);m.pathname=(0,u.normalizePathTrailingSlash)(m.pathname);var y="";if((0,c.isDynamicRoute)(m.pathname)&&m.searchParams&&r){var b=(0,n.searchParamsToUrlQuery)(m.searchParams),g=(0,l.interpolateAs)(m.pathname,m.pathname,b),_=g.result,P=g.params;_&&(y=(0,o.formatWithValidation)({pathname:_,hash:m.hash,query:(0,a.omit)(b,P)}))}var x=m.origin===f.origin?m.href.slice(m.origin.length):m.href;return r?[x,y||x]:x}catch(e){return r?[d]:d}}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},31050:function(e,t,r){"use strict";var n=r(43171);Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{RouteAnnouncer:function(){return c},default:function(){return l}});var o=r(38754),a=r(85893),i=o._(r(67294)),u=r(58194),s={border:0,clip:"rect(0 0 0 0)",height:"1px",margin:"-1px",overflow:"hidden",padding:0,position:"absolute",top:0,width:"1px",whiteSpace:"nowrap",wordWrap:"normal"},c=function(){var e=(0,u.useRouter)().asPath,t=n(i.default.useState(""),2),r=t[0],o=t[1],c=i.default.useRef(e);return i.default.useEffect(function(){if(c.current!==e){if(c.current=e,document.title)o(document.title);else{var t,r=document.querySelector("h1");o((null!=(t=null==r?void 0:r.innerText)?t:null==r?void 0:r.textContent)||e)}}},[e]),(0,a.jsx)("p",{"aria-live":"assertive",id:"__next-route-announcer__",role:"alert",style:s,children:r})},l=c;("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},19311:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{createRouteLoader:function(){return v},getClientBuildManifest:function(){return p},isAssetError:function(){return c},markAssetError:function(){return s}}),r(38754),r(98389);var n=r(3751),o=r(71650),a=r(84878);function i(e,t,r){var n,o=t.get(e);if(o)return"future"in o?o.future:Promise.resolve(o);var a=new Promise(function(e){n=e});return t.set(e,o={resolve:n,future:a}),r?r().then(function(e){return n(e),e}).catch(function(r){throw t.delete(e),r}):a}var u=Symbol("ASSET_LOAD_ERROR");function s(e){return Object.defineProperty(e,u,{})}function c(e){return e&&u in e}var l=function(e){try{return e=document.createElement("link"),!!window.MSInputMethodContext&&!!document.documentMode||e.relList.supports("prefetch")}catch(e){return!1}}(),f=function(){return(0,a.getDeploymentIdQueryOrEmptyString)()};function d(e,t,r){return new Promise(function(n,a){var i=!1;e.then(function(e){i=!0,n(e)}).catch(a),(0,o.requestIdleCallback)(function(){return setTimeout(function(){i||a(r)},t)})})}function p(){return self.__BUILD_MANIFEST?Promise.resolve(self.__BUILD_MANIFEST):d(new Promise(function(e){var t=self.__BUILD_MANIFEST_CB;self.__BUILD_MANIFEST_CB=function(){e(self.__BUILD_MANIFEST),t&&t()}}),3800,s(Error("Failed to load client build manifest")))}function h(e,t){return p().then(function(r){if(!(t in r))throw s(Error("Failed to lookup route: "+t));var o=r[t].map(function(t){return e+"/_next/"+encodeURI(t)});return{scripts:o.filter(function(e){return e.endsWith(".js")}).map(function(e){return(0,n.__unsafeCreateTrustedScriptURL)(e)+f()}),css:o.filter(function(e){return e.endsWith(".css")}).map(function(e){return e+f()})}})}function v(e){var t=new Map,r=new Map,n=new Map,a=new Map;function u(e){var t,n=r.get(e.toString());return n||(document.querySelector('script[src^="'+e+'"]')?Promise.resolve():(r.set(e.toString(),n=new Promise(function(r,n){(t=document.createElement("script")).onload=r,t.onerror=function(){return n(s(Error("Failed to load script: "+e)))},t.crossOrigin=void 0,t.src=e,document.body.appendChild(t)})),n))}function c(e){var t=n.get(e);return t||n.set(e,t=fetch(e,{credentials:"same-origin"}).then(function(t){if(!t.ok)throw Error("Failed to load stylesheet: "+e);return t.text().then(function(t){return{href:e,content:t}})}).catch(function(e){throw s(e)})),t}return{whenEntrypoint:function(e){return i(e,t)},onEntrypoint:function(e,r){(r?Promise.resolve().then(function(){return r()}).then(function(e){return{component:e&&e.default||e,exports:e}},function(e){return{error:e}}):Promise.resolve(void 0)).then(function(r){var n=t.get(e);n&&"resolve"in n?r&&(t.set(e,r),n.resolve(r)):(r?t.set(e,r):t.delete(e),a.delete(e))})},loadRoute:function(r,n){var o=this;return i(r,a,function(){var a;return d(h(e,r).then(function(e){var n=e.scripts,o=e.css;return Promise.all([t.has(r)?[]:Promise.all(n.map(u)),Promise.all(o.map(c))])}).then(function(e){return o.whenEntrypoint(r).then(function(t){return{entrypoint:t,styles:e[1]}})}),3800,s(Error("Route did not complete loading: "+r))).then(function(e){var t=e.entrypoint,r=Object.assign({styles:e.styles},t);return"error"in t?t:r}).catch(function(e){if(n)throw e;return{error:e}}).finally(function(){return null==a?void 0:a()})})},prefetch:function(t){var r,n=this;return(r=navigator.connection)&&(r.saveData||/2g/.test(r.effectiveType))?Promise.resolve():h(e,t).then(function(e){return Promise.all(l?e.scripts.map(function(e){var t,r,n;return t=e.toString(),r="script",new Promise(function(e,o){if(document.querySelector('\n      link[rel="prefetch"][href^="'+t+'"],\n      link[rel="preload"][href^="'+t+'"],\n      script[src^="'+t+'"]'))return e();n=document.createElement("link"),r&&(n.as=r),n.rel="prefetch",n.crossOrigin=void 0,n.onload=e,n.onerror=function(){return o(s(Error("Failed to prefetch: "+t)))},n.href=t,document.head.appendChild(n)})}):[])}).then(function(){(0,o.requestIdleCallback)(function(){return n.loadRoute(t,!0).catch(function(){})})}).catch(function(){})}}}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},58194:function(e,t,r){"use strict";var n=r(28957);function o(e,t){(null==t||t>e.length)&&(t=e.length);for(var r=0,n=Array(t);r<t;r++)n[r]=e[r];return n}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{Router:function(){return u.default},createRouter:function(){return y},default:function(){return v},makePublicRouterInstance:function(){return b},useRouter:function(){return m},withRouter:function(){return l.default}});var a=r(38754),i=a._(r(67294)),u=a._(r(79183)),s=r(21770),c=a._(r(80676)),l=a._(r(49656)),f={router:null,readyCallbacks:[],ready:function(e){if(this.router)return e();this.readyCallbacks.push(e)}},d=["pathname","route","query","asPath","components","isFallback","basePath","locale","locales","defaultLocale","isReady","isPreview","isLocaleDomain","domainLocales"],p=["push","replace","reload","back","prefetch","beforePopState"];function h(){if(!f.router)throw Error('No router instance found.\nYou should only use "next/router" on the client side of your app.\n');return f.router}Object.defineProperty(f,"events",{get:function(){return u.default.events}}),d.forEach(function(e){Object.defineProperty(f,e,{get:function(){return h()[e]}})}),p.forEach(function(e){f[e]=function(){for(var t=arguments.length,r=Array(t),n=0;n<t;n++)r[n]=arguments[n];var o=h();return o[e].apply(o,r)}}),["routeChangeStart","beforeHistoryChange","routeChangeComplete","routeChangeError","hashChangeStart","hashChangeComplete"].forEach(function(e){f.ready(function(){u.default.events.on(e,function(){for(var t=arguments.length,r=Array(t),n=0;n<t;n++)r[n]=arguments[n];var o="on"+e.charAt(0).toUpperCase()+e.substring(1);if(f[o])try{f[o].apply(f,r)}catch(e){console.error("Error when running the Router event: "+o),console.error((0,c.default)(e)?e.message+"\n"+e.stack:e+"")}})})});var v=f;function m(){var e=i.default.useContext(s.RouterContext);if(!e)throw Error("NextRouter was not mounted. https://nextjs.org/docs/messages/next-router-not-mounted");return e}function y(){for(var e=arguments.length,t=Array(e),r=0;r<e;r++)t[r]=arguments[r];return f.router=n(u.default,t),f.readyCallbacks.forEach(function(e){return e()}),f.readyCallbacks=[],f.router}function b(e){var t,r={},n=function(e,t){var r="undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(!r){if(Array.isArray(e)||(r=function(e,t){if(e){if("string"==typeof e)return o(e,void 0);var r=Object.prototype.toString.call(e).slice(8,-1);if("Object"===r&&e.constructor&&(r=e.constructor.name),"Map"===r||"Set"===r)return Array.from(e);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return o(e,void 0)}}(e))){r&&(e=r);var n=0,a=function(){};return{s:a,n:function(){return n>=e.length?{done:!0}:{done:!1,value:e[n++]}},e:function(e){throw e},f:a}}throw TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var i,u=!0,s=!1;return{s:function(){r=r.call(e)},n:function(){var e=r.next();return u=e.done,e},e:function(e){s=!0,i=e},f:function(){try{u||null==r.return||r.return()}finally{if(s)throw i}}}}(d);try{for(n.s();!(t=n.n()).done;){var a=t.value;if("object"==typeof e[a]){r[a]=Object.assign(Array.isArray(e[a])?[]:{},e[a]);continue}r[a]=e[a]}}catch(e){n.e(e)}finally{n.f()}return r.events=u.default.events,p.forEach(function(t){r[t]=function(){for(var r=arguments.length,n=Array(r),o=0;o<r;o++)n[o]=arguments[o];return e[t].apply(e,n)}}),r}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},45125:function(e,t,r){"use strict";var n=r(20968),o=r(47069),a=r(48416),i=r(43171),u=["id","src","onLoad","onReady","strategy","onError","stylesheets"];function s(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}function c(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?s(Object(r),!0).forEach(function(t){n(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):s(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{default:function(){return w},handleClientScriptLoad:function(){return O},initScriptLoader:function(){return E}});var l=r(38754),f=r(61757),d=r(85893),p=l._(r(73935)),h=f._(r(67294)),v=r(20870),m=r(99695),y=r(71650),b=new Map,g=new Set,_=["onLoad","onReady","dangerouslySetInnerHTML","children","onError","strategy","stylesheets"],P=function(e){if(p.default.preinit){e.forEach(function(e){p.default.preinit(e,{as:"style"})});return}var t=document.head;e.forEach(function(e){var r=document.createElement("link");r.type="text/css",r.rel="stylesheet",r.href=e,t.appendChild(r)})},x=function(e){var t=e.src,r=e.id,n=e.onLoad,o=void 0===n?function(){}:n,a=e.onReady,u=void 0===a?null:a,s=e.dangerouslySetInnerHTML,c=e.children,l=void 0===c?"":c,f=e.strategy,d=void 0===f?"afterInteractive":f,p=e.onError,h=e.stylesheets,v=r||t;if(!(v&&g.has(v))){if(b.has(t)){g.add(v),b.get(t).then(o,p);return}var y=function(){u&&u(),g.add(v)},x=document.createElement("script"),O=new Promise(function(e,t){x.addEventListener("load",function(t){e(),o&&o.call(this,t),y()}),x.addEventListener("error",function(e){t(e)})}).catch(function(e){p&&p(e)});s?(x.innerHTML=s.__html||"",y()):l?(x.textContent="string"==typeof l?l:Array.isArray(l)?l.join(""):"",y()):t&&(x.src=t,b.set(t,O));for(var E=0,S=Object.entries(e);E<S.length;E++){var w=i(S[E],2),j=w[0],R=w[1];if(!(void 0===R||_.includes(j))){var T=m.DOMAttributeNames[j]||j.toLowerCase();x.setAttribute(T,R)}}"worker"===d&&x.setAttribute("type","text/partytown"),x.setAttribute("data-nscript",d),h&&P(h),document.body.appendChild(x)}};function O(e){var t=e.strategy;"lazyOnload"===(void 0===t?"afterInteractive":t)?window.addEventListener("load",function(){(0,y.requestIdleCallback)(function(){return x(e)})}):x(e)}function E(e){e.forEach(O),[].concat(a(document.querySelectorAll('[data-nscript="beforeInteractive"]')),a(document.querySelectorAll('[data-nscript="beforePageRender"]'))).forEach(function(e){var t=e.id||e.getAttribute("src");g.add(t)})}function S(e){var t=e.id,r=e.src,n=void 0===r?"":r,a=e.onLoad,i=e.onReady,s=void 0===i?null:i,l=e.strategy,f=void 0===l?"afterInteractive":l,m=e.onError,b=e.stylesheets,_=o(e,u),P=(0,h.useContext)(v.HeadManagerContext),O=P.updateScripts,E=P.scripts,S=P.getIsSsr,w=P.appDir,j=P.nonce,R=(0,h.useRef)(!1);(0,h.useEffect)(function(){var e=t||n;R.current||(s&&e&&g.has(e)&&s(),R.current=!0)},[s,t,n]);var T=(0,h.useRef)(!1);if((0,h.useEffect)(function(){!T.current&&("afterInteractive"===f?x(e):"lazyOnload"===f&&("complete"===document.readyState?(0,y.requestIdleCallback)(function(){return x(e)}):window.addEventListener("load",function(){(0,y.requestIdleCallback)(function(){return x(e)})})),T.current=!0)},[e,f]),("beforeInteractive"===f||"worker"===f)&&(O?(E[f]=(E[f]||[]).concat([c({id:t,src:n,onLoad:void 0===a?function(){}:a,onReady:s,onError:m},_)]),O(E)):S&&S()?g.add(t||n):S&&!S()&&x(e)),w){if(b&&b.forEach(function(e){p.default.preinit(e,{as:"style"})}),"beforeInteractive"===f)return n?(p.default.preload(n,_.integrity?{as:"script",integrity:_.integrity,nonce:j,crossOrigin:_.crossOrigin}:{as:"script",nonce:j,crossOrigin:_.crossOrigin}),(0,d.jsx)("script",{nonce:j,dangerouslySetInnerHTML:{__html:"(self.__next_s=self.__next_s||[]).push("+JSON.stringify([n,c(c({},_),{},{id:t})])+")"}})):(_.dangerouslySetInnerHTML&&(_.children=_.dangerouslySetInnerHTML.__html,delete _.dangerouslySetInnerHTML),(0,d.jsx)("script",{nonce:j,dangerouslySetInnerHTML:{__html:"(self.__next_s=self.__next_s||[]).push("+JSON.stringify([0,c(c({},_),{},{id:t})])+")"}}));"afterInteractive"===f&&n&&p.default.preload(n,_.integrity?{as:"script",integrity:_.integrity,nonce:j,crossOrigin:_.crossOrigin}:{as:"script",nonce:j,crossOrigin:_.crossOrigin})}return null}Object.defineProperty(S,"__nextScript",{value:!0});var w=S;("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},62829:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return o}});var n=r(56905);function o(e){if("ended"!==e.state.state)throw Error("Expected span to be ended");(0,n.sendMessage)(JSON.stringify({event:"span-end",startTime:e.startTime,endTime:e.state.endTime,spanName:e.name,attributes:e.attributes}))}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},65179:function(e,t,r){"use strict";var n=r(23322),o=r(16089);Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return u}});var a=r(38754)._(r(53415)),i=function(){function e(t,r,o){var a,i;n(this,e),this.name=t,this.attributes=null!=(a=r.attributes)?a:{},this.startTime=null!=(i=r.startTime)?i:Date.now(),this.onSpanEnd=o,this.state={state:"inprogress"}}return o(e,[{key:"end",value:function(e){if("ended"===this.state.state)throw Error("Span has already ended");this.state={state:"ended",endTime:null!=e?e:Date.now()},this.onSpanEnd(this)}}]),e}(),u=new(function(){function e(){var t=this;n(this,e),this._emitter=(0,a.default)(),this.handleSpanEnd=function(e){t._emitter.emit("spanend",e)}}return o(e,[{key:"startSpan",value:function(e,t){return new i(e,t,this.handleSpanEnd)}},{key:"onSpanEnd",value:function(e){var t=this;return this._emitter.on("spanend",e),function(){t._emitter.off("spanend",e)}}}]),e}());("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},3751:function(e,t){"use strict";var r;function n(e){var t;return(null==(t=function(){if(void 0===r){var e;r=(null==(e=window.trustedTypes)?void 0:e.createPolicy("nextjs",{createHTML:function(e){return e},createScript:function(e){return e},createScriptURL:function(e){return e}}))||null}return r}())?void 0:t.createScriptURL(e))||e}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"__unsafeCreateTrustedScriptURL",{enumerable:!0,get:function(){return n}}),("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},83069:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),r(84878),self.__next_set_public_path__=function(e){r.p=e},("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},49656:function(e,t,r){"use strict";var n=r(20968);function o(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return u}}),r(38754);var a=r(85893);r(67294);var i=r(58194);function u(e){function t(t){return(0,a.jsx)(e,function(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?o(Object(r),!0).forEach(function(t){n(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):o(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}({router:(0,i.useRouter)()},t))}return t.getInitialProps=e.getInitialProps,t.origGetInitialProps=e.origGetInitialProps,t}("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},45074:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{AppRouterContext:function(){return o},GlobalLayoutRouterContext:function(){return i},LayoutRouterContext:function(){return a},MissingSlotContext:function(){return s},TemplateContext:function(){return u}});var n=r(38754)._(r(67294)),o=n.default.createContext(null),a=n.default.createContext(null),i=n.default.createContext(null),u=n.default.createContext(null),s=n.default.createContext(new Set)},1703:function(e,t,r){"use strict";var n=r(23322),o=r(16089);function a(e,t){(null==t||t>e.length)&&(t=e.length);for(var r=0,n=Array(t);r<t;r++)n[r]=e[r];return n}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"BloomFilter",{enumerable:!0,get:function(){return i}});var i=function(){function e(t){var r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1e-4;n(this,e),this.numItems=t,this.errorRate=r,this.numBits=Math.ceil(-(t*Math.log(r))/(Math.log(2)*Math.log(2))),this.numHashes=Math.ceil(this.numBits/t*Math.log(2)),this.bitArray=Array(this.numBits).fill(0)}return o(e,[{key:"export",value:function(){return{numItems:this.numItems,errorRate:this.errorRate,numBits:this.numBits,numHashes:this.numHashes,bitArray:this.bitArray}}},{key:"import",value:function(e){this.numItems=e.numItems,this.errorRate=e.errorRate,this.numBits=e.numBits,this.numHashes=e.numHashes,this.bitArray=e.bitArray}},{key:"add",value:function(e){var t=this;this.getHashValues(e).forEach(function(e){t.bitArray[e]=1})}},{key:"contains",value:function(e){var t=this;return this.getHashValues(e).every(function(e){return t.bitArray[e]})}},{key:"getHashValues",value:function(e){for(var t=[],r=1;r<=this.numHashes;r++){var n=function(e){for(var t=0,r=0;r<e.length;r++)t=Math.imul(t^e.charCodeAt(r),1540483477),t^=t>>>13,t=Math.imul(t,1540483477);return t>>>0}(""+e+r)%this.numBits;t.push(n)}return t}}],[{key:"from",value:function(t,r){void 0===r&&(r=1e-4);var n,o=new e(t.length,r),i=function(e,t){var r="undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(!r){if(Array.isArray(e)||(r=function(e,t){if(e){if("string"==typeof e)return a(e,void 0);var r=Object.prototype.toString.call(e).slice(8,-1);if("Object"===r&&e.constructor&&(r=e.constructor.name),"Map"===r||"Set"===r)return Array.from(e);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return a(e,void 0)}}(e))){r&&(e=r);var n=0,o=function(){};return{s:o,n:function(){return n>=e.length?{done:!0}:{done:!1,value:e[n++]}},e:function(e){throw e},f:o}}throw TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var i,u=!0,s=!1;return{s:function(){r=r.call(e)},n:function(){var e=r.next();return u=e.done,e},e:function(e){s=!0,i=e},f:function(){try{u||null==r.return||r.return()}finally{if(s)throw i}}}}(t);try{for(i.s();!(n=i.n()).done;){var u=n.value;o.add(u)}}catch(e){i.e(e)}finally{i.f()}return o}}]),e}()},16145:function(e,t,r){"use strict";var n,o=r(20968);Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{APP_BUILD_MANIFEST:function(){return _},APP_CLIENT_INTERNALS:function(){return J},APP_PATHS_MANIFEST:function(){return y},APP_PATH_ROUTES_MANIFEST:function(){return b},AUTOMATIC_FONT_OPTIMIZATION_MANIFEST:function(){return k},BARREL_OPTIMIZATION_PREFIX:function(){return W},BLOCKED_PAGES:function(){return F},BUILD_ID_FILE:function(){return D},BUILD_MANIFEST:function(){return g},CLIENT_PUBLIC_FILES_PATH:function(){return B},CLIENT_REFERENCE_MANIFEST:function(){return G},CLIENT_STATIC_FILES_PATH:function(){return U},CLIENT_STATIC_FILES_RUNTIME_AMP:function(){return Z},CLIENT_STATIC_FILES_RUNTIME_MAIN:function(){return Y},CLIENT_STATIC_FILES_RUNTIME_MAIN_APP:function(){return $},CLIENT_STATIC_FILES_RUNTIME_POLYFILLS:function(){return et},CLIENT_STATIC_FILES_RUNTIME_POLYFILLS_SYMBOL:function(){return er},CLIENT_STATIC_FILES_RUNTIME_REACT_REFRESH:function(){return Q},CLIENT_STATIC_FILES_RUNTIME_WEBPACK:function(){return ee},COMPILER_INDEXES:function(){return u},COMPILER_NAMES:function(){return i},CONFIG_FILES:function(){return N},DEFAULT_RUNTIME_WEBPACK:function(){return en},DEFAULT_SANS_SERIF_FONT:function(){return el},DEFAULT_SERIF_FONT:function(){return ec},DEV_CLIENT_PAGES_MANIFEST:function(){return M},DEV_MIDDLEWARE_MANIFEST:function(){return C},EDGE_RUNTIME_WEBPACK:function(){return eo},EDGE_UNSUPPORTED_NODE_APIS:function(){return ev},EXPORT_DETAIL:function(){return S},EXPORT_MARKER:function(){return E},FUNCTIONS_CONFIG_MANIFEST:function(){return P},GOOGLE_FONT_PROVIDER:function(){return eu},IMAGES_MANIFEST:function(){return R},INTERCEPTION_ROUTE_REWRITE_MANIFEST:function(){return X},MIDDLEWARE_BUILD_MANIFEST:function(){return V},MIDDLEWARE_MANIFEST:function(){return A},MIDDLEWARE_REACT_LOADABLE_MANIFEST:function(){return K},MODERN_BROWSERSLIST_TARGET:function(){return a.default},NEXT_BUILTIN_DOCUMENT:function(){return q},NEXT_FONT_MANIFEST:function(){return O},OPTIMIZED_FONT_PROVIDERS:function(){return es},PAGES_MANIFEST:function(){return m},PHASE_DEVELOPMENT_SERVER:function(){return p},PHASE_EXPORT:function(){return l},PHASE_INFO:function(){return v},PHASE_PRODUCTION_BUILD:function(){return f},PHASE_PRODUCTION_SERVER:function(){return d},PHASE_TEST:function(){return h},PRERENDER_MANIFEST:function(){return w},REACT_LOADABLE_MANIFEST:function(){return I},ROUTES_MANIFEST:function(){return j},RSC_MODULE_TYPES:function(){return eh},SERVER_DIRECTORY:function(){return L},SERVER_FILES_MANIFEST:function(){return T},SERVER_PROPS_ID:function(){return ei},SERVER_REFERENCE_MANIFEST:function(){return z},STATIC_PROPS_ID:function(){return ea},STATIC_STATUS_PAGES:function(){return ef},STRING_LITERAL_DROP_BUNDLE:function(){return H},SUBRESOURCE_INTEGRITY_MANIFEST:function(){return x},SYSTEM_ENTRYPOINTS:function(){return em},TRACE_OUTPUT_VERSION:function(){return ed},TURBO_TRACE_DEFAULT_MEMORY_LIMIT:function(){return ep},UNDERSCORE_NOT_FOUND_ROUTE:function(){return s},UNDERSCORE_NOT_FOUND_ROUTE_ENTRY:function(){return c}});var a=r(38754)._(r(34469)),i={client:"client",server:"server",edgeServer:"edge-server"},u=(o(n={},i.client,0),o(n,i.server,1),o(n,i.edgeServer,2),n),s="/_not-found",c=""+s+"/page",l="phase-export",f="phase-production-build",d="phase-production-server",p="phase-development-server",h="phase-test",v="phase-info",m="pages-manifest.json",y="app-paths-manifest.json",b="app-path-routes-manifest.json",g="build-manifest.json",_="app-build-manifest.json",P="functions-config-manifest.json",x="subresource-integrity-manifest",O="next-font-manifest",E="export-marker.json",S="export-detail.json",w="prerender-manifest.json",j="routes-manifest.json",R="images-manifest.json",T="required-server-files.json",M="_devPagesManifest.json",A="middleware-manifest.json",C="_devMiddlewareManifest.json",I="react-loadable-manifest.json",k="font-manifest.json",L="server",N=["next.config.js","next.config.mjs"],D="BUILD_ID",F=["/_document","/_app","/_error"],B="public",U="static",H="__NEXT_DROP_CLIENT_FILE__",q="__NEXT_BUILTIN_DOCUMENT__",W="__barrel_optimize__",G="client-reference-manifest",z="server-reference-manifest",V="middleware-build-manifest",K="middleware-react-loadable-manifest",X="interception-route-rewrite-manifest",Y="main",$=""+Y+"-app",J="app-pages-internals",Q="react-refresh",Z="amp",ee="webpack",et="polyfills",er=Symbol(et),en="webpack-runtime",eo="edge-runtime-webpack",ea="__N_SSG",ei="__N_SSP",eu="https://fonts.googleapis.com/",es=[{url:eu,preconnect:"https://fonts.gstatic.com"},{url:"https://use.typekit.net",preconnect:"https://use.typekit.net"}],ec={name:"Times New Roman",xAvgCharWidth:821,azAvgWidth:854.3953488372093,unitsPerEm:2048},el={name:"Arial",xAvgCharWidth:904,azAvgWidth:934.5116279069767,unitsPerEm:2048},ef=["/500"],ed=1,ep=6e3,eh={client:"client",server:"server"},ev=["clearImmediate","setImmediate","BroadcastChannel","ByteLengthQueuingStrategy","CompressionStream","CountQueuingStrategy","DecompressionStream","DomException","MessageChannel","MessageEvent","MessagePort","ReadableByteStreamController","ReadableStreamBYOBRequest","ReadableStreamDefaultController","TransformStreamDefaultController","WritableStreamDefaultController"],em=new Set([Y,Q,Z,$]);("function"==typeof t.default||"object"==typeof t.default&&null!==t.default)&&void 0===t.default.__esModule&&(Object.defineProperty(t.default,"__esModule",{value:!0}),Object.assign(t.default,t),e.exports=t.default)},74757:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"escapeStringRegexp",{enumerable:!0,get:function(){return o}});var r=/[|\\{}()[\]^$+*?.-]/,n=/[|\\{}()[\]^$+*?.-]/g;function o(e){return r.test(e)?e.replace(n,"\\$&"):e}},20870:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"HeadManagerContext",{enumerable:!0,get:function(){return n}});var n=r(38754)._(r(67294)).default.createContext({})},87861:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{PathParamsContext:function(){return i},PathnameContext:function(){return a},SearchParamsContext:function(){return o}});var n=r(67294),o=(0,n.createContext)(null),a=(0,n.createContext)(null),i=(0,n.createContext)(null)},18899:function(e,t){"use strict";function r(e,t){var r,n=e.split("/");return(t||[]).some(function(t){return!!n[1]&&n[1].toLowerCase()===t.toLowerCase()&&(r=t,n.splice(1,1),e=n.join("/")||"/",!0)}),{pathname:e,detectedLocale:r}}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"normalizeLocalePath",{enumerable:!0,get:function(){return r}})},36769:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"ImageConfigContext",{enumerable:!0,get:function(){return a}});var n=r(38754)._(r(67294)),o=r(92296),a=n.default.createContext(o.imageConfigDefault)},92296:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{VALID_LOADERS:function(){return r},imageConfigDefault:function(){return n}});var r=["default","imgix","cloudinary","akamai","custom"],n={deviceSizes:[640,750,828,1080,1200,1920,2048,3840],imageSizes:[16,32,48,64,96,128,256,384],path:"/_next/image",loader:"default",loaderFile:"",domains:[],disableStaticImages:!1,minimumCacheTTL:60,formats:["image/webp"],dangerouslyAllowSVG:!1,contentSecurityPolicy:"script-src 'none'; frame-src 'none'; sandbox;",contentDispositionType:"inline",remotePatterns:[],unoptimized:!1}},86165:function(e,t){"use strict";function r(e){return Object.prototype.toString.call(e)}function n(e){if("[object Object]"!==r(e))return!1;var t=Object.getPrototypeOf(e);return null===t||t.hasOwnProperty("isPrototypeOf")}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{getObjectClassLabel:function(){return r},isPlainObject:function(){return n}})},92208:function(e,t,r){"use strict";var n=r(16089),o=r(23322),a=r(55667),i=r(81961),u=r(67731),s=r(27033);Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{BailoutToCSRError:function(){return l},isBailoutToCSRError:function(){return f}});var c="BAILOUT_TO_CLIENT_SIDE_RENDERING",l=function(e){a(s,e);var t,r=(t=function(){if("undefined"==typeof Reflect||!Reflect.construct||Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch(e){return!1}}(),function(){var e,r=u(s);return e=t?Reflect.construct(r,arguments,u(this).constructor):r.apply(this,arguments),i(this,e)});function s(e){var t;return o(this,s),(t=r.call(this,"Bail out to client-side rendering: "+e)).reason=e,t.digest=c,t}return n(s)}(s(Error));function f(e){return"object"==typeof e&&null!==e&&"digest"in e&&e.digest===c}},53415:function(e,t){"use strict";function r(){var e=Object.create(null);return{on:function(t,r){(e[t]||(e[t]=[])).push(r)},off:function(t,r){e[t]&&e[t].splice(e[t].indexOf(r)>>>0,1)},emit:function(t){for(var r=arguments.length,n=Array(r>1?r-1:0),o=1;o<r;o++)n[o-1]=arguments[o];(e[t]||[]).slice().map(function(e){e.apply(void 0,n)})}}}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return r}})},34469:function(e){"use strict";e.exports=["chrome 64","edge 79","firefox 67","opera 51","safari 12"]},92803:function(e,t){"use strict";function r(e){var t=(null==e?void 0:e.replace(/^\/+|\/+$/g,""))||!1;if(!t)return"";if(URL.canParse(t)){var r=new URL(t).toString();return r.endsWith("/")?r.slice(0,-1):r}return"/"+t}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"normalizedAssetPrefix",{enumerable:!0,get:function(){return r}})},26089:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"denormalizePagePath",{enumerable:!0,get:function(){return a}});var n=r(1777),o=r(89203);function a(e){var t=(0,o.normalizePathSep)(e);return t.startsWith("/index/")&&!(0,n.isDynamicRoute)(t)?t.slice(6):"/index"!==t?t:"/"}},67806:function(e,t){"use strict";function r(e){return e.startsWith("/")?e:"/"+e}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"ensureLeadingSlash",{enumerable:!0,get:function(){return r}})},89203:function(e,t){"use strict";function r(e){return e.replace(/\\/g,"/")}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"normalizePathSep",{enumerable:!0,get:function(){return r}})},21770:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"RouterContext",{enumerable:!0,get:function(){return n}});var n=r(38754)._(r(67294)).default.createContext(null)},93726:function(e,t,r){"use strict";var n=r(47069),o=["children","router"];Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{PathnameContextProviderAdapter:function(){return v},adaptForAppRouterInstance:function(){return d},adaptForPathParams:function(){return h},adaptForSearchParams:function(){return p}});var a=r(61757),i=r(85893),u=a._(r(67294)),s=r(87861),c=r(1777),l=r(20204),f=r(68710);function d(e){return{back:function(){e.back()},forward:function(){e.forward()},refresh:function(){e.reload()},fastRefresh:function(){},push:function(t,r){var n=(void 0===r?{}:r).scroll;e.push(t,void 0,{scroll:n})},replace:function(t,r){var n=(void 0===r?{}:r).scroll;e.replace(t,void 0,{scroll:n})},prefetch:function(t){e.prefetch(t)}}}function p(e){return e.isReady&&e.query?(0,l.asPathToSearchParams)(e.asPath):new URLSearchParams}function h(e){if(!e.isReady||!e.query)return null;for(var t={},r=Object.keys((0,f.getRouteRegex)(e.pathname).groups),n=0;n<r.length;n++){var o=r[n];t[o]=e.query[o]}return t}function v(e){var t=e.children,r=e.router,a=n(e,o),l=(0,u.useRef)(a.isAutoExport),f=(0,u.useMemo)(function(){var e,t=l.current;if(t&&(l.current=!1),(0,c.isDynamicRoute)(r.pathname)&&(r.isFallback||t&&!r.isReady))return null;try{e=new URL(r.asPath,"http://f")}catch(e){return"/"}return e.pathname},[r.asPath,r.isFallback,r.isReady,r.pathname]);return(0,i.jsx)(s.PathnameContext.Provider,{value:f,children:t})}},79183:function(e,t,r){"use strict";var n=r(64687),o=r(23322),a=r(16089),i=r(20968),u=r(43171),s=r(67752);function c(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}function l(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?c(Object(r),!0).forEach(function(t){i(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):c(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{createKey:function(){return ee},default:function(){return en},matchesMiddleware:function(){return G}});var f=r(38754),d=r(61757),p=r(61105),h=r(19311),v=r(45125),m=d._(r(80676)),y=r(26089),b=r(18899),g=f._(r(53415)),_=r(9642),P=r(43033),x=r(85261),O=f._(r(72431)),E=r(26049),S=r(68710),w=r(92151);r(61139);var j=r(12345),R=r(23443),T=r(22859),M=r(72743),A=r(85439),C=r(55638),I=r(68364),k=r(79423),L=r(24166),N=r(7616),D=r(32560),F=r(25656),B=r(78855),U=r(52395),H=r(6287),q=r(28589);function W(){return Object.assign(Error("Route Cancelled"),{cancelled:!0})}function G(e){return z.apply(this,arguments)}function z(){return(z=s(n.mark(function e(t){var r,o,a,i;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,Promise.resolve(t.router.pageLoader.getMiddleware());case 2:if(r=e.sent){e.next=5;break}return e.abrupt("return",!1);case 5:return o=(0,j.parsePath)(t.asPath).pathname,a=(0,C.hasBasePath)(o)?(0,M.removeBasePath)(o):o,i=(0,A.addBasePath)((0,R.addLocale)(a,t.locale)),e.abrupt("return",r.some(function(e){return new RegExp(e.regexp).test(i)}));case 9:case"end":return e.stop()}},e)}))).apply(this,arguments)}function V(e){var t=(0,_.getLocationOrigin)();return e.startsWith(t)?e.substring(t.length):e}function K(e,t,r){var n=u((0,I.resolveHref)(e,t,!0),2),o=n[0],a=n[1],i=(0,_.getLocationOrigin)(),s=o.startsWith(i),c=a&&a.startsWith(i);o=V(o),a=a?V(a):a;var l=s?o:(0,A.addBasePath)(o),f=r?V((0,I.resolveHref)(e,r)):a||o;return{url:l,as:c?f:(0,A.addBasePath)(f)}}function X(e,t){var r=(0,p.removeTrailingSlash)((0,y.denormalizePagePath)(e));return"/404"===r||"/_error"===r?e:(t.includes(r)||t.some(function(t){if((0,P.isDynamicRoute)(t)&&(0,S.getRouteRegex)(t).re.test(r))return e=t,!0}),(0,p.removeTrailingSlash)(e))}function Y(e){return $.apply(this,arguments)}function $(){return($=s(n.mark(function e(t){var r,o;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,G(t);case 2:if(!(!e.sent||!t.fetchData)){e.next=5;break}return e.abrupt("return",null);case 5:return e.next=7,t.fetchData();case 7:return r=e.sent,e.next=10,function(e,t,r){var n={basePath:r.router.basePath,i18n:{locales:r.router.locales},trailingSlash:!1},o=t.headers.get("x-nextjs-rewrite"),a=o||t.headers.get("x-nextjs-matched-path"),i=t.headers.get("x-matched-path");if(!i||a||i.includes("__next_data_catchall")||i.includes("/_error")||i.includes("/404")||(a=i),a){if(a.startsWith("/")){var s=(0,x.parseRelativeUrl)(a),c=(0,L.getNextPathnameInfo)(s.pathname,{nextConfig:n,parseData:!0}),f=(0,p.removeTrailingSlash)(c.pathname);return Promise.all([r.router.pageLoader.getPageList(),(0,h.getClientBuildManifest)()]).then(function(t){var a=u(t,2),i=a[0];a[1].__rewrites;var l=(0,R.addLocale)(c.pathname,c.locale);if((0,P.isDynamicRoute)(l)||!o&&i.includes((0,b.normalizeLocalePath)((0,M.removeBasePath)(l),r.router.locales).pathname)){var d=(0,L.getNextPathnameInfo)((0,x.parseRelativeUrl)(e).pathname,{nextConfig:n,parseData:!0});l=(0,A.addBasePath)(d.pathname),s.pathname=l}if(!i.includes(f)){var p=X(f,i);p!==f&&(f=p)}var h=i.includes(f)?f:X((0,b.normalizeLocalePath)((0,M.removeBasePath)(s.pathname),r.router.locales).pathname,i);if((0,P.isDynamicRoute)(h)){var v=(0,E.getRouteMatcher)((0,S.getRouteRegex)(h))(l);Object.assign(s.query,v||{})}return{type:"rewrite",parsedAs:s,resolvedHref:h}})}var d=(0,j.parsePath)(e);return Promise.resolve({type:"redirect-external",destination:""+(0,N.formatNextPathnameInfo)(l(l({},(0,L.getNextPathnameInfo)(d.pathname,{nextConfig:n,parseData:!0})),{},{defaultLocale:r.router.defaultLocale,buildId:""}))+d.query+d.hash})}var v=t.headers.get("x-nextjs-redirect");if(v){if(v.startsWith("/")){var m=(0,j.parsePath)(v),y=(0,N.formatNextPathnameInfo)(l(l({},(0,L.getNextPathnameInfo)(m.pathname,{nextConfig:n,parseData:!0})),{},{defaultLocale:r.router.defaultLocale,buildId:""}));return Promise.resolve({type:"redirect-internal",newAs:""+y+m.query+m.hash,newUrl:""+y+m.query+m.hash})}return Promise.resolve({type:"redirect-external",destination:v})}return Promise.resolve({type:"next"})}(r.dataHref,r.response,t);case 10:return o=e.sent,e.abrupt("return",{dataHref:r.dataHref,json:r.json,response:r.response,text:r.text,cacheKey:r.cacheKey,effect:o});case 12:case"end":return e.stop()}},e)}))).apply(this,arguments)}var J=Symbol("SSG_DATA_NOT_FOUND");function Q(e){try{return JSON.parse(e)}catch(e){return null}}function Z(e){var t=e.dataHref,r=e.inflightCache,n=e.isPrefetch,o=e.hasMiddleware,a=e.isServerRender,i=e.parseJSON,u=e.persistCache,s=e.isBackground,c=e.unstable_skipClientCache,l=new URL(t,window.location.href).href,f=function(e){var s;return(function e(t,r,n){return fetch(t,{credentials:"same-origin",method:n.method||"GET",headers:Object.assign({},n.headers,{"x-nextjs-data":"1"})}).then(function(o){return!o.ok&&r>1&&o.status>=500?e(t,r-1,n):o})})(t,a?3:1,{headers:Object.assign({},n?{purpose:"prefetch"}:{},n&&o?{"x-middleware-prefetch":"1"}:{}),method:null!=(s=null==e?void 0:e.method)?s:"GET"}).then(function(r){return r.ok&&(null==e?void 0:e.method)==="HEAD"?{dataHref:t,response:r,text:"",json:{},cacheKey:l}:r.text().then(function(e){if(!r.ok){if(o&&[301,302,307,308].includes(r.status))return{dataHref:t,response:r,text:e,json:{},cacheKey:l};if(404===r.status){var n;if(null==(n=Q(e))?void 0:n.notFound)return{dataHref:t,json:{notFound:J},response:r,text:e,cacheKey:l}}var u=Error("Failed to load static props");throw a||(0,h.markAssetError)(u),u}return{dataHref:t,json:i?Q(e):null,response:r,text:e,cacheKey:l}})}).then(function(e){return u&&"no-cache"!==e.response.headers.get("x-middleware-cache")||delete r[l],e}).catch(function(e){throw c||delete r[l],("Failed to fetch"===e.message||"NetworkError when attempting to fetch resource."===e.message||"Load failed"===e.message)&&(0,h.markAssetError)(e),e})};return c&&u?f({}).then(function(e){return"no-cache"!==e.response.headers.get("x-middleware-cache")&&(r[l]=Promise.resolve(e)),e}):void 0!==r[l]?r[l]:r[l]=f(s?{method:"HEAD"}:{})}function ee(){return Math.random().toString(36).slice(2,10)}function et(e){var t=e.url,r=e.router;if(t===(0,A.addBasePath)((0,R.addLocale)(r.asPath,r.locale)))throw Error("Invariant: attempted to hard navigate to the same URL "+t+" "+location.href);window.location.href=t}var er=function(e){var t=e.route,r=e.router,n=!1,o=r.clc=function(){n=!0};return function(){if(n){var e=Error('Abort fetching component for route: "'+t+'"');throw e.cancelled=!0,e}o===r.clc&&(r.clc=null)}},en=function(){var e,t,i,c,f,d;function y(e,t,n,a){var i=this,u=a.initialProps,s=a.pageLoader,c=a.App,l=a.wrapApp,f=a.Component,d=a.err,h=a.subscription,v=a.isFallback,m=a.locale,b=(a.locales,a.defaultLocale,a.domainLocales,a.isPreview);o(this,y),this.sdc={},this.sbc={},this.isFirstPopStateEvent=!0,this._key=ee(),this.onPopState=function(e){var t,r=i.isFirstPopStateEvent;i.isFirstPopStateEvent=!1;var n=e.state;if(!n){var o=i.pathname,a=i.query;i.changeState("replaceState",(0,w.formatWithValidation)({pathname:(0,A.addBasePath)(o),query:a}),(0,_.getURL)());return}if(n.__NA){window.location.reload();return}if(n.__N&&(!r||i.locale!==n.options.locale||n.as!==i.asPath)){var u=n.url,s=n.as,c=n.options,l=n.key;i._key=l;var f=(0,x.parseRelativeUrl)(u).pathname;(!i.isSsr||s!==(0,A.addBasePath)(i.asPath)||f!==(0,A.addBasePath)(i.pathname))&&(!i._bps||i._bps(n))&&i.change("replaceState",u,s,Object.assign({},c,{shallow:c.shallow&&i._shallow,locale:c.locale||i.defaultLocale,_h:0}),t)}};var g=(0,p.removeTrailingSlash)(e);this.components={},"/_error"!==e&&(this.components[g]={Component:f,initial:!0,props:u,err:d,__N_SSG:u&&u.__N_SSG,__N_SSP:u&&u.__N_SSP}),this.components["/_app"]={Component:c,styleSheets:[]};var O=r(1703).BloomFilter,E={numItems:0,errorRate:1e-4,numBits:0,numHashes:null,bitArray:[]},S={numItems:0,errorRate:1e-4,numBits:0,numHashes:null,bitArray:[]};(null==E?void 0:E.numHashes)&&(this._bfl_s=new O(E.numItems,E.errorRate),this._bfl_s.import(E)),(null==S?void 0:S.numHashes)&&(this._bfl_d=new O(S.numItems,S.errorRate),this._bfl_d.import(S)),this.events=y.events,this.pageLoader=s;var j=(0,P.isDynamicRoute)(e)&&self.__NEXT_DATA__.autoExport;if(this.basePath="/nvflare-dashboard",this.sub=h,this.clc=null,this._wrapApp=l,this.isSsr=!0,this.isLocaleDomain=!1,this.isReady=!!(self.__NEXT_DATA__.gssp||self.__NEXT_DATA__.gip||self.__NEXT_DATA__.isExperimentalCompile||self.__NEXT_DATA__.appGip&&!self.__NEXT_DATA__.gsp||!j&&!self.location.search),this.state={route:g,pathname:e,query:t,asPath:j?e:n,isPreview:!!b,locale:void 0,isFallback:v},this._initialMatchesMiddlewarePromise=Promise.resolve(!1),!n.startsWith("//")){var R={locale:m},T=(0,_.getURL)();this._initialMatchesMiddlewarePromise=G({router:this,locale:m,asPath:T}).then(function(r){return R._shouldResolveHref=n!==e,i.changeState("replaceState",r?T:(0,w.formatWithValidation)({pathname:(0,A.addBasePath)(e),query:t}),T,R),r})}window.addEventListener("popstate",this.onPopState)}return a(y,[{key:"reload",value:function(){window.location.reload()}},{key:"back",value:function(){window.history.back()}},{key:"forward",value:function(){window.history.forward()}},{key:"push",value:function(e,t,r){void 0===r&&(r={});var n=K(this,e,t);return e=n.url,t=n.as,this.change("pushState",e,t,r)}},{key:"replace",value:function(e,t,r){void 0===r&&(r={});var n=K(this,e,t);return e=n.url,t=n.as,this.change("replaceState",e,t,r)}},{key:"_bfl",value:(e=s(n.mark(function e(t,r,o,a){var i,u,s,c,l,f,d,h,v,m,y,b,g,_,P;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:i=!1,u=!1,s=0,c=[t,r];case 4:if(!(s<c.length)){e.next=35;break}if(!(l=c[s])||(f=(0,p.removeTrailingSlash)(new URL(l,"http://n").pathname),d=(0,A.addBasePath)((0,R.addLocale)(f,o||this.locale)),!(f!==(0,p.removeTrailingSlash)(new URL(this.asPath,"http://n").pathname)))){e.next=32;break}i=i||!!(null==(h=this._bfl_s)?void 0:h.contains(f))||!!(null==(v=this._bfl_s)?void 0:v.contains(d)),m=0,y=[f,d];case 12:if(!(m<y.length)){e.next=27;break}b=y[m].split("/"),g=0;case 16:if(!(!u&&g<b.length+1)){e.next=24;break}if(!((P=b.slice(0,g).join("/"))&&(null==(_=this._bfl_d)?void 0:_.contains(P)))){e.next=21;break}return u=!0,e.abrupt("break",24);case 21:g++,e.next=16;break;case 24:m++,e.next=12;break;case 27:if(!(i||u)){e.next=32;break}if(!a){e.next=30;break}return e.abrupt("return",!0);case 30:return et({url:(0,A.addBasePath)((0,R.addLocale)(t,o||this.locale,this.defaultLocale)),router:this}),e.abrupt("return",new Promise(function(){}));case 32:s++,e.next=4;break;case 35:return e.abrupt("return",!1);case 36:case"end":return e.stop()}},e,this)})),function(t,r,n,o){return e.apply(this,arguments)})},{key:"change",value:(t=s(n.mark(function e(t,r,o,a,i){var s,c,f,d,b,g,O,I,k,L,N,B,q,z,V,Y,$,Q,Z,ee,er,en,eo,ea,ei,eu,es,ec,el,ef,ed,ep,eh,ev,em,ey,eb,eg,e_,eP,ex,eO,eE,eS,ew,ej,eR,eT,eM,eA,eC,eI,ek,eL,eN,eD,eF,eB,eU;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:if((0,F.isLocalURL)(r)){e.next=3;break}return et({url:r,router:this}),e.abrupt("return",!1);case 3:if(!(!(c=1===a._h)&&!a.shallow)){e.next=7;break}return e.next=7,this._bfl(o,void 0,a.locale);case 7:if(f=c||a._shouldResolveHref||(0,j.parsePath)(r).pathname===(0,j.parsePath)(o).pathname,d=l({},this.state),b=!0!==this.isReady,this.isReady=!0,g=this.isSsr,c||(this.isSsr=!1),!(c&&this.clc)){e.next=15;break}return e.abrupt("return",!1);case 15:O=d.locale,e.next=28;break;case 28:if(_.ST&&performance.mark("routeChange"),k=void 0!==(I=a.shallow)&&I,N=void 0===(L=a.scroll)||L,B={shallow:k},this._inFlightRoute&&this.clc&&(g||y.events.emit("routeChangeError",W(),this._inFlightRoute,B),this.clc(),this.clc=null),o=(0,A.addBasePath)((0,R.addLocale)((0,C.hasBasePath)(o)?(0,M.removeBasePath)(o):o,a.locale,this.defaultLocale)),q=(0,T.removeLocale)((0,C.hasBasePath)(o)?(0,M.removeBasePath)(o):o,d.locale),this._inFlightRoute=o,z=O!==d.locale,!(!c&&this.onlyAHashChange(q)&&!z)){e.next=52;break}return d.asPath=q,y.events.emit("hashChangeStart",o,B),this.changeState(t,r,o,l(l({},a),{},{scroll:!1})),N&&this.scrollToHash(q),e.prev=41,e.next=44,this.set(d,this.components[d.route],null);case 44:e.next=50;break;case 46:throw e.prev=46,e.t0=e.catch(41),(0,m.default)(e.t0)&&e.t0.cancelled&&y.events.emit("routeChangeError",e.t0,q,B),e.t0;case 50:return y.events.emit("hashChangeComplete",o,B),e.abrupt("return",!0);case 52:return Y=(V=(0,x.parseRelativeUrl)(r)).pathname,$=V.query,e.prev=54,e.next=57,Promise.all([this.pageLoader.getPageList(),(0,h.getClientBuildManifest)(),this.pageLoader.getMiddleware()]);case 57:Q=(Z=u(e.sent,2))[0],Z[1].__rewrites,e.next=67;break;case 63:return e.prev=63,e.t1=e.catch(54),et({url:o,router:this}),e.abrupt("return",!1);case 67:if(this.urlIsNew(q)||z||(t="replaceState"),ee=o,Y=Y?(0,p.removeTrailingSlash)((0,M.removeBasePath)(Y)):Y,er=(0,p.removeTrailingSlash)(Y),en=o.startsWith("/")&&(0,x.parseRelativeUrl)(o).pathname,!(null==(s=this.components[Y])?void 0:s.__appRouter)){e.next=75;break}return et({url:o,router:this}),e.abrupt("return",new Promise(function(){}));case 75:if(eo=!!(en&&er!==en&&(!(0,P.isDynamicRoute)(er)||!(0,E.getRouteMatcher)((0,S.getRouteRegex)(er))(en))),e.t2=!a.shallow,!e.t2){e.next=81;break}return e.next=80,G({asPath:o,locale:d.locale,router:this});case 80:e.t2=e.sent;case 81:if(ea=e.t2,c&&ea&&(f=!1),!(f&&"/_error"!==Y)){e.next=96;break}a._shouldResolveHref=!0,e.next=94;break;case 90:ea||(ee=ei.asPath),ei.matchedPage&&ei.resolvedHref&&(Y=ei.resolvedHref,V.pathname=(0,A.addBasePath)(Y),ea||(r=(0,w.formatWithValidation)(V))),e.next=96;break;case 94:V.pathname=X(Y,Q),V.pathname===Y||(Y=V.pathname,V.pathname=(0,A.addBasePath)(Y),ea||(r=(0,w.formatWithValidation)(V)));case 96:if((0,F.isLocalURL)(o)){e.next=101;break}e.next=99;break;case 99:return et({url:o,router:this}),e.abrupt("return",!1);case 101:if(ee=(0,T.removeLocale)((0,M.removeBasePath)(ee),d.locale),er=(0,p.removeTrailingSlash)(Y),eu=!1,!(0,P.isDynamicRoute)(er)){e.next=119;break}if(ec=(es=(0,x.parseRelativeUrl)(ee)).pathname,el=(0,S.getRouteRegex)(er),eu=(0,E.getRouteMatcher)(el)(ec),ed=(ef=er===ec)?(0,H.interpolateAs)(er,ec,$):{},!(!eu||ef&&!ed.result)){e.next=118;break}if(!((ep=Object.keys(el.groups).filter(function(e){return!$[e]&&!el.groups[e].optional})).length>0&&!ea)){e.next=116;break}throw Error((ef?"The provided `href` ("+r+") value is missing query values ("+ep.join(", ")+") to be interpolated properly. ":"The provided `as` value ("+ec+") is incompatible with the `href` value ("+er+"). ")+"Read more: https://nextjs.org/docs/messages/"+(ef?"href-interpolation-failed":"incompatible-href-as"));case 116:e.next=119;break;case 118:ef?o=(0,w.formatWithValidation)(Object.assign({},es,{pathname:ed.result,query:(0,U.omit)($,ed.params)})):Object.assign($,eu);case 119:return c||y.events.emit("routeChangeStart",o,B),eh="/404"===this.pathname||"/_error"===this.pathname,e.prev=121,e.next=124,this.getRouteInfo({route:er,pathname:Y,query:$,as:o,resolvedAs:ee,routeProps:B,locale:d.locale,isPreview:d.isPreview,hasMiddleware:ea,unstable_skipClientCache:a.unstable_skipClientCache,isQueryUpdating:c&&!this.isFallback,isMiddlewareRewrite:eo});case 124:if(eb=e.sent,!(!c&&!a.shallow)){e.next=128;break}return e.next=128,this._bfl(o,"resolvedAs"in eb?eb.resolvedAs:void 0,d.locale);case 128:if("route"in eb&&ea&&(er=Y=eb.route||er,B.shallow||($=Object.assign({},eb.query||{},$)),eg=(0,C.hasBasePath)(V.pathname)?(0,M.removeBasePath)(V.pathname):V.pathname,eu&&Y!==eg&&Object.keys(eu).forEach(function(e){eu&&$[e]===eu[e]&&delete $[e]}),(0,P.isDynamicRoute)(Y))&&(e_=!B.shallow&&eb.resolvedAs?eb.resolvedAs:(0,A.addBasePath)((0,R.addLocale)(new URL(o,location.href).pathname,d.locale),!0),(0,C.hasBasePath)(e_)&&(e_=(0,M.removeBasePath)(e_)),eP=(0,S.getRouteRegex)(Y),(ex=(0,E.getRouteMatcher)(eP)(new URL(e_,location.href).pathname))&&Object.assign($,ex)),!("type"in eb)){e.next=136;break}if("redirect-internal"!==eb.type){e.next=134;break}return e.abrupt("return",this.change(t,eb.newUrl,eb.newAs,a));case 134:return et({url:eb.destination,router:this}),e.abrupt("return",new Promise(function(){}));case 136:if((eO=eb.Component)&&eO.unstable_scriptLoader&&[].concat(eO.unstable_scriptLoader()).forEach(function(e){(0,v.handleClientScriptLoad)(e.props)}),!((eb.__N_SSG||eb.__N_SSP)&&eb.props)){e.next=165;break}if(!(eb.props.pageProps&&eb.props.pageProps.__N_REDIRECT)){e.next=149;break}if(a.locale=!1,!((eE=eb.props.pageProps.__N_REDIRECT).startsWith("/")&&!1!==eb.props.pageProps.__N_REDIRECT_BASE_PATH)){e.next=147;break}return(eS=(0,x.parseRelativeUrl)(eE)).pathname=X(eS.pathname,Q),ej=(ew=K(this,eE,eE)).url,eR=ew.as,e.abrupt("return",this.change(t,ej,eR,a));case 147:return et({url:eE,router:this}),e.abrupt("return",new Promise(function(){}));case 149:if(d.isPreview=!!eb.props.__N_PREVIEW,eb.props.notFound!==J){e.next=165;break}return e.prev=151,e.next=154,this.fetchComponent("/404");case 154:eT="/404",e.next=160;break;case 157:e.prev=157,e.t3=e.catch(151),eT="/_error";case 160:return e.next=162,this.getRouteInfo({route:eT,pathname:eT,query:$,as:o,resolvedAs:ee,routeProps:{shallow:!1},locale:d.locale,isPreview:d.isPreview,isNotFound:!0});case 162:if(!("type"in(eb=e.sent))){e.next=165;break}throw Error("Unexpected middleware effect on /404");case 165:if(c&&"/_error"===this.pathname&&(null==(em=self.__NEXT_DATA__.props)?void 0:null==(ev=em.pageProps)?void 0:ev.statusCode)===500&&(null==(ey=eb.props)?void 0:ey.pageProps)&&(eb.props.pageProps.statusCode=500),eA=a.shallow&&d.route===(null!=(eM=eb.route)?eM:er),ek=(eI=null!=(eC=a.scroll)?eC:!c&&!eA)?{x:0,y:0}:null,eL=null!=i?i:ek,eN=l(l({},d),{},{route:er,pathname:Y,query:$,asPath:q,isFallback:!1}),!(c&&eh)){e.next=188;break}return e.next=174,this.getRouteInfo({route:this.pathname,pathname:this.pathname,query:$,as:o,resolvedAs:ee,routeProps:{shallow:!1},locale:d.locale,isPreview:d.isPreview,isQueryUpdating:c&&!this.isFallback});case 174:if(!("type"in(eb=e.sent))){e.next=177;break}throw Error("Unexpected middleware effect on "+this.pathname);case 177:return"/_error"===this.pathname&&(null==(eF=self.__NEXT_DATA__.props)?void 0:null==(eD=eF.pageProps)?void 0:eD.statusCode)===500&&(null==(eB=eb.props)?void 0:eB.pageProps)&&(eb.props.pageProps.statusCode=500),e.prev=178,e.next=181,this.set(eN,eb,eL);case 181:e.next=187;break;case 183:throw e.prev=183,e.t4=e.catch(178),(0,m.default)(e.t4)&&e.t4.cancelled&&y.events.emit("routeChangeError",e.t4,q,B),e.t4;case 187:return e.abrupt("return",!0);case 188:if(y.events.emit("beforeHistoryChange",o,B),this.changeState(t,r,o,a),c&&!eL&&!b&&!z&&(0,D.compareRouterStates)(eN,this.state)){e.next=211;break}return e.prev=192,e.next=195,this.set(eN,eb,eL);case 195:e.next=204;break;case 197:if(e.prev=197,e.t5=e.catch(192),!e.t5.cancelled){e.next=203;break}eb.error=eb.error||e.t5,e.next=204;break;case 203:throw e.t5;case 204:if(!eb.error){e.next=207;break}throw c||y.events.emit("routeChangeError",eb.error,q,B),eb.error;case 207:c||y.events.emit("routeChangeComplete",o,B),eU=/#.+$/,eI&&eU.test(o)&&this.scrollToHash(o);case 211:return e.abrupt("return",!0);case 214:if(e.prev=214,e.t6=e.catch(121),!((0,m.default)(e.t6)&&e.t6.cancelled)){e.next=218;break}return e.abrupt("return",!1);case 218:throw e.t6;case 219:case"end":return e.stop()}},e,this,[[41,46],[54,63],[121,214],[151,157],[178,183],[192,197]])})),function(e,r,n,o,a){return t.apply(this,arguments)})},{key:"changeState",value:function(e,t,r,n){void 0===n&&(n={}),("pushState"!==e||(0,_.getURL)()!==r)&&(this._shallow=n.shallow,window.history[e]({url:t,as:r,options:n,__N:!0,key:this._key="pushState"!==e?this._key:ee()},"",r))}},{key:"handleRouteInfoError",value:(i=s(n.mark(function e(t,r,o,a,i,u){var s,c,l,f;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:if(console.error(t),!t.cancelled){e.next=3;break}throw t;case 3:if(!((0,h.isAssetError)(t)||u)){e.next=7;break}throw y.events.emit("routeChangeError",t,a,i),et({url:a,router:this}),W();case 7:return e.prev=7,e.next=10,this.fetchComponent("/_error");case 10:if((f={props:s,Component:l=(c=e.sent).page,styleSheets:c.styleSheets,err:t,error:t}).props){e.next=25;break}return e.prev=15,e.next=18,this.getInitialProps(l,{err:t,pathname:r,query:o});case 18:f.props=e.sent,e.next=25;break;case 21:e.prev=21,e.t0=e.catch(15),console.error("Error in error page `getInitialProps`: ",e.t0),f.props={};case 25:return e.abrupt("return",f);case 28:return e.prev=28,e.t1=e.catch(7),e.abrupt("return",this.handleRouteInfoError((0,m.default)(e.t1)?e.t1:Error(e.t1+""),r,o,a,i,!0));case 31:case"end":return e.stop()}},e,this,[[7,28],[15,21]])})),function(e,t,r,n,o,a){return i.apply(this,arguments)})},{key:"getRouteInfo",value:(c=s(n.mark(function e(t){var r,o,a,i,u,c,f,d,h,v,y,g,_,P,x,O,E,S,j,R,T,A,C,I,L,N,D,F,B,U,H,q,W=this;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:if(r=t.route,o=t.pathname,a=t.query,i=t.as,u=t.resolvedAs,c=t.routeProps,f=t.locale,d=t.hasMiddleware,h=t.isPreview,v=t.unstable_skipClientCache,y=t.isQueryUpdating,g=t.isMiddlewareRewrite,_=t.isNotFound,P=r,e.prev=2,j=this.components[P],!(c.shallow&&j&&this.route===P)){e.next=6;break}return e.abrupt("return",j);case 6:if(R=er({route:P,router:this}),d&&(j=void 0),T=!j||"initial"in j?void 0:j,A=y,C={dataHref:this.pageLoader.getDataHref({href:(0,w.formatWithValidation)({pathname:o,query:a}),skipInterpolation:!0,asPath:_?"/404":u,locale:f}),hasMiddleware:!0,isServerRender:this.isSsr,parseJSON:!0,inflightCache:A?this.sbc:this.sdc,persistCache:!h,isPrefetch:!1,unstable_skipClientCache:v,isBackground:A},!(y&&!g)){e.next=15;break}e.t0=null,e.next=18;break;case 15:return e.next=17,Y({fetchData:function(){return Z(C)},asPath:_?"/404":u,locale:f,router:this}).catch(function(e){if(y)return null;throw e});case 17:e.t0=e.sent;case 18:if((I=e.t0)&&("/_error"===o||"/404"===o)&&(I.effect=void 0),y&&(I?I.json=self.__NEXT_DATA__.props:I={json:self.__NEXT_DATA__.props}),R(),!((null==I?void 0:null==(x=I.effect)?void 0:x.type)==="redirect-internal"||(null==I?void 0:null==(O=I.effect)?void 0:O.type)==="redirect-external")){e.next=24;break}return e.abrupt("return",I.effect);case 24:if((null==I?void 0:null==(E=I.effect)?void 0:E.type)!=="rewrite"){e.next=37;break}return L=(0,p.removeTrailingSlash)(I.effect.resolvedHref),e.next=28,this.pageLoader.getPageList();case 28:if(N=e.sent,!(!y||N.includes(L))||(P=L,o=I.effect.resolvedHref,a=l(l({},a),I.effect.parsedAs.query),u=(0,M.removeBasePath)((0,b.normalizeLocalePath)(I.effect.parsedAs.pathname,this.locales).pathname),j=this.components[P],!(c.shallow&&j&&this.route===P&&!d))){e.next=37;break}return e.abrupt("return",l(l({},j),{},{route:P}));case 37:if(!(0,k.isAPIRoute)(P)){e.next=40;break}return et({url:i,router:this}),e.abrupt("return",new Promise(function(){}));case 40:if(e.t1=T,e.t1){e.next=45;break}return e.next=44,this.fetchComponent(P).then(function(e){return{Component:e.page,styleSheets:e.styleSheets,__N_SSG:e.mod.__N_SSG,__N_SSP:e.mod.__N_SSP}});case 44:e.t1=e.sent;case 45:D=e.t1,e.next=50;break;case 50:return F=null==I?void 0:null==(S=I.response)?void 0:S.headers.get("x-middleware-skip"),B=D.__N_SSG||D.__N_SSP,F&&(null==I?void 0:I.dataHref)&&delete this.sdc[I.dataHref],e.next=55,this._getData(s(n.mark(function e(){var t,r;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:if(!B){e.next=8;break}if(!((null==I?void 0:I.json)&&!F)){e.next=3;break}return e.abrupt("return",{cacheKey:I.cacheKey,props:I.json});case 3:return t=(null==I?void 0:I.dataHref)?I.dataHref:W.pageLoader.getDataHref({href:(0,w.formatWithValidation)({pathname:o,query:a}),asPath:u,locale:f}),e.next=6,Z({dataHref:t,isServerRender:W.isSsr,parseJSON:!0,inflightCache:F?{}:W.sdc,persistCache:!h,isPrefetch:!1,unstable_skipClientCache:v});case 6:return r=e.sent,e.abrupt("return",{cacheKey:r.cacheKey,props:r.json||{}});case 8:return e.t0={},e.next=11,W.getInitialProps(D.Component,{pathname:o,query:a,asPath:i,locale:f,locales:W.locales,defaultLocale:W.defaultLocale});case 11:return e.t1=e.sent,e.abrupt("return",{headers:e.t0,props:e.t1});case 13:case"end":return e.stop()}},e)})));case 55:return H=(U=e.sent).props,q=U.cacheKey,D.__N_SSP&&C.dataHref&&q&&delete this.sdc[q],this.isPreview||!D.__N_SSG||y||Z(Object.assign({},C,{isBackground:!0,persistCache:!1,inflightCache:this.sbc})).catch(function(){}),H.pageProps=Object.assign({},H.pageProps),D.props=H,D.route=P,D.query=a,D.resolvedAs=u,this.components[P]=D,e.abrupt("return",D);case 69:return e.prev=69,e.t2=e.catch(2),e.abrupt("return",this.handleRouteInfoError((0,m.getProperError)(e.t2),o,a,i,c));case 72:case"end":return e.stop()}},e,this,[[2,69]])})),function(e){return c.apply(this,arguments)})},{key:"set",value:function(e,t,r){return this.state=e,this.sub(t,this.components["/_app"].Component,r)}},{key:"beforePopState",value:function(e){this._bps=e}},{key:"onlyAHashChange",value:function(e){if(!this.asPath)return!1;var t=u(this.asPath.split("#",2),2),r=t[0],n=t[1],o=u(e.split("#",2),2),a=o[0],i=o[1];return!!i&&r===a&&n===i||r===a&&n!==i}},{key:"scrollToHash",value:function(e){var t=u(e.split("#",2),2)[1],r=void 0===t?"":t;(0,q.handleSmoothScroll)(function(){if(""===r||"top"===r){window.scrollTo(0,0);return}var e=decodeURIComponent(r),t=document.getElementById(e);if(t){t.scrollIntoView();return}var n=document.getElementsByName(e)[0];n&&n.scrollIntoView()},{onlyHashChange:this.onlyAHashChange(e)})}},{key:"urlIsNew",value:function(e){return this.asPath!==e}},{key:"prefetch",value:(f=s(n.mark(function e(t,r,o){var a,i,u,s,c,f,d,h,v,m,y,b,g,_=this;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:void 0===r&&(r=t),void 0===o&&(o={}),e.next=4;break;case 4:if(!(0,B.isBot)(window.navigator.userAgent)){e.next=6;break}return e.abrupt("return");case 6:return i=(a=(0,x.parseRelativeUrl)(t)).pathname,u=a.pathname,s=a.query,c=u,e.next=13,this.pageLoader.getPageList();case 13:return f=e.sent,d=r,h=void 0!==o.locale?o.locale||void 0:this.locale,e.next=18,G({asPath:r,locale:h,router:this});case 18:v=e.sent,e.next=29;break;case 22:if(m=e.sent.__rewrites,!(y=(0,O.default)((0,A.addBasePath)((0,R.addLocale)(r,this.locale),!0),f,m,a.query,function(e){return X(e,f)},this.locales)).externalDest){e.next=27;break}return e.abrupt("return");case 27:v||(d=(0,T.removeLocale)((0,M.removeBasePath)(y.asPath),this.locale)),y.matchedPage&&y.resolvedHref&&(u=y.resolvedHref,a.pathname=u,v||(t=(0,w.formatWithValidation)(a)));case 29:a.pathname=X(a.pathname,f),(0,P.isDynamicRoute)(a.pathname)&&(u=a.pathname,a.pathname=u,Object.assign(s,(0,E.getRouteMatcher)((0,S.getRouteRegex)(a.pathname))((0,j.parsePath)(r).pathname)||{}),v||(t=(0,w.formatWithValidation)(a))),e.next=35;break;case 35:return e.next=37,Y({fetchData:function(){return Z({dataHref:_.pageLoader.getDataHref({href:(0,w.formatWithValidation)({pathname:c,query:s}),skipInterpolation:!0,asPath:d,locale:h}),hasMiddleware:!0,isServerRender:!1,parseJSON:!0,inflightCache:_.sdc,persistCache:!_.isPreview,isPrefetch:!0})},asPath:r,locale:h,router:this});case 37:e.t0=e.sent;case 38:if((null==(b=e.t0)?void 0:b.effect.type)==="rewrite"&&(a.pathname=b.effect.resolvedHref,u=b.effect.resolvedHref,s=l(l({},s),b.effect.parsedAs.query),d=b.effect.parsedAs.pathname,t=(0,w.formatWithValidation)(a)),(null==b?void 0:b.effect.type)!=="redirect-external"){e.next=42;break}return e.abrupt("return");case 42:return g=(0,p.removeTrailingSlash)(u),e.next=45,this._bfl(r,d,o.locale,!0);case 45:if(!e.sent){e.next=47;break}this.components[i]={__appRouter:!0};case 47:return e.next=49,Promise.all([this.pageLoader._isSsg(g).then(function(e){return!!e&&Z({dataHref:(null==b?void 0:b.json)?null==b?void 0:b.dataHref:_.pageLoader.getDataHref({href:t,asPath:d,locale:h}),isServerRender:!1,parseJSON:!0,inflightCache:_.sdc,persistCache:!_.isPreview,isPrefetch:!0,unstable_skipClientCache:o.unstable_skipClientCache||o.priority&&!0}).then(function(){return!1}).catch(function(){return!1})}),this.pageLoader[o.priority?"loadPage":"prefetch"](g)]);case 49:case"end":return e.stop()}},e,this)})),function(e,t,r){return f.apply(this,arguments)})},{key:"fetchComponent",value:(d=s(n.mark(function e(t){var r,o;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:return r=er({route:t,router:this}),e.prev=1,e.next=4,this.pageLoader.loadPage(t);case 4:return o=e.sent,r(),e.abrupt("return",o);case 9:throw e.prev=9,e.t0=e.catch(1),r(),e.t0;case 13:case"end":return e.stop()}},e,this,[[1,9]])})),function(e){return d.apply(this,arguments)})},{key:"_getData",value:function(e){var t=this,r=!1,n=function(){r=!0};return this.clc=n,e().then(function(e){if(n===t.clc&&(t.clc=null),r){var o=Error("Loading initial props cancelled");throw o.cancelled=!0,o}return e})}},{key:"_getFlightData",value:function(e){return Z({dataHref:e,isServerRender:!0,parseJSON:!1,inflightCache:this.sdc,persistCache:!1,isPrefetch:!1}).then(function(e){return{data:e.text}})}},{key:"getInitialProps",value:function(e,t){var r=this.components["/_app"].Component,n=this._wrapApp(r);return t.AppTree=n,(0,_.loadGetInitialProps)(r,{AppTree:n,Component:e,router:this,ctx:t})}},{key:"route",get:function(){return this.state.route}},{key:"pathname",get:function(){return this.state.pathname}},{key:"query",get:function(){return this.state.query}},{key:"asPath",get:function(){return this.state.asPath}},{key:"locale",get:function(){return this.state.locale}},{key:"isFallback",get:function(){return this.state.isFallback}},{key:"isPreview",get:function(){return this.state.isPreview}}]),y}();en.events=(0,g.default)()},25940:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"addLocale",{enumerable:!0,get:function(){return a}});var n=r(26405),o=r(69360);function a(e,t,r,a){if(!t||t===r)return e;var i=e.toLowerCase();return!a&&((0,o.pathHasPrefix)(i,"/api")||(0,o.pathHasPrefix)(i,"/"+t.toLowerCase()))?e:(0,n.addPathPrefix)(e,"/"+t)}},26405:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"addPathPrefix",{enumerable:!0,get:function(){return o}});var n=r(12345);function o(e,t){if(!e.startsWith("/")||!t)return e;var r=(0,n.parsePath)(e);return""+t+r.pathname+r.query+r.hash}},53563:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"addPathSuffix",{enumerable:!0,get:function(){return o}});var n=r(12345);function o(e,t){if(!e.startsWith("/")||!t)return e;var r=(0,n.parsePath)(e);return""+r.pathname+t+r.query+r.hash}},76346:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{normalizeAppPath:function(){return a},normalizeRscURL:function(){return i}});var n=r(67806),o=r(74051);function a(e){return(0,n.ensureLeadingSlash)(e.split("/").reduce(function(e,t,r,n){return!t||(0,o.isGroupSegment)(t)||"@"===t[0]||("page"===t||"route"===t)&&r===n.length-1?e:e+"/"+t},""))}function i(e){return e.replace(/\.rsc($|\?)/,"$1")}},20204:function(e,t){"use strict";function r(e){return new URL(e,"http://n").searchParams}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"asPathToSearchParams",{enumerable:!0,get:function(){return r}})},32560:function(e,t){"use strict";function r(e,t){var r=Object.keys(e);if(r.length!==Object.keys(t).length)return!1;for(var n=r.length;n--;){var o=r[n];if("query"===o){var a=Object.keys(e.query);if(a.length!==Object.keys(t.query).length)return!1;for(var i=a.length;i--;){var u=a[i];if(!t.query.hasOwnProperty(u)||e.query[u]!==t.query[u])return!1}}else if(!t.hasOwnProperty(o)||e[o]!==t[o])return!1}return!0}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"compareRouterStates",{enumerable:!0,get:function(){return r}})},7616:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"formatNextPathnameInfo",{enumerable:!0,get:function(){return u}});var n=r(61105),o=r(26405),a=r(53563),i=r(25940);function u(e){var t=(0,i.addLocale)(e.pathname,e.locale,e.buildId?void 0:e.defaultLocale,e.ignorePrefix);return(e.buildId||!e.trailingSlash)&&(t=(0,n.removeTrailingSlash)(t)),e.buildId&&(t=(0,a.addPathSuffix)((0,o.addPathPrefix)(t,"/_next/data/"+e.buildId),"/"===e.pathname?"index.json":".json")),t=(0,o.addPathPrefix)(t,e.basePath),!e.buildId&&e.trailingSlash?t.endsWith("/")?t:(0,a.addPathSuffix)(t,"/"):(0,n.removeTrailingSlash)(t)}},92151:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{formatUrl:function(){return a},formatWithValidation:function(){return u},urlObjectKeys:function(){return i}});var n=r(61757)._(r(75606)),o=/https?|ftp|gopher|file/;function a(e){var t=e.auth,r=e.hostname,a=e.protocol||"",i=e.pathname||"",u=e.hash||"",s=e.query||"",c=!1;t=t?encodeURIComponent(t).replace(/%3A/i,":")+"@":"",e.host?c=t+e.host:r&&(c=t+(~r.indexOf(":")?"["+r+"]":r),e.port&&(c+=":"+e.port)),s&&"object"==typeof s&&(s=String(n.urlQueryToSearchParams(s)));var l=e.search||s&&"?"+s||"";return a&&!a.endsWith(":")&&(a+=":"),e.slashes||(!a||o.test(a))&&!1!==c?(c="//"+(c||""),i&&"/"!==i[0]&&(i="/"+i)):c||(c=""),u&&"#"!==u[0]&&(u="#"+u),l&&"?"!==l[0]&&(l="?"+l),""+a+c+(i=i.replace(/[?#]/g,encodeURIComponent))+(l=l.replace("#","%23"))+u}var i=["auth","hash","host","hostname","href","path","pathname","port","protocol","query","search","slashes"];function u(e){return a(e)}},98389:function(e,t){"use strict";function r(e,t){return void 0===t&&(t=""),("/"===e?"/index":/^\/index(\/|$)/.test(e)?"/index"+e:e)+t}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return r}})},24166:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"getNextPathnameInfo",{enumerable:!0,get:function(){return i}});var n=r(18899),o=r(69580),a=r(69360);function i(e,t){var r=null!=(p=t.nextConfig)?p:{},i=r.basePath,u=r.i18n,s=r.trailingSlash,c={pathname:e,trailingSlash:"/"!==e?e.endsWith("/"):s};i&&(0,a.pathHasPrefix)(c.pathname,i)&&(c.pathname=(0,o.removePathPrefix)(c.pathname,i),c.basePath=i);var l=c.pathname;if(c.pathname.startsWith("/_next/data/")&&c.pathname.endsWith(".json")){var f=c.pathname.replace(/^\/_next\/data\//,"").replace(/\.json$/,"").split("/"),d=f[0];c.buildId=d,l="index"!==f[1]?"/"+f.slice(1).join("/"):"/",!0===t.parseData&&(c.pathname=l)}if(u){var p,h,v=t.i18nProvider?t.i18nProvider.analyze(c.pathname):(0,n.normalizeLocalePath)(c.pathname,u.locales);c.locale=v.detectedLocale,c.pathname=null!=(h=v.pathname)?h:c.pathname,!v.detectedLocale&&c.buildId&&(v=t.i18nProvider?t.i18nProvider.analyze(l):(0,n.normalizeLocalePath)(l,u.locales)).detectedLocale&&(c.locale=v.detectedLocale)}return c}},28589:function(e,t){"use strict";function r(e,t){if(void 0===t&&(t={}),t.onlyHashChange){e();return}var r=document.documentElement,n=r.style.scrollBehavior;r.style.scrollBehavior="auto",t.dontForceLayout||r.getClientRects(),e(),r.style.scrollBehavior=n}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"handleSmoothScroll",{enumerable:!0,get:function(){return r}})},1777:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{getSortedRoutes:function(){return n.getSortedRoutes},isDynamicRoute:function(){return o.isDynamicRoute}});var n=r(64244),o=r(43033)},6287:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"interpolateAs",{enumerable:!0,get:function(){return a}});var n=r(26049),o=r(68710);function a(e,t,r){var a="",i=(0,o.getRouteRegex)(e),u=i.groups,s=(t!==e?(0,n.getRouteMatcher)(i)(t):"")||r;a=e;var c=Object.keys(u);return c.every(function(e){var t=s[e]||"",r=u[e],n=r.repeat,o=r.optional,i="["+(n?"...":"")+e+"]";return o&&(i=(t?"":"/")+"["+i+"]"),n&&!Array.isArray(t)&&(t=[t]),(o||e in s)&&(a=a.replace(i,n?t.map(function(e){return encodeURIComponent(e)}).join("/"):encodeURIComponent(t))||"/")})||(a=""),{params:c,result:a}}},78855:function(e,t){"use strict";function r(e){return/Googlebot|Mediapartners-Google|AdsBot-Google|googleweblight|Storebot-Google|Google-PageRenderer|Bingbot|BingPreview|Slurp|DuckDuckBot|baiduspider|yandex|sogou|LinkedInBot|bitlybot|tumblr|vkShare|quora link preview|facebookexternalhit|facebookcatalog|Twitterbot|applebot|redditbot|Slackbot|Discordbot|WhatsApp|SkypeUriPreview|ia_archiver/i.test(e)}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"isBot",{enumerable:!0,get:function(){return r}})},43033:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"isDynamicRoute",{enumerable:!0,get:function(){return a}});var n=r(92407),o=/\/\[[^/]+?\](?=\/|$)/;function a(e){return(0,n.isInterceptionRouteAppPath)(e)&&(e=(0,n.extractInterceptionRouteInformation)(e).interceptedRoute),o.test(e)}},25656:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"isLocalURL",{enumerable:!0,get:function(){return a}});var n=r(9642),o=r(55638);function a(e){if(!(0,n.isAbsoluteUrl)(e))return!0;try{var t=(0,n.getLocationOrigin)(),r=new URL(e,t);return r.origin===t&&(0,o.hasBasePath)(r.pathname)}catch(e){return!1}}},52395:function(e,t){"use strict";function r(e,t){var r={};return Object.keys(e).forEach(function(n){t.includes(n)||(r[n]=e[n])}),r}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"omit",{enumerable:!0,get:function(){return r}})},12345:function(e,t){"use strict";function r(e){var t=e.indexOf("#"),r=e.indexOf("?"),n=r>-1&&(t<0||r<t);return n||t>-1?{pathname:e.substring(0,n?r:t),query:n?e.substring(r,t>-1?t:void 0):"",hash:t>-1?e.slice(t):""}:{pathname:e,query:"",hash:""}}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"parsePath",{enumerable:!0,get:function(){return r}})},85261:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"parseRelativeUrl",{enumerable:!0,get:function(){return a}});var n=r(9642),o=r(75606);function a(e,t){var r=new URL((0,n.getLocationOrigin)()),a=t?new URL(t,r):e.startsWith(".")?new URL(window.location.href):r,i=new URL(e,a),u=i.pathname,s=i.searchParams,c=i.search,l=i.hash,f=i.href;if(i.origin!==r.origin)throw Error("invariant: invalid relative URL, router received "+e);return{pathname:u,query:(0,o.searchParamsToUrlQuery)(s),search:c,hash:l,href:f.slice(r.origin.length)}}},69360:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"pathHasPrefix",{enumerable:!0,get:function(){return o}});var n=r(12345);function o(e,t){if("string"!=typeof e)return!1;var r=(0,n.parsePath)(e).pathname;return r===t||r.startsWith(t+"/")}},75606:function(e,t,r){"use strict";var n=r(43171);function o(e){var t={};return e.forEach(function(e,r){void 0===t[r]?t[r]=e:Array.isArray(t[r])?t[r].push(e):t[r]=[t[r],e]}),t}function a(e){return"string"!=typeof e&&("number"!=typeof e||isNaN(e))&&"boolean"!=typeof e?"":String(e)}function i(e){var t=new URLSearchParams;return Object.entries(e).forEach(function(e){var r=n(e,2),o=r[0],i=r[1];Array.isArray(i)?i.forEach(function(e){return t.append(o,a(e))}):t.set(o,a(i))}),t}function u(e){for(var t=arguments.length,r=Array(t>1?t-1:0),n=1;n<t;n++)r[n-1]=arguments[n];return r.forEach(function(t){Array.from(t.keys()).forEach(function(t){return e.delete(t)}),t.forEach(function(t,r){return e.append(r,t)})}),e}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{assign:function(){return u},searchParamsToUrlQuery:function(){return o},urlQueryToSearchParams:function(){return i}})},69580:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"removePathPrefix",{enumerable:!0,get:function(){return o}});var n=r(69360);function o(e,t){if(!(0,n.pathHasPrefix)(e,t))return e;var r=e.slice(t.length);return r.startsWith("/")?r:"/"+r}},61105:function(e,t){"use strict";function r(e){return e.replace(/\/$/,"")||"/"}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"removeTrailingSlash",{enumerable:!0,get:function(){return r}})},26049:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"getRouteMatcher",{enumerable:!0,get:function(){return o}});var n=r(9642);function o(e){var t=e.re,r=e.groups;return function(e){var o=t.exec(e);if(!o)return!1;var a=function(e){try{return decodeURIComponent(e)}catch(e){throw new n.DecodeError("failed to decode param")}},i={};return Object.keys(r).forEach(function(e){var t=r[e],n=o[t.pos];void 0!==n&&(i[e]=~n.indexOf("/")?n.split("/").map(function(e){return a(e)}):t.repeat?[a(n)]:a(n))}),i}}},68710:function(e,t,r){"use strict";var n=r(20968),o=r(43171);function a(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}function i(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?a(Object(r),!0).forEach(function(t){n(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):a(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{getNamedMiddlewareRegex:function(){return m},getNamedRouteRegex:function(){return v},getRouteRegex:function(){return d}});var u=r(92407),s=r(74757),c=r(61105);function l(e){var t=e.startsWith("[")&&e.endsWith("]");t&&(e=e.slice(1,-1));var r=e.startsWith("...");return r&&(e=e.slice(3)),{key:e,repeat:r,optional:t}}function f(e){var t=(0,c.removeTrailingSlash)(e).slice(1).split("/"),r={},n=1;return{parameterizedRoute:t.map(function(e){var t=u.INTERCEPTION_ROUTE_MARKERS.find(function(t){return e.startsWith(t)}),o=e.match(/\[((?:\[.*\])|.+)\]/);if(t&&o){var a=l(o[1]),i=a.key,c=a.optional,f=a.repeat;return r[i]={pos:n++,repeat:f,optional:c},"/"+(0,s.escapeStringRegexp)(t)+"([^/]+?)"}if(!o)return"/"+(0,s.escapeStringRegexp)(e);var d=l(o[1]),p=d.key,h=d.repeat,v=d.optional;return r[p]={pos:n++,repeat:h,optional:v},h?v?"(?:/(.+?))?":"/(.+?)":"/([^/]+?)"}).join(""),groups:r}}function d(e){var t=f(e),r=t.parameterizedRoute,n=t.groups;return{re:RegExp("^"+r+"(?:/)?$"),groups:n}}function p(e){var t=e.interceptionMarker,r=e.getSafeRouteKey,n=e.segment,o=e.routeKeys,a=e.keyPrefix,i=l(n),u=i.key,c=i.optional,f=i.repeat,d=u.replace(/\W/g,"");a&&(d=""+a+d);var p=!1;(0===d.length||d.length>30)&&(p=!0),isNaN(parseInt(d.slice(0,1)))||(p=!0),p&&(d=r()),a?o[d]=""+a+u:o[d]=u;var h=t?(0,s.escapeStringRegexp)(t):"";return f?c?"(?:/"+h+"(?<"+d+">.+?))?":"/"+h+"(?<"+d+">.+?)":"/"+h+"(?<"+d+">[^/]+?)"}function h(e,t){var r,n=(0,c.removeTrailingSlash)(e).slice(1).split("/"),a=(r=0,function(){for(var e="",t=++r;t>0;)e+=String.fromCharCode(97+(t-1)%26),t=Math.floor((t-1)/26);return e}),i={};return{namedParameterizedRoute:n.map(function(e){var r=u.INTERCEPTION_ROUTE_MARKERS.some(function(t){return e.startsWith(t)}),n=e.match(/\[((?:\[.*\])|.+)\]/);return r&&n?p({getSafeRouteKey:a,interceptionMarker:o(e.split(n[0]),1)[0],segment:n[1],routeKeys:i,keyPrefix:t?"nxtI":void 0}):n?p({getSafeRouteKey:a,segment:n[1],routeKeys:i,keyPrefix:t?"nxtP":void 0}):"/"+(0,s.escapeStringRegexp)(e)}).join(""),routeKeys:i}}function v(e,t){var r=h(e,t);return i(i({},d(e)),{},{namedRegex:"^"+r.namedParameterizedRoute+"(?:/)?$",routeKeys:r.routeKeys})}function m(e,t){var r=f(e).parameterizedRoute,n=t.catchAll,o=void 0===n||n;return"/"===r?{namedRegex:"^/"+(o?".*":"")+"$"}:{namedRegex:"^"+h(e,!1).namedParameterizedRoute+(o?"(?:(/.*)?)":"")+"$"}}},64244:function(e,t,r){"use strict";var n=r(48416),o=r(23322),a=r(16089);Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"getSortedRoutes",{enumerable:!0,get:function(){return u}});var i=function(){function e(){o(this,e),this.placeholder=!0,this.children=new Map,this.slugName=null,this.restSlugName=null,this.optionalRestSlugName=null}return a(e,[{key:"insert",value:function(e){this._insert(e.split("/").filter(Boolean),[],!1)}},{key:"smoosh",value:function(){return this._smoosh()}},{key:"_smoosh",value:function(e){var t=this;void 0===e&&(e="/");var r=n(this.children.keys()).sort();null!==this.slugName&&r.splice(r.indexOf("[]"),1),null!==this.restSlugName&&r.splice(r.indexOf("[...]"),1),null!==this.optionalRestSlugName&&r.splice(r.indexOf("[[...]]"),1);var o=r.map(function(r){return t.children.get(r)._smoosh(""+e+r+"/")}).reduce(function(e,t){return[].concat(n(e),n(t))},[]);if(null!==this.slugName&&o.push.apply(o,n(this.children.get("[]")._smoosh(e+"["+this.slugName+"]/"))),!this.placeholder){var a="/"===e?"/":e.slice(0,-1);if(null!=this.optionalRestSlugName)throw Error('You cannot define a route with the same specificity as a optional catch-all route ("'+a+'" and "'+a+"[[..."+this.optionalRestSlugName+']]").');o.unshift(a)}return null!==this.restSlugName&&o.push.apply(o,n(this.children.get("[...]")._smoosh(e+"[..."+this.restSlugName+"]/"))),null!==this.optionalRestSlugName&&o.push.apply(o,n(this.children.get("[[...]]")._smoosh(e+"[[..."+this.optionalRestSlugName+"]]/"))),o}},{key:"_insert",value:function(t,r,n){if(0===t.length){this.placeholder=!1;return}if(n)throw Error("Catch-all must be the last part of the URL.");var o=t[0];if(o.startsWith("[")&&o.endsWith("]")){var a=function(e,t){if(null!==e&&e!==t)throw Error("You cannot use different slug names for the same dynamic path ('"+e+"' !== '"+t+"').");r.forEach(function(e){if(e===t)throw Error('You cannot have the same slug name "'+t+'" repeat within a single dynamic path');if(e.replace(/\W/g,"")===o.replace(/\W/g,""))throw Error('You cannot have the slug names "'+e+'" and "'+t+'" differ only by non-word symbols within a single dynamic path')}),r.push(t)},i=o.slice(1,-1),u=!1;if(i.startsWith("[")&&i.endsWith("]")&&(i=i.slice(1,-1),u=!0),i.startsWith("...")&&(i=i.substring(3),n=!0),i.startsWith("[")||i.endsWith("]"))throw Error("Segment names may not start or end with extra brackets ('"+i+"').");if(i.startsWith("."))throw Error("Segment names may not start with erroneous periods ('"+i+"').");if(n){if(u){if(null!=this.restSlugName)throw Error('You cannot use both an required and optional catch-all route at the same level ("[...'+this.restSlugName+']" and "'+t[0]+'" ).');a(this.optionalRestSlugName,i),this.optionalRestSlugName=i,o="[[...]]"}else{if(null!=this.optionalRestSlugName)throw Error('You cannot use both an optional and required catch-all route at the same level ("[[...'+this.optionalRestSlugName+']]" and "'+t[0]+'").');a(this.restSlugName,i),this.restSlugName=i,o="[...]"}}else{if(u)throw Error('Optional route parameters are not yet supported ("'+t[0]+'").');a(this.slugName,i),this.slugName=i,o="[]"}}this.children.has(o)||this.children.set(o,new e),this.children.get(o)._insert(t.slice(1),r,n)}}]),e}();function u(e){var t=new i;return e.forEach(function(e){return t.insert(e)}),t.smoosh()}},41258:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{default:function(){return n},setConfig:function(){return o}});var r,n=function(){return r};function o(e){r=e}},74051:function(e,t){"use strict";function r(e){return"("===e[0]&&e.endsWith(")")}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{DEFAULT_SEGMENT_KEY:function(){return o},PAGE_SEGMENT_KEY:function(){return n},isGroupSegment:function(){return r}});var n="__PAGE__",o="__DEFAULT__"},9642:function(e,t,r){"use strict";var n=r(64687),o=r(16089),a=r(23322),i=r(55667),u=r(81961),s=r(67731),c=r(27033),l=r(67752);function f(e){var t=function(){if("undefined"==typeof Reflect||!Reflect.construct||Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch(e){return!1}}();return function(){var r,n=s(e);return r=t?Reflect.construct(n,arguments,s(this).constructor):n.apply(this,arguments),u(this,r)}}Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{DecodeError:function(){return S},MiddlewareNotFoundError:function(){return T},MissingStaticPage:function(){return R},NormalizeError:function(){return w},PageNotFoundError:function(){return j},SP:function(){return O},ST:function(){return E},WEB_VITALS:function(){return d},execOnce:function(){return p},getDisplayName:function(){return b},getLocationOrigin:function(){return m},getURL:function(){return y},isAbsoluteUrl:function(){return v},isResSent:function(){return g},loadGetInitialProps:function(){return P},normalizeRepeatedSlashes:function(){return _},stringifyError:function(){return M}});var d=["CLS","FCP","FID","INP","LCP","TTFB"];function p(e){var t,r=!1;return function(){for(var n=arguments.length,o=Array(n),a=0;a<n;a++)o[a]=arguments[a];return r||(r=!0,t=e.apply(void 0,o)),t}}var h=/^[a-zA-Z][a-zA-Z\d+\-.]*?:/,v=function(e){return h.test(e)};function m(){var e=window.location,t=e.protocol,r=e.hostname,n=e.port;return t+"//"+r+(n?":"+n:"")}function y(){var e=window.location.href,t=m();return e.substring(t.length)}function b(e){return"string"==typeof e?e:e.displayName||e.name||"Unknown"}function g(e){return e.finished||e.headersSent}function _(e){var t=e.split("?");return t[0].replace(/\\/g,"/").replace(/\/\/+/g,"/")+(t[1]?"?"+t.slice(1).join("?"):"")}function P(e,t){return x.apply(this,arguments)}function x(){return(x=l(n.mark(function e(t,r){var o,a;return n.wrap(function(e){for(;;)switch(e.prev=e.next){case 0:e.next=4;break;case 4:if(o=r.res||r.ctx&&r.ctx.res,t.getInitialProps){e.next=12;break}if(!(r.ctx&&r.Component)){e.next=11;break}return e.next=9,P(r.Component,r.ctx);case 9:return e.t0=e.sent,e.abrupt("return",{pageProps:e.t0});case 11:return e.abrupt("return",{});case 12:return e.next=14,t.getInitialProps(r);case 14:if(a=e.sent,!(o&&g(o))){e.next=17;break}return e.abrupt("return",a);case 17:if(a){e.next=20;break}throw Error('"'+b(t)+'.getInitialProps()" should resolve to an object. But found "'+a+'" instead.');case 20:return e.abrupt("return",a);case 22:case"end":return e.stop()}},e)}))).apply(this,arguments)}var O="undefined"!=typeof performance,E=O&&["mark","measure","getEntriesByName"].every(function(e){return"function"==typeof performance[e]}),S=function(e){i(r,e);var t=f(r);function r(){return a(this,r),t.apply(this,arguments)}return o(r)}(c(Error)),w=function(e){i(r,e);var t=f(r);function r(){return a(this,r),t.apply(this,arguments)}return o(r)}(c(Error)),j=function(e){i(r,e);var t=f(r);function r(e){var n;return a(this,r),(n=t.call(this)).code="ENOENT",n.name="PageNotFoundError",n.message="Cannot find module for page: "+e,n}return o(r)}(c(Error)),R=function(e){i(r,e);var t=f(r);function r(e,n){var o;return a(this,r),(o=t.call(this)).message="Failed to load static file for page: "+e+" "+n,o}return o(r)}(c(Error)),T=function(e){i(r,e);var t=f(r);function r(){var e;return a(this,r),(e=t.call(this)).code="ENOENT",e.message="Cannot find the middleware module",e}return o(r)}(c(Error));function M(e){return JSON.stringify({message:e.message,stack:e.stack})}},84878:function(e,t){"use strict";function r(){return""}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"getDeploymentIdQueryOrEmptyString",{enumerable:!0,get:function(){return r}})},40037:function(){"trimStart"in String.prototype||(String.prototype.trimStart=String.prototype.trimLeft),"trimEnd"in String.prototype||(String.prototype.trimEnd=String.prototype.trimRight),"description"in Symbol.prototype||Object.defineProperty(Symbol.prototype,"description",{configurable:!0,get:function(){var e=/\((.*)\)/.exec(this.toString());return e?e[1]:void 0}}),Array.prototype.flat||(Array.prototype.flat=function(e,t){return t=this.concat.apply([],this),e>1&&t.some(Array.isArray)?t.flat(e-1):t},Array.prototype.flatMap=function(e,t){return this.map(e,t).flat()}),Promise.prototype.finally||(Promise.prototype.finally=function(e){if("function"!=typeof e)return this.then(e,e);var t=this.constructor||Promise;return this.then(function(r){return t.resolve(e()).then(function(){return r})},function(r){return t.resolve(e()).then(function(){throw r})})}),Object.fromEntries||(Object.fromEntries=function(e){return Array.from(e).reduce(function(e,t){return e[t[0]]=t[1],e},{})}),Array.prototype.at||(Array.prototype.at=function(e){var t=Math.trunc(e)||0;if(t<0&&(t+=this.length),!(t<0||t>=this.length))return this[t]}),Object.hasOwn||(Object.hasOwn=function(e,t){if(null==e)throw TypeError("Cannot convert undefined or null to object");return Object.prototype.hasOwnProperty.call(Object(e),t)}),"canParse"in URL||(URL.canParse=function(e,t){try{return new URL(e,t),!0}catch(e){return!1}})},78018:function(e){var t,r,n,o,a,i,u,s,c,l,f,d,p,h,v,m,y,b,g,_,P,x,O,E,S,w,j,R,T,M,A,C,I,k,L,N,D,F,B,U,H,q,W,G,z,V;(t={}).d=function(e,r){for(var n in r)t.o(r,n)&&!t.o(e,n)&&Object.defineProperty(e,n,{enumerable:!0,get:r[n]})},t.o=function(e,t){return Object.prototype.hasOwnProperty.call(e,t)},t.r=function(e){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},void 0!==t&&(t.ab="//"),r={},t.r(r),t.d(r,{getCLS:function(){return O},getFCP:function(){return _},getFID:function(){return M},getINP:function(){return q},getLCP:function(){return G},getTTFB:function(){return V},onCLS:function(){return O},onFCP:function(){return _},onFID:function(){return M},onINP:function(){return q},onLCP:function(){return G},onTTFB:function(){return V}}),s=-1,c=function(e){addEventListener("pageshow",function(t){t.persisted&&(s=t.timeStamp,e(t))},!0)},l=function(){return window.performance&&performance.getEntriesByType&&performance.getEntriesByType("navigation")[0]},f=function(){var e=l();return e&&e.activationStart||0},d=function(e,t){var r=l(),n="navigate";return s>=0?n="back-forward-cache":r&&(n=document.prerendering||f()>0?"prerender":r.type.replace(/_/g,"-")),{name:e,value:void 0===t?-1:t,rating:"good",delta:0,entries:[],id:"v3-".concat(Date.now(),"-").concat(Math.floor(8999999999999*Math.random())+1e12),navigationType:n}},p=function(e,t,r){try{if(PerformanceObserver.supportedEntryTypes.includes(e)){var n=new PerformanceObserver(function(e){t(e.getEntries())});return n.observe(Object.assign({type:e,buffered:!0},r||{})),n}}catch(e){}},h=function(e,t){var r=function r(n){"pagehide"!==n.type&&"hidden"!==document.visibilityState||(e(n),t&&(removeEventListener("visibilitychange",r,!0),removeEventListener("pagehide",r,!0)))};addEventListener("visibilitychange",r,!0),addEventListener("pagehide",r,!0)},v=function(e,t,r,n){var o,a;return function(i){var u;t.value>=0&&(i||n)&&((a=t.value-(o||0))||void 0===o)&&(o=t.value,t.delta=a,t.rating=(u=t.value)>r[1]?"poor":u>r[0]?"needs-improvement":"good",e(t))}},m=-1,y=function(){return"hidden"!==document.visibilityState||document.prerendering?1/0:0},b=function(){h(function(e){m=e.timeStamp},!0)},g=function(){return m<0&&(m=y(),b(),c(function(){setTimeout(function(){m=y(),b()},0)})),{get firstHiddenTime(){return m}}},_=function(e,t){t=t||{};var r,n=[1800,3e3],o=g(),a=d("FCP"),i=function(e){e.forEach(function(e){"first-contentful-paint"===e.name&&(s&&s.disconnect(),e.startTime<o.firstHiddenTime&&(a.value=e.startTime-f(),a.entries.push(e),r(!0)))})},u=window.performance&&window.performance.getEntriesByName&&window.performance.getEntriesByName("first-contentful-paint")[0],s=u?null:p("paint",i);(u||s)&&(r=v(e,a,n,t.reportAllChanges),u&&i([u]),c(function(o){r=v(e,a=d("FCP"),n,t.reportAllChanges),requestAnimationFrame(function(){requestAnimationFrame(function(){a.value=performance.now()-o.timeStamp,r(!0)})})}))},P=!1,x=-1,O=function(e,t){t=t||{};var r=[.1,.25];P||(_(function(e){x=e.value}),P=!0);var n,o=function(t){x>-1&&e(t)},a=d("CLS",0),i=0,u=[],s=function(e){e.forEach(function(e){if(!e.hadRecentInput){var t=u[0],r=u[u.length-1];i&&e.startTime-r.startTime<1e3&&e.startTime-t.startTime<5e3?(i+=e.value,u.push(e)):(i=e.value,u=[e]),i>a.value&&(a.value=i,a.entries=u,n())}})},l=p("layout-shift",s);l&&(n=v(o,a,r,t.reportAllChanges),h(function(){s(l.takeRecords()),n(!0)}),c(function(){i=0,x=-1,n=v(o,a=d("CLS",0),r,t.reportAllChanges)}))},E={passive:!0,capture:!0},S=new Date,w=function(e,t){n||(n=t,o=e,a=new Date,T(removeEventListener),j())},j=function(){if(o>=0&&o<a-S){var e={entryType:"first-input",name:n.type,target:n.target,cancelable:n.cancelable,startTime:n.timeStamp,processingStart:n.timeStamp+o};i.forEach(function(t){t(e)}),i=[]}},R=function(e){if(e.cancelable){var t,r,n,o=(e.timeStamp>1e12?new Date:performance.now())-e.timeStamp;"pointerdown"==e.type?(t=function(){w(o,e),n()},r=function(){n()},n=function(){removeEventListener("pointerup",t,E),removeEventListener("pointercancel",r,E)},addEventListener("pointerup",t,E),addEventListener("pointercancel",r,E)):w(o,e)}},T=function(e){["mousedown","keydown","touchstart","pointerdown"].forEach(function(t){return e(t,R,E)})},M=function(e,t){t=t||{};var r,a=[100,300],u=g(),s=d("FID"),l=function(e){e.startTime<u.firstHiddenTime&&(s.value=e.processingStart-e.startTime,s.entries.push(e),r(!0))},f=function(e){e.forEach(l)},m=p("first-input",f);r=v(e,s,a,t.reportAllChanges),m&&h(function(){f(m.takeRecords()),m.disconnect()},!0),m&&c(function(){r=v(e,s=d("FID"),a,t.reportAllChanges),i=[],o=-1,n=null,T(addEventListener),i.push(l),j()})},A=0,C=1/0,I=0,k=function(e){e.forEach(function(e){e.interactionId&&(C=Math.min(C,e.interactionId),A=(I=Math.max(I,e.interactionId))?(I-C)/7+1:0)})},L=function(){return u?A:performance.interactionCount||0},N=function(){"interactionCount"in performance||u||(u=p("event",k,{type:"event",buffered:!0,durationThreshold:0}))},D=0,F=function(){return L()-D},B=[],U={},H=function(e){var t=B[B.length-1],r=U[e.interactionId];if(r||B.length<10||e.duration>t.latency){if(r)r.entries.push(e),r.latency=Math.max(r.latency,e.duration);else{var n={id:e.interactionId,latency:e.duration,entries:[e]};U[n.id]=n,B.push(n)}B.sort(function(e,t){return t.latency-e.latency}),B.splice(10).forEach(function(e){delete U[e.id]})}},q=function(e,t){t=t||{};var r=[200,500];N();var n,o=d("INP"),a=function(e){e.forEach(function(e){e.interactionId&&H(e),"first-input"!==e.entryType||B.some(function(t){return t.entries.some(function(t){return e.duration===t.duration&&e.startTime===t.startTime})})||H(e)});var t,r=(t=Math.min(B.length-1,Math.floor(F()/50)),B[t]);r&&r.latency!==o.value&&(o.value=r.latency,o.entries=r.entries,n())},i=p("event",a,{durationThreshold:t.durationThreshold||40});n=v(e,o,r,t.reportAllChanges),i&&(i.observe({type:"first-input",buffered:!0}),h(function(){a(i.takeRecords()),o.value<0&&F()>0&&(o.value=0,o.entries=[]),n(!0)}),c(function(){B=[],D=L(),n=v(e,o=d("INP"),r,t.reportAllChanges)}))},W={},G=function(e,t){t=t||{};var r,n=[2500,4e3],o=g(),a=d("LCP"),i=function(e){var t=e[e.length-1];if(t){var n=t.startTime-f();n<o.firstHiddenTime&&(a.value=n,a.entries=[t],r())}},u=p("largest-contentful-paint",i);if(u){r=v(e,a,n,t.reportAllChanges);var s=function(){W[a.id]||(i(u.takeRecords()),u.disconnect(),W[a.id]=!0,r(!0))};["keydown","click"].forEach(function(e){addEventListener(e,s,{once:!0,capture:!0})}),h(s,!0),c(function(o){r=v(e,a=d("LCP"),n,t.reportAllChanges),requestAnimationFrame(function(){requestAnimationFrame(function(){a.value=performance.now()-o.timeStamp,W[a.id]=!0,r(!0)})})})}},z=function e(t){document.prerendering?addEventListener("prerenderingchange",function(){return e(t)},!0):"complete"!==document.readyState?addEventListener("load",function(){return e(t)},!0):setTimeout(t,0)},V=function(e,t){t=t||{};var r=[800,1800],n=d("TTFB"),o=v(e,n,r,t.reportAllChanges);z(function(){var a=l();if(a){if(n.value=Math.max(a.responseStart-f(),0),n.value<0||n.value>performance.now())return;n.entries=[a],o(!0),c(function(){(o=v(e,n=d("TTFB",0),r,t.reportAllChanges))(!0)})}})},e.exports=r},79423:function(e,t){"use strict";function r(e){return"/api"===e||!!(null==e?void 0:e.startsWith("/api/"))}Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"isAPIRoute",{enumerable:!0,get:function(){return r}})},80676:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{default:function(){return o},getProperError:function(){return a}});let n=r(86165);function o(e){return"object"==typeof e&&null!==e&&"name"in e&&"message"in e}function a(e){return o(e)?e:Error((0,n.isPlainObject)(e)?JSON.stringify(e):e+"")}},92407:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),function(e,t){for(var r in t)Object.defineProperty(e,r,{enumerable:!0,get:t[r]})}(t,{INTERCEPTION_ROUTE_MARKERS:function(){return o},extractInterceptionRouteInformation:function(){return i},isInterceptionRouteAppPath:function(){return a}});let n=r(76346),o=["(..)(..)","(.)","(..)","(...)"];function a(e){return void 0!==e.split("/").find(e=>o.find(t=>e.startsWith(t)))}function i(e){let t,r,a;for(let n of e.split("/"))if(r=o.find(e=>n.startsWith(e))){[t,a]=e.split(r,2);break}if(!t||!r||!a)throw Error(`Invalid interception route: ${e}. Must be in the format /<intercepting route>/(..|...|..)(..)/<intercepted route>`);switch(t=(0,n.normalizeAppPath)(t),r){case"(.)":a="/"===t?`/${a}`:t+"/"+a;break;case"(..)":if("/"===t)throw Error(`Invalid interception route: ${e}. Cannot use (..) marker at the root level, use (.) instead.`);a=t.split("/").slice(0,-1).concat(a).join("/");break;case"(...)":a="/"+a;break;case"(..)(..)":let i=t.split("/");if(i.length<=2)throw Error(`Invalid interception route: ${e}. Cannot use (..)(..) marker at the root level or one level up.`);a=i.slice(0,-2).concat(a).join("/");break;default:throw Error("Invariant: unexpected marker")}return{interceptingRoute:t,interceptedRoute:a}}},72431:function(){},17061:function(e,t,r){var n=r(18698).default;function o(){"use strict";e.exports=o=function(){return r},e.exports.__esModule=!0,e.exports.default=e.exports;var t,r={},a=Object.prototype,i=a.hasOwnProperty,u=Object.defineProperty||function(e,t,r){e[t]=r.value},s="function"==typeof Symbol?Symbol:{},c=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",f=s.toStringTag||"@@toStringTag";function d(e,t,r){return Object.defineProperty(e,t,{value:r,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{d({},"")}catch(e){d=function(e,t,r){return e[t]=r}}function p(e,r,n,o){var a,i,s=Object.create((r&&r.prototype instanceof g?r:g).prototype);return u(s,"_invoke",{value:(a=new M(o||[]),i=v,function(r,o){if(i===m)throw Error("Generator is already running");if(i===y){if("throw"===r)throw o;return{value:t,done:!0}}for(a.method=r,a.arg=o;;){var u=a.delegate;if(u){var s=function e(r,n){var o=n.method,a=r.iterator[o];if(a===t)return n.delegate=null,"throw"===o&&r.iterator.return&&(n.method="return",n.arg=t,e(r,n),"throw"===n.method)||"return"!==o&&(n.method="throw",n.arg=TypeError("The iterator does not provide a '"+o+"' method")),b;var i=h(a,r.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,b;var u=i.arg;return u?u.done?(n[r.resultName]=u.value,n.next=r.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,b):u:(n.method="throw",n.arg=TypeError("iterator result is not an object"),n.delegate=null,b)}(u,a);if(s){if(s===b)continue;return s}}if("next"===a.method)a.sent=a._sent=a.arg;else if("throw"===a.method){if(i===v)throw i=y,a.arg;a.dispatchException(a.arg)}else"return"===a.method&&a.abrupt("return",a.arg);i=m;var c=h(e,n,a);if("normal"===c.type){if(i=a.done?y:"suspendedYield",c.arg===b)continue;return{value:c.arg,done:a.done}}"throw"===c.type&&(i=y,a.method="throw",a.arg=c.arg)}})}),s}function h(e,t,r){try{return{type:"normal",arg:e.call(t,r)}}catch(e){return{type:"throw",arg:e}}}r.wrap=p;var v="suspendedStart",m="executing",y="completed",b={};function g(){}function _(){}function P(){}var x={};d(x,c,function(){return this});var O=Object.getPrototypeOf,E=O&&O(O(A([])));E&&E!==a&&i.call(E,c)&&(x=E);var S=P.prototype=g.prototype=Object.create(x);function w(e){["next","throw","return"].forEach(function(t){d(e,t,function(e){return this._invoke(t,e)})})}function j(e,t){var r;u(this,"_invoke",{value:function(o,a){function u(){return new t(function(r,u){!function r(o,a,u,s){var c=h(e[o],e,a);if("throw"!==c.type){var l=c.arg,f=l.value;return f&&"object"==n(f)&&i.call(f,"__await")?t.resolve(f.__await).then(function(e){r("next",e,u,s)},function(e){r("throw",e,u,s)}):t.resolve(f).then(function(e){l.value=e,u(l)},function(e){return r("throw",e,u,s)})}s(c.arg)}(o,a,r,u)})}return r=r?r.then(u,u):u()}})}function R(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function T(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function M(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(R,this),this.reset(!0)}function A(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function r(){for(;++o<e.length;)if(i.call(e,o))return r.value=e[o],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw TypeError(n(e)+" is not iterable")}return _.prototype=P,u(S,"constructor",{value:P,configurable:!0}),u(P,"constructor",{value:_,configurable:!0}),_.displayName=d(P,f,"GeneratorFunction"),r.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===_||"GeneratorFunction"===(t.displayName||t.name))},r.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,P):(e.__proto__=P,d(e,f,"GeneratorFunction")),e.prototype=Object.create(S),e},r.awrap=function(e){return{__await:e}},w(j.prototype),d(j.prototype,l,function(){return this}),r.AsyncIterator=j,r.async=function(e,t,n,o,a){void 0===a&&(a=Promise);var i=new j(p(e,t,n,o),a);return r.isGeneratorFunction(t)?i:i.next().then(function(e){return e.done?e.value:i.next()})},w(S),d(S,f,"Generator"),d(S,c,function(){return this}),d(S,"toString",function(){return"[object Generator]"}),r.keys=function(e){var t=Object(e),r=[];for(var n in t)r.push(n);return r.reverse(),function e(){for(;r.length;){var n=r.pop();if(n in t)return e.value=n,e.done=!1,e}return e.done=!0,e}},r.values=A,M.prototype={constructor:M,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(T),!e)for(var r in this)"t"===r.charAt(0)&&i.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,o){return u.type="throw",u.arg=e,r.next=n,o&&(r.method="next",r.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],u=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var s=i.call(a,"catchLoc"),c=i.call(a,"finallyLoc");if(s&&c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!c)throw Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(e,t){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&i.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var o=n;break}}o&&("break"===e||"continue"===e)&&o.tryLoc<=t&&t<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=e,a.arg=t,o?(this.method="next",this.next=o.finallyLoc,b):this.complete(a)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),b},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var r=this.tryEntries[t];if(r.finallyLoc===e)return this.complete(r.completion,r.afterLoc),T(r),b}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var r=this.tryEntries[t];if(r.tryLoc===e){var n=r.completion;if("throw"===n.type){var o=n.arg;T(r)}return o}}throw Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:A(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),b}},r}e.exports=o,e.exports.__esModule=!0,e.exports.default=e.exports},18698:function(e){function t(r){return e.exports=t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},e.exports.__esModule=!0,e.exports.default=e.exports,t(r)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},64687:function(e,t,r){var n=r(17061)();e.exports=n;try{regeneratorRuntime=n}catch(e){"object"==typeof globalThis?globalThis.regeneratorRuntime=n:Function("r","regeneratorRuntime = r")(n)}},13148:function(e){e.exports=function(e,t){(null==t||t>e.length)&&(t=e.length);for(var r=0,n=Array(t);r<t;r++)n[r]=e[r];return n},e.exports.__esModule=!0,e.exports.default=e.exports},80227:function(e){e.exports=function(e){if(Array.isArray(e))return e},e.exports.__esModule=!0,e.exports.default=e.exports},24353:function(e,t,r){var n=r(13148);e.exports=function(e){if(Array.isArray(e))return n(e)},e.exports.__esModule=!0,e.exports.default=e.exports},66948:function(e){e.exports=function(e){if(void 0===e)throw ReferenceError("this hasn't been initialised - super() hasn't been called");return e},e.exports.__esModule=!0,e.exports.default=e.exports},67752:function(e){function t(e,t,r,n,o,a,i){try{var u=e[a](i),s=u.value}catch(e){r(e);return}u.done?t(s):Promise.resolve(s).then(n,o)}e.exports=function(e){return function(){var r=this,n=arguments;return new Promise(function(o,a){var i=e.apply(r,n);function u(e){t(i,o,a,u,s,"next",e)}function s(e){t(i,o,a,u,s,"throw",e)}u(void 0)})}},e.exports.__esModule=!0,e.exports.default=e.exports},23322:function(e){e.exports=function(e,t){if(!(e instanceof t))throw TypeError("Cannot call a class as a function")},e.exports.__esModule=!0,e.exports.default=e.exports},28957:function(e,t,r){var n=r(53062),o=r(38782);function a(t,r,i){return o()?e.exports=a=Reflect.construct.bind():e.exports=a=function(e,t,r){var o=[null];o.push.apply(o,t);var a=new(Function.bind.apply(e,o));return r&&n(a,r.prototype),a},e.exports.__esModule=!0,e.exports.default=e.exports,a.apply(null,arguments)}e.exports=a,e.exports.__esModule=!0,e.exports.default=e.exports},16089:function(e,t,r){var n=r(69597);function o(e,t){for(var r=0;r<t.length;r++){var o=t[r];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(e,n(o.key),o)}}e.exports=function(e,t,r){return t&&o(e.prototype,t),r&&o(e,r),Object.defineProperty(e,"prototype",{writable:!1}),e},e.exports.__esModule=!0,e.exports.default=e.exports},20968:function(e,t,r){var n=r(69597);e.exports=function(e,t,r){return(t=n(t))in e?Object.defineProperty(e,t,{value:r,enumerable:!0,configurable:!0,writable:!0}):e[t]=r,e},e.exports.__esModule=!0,e.exports.default=e.exports},67731:function(e){function t(r){return e.exports=t=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},e.exports.__esModule=!0,e.exports.default=e.exports,t(r)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},55667:function(e,t,r){var n=r(53062);e.exports=function(e,t){if("function"!=typeof t&&null!==t)throw TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&n(e,t)},e.exports.__esModule=!0,e.exports.default=e.exports},13819:function(e){e.exports=function(e){return -1!==Function.toString.call(e).indexOf("[native code]")},e.exports.__esModule=!0,e.exports.default=e.exports},38782:function(e){e.exports=function(){if("undefined"==typeof Reflect||!Reflect.construct||Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch(e){return!1}},e.exports.__esModule=!0,e.exports.default=e.exports},98024:function(e){e.exports=function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)},e.exports.__esModule=!0,e.exports.default=e.exports},39981:function(e){e.exports=function(e,t){var r=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=r){var n,o,a,i,u=[],s=!0,c=!1;try{if(a=(r=r.call(e)).next,0===t){if(Object(r)!==r)return;s=!1}else for(;!(s=(n=a.call(r)).done)&&(u.push(n.value),u.length!==t);s=!0);}catch(e){c=!0,o=e}finally{try{if(!s&&null!=r.return&&(i=r.return(),Object(i)!==i))return}finally{if(c)throw o}}return u}},e.exports.__esModule=!0,e.exports.default=e.exports},35149:function(e){e.exports=function(){throw TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")},e.exports.__esModule=!0,e.exports.default=e.exports},28794:function(e){e.exports=function(){throw TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")},e.exports.__esModule=!0,e.exports.default=e.exports},47069:function(e,t,r){var n=r(89103);e.exports=function(e,t){if(null==e)return{};var r,o,a=n(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(o=0;o<i.length;o++)r=i[o],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(a[r]=e[r])}return a},e.exports.__esModule=!0,e.exports.default=e.exports},89103:function(e){e.exports=function(e,t){if(null==e)return{};var r,n,o={},a=Object.keys(e);for(n=0;n<a.length;n++)r=a[n],t.indexOf(r)>=0||(o[r]=e[r]);return o},e.exports.__esModule=!0,e.exports.default=e.exports},81961:function(e,t,r){var n=r(12092).default,o=r(66948);e.exports=function(e,t){if(t&&("object"===n(t)||"function"==typeof t))return t;if(void 0!==t)throw TypeError("Derived constructors may only return object or undefined");return o(e)},e.exports.__esModule=!0,e.exports.default=e.exports},53062:function(e){function t(r,n){return e.exports=t=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},e.exports.__esModule=!0,e.exports.default=e.exports,t(r,n)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},43171:function(e,t,r){var n=r(80227),o=r(39981),a=r(34970),i=r(35149);e.exports=function(e,t){return n(e)||o(e,t)||a(e,t)||i()},e.exports.__esModule=!0,e.exports.default=e.exports},48416:function(e,t,r){var n=r(24353),o=r(98024),a=r(34970),i=r(28794);e.exports=function(e){return n(e)||o(e)||a(e)||i()},e.exports.__esModule=!0,e.exports.default=e.exports},23279:function(e,t,r){var n=r(12092).default;e.exports=function(e,t){if("object"!==n(e)||null===e)return e;var r=e[Symbol.toPrimitive];if(void 0!==r){var o=r.call(e,t||"default");if("object"!==n(o))return o;throw TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)},e.exports.__esModule=!0,e.exports.default=e.exports},69597:function(e,t,r){var n=r(12092).default,o=r(23279);e.exports=function(e){var t=o(e,"string");return"symbol"===n(t)?t:String(t)},e.exports.__esModule=!0,e.exports.default=e.exports},12092:function(e){function t(r){return e.exports=t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},e.exports.__esModule=!0,e.exports.default=e.exports,t(r)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},34970:function(e,t,r){var n=r(13148);e.exports=function(e,t){if(e){if("string"==typeof e)return n(e,t);var r=Object.prototype.toString.call(e).slice(8,-1);if("Object"===r&&e.constructor&&(r=e.constructor.name),"Map"===r||"Set"===r)return Array.from(e);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return n(e,t)}},e.exports.__esModule=!0,e.exports.default=e.exports},27033:function(e,t,r){var n=r(67731),o=r(53062),a=r(13819),i=r(28957);function u(t){var r="function"==typeof Map?new Map:void 0;return e.exports=u=function(e){if(null===e||!a(e))return e;if("function"!=typeof e)throw TypeError("Super expression must either be null or a function");if(void 0!==r){if(r.has(e))return r.get(e);r.set(e,t)}function t(){return i(e,arguments,n(this).constructor)}return t.prototype=Object.create(e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),o(t,e)},e.exports.__esModule=!0,e.exports.default=e.exports,u(t)}e.exports=u,e.exports.__esModule=!0,e.exports.default=e.exports},38754:function(e,t,r){"use strict";function n(e){return e&&e.__esModule?e:{default:e}}r.r(t),r.d(t,{_:function(){return n},_interop_require_default:function(){return n}})},61757:function(e,t,r){"use strict";function n(e){if("function"!=typeof WeakMap)return null;var t=new WeakMap,r=new WeakMap;return(n=function(e){return e?r:t})(e)}function o(e,t){if(!t&&e&&e.__esModule)return e;if(null===e||"object"!=typeof e&&"function"!=typeof e)return{default:e};var r=n(t);if(r&&r.has(e))return r.get(e);var o={__proto__:null},a=Object.defineProperty&&Object.getOwnPropertyDescriptor;for(var i in e)if("default"!==i&&Object.prototype.hasOwnProperty.call(e,i)){var u=a?Object.getOwnPropertyDescriptor(e,i):null;u&&(u.get||u.set)?Object.defineProperty(o,i,u):o[i]=e[i]}return o.default=e,r&&r.set(e,o),o}r.r(t),r.d(t,{_:function(){return o},_interop_require_wildcard:function(){return o}})}},function(e){e.O(0,[774],function(){return e(e.s=45349)}),_N_E=e.O()}]);
\ No newline at end of file
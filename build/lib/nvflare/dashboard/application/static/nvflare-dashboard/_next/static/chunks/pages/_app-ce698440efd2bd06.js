@@ -0,0 +1,161 @@
+(self.webpackChunk_N_E=self.webpackChunk_N_E||[]).push([[888],{45042:function(e,t,r){"use strict";function n(e){var t=Object.create(null);return function(r){return void 0===t[r]&&(t[r]=e(r)),t[r]}}r.d(t,{Z:function(){return n}})},91245:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={lightGray000:"#FFFFFF",lightGray100:"#FAFAFA",lightGray300:"#E0E0E0",lightGray400:"#AAAAAA",lightGray500:"#9E9E9E",darkGray300:"#616161",darkGray500:"#424242",darkGray600:"#2B2B2B",darkGray700:"#212121",darkGray800:"#181818",darkGray900:"#050505",green100:"#EFF7E0",green300:"#BBDC80",green500:"#76B900",green700:"#59A700",darkGreen100:"#DBE4E1",darkGreen300:"#437565",darkGreen500:"#004831",darkGreen700:"#00301F",teal100:"#E0F0EE",teal300:"#80C2B8",teal500:"#008471",teal700:"#006754",blue100:"#E8ECF4",blue300:"#7191D5",blue500:"#3E64A3",blue700:"#003A74",orange100:"#FFF2E9",orange300:"#FFC076",orange500:"#F08039",orange700:"#BD560F",red100:"#FFEAEB",red300:"#FF786D",red500:"#F03232",red700:"#C40019",purple100:"#F3E5F5",purple300:"#DF78EF",purple500:"#AB47BC",purple700:"#790E8B"}},90064:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={lowest:"0 1px 3px 0 rgba(0, 0, 0, 0.20)",low:"0 2px 3px 0 rgba(0, 0, 0, 0.14)",mid:"0 4px 5px 0 rgba(0, 0, 0, 0.12)",high:"0 8px 10px 0 rgba(0, 0, 0, 0.15)"}},7347:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.BaseColors=t.KaizenThemeProvider=t.KaizenThemeContext=t.KaizenThemes=t.useAppearance=void 0;var a=r(41493);Object.defineProperty(t,"useAppearance",{enumerable:!0,get:function(){return a.useAppearance}}),Object.defineProperty(t,"KaizenThemes",{enumerable:!0,get:function(){return a.KaizenThemes}}),Object.defineProperty(t,"KaizenThemeContext",{enumerable:!0,get:function(){return a.KaizenThemeContext}}),Object.defineProperty(t,"KaizenThemeProvider",{enumerable:!0,get:function(){return a.KaizenThemeProvider}});var o=r(91245);Object.defineProperty(t,"BaseColors",{enumerable:!0,get:function(){return n(o).default}})},9367:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(50298)),o=n(r(8811)),u=Object.assign(Object.assign({},a.default),o.default);t.default=u},50298:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(91245)),o=n(r(90064)),u=`
+  box-shadow: ${o.default.lowest};
+`,i=`
+  box-shadow: ${o.default.low};
+`,l=`
+  box-shadow: ${o.default.mid};
+`,d=`
+  box-shadow: ${o.default.high};
+`,f=`
+  border: 1px solid transparent;
+  outline: 1px solid ${a.default.lightGray500};
+  outline-offset: -1px;
+
+  &:hover {
+    outline-color: ${a.default.darkGray300};
+  }
+
+  &:focus {
+    outline-color: ${a.default.green500};
+  }
+`,s=`
+  ${f}
+  outline-color: ${a.default.darkGray300};
+  background: rgba(5, 5, 5, 0.35);
+
+  &:hover {
+    cursor: not-allowed;
+  }
+
+  &:focus {
+    outline-color: ${a.default.lightGray300};
+  }
+`,c=`
+  ${f}
+  outline-color: ${a.default.green300};
+
+  &:focus,
+  &:hover {
+    outline-color: ${a.default.green300};
+  }
+`,h=`
+  ${f}
+  outline-color: ${a.default.red300};
+
+  &:focus,
+  &:hover {
+    outline-color: ${a.default.red300};
+  }
+`;t.default={elevationLowest:u,elevationLow:i,elevationMid:l,elevationHigh:d,inputOutline:f,disabledInputOutline:s,validOutline:c,invalidOutline:h}},8811:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(30868)),o=`
+  font-family: ${a.default.font.brand};
+  font-size: ${a.default.size.large};
+  font-weight: 200;
+  font-style: normal;
+  line-height: 28px;
+  text-decoration: none;
+  letter-spacing: -0.4px;
+  text-transform: none;
+`,u=`
+  font-family: ${a.default.font.brand};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.normal};
+  font-style: normal;
+  line-height: 21px;
+  text-decoration: none;
+  letter-spacing: -0.2px;
+  text-transform: none;
+`,i=`
+  font-family: ${a.default.font.body};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.semiBold};
+  font-style: normal;
+  line-height: 21px;
+  text-decoration: none;
+  letter-spacing: 0;
+  text-transform: none;
+`,l=`
+  font-family: ${a.default.font.body};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.normal};
+  font-style: normal;
+  line-height: ${a.default.lineHeight.baseline};
+  text-align: left;
+  text-decoration: none;
+  letter-spacing: ${a.default.letterSpacing.baseline};
+  text-transform: none;
+`,d=`
+  font-family: ${a.default.font.body};
+  font-size: ${a.default.size.small};
+  font-weight: ${a.default.weight.normal};
+  font-style: normal;
+  line-height: 18px;
+  text-align: left;
+  text-decoration: none;
+  letter-spacing: ${a.default.letterSpacing.baseline};
+  text-transform: none;
+`,f=`
+  font-family: ${a.default.font.body};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.normal};
+  font-style: normal;
+  line-height: 18px;
+  margin: 0;
+  text-align: left;
+  text-decoration: none;
+  letter-spacing: ${a.default.letterSpacing.baseline};
+  text-transform: none;
+`,s=`
+  font-family: ${a.default.font.body};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.bold};
+  font-style: normal;
+  line-height: 21px;
+  text-align: left;
+  text-decoration: none;
+  letter-spacing: 0.4px;
+  text-transform: none;
+`,c=`
+  font-family: ${a.default.font.body};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.normal};
+  font-style: normal;
+  line-height: 21px;
+  text-align: left;
+  text-decoration: none;
+  letter-spacing: 0.4px;
+  text-transform: none;
+`,h=`
+  font-family: ${a.default.font.body};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.normal};
+  font-style: italic;
+  line-height: 18px;
+  text-align: left;
+  text-decoration: none;
+  letter-spacing: ${a.default.letterSpacing.baseline};
+  text-transform: none;
+`,g=`
+  font-family: ${a.default.font.code};
+  font-size: ${a.default.size.normal};
+  font-weight: ${a.default.weight.normal};
+  font-style: normal;
+  line-height: 21px;
+  text-align: left;
+  text-decoration: none;
+  letter-spacing: 0;
+  text-transform: none;
+`;t.default={headerLarge:o,headerMedium:u,headerSmall:i,body:l,bodySmall:d,input:f,label:s,labelSmall:c,placeholder:h,codeblock:g}},47628:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={zero:"0",one:"0.25rem",two:"0.5rem",three:"0.75rem",four:"1rem",five:"1.25rem",six:"1.5rem",seven:"1.75rem",eight:"2rem",twelve:"3rem",sixteen:"4rem"}},5415:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(91245)),o={brand:a.default.green500,accentColor:a.default.green500,headerColor:a.default.green500,highlightColor:a.default.green300,pageBackground:a.default.darkGray700,componentBackground:a.default.darkGray600,fontColor:a.default.lightGray100,fontColorInverted:a.default.darkGray300,link:a.default.green500,formField:{enabled:{background:a.default.darkGray700,border:a.default.darkGray500,foreground:a.default.lightGray000,checked:a.default.green500},disabled:{background:a.default.darkGray600,border:a.default.darkGray500,foreground:a.default.darkGray300,checked:a.default.darkGray300}},actionMenu:{icon:a.default.lightGray500,menu:{background:a.default.darkGray700},divider:{background:a.default.darkGray500},item:{default:{foreground:a.default.lightGray000,normal:{background:a.default.darkGray700},hover:{background:a.default.darkGray500}},critical:{normal:{foreground:a.default.red300},hover:{background:a.default.red700,foreground:a.default.lightGray000}},disabled:{normal:{foreground:a.default.darkGray500,icon:a.default.darkGray300},hover:{background:a.default.darkGray700,foreground:a.default.darkGray500,icon:a.default.darkGray300}}}},appBar:{background:a.default.darkGray900,foreground:a.default.lightGray100},avatar:{background:a.default.green500,foreground:a.default.darkGray700},banner:{foreground:{default:a.default.lightGray000,passive:a.default.lightGray100},background:{critical:{from:a.default.red700,to:a.default.red500},warning:{from:a.default.orange700,to:a.default.orange500},success:{from:a.default.green700,to:a.default.green500},info:{from:a.default.blue500,to:a.default.blue300},passive:a.default.darkGray600},icon:{critical:a.default.red500,warning:a.default.orange500,success:a.default.green500,info:a.default.blue300}},block:{titleForeground:a.default.lightGray400,contentForeground:a.default.lightGray100,toggleIconColor:a.default.lightGray400},button:{foreground:a.default.lightGray000,solid:{disabled:{background:a.default.darkGray500,foreground:a.default.darkGray300},primary:{normal:{background:a.default.green500,border:a.default.green500},hover:{background:a.default.green700,border:a.default.green700},focus:{border:a.default.green700,shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700}},secondary:{normal:{background:a.default.darkGray300,border:a.default.darkGray300},hover:{background:a.default.darkGray500,border:a.default.darkGray500},focus:{border:a.default.darkGray500,shadowInset:a.default.darkGray500},active:{background:a.default.darkGray500,border:a.default.darkGray500}},success:{normal:{background:a.default.green500,border:a.default.green500},hover:{background:a.default.green700,border:a.default.green700},focus:{border:a.default.green700,shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700}},critical:{normal:{background:a.default.red500,border:a.default.red500},hover:{background:a.default.red700,border:a.default.red700},focus:{border:a.default.red700,shadowInset:a.default.red700},active:{background:a.default.red700,border:a.default.red700}},info:{normal:{background:a.default.blue300,border:a.default.blue300},hover:{background:a.default.blue500,border:a.default.blue500},focus:{border:a.default.blue500,shadowInset:a.default.blue500},active:{background:a.default.blue500,border:a.default.blue500}}},outline:{background:a.default.darkGray600,hover:{foreground:a.default.darkGray600},disabled:{border:a.default.lightGray400,foreground:a.default.lightGray400},primary:{normal:{border:a.default.green500,foreground:a.default.green500},hover:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000},focus:{shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000}},secondary:{normal:{border:a.default.darkGray300,foreground:a.default.darkGray300},hover:{background:a.default.darkGray500,border:a.default.darkGray500,foreground:a.default.lightGray000},focus:{shadowInset:a.default.darkGray500},active:{background:a.default.darkGray500,border:a.default.darkGray500,foreground:a.default.lightGray000}},success:{normal:{border:a.default.green500,foreground:a.default.green500},hover:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000},focus:{shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000}},critical:{normal:{border:a.default.red500,foreground:a.default.red500},hover:{background:a.default.red700,border:a.default.red700,foreground:a.default.lightGray000},focus:{shadowInset:a.default.red700},active:{background:a.default.red700,border:a.default.red700,foreground:a.default.lightGray000}},info:{normal:{border:a.default.blue300,foreground:a.default.blue300},hover:{background:a.default.blue500,border:a.default.blue500,foreground:a.default.lightGray000},focus:{shadowInset:a.default.blue500},active:{background:a.default.blue500,border:a.default.blue500,foreground:a.default.lightGray000}}},link:{disabled:{foreground:a.default.darkGray500},primary:{normal:{foreground:a.default.green500},hover:{foreground:a.default.green700},active:{foreground:a.default.green700}},secondary:{normal:{foreground:a.default.lightGray500},hover:{foreground:a.default.darkGray300},active:{foreground:a.default.darkGray300}},success:{normal:{foreground:a.default.green500},hover:{foreground:a.default.green700},active:{foreground:a.default.green700}},critical:{normal:{foreground:a.default.red500},hover:{foreground:a.default.red700},active:{foreground:a.default.red700}},info:{normal:{foreground:a.default.blue300},hover:{foreground:a.default.blue500},active:{foreground:a.default.blue500}}}},card:{background:a.default.darkGray600,stack:{background:a.default.darkGray700},compact:{header:{icon:{fill:a.default.lightGray500}},content:{title:a.default.lightGray000,foreground:a.default.lightGray000,link:a.default.green500}},full:{header:{logo:{background:a.default.darkGray700,foreground:a.default.lightGray100},icon:{fill:a.default.lightGray100,foreground:a.default.lightGray100},image:{background:a.default.darkGray500,foreground:a.default.lightGray100}},content:{title:a.default.green500,subtitle:a.default.lightGray500,icon:a.default.lightGray100},footer:{background:a.default.darkGray700}}},checkbox:{foreground:a.default.lightGray100,normal:{border:a.default.darkGray500},focus:{border:a.default.green500},check:{background:a.default.green500}},contentHeader:{background:a.default.darkGray600,foreground:a.default.lightGray000},datePicker:{background:a.default.darkGray600,header:{border:a.default.darkGray500,color:a.default.lightGray300},day:{color:a.default.darkGray300,selected:{background:a.default.darkGray600,foreground:a.default.lightGray300,hover:a.default.lightGray300}},selectDate:{background:a.default.darkGray700,border:{closed:a.default.darkGray500,open:a.default.green500},left:{color:a.default.lightGray000,placeholderColor:a.default.darkGray300},right:{border:a.default.darkGray500}},today:{border:a.default.darkGray500,color:a.default.green500},close:{background:a.default.lightGray000,color:a.default.darkGray700}},foundation:{background:a.default.darkGray600,border:a.default.darkGray300,foreground:a.default.lightGray100},hero:{title:a.default.green500,content:a.default.lightGray100},menu:{background:a.default.darkGray900,border:a.default.darkGray900,rail:a.default.green500,subItem:{border:a.default.darkGray600,normal:{color:a.default.lightGray500},hover:{color:a.default.lightGray000},selected:{color:a.default.green500}},item:{normal:{color:a.default.lightGray500},hover:{color:a.default.lightGray000},selected:{color:a.default.lightGray000,background:a.default.darkGray700}},footer:{background:a.default.darkGray700,color:a.default.lightGray300}},modal:{backdrop:a.default.darkGray900,closeButton:a.default.lightGray300,title:{foreground:a.default.lightGray300}},nodeEditor:{background:a.default.darkGray300},note:{normal:{background:a.default.darkGray600},cli:{foreground:a.default.lightGray000,background:a.default.darkGray600}},pagination:{button:{caret:{fill:a.default.lightGray300},number:{background:a.default.darkGray700,border:a.default.darkGray700,foreground:a.default.darkGray300,selected:{background:a.default.darkGray600,border:a.default.lightGray500,shadow:"1px 2px 2px 0 rgba(0, 0, 0, 0.15)"},shadow:"0 2px 4px 0 rgba(0, 0, 0, 0.4)"}},input:{background:a.default.darkGray700,border:a.default.darkGray500,foreground:a.default.lightGray300}},progress:{background:a.default.darkGray600,border:a.default.darkGray500,progressBar:{primary:{background:a.default.green500},secondary:{background:a.default.lightGray400},success:{background:a.default.green700},warning:{background:a.default.orange500},critical:{background:a.default.red500},info:{background:a.default.blue300}}},radio:{foreground:a.default.lightGray100,normal:{border:a.default.darkGray500},focus:{border:a.default.green500},check:{background:a.default.green500}},result:{background:a.default.darkGray600,border:a.default.darkGray500,detailsBackground:a.default.darkGray500,statusBackground:a.default.lightGray300,statusForeground:a.default.darkGray900},select:{clearIndicator:{normal:{foreground:a.default.darkGray500},hover:{foreground:a.default.lightGray100}},control:{normal:{background:a.default.darkGray700,border:a.default.darkGray500},active:{background:a.default.darkGray700,border:a.default.green500},disabled:{background:a.default.darkGray600,border:a.default.darkGray500},invalid:{border:a.default.red500}},dropdownIndicator:{normal:{foreground:a.default.darkGray500},hover:{foreground:a.default.lightGray100},open:{foreground:a.default.lightGray100}},group:{border:a.default.darkGray500},groupHeading:{foreground:a.default.lightGray500},icon:{normal:{fill:a.default.darkGray500},focused:{fill:a.default.green500},disabled:{fill:a.default.darkGray500}},indicatorSeparator:{background:a.default.darkGray500},input:{foreground:a.default.lightGray300},menu:{background:a.default.darkGray700},multiValue:{background:a.default.darkGray500},multiValueLabel:{foreground:a.default.lightGray300},multiValueRemove:{normal:{background:a.default.darkGray500,foreground:a.default.lightGray500},hover:{background:a.default.darkGray300,foreground:a.default.lightGray100}},noOptionsMessage:{foreground:a.default.lightGray500},option:{normal:{background:a.default.darkGray700,foreground:a.default.lightGray500},hover:{background:a.default.darkGray500},selected:{check:a.default.green500,foreground:a.default.lightGray000},disabled:{foreground:a.default.darkGray300}},placeholder:{foreground:a.default.lightGray500},singleValue:{normal:{foreground:a.default.lightGray300},active:{foreground:a.default.lightGray000},disabled:{foreground:a.default.darkGray300}},validationMessage:{foreground:a.default.red500}},sidePanel:{background:a.default.darkGray900,border:a.default.lightGray500},slider:{handle:{background:a.default.darkGray600,border:a.default.green500,innerShadow:`inset 0.5px 0.5px 1px 0 ${a.default.darkGray500}`,shadow:"rgba(0,0,0,0.4)"},tooltip:{background:a.default.darkGray700,border:a.default.green500,foreground:a.default.green500},mark:{foreground:a.default.darkGray300,normal:{background:a.default.darkGray500,border:a.default.darkGray300},active:{background:a.default.darkGray600,border:a.default.green500}},track:{background:a.default.green500},rail:{background:a.default.darkGray800,shadow:"inset 0 1px 2px 0 rgba(0,0,0,0.8)"}},spinner:{color:a.default.green500,glow:a.default.green500},switch:{foreground:a.default.lightGray100,normal:{background:a.default.darkGray700},checked:{background:a.default.green500},disabled:{border:a.default.darkGray500,normal:{background:a.default.darkGray600},checked:{background:a.default.darkGray600}},check:{background:a.default.darkGray600,innerShadow:"inset 0.5px 0.5px 1px 0 rgba(0,0,0,0.2)"},contextLabels:{on:{foreground:a.default.lightGray000},off:{foreground:a.default.darkGray500}}},table:{header:{background:a.default.darkGray500,columnFilterIndicator:a.default.lightGray500,columnFilterIndicatorActive:a.default.green700,foreground:a.default.lightGray000,resizer:a.default.darkGray300,sortActive:a.default.lightGray000,sortInActive:a.default.lightGray300,actionBackground:a.default.darkGray700,actionDisabled:a.default.darkGray300,actionForeground:a.default.lightGray500,actionHoverBackground:a.default.darkGray500,actionHoverForeground:a.default.lightGray000},body:{background:a.default.darkGray600,backgroundExpandedRow:a.default.darkGray800,backgroundHover:a.default.darkGray700,border:a.default.darkGray500,foreground:a.default.lightGray000},result:{background:a.default.darkGray600,border:a.default.darkGray500,iconBackground:a.default.darkGray500}},tab:{bar:{border:a.default.darkGray500},normal:{foreground:a.default.lightGray500},hover:{border:a.default.green500,foreground:a.default.green500},active:{border:a.default.green700,foreground:a.default.green700},selected:{border:a.default.green500,foreground:a.default.green500},disabled:{foreground:a.default.darkGray500}},tag:{gray:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.darkGray500},hover:{background:a.default.darkGray300}},outline:{background:a.default.darkGray300,border:a.default.lightGray500,foreground:a.default.lightGray300}},red:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.red500},hover:{background:a.default.red700}},outline:{background:a.default.red700,border:a.default.red500,foreground:a.default.red500}},orange:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.orange500},hover:{background:a.default.orange700}},outline:{background:a.default.orange700,border:a.default.orange500,foreground:a.default.orange500}},green:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.green500},hover:{background:a.default.green700}},outline:{background:a.default.green700,border:a.default.green500,foreground:a.default.green500}},darkGreen:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.darkGreen500},hover:{background:a.default.darkGreen700}},outline:{background:a.default.darkGreen300,border:a.default.darkGreen300,foreground:a.default.darkGreen300}},teal:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.teal500},hover:{background:a.default.teal700}},outline:{background:a.default.teal700,border:a.default.teal500,foreground:a.default.teal500}},blue:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.blue500},hover:{background:a.default.blue700}},outline:{background:a.default.blue700,border:a.default.blue500,foreground:a.default.blue500}},purple:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.purple500},hover:{background:a.default.purple700}},outline:{background:a.default.purple700,border:a.default.purple500,foreground:a.default.purple500}}},tagEditor:{background:a.default.darkGray700,border:a.default.darkGray500,foreground:a.default.lightGray000},textbox:{placeholder:a.default.lightGray400,validationMessage:a.default.red500,icon:{color:a.default.green500},normal:{background:a.default.darkGray700,border:a.default.darkGray500,foreground:a.default.lightGray000},focus:{border:a.default.green500},disabled:{border:a.default.darkGray500,foreground:a.default.darkGray300},invalid:{border:a.default.red500}},timebox:{background:a.default.darkGray700,label:{foreground:a.default.lightGray500},normal:{border:a.default.darkGray500,foreground:a.default.lightGray500},hover:{background:a.default.darkGray500},focus:{background:a.default.green500,border:a.default.green500,foreground:a.default.lightGray000},disabled:{background:a.default.darkGray800,border:a.default.darkGray500,foreground:a.default.darkGray500}},tooltip:{background:a.default.darkGray700,normal:{foreground:a.default.lightGray100,border:a.default.darkGray500},success:{foreground:a.default.green500,border:a.default.green500},warning:{foreground:a.default.orange500,border:a.default.orange500},critical:{foreground:a.default.red500,border:a.default.red500},info:{foreground:a.default.blue500,border:a.default.blue500}},visualization:{border:a.default.darkGray500,donut:{subtitle:a.default.lightGray400,title:a.default.lightGray000},hover:a.default.green500,label:a.default.lightGray500,tooltip:{inverse:a.default.darkGray300,normal:a.default.lightGray100}}};t.default=Object.assign(Object.assign({},a.default),o)},31920:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(90064));t.default=Object.assign(Object.assign({},a.default),{lowest:"0 1px 3px 0 rgba(0, 0, 0, 0.4)",low:"0 2px 3px 0 rgba(0, 0, 0, 0.4)",mid:"0 4px 5px 0 rgba(0, 0, 0, 0.4)",high:"0 8px 10px 0 rgba(0, 0, 0, 0.4)"})},68226:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(5415)),o=n(r(31920)),u=n(r(9367)),i=n(r(74780)),l=n(r(46649)),d={name:"enterpriseDark",darkMode:!0,colors:a.default,elevation:o.default,spacing:i.default,mixins:u.default,typography:l.default};t.default=d},74780:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(47628));t.default=Object.assign({},a.default)},46649:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(30868));t.default=Object.assign({},a.default)},11770:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(91245)),o={brand:a.default.green500,accentColor:a.default.green500,headerColor:a.default.darkGray900,highlightColor:a.default.green300,pageBackground:a.default.lightGray100,componentBackground:a.default.lightGray000,fontColor:a.default.darkGray900,fontColorInverted:a.default.lightGray100,link:a.default.green500,formField:{enabled:{background:a.default.lightGray100,border:a.default.lightGray500,foreground:a.default.darkGray700,checked:a.default.green500},disabled:{background:a.default.lightGray300,border:a.default.lightGray500,foreground:a.default.lightGray500,checked:a.default.lightGray500}},actionMenu:{icon:a.default.lightGray500,menu:{background:a.default.lightGray000},divider:{background:a.default.lightGray300},item:{default:{foreground:a.default.darkGray700,normal:{background:a.default.lightGray000},hover:{background:a.default.lightGray300}},critical:{normal:{foreground:a.default.red700},hover:{background:a.default.red500,foreground:a.default.lightGray000}},disabled:{normal:{foreground:a.default.lightGray300,icon:a.default.lightGray500},hover:{background:a.default.lightGray000,foreground:a.default.lightGray300,icon:a.default.lightGray500}}}},appBar:{background:a.default.lightGray000,foreground:a.default.darkGray900},avatar:{background:a.default.green500,foreground:a.default.lightGray000},banner:{foreground:{default:a.default.lightGray000,passive:a.default.darkGray900},background:{critical:{from:a.default.red700,to:a.default.red500},warning:{from:a.default.orange700,to:a.default.orange500},success:{from:a.default.green700,to:a.default.green500},info:{from:a.default.blue500,to:a.default.blue300},passive:a.default.lightGray000},icon:{critical:a.default.red500,warning:a.default.orange500,success:a.default.green500,info:a.default.blue300}},block:{titleForeground:a.default.darkGray600,contentForeground:a.default.darkGray900,toggleIconColor:a.default.darkGray600},button:{foreground:a.default.lightGray000,solid:{disabled:{background:a.default.lightGray400,foreground:a.default.lightGray300},primary:{normal:{background:a.default.green500,border:a.default.green500},hover:{background:a.default.green700,border:a.default.green700},focus:{border:a.default.green700,shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700}},secondary:{normal:{background:a.default.darkGray300,border:a.default.darkGray300},hover:{background:a.default.darkGray500,border:a.default.darkGray500},focus:{border:a.default.darkGray500,shadowInset:a.default.darkGray500},active:{background:a.default.darkGray500,border:a.default.darkGray500}},success:{normal:{background:a.default.green500,border:a.default.green500},hover:{background:a.default.green700,border:a.default.green700},focus:{border:a.default.green700,shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700}},critical:{normal:{background:a.default.red500,border:a.default.red500},hover:{background:a.default.red700,border:a.default.red700},focus:{border:a.default.red700,shadowInset:a.default.red700},active:{background:a.default.red700,border:a.default.red700}},info:{normal:{background:a.default.blue300,border:a.default.blue300},hover:{background:a.default.blue500,border:a.default.blue500},focus:{border:a.default.blue500,shadowInset:a.default.blue500},active:{background:a.default.blue500,border:a.default.blue500}}},outline:{background:a.default.lightGray000,hover:{foreground:a.default.lightGray000},disabled:{border:a.default.lightGray400,foreground:a.default.lightGray400},primary:{normal:{border:a.default.green500,foreground:a.default.green500},hover:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000},focus:{shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000}},secondary:{normal:{border:a.default.darkGray300,foreground:a.default.darkGray300},hover:{background:a.default.darkGray500,border:a.default.darkGray500,foreground:a.default.lightGray000},focus:{shadowInset:a.default.darkGray500},active:{background:a.default.darkGray500,border:a.default.darkGray500,foreground:a.default.lightGray000}},success:{normal:{border:a.default.green500,foreground:a.default.green500},hover:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000},focus:{shadowInset:a.default.green700},active:{background:a.default.green700,border:a.default.green700,foreground:a.default.lightGray000}},critical:{normal:{border:a.default.red500,foreground:a.default.red500},hover:{background:a.default.red700,border:a.default.red700,foreground:a.default.lightGray000},focus:{shadowInset:a.default.red700},active:{background:a.default.red700,border:a.default.red700,foreground:a.default.lightGray000}},info:{normal:{border:a.default.blue300,foreground:a.default.blue300},hover:{background:a.default.blue500,border:a.default.blue500,foreground:a.default.lightGray000},focus:{shadowInset:a.default.blue500},active:{background:a.default.blue500,border:a.default.blue500,foreground:a.default.lightGray000}}},link:{disabled:{foreground:a.default.lightGray400},primary:{normal:{foreground:a.default.green500},hover:{foreground:a.default.green700},active:{foreground:a.default.green700}},secondary:{normal:{foreground:a.default.darkGray300},hover:{foreground:a.default.darkGray600},active:{foreground:a.default.darkGray600}},success:{normal:{foreground:a.default.green500},hover:{foreground:a.default.green700},active:{foreground:a.default.green700}},critical:{normal:{foreground:a.default.red500},hover:{foreground:a.default.red700},active:{foreground:a.default.red700}},info:{normal:{foreground:a.default.blue300},hover:{foreground:a.default.blue500},active:{foreground:a.default.blue500}}}},card:{background:a.default.lightGray000,stack:{background:a.default.lightGray100},compact:{header:{icon:{fill:a.default.darkGray300}},content:{title:a.default.darkGray900,foreground:a.default.darkGray900,link:a.default.green500}},full:{header:{logo:{background:a.default.lightGray100,foreground:a.default.darkGray700},icon:{fill:a.default.lightGray100,foreground:a.default.lightGray100},image:{background:a.default.lightGray300,foreground:a.default.lightGray100}},content:{title:a.default.green500,subtitle:a.default.lightGray500,icon:a.default.darkGray700},footer:{background:a.default.lightGray100}}},checkbox:{foreground:a.default.darkGray900,normal:{border:a.default.lightGray500},focus:{border:a.default.green500},check:{background:a.default.green500}},contentHeader:{background:a.default.lightGray000,foreground:a.default.darkGray900},datePicker:{background:a.default.lightGray000,header:{border:a.default.lightGray300,color:a.default.darkGray300},day:{color:a.default.lightGray500,selected:{background:a.default.lightGray300,foreground:a.default.darkGray900,hover:a.default.lightGray300}},selectDate:{background:a.default.lightGray000,border:{closed:a.default.lightGray500,open:a.default.green500},left:{color:a.default.darkGray900,placeholderColor:a.default.lightGray500},right:{border:a.default.lightGray500}},today:{border:a.default.lightGray300,color:a.default.green500},close:{background:a.default.darkGray700,color:a.default.lightGray000}},foundation:{background:a.default.lightGray000,border:a.default.darkGray300,foreground:a.default.darkGray900},hero:{title:a.default.green500,content:a.default.darkGray900},menu:{background:a.default.lightGray000,border:a.default.lightGray500,rail:a.default.green500,subItem:{border:a.default.lightGray300,normal:{color:a.default.lightGray500},hover:{color:a.default.darkGray900},selected:{color:a.default.green500}},item:{normal:{color:a.default.lightGray500},hover:{color:a.default.darkGray900},selected:{color:a.default.darkGray900,background:a.default.lightGray100}},footer:{background:a.default.lightGray300,color:a.default.darkGray300}},modal:{backdrop:a.default.darkGray900,closeButton:a.default.darkGray300,title:{foreground:a.default.darkGray300}},nodeEditor:{background:a.default.lightGray100},note:{normal:{background:a.default.lightGray100},cli:{foreground:a.default.lightGray000,background:a.default.darkGray600}},pagination:{button:{caret:{fill:a.default.darkGray300},number:{background:a.default.lightGray100,border:a.default.lightGray100,foreground:a.default.darkGray900,selected:{background:a.default.lightGray000,border:a.default.lightGray500,shadow:"1px 2px 2px 0 rgba(0, 0, 0, 0.15)"},shadow:"1px 1px 1px 0 rgba(0, 0, 0, 0.20)"}},input:{background:a.default.lightGray100,border:a.default.lightGray300,foreground:a.default.darkGray900}},progress:{background:a.default.lightGray100,border:a.default.lightGray300,progressBar:{primary:{background:a.default.green500},secondary:{background:a.default.darkGray300},success:{background:a.default.green700},warning:{background:a.default.orange500},critical:{background:a.default.red500},info:{background:a.default.blue300}}},radio:{foreground:a.default.darkGray900,normal:{border:a.default.lightGray500},focus:{border:a.default.green500},check:{background:a.default.green500}},result:{background:a.default.lightGray100,border:a.default.lightGray300,detailsBackground:a.default.lightGray300,statusBackground:a.default.lightGray300,statusForeground:a.default.darkGray900},select:{clearIndicator:{normal:{foreground:a.default.lightGray500},hover:{foreground:a.default.darkGray500}},control:{normal:{background:a.default.lightGray100,border:a.default.lightGray500},active:{background:a.default.lightGray100,border:a.default.green500},disabled:{background:a.default.lightGray300,border:a.default.lightGray500},invalid:{border:a.default.red500}},dropdownIndicator:{normal:{foreground:a.default.lightGray500},hover:{foreground:a.default.darkGray500},open:{foreground:a.default.darkGray500}},group:{border:a.default.lightGray300},groupHeading:{foreground:a.default.darkGray300},icon:{normal:{fill:a.default.lightGray500},focused:{fill:a.default.green500},disabled:{fill:a.default.lightGray500}},indicatorSeparator:{background:a.default.lightGray500},input:{foreground:a.default.darkGray500},menu:{background:a.default.lightGray000},multiValue:{background:a.default.lightGray300},multiValueLabel:{foreground:a.default.darkGray500},multiValueRemove:{normal:{background:a.default.lightGray300,foreground:a.default.darkGray500},hover:{background:a.default.lightGray500,foreground:a.default.lightGray100}},noOptionsMessage:{foreground:a.default.darkGray300},option:{normal:{background:a.default.lightGray000,foreground:a.default.darkGray300},hover:{background:a.default.lightGray300},selected:{check:a.default.green500,foreground:a.default.darkGray900},disabled:{foreground:a.default.lightGray300}},placeholder:{foreground:a.default.lightGray500},singleValue:{normal:{foreground:a.default.darkGray500},active:{foreground:a.default.darkGray700},disabled:{foreground:a.default.lightGray500}},validationMessage:{foreground:a.default.red500}},sidePanel:{background:a.default.lightGray000,border:a.default.lightGray300},slider:{handle:{background:a.default.lightGray100,border:a.default.green500,innerShadow:`inset 1.5px 1.5px 1px 0 ${a.default.lightGray000}`,shadow:"rgba(0,0,0,0.14)"},tooltip:{background:a.default.lightGray000,border:a.default.green500,foreground:a.default.green500},mark:{foreground:a.default.lightGray500,normal:{background:a.default.lightGray300,border:a.default.lightGray500},active:{background:a.default.lightGray000,border:a.default.green500}},track:{background:a.default.green500},rail:{background:a.default.lightGray100,shadow:"inset 0 1px 5px 0 rgba(0,0,0,0.3)"}},spinner:{color:a.default.green700,glow:a.default.green700},switch:{foreground:a.default.darkGray900,normal:{background:a.default.darkGray300},checked:{background:a.default.green500},disabled:{border:a.default.lightGray500,normal:{background:a.default.lightGray300},checked:{background:a.default.lightGray500}},check:{background:a.default.lightGray100,innerShadow:"inset -0.5px -0.5px 1px 0 rgba(0,0,0,0.2)"},contextLabels:{on:{foreground:a.default.lightGray000},off:{foreground:a.default.lightGray000}}},table:{header:{background:a.default.darkGray700,columnFilterIndicator:a.default.lightGray500,columnFilterIndicatorActive:a.default.green700,foreground:a.default.lightGray000,resizer:a.default.lightGray500,sortActive:a.default.lightGray000,sortInActive:a.default.lightGray300,actionBackground:a.default.lightGray000,actionDisabled:a.default.lightGray300,actionForeground:a.default.darkGray900,actionHoverBackground:a.default.lightGray300,actionHoverForeground:a.default.darkGray300},body:{background:a.default.lightGray000,backgroundExpandedRow:a.default.lightGray100,backgroundHover:a.default.lightGray100,border:a.default.lightGray300,foreground:a.default.darkGray900},result:{background:a.default.lightGray100,border:a.default.lightGray300,iconBackground:a.default.darkGray500}},tab:{bar:{border:a.default.lightGray300},normal:{foreground:a.default.lightGray500},hover:{border:a.default.green500,foreground:a.default.green500},active:{border:a.default.green700,foreground:a.default.green700},selected:{border:a.default.green500,foreground:a.default.green500},disabled:{foreground:a.default.lightGray300}},tag:{gray:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.darkGray500},hover:{background:a.default.darkGray300}},outline:{background:a.default.darkGray300,border:a.default.lightGray500,foreground:a.default.lightGray300}},red:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.red500},hover:{background:a.default.red700}},outline:{background:a.default.red700,border:a.default.red500,foreground:a.default.red500}},orange:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.orange500},hover:{background:a.default.orange700}},outline:{background:a.default.orange700,border:a.default.orange500,foreground:a.default.orange500}},green:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.green500},hover:{background:a.default.green700}},outline:{background:a.default.green700,border:a.default.green500,foreground:a.default.green500}},darkGreen:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.darkGreen500},hover:{background:a.default.darkGreen700}},outline:{background:a.default.darkGreen700,border:a.default.darkGreen500,foreground:a.default.darkGreen500}},teal:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.teal500},hover:{background:a.default.teal700}},outline:{background:a.default.teal700,border:a.default.teal500,foreground:a.default.teal500}},blue:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.blue500},hover:{background:a.default.blue700}},outline:{background:a.default.blue700,border:a.default.blue500,foreground:a.default.blue500}},purple:{solid:{foreground:a.default.lightGray000,normal:{background:a.default.purple500},hover:{background:a.default.purple700}},outline:{background:a.default.purple700,border:a.default.purple500,foreground:a.default.purple500}}},tagEditor:{background:a.default.lightGray000,border:a.default.lightGray500,foreground:a.default.darkGray700},textbox:{placeholder:a.default.lightGray500,validationMessage:a.default.red500,icon:{color:a.default.green500},normal:{background:a.default.lightGray100,border:a.default.lightGray500,foreground:a.default.darkGray700},focus:{border:a.default.green500},disabled:{border:a.default.lightGray300,foreground:a.default.lightGray500},invalid:{border:a.default.red500}},timebox:{background:a.default.lightGray000,label:{foreground:a.default.lightGray500},normal:{border:a.default.lightGray500,foreground:a.default.darkGray700},hover:{background:a.default.lightGray300},focus:{background:a.default.green500,border:a.default.green500,foreground:a.default.lightGray000},disabled:{background:a.default.lightGray300,border:a.default.lightGray500,foreground:a.default.lightGray500}},tooltip:{background:a.default.lightGray000,normal:{foreground:a.default.darkGray700,border:a.default.lightGray500},success:{foreground:a.default.green500,border:a.default.green500},warning:{foreground:a.default.orange500,border:a.default.orange500},critical:{foreground:a.default.red500,border:a.default.red500},info:{foreground:a.default.blue500,border:a.default.blue500}},visualization:{border:a.default.lightGray300,donut:{subtitle:a.default.darkGray300,title:a.default.darkGray500},hover:a.default.green500,label:a.default.lightGray500,tooltip:{inverse:a.default.darkGray900,normal:a.default.lightGray100}}};t.default=Object.assign(Object.assign({},a.default),o)},5841:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(90064));t.default=Object.assign({},a.default)},55483:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(11770)),o=n(r(5841)),u=n(r(9367)),i=n(r(13894)),l=n(r(76765)),d={name:"enterpriseLight",darkMode:!1,colors:a.default,elevation:o.default,spacing:i.default,mixins:u.default,typography:l.default};t.default=d},13894:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(47628));t.default=Object.assign({},a.default)},76765:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(30868));t.default=Object.assign({},a.default)},41493:function(e,t,r){"use strict";var n=this&&this.__createBinding||(Object.create?function(e,t,r,n){void 0===n&&(n=r);var a=Object.getOwnPropertyDescriptor(t,r);(!a||("get"in a?!t.__esModule:a.writable||a.configurable))&&(a={enumerable:!0,get:function(){return t[r]}}),Object.defineProperty(e,n,a)}:function(e,t,r,n){void 0===n&&(n=r),e[n]=t[r]}),a=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),o=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var r in e)"default"!==r&&Object.prototype.hasOwnProperty.call(e,r)&&n(t,e,r);return a(t,e),t},u=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.KaizenThemeProvider=t.KaizenThemeContext=t.KaizenThemes=t.useAppearance=void 0;let i=o(r(67294)),l=r(85444),d=u(r(55145));t.useAppearance=d.default;let f=u(r(40665));t.KaizenThemes=f.default,t.KaizenThemeContext=i.createContext(f.default.enterpriseLight),t.KaizenThemeProvider=({themeName:e,theme:r,children:n})=>{let a=null!=r?r:f.default.enterpriseLight;return e&&(a=f.default[e]),i.createElement(t.KaizenThemeContext.Provider,{value:a},i.createElement(l.ThemeProvider,{theme:a},n))}},40665:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let a=n(r(55483)),o=n(r(68226)),u={enterpriseLight:a.default,enterpriseDark:o.default};t.default=u},55145:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0});let n=r(67294),a=r(25394);t.default=(e="light",{element:t=null==document?void 0:document.body,lightClassName:o="light-mode",darkClassName:u="dark-mode",onChange:i,storageKey:l="kui:appearance"}={})=>{var d;let f=null===(d=null===r.g||void 0===r.g?void 0:r.g.matchMedia)||void 0===d?void 0:d.call(r.g,"(prefers-color-scheme: dark)"),s="string"==typeof t?document.querySelector(t):t,[c,h]=(0,a.usePersistedState)(l,e),g=({matches:e})=>h(e?"dark":"light");(0,n.useEffect)(()=>(null==f||f.addEventListener("change",g),()=>{null==f||f.removeEventListener("change",g)}),[]);let y=(0,n.useMemo)(()=>e=>{null==s||s.classList.add("dark"===e?u:o),null==s||s.classList.remove("dark"===e?o:u)},[i,t,u,o]);return(0,n.useEffect)(()=>{y(c)},[y,c]),{appearance:c,setLight:(0,n.useCallback)(()=>h("light"),[h]),setDark:(0,n.useCallback)(()=>h("dark"),[h]),toggleAppearance:(0,n.useCallback)(()=>h("dark"===c?"light":"dark"),[c,h])}}},30868:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default={font:{body:"'Roboto', sans-serif",brand:"'Roboto', sans-serif",code:"'JetBrains Mono', 'Courier', monospace"},size:{tiny:"0.625rem",small:"0.75rem",normal:"0.875rem",large:"1.25rem",larger:"1.5rem",giant:"2.625rem"},weight:{thin:100,extraLight:200,light:300,normal:400,medium:500,semiBold:600,bold:700,extraBold:800,black:900},lineHeight:{baseline:"1.25rem"},letterSpacing:{baseline:0}}},16991:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=(e="")=>{var t,r;return null!==(r=null===(t=e.match(/^[a-z]+|[A-Z][a-z]*/g))||void 0===t?void 0:t.map(e=>e[0].toUpperCase()+e.substr(1).toLowerCase()).join(" "))&&void 0!==r?r:e}},75131:function(e,t,r){"use strict";var n=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.copy=void 0;let a=n(r(67294));function o(e){let t=document.createElement("textarea");t.style.position="fixed",t.style.left="0",t.style.top="0",t.style.opacity="0",t.value=e,document.body.appendChild(t),t.focus(),t.select(),document.execCommand("copy"),document.body.removeChild(t)}t.copy=o;let u=({value:e,onClick:t})=>r=>{o(e),t&&t(r)};t.default=({value:e,children:t})=>a.default.Children.map(t,t=>{var r;return a.default.cloneElement(t,{onClick:u({value:e,onClick:null===(r=t.props)||void 0===r?void 0:r.onClick})})})},85456:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=function(e,t,r){if(e){let n=URL.createObjectURL(e),a=document.createElement("a");a.download=`${t}.${r}`,a.href=n,a.click()}}},84537:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=function(e){let t=0;if(0===e.length)return t;for(let r=0;r<e.length;r+=1)t=(t<<5)-t+e.charCodeAt(r)|0;return t}},25394:function(e,t,r){"use strict";var n=this&&this.__createBinding||(Object.create?function(e,t,r,n){void 0===n&&(n=r);var a=Object.getOwnPropertyDescriptor(t,r);(!a||("get"in a?!t.__esModule:a.writable||a.configurable))&&(a={enumerable:!0,get:function(){return t[r]}}),Object.defineProperty(e,n,a)}:function(e,t,r,n){void 0===n&&(n=r),e[n]=t[r]}),a=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),o=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var r in e)"default"!==r&&Object.prototype.hasOwnProperty.call(e,r)&&n(t,e,r);return a(t,e),t},u=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0}),t.usePersistedState=t.sanitizeForCsv=t.RelativePortal=t.primitiveArrayEquals=t.isEmptyObject=t.hashString=t.downloadFileFromBlob=t.CopyOnClick=t.copy=t.camelCaseToHuman=void 0;let i=u(r(16991));t.camelCaseToHuman=i.default;let l=o(r(75131));t.CopyOnClick=l.default,Object.defineProperty(t,"copy",{enumerable:!0,get:function(){return l.copy}});let d=u(r(85456));t.downloadFileFromBlob=d.default;let f=u(r(84537));t.hashString=f.default;let s=u(r(48279));t.isEmptyObject=s.default;let c=u(r(97208));t.primitiveArrayEquals=c.default;let h=u(r(68354));t.RelativePortal=h.default;let g=u(r(84194));t.sanitizeForCsv=g.default;let y=u(r(63162));t.usePersistedState=y.default;let p={camelCaseToHuman:i.default,CopyOnClick:l.default,downloadFileFromBlob:d.default,hashString:f.default,isEmptyObject:s.default,primitiveArrayEquals:c.default,RelativePortal:h.default,sanitizeForCsv:g.default,usePersistedState:y.default};t.default=p},48279:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=function(e){for(let t in e)return!1;return!0}},97208:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=function(e,t,r=!0){return r&&(e.sort(),t.sort()),Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((e,r)=>e===t[r])}},68354:function(e,t,r){"use strict";var n=this&&this.__createBinding||(Object.create?function(e,t,r,n){void 0===n&&(n=r);var a=Object.getOwnPropertyDescriptor(t,r);(!a||("get"in a?!t.__esModule:a.writable||a.configurable))&&(a={enumerable:!0,get:function(){return t[r]}}),Object.defineProperty(e,n,a)}:function(e,t,r,n){void 0===n&&(n=r),e[n]=t[r]}),a=this&&this.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),o=this&&this.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var r in e)"default"!==r&&Object.prototype.hasOwnProperty.call(e,r)&&n(t,e,r);return a(t,e),t},u=this&&this.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(t,"__esModule",{value:!0});let i=o(r(67294)),l=u(r(73935)),d=u(r(93967)),f=u(r(85444)),s=u(r(96782)),c=f.default.div`
+  ${s.default.parent}
+`,h=f.default.div`
+  ${s.default.relative}
+  z-index: ${e=>e.zIndex};
+`,g=e=>{let{left:t,right:r,height:n,width:a,top:o}=e,u=window.pageXOffset,i=window.pageYOffset;return{top:o+i+8,right:r+u,bottom:o+i+n-8,left:t+u,height:n,width:a}},y=({children:e,onOutsideClick:t})=>{let[r,n]=(0,i.useState)(null);(0,i.useEffect)(()=>{let e=document.createElement("div");return n(e),document.body&&document.body.appendChild(e),()=>{document.body&&document.body.removeChild(e)}},[n]);let a=(0,i.useCallback)(e=>{!e.target.closest(".relative")&&t&&t(e)},[]);return((0,i.useEffect)(()=>{let e=null!==r&&t;return e&&document.addEventListener("click",a,!0),()=>{e&&document.removeEventListener("click",a,!0)}},[r]),r)?l.default.createPortal(e,r):null},p=({anchor:e,origin:t,portalWidth:r,portalHeight:n,ref:a})=>{if(!a)return{};let{left:o,top:u,bottom:i,right:l,width:d}=g(a.getBoundingClientRect()),f={"top-left":{left:o,top:i},"top-right":{left:l,top:i},"top-center":{left:o+d/2,top:i},"bottom-left":{left:o,top:u},"bottom-center":{left:o+d/2,top:u},"bottom-right":{left:l,top:u}}[e];t.indexOf("right")>-1&&(f.left-=r),t.indexOf("center")>-1&&(f.left-=r/2),t.indexOf("bottom")>-1&&(f.top-=n);let s=window.innerHeight+window.scrollY-(f.top+n);return s<0&&(f.top+=s),Object.assign(Object.assign({},f),{width:r,height:n})};t.default=function({Parent:e,anchor:t="top-left",children:r,height:n=50,onMouseLeave:a,onOutsideClick:o,origin:u="top-left",parentClassName:l,portalClassName:f,portalZIndex:s=50,width:g=200}){let[b,v]=(0,i.useState)(null),[,m]=(0,i.useState)(!0),k=(0,i.useCallback)(e=>{e&&null===b&&v(e)},[]);(0,i.useLayoutEffect)(()=>{let e=()=>m(e=>!e);return window.addEventListener("resize",e),()=>window.removeEventListener("resize",e)},[b,m]),(0,i.useEffect)(()=>{let e=r&&setInterval(()=>m(e=>!e),100);return()=>{e&&clearInterval(e)}},[m,r]);let G=p({ref:b,origin:u,anchor:t,portalWidth:g,portalHeight:n});return i.default.createElement(i.default.Fragment,null,i.default.createElement(c,{className:(0,d.default)("parent",l)},i.default.createElement("div",{ref:k},e)),r&&i.default.createElement(y,{onOutsideClick:o},i.default.createElement(h,{className:(0,d.default)("relative",f),style:G,onMouseLeave:a,zIndex:s},r)))}},84194:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=function(e){if("string"==typeof e){let t=e.replace(/"/g,'""');return/("|,)/.test(t)?`"${t}"`:t}return e}},96782:function(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0});let r=`
+  display: inline-flex;
+
+  > div {
+    display: inline-flex;
+  }
+`,n=`
+  z-index: 50;
+  position: absolute;
+`;t.default={parent:r,relative:n}},63162:function(e,t,r){"use strict";Object.defineProperty(t,"__esModule",{value:!0});let n=r(67294);t.default=function(e,t){let[r,a]=(0,n.useState)(t);return window.addEventListener("storage",({key:t,newValue:n})=>{t===e&&r!==n&&a(n)}),(0,n.useEffect)(()=>{r?localStorage.setItem(e,r):localStorage.removeItem(e)},[r]),[r,a]}},8679:function(e,t,r){"use strict";var n=r(59864),a={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},u={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},i={};function l(e){return n.isMemo(e)?u:i[e.$$typeof]||a}i[n.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},i[n.Memo]=u;var d=Object.defineProperty,f=Object.getOwnPropertyNames,s=Object.getOwnPropertySymbols,c=Object.getOwnPropertyDescriptor,h=Object.getPrototypeOf,g=Object.prototype;e.exports=function e(t,r,n){if("string"!=typeof r){if(g){var a=h(r);a&&a!==g&&e(t,a,n)}var u=f(r);s&&(u=u.concat(s(r)));for(var i=l(t),y=l(r),p=0;p<u.length;++p){var b=u[p];if(!o[b]&&!(n&&n[b])&&!(y&&y[b])&&!(i&&i[b])){var v=c(r,b);try{d(t,b,v)}catch(e){}}}}return t}},19596:function(e,t,r){"use strict";r.r(t),r.d(t,{default:function(){return y}});var n=r(8307),a=r(67294),o=r(88767),u=r(7347);function i(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}function l(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?i(Object(r),!0).forEach(function(t){(0,n.Z)(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):i(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}var d=l(l({},u.KaizenThemes.enterpriseDark),{},{colors:l({},u.KaizenThemes.enterpriseDark.colors)});r(96763);var f=r(85893);function s(e,t){var r=Object.keys(e);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(e);t&&(n=n.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),r.push.apply(r,n)}return r}var c=new o.QueryClient,h=function(e){var t=e.Component,r=e.pageProps;return e.router,(0,f.jsx)(t,function(e){for(var t=1;t<arguments.length;t++){var r=null!=arguments[t]?arguments[t]:{};t%2?s(Object(r),!0).forEach(function(t){(0,n.Z)(e,t,r[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(r)):s(Object(r)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(r,t))})}return e}({},r))},g=function(e){var t=e.children,r=(0,a.useState)(!1),n=r[0],o=r[1];return(0,a.useEffect)(function(){o(!0)},[]),(0,f.jsx)("div",{suppressHydrationWarning:!0,children:n?t:null})};function y(e){var t=e.Component,r=e.pageProps,n=e.router;return(0,f.jsx)(g,{children:(0,f.jsx)(o.QueryClientProvider,{client:c,children:(0,f.jsx)(u.KaizenThemeProvider,{theme:d,children:(0,f.jsx)(h,{Component:t,pageProps:r,router:n})})})})}},83454:function(e,t,r){"use strict";var n,a;e.exports=(null==(n=r.g.process)?void 0:n.env)&&"object"==typeof(null==(a=r.g.process)?void 0:a.env)?r.g.process:r(77663)},6840:function(e,t,r){(window.__NEXT_P=window.__NEXT_P||[]).push(["/_app",function(){return r(19596)}])},96763:function(){},77663:function(e){!function(){var t={229:function(e){var t,r,n,a=e.exports={};function o(){throw Error("setTimeout has not been defined")}function u(){throw Error("clearTimeout has not been defined")}function i(e){if(t===setTimeout)return setTimeout(e,0);if((t===o||!t)&&setTimeout)return t=setTimeout,setTimeout(e,0);try{return t(e,0)}catch(r){try{return t.call(null,e,0)}catch(r){return t.call(this,e,0)}}}!function(){try{t="function"==typeof setTimeout?setTimeout:o}catch(e){t=o}try{r="function"==typeof clearTimeout?clearTimeout:u}catch(e){r=u}}();var l=[],d=!1,f=-1;function s(){d&&n&&(d=!1,n.length?l=n.concat(l):f=-1,l.length&&c())}function c(){if(!d){var e=i(s);d=!0;for(var t=l.length;t;){for(n=l,l=[];++f<t;)n&&n[f].run();f=-1,t=l.length}n=null,d=!1,function(e){if(r===clearTimeout)return clearTimeout(e);if((r===u||!r)&&clearTimeout)return r=clearTimeout,clearTimeout(e);try{r(e)}catch(t){try{return r.call(null,e)}catch(t){return r.call(this,e)}}}(e)}}function h(e,t){this.fun=e,this.array=t}function g(){}a.nextTick=function(e){var t=Array(arguments.length-1);if(arguments.length>1)for(var r=1;r<arguments.length;r++)t[r-1]=arguments[r];l.push(new h(e,t)),1!==l.length||d||i(c)},h.prototype.run=function(){this.fun.apply(null,this.array)},a.title="browser",a.browser=!0,a.env={},a.argv=[],a.version="",a.versions={},a.on=g,a.addListener=g,a.once=g,a.off=g,a.removeListener=g,a.removeAllListeners=g,a.emit=g,a.prependListener=g,a.prependOnceListener=g,a.listeners=function(e){return[]},a.binding=function(e){throw Error("process.binding is not supported")},a.cwd=function(){return"/"},a.chdir=function(e){throw Error("process.chdir is not supported")},a.umask=function(){return 0}}},r={};function n(e){var a=r[e];if(void 0!==a)return a.exports;var o=r[e]={exports:{}},u=!0;try{t[e](o,o.exports,n),u=!1}finally{u&&delete r[e]}return o.exports}n.ab="//";var a=n(229);e.exports=a}()},69921:function(e,t){"use strict";var r="function"==typeof Symbol&&Symbol.for,n=r?Symbol.for("react.element"):60103,a=r?Symbol.for("react.portal"):60106,o=r?Symbol.for("react.fragment"):60107,u=r?Symbol.for("react.strict_mode"):60108,i=r?Symbol.for("react.profiler"):60114,l=r?Symbol.for("react.provider"):60109,d=r?Symbol.for("react.context"):60110,f=r?Symbol.for("react.async_mode"):60111,s=r?Symbol.for("react.concurrent_mode"):60111,c=r?Symbol.for("react.forward_ref"):60112,h=r?Symbol.for("react.suspense"):60113,g=r?Symbol.for("react.suspense_list"):60120,y=r?Symbol.for("react.memo"):60115,p=r?Symbol.for("react.lazy"):60116,b=r?Symbol.for("react.block"):60121,v=r?Symbol.for("react.fundamental"):60117,m=r?Symbol.for("react.responder"):60118,k=r?Symbol.for("react.scope"):60119;function G(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case n:switch(e=e.type){case f:case s:case o:case i:case u:case h:return e;default:switch(e=e&&e.$$typeof){case d:case c:case p:case y:case l:return e;default:return t}}case a:return t}}}function w(e){return G(e)===s}t.AsyncMode=f,t.ConcurrentMode=s,t.ContextConsumer=d,t.ContextProvider=l,t.Element=n,t.ForwardRef=c,t.Fragment=o,t.Lazy=p,t.Memo=y,t.Portal=a,t.Profiler=i,t.StrictMode=u,t.Suspense=h,t.isAsyncMode=function(e){return w(e)||G(e)===f},t.isConcurrentMode=w,t.isContextConsumer=function(e){return G(e)===d},t.isContextProvider=function(e){return G(e)===l},t.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===n},t.isForwardRef=function(e){return G(e)===c},t.isFragment=function(e){return G(e)===o},t.isLazy=function(e){return G(e)===p},t.isMemo=function(e){return G(e)===y},t.isPortal=function(e){return G(e)===a},t.isProfiler=function(e){return G(e)===i},t.isStrictMode=function(e){return G(e)===u},t.isSuspense=function(e){return G(e)===h},t.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===o||e===s||e===i||e===u||e===h||e===g||"object"==typeof e&&null!==e&&(e.$$typeof===p||e.$$typeof===y||e.$$typeof===l||e.$$typeof===d||e.$$typeof===c||e.$$typeof===v||e.$$typeof===m||e.$$typeof===k||e.$$typeof===b)},t.typeOf=G},59864:function(e,t,r){"use strict";e.exports=r(69921)},46747:function(e,t,r){"use strict";r.d(t,{QueryClient:function(){return n.S}});var n=r(56538),a=r(86755);r.o(a,"QueryClientProvider")&&r.d(t,{QueryClientProvider:function(){return a.QueryClientProvider}})},41909:function(e,t,r){"use strict";r.d(t,{E:function(){return o},j:function(){return a}});var n=console;function a(){return n}function o(e){n=e}},101:function(e,t,r){"use strict";r.d(t,{V:function(){return a}});var n=r(52288),a=new(function(){function e(){this.queue=[],this.transactions=0,this.notifyFn=function(e){e()},this.batchNotifyFn=function(e){e()}}var t=e.prototype;return t.batch=function(e){var t;this.transactions++;try{t=e()}finally{this.transactions--,this.transactions||this.flush()}return t},t.schedule=function(e){var t=this;this.transactions?this.queue.push(e):(0,n.A4)(function(){t.notifyFn(e)})},t.batchCalls=function(e){var t=this;return function(){for(var r=arguments.length,n=Array(r),a=0;a<r;a++)n[a]=arguments[a];t.schedule(function(){e.apply(void 0,n)})}},t.flush=function(){var e=this,t=this.queue;this.queue=[],t.length&&(0,n.A4)(function(){e.batchNotifyFn(function(){t.forEach(function(t){e.notifyFn(t)})})})},t.setNotifyFunction=function(e){this.notifyFn=e},t.setBatchNotifyFunction=function(e){this.batchNotifyFn=e},e}())},56538:function(e,t,r){"use strict";r.d(t,{S:function(){return G}});var n=r(87462),a=r(52288),o=r(94578),u=r(101),i=r(41909),l=function(){function e(){this.listeners=[]}var t=e.prototype;return t.subscribe=function(e){var t=this,r=e||function(){};return this.listeners.push(r),this.onSubscribe(),function(){t.listeners=t.listeners.filter(function(e){return e!==r}),t.onUnsubscribe()}},t.hasListeners=function(){return this.listeners.length>0},t.onSubscribe=function(){},t.onUnsubscribe=function(){},e}(),d=new(function(e){function t(){var t;return(t=e.call(this)||this).setup=function(e){var t;if(!a.sk&&(null==(t=window)?void 0:t.addEventListener)){var r=function(){return e()};return window.addEventListener("visibilitychange",r,!1),window.addEventListener("focus",r,!1),function(){window.removeEventListener("visibilitychange",r),window.removeEventListener("focus",r)}}},t}(0,o.Z)(t,e);var r=t.prototype;return r.onSubscribe=function(){this.cleanup||this.setEventListener(this.setup)},r.onUnsubscribe=function(){if(!this.hasListeners()){var e;null==(e=this.cleanup)||e.call(this),this.cleanup=void 0}},r.setEventListener=function(e){var t,r=this;this.setup=e,null==(t=this.cleanup)||t.call(this),this.cleanup=e(function(e){"boolean"==typeof e?r.setFocused(e):r.onFocus()})},r.setFocused=function(e){this.focused=e,e&&this.onFocus()},r.onFocus=function(){this.listeners.forEach(function(e){e()})},r.isFocused=function(){return"boolean"==typeof this.focused?this.focused:"undefined"==typeof document||[void 0,"visible","prerender"].includes(document.visibilityState)},t}(l)),f=new(function(e){function t(){var t;return(t=e.call(this)||this).setup=function(e){var t;if(!a.sk&&(null==(t=window)?void 0:t.addEventListener)){var r=function(){return e()};return window.addEventListener("online",r,!1),window.addEventListener("offline",r,!1),function(){window.removeEventListener("online",r),window.removeEventListener("offline",r)}}},t}(0,o.Z)(t,e);var r=t.prototype;return r.onSubscribe=function(){this.cleanup||this.setEventListener(this.setup)},r.onUnsubscribe=function(){if(!this.hasListeners()){var e;null==(e=this.cleanup)||e.call(this),this.cleanup=void 0}},r.setEventListener=function(e){var t,r=this;this.setup=e,null==(t=this.cleanup)||t.call(this),this.cleanup=e(function(e){"boolean"==typeof e?r.setOnline(e):r.onOnline()})},r.setOnline=function(e){this.online=e,e&&this.onOnline()},r.onOnline=function(){this.listeners.forEach(function(e){e()})},r.isOnline=function(){return"boolean"==typeof this.online?this.online:"undefined"==typeof navigator||void 0===navigator.onLine||navigator.onLine},t}(l));function s(e){return Math.min(1e3*Math.pow(2,e),3e4)}function c(e){return"function"==typeof(null==e?void 0:e.cancel)}var h=function(e){this.revert=null==e?void 0:e.revert,this.silent=null==e?void 0:e.silent};function g(e){return e instanceof h}var y=function(e){var t,r,n,o,u=this,i=!1;this.abort=e.abort,this.cancel=function(e){return null==t?void 0:t(e)},this.cancelRetry=function(){i=!0},this.continueRetry=function(){i=!1},this.continue=function(){return null==r?void 0:r()},this.failureCount=0,this.isPaused=!1,this.isResolved=!1,this.isTransportCancelable=!1,this.promise=new Promise(function(e,t){n=e,o=t});var l=function(t){u.isResolved||(u.isResolved=!0,null==e.onSuccess||e.onSuccess(t),null==r||r(),n(t))},g=function(t){u.isResolved||(u.isResolved=!0,null==e.onError||e.onError(t),null==r||r(),o(t))};!function n(){var o;if(!u.isResolved){try{o=e.fn()}catch(e){o=Promise.reject(e)}t=function(e){if(!u.isResolved&&(g(new h(e)),null==u.abort||u.abort(),c(o)))try{o.cancel()}catch(e){}},u.isTransportCancelable=c(o),Promise.resolve(o).then(l).catch(function(t){if(!u.isResolved){var o,l,c=null!=(o=e.retry)?o:3,h=null!=(l=e.retryDelay)?l:s,y="function"==typeof h?h(u.failureCount,t):h,p=!0===c||"number"==typeof c&&u.failureCount<c||"function"==typeof c&&c(u.failureCount,t);if(i||!p){g(t);return}u.failureCount++,null==e.onFail||e.onFail(u.failureCount,t),(0,a.Gh)(y).then(function(){if(!d.isFocused()||!f.isOnline())return new Promise(function(t){r=t,u.isPaused=!0,null==e.onPause||e.onPause()}).then(function(){r=void 0,u.isPaused=!1,null==e.onContinue||e.onContinue()})}).then(function(){i?g(t):n()})}})}}()},p=function(){function e(e){this.abortSignalConsumed=!1,this.hadObservers=!1,this.defaultOptions=e.defaultOptions,this.setOptions(e.options),this.observers=[],this.cache=e.cache,this.queryKey=e.queryKey,this.queryHash=e.queryHash,this.initialState=e.state||this.getDefaultState(this.options),this.state=this.initialState,this.meta=e.meta,this.scheduleGc()}var t=e.prototype;return t.setOptions=function(e){var t;this.options=(0,n.Z)({},this.defaultOptions,e),this.meta=null==e?void 0:e.meta,this.cacheTime=Math.max(this.cacheTime||0,null!=(t=this.options.cacheTime)?t:3e5)},t.setDefaultOptions=function(e){this.defaultOptions=e},t.scheduleGc=function(){var e=this;this.clearGcTimeout(),(0,a.PN)(this.cacheTime)&&(this.gcTimeout=setTimeout(function(){e.optionalRemove()},this.cacheTime))},t.clearGcTimeout=function(){this.gcTimeout&&(clearTimeout(this.gcTimeout),this.gcTimeout=void 0)},t.optionalRemove=function(){!this.observers.length&&(this.state.isFetching?this.hadObservers&&this.scheduleGc():this.cache.remove(this))},t.setData=function(e,t){var r,n,o=this.state.data,u=(0,a.SE)(e,o);return(null==(r=(n=this.options).isDataEqual)?void 0:r.call(n,o,u))?u=o:!1!==this.options.structuralSharing&&(u=(0,a.Q$)(o,u)),this.dispatch({data:u,type:"success",dataUpdatedAt:null==t?void 0:t.updatedAt}),u},t.setState=function(e,t){this.dispatch({type:"setState",state:e,setStateOptions:t})},t.cancel=function(e){var t,r=this.promise;return null==(t=this.retryer)||t.cancel(e),r?r.then(a.ZT).catch(a.ZT):Promise.resolve()},t.destroy=function(){this.clearGcTimeout(),this.cancel({silent:!0})},t.reset=function(){this.destroy(),this.setState(this.initialState)},t.isActive=function(){return this.observers.some(function(e){return!1!==e.options.enabled})},t.isFetching=function(){return this.state.isFetching},t.isStale=function(){return this.state.isInvalidated||!this.state.dataUpdatedAt||this.observers.some(function(e){return e.getCurrentResult().isStale})},t.isStaleByTime=function(e){return void 0===e&&(e=0),this.state.isInvalidated||!this.state.dataUpdatedAt||!(0,a.Kp)(this.state.dataUpdatedAt,e)},t.onFocus=function(){var e,t=this.observers.find(function(e){return e.shouldFetchOnWindowFocus()});t&&t.refetch(),null==(e=this.retryer)||e.continue()},t.onOnline=function(){var e,t=this.observers.find(function(e){return e.shouldFetchOnReconnect()});t&&t.refetch(),null==(e=this.retryer)||e.continue()},t.addObserver=function(e){-1===this.observers.indexOf(e)&&(this.observers.push(e),this.hadObservers=!0,this.clearGcTimeout(),this.cache.notify({type:"observerAdded",query:this,observer:e}))},t.removeObserver=function(e){-1!==this.observers.indexOf(e)&&(this.observers=this.observers.filter(function(t){return t!==e}),this.observers.length||(this.retryer&&(this.retryer.isTransportCancelable||this.abortSignalConsumed?this.retryer.cancel({revert:!0}):this.retryer.cancelRetry()),this.cacheTime?this.scheduleGc():this.cache.remove(this)),this.cache.notify({type:"observerRemoved",query:this,observer:e}))},t.getObserversCount=function(){return this.observers.length},t.invalidate=function(){this.state.isInvalidated||this.dispatch({type:"invalidate"})},t.fetch=function(e,t){var r,n,o,u,l,d,f=this;if(this.state.isFetching){if(this.state.dataUpdatedAt&&(null==t?void 0:t.cancelRefetch))this.cancel({silent:!0});else if(this.promise)return null==(r=this.retryer)||r.continueRetry(),this.promise}if(e&&this.setOptions(e),!this.options.queryFn){var s=this.observers.find(function(e){return e.options.queryFn});s&&this.setOptions(s.options)}var c=(0,a.mc)(this.queryKey),h=(0,a.G9)(),p={queryKey:c,pageParam:void 0,meta:this.meta};Object.defineProperty(p,"signal",{enumerable:!0,get:function(){if(h)return f.abortSignalConsumed=!0,h.signal}});var b={fetchOptions:t,options:this.options,queryKey:c,state:this.state,fetchFn:function(){return f.options.queryFn?(f.abortSignalConsumed=!1,f.options.queryFn(p)):Promise.reject("Missing queryFn")},meta:this.meta};return(null==(u=this.options.behavior)?void 0:u.onFetch)&&(null==(n=this.options.behavior)||n.onFetch(b)),this.revertState=this.state,this.state.isFetching&&this.state.fetchMeta===(null==(l=b.fetchOptions)?void 0:l.meta)||this.dispatch({type:"fetch",meta:null==(o=b.fetchOptions)?void 0:o.meta}),this.retryer=new y({fn:b.fetchFn,abort:null==h?void 0:null==(d=h.abort)?void 0:d.bind(h),onSuccess:function(e){f.setData(e),null==f.cache.config.onSuccess||f.cache.config.onSuccess(e,f),0===f.cacheTime&&f.optionalRemove()},onError:function(e){g(e)&&e.silent||f.dispatch({type:"error",error:e}),g(e)||(null==f.cache.config.onError||f.cache.config.onError(e,f),(0,i.j)().error(e)),0===f.cacheTime&&f.optionalRemove()},onFail:function(){f.dispatch({type:"failed"})},onPause:function(){f.dispatch({type:"pause"})},onContinue:function(){f.dispatch({type:"continue"})},retry:b.options.retry,retryDelay:b.options.retryDelay}),this.promise=this.retryer.promise,this.promise},t.dispatch=function(e){var t=this;this.state=this.reducer(this.state,e),u.V.batch(function(){t.observers.forEach(function(t){t.onQueryUpdate(e)}),t.cache.notify({query:t,type:"queryUpdated",action:e})})},t.getDefaultState=function(e){var t="function"==typeof e.initialData?e.initialData():e.initialData,r=void 0!==e.initialData?"function"==typeof e.initialDataUpdatedAt?e.initialDataUpdatedAt():e.initialDataUpdatedAt:0,n=void 0!==t;return{data:t,dataUpdateCount:0,dataUpdatedAt:n?null!=r?r:Date.now():0,error:null,errorUpdateCount:0,errorUpdatedAt:0,fetchFailureCount:0,fetchMeta:null,isFetching:!1,isInvalidated:!1,isPaused:!1,status:n?"success":"idle"}},t.reducer=function(e,t){var r,a;switch(t.type){case"failed":return(0,n.Z)({},e,{fetchFailureCount:e.fetchFailureCount+1});case"pause":return(0,n.Z)({},e,{isPaused:!0});case"continue":return(0,n.Z)({},e,{isPaused:!1});case"fetch":return(0,n.Z)({},e,{fetchFailureCount:0,fetchMeta:null!=(r=t.meta)?r:null,isFetching:!0,isPaused:!1},!e.dataUpdatedAt&&{error:null,status:"loading"});case"success":return(0,n.Z)({},e,{data:t.data,dataUpdateCount:e.dataUpdateCount+1,dataUpdatedAt:null!=(a=t.dataUpdatedAt)?a:Date.now(),error:null,fetchFailureCount:0,isFetching:!1,isInvalidated:!1,isPaused:!1,status:"success"});case"error":var o=t.error;if(g(o)&&o.revert&&this.revertState)return(0,n.Z)({},this.revertState);return(0,n.Z)({},e,{error:o,errorUpdateCount:e.errorUpdateCount+1,errorUpdatedAt:Date.now(),fetchFailureCount:e.fetchFailureCount+1,isFetching:!1,isPaused:!1,status:"error"});case"invalidate":return(0,n.Z)({},e,{isInvalidated:!0});case"setState":return(0,n.Z)({},e,t.state);default:return e}},e}(),b=function(e){function t(t){var r;return(r=e.call(this)||this).config=t||{},r.queries=[],r.queriesMap={},r}(0,o.Z)(t,e);var r=t.prototype;return r.build=function(e,t,r){var n,o=t.queryKey,u=null!=(n=t.queryHash)?n:(0,a.Rm)(o,t),i=this.get(u);return i||(i=new p({cache:this,queryKey:o,queryHash:u,options:e.defaultQueryOptions(t),state:r,defaultOptions:e.getQueryDefaults(o),meta:t.meta}),this.add(i)),i},r.add=function(e){this.queriesMap[e.queryHash]||(this.queriesMap[e.queryHash]=e,this.queries.push(e),this.notify({type:"queryAdded",query:e}))},r.remove=function(e){var t=this.queriesMap[e.queryHash];t&&(e.destroy(),this.queries=this.queries.filter(function(t){return t!==e}),t===e&&delete this.queriesMap[e.queryHash],this.notify({type:"queryRemoved",query:e}))},r.clear=function(){var e=this;u.V.batch(function(){e.queries.forEach(function(t){e.remove(t)})})},r.get=function(e){return this.queriesMap[e]},r.getAll=function(){return this.queries},r.find=function(e,t){var r=(0,a.I6)(e,t)[0];return void 0===r.exact&&(r.exact=!0),this.queries.find(function(e){return(0,a._x)(r,e)})},r.findAll=function(e,t){var r=(0,a.I6)(e,t)[0];return Object.keys(r).length>0?this.queries.filter(function(e){return(0,a._x)(r,e)}):this.queries},r.notify=function(e){var t=this;u.V.batch(function(){t.listeners.forEach(function(t){t(e)})})},r.onFocus=function(){var e=this;u.V.batch(function(){e.queries.forEach(function(e){e.onFocus()})})},r.onOnline=function(){var e=this;u.V.batch(function(){e.queries.forEach(function(e){e.onOnline()})})},t}(l),v=function(){function e(e){this.options=(0,n.Z)({},e.defaultOptions,e.options),this.mutationId=e.mutationId,this.mutationCache=e.mutationCache,this.observers=[],this.state=e.state||{context:void 0,data:void 0,error:null,failureCount:0,isPaused:!1,status:"idle",variables:void 0},this.meta=e.meta}var t=e.prototype;return t.setState=function(e){this.dispatch({type:"setState",state:e})},t.addObserver=function(e){-1===this.observers.indexOf(e)&&this.observers.push(e)},t.removeObserver=function(e){this.observers=this.observers.filter(function(t){return t!==e})},t.cancel=function(){return this.retryer?(this.retryer.cancel(),this.retryer.promise.then(a.ZT).catch(a.ZT)):Promise.resolve()},t.continue=function(){return this.retryer?(this.retryer.continue(),this.retryer.promise):this.execute()},t.execute=function(){var e,t=this,r="loading"===this.state.status,n=Promise.resolve();return r||(this.dispatch({type:"loading",variables:this.options.variables}),n=n.then(function(){null==t.mutationCache.config.onMutate||t.mutationCache.config.onMutate(t.state.variables,t)}).then(function(){return null==t.options.onMutate?void 0:t.options.onMutate(t.state.variables)}).then(function(e){e!==t.state.context&&t.dispatch({type:"loading",context:e,variables:t.state.variables})})),n.then(function(){return t.executeMutation()}).then(function(r){e=r,null==t.mutationCache.config.onSuccess||t.mutationCache.config.onSuccess(e,t.state.variables,t.state.context,t)}).then(function(){return null==t.options.onSuccess?void 0:t.options.onSuccess(e,t.state.variables,t.state.context)}).then(function(){return null==t.options.onSettled?void 0:t.options.onSettled(e,null,t.state.variables,t.state.context)}).then(function(){return t.dispatch({type:"success",data:e}),e}).catch(function(e){return null==t.mutationCache.config.onError||t.mutationCache.config.onError(e,t.state.variables,t.state.context,t),(0,i.j)().error(e),Promise.resolve().then(function(){return null==t.options.onError?void 0:t.options.onError(e,t.state.variables,t.state.context)}).then(function(){return null==t.options.onSettled?void 0:t.options.onSettled(void 0,e,t.state.variables,t.state.context)}).then(function(){throw t.dispatch({type:"error",error:e}),e})})},t.executeMutation=function(){var e,t=this;return this.retryer=new y({fn:function(){return t.options.mutationFn?t.options.mutationFn(t.state.variables):Promise.reject("No mutationFn found")},onFail:function(){t.dispatch({type:"failed"})},onPause:function(){t.dispatch({type:"pause"})},onContinue:function(){t.dispatch({type:"continue"})},retry:null!=(e=this.options.retry)?e:0,retryDelay:this.options.retryDelay}),this.retryer.promise},t.dispatch=function(e){var t=this;this.state=function(e,t){switch(t.type){case"failed":return(0,n.Z)({},e,{failureCount:e.failureCount+1});case"pause":return(0,n.Z)({},e,{isPaused:!0});case"continue":return(0,n.Z)({},e,{isPaused:!1});case"loading":return(0,n.Z)({},e,{context:t.context,data:void 0,error:null,isPaused:!1,status:"loading",variables:t.variables});case"success":return(0,n.Z)({},e,{data:t.data,error:null,status:"success",isPaused:!1});case"error":return(0,n.Z)({},e,{data:void 0,error:t.error,failureCount:e.failureCount+1,isPaused:!1,status:"error"});case"setState":return(0,n.Z)({},e,t.state);default:return e}}(this.state,e),u.V.batch(function(){t.observers.forEach(function(t){t.onMutationUpdate(e)}),t.mutationCache.notify(t)})},e}(),m=function(e){function t(t){var r;return(r=e.call(this)||this).config=t||{},r.mutations=[],r.mutationId=0,r}(0,o.Z)(t,e);var r=t.prototype;return r.build=function(e,t,r){var n=new v({mutationCache:this,mutationId:++this.mutationId,options:e.defaultMutationOptions(t),state:r,defaultOptions:t.mutationKey?e.getMutationDefaults(t.mutationKey):void 0,meta:t.meta});return this.add(n),n},r.add=function(e){this.mutations.push(e),this.notify(e)},r.remove=function(e){this.mutations=this.mutations.filter(function(t){return t!==e}),e.cancel(),this.notify(e)},r.clear=function(){var e=this;u.V.batch(function(){e.mutations.forEach(function(t){e.remove(t)})})},r.getAll=function(){return this.mutations},r.find=function(e){return void 0===e.exact&&(e.exact=!0),this.mutations.find(function(t){return(0,a.X7)(e,t)})},r.findAll=function(e){return this.mutations.filter(function(t){return(0,a.X7)(e,t)})},r.notify=function(e){var t=this;u.V.batch(function(){t.listeners.forEach(function(t){t(e)})})},r.onFocus=function(){this.resumePausedMutations()},r.onOnline=function(){this.resumePausedMutations()},r.resumePausedMutations=function(){var e=this.mutations.filter(function(e){return e.state.isPaused});return u.V.batch(function(){return e.reduce(function(e,t){return e.then(function(){return t.continue().catch(a.ZT)})},Promise.resolve())})},t}(l);function k(e,t){return null==e.getNextPageParam?void 0:e.getNextPageParam(t[t.length-1],t)}var G=function(){function e(e){void 0===e&&(e={}),this.queryCache=e.queryCache||new b,this.mutationCache=e.mutationCache||new m,this.defaultOptions=e.defaultOptions||{},this.queryDefaults=[],this.mutationDefaults=[]}var t=e.prototype;return t.mount=function(){var e=this;this.unsubscribeFocus=d.subscribe(function(){d.isFocused()&&f.isOnline()&&(e.mutationCache.onFocus(),e.queryCache.onFocus())}),this.unsubscribeOnline=f.subscribe(function(){d.isFocused()&&f.isOnline()&&(e.mutationCache.onOnline(),e.queryCache.onOnline())})},t.unmount=function(){var e,t;null==(e=this.unsubscribeFocus)||e.call(this),null==(t=this.unsubscribeOnline)||t.call(this)},t.isFetching=function(e,t){var r=(0,a.I6)(e,t)[0];return r.fetching=!0,this.queryCache.findAll(r).length},t.isMutating=function(e){return this.mutationCache.findAll((0,n.Z)({},e,{fetching:!0})).length},t.getQueryData=function(e,t){var r;return null==(r=this.queryCache.find(e,t))?void 0:r.state.data},t.getQueriesData=function(e){return this.getQueryCache().findAll(e).map(function(e){return[e.queryKey,e.state.data]})},t.setQueryData=function(e,t,r){var n=(0,a._v)(e),o=this.defaultQueryOptions(n);return this.queryCache.build(this,o).setData(t,r)},t.setQueriesData=function(e,t,r){var n=this;return u.V.batch(function(){return n.getQueryCache().findAll(e).map(function(e){var a=e.queryKey;return[a,n.setQueryData(a,t,r)]})})},t.getQueryState=function(e,t){var r;return null==(r=this.queryCache.find(e,t))?void 0:r.state},t.removeQueries=function(e,t){var r=(0,a.I6)(e,t)[0],n=this.queryCache;u.V.batch(function(){n.findAll(r).forEach(function(e){n.remove(e)})})},t.resetQueries=function(e,t,r){var o=this,i=(0,a.I6)(e,t,r),l=i[0],d=i[1],f=this.queryCache,s=(0,n.Z)({},l,{active:!0});return u.V.batch(function(){return f.findAll(l).forEach(function(e){e.reset()}),o.refetchQueries(s,d)})},t.cancelQueries=function(e,t,r){var n=this,o=(0,a.I6)(e,t,r),i=o[0],l=o[1],d=void 0===l?{}:l;return void 0===d.revert&&(d.revert=!0),Promise.all(u.V.batch(function(){return n.queryCache.findAll(i).map(function(e){return e.cancel(d)})})).then(a.ZT).catch(a.ZT)},t.invalidateQueries=function(e,t,r){var o,i,l,d=this,f=(0,a.I6)(e,t,r),s=f[0],c=f[1],h=(0,n.Z)({},s,{active:null==(o=null!=(i=s.refetchActive)?i:s.active)||o,inactive:null!=(l=s.refetchInactive)&&l});return u.V.batch(function(){return d.queryCache.findAll(s).forEach(function(e){e.invalidate()}),d.refetchQueries(h,c)})},t.refetchQueries=function(e,t,r){var o=this,i=(0,a.I6)(e,t,r),l=i[0],d=i[1],f=Promise.all(u.V.batch(function(){return o.queryCache.findAll(l).map(function(e){return e.fetch(void 0,(0,n.Z)({},d,{meta:{refetchPage:null==l?void 0:l.refetchPage}}))})})).then(a.ZT);return(null==d?void 0:d.throwOnError)||(f=f.catch(a.ZT)),f},t.fetchQuery=function(e,t,r){var n=(0,a._v)(e,t,r),o=this.defaultQueryOptions(n);void 0===o.retry&&(o.retry=!1);var u=this.queryCache.build(this,o);return u.isStaleByTime(o.staleTime)?u.fetch(o):Promise.resolve(u.state.data)},t.prefetchQuery=function(e,t,r){return this.fetchQuery(e,t,r).then(a.ZT).catch(a.ZT)},t.fetchInfiniteQuery=function(e,t,r){var n=(0,a._v)(e,t,r);return n.behavior={onFetch:function(e){e.fetchFn=function(){var t,r,n,o,u,i,l,d=null==(t=e.fetchOptions)?void 0:null==(r=t.meta)?void 0:r.refetchPage,f=null==(n=e.fetchOptions)?void 0:null==(o=n.meta)?void 0:o.fetchMore,s=null==f?void 0:f.pageParam,h=(null==f?void 0:f.direction)==="forward",g=(null==f?void 0:f.direction)==="backward",y=(null==(u=e.state.data)?void 0:u.pages)||[],p=(null==(i=e.state.data)?void 0:i.pageParams)||[],b=(0,a.G9)(),v=null==b?void 0:b.signal,m=p,G=!1,w=e.options.queryFn||function(){return Promise.reject("Missing queryFn")},C=function(e,t,r,n){return m=n?[t].concat(m):[].concat(m,[t]),n?[r].concat(e):[].concat(e,[r])},x=function(t,r,n,a){if(G)return Promise.reject("Cancelled");if(void 0===n&&!r&&t.length)return Promise.resolve(t);var o=w({queryKey:e.queryKey,signal:v,pageParam:n,meta:e.meta}),u=Promise.resolve(o).then(function(e){return C(t,n,e,a)});return c(o)&&(u.cancel=o.cancel),u};if(y.length){if(h){var O=void 0!==s,S=O?s:k(e.options,y);l=x(y,O,S)}else if(g){var P,_=void 0!==s,A=_?s:null==(P=e.options).getPreviousPageParam?void 0:P.getPreviousPageParam(y[0],y);l=x(y,_,A,!0)}else!function(){m=[];var t=void 0===e.options.getNextPageParam;l=!d||!y[0]||d(y[0],0,y)?x([],t,p[0]):Promise.resolve(C([],p[0],y[0]));for(var r=function(r){l=l.then(function(n){if(!d||!y[r]||d(y[r],r,y)){var a=t?p[r]:k(e.options,n);return x(n,t,a)}return Promise.resolve(C(n,p[r],y[r]))})},n=1;n<y.length;n++)r(n)}()}else l=x([]);var E=l.then(function(e){return{pages:e,pageParams:m}});return E.cancel=function(){G=!0,null==b||b.abort(),c(l)&&l.cancel()},E}}},this.fetchQuery(n)},t.prefetchInfiniteQuery=function(e,t,r){return this.fetchInfiniteQuery(e,t,r).then(a.ZT).catch(a.ZT)},t.cancelMutations=function(){var e=this;return Promise.all(u.V.batch(function(){return e.mutationCache.getAll().map(function(e){return e.cancel()})})).then(a.ZT).catch(a.ZT)},t.resumePausedMutations=function(){return this.getMutationCache().resumePausedMutations()},t.executeMutation=function(e){return this.mutationCache.build(this,e).execute()},t.getQueryCache=function(){return this.queryCache},t.getMutationCache=function(){return this.mutationCache},t.getDefaultOptions=function(){return this.defaultOptions},t.setDefaultOptions=function(e){this.defaultOptions=e},t.setQueryDefaults=function(e,t){var r=this.queryDefaults.find(function(t){return(0,a.yF)(e)===(0,a.yF)(t.queryKey)});r?r.defaultOptions=t:this.queryDefaults.push({queryKey:e,defaultOptions:t})},t.getQueryDefaults=function(e){var t;return e?null==(t=this.queryDefaults.find(function(t){return(0,a.to)(e,t.queryKey)}))?void 0:t.defaultOptions:void 0},t.setMutationDefaults=function(e,t){var r=this.mutationDefaults.find(function(t){return(0,a.yF)(e)===(0,a.yF)(t.mutationKey)});r?r.defaultOptions=t:this.mutationDefaults.push({mutationKey:e,defaultOptions:t})},t.getMutationDefaults=function(e){var t;return e?null==(t=this.mutationDefaults.find(function(t){return(0,a.to)(e,t.mutationKey)}))?void 0:t.defaultOptions:void 0},t.defaultQueryOptions=function(e){if(null==e?void 0:e._defaulted)return e;var t=(0,n.Z)({},this.defaultOptions.queries,this.getQueryDefaults(null==e?void 0:e.queryKey),e,{_defaulted:!0});return!t.queryHash&&t.queryKey&&(t.queryHash=(0,a.Rm)(t.queryKey,t)),t},t.defaultQueryObserverOptions=function(e){return this.defaultQueryOptions(e)},t.defaultMutationOptions=function(e){return(null==e?void 0:e._defaulted)?e:(0,n.Z)({},this.defaultOptions.mutations,this.getMutationDefaults(null==e?void 0:e.mutationKey),e,{_defaulted:!0})},t.clear=function(){this.queryCache.clear(),this.mutationCache.clear()},e}()},86755:function(){},52288:function(e,t,r){"use strict";r.d(t,{A4:function(){return G},G9:function(){return w},Gh:function(){return k},I6:function(){return s},Kp:function(){return d},PN:function(){return i},Q$:function(){return function e(t,r){if(t===r)return t;var n=Array.isArray(t)&&Array.isArray(r);if(n||b(t)&&b(r)){for(var a=n?t.length:Object.keys(t).length,o=n?r:Object.keys(r),u=o.length,i=n?[]:{},l=0,d=0;d<u;d++){var f=n?d:o[d];i[f]=e(t[f],r[f]),i[f]===t[f]&&l++}return a===u&&l===a?t:i}return r}},Rm:function(){return g},SE:function(){return u},X7:function(){return h},ZT:function(){return o},_v:function(){return f},_x:function(){return c},mc:function(){return l},sk:function(){return a},to:function(){return p},yF:function(){return y}});var n=r(87462),a="undefined"==typeof window;function o(){}function u(e,t){return"function"==typeof e?e(t):e}function i(e){return"number"==typeof e&&e>=0&&e!==1/0}function l(e){return Array.isArray(e)?e:[e]}function d(e,t){return Math.max(e+(t||0)-Date.now(),0)}function f(e,t,r){return m(e)?"function"==typeof t?(0,n.Z)({},r,{queryKey:e,queryFn:t}):(0,n.Z)({},t,{queryKey:e}):e}function s(e,t,r){return m(e)?[(0,n.Z)({},t,{queryKey:e}),r]:[e||{},t]}function c(e,t){var r=e.active,n=e.exact,a=e.fetching,o=e.inactive,u=e.predicate,i=e.queryKey,l=e.stale;if(m(i)){if(n){if(t.queryHash!==g(i,t.options))return!1}else if(!p(t.queryKey,i))return!1}var d=!0===r&&!0===o||null==r&&null==o?"all":!1===r&&!1===o?"none":(null!=r?r:!o)?"active":"inactive";if("none"===d)return!1;if("all"!==d){var f=t.isActive();if("active"===d&&!f||"inactive"===d&&f)return!1}return("boolean"!=typeof l||t.isStale()===l)&&("boolean"!=typeof a||t.isFetching()===a)&&(!u||!!u(t))}function h(e,t){var r=e.exact,n=e.fetching,a=e.predicate,o=e.mutationKey;if(m(o)){if(!t.options.mutationKey)return!1;if(r){if(y(t.options.mutationKey)!==y(o))return!1}else if(!p(t.options.mutationKey,o))return!1}return("boolean"!=typeof n||"loading"===t.state.status===n)&&(!a||!!a(t))}function g(e,t){return((null==t?void 0:t.queryKeyHashFn)||y)(e)}function y(e){return JSON.stringify(l(e),function(e,t){return b(t)?Object.keys(t).sort().reduce(function(e,r){return e[r]=t[r],e},{}):t})}function p(e,t){return function e(t,r){return t===r||typeof t==typeof r&&!!t&&!!r&&"object"==typeof t&&"object"==typeof r&&!Object.keys(r).some(function(n){return!e(t[n],r[n])})}(l(e),l(t))}function b(e){if(!v(e))return!1;var t=e.constructor;if(void 0===t)return!0;var r=t.prototype;return!!(v(r)&&r.hasOwnProperty("isPrototypeOf"))}function v(e){return"[object Object]"===Object.prototype.toString.call(e)}function m(e){return"string"==typeof e||Array.isArray(e)}function k(e){return new Promise(function(t){setTimeout(t,e)})}function G(e){Promise.resolve().then(e).catch(function(e){return setTimeout(function(){throw e})})}function w(){if("function"==typeof AbortController)return new AbortController}},88767:function(e,t,r){"use strict";r.d(t,{QueryClient:function(){return n.QueryClient},QueryClientProvider:function(){return a.QueryClientProvider}});var n=r(46747);r.o(n,"QueryClientProvider")&&r.d(t,{QueryClientProvider:function(){return n.QueryClientProvider}});var a=r(31373)},31373:function(e,t,r){"use strict";r.d(t,{QueryClientProvider:function(){return f}});var n=r(101),a=r(73935).unstable_batchedUpdates;n.V.setBatchNotifyFunction(a);var o=r(41909),u=console;(0,o.E)(u);var i=r(67294),l=i.createContext(void 0),d=i.createContext(!1),f=function(e){var t=e.client,r=e.contextSharing,n=void 0!==r&&r,a=e.children;i.useEffect(function(){return t.mount(),function(){t.unmount()}},[t]);var o=n&&"undefined"!=typeof window?(window.ReactQueryClientContext||(window.ReactQueryClientContext=l),window.ReactQueryClientContext):l;return i.createElement(d.Provider,{value:n},i.createElement(o.Provider,{value:t},a))}},96774:function(e){e.exports=function(e,t,r,n){var a=r?r.call(n,e,t):void 0;if(void 0!==a)return!!a;if(e===t)return!0;if("object"!=typeof e||!e||"object"!=typeof t||!t)return!1;var o=Object.keys(e),u=Object.keys(t);if(o.length!==u.length)return!1;for(var i=Object.prototype.hasOwnProperty.bind(t),l=0;l<o.length;l++){var d=o[l];if(!i(d))return!1;var f=e[d],s=t[d];if(!1===(a=r?r.call(n,f,s,d):void 0)||void 0===a&&f!==s)return!1}return!0}},85444:function(e,t,r){"use strict";r.r(t),r.d(t,{ServerStyleSheet:function(){return e$},StyleSheetConsumer:function(){return eo},StyleSheetContext:function(){return ea},StyleSheetManager:function(){return es},ThemeConsumer:function(){return eE},ThemeContext:function(){return eA},ThemeProvider:function(){return ej},__PRIVATE__:function(){return ez},createGlobalStyle:function(){return eT},css:function(){return eG},default:function(){return eL},isStyledComponent:function(){return w},keyframes:function(){return eD},useTheme:function(){return eq},version:function(){return x},withTheme:function(){return eR}});var n=r(59864),a=r(67294),o=r(96774),u=r.n(o),i=function(e){function t(e,t,n){var a=t.trim().split(g);t=a;var o=a.length,u=e.length;switch(u){case 0:case 1:var i=0;for(e=0===u?"":e[0]+" ";i<o;++i)t[i]=r(e,t[i],n).trim();break;default:var l=i=0;for(t=[];i<o;++i)for(var d=0;d<u;++d)t[l++]=r(e[d]+" ",a[i],n).trim()}return t}function r(e,t,r){var n=t.charCodeAt(0);switch(33>n&&(n=(t=t.trim()).charCodeAt(0)),n){case 38:return t.replace(y,"$1"+e.trim());case 58:return e.trim()+t.replace(y,"$1"+e.trim());default:if(0<1*r&&0<t.indexOf("\f"))return t.replace(y,(58===e.charCodeAt(0)?"":"$1")+e.trim())}return e+t}function n(e,t,r,o){var u=e+";",i=2*t+3*r+4*o;if(944===i){e=u.indexOf(":",9)+1;var l=u.substring(e,u.length-1).trim();return l=u.substring(0,e).trim()+l+";",1===A||2===A&&a(l,1)?"-webkit-"+l+l:l}if(0===A||2===A&&!a(u,1))return u;switch(i){case 1015:return 97===u.charCodeAt(10)?"-webkit-"+u+u:u;case 951:return 116===u.charCodeAt(3)?"-webkit-"+u+u:u;case 963:return 110===u.charCodeAt(5)?"-webkit-"+u+u:u;case 1009:if(100!==u.charCodeAt(4))break;case 969:case 942:return"-webkit-"+u+u;case 978:return"-webkit-"+u+"-moz-"+u+u;case 1019:case 983:return"-webkit-"+u+"-moz-"+u+"-ms-"+u+u;case 883:if(45===u.charCodeAt(8))return"-webkit-"+u+u;if(0<u.indexOf("image-set(",11))return u.replace(O,"$1-webkit-$2")+u;break;case 932:if(45===u.charCodeAt(4))switch(u.charCodeAt(5)){case 103:return"-webkit-box-"+u.replace("-grow","")+"-webkit-"+u+"-ms-"+u.replace("grow","positive")+u;case 115:return"-webkit-"+u+"-ms-"+u.replace("shrink","negative")+u;case 98:return"-webkit-"+u+"-ms-"+u.replace("basis","preferred-size")+u}return"-webkit-"+u+"-ms-"+u+u;case 964:return"-webkit-"+u+"-ms-flex-"+u+u;case 1023:if(99!==u.charCodeAt(8))break;return"-webkit-box-pack"+(l=u.substring(u.indexOf(":",15)).replace("flex-","").replace("space-between","justify"))+"-webkit-"+u+"-ms-flex-pack"+l+u;case 1005:return c.test(u)?u.replace(s,":-webkit-")+u.replace(s,":-moz-")+u:u;case 1e3:switch(t=(l=u.substring(13).trim()).indexOf("-")+1,l.charCodeAt(0)+l.charCodeAt(t)){case 226:l=u.replace(m,"tb");break;case 232:l=u.replace(m,"tb-rl");break;case 220:l=u.replace(m,"lr");break;default:return u}return"-webkit-"+u+"-ms-"+l+u;case 1017:if(-1===u.indexOf("sticky",9))break;case 975:switch(t=(u=e).length-10,i=(l=(33===u.charCodeAt(t)?u.substring(0,t):u).substring(e.indexOf(":",7)+1).trim()).charCodeAt(0)+(0|l.charCodeAt(7))){case 203:if(111>l.charCodeAt(8))break;case 115:u=u.replace(l,"-webkit-"+l)+";"+u;break;case 207:case 102:u=u.replace(l,"-webkit-"+(102<i?"inline-":"")+"box")+";"+u.replace(l,"-webkit-"+l)+";"+u.replace(l,"-ms-"+l+"box")+";"+u}return u+";";case 938:if(45===u.charCodeAt(5))switch(u.charCodeAt(6)){case 105:return l=u.replace("-items",""),"-webkit-"+u+"-webkit-box-"+l+"-ms-flex-"+l+u;case 115:return"-webkit-"+u+"-ms-flex-item-"+u.replace(w,"")+u;default:return"-webkit-"+u+"-ms-flex-line-pack"+u.replace("align-content","").replace(w,"")+u}break;case 973:case 989:if(45!==u.charCodeAt(3)||122===u.charCodeAt(4))break;case 931:case 953:if(!0===x.test(e))return 115===(l=e.substring(e.indexOf(":")+1)).charCodeAt(0)?n(e.replace("stretch","fill-available"),t,r,o).replace(":fill-available",":stretch"):u.replace(l,"-webkit-"+l)+u.replace(l,"-moz-"+l.replace("fill-",""))+u;break;case 962:if(u="-webkit-"+u+(102===u.charCodeAt(5)?"-ms-"+u:"")+u,211===r+o&&105===u.charCodeAt(13)&&0<u.indexOf("transform",10))return u.substring(0,u.indexOf(";",27)+1).replace(h,"$1-webkit-$2")+u}return u}function a(e,t){var r=e.indexOf(1===t?":":"{"),n=e.substring(0,3!==t?r:10);return r=e.substring(r+1,e.length-1),M(2!==t?n:n.replace(C,"$1"),r,t)}function o(e,t){var r=n(t,t.charCodeAt(0),t.charCodeAt(1),t.charCodeAt(2));return r!==t+";"?r.replace(G," or ($1)").substring(4):"("+t+")"}function u(e,t,r,n,a,o,u,i,d,f){for(var s,c=0,h=t;c<F;++c)switch(s=j[c].call(l,e,h,r,n,a,o,u,i,d,f)){case void 0:case!1:case!0:case null:break;default:h=s}if(h!==t)return h}function i(e){return void 0!==(e=e.prefix)&&(M=null,e?"function"!=typeof e?A=1:(A=2,M=e):A=0),i}function l(e,r){var i=e;if(33>i.charCodeAt(0)&&(i=i.trim()),i=[i],0<F){var l=u(-1,r,i,i,P,S,0,0,0,0);void 0!==l&&"string"==typeof l&&(r=l)}var s=function e(r,i,l,s,c){for(var h,g,y,m,G,w=0,C=0,x=0,O=0,j=0,M=0,T=y=h=0,D=0,$=0,R=0,q=0,z=l.length,L=z-1,B="",N="",Z="",K="";D<z;){if(g=l.charCodeAt(D),D===L&&0!==C+O+x+w&&(0!==C&&(g=47===C?10:47),O=x=w=0,z++,L++),0===C+O+x+w){if(D===L&&(0<$&&(B=B.replace(f,"")),0<B.trim().length)){switch(g){case 32:case 9:case 59:case 13:case 10:break;default:B+=l.charAt(D)}g=59}switch(g){case 123:for(h=(B=B.trim()).charCodeAt(0),y=1,q=++D;D<z;){switch(g=l.charCodeAt(D)){case 123:y++;break;case 125:y--;break;case 47:switch(g=l.charCodeAt(D+1)){case 42:case 47:e:{for(T=D+1;T<L;++T)switch(l.charCodeAt(T)){case 47:if(42===g&&42===l.charCodeAt(T-1)&&D+2!==T){D=T+1;break e}break;case 10:if(47===g){D=T+1;break e}}D=T}}break;case 91:g++;case 40:g++;case 34:case 39:for(;D++<L&&l.charCodeAt(D)!==g;);}if(0===y)break;D++}if(y=l.substring(q,D),0===h&&(h=(B=B.replace(d,"").trim()).charCodeAt(0)),64===h){switch(0<$&&(B=B.replace(f,"")),g=B.charCodeAt(1)){case 100:case 109:case 115:case 45:$=i;break;default:$=E}if(q=(y=e(i,$,y,g,c+1)).length,0<F&&(G=u(3,y,$=t(E,B,R),i,P,S,q,g,c,s),B=$.join(""),void 0!==G&&0===(q=(y=G.trim()).length)&&(g=0,y="")),0<q)switch(g){case 115:B=B.replace(k,o);case 100:case 109:case 45:y=B+"{"+y+"}";break;case 107:y=(B=B.replace(p,"$1 $2"))+"{"+y+"}",y=1===A||2===A&&a("@"+y,3)?"@-webkit-"+y+"@"+y:"@"+y;break;default:y=B+y,112===s&&(N+=y,y="")}else y=""}else y=e(i,t(i,B,R),y,s,c+1);Z+=y,y=R=$=T=h=0,B="",g=l.charCodeAt(++D);break;case 125:case 59:if(1<(q=(B=(0<$?B.replace(f,""):B).trim()).length))switch(0===T&&(45===(h=B.charCodeAt(0))||96<h&&123>h)&&(q=(B=B.replace(" ",":")).length),0<F&&void 0!==(G=u(1,B,i,r,P,S,N.length,s,c,s))&&0===(q=(B=G.trim()).length)&&(B="\0\0"),h=B.charCodeAt(0),g=B.charCodeAt(1),h){case 0:break;case 64:if(105===g||99===g){K+=B+l.charAt(D);break}default:58!==B.charCodeAt(q-1)&&(N+=n(B,h,g,B.charCodeAt(2)))}R=$=T=h=0,B="",g=l.charCodeAt(++D)}}switch(g){case 13:case 10:47===C?C=0:0===1+h&&107!==s&&0<B.length&&($=1,B+="\0"),0<F*I&&u(0,B,i,r,P,S,N.length,s,c,s),S=1,P++;break;case 59:case 125:if(0===C+O+x+w){S++;break}default:switch(S++,m=l.charAt(D),g){case 9:case 32:if(0===O+w+C)switch(j){case 44:case 58:case 9:case 32:m="";break;default:32!==g&&(m=" ")}break;case 0:m="\\0";break;case 12:m="\\f";break;case 11:m="\\v";break;case 38:0===O+C+w&&($=R=1,m="\f"+m);break;case 108:if(0===O+C+w+_&&0<T)switch(D-T){case 2:112===j&&58===l.charCodeAt(D-3)&&(_=j);case 8:111===M&&(_=M)}break;case 58:0===O+C+w&&(T=D);break;case 44:0===C+x+O+w&&($=1,m+="\r");break;case 34:case 39:0===C&&(O=O===g?0:0===O?g:O);break;case 91:0===O+C+x&&w++;break;case 93:0===O+C+x&&w--;break;case 41:0===O+C+w&&x--;break;case 40:0===O+C+w&&(0===h&&(2*j+3*M==533||(h=1)),x++);break;case 64:0===C+x+O+w+T+y&&(y=1);break;case 42:case 47:if(!(0<O+w+x))switch(C){case 0:switch(2*g+3*l.charCodeAt(D+1)){case 235:C=47;break;case 220:q=D,C=42}break;case 42:47===g&&42===j&&q+2!==D&&(33===l.charCodeAt(q+2)&&(N+=l.substring(q,D+1)),m="",C=0)}}0===C&&(B+=m)}M=j,j=g,D++}if(0<(q=N.length)){if($=i,0<F&&void 0!==(G=u(2,N,$,r,P,S,q,s,c,s))&&0===(N=G).length)return K+N+Z;if(N=$.join(",")+"{"+N+"}",0!=A*_){switch(2!==A||a(N,2)||(_=0),_){case 111:N=N.replace(v,":-moz-$1")+N;break;case 112:N=N.replace(b,"::-webkit-input-$1")+N.replace(b,"::-moz-$1")+N.replace(b,":-ms-input-$1")+N}_=0}}return K+N+Z}(E,i,r,0,0);return 0<F&&void 0!==(l=u(-2,s,i,i,P,S,s.length,0,0,0))&&(s=l),_=0,S=P=1,s}var d=/^\0+/g,f=/[\0\r\f]/g,s=/: */g,c=/zoo|gra/,h=/([,: ])(transform)/g,g=/,\r+?/g,y=/([\t\r\n ])*\f?&/g,p=/@(k\w+)\s*(\S*)\s*/,b=/::(place)/g,v=/:(read-only)/g,m=/[svh]\w+-[tblr]{2}/,k=/\(\s*(.*)\s*\)/g,G=/([\s\S]*?);/g,w=/-self|flex-/g,C=/[^]*?(:[rp][el]a[\w-]+)[^]*/,x=/stretch|:\s*\w+\-(?:conte|avail)/,O=/([^-])(image-set\()/,S=1,P=1,_=0,A=1,E=[],j=[],F=0,M=null,I=0;return l.use=function e(t){switch(t){case void 0:case null:F=j.length=0;break;default:if("function"==typeof t)j[F++]=t;else if("object"==typeof t)for(var r=0,n=t.length;r<n;++r)e(t[r]);else I=0|!!t}return e},l.set=i,void 0!==e&&i(e),l},l={animationIterationCount:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1},d=r(45042),f=/^((children|dangerouslySetInnerHTML|key|ref|autoFocus|defaultValue|defaultChecked|innerHTML|suppressContentEditableWarning|suppressHydrationWarning|valueLink|abbr|accept|acceptCharset|accessKey|action|allow|allowUserMedia|allowPaymentRequest|allowFullScreen|allowTransparency|alt|async|autoComplete|autoPlay|capture|cellPadding|cellSpacing|challenge|charSet|checked|cite|classID|className|cols|colSpan|content|contentEditable|contextMenu|controls|controlsList|coords|crossOrigin|data|dateTime|decoding|default|defer|dir|disabled|disablePictureInPicture|disableRemotePlayback|download|draggable|encType|enterKeyHint|form|formAction|formEncType|formMethod|formNoValidate|formTarget|frameBorder|headers|height|hidden|high|href|hrefLang|htmlFor|httpEquiv|id|inputMode|integrity|is|keyParams|keyType|kind|label|lang|list|loading|loop|low|marginHeight|marginWidth|max|maxLength|media|mediaGroup|method|min|minLength|multiple|muted|name|nonce|noValidate|open|optimum|pattern|placeholder|playsInline|poster|preload|profile|radioGroup|readOnly|referrerPolicy|rel|required|reversed|role|rows|rowSpan|sandbox|scope|scoped|scrolling|seamless|selected|shape|size|sizes|slot|span|spellCheck|src|srcDoc|srcLang|srcSet|start|step|style|summary|tabIndex|target|title|translate|type|useMap|value|width|wmode|wrap|about|datatype|inlist|prefix|property|resource|typeof|vocab|autoCapitalize|autoCorrect|autoSave|color|incremental|fallback|inert|itemProp|itemScope|itemType|itemID|itemRef|on|option|results|security|unselectable|accentHeight|accumulate|additive|alignmentBaseline|allowReorder|alphabetic|amplitude|arabicForm|ascent|attributeName|attributeType|autoReverse|azimuth|baseFrequency|baselineShift|baseProfile|bbox|begin|bias|by|calcMode|capHeight|clip|clipPathUnits|clipPath|clipRule|colorInterpolation|colorInterpolationFilters|colorProfile|colorRendering|contentScriptType|contentStyleType|cursor|cx|cy|d|decelerate|descent|diffuseConstant|direction|display|divisor|dominantBaseline|dur|dx|dy|edgeMode|elevation|enableBackground|end|exponent|externalResourcesRequired|fill|fillOpacity|fillRule|filter|filterRes|filterUnits|floodColor|floodOpacity|focusable|fontFamily|fontSize|fontSizeAdjust|fontStretch|fontStyle|fontVariant|fontWeight|format|from|fr|fx|fy|g1|g2|glyphName|glyphOrientationHorizontal|glyphOrientationVertical|glyphRef|gradientTransform|gradientUnits|hanging|horizAdvX|horizOriginX|ideographic|imageRendering|in|in2|intercept|k|k1|k2|k3|k4|kernelMatrix|kernelUnitLength|kerning|keyPoints|keySplines|keyTimes|lengthAdjust|letterSpacing|lightingColor|limitingConeAngle|local|markerEnd|markerMid|markerStart|markerHeight|markerUnits|markerWidth|mask|maskContentUnits|maskUnits|mathematical|mode|numOctaves|offset|opacity|operator|order|orient|orientation|origin|overflow|overlinePosition|overlineThickness|panose1|paintOrder|pathLength|patternContentUnits|patternTransform|patternUnits|pointerEvents|points|pointsAtX|pointsAtY|pointsAtZ|preserveAlpha|preserveAspectRatio|primitiveUnits|r|radius|refX|refY|renderingIntent|repeatCount|repeatDur|requiredExtensions|requiredFeatures|restart|result|rotate|rx|ry|scale|seed|shapeRendering|slope|spacing|specularConstant|specularExponent|speed|spreadMethod|startOffset|stdDeviation|stemh|stemv|stitchTiles|stopColor|stopOpacity|strikethroughPosition|strikethroughThickness|string|stroke|strokeDasharray|strokeDashoffset|strokeLinecap|strokeLinejoin|strokeMiterlimit|strokeOpacity|strokeWidth|surfaceScale|systemLanguage|tableValues|targetX|targetY|textAnchor|textDecoration|textRendering|textLength|to|transform|u1|u2|underlinePosition|underlineThickness|unicode|unicodeBidi|unicodeRange|unitsPerEm|vAlphabetic|vHanging|vIdeographic|vMathematical|values|vectorEffect|version|vertAdvY|vertOriginX|vertOriginY|viewBox|viewTarget|visibility|widths|wordSpacing|writingMode|x|xHeight|x1|x2|xChannelSelector|xlinkActuate|xlinkArcrole|xlinkHref|xlinkRole|xlinkShow|xlinkTitle|xlinkType|xmlBase|xmlns|xmlnsXlink|xmlLang|xmlSpace|y|y1|y2|yChannelSelector|z|zoomAndPan|for|class|autofocus)|(([Dd][Aa][Tt][Aa]|[Aa][Rr][Ii][Aa]|x)-.*))$/,s=(0,d.Z)(function(e){return f.test(e)||111===e.charCodeAt(0)&&110===e.charCodeAt(1)&&91>e.charCodeAt(2)}),c=r(8679),h=r.n(c),g=r(83454);function y(){return(y=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(this,arguments)}var p=function(e,t){for(var r=[e[0]],n=0,a=t.length;n<a;n+=1)r.push(t[n],e[n+1]);return r},b=function(e){return null!==e&&"object"==typeof e&&"[object Object]"===(e.toString?e.toString():Object.prototype.toString.call(e))&&!(0,n.typeOf)(e)},v=Object.freeze([]),m=Object.freeze({});function k(e){return"function"==typeof e}function G(e){return e.displayName||e.name||"Component"}function w(e){return e&&"string"==typeof e.styledComponentId}var C=void 0!==g&&void 0!==g.env&&(g.env.REACT_APP_SC_ATTR||g.env.SC_ATTR)||"data-styled",x="5.3.11",O="undefined"!=typeof window&&"HTMLElement"in window,S=!!("boolean"==typeof SC_DISABLE_SPEEDY?SC_DISABLE_SPEEDY:void 0!==g&&void 0!==g.env&&(void 0!==g.env.REACT_APP_SC_DISABLE_SPEEDY&&""!==g.env.REACT_APP_SC_DISABLE_SPEEDY?"false"!==g.env.REACT_APP_SC_DISABLE_SPEEDY&&g.env.REACT_APP_SC_DISABLE_SPEEDY:void 0!==g.env.SC_DISABLE_SPEEDY&&""!==g.env.SC_DISABLE_SPEEDY&&"false"!==g.env.SC_DISABLE_SPEEDY&&g.env.SC_DISABLE_SPEEDY)),P={};function _(e){for(var t=arguments.length,r=Array(t>1?t-1:0),n=1;n<t;n++)r[n-1]=arguments[n];throw Error("An error occurred. See https://git.io/JUIaE#"+e+" for more information."+(r.length>0?" Args: "+r.join(", "):""))}var A=function(){function e(e){this.groupSizes=new Uint32Array(512),this.length=512,this.tag=e}var t=e.prototype;return t.indexOfGroup=function(e){for(var t=0,r=0;r<e;r++)t+=this.groupSizes[r];return t},t.insertRules=function(e,t){if(e>=this.groupSizes.length){for(var r=this.groupSizes,n=r.length,a=n;e>=a;)(a<<=1)<0&&_(16,""+e);this.groupSizes=new Uint32Array(a),this.groupSizes.set(r),this.length=a;for(var o=n;o<a;o++)this.groupSizes[o]=0}for(var u=this.indexOfGroup(e+1),i=0,l=t.length;i<l;i++)this.tag.insertRule(u,t[i])&&(this.groupSizes[e]++,u++)},t.clearGroup=function(e){if(e<this.length){var t=this.groupSizes[e],r=this.indexOfGroup(e),n=r+t;this.groupSizes[e]=0;for(var a=r;a<n;a++)this.tag.deleteRule(r)}},t.getGroup=function(e){var t="";if(e>=this.length||0===this.groupSizes[e])return t;for(var r=this.groupSizes[e],n=this.indexOfGroup(e),a=n+r,o=n;o<a;o++)t+=this.tag.getRule(o)+"/*!sc*/\n";return t},e}(),E=new Map,j=new Map,F=1,M=function(e){if(E.has(e))return E.get(e);for(;j.has(F);)F++;var t=F++;return E.set(e,t),j.set(t,e),t},I=function(e,t){t>=F&&(F=t+1),E.set(e,t),j.set(t,e)},T="style["+C+'][data-styled-version="5.3.11"]',D=RegExp("^"+C+'\\.g(\\d+)\\[id="([\\w\\d-]+)"\\].*?"([^"]*)'),$=function(e,t,r){for(var n,a=r.split(","),o=0,u=a.length;o<u;o++)(n=a[o])&&e.registerName(t,n)},R=function(e,t){for(var r=(t.textContent||"").split("/*!sc*/\n"),n=[],a=0,o=r.length;a<o;a++){var u=r[a].trim();if(u){var i=u.match(D);if(i){var l=0|parseInt(i[1],10),d=i[2];0!==l&&(I(d,l),$(e,d,i[3]),e.getTag().insertRules(l,n)),n.length=0}else n.push(u)}}},q=function(){return r.nc},z=function(e){var t=document.head,r=e||t,n=document.createElement("style"),a=function(e){for(var t=e.childNodes,r=t.length;r>=0;r--){var n=t[r];if(n&&1===n.nodeType&&n.hasAttribute(C))return n}}(r),o=void 0!==a?a.nextSibling:null;n.setAttribute(C,"active"),n.setAttribute("data-styled-version","5.3.11");var u=q();return u&&n.setAttribute("nonce",u),r.insertBefore(n,o),n},L=function(){function e(e){var t=this.element=z(e);t.appendChild(document.createTextNode("")),this.sheet=function(e){if(e.sheet)return e.sheet;for(var t=document.styleSheets,r=0,n=t.length;r<n;r++){var a=t[r];if(a.ownerNode===e)return a}_(17)}(t),this.length=0}var t=e.prototype;return t.insertRule=function(e,t){try{return this.sheet.insertRule(t,e),this.length++,!0}catch(e){return!1}},t.deleteRule=function(e){this.sheet.deleteRule(e),this.length--},t.getRule=function(e){var t=this.sheet.cssRules[e];return void 0!==t&&"string"==typeof t.cssText?t.cssText:""},e}(),B=function(){function e(e){var t=this.element=z(e);this.nodes=t.childNodes,this.length=0}var t=e.prototype;return t.insertRule=function(e,t){if(e<=this.length&&e>=0){var r=document.createTextNode(t),n=this.nodes[e];return this.element.insertBefore(r,n||null),this.length++,!0}return!1},t.deleteRule=function(e){this.element.removeChild(this.nodes[e]),this.length--},t.getRule=function(e){return e<this.length?this.nodes[e].textContent:""},e}(),N=function(){function e(e){this.rules=[],this.length=0}var t=e.prototype;return t.insertRule=function(e,t){return e<=this.length&&(this.rules.splice(e,0,t),this.length++,!0)},t.deleteRule=function(e){this.rules.splice(e,1),this.length--},t.getRule=function(e){return e<this.length?this.rules[e]:""},e}(),Z=O,K={isServer:!O,useCSSOMInjection:!S},Q=function(){function e(e,t,r){void 0===e&&(e=m),void 0===t&&(t={}),this.options=y({},K,{},e),this.gs=t,this.names=new Map(r),this.server=!!e.isServer,!this.server&&O&&Z&&(Z=!1,function(e){for(var t=document.querySelectorAll(T),r=0,n=t.length;r<n;r++){var a=t[r];a&&"active"!==a.getAttribute(C)&&(R(e,a),a.parentNode&&a.parentNode.removeChild(a))}}(this))}e.registerId=function(e){return M(e)};var t=e.prototype;return t.reconstructWithOptions=function(t,r){return void 0===r&&(r=!0),new e(y({},this.options,{},t),this.gs,r&&this.names||void 0)},t.allocateGSInstance=function(e){return this.gs[e]=(this.gs[e]||0)+1},t.getTag=function(){var e,t,r,n;return this.tag||(this.tag=(t=(e=this.options).isServer,r=e.useCSSOMInjection,n=e.target,new A(t?new N(n):r?new L(n):new B(n))))},t.hasNameForId=function(e,t){return this.names.has(e)&&this.names.get(e).has(t)},t.registerName=function(e,t){if(M(e),this.names.has(e))this.names.get(e).add(t);else{var r=new Set;r.add(t),this.names.set(e,r)}},t.insertRules=function(e,t,r){this.registerName(e,t),this.getTag().insertRules(M(e),r)},t.clearNames=function(e){this.names.has(e)&&this.names.get(e).clear()},t.clearRules=function(e){this.getTag().clearGroup(M(e)),this.clearNames(e)},t.clearTag=function(){this.tag=void 0},t.toString=function(){return function(e){for(var t=e.getTag(),r=t.length,n="",a=0;a<r;a++){var o,u=(o=a,j.get(o));if(void 0!==u){var i=e.names.get(u),l=t.getGroup(a);if(i&&l&&i.size){var d=C+".g"+a+'[id="'+u+'"]',f="";void 0!==i&&i.forEach(function(e){e.length>0&&(f+=e+",")}),n+=""+l+d+'{content:"'+f+'"}/*!sc*/\n'}}}return n}(this)},e}(),H=/(a)(d)/gi,U=function(e){return String.fromCharCode(e+(e>25?39:97))};function V(e){var t,r="";for(t=Math.abs(e);t>52;t=t/52|0)r=U(t%52)+r;return(U(t%52)+r).replace(H,"$1-$2")}var W=function(e,t){for(var r=t.length;r;)e=33*e^t.charCodeAt(--r);return e},Y=function(e){return W(5381,e)};function X(e){for(var t=0;t<e.length;t+=1){var r=e[t];if(k(r)&&!w(r))return!1}return!0}var J=Y("5.3.11"),ee=function(){function e(e,t,r){this.rules=e,this.staticRulesId="",this.isStatic=(void 0===r||r.isStatic)&&X(e),this.componentId=t,this.baseHash=W(J,t),this.baseStyle=r,Q.registerId(t)}return e.prototype.generateAndInjectStyles=function(e,t,r){var n=this.componentId,a=[];if(this.baseStyle&&a.push(this.baseStyle.generateAndInjectStyles(e,t,r)),this.isStatic&&!r.hash){if(this.staticRulesId&&t.hasNameForId(n,this.staticRulesId))a.push(this.staticRulesId);else{var o=em(this.rules,e,t,r).join(""),u=V(W(this.baseHash,o)>>>0);if(!t.hasNameForId(n,u)){var i=r(o,"."+u,void 0,n);t.insertRules(n,u,i)}a.push(u),this.staticRulesId=u}}else{for(var l=this.rules.length,d=W(this.baseHash,r.hash),f="",s=0;s<l;s++){var c=this.rules[s];if("string"==typeof c)f+=c;else if(c){var h=em(c,e,t,r),g=Array.isArray(h)?h.join(""):h;d=W(d,g+s),f+=g}}if(f){var y=V(d>>>0);if(!t.hasNameForId(n,y)){var p=r(f,"."+y,void 0,n);t.insertRules(n,y,p)}a.push(y)}}return a.join(" ")},e}(),et=/^\s*\/\/.*$/gm,er=[":","[",".","#"];function en(e){var t,r,n,a,o=void 0===e?m:e,u=o.options,l=void 0===u?m:u,d=o.plugins,f=void 0===d?v:d,s=new i(l),c=[],h=function(e){function t(t){if(t)try{e(t+"}")}catch(e){}}return function(r,n,a,o,u,i,l,d,f,s){switch(r){case 1:if(0===f&&64===n.charCodeAt(0))return e(n+";"),"";break;case 2:if(0===d)return n+"/*|*/";break;case 3:switch(d){case 102:case 112:return e(a[0]+n),"";default:return n+(0===s?"/*|*/":"")}case -2:n.split("/*|*/}").forEach(t)}}}(function(e){c.push(e)}),g=function(e,n,o){return 0===n&&-1!==er.indexOf(o[r.length])||o.match(a)?e:"."+t};function y(e,o,u,i){void 0===i&&(i="&");var l=e.replace(et,""),d=o&&u?u+" "+o+" { "+l+" }":l;return t=i,n=RegExp("\\"+(r=o)+"\\b","g"),a=RegExp("(\\"+r+"\\b){2,}"),s(u||!o?"":o,d)}return s.use([].concat(f,[function(e,t,a){2===e&&a.length&&a[0].lastIndexOf(r)>0&&(a[0]=a[0].replace(n,g))},h,function(e){if(-2===e){var t=c;return c=[],t}}])),y.hash=f.length?f.reduce(function(e,t){return t.name||_(15),W(e,t.name)},5381).toString():"",y}var ea=a.createContext(),eo=ea.Consumer,eu=a.createContext(),ei=(eu.Consumer,new Q),el=en();function ed(){return(0,a.useContext)(ea)||ei}function ef(){return(0,a.useContext)(eu)||el}function es(e){var t=(0,a.useState)(e.stylisPlugins),r=t[0],n=t[1],o=ed(),i=(0,a.useMemo)(function(){var t=o;return e.sheet?t=e.sheet:e.target&&(t=t.reconstructWithOptions({target:e.target},!1)),e.disableCSSOMInjection&&(t=t.reconstructWithOptions({useCSSOMInjection:!1})),t},[e.disableCSSOMInjection,e.sheet,e.target]),l=(0,a.useMemo)(function(){return en({options:{prefix:!e.disableVendorPrefixes},plugins:r})},[e.disableVendorPrefixes,r]);return(0,a.useEffect)(function(){u()(r,e.stylisPlugins)||n(e.stylisPlugins)},[e.stylisPlugins]),a.createElement(ea.Provider,{value:i},a.createElement(eu.Provider,{value:l},e.children))}var ec=function(){function e(e,t){var r=this;this.inject=function(e,t){void 0===t&&(t=el);var n=r.name+t.hash;e.hasNameForId(r.id,n)||e.insertRules(r.id,n,t(r.rules,n,"@keyframes"))},this.toString=function(){return _(12,String(r.name))},this.name=e,this.id="sc-keyframes-"+e,this.rules=t}return e.prototype.getName=function(e){return void 0===e&&(e=el),this.name+e.hash},e}(),eh=/([A-Z])/,eg=/([A-Z])/g,ey=/^ms-/,ep=function(e){return"-"+e.toLowerCase()};function eb(e){return eh.test(e)?e.replace(eg,ep).replace(ey,"-ms-"):e}var ev=function(e){return null==e||!1===e||""===e};function em(e,t,r,n){if(Array.isArray(e)){for(var a,o=[],u=0,i=e.length;u<i;u+=1)""!==(a=em(e[u],t,r,n))&&(Array.isArray(a)?o.push.apply(o,a):o.push(a));return o}return ev(e)?"":w(e)?"."+e.styledComponentId:k(e)?"function"!=typeof e||e.prototype&&e.prototype.isReactComponent||!t?e:em(e(t),t,r,n):e instanceof ec?r?(e.inject(r,n),e.getName(n)):e:b(e)?function e(t,r){var n,a=[];for(var o in t)t.hasOwnProperty(o)&&!ev(t[o])&&(Array.isArray(t[o])&&t[o].isCss||k(t[o])?a.push(eb(o)+":",t[o],";"):b(t[o])?a.push.apply(a,e(t[o],o)):a.push(eb(o)+": "+(null==(n=t[o])||"boolean"==typeof n||""===n?"":"number"!=typeof n||0===n||o in l||o.startsWith("--")?String(n).trim():n+"px")+";"));return r?[r+" {"].concat(a,["}"]):a}(e):e.toString()}var ek=function(e){return Array.isArray(e)&&(e.isCss=!0),e};function eG(e){for(var t=arguments.length,r=Array(t>1?t-1:0),n=1;n<t;n++)r[n-1]=arguments[n];return k(e)||b(e)?ek(em(p(v,[e].concat(r)))):0===r.length&&1===e.length&&"string"==typeof e[0]?e:ek(em(p(e,r)))}var ew=function(e,t,r){return void 0===r&&(r=m),e.theme!==r.theme&&e.theme||t||r.theme},eC=/[!"#$%&'()*+,./:;<=>?@[\\\]^`{|}~-]+/g,ex=/(^-|-$)/g;function eO(e){return e.replace(eC,"-").replace(ex,"")}var eS=function(e){return V(Y(e)>>>0)};function eP(e){return"string"==typeof e}var e_=function(e){return"function"==typeof e||"object"==typeof e&&null!==e&&!Array.isArray(e)},eA=a.createContext(),eE=eA.Consumer;function ej(e){var t=(0,a.useContext)(eA),r=(0,a.useMemo)(function(){var r;return(r=e.theme)?k(r)?r(t):Array.isArray(r)||"object"!=typeof r?_(8):t?y({},t,{},r):r:_(14)},[e.theme,t]);return e.children?a.createElement(eA.Provider,{value:r},e.children):null}var eF={},eM=function(e){return function e(t,r,a){if(void 0===a&&(a=m),!(0,n.isValidElementType)(r))return _(1,String(r));var o=function(){return t(r,a,eG.apply(void 0,arguments))};return o.withConfig=function(n){return e(t,r,y({},a,{},n))},o.attrs=function(n){return e(t,r,y({},a,{attrs:Array.prototype.concat(a.attrs,n).filter(Boolean)}))},o}(function e(t,r,n){var o=w(t),u=!eP(t),i=r.attrs,l=void 0===i?v:i,d=r.componentId,f=void 0===d?(x=r.displayName,O=r.parentComponentId,eF[S="string"!=typeof x?"sc":eO(x)]=(eF[S]||0)+1,P=S+"-"+eS("5.3.11"+S+eF[S]),O?O+"-"+P:P):d,c=r.displayName,g=void 0===c?eP(t)?"styled."+t:"Styled("+G(t)+")":c,p=r.displayName&&r.componentId?eO(r.displayName)+"-"+r.componentId:r.componentId||f,b=o&&t.attrs?Array.prototype.concat(t.attrs,l).filter(Boolean):l,C=r.shouldForwardProp;o&&t.shouldForwardProp&&(C=r.shouldForwardProp?function(e,n,a){return t.shouldForwardProp(e,n,a)&&r.shouldForwardProp(e,n,a)}:t.shouldForwardProp);var x,O,S,P,_,A=new ee(n,p,o?t.componentStyle:void 0),E=A.isStatic&&0===l.length,j=function(e,t){return function(e,t,r,n){var o,u,i,l,d,f=e.attrs,c=e.componentStyle,h=e.defaultProps,g=e.foldedComponentIds,p=e.shouldForwardProp,b=e.styledComponentId,v=e.target,G=(void 0===(o=ew(t,(0,a.useContext)(eA),h)||m)&&(o=m),u=y({},t,{theme:o}),i={},f.forEach(function(e){var t,r,n,a=e;for(t in k(a)&&(a=a(u)),a)u[t]=i[t]="className"===t?(r=i[t],n=a[t],r&&n?r+" "+n:r||n):a[t]}),[u,i]),w=G[0],C=G[1],x=(l=ed(),d=ef(),n?c.generateAndInjectStyles(m,l,d):c.generateAndInjectStyles(w,l,d)),O=C.$as||t.$as||C.as||t.as||v,S=eP(O),P=C!==t?y({},t,{},C):t,_={};for(var A in P)"$"!==A[0]&&"as"!==A&&("forwardedAs"===A?_.as=P[A]:(p?p(A,s,O):!S||s(A))&&(_[A]=P[A]));return t.style&&C.style!==t.style&&(_.style=y({},t.style,{},C.style)),_.className=Array.prototype.concat(g,b,x!==b?x:null,t.className,C.className).filter(Boolean).join(" "),_.ref=r,(0,a.createElement)(O,_)}(_,e,t,E)};return j.displayName=g,(_=a.forwardRef(j)).attrs=b,_.componentStyle=A,_.displayName=g,_.shouldForwardProp=C,_.foldedComponentIds=o?Array.prototype.concat(t.foldedComponentIds,t.styledComponentId):v,_.styledComponentId=p,_.target=o?t.target:t,_.withComponent=function(t){var a=r.componentId,o=function(e,t){if(null==e)return{};var r,n,a={},o=Object.keys(e);for(n=0;n<o.length;n++)t.indexOf(r=o[n])>=0||(a[r]=e[r]);return a}(r,["componentId"]),u=a&&a+"-"+(eP(t)?t:eO(G(t)));return e(t,y({},o,{attrs:b,componentId:u}),n)},Object.defineProperty(_,"defaultProps",{get:function(){return this._foldedDefaultProps},set:function(e){this._foldedDefaultProps=o?function e(t){for(var r=arguments.length,n=Array(r>1?r-1:0),a=1;a<r;a++)n[a-1]=arguments[a];for(var o=0;o<n.length;o++){var u=n[o];if(e_(u))for(var i in u)"__proto__"!==i&&"constructor"!==i&&"prototype"!==i&&function(t,r,n){var a=t[n];e_(r)&&e_(a)?e(a,r):t[n]=r}(t,u[i],i)}return t}({},t.defaultProps,e):e}}),Object.defineProperty(_,"toString",{value:function(){return"."+_.styledComponentId}}),u&&h()(_,t,{attrs:!0,componentStyle:!0,displayName:!0,foldedComponentIds:!0,shouldForwardProp:!0,styledComponentId:!0,target:!0,withComponent:!0}),_},e)};["a","abbr","address","area","article","aside","audio","b","base","bdi","bdo","big","blockquote","body","br","button","canvas","caption","cite","code","col","colgroup","data","datalist","dd","del","details","dfn","dialog","div","dl","dt","em","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","iframe","img","input","ins","kbd","keygen","label","legend","li","link","main","map","mark","marquee","menu","menuitem","meta","meter","nav","noscript","object","ol","optgroup","option","output","p","param","picture","pre","progress","q","rp","rt","ruby","s","samp","script","section","select","small","source","span","strong","style","sub","summary","sup","table","tbody","td","textarea","tfoot","th","thead","time","title","tr","track","u","ul","var","video","wbr","circle","clipPath","defs","ellipse","foreignObject","g","image","line","linearGradient","marker","mask","path","pattern","polygon","polyline","radialGradient","rect","stop","svg","text","textPath","tspan"].forEach(function(e){eM[e]=eM(e)});var eI=function(){function e(e,t){this.rules=e,this.componentId=t,this.isStatic=X(e),Q.registerId(this.componentId+1)}var t=e.prototype;return t.createStyles=function(e,t,r,n){var a=n(em(this.rules,t,r,n).join(""),""),o=this.componentId+e;r.insertRules(o,o,a)},t.removeStyles=function(e,t){t.clearRules(this.componentId+e)},t.renderStyles=function(e,t,r,n){e>2&&Q.registerId(this.componentId+e),this.removeStyles(e,r),this.createStyles(e,t,r,n)},e}();function eT(e){for(var t=arguments.length,r=Array(t>1?t-1:0),n=1;n<t;n++)r[n-1]=arguments[n];var o=eG.apply(void 0,[e].concat(r)),u="sc-global-"+eS(JSON.stringify(o)),i=new eI(o,u);function l(e){var t=ed(),r=ef(),n=(0,a.useContext)(eA),o=(0,a.useRef)(t.allocateGSInstance(u)).current;return t.server&&d(o,e,t,n,r),(0,a.useLayoutEffect)(function(){if(!t.server)return d(o,e,t,n,r),function(){return i.removeStyles(o,t)}},[o,e,t,n,r]),null}function d(e,t,r,n,a){if(i.isStatic)i.renderStyles(e,P,r,a);else{var o=y({},t,{theme:ew(t,n,l.defaultProps)});i.renderStyles(e,o,r,a)}}return a.memo(l)}function eD(e){for(var t=arguments.length,r=Array(t>1?t-1:0),n=1;n<t;n++)r[n-1]=arguments[n];var a=eG.apply(void 0,[e].concat(r)).join("");return new ec(eS(a),a)}var e$=function(){function e(){var e=this;this._emitSheetCSS=function(){var t=e.instance.toString();if(!t)return"";var r=q();return"<style "+[r&&'nonce="'+r+'"',C+'="true"','data-styled-version="5.3.11"'].filter(Boolean).join(" ")+">"+t+"</style>"},this.getStyleTags=function(){return e.sealed?_(2):e._emitSheetCSS()},this.getStyleElement=function(){if(e.sealed)return _(2);var t,r=((t={})[C]="",t["data-styled-version"]="5.3.11",t.dangerouslySetInnerHTML={__html:e.instance.toString()},t),n=q();return n&&(r.nonce=n),[a.createElement("style",y({},r,{key:"sc-0-0"}))]},this.seal=function(){e.sealed=!0},this.instance=new Q({isServer:!0}),this.sealed=!1}var t=e.prototype;return t.collectStyles=function(e){return this.sealed?_(2):a.createElement(es,{sheet:this.instance},e)},t.interleaveWithNodeStream=function(e){return _(3)},e}(),eR=function(e){var t=a.forwardRef(function(t,r){var n=ew(t,(0,a.useContext)(eA),e.defaultProps);return a.createElement(e,y({},t,{theme:n,ref:r}))});return h()(t,e),t.displayName="WithTheme("+G(e)+")",t},eq=function(){return(0,a.useContext)(eA)},ez={StyleSheet:Q,masterSheet:ei},eL=eM},93967:function(e,t){var r;!function(){"use strict";var n={}.hasOwnProperty;function a(){for(var e="",t=0;t<arguments.length;t++){var r=arguments[t];r&&(e=o(e,function(e){if("string"==typeof e||"number"==typeof e)return e;if("object"!=typeof e)return"";if(Array.isArray(e))return a.apply(null,e);if(e.toString!==Object.prototype.toString&&!e.toString.toString().includes("[native code]"))return e.toString();var t="";for(var r in e)n.call(e,r)&&e[r]&&(t=o(t,r));return t}(r)))}return e}function o(e,t){return t?e?e+" "+t:e+t:e}e.exports?(a.default=a,e.exports=a):void 0!==(r=(function(){return a}).apply(t,[]))&&(e.exports=r)}()},87462:function(e,t,r){"use strict";function n(){return(n=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var n in r)({}).hasOwnProperty.call(r,n)&&(e[n]=r[n])}return e}).apply(null,arguments)}r.d(t,{Z:function(){return n}})},94578:function(e,t,r){"use strict";r.d(t,{Z:function(){return a}});var n=r(89611);function a(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,(0,n.Z)(e,t)}},89611:function(e,t,r){"use strict";function n(e,t){return(n=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e})(e,t)}r.d(t,{Z:function(){return n}})},8307:function(e,t,r){"use strict";function n(e){return(n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function a(e,t,r){var a;return a=function(e,t){if("object"!==n(e)||null===e)return e;var r=e[Symbol.toPrimitive];if(void 0!==r){var a=r.call(e,t||"default");if("object"!==n(a))return a;throw TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(t,"string"),(t="symbol"===n(a)?a:String(a))in e?Object.defineProperty(e,t,{value:r,enumerable:!0,configurable:!0,writable:!0}):e[t]=r,e}r.d(t,{Z:function(){return a}})}},function(e){var t=function(t){return e(e.s=t)};e.O(0,[774,179],function(){return t(6840),t(58194)}),_N_E=e.O()}]);
\ No newline at end of file
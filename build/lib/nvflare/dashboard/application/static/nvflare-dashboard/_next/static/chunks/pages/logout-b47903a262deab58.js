@@ -0,0 +1 @@
+(self.webpackChunk_N_E=self.webpackChunk_N_E||[]).push([[765],{61889:function(t,e,n){"use strict";n.r(e);var u=n(11163),r=n(40203);e.default=function(){var t=(0,u.useRouter)().push;return(0,r.KY)("none","",-1,0),t("/"),"Logging out"}},40203:function(t,e,n){"use strict";n.d(e,{Gg:function(){return i},KY:function(){return r},a5:function(){return o}});var u={user:{email:"",token:"",id:-1,role:0},status:"unauthenticated"};function r(t,e,n,r,o){var i=arguments.length>5&&void 0!==arguments[5]&&arguments[5];return u={user:{email:t,token:e,id:n,role:r,org:o},expired:i,status:0==r?"unauthenticated":"authenticated"},localStorage.setItem("session",JSON.stringify(u)),u}function o(t){return u={user:{email:u.user.email,token:u.user.token,id:u.user.id,role:t,org:u.user.org},expired:u.expired,status:u.status},localStorage.setItem("session",JSON.stringify(u)),u}function i(){var t=localStorage.getItem("session");return null!=t&&(u=JSON.parse(t)),u}},33116:function(t,e,n){(window.__NEXT_P=window.__NEXT_P||[]).push(["/logout",function(){return n(61889)}])},11163:function(t,e,n){t.exports=n(58194)}},function(t){t.O(0,[888,774,179],function(){return t(t.s=33116)}),_N_E=t.O()}]);
\ No newline at end of file
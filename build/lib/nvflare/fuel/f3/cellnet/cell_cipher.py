@@ -0,0 +1,428 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+from cryptography.exceptions import InvalidKey, InvalidSignature
+from cryptography.hazmat.primitives import asymmetric, ciphers, hashes, padding
+from cryptography.x509 import Certificate
+
+from nvflare.lighter.utils import verify_cert_chain
+
+HASH_LENGTH = 4  # Adjustable to avoid collision
+NONCE_LENGTH = 16  # For AES, this is 128 bits (i.e. block size)
+KEY_LENGTH = 32  # AES 256.  Choose from 16, 24, 32
+HEADER_LENGTH = HASH_LENGTH + NONCE_LENGTH
+PADDING_LENGTH = NONCE_LENGTH * 8  # in bits
+KEY_ENC_LENGTH = 256
+SIGNATURE_LENGTH = 256
+SIMPLE_HEADER_LENGTH = NONCE_LENGTH + KEY_ENC_LENGTH + SIGNATURE_LENGTH
+
+# Chunked AES-GCM mode
+GCM_NONCE_LENGTH = 12
+GCM_TAG_LENGTH = 16
+GCM_CHUNK_SIZE_STRUCT = struct.Struct(">I")
+GCM_AAD_STRUCT = struct.Struct(">QII")  # clear payload size, chunk size, chunk index
+GCM_HEADER_LENGTH = GCM_NONCE_LENGTH + KEY_ENC_LENGTH + SIGNATURE_LENGTH + GCM_CHUNK_SIZE_STRUCT.size
+DEFAULT_GCM_CHUNK_SIZE = 256 * 1024
+
+# update_into requires the output buffer to be this much larger than the input
+_UPDATE_INTO_EXTRA = 15
+
+BytesAlike = Union[bytes, bytearray, memoryview]
+
+
+class CipherMode:
+    CBC = "cbc"
+    GCM = "gcm"
+
+
+def get_hash(value):
+    hash = hashes.Hash(hashes.SHA256())
+    hash.update(value)
+    return hash.finalize()
+
+
+class SessionKeyUnavailable(Exception):
+    pass
+
+
+class InvalidCertChain(Exception):
+    pass
+
+
+def _normalize_cert_chain(cert) -> list:
+    if isinstance(cert, Certificate):
+        return [cert]
+    return list(cert)
+
+
+def _asym_enc(k, m):
+    return k.encrypt(
+        m,
+        asymmetric.padding.OAEP(
+            mgf=asymmetric.padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None
+        ),
+    )
+
+
+def _asym_dec(k, m):
+    return k.decrypt(
+        m,
+        asymmetric.padding.OAEP(
+            mgf=asymmetric.padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None
+        ),
+    )
+
+
+def _sign(k, m):
+    return k.sign(
+        data=m,
+        padding=asymmetric.padding.PSS(
+            mgf=asymmetric.padding.MGF1(hashes.SHA256()),
+            salt_length=asymmetric.padding.PSS.MAX_LENGTH,
+        ),
+        algorithm=hashes.SHA256(),
+    )
+
+
+def _verify(k, m, s):
+
+    if not isinstance(m, bytes):
+        m = bytes(m)
+
+    if not isinstance(s, bytes):
+        s = bytes(s)
+
+    k.verify(
+        s,
+        m,
+        asymmetric.padding.PSS(
+            mgf=asymmetric.padding.MGF1(hashes.SHA256()), salt_length=asymmetric.padding.PSS.MAX_LENGTH
+        ),
+        hashes.SHA256(),
+    )
+
+
+def _sym_enc(k: bytes, n: bytes, m: bytes):
+    cipher = ciphers.Cipher(ciphers.algorithms.AES(k), ciphers.modes.CBC(n))
+    encryptor = cipher.encryptor()
+    padder = padding.PKCS7(PADDING_LENGTH).padder()
+    padded_data = padder.update(m) + padder.finalize()
+    return encryptor.update(padded_data) + encryptor.finalize()
+
+
+def _sym_dec(k: bytes, n: bytes, m: bytes):
+    cipher = ciphers.Cipher(ciphers.algorithms.AES(k), ciphers.modes.CBC(n))
+    decryptor = cipher.decryptor()
+    plain_text = decryptor.update(m)
+    plain_text = plain_text + decryptor.finalize()
+    unpadder = padding.PKCS7(PADDING_LENGTH).unpadder()
+    return unpadder.update(plain_text) + unpadder.finalize()
+
+
+def _gcm_chunk_nonce(base_nonce: int, index: int) -> bytes:
+    return (base_nonce ^ index).to_bytes(GCM_NONCE_LENGTH, "big")
+
+
+def _gcm_encrypt_chunk(key: bytes, base_nonce: int, aad_prefix: tuple, index: int, data, out):
+    """Encrypt one chunk into out, which has room for the cipher text and the tag"""
+    encryptor = ciphers.Cipher(
+        ciphers.algorithms.AES(key), ciphers.modes.GCM(_gcm_chunk_nonce(base_nonce, index))
+    ).encryptor()
+    encryptor.authenticate_additional_data(GCM_AAD_STRUCT.pack(*aad_prefix, index))
+    encryptor.update_into(data, out)
+    encryptor.finalize()
+    out[len(data) : len(data) + GCM_TAG_LENGTH] = encryptor.tag
+
+
+def _gcm_decrypt_chunk(key: bytes, base_nonce: int, aad_prefix: tuple, index: int, data, tag: bytes, out):
+    """Decrypt one chunk into out and verify its tag. InvalidTag is raised if the chunk is not authentic."""
+    decryptor = ciphers.Cipher(
+        ciphers.algorithms.AES(key), ciphers.modes.GCM(_gcm_chunk_nonce(base_nonce, index), bytes(tag))
+    ).decryptor()
+    decryptor.authenticate_additional_data(GCM_AAD_STRUCT.pack(*aad_prefix, index))
+    decryptor.update_into(data, out)
+    decryptor.finalize()
+
+
+def _num_gcm_chunks(size: int, chunk_size: int) -> int:
+    # an empty payload still has one chunk, so it is authenticated
+    return max(1, (size + chunk_size - 1) // chunk_size)
+
+
+def _run_chunks(func, num_chunks: int, executor: Optional[ThreadPoolExecutor]):
+    if executor and num_chunks > 1:
+        # consume the results to raise the first error
+        for _ in executor.map(func, range(num_chunks)):
+            pass
+    else:
+        for i in range(num_chunks):
+            func(i)
+
+
+def _chunked_sym_enc(
+    k: bytes, header: bytes, m: BytesAlike, chunk_size: int, executor: Optional[ThreadPoolExecutor] = None
+) -> bytearray:
+    """Encrypt the message in AES-GCM chunks into a preallocated buffer.
+
+    The layout of the result is header | nonce | chunk_size | (cipher text | tag) of each chunk.
+    Each chunk is encrypted with its own nonce derived from the random nonce of the message, and authenticates
+    the message size, chunk size and its index, so chunks cannot be truncated, reordered or mixed.
+    """
+    m = memoryview(m).cast("B")
+    size = len(m)
+    num_chunks = _num_gcm_chunks(size, chunk_size)
+    nonce = os.urandom(GCM_NONCE_LENGTH)
+    base_nonce = int.from_bytes(nonce, "big")
+    aad_prefix = (size, chunk_size)
+
+    prefix = header + nonce + GCM_CHUNK_SIZE_STRUCT.pack(chunk_size)
+    body_start = len(prefix)
+    out = bytearray(body_start + size + num_chunks * GCM_TAG_LENGTH + _UPDATE_INTO_EXTRA)
+    out[:body_start] = prefix
+    out_view = memoryview(out)
+
+    def _encrypt(i):
+        start = i * chunk_size
+        end = min(start + chunk_size, size)
+        out_start = body_start + start + i * GCM_TAG_LENGTH
+        out_end = out_start + end - start + GCM_TAG_LENGTH + _UPDATE_INTO_EXTRA
+        _gcm_encrypt_chunk(k, base_nonce, aad_prefix, i, m[start:end], out_view[out_start:out_end])
+
+    _run_chunks(_encrypt, num_chunks, executor)
+    out_view.release()
+    del out[-_UPDATE_INTO_EXTRA:]
+    return out
+
+
+def _chunked_sym_dec(k: bytes, m: BytesAlike, executor: Optional[ThreadPoolExecutor] = None) -> memoryview:
+    """Decrypt the body (after the header) of a message encrypted by _chunked_sym_enc."""
+    m = memoryview(m).cast("B")
+    if len(m) < GCM_NONCE_LENGTH + GCM_CHUNK_SIZE_STRUCT.size + GCM_TAG_LENGTH:
+        raise ValueError(f"encrypted payload is too short: {len(m)} bytes")
+
+    base_nonce = int.from_bytes(m[:GCM_NONCE_LENGTH], "big")
+    (chunk_size,) = GCM_CHUNK_SIZE_STRUCT.unpack_from(m, GCM_NONCE_LENGTH)
+    if chunk_size <= 0:
+        raise ValueError(f"invalid chunk size {chunk_size}")
+
+    body = m[GCM_NONCE_LENGTH + GCM_CHUNK_SIZE_STRUCT.size :]
+    num_chunks = _num_gcm_chunks(len(body), chunk_size + GCM_TAG_LENGTH)
+    size = len(body) - num_chunks * GCM_TAG_LENGTH
+    if size < 0 or _num_gcm_chunks(size, chunk_size) != num_chunks:
+        raise ValueError(f"invalid encrypted payload size {len(body)} for chunk size {chunk_size}")
+
+    aad_prefix = (size, chunk_size)
+    out = bytearray(size + _UPDATE_INTO_EXTRA)
+    out_view = memoryview(out)
+
+    def _decrypt(i):
+        start = i * chunk_size
+        end = min(start + chunk_size, size)
+        in_start = start + i * GCM_TAG_LENGTH
+        in_end = in_start + end - start
+        _gcm_decrypt_chunk(
+            k,
+            base_nonce,
+            aad_prefix,
+            i,
+            body[in_start:in_end],
+            body[in_end : in_end + GCM_TAG_LENGTH],
+            out_view[start : end + _UPDATE_INTO_EXTRA],
+        )
+
+    _run_chunks(_decrypt, num_chunks, executor)
+    return out_view[:size]
+
+
+class SessionKeyManager:
+    def __init__(self, root_ca):
+        self.key_hash_dict = dict()
+        self.root_ca = root_ca
+        self.root_ca_pub_key = root_ca.public_key()
+
+    def validate_cert_chain(self, cert):
+        self.root_ca_pub_key.verify(
+            cert.signature, cert.tbs_certificate_bytes, asymmetric.padding.PKCS1v15(), cert.signature_hash_algorithm
+        )
+
+    def key_request(self, remote_cert, local_cert, local_pri_key):
+        session_key = os.urandom(KEY_LENGTH)
+        signature = _sign(local_pri_key, session_key)
+        try:
+            self.validate_cert_chain(remote_cert)
+        except InvalidSignature:
+            return False
+
+        remote_pub_key = remote_cert.public_key()
+        key_enc = _asym_enc(remote_pub_key, session_key)
+        self.key_hash_dict[get_hash(session_key)[-HASH_LENGTH:]] = session_key
+        key_response = key_enc + signature
+        return key_response
+
+    def process_key_response(self, remote_cert, local_cert, local_pri_key, key_response):
+        key_enc, signature = key_response[:KEY_ENC_LENGTH], key_response[KEY_ENC_LENGTH:]
+        try:
+            session_key = _asym_dec(local_pri_key, key_enc)
+            self.validate_cert_chain(remote_cert)
+            public_key = remote_cert.public_key()
+            _verify(public_key, session_key, signature)
+            self.key_hash_dict[get_hash(session_key)[-HASH_LENGTH:]] = session_key
+        except (InvalidKey, InvalidSignature, InvalidCertChain):
+            return False
+        return True
+
+    def key_available(self):
+        return bool(self.key_hash_dict)
+
+    def get_key(self, key_hash):
+        return self.key_hash_dict.get(key_hash)
+
+    def get_latest_key(self):
+        try:
+            k, last_value = _, self.key_hash_dict[k] = self.key_hash_dict.popitem()
+        except KeyError:
+            raise SessionKeyUnavailable("No session key established yet")
+        return last_value
+
+
+class SimpleCellCipher:
+    def __init__(
+        self,
+        root_ca: Certificate,
+        pri_key: asymmetric.rsa.RSAPrivateKey,
+        cert,
+        chunk_size: int = DEFAULT_GCM_CHUNK_SIZE,
+        num_threads: int = 1,
+    ):
+        """Encrypts and decrypts cell message payloads with session keys exchanged with certificates.
+
+        Args:
+            root_ca: the root CA certificate
+            pri_key: the private key of this cell
+            cert: the certificate (or certificate chain) of this cell
+            chunk_size: chunk size for the chunked AES-GCM mode
+            num_threads: number of threads to encrypt/decrypt the chunks of a payload in the chunked AES-GCM mode
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive but got {chunk_size}")
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(num_threads, thread_name_prefix="cell_cipher") if num_threads > 1 else None
+        self._root_ca = root_ca
+        self._root_ca_pub_key = root_ca.public_key()
+        self._pri_key = pri_key
+        self._cert_chain = _normalize_cert_chain(cert)
+        self._cert = self._cert_chain[0]
+        self._pub_key = self._cert.public_key()
+        self._validate_cert_chain(self._cert_chain)
+        self._cached_enc = dict()
+        self._cached_dec = dict()
+
+    def _validate_cert_chain(self, cert) -> Certificate:
+        cert_chain = _normalize_cert_chain(cert)
+        try:
+            verify_cert_chain(
+                leaf_cert=cert_chain[0],
+                intermediate_certs=cert_chain[1:],
+                root_ca_cert=self._root_ca,
+            )
+        except Exception as ex:
+            raise InvalidCertChain(str(ex)) from ex
+
+        return cert_chain[0]
+
+    def _get_enc_secret(self, target_cert):
+        target_cert_chain = _normalize_cert_chain(target_cert)
+        if not target_cert_chain:
+            raise InvalidCertChain("cert chain must contain at least one certificate")
+        target_cert = target_cert_chain[0]
+        cert_hash = hash(target_cert)
+        secret = self._cached_enc.get(cert_hash)
+        if secret is None:
+            target_cert = self._validate_cert_chain(target_cert_chain)
+            key = os.urandom(KEY_LENGTH)
+            remote_pub_key = target_cert.public_key()
+            key_enc = _asym_enc(remote_pub_key, key)
+            signature = _sign(self._pri_key, key_enc)
+            self._cached_enc[cert_hash] = (key, key_enc, signature)
+        else:
+            (key, key_enc, signature) = secret
+        return key, key_enc, signature
+
+    def encrypt(self, message: bytes, target_cert):
+        key, key_enc, signature = self._get_enc_secret(target_cert)
+        nonce = os.urandom(NONCE_LENGTH)
+        ct = nonce + key_enc + signature + _sym_enc(key, nonce, message)
+        return ct
+
+    def encrypt_chunked(self, message: BytesAlike, target_cert) -> bytearray:
+        """Encrypt the message with chunked AES-GCM.
+
+        Unlike encrypt, the message can be any bytes-like object and is not copied or padded. The cipher text is
+        written into one preallocated buffer, and the chunks may be encrypted in parallel.
+
+        Args:
+            message: the message to be encrypted
+            target_cert: the certificate (or certificate chain) of the receiver
+
+        Returns: the encrypted message
+        """
+        key, key_enc, signature = self._get_enc_secret(target_cert)
+        return _chunked_sym_enc(key, key_enc + signature, message, self.chunk_size, self._executor)
+
+    def _get_dec_key(self, key_enc, signature, origin_cert):
+        if not isinstance(key_enc, bytes):
+            key_enc = bytes(key_enc)
+
+        key_hash = hash(key_enc)
+        dec = self._cached_dec.get(key_hash)
+        if dec is None:
+            origin_cert = self._validate_cert_chain(origin_cert)
+            public_key = origin_cert.public_key()
+            _verify(public_key, key_enc, signature)
+            key = _asym_dec(self._pri_key, key_enc)
+            self._cached_dec[key_hash] = key
+        else:
+            key = dec
+        return key
+
+    def decrypt(self, message: bytes, origin_cert):
+        nonce, key_enc, signature = (
+            message[:NONCE_LENGTH],
+            message[NONCE_LENGTH : NONCE_LENGTH + KEY_ENC_LENGTH],
+            message[NONCE_LENGTH + KEY_ENC_LENGTH : SIMPLE_HEADER_LENGTH],
+        )
+        key = self._get_dec_key(key_enc, signature, origin_cert)
+        return _sym_dec(key, nonce, message[SIMPLE_HEADER_LENGTH:])
+
+    def decrypt_chunked(self, message: BytesAlike, origin_cert) -> memoryview:
+        """Decrypt a message encrypted with encrypt_chunked.
+
+        Args:
+            message: the encrypted message
+            origin_cert: the certificate (or certificate chain) of the sender
+
+        Returns: the decrypted message
+
+        Raises: InvalidTag if the message is not authentic
+        """
+        message = memoryview(message).cast("B")
+        key_enc = message[:KEY_ENC_LENGTH]
+        signature = message[KEY_ENC_LENGTH : KEY_ENC_LENGTH + SIGNATURE_LENGTH]
+        key = self._get_dec_key(key_enc, signature, origin_cert)
+        return _chunked_sym_dec(key, message[KEY_ENC_LENGTH + SIGNATURE_LENGTH :], self._executor)
@@ -0,0 +1,193 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+from typing import Union
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.x509 import Certificate
+
+from nvflare.fuel.f3.cellnet.cell_cipher import DEFAULT_GCM_CHUNK_SIZE, CipherMode, SimpleCellCipher
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.cellnet.identity import CellIdentityResolver, get_cert_common_name_from_pem
+from nvflare.fuel.f3.comm_config import CommConfigurator
+from nvflare.fuel.f3.drivers.driver_params import DriverParams
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.message import Message
+
+log = logging.getLogger(__name__)
+
+CERT_ERROR = "cert_error"
+CERT_TARGET = "cert_target"
+CERT_ORIGIN = "cert_origin"
+CERT_CONTENT = "cert_content"
+CERT_CA_CONTENT = "cert_ca_content"
+CERT_REQ_TIMEOUT = 10
+
+
+class CredentialManager:
+    """Helper class for secure message. It holds the local credentials and certificate cache"""
+
+    def __init__(
+        self,
+        local_endpoint: Endpoint,
+        identity_resolver: CellIdentityResolver = None,
+        enforce_identity: bool = False,
+    ):
+
+        self.local_endpoint = local_endpoint
+        self.cert_cache = {}
+        self.lock = threading.Lock()
+        self.identity_resolver = identity_resolver if identity_resolver else CellIdentityResolver(local_endpoint.name)
+        self.enforce_identity = enforce_identity
+
+        comm_configurator = CommConfigurator()
+        self.cipher_mode = comm_configurator.get_cell_cipher_mode(CipherMode.CBC).lower()
+        if self.cipher_mode not in (CipherMode.CBC, CipherMode.GCM):
+            raise ValueError(f"unsupported cell cipher mode '{self.cipher_mode}'")
+        self.cipher_chunk_size = comm_configurator.get_cell_cipher_chunk_size(DEFAULT_GCM_CHUNK_SIZE)
+        self.cipher_threads = comm_configurator.get_cell_cipher_threads(1)
+
+        conn_props = self.local_endpoint.conn_props
+        ca_cert_path = conn_props.get(DriverParams.CA_CERT)
+        server_cert_path = conn_props.get(DriverParams.SERVER_CERT)
+        if server_cert_path:
+            local_cert_path = server_cert_path
+            local_key_path = conn_props.get(DriverParams.SERVER_KEY)
+        else:
+            local_cert_path = conn_props.get(DriverParams.CLIENT_CERT)
+            local_key_path = conn_props.get(DriverParams.CLIENT_KEY)
+
+        if not local_cert_path:
+            log.debug("Certificate is not configured, secure message is not supported")
+            self.ca_cert = None
+            self.local_cert = None
+            self.local_key = None
+            self.cell_cipher = None
+        else:
+            self.ca_cert = self.read_file(ca_cert_path)
+            self.local_cert = self.read_file(local_cert_path)
+            self.local_key = self.read_file(local_key_path)
+            self.cell_cipher = SimpleCellCipher(self.get_ca_cert(), self.get_local_key(), self.get_local_cert_chain())
+
+        if not self.local_cert:
+            log.debug("Certificate is not configured, secure message is not supported")
+            self.cell_cipher = None
+        else:
+            self.cell_cipher = SimpleCellCipher(
+                self.get_ca_cert(),
+                self.get_local_key(),
+                self.get_local_cert_chain(),
+                chunk_size=self.cipher_chunk_size,
+                num_threads=self.cipher_threads,
+            )
+
+    def encrypt(self, target_cert: bytes, payload: Union[bytes, bytearray, memoryview], mode: str = CipherMode.CBC):
+
+        if not self.cell_cipher:
+            raise RuntimeError("Secure message not supported, Cell not running in secure mode")
+
+        target_cert_chain = x509.load_pem_x509_certificates(target_cert)
+        if mode == CipherMode.GCM:
+            return self.cell_cipher.encrypt_chunked(payload, target_cert_chain)
+        return self.cell_cipher.encrypt(payload, target_cert_chain)
+
+    def decrypt(self, origin_cert: bytes, cipher: Union[bytes, bytearray, memoryview], mode: str = CipherMode.CBC):
+
+        if not self.cell_cipher:
+            raise RuntimeError("Secure message not supported, Cell not running in secure mode")
+
+        origin_cert_chain = x509.load_pem_x509_certificates(origin_cert)
+        if mode == CipherMode.GCM:
+            return self.cell_cipher.decrypt_chunked(cipher, origin_cert_chain)
+        return self.cell_cipher.decrypt(cipher, origin_cert_chain)
+
+    def get_certificate(self, fqcn: str) -> bytes:
+        if not self.cell_cipher:
+            raise RuntimeError("This cell doesn't support certificate exchange, not running in secure mode")
+        with self.lock:
+            return self.cert_cache.get(fqcn)
+
+    def create_request(self) -> dict:
+        req = {
+            CERT_CONTENT: self.local_cert,
+            CERT_CA_CONTENT: self.ca_cert,
+        }
+
+        return req
+
+    def _cache_cert(self, fqcn: str, cert: bytes):
+        if not cert:
+            raise RuntimeError(f"missing certificate for {fqcn}")
+
+        if self.enforce_identity:
+            cn = get_cert_common_name_from_pem(cert)
+            try:
+                self.identity_resolver.require_match(fqcn, cn, f"certificate for {fqcn}")
+            except ValueError as ex:
+                raise RuntimeError(str(ex))
+
+        with self.lock:
+            self.cert_cache[fqcn] = cert
+
+    def process_request(self, request: Message) -> dict:
+        origin = request.get_header(MessageHeaderKey.ORIGIN)
+        target = request.get_header(MessageHeaderKey.DESTINATION)
+        reply = {}
+        if not self.local_cert:
+            reply[CERT_ERROR] = f"Target {target} is not running in secure mode"
+        else:
+            payload = request.payload
+            cert = payload.get(CERT_CONTENT)
+
+            # Save cert from requester in the cache
+            self._cache_cert(origin, cert)
+
+            reply[CERT_CONTENT] = self.local_cert
+            reply[CERT_CA_CONTENT] = self.ca_cert
+
+        return reply
+
+    def process_response(self, message: Message) -> bytes:
+        origin = message.get_header(MessageHeaderKey.ORIGIN)
+        reply = message.payload
+        error = reply.get(CERT_ERROR)
+        if error:
+            raise RuntimeError(f"Request to get certificate from {origin} failed: {error}")
+
+        cert = reply.get(CERT_CONTENT)
+        self._cache_cert(origin, cert)
+        return cert
+
+    def get_local_cert(self) -> Certificate:
+        return x509.load_pem_x509_certificate(self.local_cert)
+
+    def get_local_cert_chain(self) -> list:
+        return x509.load_pem_x509_certificates(self.local_cert)
+
+    def get_local_key(self) -> RSAPrivateKey:
+        return serialization.load_pem_private_key(self.local_key, password=None)
+
+    def get_ca_cert(self) -> Certificate:
+        return x509.load_pem_x509_certificate(self.ca_cert)
+
+    @staticmethod
+    def read_file(file_name: str):
+        if not file_name:
+            return None
+
+        with open(file_name, "rb") as f:
+            return f.read()
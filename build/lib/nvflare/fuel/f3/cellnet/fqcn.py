@@ -0,0 +1,32 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from nvflare.fuel.common.fqn import FQN
+
+
+class FQCN(FQN):
+    pass
+
+
+class FqcnInfo:
+    def __init__(self, fqcn: str):
+        self.fqcn = fqcn
+        self.path = FQCN.split(fqcn)
+        self.gen = len(self.path)
+        self.is_root = self.gen == 1
+        self.root = self.path[0]
+        self.is_on_server = self.root == FQCN.ROOT_SERVER
+
+
+def same_family(info1: FqcnInfo, info2: FqcnInfo):
+    return info1.root == info2.root
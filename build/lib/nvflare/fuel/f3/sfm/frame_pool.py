@@ -0,0 +1,215 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from nvflare.fuel.f3.comm_config import CommConfigurator
+from nvflare.fuel.f3.connection import BytesAlike
+from nvflare.fuel.f3.stats_pool import CounterPool, StatsPoolManager
+
+log = logging.getLogger(__name__)
+
+# Frames smaller than this are not worth pooling
+MIN_POOLED_SIZE = 64 * 1024
+DEFAULT_MAX_POOL_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_BUFFER_SIZE = 64 * 1024 * 1024
+
+COUNTER_HIT = "hit"
+COUNTER_MISS = "miss"
+COUNTER_DISCARD = "discard"
+
+
+class _PooledBuffer(bytearray):
+    """A receive buffer owned by the FramePool"""
+
+    __slots__ = ("in_use",)
+
+    def is_exported(self) -> bool:
+        """Check whether a view of the buffer is still alive, e.g. a message payload or an array made from it."""
+        try:
+            # A bytearray can't be resized while its memory is exported. Removing the last byte and adding it back
+            # doesn't reallocate the memory.
+            last = self.pop()
+        except BufferError:
+            return True
+
+        self.append(last)
+        return False
+
+
+class FramePool:
+    """A size-classed pool of buffers for received frames.
+
+    Drivers acquire a buffer for each frame they read and ConnManager releases it once the frame is processed,
+    so frames of similar size reuse the same memory instead of allocating a new buffer each time.
+
+    The payload of a DATA frame is passed downstream as a view of the pooled buffer, without copying it. A buffer
+    that is released while such views are still alive (e.g. stream chunks waiting to be read) is lent out: it's
+    only reused once all views of it are gone.
+
+    Buffer sizes are rounded up to a quarter of the enclosing power of two, so no more than 25% of a buffer
+    is wasted. The idle and lent buffers retained by the pool never exceed max_pool_bytes each. Frames larger
+    than max_buffer_size are not pooled.
+    """
+
+    def __init__(
+        self,
+        max_pool_bytes: int = DEFAULT_MAX_POOL_BYTES,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        stats: Optional[CounterPool] = None,
+    ):
+        self.max_pool_bytes = max_pool_bytes
+        self.max_buffer_size = max_buffer_size
+        self.stats = stats
+        self.free_buffers: Dict[int, List[_PooledBuffer]] = {}
+        self.idle_bytes = 0
+        self.lent_buffers: Dict[int, List[_PooledBuffer]] = {}
+        self.lent_bytes = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def size_class(size: int) -> int:
+        if size <= MIN_POOLED_SIZE:
+            return MIN_POOLED_SIZE
+
+        step = 1 << (size.bit_length() - 3)
+        return (size + step - 1) // step * step
+
+    def acquire(self, size: int) -> BytesAlike:
+        """Get a buffer of the size.
+
+        Args:
+            size: Number of bytes needed
+
+        Returns:
+            A memoryview of exactly size bytes over a pooled buffer, or a new bytearray if the size is not pooled
+        """
+        if size < MIN_POOLED_SIZE or size > self.max_buffer_size:
+            return bytearray(size)
+
+        cls = self.size_class(size)
+        with self.lock:
+            free_list = self.free_buffers.get(cls)
+            buffer = free_list.pop() if free_list else None
+            if buffer is not None:
+                self.idle_bytes -= cls
+            else:
+                buffer = self._reclaim(cls)
+
+        if buffer is None:
+            buffer = _PooledBuffer(cls)
+            self._count(cls, COUNTER_MISS)
+        else:
+            self._count(cls, COUNTER_HIT)
+
+        buffer.in_use = True
+        return memoryview(buffer)[:size]
+
+    def release(self, frame: BytesAlike):
+        """Return the buffer of a frame to the pool. Frames not acquired from the pool are ignored.
+
+        The frame itself is released. Views of it that are still alive, like the payload of the message made from
+        the frame, stay valid: the buffer is only reused once they are gone.
+
+        Args:
+            frame: The frame returned by acquire
+        """
+        if not self.owns(frame):
+            return
+
+        buffer = frame.obj
+        if not buffer.in_use:
+            log.warning("Frame buffer is released more than once")
+            return
+
+        buffer.in_use = False
+        try:
+            frame.release()
+        except BufferError:
+            # an object made directly from the frame is still alive, the buffer is lent out below
+            pass
+
+        cls = len(buffer)
+        with self.lock:
+            if not buffer.is_exported():
+                if self.idle_bytes + cls <= self.max_pool_bytes:
+                    self.free_buffers.setdefault(cls, []).append(buffer)
+                    self.idle_bytes += cls
+                    return
+            elif self.lent_bytes + cls <= self.max_pool_bytes:
+                self.lent_buffers.setdefault(cls, []).append(buffer)
+                self.lent_bytes += cls
+                return
+
+        self._count(cls, COUNTER_DISCARD)
+
+    def _reclaim(self, cls: int) -> Optional[_PooledBuffer]:
+        """Take a lent buffer of the size class back if all views of it are gone. Must be called with the lock."""
+        lent_list = self.lent_buffers.get(cls)
+        if not lent_list:
+            return None
+
+        for i, buffer in enumerate(lent_list):
+            if not buffer.is_exported():
+                del lent_list[i]
+                self.lent_bytes -= cls
+                return buffer
+        return None
+
+    @staticmethod
+    def owns(frame: BytesAlike) -> bool:
+        try:
+            return isinstance(frame, memoryview) and isinstance(frame.obj, _PooledBuffer)
+        except ValueError:
+            # the frame is already released
+            return False
+
+    def _count(self, cls: int, counter_name: str):
+        if self.stats:
+            self.stats.increment(f"{cls // 1024}KB", counter_name)
+
+
+_pool_lock = threading.Lock()
+_frame_pool = None
+
+
+def get_frame_pool() -> Optional[FramePool]:
+    """Get the process-wide frame pool, created from the comm config on first use.
+
+    Returns:
+        The FramePool or None if pooling is disabled
+    """
+    global _frame_pool
+
+    with _pool_lock:
+        if _frame_pool is None:
+            config = CommConfigurator()
+            if config.get_sfm_frame_pool_enabled(True):
+                stats = StatsPoolManager.get_pool("sfm_frame_pool")
+                if not stats:
+                    stats = StatsPoolManager.add_counter_pool(
+                        "sfm_frame_pool",
+                        "SFM receive buffer pool counters by buffer size",
+                        [COUNTER_HIT, COUNTER_MISS, COUNTER_DISCARD],
+                    )
+                _frame_pool = FramePool(
+                    max_pool_bytes=config.get_sfm_frame_pool_max_bytes(DEFAULT_MAX_POOL_BYTES),
+                    max_buffer_size=config.get_sfm_frame_pool_max_buffer_size(DEFAULT_MAX_BUFFER_SIZE),
+                    stats=stats,
+                )
+            else:
+                _frame_pool = False
+
+        return _frame_pool or None
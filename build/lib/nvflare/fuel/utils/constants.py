@@ -0,0 +1,38 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import Enum
+
+
+class FrameworkType(str, Enum):
+    """Machine learning framework type.
+
+    Used to identify the ML framework for model handling, persistor selection,
+    and checkpoint validation across both server and client components.
+    """
+
+    RAW = "raw"
+    NUMPY = "numpy"
+    PYTORCH = "pytorch"
+    TENSORFLOW = "tensorflow"
+
+
+class Mode(str, Enum):
+    ACTIVE = "ACTIVE"
+    PASSIVE = "PASSIVE"
+
+
+class PipeChannelName:
+    TASK = "task"
+    METRIC = "metric"
@@ -0,0 +1,25 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+All DOTs (Datum Object Type) must be unique.
+This file is used as the global DOT registry to ensure that all DOTs are unique.
+"""
+NUMPY_BYTES = 1
+NUMPY_FILE = 2
+NUMPY_DOWNLOAD = 3
+TENSOR_BYTES = 4
+TENSOR_FILE = 5
+TENSOR_DOWNLOAD = 6
+NUMPY_RAW_DOWNLOAD = 7
@@ -0,0 +1,111 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from typing import List, Optional
+
+from nvflare.apis.fl_component import FLComponent
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.utils.event import fire_event_to_components
+from nvflare.fuel.f3.stats_pool import StatsPoolManager
+
+
+def fire_event(event: str, handlers: list, ctx: FLContext):
+    """Fires the specified event and invokes the list of handlers.
+
+    Args:
+        event: the event to be fired
+        handlers: handlers to be invoked
+        ctx: context for cross-component data sharing
+
+    Returns: N/A
+
+    """
+    return fire_event_to_components(event, handlers, ctx)
+
+
+def _get_time_pool(name: str, description: str, scope: Optional[str]):
+    try:
+        return StatsPoolManager.add_time_hist_pool(name, description, scope=scope)
+    except ValueError:
+        # the pool was already created in this process, e.g. by a previous run manager
+        return StatsPoolManager.get_pool(f"{name}@{scope}" if scope else name)
+
+
+def _is_subscriber(handler, event: str) -> bool:
+    if not isinstance(handler, FLComponent):
+        # keep it, so fire_event_to_components reports the invalid handler
+        return True
+    events = handler.get_subscribed_events()
+    return events is None or event in events
+
+
+class EventDispatcher:
+    def __init__(self, scope: Optional[str] = None):
+        """Dispatches events to the handlers that subscribe to them.
+
+        The subscribers of an event type are looked up from the handlers when the event is first fired, and kept
+        in a dispatch table. The table is rebuilt when the list of handlers or the event subscriptions change.
+
+        The time taken to dispatch each event type, and the time taken by each handler to handle it, are recorded
+        in the "Event_Dispatch" and "Event_Handling" stats pools.
+
+        Args:
+            scope: scope of the stats pools, e.g. the job ID
+        """
+        self._lock = threading.Lock()
+        self._table = {}  # event type => list of subscribers
+        self._handlers_key = None
+        self.dispatch_stats_pool = _get_time_pool("Event_Dispatch", "Time (secs) taken to dispatch events", scope)
+        self.handling_stats_pool = _get_time_pool(
+            "Event_Handling", "Time (secs) taken by components to handle events", scope
+        )
+
+    def get_subscribers(self, event: str, handlers: List[FLComponent]) -> List[FLComponent]:
+        """Gets the handlers that subscribe to the event, in the order of the handlers."""
+        if not handlers:
+            return []
+
+        # handlers are only appended to the list of the run manager
+        key = (id(handlers), len(handlers), FLComponent.get_subscription_version())
+        with self._lock:
+            if key != self._handlers_key:
+                self._table = {}
+                self._handlers_key = key
+            subscribers = self._table.get(event)
+            if subscribers is None:
+                subscribers = [h for h in handlers if _is_subscriber(h, event)]
+                self._table[event] = subscribers
+        return subscribers
+
+    def fire_event(self, event: str, handlers: List[FLComponent], ctx: FLContext):
+        """Fires the event to the handlers that subscribe to it.
+
+        Args:
+            event: the event to be fired
+            handlers: all handlers
+            ctx: context for cross-component data sharing
+
+        Returns: N/A
+
+        """
+        subscribers = self.get_subscribers(event, handlers)
+        start = time.perf_counter()
+        try:
+            fire_event_to_components(event, subscribers, ctx, handler_time_cb=self._record_handling_time)
+        finally:
+            self.dispatch_stats_pool.record_value(category=event, value=time.perf_counter() - start)
+
+    def _record_handling_time(self, event: str, handler: FLComponent, duration: float):
+        self.handling_stats_pool.record_value(category=f"{event}:{handler.name}", value=duration)
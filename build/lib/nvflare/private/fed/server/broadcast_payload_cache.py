@@ -0,0 +1,212 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from typing import Callable, Optional, Tuple
+
+from nvflare.apis.shareable import ReservedHeaderKey, Shareable
+from nvflare.fuel.f3.stats_pool import StatsPoolManager
+from nvflare.fuel.utils.fobs.pre_encoded import PreEncoded
+from nvflare.fuel.utils.log_utils import get_obj_logger
+from nvflare.fuel.utils.msg_root_utils import subscribe_to_msg_root
+
+# values of these types are small and cheap to serialize, so they are not pre-encoded
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+class _CounterName:
+    HIT = "hit"
+    MISS = "miss"
+
+
+def encode_content(data: Shareable, fobs_ctx: Optional[dict] = None) -> dict:
+    """Serialize the content (all but the headers) of the shareable.
+
+    Args:
+        data: the shareable
+        fobs_ctx: contextual info for decomposers
+
+    Returns: a dict of content key => value, in which the values to be serialized are PreEncoded
+    """
+    content = {}
+    for k, v in data.items():
+        if k == ReservedHeaderKey.HEADERS:
+            continue
+        content[k] = v if isinstance(v, _PLAIN_TYPES) else PreEncoded.encode(v, fobs_ctx=fobs_ctx)
+    return content
+
+
+class BroadcastPayload:
+    def __init__(self, msg_root_id: str, task_name: str, capacity: int):
+        """The filtered and serialized data of a broadcast task, shared by the targets of the task.
+
+        The data is filtered only once, by the first client that gets it: this client is the producer, and it
+        serializes the data and sets the content. Other clients get the filtered data, and wait for the content.
+
+        Args:
+            msg_root_id: message root ID of the task
+            task_name: name of the task
+            capacity: number of clients the payload can be sent to
+        """
+        self.msg_root_id = msg_root_id
+        self.task_name = task_name
+        self.capacity = capacity
+        self.num_clients = 0
+        self._filter_lock = threading.Lock()
+        self._filtered = None
+        self._content = None
+        self._content_set = threading.Event()
+
+    def get_filtered(self, filter_cb: Callable[[], Shareable]) -> Tuple[Shareable, bool]:
+        """Get the filtered task data.
+
+        Args:
+            filter_cb: the CB to filter the task data. It's called only once for all clients.
+
+        Returns: a tuple of (the filtered data, whether the caller is the producer of the payload).
+        If the caller is the producer, it must call set_content(), even if it fails to serialize the data.
+        """
+        with self._filter_lock:
+            if self._filtered is not None:
+                return self._filtered, False
+            self._filtered = filter_cb()
+            return self._filtered, True
+
+    def set_content(self, content: Optional[dict]):
+        """Set the serialized content of the filtered data.
+
+        Args:
+            content: the content created with encode_content(), or None if the data could not be serialized.
+        """
+        self._content = content
+        self._content_set.set()
+
+    def wait_content(self) -> Optional[dict]:
+        """Wait for the producer to set the content.
+
+        Returns: the serialized content, or None if the producer failed to serialize the data.
+        """
+        self._content_set.wait()
+        return self._content
+
+
+class _TaskStats:
+    def __init__(self, task_name: str):
+        self.task_name = task_name
+        self.hits = 0
+        self.misses = 0
+
+
+class BroadcastPayloadCache:
+    def __init__(self, scope: Optional[str] = None):
+        """Keeps the payloads of broadcast tasks, so the data of a task is filtered and serialized only once.
+
+        Payloads are keyed by the message root ID of the task, and are removed when the message root is deleted
+        (i.e. the task is done), or when they have been sent to as many clients as their capacity. Serialized tensors
+        are downloaded by the clients through the download transaction created when the payload is serialized, so the
+        capacity of a payload is the number of receivers of the transaction.
+
+        Hits and misses are recorded by task name in the "Broadcast_Payload_Cache" stats pool, and are logged for
+        each task when it is done.
+
+        Args:
+            scope: scope of the stats pool, e.g. the job ID
+        """
+        self._lock = threading.Lock()
+        self._payloads = {}  # msg root id => BroadcastPayload
+        self._task_stats = {}  # msg root id => _TaskStats
+        self.logger = get_obj_logger(self)
+        try:
+            self.stats_pool = StatsPoolManager.add_counter_pool(
+                "Broadcast_Payload_Cache",
+                "Hits and misses of broadcast task payloads",
+                [_CounterName.HIT, _CounterName.MISS],
+                scope=scope,
+            )
+        except ValueError:
+            # the pool was already created in this process, e.g. by a previous runner
+            self.stats_pool = StatsPoolManager.get_pool(
+                f"Broadcast_Payload_Cache@{scope}" if scope else "Broadcast_Payload_Cache"
+            )
+
+    def get_payload(self, msg_root_id: str, task_name: str, capacity: int) -> BroadcastPayload:
+        """Get the payload of a broadcast task for a client.
+
+        Args:
+            msg_root_id: message root ID of the task
+            task_name: name of the task
+            capacity: number of clients the payload can be sent to, if a new payload is created
+
+        Returns: the payload
+        """
+        with self._lock:
+            if msg_root_id not in self._task_stats:
+                self._task_stats[msg_root_id] = _TaskStats(task_name)
+                subscribe_to_msg_root(msg_root_id, self._msg_root_deleted)
+
+            payload = self._payloads.get(msg_root_id)
+            if not payload:
+                payload = BroadcastPayload(msg_root_id, task_name, max(capacity, 1))
+                self._payloads[msg_root_id] = payload
+            payload.num_clients += 1
+            if payload.num_clients >= payload.capacity:
+                # the payload cannot be sent to more clients: the next client will create a new one
+                self._payloads.pop(msg_root_id)
+            return payload
+
+    def record(self, payload: BroadcastPayload, hit: bool):
+        """Record whether the serialized content of the payload was reused for a client.
+
+        Args:
+            payload: the payload
+            hit: whether the content was reused
+        """
+        with self._lock:
+            stats = self._task_stats.get(payload.msg_root_id)
+            if stats:
+                if hit:
+                    stats.hits += 1
+                else:
+                    stats.misses += 1
+        self.stats_pool.increment(payload.task_name, _CounterName.HIT if hit else _CounterName.MISS)
+
+    def get_task_stats(self, msg_root_id: str) -> Tuple[int, int]:
+        """Get the number of hits and misses of a task.
+
+        Args:
+            msg_root_id: message root ID of the task
+
+        Returns: a tuple of (hits, misses)
+        """
+        with self._lock:
+            stats = self._task_stats.get(msg_root_id)
+            return (stats.hits, stats.misses) if stats else (0, 0)
+
+    def get_num_payloads(self) -> int:
+        with self._lock:
+            return len(self._payloads)
+
+    def clear(self):
+        with self._lock:
+            self._payloads.clear()
+            self._task_stats.clear()
+
+    def _msg_root_deleted(self, msg_root_id: str):
+        with self._lock:
+            self._payloads.pop(msg_root_id, None)
+            stats = self._task_stats.pop(msg_root_id, None)
+        if stats:
+            self.logger.info(
+                f"broadcast payload cache of task {stats.task_name} ({msg_root_id}): "
+                f"{stats.hits} hits, {stats.misses} misses"
+            )
@@ -0,0 +1,26 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from nvflare.apis.fl_constant import MachineStatus
+
+
+class RunInfo(object):
+    def __init__(self, job_id, app_path):
+        """Information for a run."""
+        self.job_id = job_id
+        self.start_time = time.time()
+        self.app_path = app_path
+        self.status = MachineStatus.STOPPED.value
@@ -0,0 +1,181 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from nvflare.fuel.utils.log_utils import get_obj_logger
+from nvflare.security.logging import secure_format_exception
+
+
+class _ParkedRequest:
+    def __init__(self, client_name: str, resume_cb: Callable[[], None], deadline: float):
+        self.client_name = client_name
+        self.resume_cb = resume_cb
+        self.deadline = deadline
+
+
+class TaskRequestParker:
+    def __init__(self, max_parked: int = 1000, num_workers: int = 4):
+        """Holds getTask requests of clients until tasks may be available for them.
+
+        A request that got no task is parked with a resume CB instead of being answered right away.
+        The CB is called, in a worker thread, when notify() is called for the client of the request,
+        or when the request has been parked for its timeout. The CB is expected to process the request
+        again and send the reply.
+
+        Args:
+            max_parked: max number of requests to park at the same time
+            num_workers: number of threads for calling the resume CBs
+        """
+        self.max_parked = max_parked
+        self.num_workers = num_workers
+        self.logger = get_obj_logger(self)
+        self._parked = {}  # client name => _ParkedRequest
+        self._deadlines = []  # heap of (deadline, count, _ParkedRequest); resumed requests are skipped when popped
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._seq = 0  # increased whenever tasks may have become available
+        self._closed = False
+        self._executor = None
+        self._timer = None
+
+    def get_seq(self) -> int:
+        """Get the notification sequence number.
+
+        Get it before processing a request, and pass it to park() if no task is found for the request.
+
+        Returns: the current notification sequence number
+        """
+        with self._cond:
+            return self._seq
+
+    def park(self, client_name: str, resume_cb: Callable[[], None], timeout: float, seq: int) -> bool:
+        """Park the getTask request of a client.
+
+        If the client already has a parked request, the old request is resumed right away.
+        If notify() was called since the specified seq was obtained, the request is resumed right away,
+        since the client may have missed the new task when its request was processed.
+
+        Args:
+            client_name: name of the client
+            resume_cb: the CB to process the request again and send the reply
+            timeout: max number of seconds to park the request
+            seq: the notification sequence number obtained before the request was processed
+
+        Returns: whether the request is parked. If not, the caller must reply to the request.
+        """
+        with self._cond:
+            if self._closed or timeout <= 0:
+                return False
+            if client_name not in self._parked and len(self._parked) >= self.max_parked:
+                return False
+
+            self._start()
+            old = self._parked.pop(client_name, None)
+            to_resume = [old] if old else []
+            req = _ParkedRequest(client_name, resume_cb, time.time() + timeout)
+            if seq != self._seq:
+                to_resume.append(req)
+            else:
+                self._parked[client_name] = req
+                heapq.heappush(self._deadlines, (req.deadline, next(self._counter), req))
+                if self._deadlines[0][2] is req:
+                    # the timer must wake up earlier
+                    self._cond.notify()
+
+        for r in to_resume:
+            self._resume(r)
+        return True
+
+    def notify(self, client_names: Optional[List[str]] = None):
+        """Resume the parked requests of the specified clients, since tasks may be available for them.
+
+        Args:
+            client_names: names of the clients. None or empty means all clients.
+        """
+        with self._cond:
+            self._seq += 1
+            if not client_names:
+                to_resume = list(self._parked.values())
+                self._parked.clear()
+                self._deadlines.clear()
+            else:
+                to_resume = [self._parked.pop(n) for n in client_names if n in self._parked]
+
+        for r in to_resume:
+            self._resume(r)
+
+    def get_num_parked(self) -> int:
+        with self._cond:
+            return len(self._parked)
+
+    def close(self):
+        """Resume all parked requests, and stop parking new ones."""
+        with self._cond:
+            self._closed = True
+            to_resume = list(self._parked.values())
+            self._parked.clear()
+            self._deadlines.clear()
+            self._cond.notify()
+
+        for r in to_resume:
+            self._resume(r)
+
+        if self._executor:
+            # resume CBs that are already submitted still run
+            self._executor.shutdown(wait=False)
+
+    def _start(self):
+        # called with the lock held
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="task_req_parker")
+            self._timer = threading.Thread(target=self._expire, name="task_req_parker_timer", daemon=True)
+            self._timer.start()
+
+    def _resume(self, req: _ParkedRequest):
+        try:
+            self._executor.submit(self._call_resume_cb, req)
+        except RuntimeError:
+            # the executor is shut down
+            self._call_resume_cb(req)
+
+    def _call_resume_cb(self, req: _ParkedRequest):
+        try:
+            req.resume_cb()
+        except Exception as e:
+            self.logger.error(f"error resuming task request of {req.client_name}: {secure_format_exception(e)}")
+
+    def _expire(self):
+        while True:
+            expired = []
+            with self._cond:
+                if self._closed:
+                    return
+                now = time.time()
+                while self._deadlines and self._deadlines[0][0] <= now:
+                    _, _, req = heapq.heappop(self._deadlines)
+                    if self._parked.get(req.client_name) is req:
+                        del self._parked[req.client_name]
+                        expired.append(req)
+                if not expired:
+                    self._cond.wait(self._deadlines[0][0] - now if self._deadlines else None)
+                    continue
+
+            for r in expired:
+                self._resume(r)
@@ -0,0 +1,34 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .fed_task import FedTaskRecipe
+from .fedavg import FedAvgRecipe
+from .poc_env import PocEnv
+from .prod_env import ProdEnv
+from .run import Run
+from .sim_env import SimEnv
+from .utils import add_cross_site_evaluation, add_experiment_tracking, set_per_site_config, set_recipe_meta
+
+__all__ = [
+    "SimEnv",
+    "PocEnv",
+    "ProdEnv",
+    "Run",
+    "add_experiment_tracking",
+    "add_cross_site_evaluation",
+    "set_per_site_config",
+    "set_recipe_meta",
+    "FedAvgRecipe",
+    "FedTaskRecipe",
+]
@@ -0,0 +1,28 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class FlareServiceConstants(object):
+    FLARE_PROJ_ADMIN = "admin@nvidia.com"
+    FLARE_OTHER_ADMINS = "other_admins"
+    FLARE_SERVER = "server"
+    FLARE_CLIENTS = "clients"
+    STARTUP = "startup"
+    CMD_START = "start"
+    CMD_STOP = "stop"
+    EXAMPLES = "examples"
+    TRANSFER = "transfer"
+    IS_DOCKER_RUN = "is_docker_run"
+    DOCKER_RUN_MODE = "docker_run_mode"
+    DOCKER_RUN_MODE_DEPLOY = "deploy"
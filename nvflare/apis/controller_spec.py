@@ -17,6 +17,7 @@ import time
 import uuid
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import Optional
 
 from nvflare.apis.signal import Signal
 
@@ -77,6 +78,7 @@ class Task:
         task_done_cb=None,
         operator=None,
         secure=False,
+        concurrent_callbacks: bool = False,
     ):
         """Init the Task.
 
@@ -98,6 +100,9 @@ class Task:
                 It needs to follow the task_done_cb_signature.
             operator: task operator that describes the operation of the task
             secure: should this task be transmitted in a secure way
+            concurrent_callbacks: whether the before_task_sent_cb, after_task_sent_cb and result_received_cb of
+                different clients may run at the same time. By default, the callbacks of a task are serialized by
+                its cb_lock. Only set this if the callbacks are thread-safe.
 
         """
         if not isinstance(name, str):
@@ -112,6 +117,7 @@ class Task:
         self.data = data  # task data to be sent to client(s)
         self.operator = operator
         self.cb_lock = threading.Lock()
+        self.concurrent_callbacks = concurrent_callbacks
         self.secure = secure
 
         data.set_header(ReservedHeaderKey.TASK_NAME, name)
@@ -509,6 +515,18 @@ class ControllerSpec(ABC):
         """
         pass
 
+    def wait_for_standing_tasks(self, timeout: Optional[float] = None, max_num_tasks: int = 0) -> bool:
+        """Waits until the number of standing tasks is no more than max_num_tasks.
+
+        Args:
+            timeout: max time in seconds to wait. None means to wait until the condition is met.
+            max_num_tasks: the number of standing tasks to wait for
+
+        Returns: whether the number of standing tasks is no more than max_num_tasks
+
+        """
+        pass
+
     def cancel_task(
         self,
         task: Task,
@@ -60,6 +60,17 @@ class Filter(FLComponent, ABC):
         """
         pass
 
+    def is_client_independent(self) -> bool:
+        """Whether the result of the filter is the same for all clients that are sent the same data.
+
+        The server filters the data of a broadcast task only once for all its targets, if all the filters
+        of the task are client independent.
+
+        Returns: True if the filter result does not depend on the client. Default is False.
+
+        """
+        return False
+
     def set_prop(self, key: str, value):
         setattr(self, key, value)
 
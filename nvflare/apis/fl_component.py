@@ -26,6 +26,10 @@ from .shareable import Shareable
 
 
 class FLComponent(StatePersistable):
+
+    # incremented whenever a component changes the events it receives, so dispatch tables can be rebuilt
+    _subscription_version = 0
+
     def __init__(self):
         """Init FLComponent.
 
@@ -37,6 +41,7 @@ class FLComponent(StatePersistable):
         self._name = self.__class__.__name__
         self.logger = get_obj_logger(self)
         self._event_handlers = {}
+        self._subscribed_events = None
 
     def _self_check(self):
         # This is used to dynamically construct all required elements of FLComponent.
@@ -50,6 +55,9 @@ class FLComponent(StatePersistable):
         if not hasattr(self, "_event_handlers"):
             self._event_handlers = {}
 
+        if not hasattr(self, "_subscribed_events"):
+            self._subscribed_events = None
+
     @property
     def name(self):
         self._self_check()
@@ -285,7 +293,50 @@ class FLComponent(StatePersistable):
 
             if not already_registered:
                 entries.append((handler, kwargs))
+        FLComponent._subscription_version += 1
 
     def get_event_handlers(self):
         self._self_check()
         return self._event_handlers
+
+    def subscribe_events(self, event_types: str | list[str]):
+        """Declares the event types that handle_event of this component handles.
+
+        By default, a component receives all events. Once a component subscribes to event types, it only receives
+        the subscribed events and the events it registered handlers for with register_event_handler, so the event
+        dispatcher can skip this component for all other events.
+
+        Subscriptions should be made in the constructor. A subclass that handles more events in its handle_event
+        must subscribe to them too.
+
+        Args:
+            event_types: an event type or a list of event types
+        """
+        self._self_check()
+        if isinstance(event_types, str):
+            event_types = [event_types]
+        elif not isinstance(event_types, list):
+            raise ValueError(f"event_types must be string or list of strings but got {type(event_types)}")
+
+        if self._subscribed_events is None:
+            self._subscribed_events = set()
+        self._subscribed_events.update(event_types)
+        FLComponent._subscription_version += 1
+
+    @staticmethod
+    def get_subscription_version() -> int:
+        """Gets the version of the event subscriptions of all components.
+
+        The version changes whenever a component subscribes to events or registers an event handler.
+        """
+        return FLComponent._subscription_version
+
+    def get_subscribed_events(self):
+        """Gets the event types this component receives.
+
+        Returns: set of event types, or None if the component receives all events
+        """
+        self._self_check()
+        if self._subscribed_events is None:
+            return None
+        return self._subscribed_events.union(self._event_handlers.keys())
@@ -208,6 +208,9 @@ class FLContextKey:
     # Tensor streaming: minimum get_task_timeout required by server (stored in FLContext)
     MIN_GET_TASK_TIMEOUT = "__min_get_task_timeout__"
 
+    # names of the targets of a broadcast task; set when the task data sent to a client is shared by all targets
+    BROADCAST_TASK_TARGETS = "__broadcast_task_targets__"
+
 
 class ProcessType:
     SERVER_PARENT = "SP"
@@ -242,6 +245,7 @@ class AdminCommandNames:
     REMOVE_STUDY_USER = "remove_study_user"
     SUBMIT_JOB = "submit_job"
     LIST_JOBS = "list_jobs"
+    REBUILD_JOB_INDEX = "rebuild_job_index"
     GET_JOB_META = "get_job_meta"
     LIST_JOB = "list_job"
     DOWNLOAD_JOB = "download_job"
@@ -322,6 +326,7 @@ class ServerCommandKey:
     TURN_TO_COLD = "__turn_to_cold__"
     REASON = "reason"
     MIN_GET_TASK_TIMEOUT = "min_get_task_timeout"
+    LONG_POLL_TIMEOUT = "long_poll_timeout"
 
 
 class FedEventHeader:
@@ -544,6 +549,20 @@ class ConfigVarName:
     # client: timeout for getTask requests
     GET_TASK_TIMEOUT = "get_task_timeout"
 
+    # client: how long the server may hold a getTask request until a task is available (0 means no long poll)
+    GET_TASK_LONG_POLL_TIMEOUT = "get_task_long_poll_timeout"
+
+    # server: max number of getTask requests held by the server at the same time
+    MAX_PARKED_TASK_REQUESTS = "max_parked_task_requests"
+
+    # server: whether to filter and serialize the data of a broadcast task only once for all its targets.
+    # Defaults to false. The data is sent as PreEncoded values, which receivers can only decode with the
+    # PreEncodedDecomposer: only set to true when all clients run a version that has it.
+    BROADCAST_PAYLOAD_CACHE = "broadcast_payload_cache"
+
+    # server: whether to protect the data of a broadcast task with a deep copy, instead of a read-only view
+    BROADCAST_DATA_DEEP_COPY = "broadcast_data_deep_copy"
+
     # client: timeout for submitTaskResult requests
     SUBMIT_TASK_RESULT_TIMEOUT = "submit_task_result_timeout"
 
@@ -591,6 +610,15 @@ class ConfigVarName:
     # Example: recipe.add_client_config({"np_min_download_timeout": 600.0})
     MIN_DOWNLOAD_TIMEOUT = "min_download_timeout"
 
+    # SJ and CJ: send numpy arrays in the raw buffer format instead of npz (np_use_raw_format). Defaults to false.
+    # Only set to true when all receivers run a version that understands the raw format.
+    USE_RAW_FORMAT = "use_raw_format"
+
+    # SJ and CJ: send arrays and tensors larger than the download chunk size as multiple ranged items
+    # (np_use_ranged_items, tensor_use_ranged_items; numpy arrays also need np_use_raw_format). Defaults to false.
+    # Only set to true when all receivers run a version that understands ranged items.
+    USE_RANGED_ITEMS = "use_ranged_items"
+
     # SJ and CJ: min file size for streaming. If file size is less than this, it will be attached to msg directly.
     MIN_FILE_SIZE_FOR_STREAMING = "min_file_size_for_streaming"
 
@@ -107,6 +107,17 @@ class AnyRelayTaskManager(TaskManager):
         sent_target_count[client_name] = send_count + 1
         return TaskCheckStatus.SEND
 
+    def has_fixed_targets(self, task: Task) -> bool:
+        """Determine whether the task can only be sent to the targets it is scheduled with.
+
+        Args:
+            task (Task): an instance of Task
+
+        Returns:
+            bool: False if the clients that ask for the task are added to its targets
+        """
+        return not task.props[_KEY_DYNAMIC_TARGETS]
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine whether the task should exit.
 
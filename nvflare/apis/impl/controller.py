@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
 from abc import ABC
 from typing import List, Optional, Union
 
@@ -142,6 +143,15 @@ class Controller(FLComponent, ControllerSpec, ABC):
             self.logger.warning(f"get_num_standing_tasks() is not supported by {self.communicator}: {e}")
             return None
 
+    def wait_for_standing_tasks(self, timeout: Optional[float] = None, max_num_tasks: int = 0) -> bool:
+        try:
+            return self.communicator.wait_for_standing_tasks(timeout, max_num_tasks)
+        except (AttributeError, NotImplementedError):
+            # the communicator cannot notify - fall back to polling
+            time.sleep(self._task_check_period if timeout is None else timeout)
+            num_tasks = self.get_num_standing_tasks()
+            return num_tasks is not None and num_tasks <= max_num_tasks
+
     def cancel_task(
         self, task: Task, completion_status=TaskCompletionStatus.CANCELLED, fl_ctx: Optional[FLContext] = None
     ):
@@ -15,6 +15,7 @@ import datetime
 import os
 import pathlib
 import shutil
+import sqlite3
 import tempfile
 import threading
 import time
@@ -23,6 +24,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from nvflare.apis.client_engine_spec import ClientEngineSpec
 from nvflare.apis.fl_context import FLContext
+from nvflare.apis.impl.job_meta_index import JobMetaIndex, match_job_meta
 from nvflare.apis.job_def import (
     Job,
     JobDataKey,
@@ -49,6 +51,7 @@ _OBJ_TAG_SCHEDULED = "scheduled"
 _SUBMIT_RECORD_URI_ROOT = "job_submit_records"
 _SUBMIT_RECORD_JOB_INDEX_URI_ROOT = "job_submit_record_index"
 _SUBMIT_RECORD_URIS_KEY = "submit_record_uris"
+_JOB_INDEX_FILE_SUFFIX = "_meta_index.sqlite"
 
 
 class JobInfo:
@@ -121,7 +124,27 @@ class _ScheduleJobFilter(_JobFilter):
 
 
 class SimpleJobDefManager(JobDefManagerSpec):
-    def __init__(self, uri_root: str = "jobs", job_store_id: str = "job_store"):
+    def __init__(
+        self,
+        uri_root: str = "jobs",
+        job_store_id: str = "job_store",
+        use_index: bool = True,
+        index_path: Optional[str] = None,
+        index_sync_interval: float = 60.0,
+    ):
+        """Job definition manager that keeps the jobs in the job store.
+
+        Args:
+            uri_root: root URI of the jobs in the job store
+            job_store_id: component ID of the job store
+            use_index: whether to keep an SQLite index of the job metas, so jobs can be looked up without reading
+                the meta of every job from the job store
+            index_path: path of the index file. Defaults to <uri_root name>_meta_index.sqlite in the root dir of the
+                workspace. The index is not used if no path is specified and the workspace is not known.
+            index_sync_interval: minimum interval in seconds between checks of the index against the job IDs in the
+                store, which catch jobs added or removed by others (e.g. another server sharing the store). The index
+                is always checked when it's first used and rebuilt by rebuild_index. Set to 0 to only check then.
+        """
         super().__init__()
         self.uri_root = uri_root
 
@@ -141,6 +164,15 @@ class SimpleJobDefManager(JobDefManagerSpec):
         )
         self._submit_record_lock = threading.Lock()
 
+        # The job index is a cache of the job store, kept in the workspace since the store may not be writable.
+        # It is created and loaded from the store when it's first used.
+        self.use_index = use_index
+        self.index_path = index_path
+        self.job_index = None
+        self.index_sync_interval = index_sync_interval
+        self._index_sync_time = None
+        self._index_lock = threading.Lock()
+
     def _get_job_store(self, fl_ctx):
         engine = fl_ctx.get_engine()
 
@@ -326,6 +358,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
         # write it to the store
         store = self._get_job_store(fl_ctx)
         store.create_object(self.job_uri(jid), uploaded_content, meta, overwrite_existing=False)
+        self._index_job(store, jid, fl_ctx)
         return meta
 
     def clone(self, from_jid: str, meta: dict, fl_ctx: FLContext) -> Dict[str, Any]:
@@ -349,11 +382,137 @@ class SimpleJobDefManager(JobDefManagerSpec):
         store.clone_object(
             from_uri=self.job_uri(from_jid), to_uri=self.job_uri(jid), meta=meta, overwrite_existing=False
         )
+        self._index_job(store, jid, fl_ctx)
         return meta
 
     def delete(self, jid: str, fl_ctx: FLContext):
         store = self._get_job_store(fl_ctx)
         store.delete_object(self.job_uri(jid))
+        with self._index_lock:
+            index = self._create_index(fl_ctx)
+        if index:
+            try:
+                index.remove(jid)
+            except (sqlite3.Error, OSError) as e:
+                self._invalidate_index(f"failed to remove job {jid} from the job index: {e}", fl_ctx)
+
+    def _update_job_meta(self, store: StorageSpec, jid: str, meta: dict, fl_ctx: FLContext):
+        store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        self._index_job(store, jid, fl_ctx)
+
+    def _index_job(self, store: StorageSpec, jid: str, fl_ctx: FLContext):
+        """Put the meta of the job in the store into the job index"""
+        with self._index_lock:
+            index = self._create_index(fl_ctx)
+        if not index:
+            return
+        try:
+            index.put(store.get_meta(self.job_uri(jid)))
+        except (sqlite3.Error, OSError, StorageException) as e:
+            self._invalidate_index(f"failed to update job {jid} in the job index: {e}", fl_ctx)
+
+    def _invalidate_index(self, reason: str, fl_ctx: FLContext):
+        # the index may be out of date: it will be rebuilt from the store before it's used again
+        self.log_error(fl_ctx, reason)
+        try:
+            self.job_index.invalidate()
+        except (sqlite3.Error, OSError) as e:
+            self.log_error(fl_ctx, f"failed to invalidate the job index: {e}")
+
+    def _get_index_path(self, fl_ctx: FLContext) -> Optional[str]:
+        if self.index_path:
+            return self.index_path
+
+        engine = fl_ctx.get_engine()
+        get_workspace = getattr(engine, "get_workspace", None)
+        workspace = get_workspace() if callable(get_workspace) else None
+        if not workspace:
+            return None
+        uri_root = self.uri_root.rstrip(os.sep) or self.uri_root
+        return os.path.join(workspace.get_root_dir(), os.path.basename(uri_root) + _JOB_INDEX_FILE_SUFFIX)
+
+    def _create_index(self, fl_ctx: FLContext) -> Optional[JobMetaIndex]:
+        """Create the job index when it's first used. Must be called with the index lock held."""
+        if self.job_index or not self.use_index:
+            return self.job_index
+
+        index_path = self._get_index_path(fl_ctx)
+        if not index_path:
+            self.log_warning(fl_ctx, "job index is not used: no index path and no workspace")
+            self.use_index = False
+            return None
+        self.job_index = JobMetaIndex(index_path)
+        return self.job_index
+
+    def _get_index(self, store: StorageSpec, fl_ctx: FLContext) -> Optional[JobMetaIndex]:
+        """Get the job index that is in sync with the store, or None if the index is not available"""
+        with self._index_lock:
+            if not self._create_index(fl_ctx):
+                return None
+            try:
+                if not self.job_index.is_built():
+                    self._rebuild_index(store, fl_ctx)
+                elif self._index_sync_due():
+                    self._sync_index(store, fl_ctx)
+                return self.job_index
+            except (sqlite3.Error, OSError) as e:
+                self.log_error(fl_ctx, f"job index {self.job_index.db_path} is not available: {e}")
+                return None
+
+    def _read_job_metas(self, store: StorageSpec, job_ids) -> List[dict]:
+        metas = []
+        for jid in job_ids:
+            try:
+                meta = store.get_meta(self.job_uri(jid))
+            except StorageException:
+                # the job is being deleted
+                continue
+            if meta:
+                metas.append(meta)
+        return metas
+
+    def _list_job_ids(self, store: StorageSpec) -> List[str]:
+        return [pathlib.PurePath(uri).name for uri in store.list_objects(self.uri_root)]
+
+    def _rebuild_index(self, store: StorageSpec, fl_ctx: FLContext) -> int:
+        start = time.time()
+        count = self.job_index.rebuild(self._read_job_metas(store, self._list_job_ids(store)))
+        self._index_sync_time = time.time()
+        self.log_info(fl_ctx, f"rebuilt job index with {count} jobs in {time.time() - start:.3f} secs")
+        return count
+
+    def _index_sync_due(self) -> bool:
+        if self._index_sync_time is None:
+            # the index was built before (e.g. by a previous run of the server): check it once
+            return True
+        return 0 < self.index_sync_interval <= time.time() - self._index_sync_time
+
+    def _sync_index(self, store: StorageSpec, fl_ctx: FLContext):
+        # Listing the job IDs is O(N) in the store, so this is only done when the index is first used and then at
+        # most every index_sync_interval. Only the job IDs are compared: jobs added or removed by others are caught
+        # up, but changes by others to the metas of indexed jobs are not.
+        self._index_sync_time = time.time()
+        job_ids = set(self._list_job_ids(store))
+        indexed_ids = self.job_index.job_ids()
+        for meta in self._read_job_metas(store, job_ids - indexed_ids):
+            self.job_index.put(meta)
+        for jid in indexed_ids - job_ids:
+            self.job_index.remove(jid)
+        self.log_debug(fl_ctx, f"job index synced: {len(job_ids)} jobs")
+
+    def rebuild_index(self, fl_ctx: FLContext) -> int:
+        """Rebuild the job index from the metas of all jobs in the job store.
+
+        Args:
+            fl_ctx: FLContext
+
+        Returns: number of jobs in the index
+        """
+        store = self._get_job_store(fl_ctx)
+        with self._index_lock:
+            if not self._create_index(fl_ctx):
+                raise RuntimeError("job index is not enabled")
+            return self._rebuild_index(store, fl_ctx)
 
     def _validate_meta(self, meta):
         """Validate meta
@@ -387,7 +546,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
     def set_results_uri(self, jid: str, result_uri: str, fl_ctx: FLContext):
         store = self._get_job_store(fl_ctx)
         updated_meta = {JobMetaKey.RESULT_LOCATION.value: result_uri}
-        store.update_meta(self.job_uri(jid), updated_meta, replace=False)
+        self._update_job_meta(store, jid, updated_meta, fl_ctx)
         return self.get_job(jid, fl_ctx)
 
     def get_app(self, job: Job, app_name: str, fl_ctx: FLContext) -> bytes:
@@ -473,11 +632,11 @@ class SimpleJobDefManager(JobDefManagerSpec):
                     job_meta.get(JobMetaKey.START_TIME.value), "%Y-%m-%d %H:%M:%S.%f"
                 )
                 meta[JobMetaKey.DURATION.value] = str(datetime.datetime.now() - start_time)
-        store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        self._update_job_meta(store, jid, meta, fl_ctx)
 
     def update_meta(self, jid: str, meta, fl_ctx: FLContext):
         store = self._get_job_store(fl_ctx)
-        store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        self._update_job_meta(store, jid, meta, fl_ctx)
 
     def refresh_meta(self, job: Job, meta_keys: list, fl_ctx: FLContext):
         """Refresh meta of the job as specified in the meta keys
@@ -500,15 +659,77 @@ class SimpleJobDefManager(JobDefManagerSpec):
             self.update_meta(job.job_id, meta, fl_ctx)
 
     def get_all_jobs(self, fl_ctx: FLContext) -> List[Job]:
-        job_filter = _AllJobsFilter()
-        self._scan(job_filter, fl_ctx)
-        return job_filter.result
+        index = self._get_index(self._get_job_store(fl_ctx), fl_ctx)
+        if index:
+            return [job_from_meta(meta) for meta in index.query()]
+        return self._scan_all(fl_ctx)
 
     def get_jobs_to_schedule(self, fl_ctx: FLContext) -> List[Job]:
-        job_filter = _ScheduleJobFilter(self._get_job_store(fl_ctx))
+        store = self._get_job_store(fl_ctx)
+        index = self._get_index(store, fl_ctx)
+        if index:
+            return [job_from_meta(meta) for meta in index.query(status=RunStatus.SUBMITTED)]
+
+        job_filter = _ScheduleJobFilter(store)
         self._scan(job_filter, fl_ctx, skip_tag=_OBJ_TAG_SCHEDULED)
         return job_filter.result
 
+    def query_jobs(
+        self,
+        fl_ctx: FLContext,
+        status: Union[RunStatus, List[RunStatus], None] = None,
+        submitter: Optional[str] = None,
+        study: Optional[str] = None,
+        job_id_prefix: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        submitted_after: Optional[float] = None,
+        submitted_before: Optional[float] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Job]:
+        """Get jobs that match all the specified conditions, ordered by submit time.
+
+        Args:
+            fl_ctx: the FL context
+            status: a single status value or a list of status values
+            submitter: name of the submitter
+            study: study of the jobs
+            job_id_prefix: case-insensitive prefix of the job IDs
+            name_prefix: case-insensitive prefix of the job names
+            submitted_after: min submit time (inclusive) of the jobs
+            submitted_before: max submit time (exclusive) of the jobs
+            newest_first: whether to return the most recently submitted jobs first
+            limit: max number of jobs to return. None means no limit.
+            offset: number of matching jobs to skip, for pagination
+
+        Returns: list of matching jobs
+        """
+        conditions = dict(
+            status=status,
+            submitter=submitter,
+            study=study,
+            job_id_prefix=job_id_prefix,
+            name_prefix=name_prefix,
+            submitted_after=submitted_after,
+            submitted_before=submitted_before,
+        )
+        index = self._get_index(self._get_job_store(fl_ctx), fl_ctx)
+        if index:
+            metas = index.query(newest_first=newest_first, limit=limit, offset=offset, **conditions)
+            return [job_from_meta(meta) for meta in metas]
+
+        jobs = [job for job in self._scan_all(fl_ctx) if match_job_meta(job.meta, **conditions)]
+        jobs.sort(key=lambda job: (job.meta.get(JobMetaKey.SUBMIT_TIME.value) or 0.0, job.job_id))
+        if newest_first:
+            jobs.reverse()
+        return jobs[offset:] if limit is None else jobs[offset : offset + limit]
+
+    def _scan_all(self, fl_ctx: FLContext) -> List[Job]:
+        job_filter = _AllJobsFilter()
+        self._scan(job_filter, fl_ctx)
+        return job_filter.result
+
     def _scan(self, job_filter: _JobFilter, fl_ctx: FLContext, skip_tag=None):
         store = self._get_job_store(fl_ctx)
         obj_uris = store.list_objects(self.uri_root, without_tag=skip_tag)
@@ -535,6 +756,10 @@ class SimpleJobDefManager(JobDefManagerSpec):
         Returns: list of jobs that are in specified status
 
         """
+        index = self._get_index(self._get_job_store(fl_ctx), fl_ctx)
+        if index:
+            return [job_from_meta(meta) for meta in index.query(status=status)]
+
         job_filter = _StatusFilter(status)
         self._scan(job_filter, fl_ctx)
         return job_filter.result
@@ -556,7 +781,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
             approvals[reviewer_name] = (approved, note)
             updated_meta = {JobMetaKey.APPROVALS.value: approvals}
             store = self._get_job_store(fl_ctx)
-            store.update_meta(self.job_uri(jid), updated_meta, replace=False)
+            self._update_job_meta(store, jid, updated_meta, fl_ctx)
         return meta
 
     def save_workspace(self, jid: str, data: Union[bytes, str, List[str]], fl_ctx: FLContext):
@@ -172,6 +172,17 @@ class SequentialRelayTaskManager(TaskManager):
         self.logger.debug("win_end_idx={}".format(win_end_idx))
         return win_start_idx, win_end_idx
 
+    def has_fixed_targets(self, task: Task) -> bool:
+        """Determine whether the task can only be sent to the targets it is scheduled with.
+
+        Args:
+            task (Task): an instance of Task
+
+        Returns:
+            bool: False if the clients that ask for the task are added to its targets
+        """
+        return not task.props[_KEY_DYNAMIC_TARGETS]
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine whether the task should exit.
 
@@ -94,3 +94,15 @@ class TaskManager(object):
             fl_ctx (FLContext): fl context that comes with the task request
         """
         pass
+
+    def has_fixed_targets(self, task: Task) -> bool:
+        """Determine whether the task can only be sent to the targets it is scheduled with.
+
+        Args:
+            task (Task): an instance of Task
+
+        Returns:
+            bool: True if the task can only be sent to its scheduled targets; False if clients may be added
+            to its targets when they ask for tasks.
+        """
+        return True
@@ -11,11 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import heapq
 import threading
 import time
 from collections import OrderedDict
+from contextlib import nullcontext
 from threading import Lock
-from typing import List, Optional, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 from nvflare.apis.client import Client
 from nvflare.apis.controller_spec import ClientTask, SendOrder, Task, TaskCompletionStatus
@@ -26,6 +29,7 @@ from nvflare.apis.fl_context import FLContext
 from nvflare.apis.job_def import job_from_meta
 from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_copy
 from nvflare.apis.signal import Signal
+from nvflare.apis.utils.frozen_data import FrozenData
 from nvflare.apis.wf_comm_spec import WFCommSpec
 from nvflare.fuel.utils.config_service import ConfigService
 from nvflare.fuel.utils.msg_root_utils import delete_msg_root
@@ -41,6 +45,7 @@ from .task_manager import TaskCheckStatus, TaskManager
 _TASK_KEY_ENGINE = "___engine"
 _TASK_KEY_MANAGER = "___mgr"
 _TASK_KEY_DONE = "___done"
+_TASK_KEY_SEQ = "___seq"
 _COMPLETED_CLIENT_TASK_CACHE_SIZE = 10000
 
 
@@ -69,19 +74,25 @@ def _check_inputs(task: Task, fl_ctx: FLContext, targets: Union[List[Client], Li
                 )
 
 
-def _get_client_task(target, task: Task):
-    for ct in task.client_tasks:
-        if target == ct.client.name:
-            return ct
-    return None
-
-
 class _DeadClientStatus:
     def __init__(self):
         self.report_time = time.time()
         self.disconnect_time = None
 
 
+class _TaskState:
+    def __init__(self):
+        """Synchronizes the task requests, submissions and the task monitor that process one task.
+
+        The lock is only held to check and update the state of the task, never while the callbacks of the task run,
+        so clients can get the task and submit their results while the callbacks of other clients run.
+        """
+        self.lock = threading.Condition()
+        self.data_lock = Lock()  # protects the creation of the broadcast data of the task
+        self.busy = 0  # number of task requests and submissions that are running callbacks of the task
+        self.receiving = set()  # ids of the client tasks whose results are being processed
+
+
 class _CompletedClientTaskInfo:
     def __init__(self, client_name: str, task_name: str):
         self.client_name = client_name
@@ -99,6 +110,11 @@ class WFCommServer(FLComponent, WFCommSpec):
         self.controller = None
         self._engine = None
         self._tasks = []  # list of standing tasks
+        self._task_seq = 0  # sequence number of the last scheduled task
+        # standing tasks that may be sent to a client, in the order they are scheduled:
+        # client name => {task seq => task}. Tasks without targets (i.e. for any client) are kept separately.
+        self._client_tasks_index = {}
+        self._any_client_tasks = {}  # task seq => task
         self._client_task_map = {}  # client_task_id => client_task
         self._completed_client_task_map = OrderedDict()  # client_task_id => _CompletedClientTaskInfo
         self._all_done = False
@@ -106,10 +122,38 @@ class WFCommServer(FLComponent, WFCommSpec):
         self._task_monitor = threading.Thread(target=self._monitor_tasks, args=(), name="wf_task", daemon=True)
         self._task_check_period = task_check_period
         self._dead_client_grace = 60.0
+        self._broadcast_data_deep_copy = False
         self._dead_clients = {}  # clients reported dead: name => _DeadClientStatus
         self._dead_clients_lock = Lock()  # need lock since dead_clients can be modified from different threads
-        # make sure check_tasks, process_task_request, process_submission does not interfere with each other
+        # make sure check_tasks and finalize_run do not interfere with each other.
+        # Task requests and submissions are not serialized by this lock: they are synchronized by the state lock of
+        # the task they are processing, which is not held while task callbacks run.
         self._controller_lock = Lock()
+        # set to wake up the task monitor to check tasks right away, e.g. when a result is received
+        self._check_tasks_event = threading.Event()
+        # notified when standing tasks are removed
+        self._tasks_removed = threading.Condition()
+        # called with the names of the clients (None means all clients) that may have new tasks to get
+        self._new_task_cb = None
+
+    def set_new_task_cb(self, cb: Optional[Callable[[Optional[List[str]]], None]]):
+        """Set the CB to be called when tasks may have become available to clients.
+
+        The CB is called with the names of the clients that may get new tasks, or None for all clients.
+        The runner uses it to answer the task requests it holds right away.
+
+        Args:
+            cb: the CB, or None to remove it
+        """
+        self._new_task_cb = cb
+
+    def _notify_new_task(self, client_names: Optional[List[str]]):
+        cb = self._new_task_cb
+        if cb:
+            try:
+                cb(client_names)
+            except Exception as e:
+                self.logger.error(f"error notifying new task: {secure_format_exception(e)}")
 
     def initialize_run(self, fl_ctx: FLContext):
         """Called by runners to initialize controller with information in fl_ctx.
@@ -130,6 +174,9 @@ class WFCommServer(FLComponent, WFCommSpec):
         self._dead_client_grace = ConfigService.get_float_var(
             name=ConfigVarName.DEAD_CLIENT_GRACE_PERIOD, conf=SystemConfigs.APPLICATION_CONF, default=60.0
         )
+        self._broadcast_data_deep_copy = ConfigService.get_bool_var(
+            name=ConfigVarName.BROADCAST_DATA_DEEP_COPY, conf=SystemConfigs.APPLICATION_CONF, default=False
+        )
         self._task_monitor.start()
 
     def _cleanup_inflight_tensor_downloads(self, fl_ctx: FLContext):
@@ -206,8 +253,140 @@ class WFCommServer(FLComponent, WFCommSpec):
         Returns:
             Tuple[str, str, Shareable]: task_name, an id for the client_task, and the data for this request
         """
-        with self._controller_lock:
-            return self._do_process_task_request(client, fl_ctx)
+        return self._do_process_task_request(client, fl_ctx)
+
+    def _get_candidate_tasks(self, client_name: str) -> List[Task]:
+        """Get the standing tasks that may be sent to the client, in the order they were scheduled.
+
+        Must be called with the task lock held.
+
+        Args:
+            client_name: name of the client
+
+        Returns: list of tasks that target the client or any client
+        """
+        client_tasks = self._client_tasks_index.get(client_name)
+        if not client_tasks:
+            return list(self._any_client_tasks.values())
+        if not self._any_client_tasks:
+            return list(client_tasks.values())
+        return [t for _, t in heapq.merge(client_tasks.items(), self._any_client_tasks.items(), key=lambda x: x[0])]
+
+    def _index_task(self, task: Task):
+        """Add a scheduled task to the client task index. Must be called with the task lock held."""
+        self._task_seq += 1
+        task.props[_TASK_KEY_SEQ] = self._task_seq
+        if not task.targets or not task.props[_TASK_KEY_MANAGER].has_fixed_targets(task):
+            # the task may be sent to any client
+            self._any_client_tasks[self._task_seq] = task
+            return
+
+        for name in task.targets:
+            self._client_tasks_index.setdefault(name, {})[self._task_seq] = task
+
+    def _unindex_task(self, task: Task):
+        """Remove a task from the client task index. Must be called with the task lock held."""
+        seq = task.props.get(_TASK_KEY_SEQ)
+        if seq is None:
+            return
+
+        if self._any_client_tasks.pop(seq, None) is not None:
+            return
+
+        for name in task.targets:
+            client_tasks = self._client_tasks_index.get(name)
+            if client_tasks is not None:
+                client_tasks.pop(seq, None)
+                if not client_tasks:
+                    self._client_tasks_index.pop(name)
+
+    @staticmethod
+    def _callback_lock(task: Task):
+        """The callbacks of a task are serialized by its cb_lock, unless the task allows them to run concurrently."""
+        return nullcontext() if task.concurrent_callbacks else task.cb_lock
+
+    def _end_callbacks(self, task: Task):
+        """Called when a task request or submission is done with the callbacks of the task."""
+        state = task._comm_state
+        with state.lock:
+            state.busy -= 1
+            if state.busy:
+                return
+            state.lock.notify_all()
+        if task.completion_status is not None:
+            # the monitor may be waiting for the callbacks to exit the task
+            self._check_tasks_event.set()
+
+    def _check_task_send(self, task: Task, client: Client, fl_ctx: FLContext) -> Tuple[str, Optional[ClientTask]]:
+        """Check whether the task should be sent to the client. Must be called with the state lock of the task held.
+
+        Args:
+            task: the task to check
+            client: the client that requests a task
+            fl_ctx: FLContext associated with the request
+
+        Returns: a tuple of (TaskCheckStatus, the client task to send). The client task is the one that was already
+        sent to the client if it's resent.
+        """
+        if not task.is_standing or task.completion_status is not None:
+            # this task is finished (and waiting for the monitor to exit it)
+            return TaskCheckStatus.NO_BLOCK, None
+
+        # do we need to send this task to this client?
+        # note: the task could be sent to a client multiple times (e.g. in relay)
+        # we only check the last ClientTask sent to the client
+        client_task_to_check = task.last_client_task_map.get(client.name, None)
+        self.logger.debug("client_task_to_check: {}".format(client_task_to_check))
+
+        if client_task_to_check is not None:
+            # this client has been sent the task already
+            if client_task_to_check.result_received_time is None:
+                if client_task_to_check.id in task._comm_state.receiving:
+                    # the result of the client is being processed
+                    return TaskCheckStatus.NO_BLOCK, None
+
+                # controller has not received result from client
+                # something wrong happens when client working on this task, so resend the task
+                return TaskCheckStatus.SEND, client_task_to_check
+
+        # check with the task manager whether to send
+        manager = task.props[_TASK_KEY_MANAGER]
+        if client_task_to_check is None:
+            client_task_to_check = ClientTask(task=task, client=client)
+        check_status = manager.check_task_send(client_task_to_check, fl_ctx)
+        self.logger.debug(
+            "Checking client task: {}, task.client.name: {}".format(
+                client_task_to_check, client_task_to_check.client.name
+            )
+        )
+        self.logger.debug("Check task send get check_status: {}".format(check_status))
+        if check_status == TaskCheckStatus.SEND:
+            # creates the client_task to be checked for sending
+            return check_status, ClientTask(client, task)
+        return check_status, None
+
+    def _record_client_task(self, client_task: ClientTask):
+        """Record that the client task is sent, before the callbacks of the task run.
+
+        Must be called with the state lock of the task held. The caller must call _end_callbacks when it's done with
+        the callbacks of the task.
+
+        Args:
+            client_task: the client task to send
+        """
+        task = client_task.task
+        resend_task = client_task.task_sent_time is not None
+        client_task.task_sent_time = time.time()
+        client_task.task_send_count += 1
+
+        if not resend_task:
+            task.last_client_task_map[client_task.client.name] = client_task
+            task.client_tasks.append(client_task)
+            with self._task_lock:
+                self._client_task_map[client_task.id] = client_task
+
+        # the monitor doesn't exit the task until the callbacks are done
+        task._comm_state.busy += 1
 
     def _do_process_task_request(self, client: Client, fl_ctx: FLContext) -> Tuple[str, str, Shareable]:
         if not isinstance(client, Client):
@@ -216,158 +395,173 @@ class WFCommServer(FLComponent, WFCommSpec):
         if not isinstance(fl_ctx, FLContext):
             raise TypeError("fl_ctx must be an instance of FLContext, but got {}".format(type(fl_ctx)))
 
-        client_task_to_send = None
+        # only check the tasks that may be sent to this client, instead of all standing tasks
         with self._task_lock:
-            self.logger.debug("self._tasks: {}".format(self._tasks))
-            for task in self._tasks:
-                if task.completion_status is not None:
-                    # this task is finished (and waiting for the monitor to exit it)
+            candidate_tasks = self._get_candidate_tasks(client.name)
+            self.logger.debug("candidate tasks of {}: {}".format(client.name, candidate_tasks))
+
+        # the task is checked and recorded with its state lock held, so that the task manager sees the task state
+        # consistently. The callbacks run without it, so they don't block other clients.
+        task_to_resend = None
+        for task in candidate_tasks:
+            with task._comm_state.lock:
+                check_status, client_task_to_send = self._check_task_send(task, client, fl_ctx)
+                if check_status == TaskCheckStatus.BLOCK:
+                    # do not send this task, and do not check other tasks
+                    return self._try_again()
+                elif check_status == TaskCheckStatus.NO_BLOCK:
+                    # do not send this task, but continue to check next task
+                    continue
+                elif client_task_to_send.task_sent_time is not None:
+                    # the task was sent to the client already: resend it if no other task is available
+                    task_to_resend = task
                     continue
 
-                # do we need to send this task to this client?
-                # note: the task could be sent to a client multiple times (e.g. in relay)
-                # we only check the last ClientTask sent to the client
-                client_task_to_check = task.last_client_task_map.get(client.name, None)
-                self.logger.debug("client_task_to_check: {}".format(client_task_to_check))
-                resend_task = False
-
-                if client_task_to_check is not None:
-                    # this client has been sent the task already
-                    if client_task_to_check.result_received_time is None:
-                        # controller has not received result from client
-                        # something wrong happens when client working on this task, so resend the task
-                        resend_task = True
-                        client_task_to_send = client_task_to_check
-                        fl_ctx.set_prop(FLContextKey.IS_CLIENT_TASK_RESEND, True, sticky=False)
-
-                if not resend_task:
-                    # check with the task manager whether to send
-                    manager = task.props[_TASK_KEY_MANAGER]
-                    if client_task_to_check is None:
-                        client_task_to_check = ClientTask(task=task, client=client)
-                    check_status = manager.check_task_send(client_task_to_check, fl_ctx)
-                    self.logger.debug(
-                        "Checking client task: {}, task.client.name: {}".format(
-                            client_task_to_check, client_task_to_check.client.name
-                        )
-                    )
-                    self.logger.debug("Check task send get check_status: {}".format(check_status))
-                    if check_status == TaskCheckStatus.BLOCK:
-                        # do not send this task, and do not check other tasks
-                        return self._try_again()
-                    elif check_status == TaskCheckStatus.NO_BLOCK:
-                        # do not send this task, but continue to check next task
-                        continue
-                    else:
-                        # creates the client_task to be checked for sending
-                        client_task_to_send = ClientTask(client, task)
-                        break
-
-        # NOTE: move task sending process outside the task lock
-        # This is to minimize the locking time and to avoid potential deadlock:
-        # the CB could schedule another task, which requires lock
-        self.logger.debug("Determining based on client_task_to_send: {}".format(client_task_to_send))
-        if client_task_to_send is None:
+                self._record_client_task(client_task_to_send)
+            return self._send_client_task(client_task_to_send, False, fl_ctx)
+
+        if task_to_resend is None:
             # no task available for this client
             return self._try_again()
 
+        with task_to_resend._comm_state.lock:
+            # the task could be finished after it was checked
+            check_status, client_task_to_send = self._check_task_send(task_to_resend, client, fl_ctx)
+            if check_status != TaskCheckStatus.SEND:
+                return self._try_again()
+
+            resend_task = client_task_to_send.task_sent_time is not None
+            self._record_client_task(client_task_to_send)
+        return self._send_client_task(client_task_to_send, resend_task, fl_ctx)
+
+    def _send_client_task(
+        self, client_task_to_send: ClientTask, resend_task: bool, fl_ctx: FLContext
+    ) -> Tuple[str, str, Shareable]:
+        """Run the send callbacks of the client task and make the data to send.
+
+        The client task must have been recorded with _record_client_task.
+
+        Args:
+            client_task_to_send: the client task to send
+            resend_task: whether the client task was sent before
+            fl_ctx: FLContext associated with the request
+
+        Returns: task_name, an id for the client_task, and the data for this request
+        """
+        task = client_task_to_send.task
+        try:
+            with self._callback_lock(task):
+                return self._do_send_client_task(client_task_to_send, resend_task, fl_ctx)
+        finally:
+            self._end_callbacks(task)
+
+    def _do_send_client_task(
+        self, client_task_to_send: ClientTask, resend_task: bool, fl_ctx: FLContext
+    ) -> Tuple[str, str, Shareable]:
+        self.logger.debug("Determining based on client_task_to_send: {}".format(client_task_to_send))
+
         # try to send the task
         can_send_task = True
         task = client_task_to_send.task
-        with task.cb_lock:
-            # Note: must guarantee the after_task_sent_cb is always called
-            # regardless whether the task is sent successfully.
-            # This is so that the app could clear up things in after_task_sent_cb.
-            if task.before_task_sent_cb is not None:
-                try:
-                    task.before_task_sent_cb(client_task=client_task_to_send, fl_ctx=fl_ctx)
-                except Exception as e:
-                    self.log_exception(
-                        fl_ctx,
-                        "processing error in before_task_sent_cb on task {} ({}): {}".format(
-                            client_task_to_send.task.name, client_task_to_send.id, secure_format_exception(e)
-                        ),
-                    )
-                    # this task cannot proceed anymore
-                    task.completion_status = TaskCompletionStatus.ERROR
-                    task.exception = e
+        if resend_task:
+            fl_ctx.set_prop(FLContextKey.IS_CLIENT_TASK_RESEND, True, sticky=False)
+
+        # Note: must guarantee the after_task_sent_cb is always called
+        # regardless whether the task is sent successfully.
+        # This is so that the app could clear up things in after_task_sent_cb.
+        if task.before_task_sent_cb is not None:
+            try:
+                task.before_task_sent_cb(client_task=client_task_to_send, fl_ctx=fl_ctx)
+            except Exception as e:
+                self.log_exception(
+                    fl_ctx,
+                    "processing error in before_task_sent_cb on task {} ({}): {}".format(
+                        client_task_to_send.task.name, client_task_to_send.id, secure_format_exception(e)
+                    ),
+                )
+                # this task cannot proceed anymore
+                task.completion_status = TaskCompletionStatus.ERROR
+                task.exception = e
 
-            self.logger.debug("before_task_sent_cb done on client_task_to_send: {}".format(client_task_to_send))
-            self.logger.debug(f"task completion status is {task.completion_status}")
+        self.logger.debug("before_task_sent_cb done on client_task_to_send: {}".format(client_task_to_send))
+        self.logger.debug(f"task completion status is {task.completion_status}")
 
-            if task.completion_status is not None:
-                can_send_task = False
+        if task.completion_status is not None:
+            can_send_task = False
 
-            # remember the task name and data to be sent to the client
-            # since task.data could be reset by the after_task_sent_cb
-            task_name = task.name
+        # remember the task name and data to be sent to the client
+        # since task.data could be reset by the after_task_sent_cb
+        task_name = task.name
 
-            # For broadcast tasks, create a protected copy of task.data after before_task_sent_cb runs.
-            # This protects against data corruption from concurrent in-place modifications.
-            # The copy is created once for the first client, then reused for all subsequent clients.
+        # For broadcast tasks, create a protected view of task.data after before_task_sent_cb runs.
+        # This protects against data corruption from concurrent in-place modifications.
+        # The view is created once for the first client, then reused for all subsequent clients.
+        # Arrays are shared read-only instead of copied, unless deep copy is configured.
+        with task._comm_state.data_lock:
             if not hasattr(task, "_broadcast_data"):
                 manager = task.props.get(_TASK_KEY_MANAGER)
                 if isinstance(manager, (BcastTaskManager, BcastForeverTaskManager)):
-                    import copy
-
                     try:
-                        task._broadcast_data = copy.deepcopy(task.data)
+                        if self._broadcast_data_deep_copy:
+                            task._broadcast_data = copy.deepcopy(task.data)
+                        else:
+                            task._frozen_data = FrozenData(task.data)
+                            task._broadcast_data = task._frozen_data.data
                     except Exception as e:
                         self.log_error(
                             fl_ctx,
-                            f"Failed to deep copy task.data for broadcast: {type(e).__name__}: {e}. "
+                            f"Failed to protect task.data for broadcast: {type(e).__name__}: {e}. "
                             f"Cannot proceed - data corruption risk.",
                         )
                         task.completion_status = TaskCompletionStatus.ERROR
                         task.exception = e
                         can_send_task = False
+            elif hasattr(task, "_frozen_data") and not task._frozen_data.is_intact():
+                e = RuntimeError(f"tensors of task {task.name} were modified in place while the task is broadcast")
+                self.log_error(fl_ctx, f"{e}. Cannot proceed - data corruption risk.")
+                task.completion_status = TaskCompletionStatus.ERROR
+                task.exception = e
+                can_send_task = False
             task_data = getattr(task, "_broadcast_data", task.data)
-            operator = task.operator
-
-            if task.after_task_sent_cb is not None:
-                try:
-                    task.after_task_sent_cb(client_task=client_task_to_send, fl_ctx=fl_ctx)
-                except Exception as e:
-                    self.log_exception(
-                        fl_ctx,
-                        "processing error in after_task_sent_cb on task {} ({}): {}".format(
-                            client_task_to_send.task.name, client_task_to_send.id, secure_format_exception(e)
-                        ),
-                    )
-                    task.completion_status = TaskCompletionStatus.ERROR
-                    task.exception = e
+        operator = task.operator
 
-            if task.completion_status is not None:
-                # NOTE: the CB could cancel the task
-                can_send_task = False
+        if task.after_task_sent_cb is not None:
+            try:
+                task.after_task_sent_cb(client_task=client_task_to_send, fl_ctx=fl_ctx)
+            except Exception as e:
+                self.log_exception(
+                    fl_ctx,
+                    "processing error in after_task_sent_cb on task {} ({}): {}".format(
+                        client_task_to_send.task.name, client_task_to_send.id, secure_format_exception(e)
+                    ),
+                )
+                task.completion_status = TaskCompletionStatus.ERROR
+                task.exception = e
 
-            if not can_send_task:
-                return self._try_again()
+        if task.completion_status is not None:
+            # NOTE: the CB could cancel the task
+            can_send_task = False
 
-            self.logger.debug("after_task_sent_cb done on client_task_to_send: {}".format(client_task_to_send))
+        if not can_send_task:
+            return self._try_again()
 
-        with self._task_lock:
-            # sent the ClientTask and remember it
-            now = time.time()
-            client_task_to_send.task_sent_time = now
-            client_task_to_send.task_send_count += 1
+        self.logger.debug("after_task_sent_cb done on client_task_to_send: {}".format(client_task_to_send))
 
-            if not resend_task:
-                task.last_client_task_map[client.name] = client_task_to_send
-                task.client_tasks.append(client_task_to_send)
-                self._client_task_map[client_task_to_send.id] = client_task_to_send
+        # Create per-client copy first, then set per-client headers on the copy.
+        # This avoids mutating the shared _broadcast_data (for broadcast tasks).
+        client_data = make_copy(task_data)
 
-            # Create per-client copy first, then set per-client headers on the copy.
-            # This avoids mutating the shared _broadcast_data (for broadcast tasks).
-            client_data = make_copy(task_data)
+        if operator:
+            client_data.set_header(key=ReservedHeaderKey.TASK_OPERATOR, value=operator)
 
-            if operator:
-                client_data.set_header(key=ReservedHeaderKey.TASK_OPERATOR, value=operator)
+        client_data.set_header(ReservedHeaderKey.TASK_ID, client_task_to_send.id)
+        client_data.set_header(ReservedHeaderKey.MSG_ROOT_ID, task.msg_root_id)
+        client_data.set_header(ReservedHeaderKey.MSG_ROOT_TTL, task.timeout)
 
-            client_data.set_header(ReservedHeaderKey.TASK_ID, client_task_to_send.id)
-            client_data.set_header(ReservedHeaderKey.MSG_ROOT_ID, task.msg_root_id)
-            client_data.set_header(ReservedHeaderKey.MSG_ROOT_TTL, task.timeout)
-            return task_name, client_task_to_send.id, client_data
+        if isinstance(task.props.get(_TASK_KEY_MANAGER), BcastTaskManager) and hasattr(task, "_broadcast_data"):
+            # the data is the same for all targets of the task: tell the runner so it can be encoded only once
+            fl_ctx.set_prop(FLContextKey.BROADCAST_TASK_TARGETS, task.targets, private=True, sticky=False)
+        return task_name, client_task_to_send.id, client_data
 
     def handle_exception(self, task_id: str, fl_ctx: FLContext) -> None:
         """Called to cancel one task as its client_task is causing exception at upper level.
@@ -431,8 +625,7 @@ class WFCommServer(FLComponent, WFCommSpec):
             TypeError: when result is not an instance of Shareable
             ValueError: task_name is not found in the client_task
         """
-        with self._controller_lock:
-            self._do_process_submission(client, task_name, task_id, result, fl_ctx)
+        self._do_process_submission(client, task_name, task_id, result, fl_ctx)
 
     def _do_process_submission(
         self, client: Client, task_name: str, task_id: str, result: Shareable, fl_ctx: FLContext
@@ -450,6 +643,7 @@ class WFCommServer(FLComponent, WFCommSpec):
             client_task = self._client_task_map.get(task_id, None)
             completed_client_task = self._get_completed_client_task_info(task_id) if client_task is None else None
             self.log_debug(fl_ctx, "Get submission from client task={} id={}".format(client_task, task_id))
+            task = client_task.task if client_task else None
 
         if client_task is None:
             if (
@@ -472,8 +666,8 @@ class WFCommServer(FLComponent, WFCommSpec):
             self.fire_event(EventType.AFTER_PROCESS_RESULT_OF_UNKNOWN_TASK, fl_ctx)
             return
 
-        task = client_task.task
-        with task.cb_lock:
+        state = task._comm_state
+        with state.lock:
             if client_task.client.name != client.name:
                 self.log_warning(
                     fl_ctx,
@@ -490,35 +684,49 @@ class WFCommServer(FLComponent, WFCommSpec):
                 self.log_info(fl_ctx, "task is already finished - submission dropped")
                 return
 
-            if client_task.result_received_time is not None:
+            if client_task.result_received_time is not None or client_task.id in state.receiving:
                 self.log_info(fl_ctx, "client task result is already received - submission dropped")
                 return
 
-            # do client task CB processing outside the lock
-            # this is because the CB could schedule another task, which requires the lock
             client_task.result = result
 
             manager = task.props[_TASK_KEY_MANAGER]
             manager.check_task_result(result, client_task, fl_ctx)
 
-            if task.result_received_cb is not None:
-                try:
-                    self.log_debug(fl_ctx, "invoking result_received_cb ...")
-                    task.result_received_cb(client_task=client_task, fl_ctx=fl_ctx)
-                except Exception as e:
-                    # this task cannot proceed anymore
-                    self.log_exception(
-                        fl_ctx,
-                        "processing error in result_received_cb on task {}({}): {}".format(
-                            task_name, task_id, secure_format_exception(e)
-                        ),
-                    )
-                    task.completion_status = TaskCompletionStatus.ERROR
-                    task.exception = e
-            else:
-                self.log_debug(fl_ctx, "no result_received_cb")
+            # do client task CB processing outside the state lock, so results of other clients are not blocked
+            state.receiving.add(client_task.id)
+            state.busy += 1
+
+        try:
+            with self._callback_lock(task):
+                if task.result_received_cb is not None:
+                    try:
+                        self.log_debug(fl_ctx, "invoking result_received_cb ...")
+                        task.result_received_cb(client_task=client_task, fl_ctx=fl_ctx)
+                    except Exception as e:
+                        # this task cannot proceed anymore
+                        self.log_exception(
+                            fl_ctx,
+                            "processing error in result_received_cb on task {}({}): {}".format(
+                                task_name, task_id, secure_format_exception(e)
+                            ),
+                        )
+                        task.completion_status = TaskCompletionStatus.ERROR
+                        task.exception = e
+                else:
+                    self.log_debug(fl_ctx, "no result_received_cb")
+        finally:
+            with state.lock:
+                client_task.result_received_time = time.time()
+                state.receiving.discard(client_task.id)
+            self._end_callbacks(task)
 
-            client_task.result_received_time = time.time()
+        # the task may be complete with this result - check it now instead of at the next check period
+        self._check_tasks_event.set()
+
+        if isinstance(manager, (SequentialRelayTaskManager, AnyRelayTaskManager)):
+            # the task may be relayed to the next client now
+            self._notify_new_task(None)
 
     def _schedule_task(
         self,
@@ -569,11 +777,16 @@ class WFCommServer(FLComponent, WFCommSpec):
         task.props[_TASK_KEY_ENGINE] = self._engine
         task.is_standing = True
         task.schedule_time = time.time()
+        task._comm_state = _TaskState()
 
         with self._task_lock:
             self._tasks.append(task)
+            self._index_task(task)
             self.log_info(fl_ctx, "scheduled task {}".format(task.name))
 
+        # empty targets means any client
+        self._notify_new_task(task.targets or None)
+
     def broadcast(
         self,
         task: Task,
@@ -791,6 +1004,25 @@ class WFCommServer(FLComponent, WFCommSpec):
         """
         return len(self._tasks)
 
+    def wait_for_standing_tasks(self, timeout: Optional[float] = None, max_num_tasks: int = 0) -> bool:
+        """Wait until the number of standing tasks is no more than max_num_tasks.
+
+        The caller is woken up as soon as the tasks are removed, instead of polling get_num_standing_tasks.
+
+        Args:
+            timeout: max time in seconds to wait. None means to wait until the condition is met.
+            max_num_tasks: the number of standing tasks to wait for
+
+        Returns:
+            bool: whether the number of standing tasks is no more than max_num_tasks
+        """
+        with self._tasks_removed:
+            return self._tasks_removed.wait_for(lambda: len(self._tasks) <= max_num_tasks, timeout)
+
+    def _notify_tasks_removed(self):
+        with self._tasks_removed:
+            self._tasks_removed.notify_all()
+
     def cancel_task(
         self, task: Task, completion_status=TaskCompletionStatus.CANCELLED, fl_ctx: Optional[FLContext] = None
     ):
@@ -810,6 +1042,7 @@ class WFCommServer(FLComponent, WFCommSpec):
             fl_ctx (Optional[FLContext], optional): FLContext associated with this cancellation. Defaults to None.
         """
         task.completion_status = completion_status
+        self._check_tasks_event.set()
 
     def cancel_all_tasks(self, completion_status=TaskCompletionStatus.CANCELLED, fl_ctx: Optional[FLContext] = None):
         """Cancel all standing tasks in this controller.
@@ -825,6 +1058,7 @@ class WFCommServer(FLComponent, WFCommSpec):
         with self._task_lock:
             for t in self._tasks:
                 t.completion_status = completion_status
+        self._check_tasks_event.set()
 
     def _release_task_resources(self, task: Task, fl_ctx: Optional[FLContext] = None):
         """Drop references owned by a task after it leaves the communicator."""
@@ -838,8 +1072,7 @@ class WFCommServer(FLComponent, WFCommSpec):
                 "error cleaning up download transactions for task {}: {}".format(task.name, secure_format_exception(e)),
             )
 
-        if hasattr(task, "_broadcast_data"):
-            delattr(task, "_broadcast_data")
+        self._release_broadcast_data(task)
 
         for client_task in task.client_tasks:
             client_task.result = None
@@ -859,6 +1092,17 @@ class WFCommServer(FLComponent, WFCommSpec):
         # references still owned by this communicator.
         task.task_done_cb = None
 
+    @staticmethod
+    def _release_broadcast_data(task: Task):
+        """Drop the broadcast data of the task, and release the task data it protects."""
+        frozen_data = getattr(task, "_frozen_data", None)
+        if frozen_data:
+            frozen_data.release()
+            delattr(task, "_frozen_data")
+
+        if hasattr(task, "_broadcast_data"):
+            delattr(task, "_broadcast_data")
+
     def _clear_standing_tasks(
         self, completion_status=TaskCompletionStatus.CANCELLED, fl_ctx: Optional[FLContext] = None
     ):
@@ -870,14 +1114,23 @@ class WFCommServer(FLComponent, WFCommSpec):
         with self._task_lock:
             exit_tasks = list(self._tasks)
             self._tasks.clear()
+            self._client_tasks_index.clear()
+            self._any_client_tasks.clear()
             self._client_task_map.clear()
             self._completed_client_task_map.clear()
+            for task in exit_tasks:
+                task.is_standing = False
 
         for task in exit_tasks:
-            if task.completion_status is None:
-                task.completion_status = completion_status
-            task.is_standing = False
-            self._release_task_resources(task, fl_ctx)
+            # the task could be processed by a task request or submission that is still in progress
+            state = task._comm_state
+            with state.lock:
+                state.lock.wait_for(lambda: not state.busy)
+                if task.completion_status is None:
+                    task.completion_status = completion_status
+            with task.cb_lock:
+                self._release_task_resources(task, fl_ctx)
+        self._notify_tasks_removed()
 
     def finalize_run(self, fl_ctx: FLContext):
         """Do cleanup of the coordinator implementation.
@@ -893,6 +1146,7 @@ class WFCommServer(FLComponent, WFCommSpec):
             self._cleanup_inflight_tensor_downloads(fl_ctx)
             self._clear_standing_tasks(fl_ctx=fl_ctx)
             self._all_done = True
+        self._check_tasks_event.set()
 
     def relay(
         self,
@@ -1044,65 +1298,56 @@ class WFCommServer(FLComponent, WFCommSpec):
                     self.fire_event(EventType.CLIENT_DISCONNECTED, fl_ctx)
 
     def _monitor_tasks(self):
+        last_client_check_time = 0.0
         while not self._all_done:
-            # determine clients are still active or not
-            self._check_dead_clients()
+            # client status is checked once per check period; tasks are also checked when woken up
+            now = time.time()
+            if now - last_client_check_time >= self._task_check_period:
+                last_client_check_time = now
 
-            should_abort_job = self._job_policy_violated()
-            if not should_abort_job:
-                self.check_tasks()
-            else:
-                with self._engine.new_context() as fl_ctx:
-                    self.system_panic("Aborting job due to deployment policy violation", fl_ctx)
-                return
-            time.sleep(self._task_check_period)
+                # determine clients are still active or not
+                self._check_dead_clients()
+
+                if self._job_policy_violated():
+                    with self._engine.new_context() as fl_ctx:
+                        self.system_panic("Aborting job due to deployment policy violation", fl_ctx)
+                    return
+
+            self.check_tasks()
+            self._check_tasks_event.wait(self._task_check_period)
+            self._check_tasks_event.clear()
 
     def check_tasks(self):
         with self._controller_lock:
             self._do_check_tasks()
 
     def _do_check_tasks(self):
-        exit_tasks = []
         with self._task_lock:
-            for task in self._tasks:
-                if task.completion_status is not None:
-                    exit_tasks.append(task)
-                    continue
+            tasks = list(self._tasks)
 
-                # check the task-specific exit condition
-                manager = task.props[_TASK_KEY_MANAGER]
-                if manager is not None:
-                    if not isinstance(manager, TaskManager):
-                        raise TypeError(
-                            "manager in task must be an instance of TaskManager, but got {}".format(manager)
-                        )
-                    should_exit, exit_status = manager.check_task_exit(task)
-                    self.logger.debug("should_exit: {}, exit_status: {}".format(should_exit, exit_status))
-                    if should_exit:
-                        task.completion_status = exit_status
-                        exit_tasks.append(task)
-                        continue
-
-                # check if task timeout
-                if task.timeout and time.time() - task.schedule_time >= task.timeout:
-                    task.completion_status = TaskCompletionStatus.TIMEOUT
-                    exit_tasks.append(task)
+        exit_tasks = []
+        for task in tasks:
+            state = task._comm_state
+            with state.lock:
+                if task.completion_status is None and not self._check_task_exit(task):
                     continue
 
-                # check whether clients that the task is waiting are all dead
-                dead_clients = self._get_task_dead_clients(task)
-                if dead_clients:
-                    self.logger.info(f"client {dead_clients} is dead - set task {task.name} to TIMEOUT")
-                    task.completion_status = TaskCompletionStatus.CLIENT_DEAD
-                    exit_tasks.append(task)
+                if state.busy:
+                    # the task is being sent to a client or its result is being processed: exit it when that is done,
+                    # so that its callbacks don't run after task_done_cb
                     continue
 
+                # no more requests or submissions can start processing the task
+                task.is_standing = False
+                exit_tasks.append(task)
+
+        with self._task_lock:
             for exit_task in exit_tasks:
-                exit_task.is_standing = False
                 self.logger.debug(
                     "Removing task={}, completion_status={}".format(exit_task, exit_task.completion_status)
                 )
                 self._tasks.remove(exit_task)
+                self._unindex_task(exit_task)
                 for client_task in exit_task.client_tasks:
                     self.logger.debug("Removing client_task with id={}".format(client_task.id))
                     self._remember_completed_client_task(client_task)
@@ -1113,9 +1358,17 @@ class WFCommServer(FLComponent, WFCommSpec):
         if len(exit_tasks) <= 0:
             return
 
+        # the data of the exit tasks can be modified in place again
+        for exit_task in exit_tasks:
+            frozen_data = getattr(exit_task, "_frozen_data", None)
+            if frozen_data:
+                frozen_data.release()
+
+        self._notify_tasks_removed()
+
         with self._engine.new_context() as fl_ctx:
             for exit_task in exit_tasks:
-                with exit_task.cb_lock:
+                with self._callback_lock(exit_task):
                     self.log_info(
                         fl_ctx, "task {} exit with status {}".format(exit_task.name, exit_task.completion_status)
                     )
@@ -1151,8 +1404,42 @@ class WFCommServer(FLComponent, WFCommSpec):
                             exit_task.exception = e
 
                     # Clean up broadcast data copy to free memory (important for large models)
-                    if hasattr(exit_task, "_broadcast_data"):
-                        delattr(exit_task, "_broadcast_data")
+                    self._release_broadcast_data(exit_task)
+
+    def _check_task_exit(self, task: Task) -> bool:
+        """Check whether the task should exit, and set its completion status if so.
+
+        Must be called with the state lock of the task held.
+
+        Args:
+            task: the task to check
+
+        Returns: whether the task should exit
+        """
+        # check the task-specific exit condition
+        manager = task.props[_TASK_KEY_MANAGER]
+        if manager is not None:
+            if not isinstance(manager, TaskManager):
+                raise TypeError("manager in task must be an instance of TaskManager, but got {}".format(manager))
+            should_exit, exit_status = manager.check_task_exit(task)
+            self.logger.debug("should_exit: {}, exit_status: {}".format(should_exit, exit_status))
+            if should_exit:
+                task.completion_status = exit_status
+                return True
+
+        # check if task timeout
+        if task.timeout and time.time() - task.schedule_time >= task.timeout:
+            task.completion_status = TaskCompletionStatus.TIMEOUT
+            return True
+
+        # check whether clients that the task is waiting are all dead
+        dead_clients = self._get_task_dead_clients(task)
+        if dead_clients:
+            self.logger.info(f"client {dead_clients} is dead - set task {task.name} to TIMEOUT")
+            task.completion_status = TaskCompletionStatus.CLIENT_DEAD
+            return True
+
+        return False
 
     def _get_task_dead_clients(self, task: Task):
         """
@@ -1169,7 +1456,7 @@ class WFCommServer(FLComponent, WFCommSpec):
 
         dead_clients = []
         for target in task.targets:
-            ct = _get_client_task(target, task)
+            ct = task.last_client_task_map.get(target)
             if ct is not None and ct.result_received_time:
                 # response has been received from this client
                 continue
@@ -1187,17 +1474,22 @@ class WFCommServer(FLComponent, WFCommSpec):
         return dead_clients
 
     @staticmethod
-    def _process_finished_task(task, func):
+    def _process_finished_task(task, func, done_event: Optional[threading.Event] = None):
         def wrap(*args, **kwargs):
-            if func:
-                func(*args, **kwargs)
-            task.props[_TASK_KEY_DONE] = True
+            try:
+                if func:
+                    func(*args, **kwargs)
+            finally:
+                task.props[_TASK_KEY_DONE] = True
+                if done_event:
+                    done_event.set()
 
         return wrap
 
     def wait_for_task(self, task: Task, abort_signal: Signal):
         task.props[_TASK_KEY_DONE] = False
-        task.task_done_cb = self._process_finished_task(task=task, func=task.task_done_cb)
+        done_event = threading.Event()
+        task.task_done_cb = self._process_finished_task(task=task, func=task.task_done_cb, done_event=done_event)
         while True:
             if task.completion_status is not None:
                 break
@@ -1209,7 +1501,9 @@ class WFCommServer(FLComponent, WFCommSpec):
             task_done = task.props.get(_TASK_KEY_DONE, False)
             if task_done:
                 break
-            time.sleep(self._task_check_period)
+
+            # woken up as soon as the task is done; the timeout is for checking the abort signal
+            done_event.wait(self._task_check_period)
 
     def _job_policy_violated(self):
         if not self._engine:
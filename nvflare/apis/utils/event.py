@@ -11,8 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
 import uuid
-from typing import List
+from typing import Callable, List, Optional
 
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_constant import EventScope, FLContextKey
@@ -24,18 +25,25 @@ _KEY_EVENT_DEPTH = "###event_depth"
 _MAX_EVENT_DEPTH = 20
 
 
-def fire_event_to_components(event: str, components: List[FLComponent], ctx: FLContext):
+def fire_event_to_components(
+    event: str,
+    components: List[FLComponent],
+    ctx: FLContext,
+    handler_time_cb: Optional[Callable[[str, FLComponent, float], None]] = None,
+):
     """Fires the specified event and invokes the list of handlers.
 
     Args:
         event: the event to be fired
         components: components to be invoked
         ctx: context for cross-component data sharing
+        handler_time_cb: if specified, called with the event, the component and the time (secs) the component
+            took to handle the event
 
     Returns: N/A
 
     """
-    event_id = str(uuid.uuid4())
+    event_id = str(uuid.uuid4()) if components else None
     event_data = ctx.get_prop(FLContextKey.EVENT_DATA, None)
     event_origin = ctx.get_prop(FLContextKey.EVENT_ORIGIN, None)
     event_scope = ctx.get_prop(FLContextKey.EVENT_SCOPE, EventScope.LOCAL)
@@ -51,6 +59,7 @@ def fire_event_to_components(event: str, components: List[FLComponent], ctx: FLC
         for h in components:
             if not isinstance(h, FLComponent):
                 raise TypeError(f"handler must be FLComponent but got {type(h)}")
+            start = time.perf_counter() if handler_time_cb else 0.0
             try:
                 # since events could be recursive (a handler fires another event) on the same fl_ctx,
                 # we need to reset these key values into the fl_ctx
@@ -81,4 +90,7 @@ def fire_event_to_components(event: str, components: List[FLComponent], ctx: FLC
                     ctx.set_prop(FLContextKey.EXCEPTIONS, exceptions, sticky=False, private=True)
                 exceptions[h.name] = e
 
+            if handler_time_cb:
+                handler_time_cb(event, h, time.perf_counter() - start)
+
     ctx.set_prop(key=_KEY_EVENT_DEPTH, value=depth, private=True, sticky=False)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC
+from typing import Optional
 
 from nvflare.apis.client import Client
 from nvflare.apis.controller_spec import SendOrder, Task, TaskCompletionStatus
@@ -225,6 +226,18 @@ class WFCommSpec(ABC):
         """
         raise NotImplementedError
 
+    def wait_for_standing_tasks(self, timeout: Optional[float] = None, max_num_tasks: int = 0) -> bool:
+        """Waits until the number of standing tasks is no more than max_num_tasks.
+
+        Args:
+            timeout: max time in seconds to wait. None means to wait until the condition is met.
+            max_num_tasks: the number of standing tasks to wait for
+
+        Returns: whether the number of standing tasks is no more than max_num_tasks
+
+        """
+        raise NotImplementedError
+
     def cancel_task(
         self,
         task: Task,
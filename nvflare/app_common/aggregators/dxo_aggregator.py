@@ -17,8 +17,12 @@ from typing import Any, Dict, Optional
 from nvflare.apis.dxo import DXO, DataKind, MetaKey
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_context import FLContext
-from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+from nvflare.app_common.aggregators.weighted_aggregation_helper import (
+    ShardedWeightedAggregationHelper,
+    WeightedAggregationHelper,
+)
 from nvflare.app_common.app_constant import AppConstants
+from nvflare.app_common.filters.sparsify_update import SPARSE_SOURCE_FORMAT
 from nvflare.fuel.utils.log_utils import get_module_logger
 
 
@@ -30,6 +34,8 @@ class DXOAggregator(FLComponent):
         expected_data_kind: DataKind = DataKind.WEIGHT_DIFF,
         name_postfix: str = "",
         weigh_by_local_iter: bool = True,
+        flat_buffer: bool = False,
+        aggregation_shards: int = 1,
     ):
         """Perform accumulated weighted aggregation for one kind of corresponding DXO from contributors.
 
@@ -45,15 +51,30 @@ class DXOAggregator(FLComponent):
                 the number of computations on encrypted ciphertext.
                 The aggregated sum will still be divided by the provided weights and `aggregation_weights` for the
                 resulting weighted sum to be valid.
+            flat_buffer (bool, optional): Whether to aggregate floating-point arrays and tensors in one contiguous
+                buffer per dtype with vectorized accumulation. See `WeightedAggregationHelper`. Defaults to `False`.
+            aggregation_shards (int, optional): Number of shards the keys are partitioned into to be aggregated in
+                parallel. See `ShardedWeightedAggregationHelper`. Defaults to 1 (no sharding).
         """
         super().__init__()
+        if not isinstance(aggregation_shards, int) or aggregation_shards < 1:
+            raise ValueError(f"aggregation_shards must be a positive int but got {aggregation_shards}")
+
         self.expected_data_kind = expected_data_kind
         self.aggregation_weights = aggregation_weights or {}
         self.logger.debug(f"aggregation weights control: {aggregation_weights}")
 
-        self.aggregation_helper = WeightedAggregationHelper(
-            exclude_vars=exclude_vars, weigh_by_local_iter=weigh_by_local_iter
-        )
+        if aggregation_shards > 1:
+            self.aggregation_helper = ShardedWeightedAggregationHelper(
+                num_shards=aggregation_shards,
+                exclude_vars=exclude_vars,
+                weigh_by_local_iter=weigh_by_local_iter,
+                flat_buffer=flat_buffer,
+            )
+        else:
+            self.aggregation_helper = WeightedAggregationHelper(
+                exclude_vars=exclude_vars, weigh_by_local_iter=weigh_by_local_iter, flat_buffer=flat_buffer
+            )
 
         self.warning_count = {}
         self.warning_limit = 10
@@ -67,6 +88,11 @@ class DXOAggregator(FLComponent):
         if self.aggregation_helper:
             self.aggregation_helper.reset_stats()
 
+    def close(self):
+        """Stop the worker threads of the aggregation helper, if any. They are started again when needed."""
+        if self.aggregation_helper:
+            self.aggregation_helper.close()
+
     def accept(self, dxo: DXO, contributor_name, contribution_round, fl_ctx: FLContext) -> bool:
         """Store DXO and update aggregator's internal state
         Args:
@@ -157,7 +183,13 @@ class DXOAggregator(FLComponent):
             aggregation_weight = 1.0
 
         # aggregate
-        self.aggregation_helper.add(data, aggregation_weight * float_n_iter, contributor_name, contribution_round)
+        self.aggregation_helper.add(
+            data,
+            aggregation_weight * float_n_iter,
+            contributor_name,
+            contribution_round,
+            source_formats=dxo.get_meta_prop(SPARSE_SOURCE_FORMAT),
+        )
         self.log_debug(fl_ctx, "End accept")
         return True
 
@@ -174,6 +206,8 @@ class DXOAggregator(FLComponent):
         self.log_info(fl_ctx, f"aggregating {self.aggregation_helper.get_len()} update(s) at round {current_round}")
         self.log_debug(fl_ctx, f"complete history {self.aggregation_helper.get_len()}")
         aggregated_dict = self.aggregation_helper.get_result()
+        # the round is over: do not keep idle worker threads until the next one
+        self.close()
         self.log_debug(fl_ctx, "End aggregation")
 
         dxo = DXO(data_kind=self.expected_data_kind, data=aggregated_dict)
@@ -50,6 +50,8 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
         aggregation_weights: Union[Dict[str, Any], Dict[str, Dict[str, Any]], None] = None,
         expected_data_kind: Union[DataKind, Dict[str, DataKind]] = DataKind.WEIGHT_DIFF,
         weigh_by_local_iter: bool = True,
+        flat_buffer: bool = False,
+        aggregation_shards: int = 1,
     ):
         """Perform accumulated weighted aggregation.
 
@@ -75,6 +77,12 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
                 the number of computations on encrypted ciphertext.
                 The aggregated sum will still be divided by the provided weights and `aggregation_weights` for the
                 resulting weighted sum to be valid.
+            flat_buffer (bool, optional): Whether to aggregate floating-point arrays and tensors in one contiguous
+                buffer per dtype, accumulating each contribution with one vectorized multiply-add instead of one
+                operation per key. Useful for models with many parameters. Defaults to `False`.
+            aggregation_shards (int, optional): Number of shards the parameter keys are partitioned into. Each
+                shard has its own lock and worker, so a contribution is aggregated on multiple cores and
+                concurrent contributions can be folded in at the same time. Defaults to 1 (no sharding).
         """
         super().__init__()
         self.logger.debug(f"exclude vars: {exclude_vars}")
@@ -83,6 +91,8 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
 
         self._single_dxo_key = ""
         self._weigh_by_local_iter = weigh_by_local_iter
+        self._flat_buffer = flat_buffer
+        self._aggregation_shards = aggregation_shards
 
         self.aggregation_weights = aggregation_weights
         self.exclude_vars = exclude_vars
@@ -94,6 +104,9 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
         # parameters when re-construct the object creation configuration.
         if event_type == EventType.START_RUN:
             self._initialize(self.aggregation_weights, self.exclude_vars, self.expected_data_kind)
+        elif event_type == EventType.END_RUN:
+            for dxo_aggregator in getattr(self, "dxo_aggregators", {}).values():
+                dxo_aggregator.close()
 
     def _initialize(self, aggregation_weights, exclude_vars, expected_data_kind):
         # Check expected data kind
@@ -166,6 +179,8 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
                         expected_data_kind=self.expected_data_kind[k],
                         name_postfix=k,
                         weigh_by_local_iter=self._weigh_by_local_iter,
+                        flat_buffer=self._flat_buffer,
+                        aggregation_shards=self._aggregation_shards,
                     )
                 }
             )
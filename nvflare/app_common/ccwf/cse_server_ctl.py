@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-import time
 
 from nvflare.apis.controller_spec import ClientTask, Task
 from nvflare.apis.dxo import from_shareable
@@ -202,7 +201,7 @@ class CrossSiteEvalServerController(ServerSideController):
 
                 self.log_info(fl_ctx, f"abort signal received - cancelled {len(tasks)} pending tasks")
                 return
-            time.sleep(0.5)
+            self.wait_for_standing_tasks(timeout=0.5)
 
     def _evaluate_global_models(self, abort_signal: Signal, fl_ctx: FLContext):
         if not self.eval_global:
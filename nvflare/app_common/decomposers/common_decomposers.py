@@ -19,6 +19,7 @@ from typing import Any
 from nvflare.app_common.abstract.fl_model import FLModel
 from nvflare.app_common.abstract.learnable import Learnable
 from nvflare.app_common.abstract.model import ModelLearnable
+from nvflare.app_common.utils.sparse_array import SparseArray
 from nvflare.app_common.widgets.event_recorder import _CtxPropReq, _EventReq, _EventStats
 from nvflare.fuel.utils import fobs
 from nvflare.fuel.utils.fobs.datum import DatumManager
@@ -58,6 +59,19 @@ class FLModelDecomposer(fobs.Decomposer):
         )
 
 
+class SparseArrayDecomposer(fobs.Decomposer):
+    def supported_type(self):
+        return SparseArray
+
+    def decompose(self, b: SparseArray, manager: DatumManager = None) -> Any:
+        # the index and value arrays are serialized by the numpy decomposer; the array is never densified
+        return list(b.shape), b.index_deltas, b.values
+
+    def recompose(self, data: tuple, manager: DatumManager = None) -> SparseArray:
+        shape, index_deltas, values = data
+        return SparseArray(tuple(shape), index_deltas, values)
+
+
 def register():
     if register.registered:
         return
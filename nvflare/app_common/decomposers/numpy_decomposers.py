@@ -19,8 +19,11 @@ from typing import Any, Tuple
 
 import numpy as np
 
+import nvflare.fuel.utils.app_config_utils as acu
 import nvflare.fuel.utils.fobs.dots as dots
+from nvflare.apis.fl_constant import ConfigVarName
 from nvflare.app_common.np.np_downloader import ArrayDownloadable, download_arrays
+from nvflare.app_common.np.np_raw_format import decode_arrays, encode_arrays, is_raw_format
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.streaming.download_service import Downloadable
 from nvflare.fuel.utils import fobs
@@ -28,6 +31,7 @@ from nvflare.fuel.utils.fobs.datum import DatumManager
 from nvflare.fuel.utils.fobs.decomposers.via_downloader import ViaDownloaderDecomposer
 
 _NPZ_EXTENSION = ".npz"
+_RAW_KEY = "a"
 
 
 class NumpyScalarDecomposer(fobs.Decomposer, ABC):
@@ -68,11 +72,24 @@ class NumpyArrayDecomposer(ViaDownloaderDecomposer):
     def supported_type(self):
         return np.ndarray
 
+    def supported_dots(self):
+        # receivers accept both formats; the DOT of the download datum tells which one the sender used
+        return [dots.NUMPY_DOWNLOAD, dots.NUMPY_RAW_DOWNLOAD]
+
     def get_download_dot(self) -> int:
-        return dots.NUMPY_DOWNLOAD
+        return dots.NUMPY_RAW_DOWNLOAD if self._use_raw_format() else dots.NUMPY_DOWNLOAD
+
+    def _use_raw_format(self) -> bool:
+        # opt-in: receivers of older versions cannot decode the raw format
+        return acu.get_bool_var(self._config_var_name(ConfigVarName.USE_RAW_FORMAT), False)
 
     def to_downloadable(self, items: dict, max_chunk_size: int, fobs_ctx: dict) -> Downloadable:
-        return ArrayDownloadable(items, max_chunk_size)
+        return ArrayDownloadable(
+            items,
+            max_chunk_size,
+            raw_format=self._use_raw_format(),
+            split_large_arrays=acu.get_bool_var(self._config_var_name(ConfigVarName.USE_RANGED_ITEMS), False),
+        )
 
     def download(
         self,
@@ -97,11 +114,18 @@ class NumpyArrayDecomposer(ViaDownloaderDecomposer):
         )
 
     def native_decompose(self, target: np.ndarray, manager: DatumManager = None) -> bytes:
+        if self._use_raw_format():
+            return encode_arrays({_RAW_KEY: target})
+
         stream = BytesIO()
         np.save(stream, target, allow_pickle=False)
         return stream.getvalue()
 
     def native_recompose(self, data: bytes, manager: DatumManager = None) -> np.ndarray:
+        if is_raw_format(data):
+            # writable like arrays loaded from npz; only copied if the data is read-only
+            return decode_arrays(data, writeable=True)[_RAW_KEY]
+
         stream = BytesIO(data)
         return np.load(stream, allow_pickle=False)
 
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .densify_update import DensifyUpdate
 from .exclude_vars import ExcludeVars
 from .percentile_privacy import PercentilePrivacy
+from .sparsify_update import SparsifyUpdate
 from .svt_privacy import SVTPrivacy
 
-__all__ = ["PercentilePrivacy", "SVTPrivacy", "ExcludeVars"]
+__all__ = ["PercentilePrivacy", "SVTPrivacy", "ExcludeVars", "SparsifyUpdate", "DensifyUpdate"]
@@ -0,0 +1,144 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from nvflare.apis.dxo import DXO, DataKind
+from nvflare.apis.dxo_filter import DXOFilter
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.app_common.utils.sparse_array import SparseArray, threshold_indices, top_k_indices
+
+# meta key of the DXO: name of a sparsified param => format of its dense value ("numpy" or "torch")
+SPARSE_SOURCE_FORMAT = "sparse_source_format"
+
+
+class SparsifyUpdate(DXOFilter):
+
+    TOP_K = "top_k"
+    THRESHOLD = "threshold"
+
+    def __init__(
+        self,
+        mode: str = TOP_K,
+        ratio: float = 0.01,
+        threshold: Optional[float] = None,
+        error_feedback: bool = True,
+    ):
+        """Sparsify WEIGHT_DIFF updates: only the values of the largest magnitude are sent, as `SparseArray`s.
+
+        With error feedback, the values that are not sent are kept by the filter and added to the update of the
+        next round, so small changes are not lost but delayed until they add up. The filter must then be
+        instantiated once per site, as a task result filter of the client.
+
+        A param is kept dense if its sparse form is not smaller. The WeightedAggregationHelper adds sparse
+        params into its dense totals; use `DensifyUpdate` on the server for other consumers of the updates.
+
+        Args:
+            mode (str): "top_k" to keep the ratio of the values of the largest magnitude of each param, or
+                "threshold" to keep the values whose magnitude is at least the threshold. Defaults to "top_k".
+            ratio (float): fraction of the values of each param to keep in "top_k" mode. Defaults to 0.01.
+            threshold (float, optional): min magnitude of the kept values in "threshold" mode.
+            error_feedback (bool): whether to add the values that were not sent to the next update.
+                Defaults to True.
+
+        Raises:
+            ValueError: when the mode is invalid, or its ratio or threshold is out of range
+        """
+        super().__init__(supported_data_kinds=[DataKind.WEIGHT_DIFF], data_kinds_to_filter=[DataKind.WEIGHT_DIFF])
+        if mode == self.TOP_K:
+            if not 0.0 < ratio <= 1.0:
+                raise ValueError(f"ratio must be in (0, 1] but got {ratio}")
+        elif mode == self.THRESHOLD:
+            if threshold is None or threshold < 0.0:
+                raise ValueError(f"threshold must be a non-negative number but got {threshold}")
+        else:
+            raise ValueError(f"invalid mode {mode}: must be in {(self.TOP_K, self.THRESHOLD)}")
+
+        self.mode = mode
+        self.ratio = ratio
+        self.threshold = threshold
+        self.error_feedback = error_feedback
+        self._residuals: Dict[str, np.ndarray] = {}
+
+    def _select(self, values: np.ndarray) -> np.ndarray:
+        if self.mode == self.TOP_K:
+            return top_k_indices(values, math.ceil(values.size * self.ratio))
+        return threshold_indices(values, self.threshold)
+
+    def _sparsify(self, name: str, values: np.ndarray):
+        residual = self._residuals.pop(name, None)
+        if residual is not None and residual.shape == values.shape:
+            values = values + residual
+        elif self.error_feedback:
+            # the residual is computed in place: do not modify the data of the caller
+            values = values.copy()
+
+        indices = self._select(values)
+        sparse = SparseArray.from_dense(values, indices)
+        if sparse.nbytes >= values.nbytes:
+            return values
+
+        if self.error_feedback:
+            values.reshape(-1)[indices] = 0
+            self._residuals[name] = values
+        return sparse
+
+    def process_dxo(self, dxo: DXO, shareable: Shareable, fl_ctx: FLContext) -> Union[None, DXO]:
+        """Replace the floating-point arrays and tensors of the update with their sparse form.
+
+        Args:
+            dxo (DXO): WEIGHT_DIFF DXO to be sparsified
+            shareable: the shareable that the dxo belongs to
+            fl_ctx (FLContext): only used for logging
+
+        Returns: the DXO with sparse params
+        """
+        source_formats = {}
+        n_bytes_before = 0
+        n_bytes_after = 0
+        for name, param in dxo.data.items():
+            values = param
+            source_format = "numpy"
+            if not isinstance(param, np.ndarray) and hasattr(param, "cpu") and hasattr(param, "numpy"):
+                source_format = "torch"
+                try:
+                    values = param.detach().cpu().numpy()
+                except TypeError:
+                    # dtypes without a NumPy equivalent (e.g. bfloat16) are sent dense
+                    continue
+            if not isinstance(values, np.ndarray) or values.dtype.kind != "f" or values.size == 0:
+                continue
+
+            n_bytes_before += values.nbytes
+            result = self._sparsify(name, values)
+            n_bytes_after += result.nbytes
+            if isinstance(result, SparseArray):
+                dxo.data[name] = result
+                source_formats[name] = source_format
+            elif result is not values:
+                # kept dense, with the residual of the previous round added
+                dxo.data[name] = param.new_tensor(result) if source_format == "torch" else result
+
+        dxo.set_meta_prop(SPARSE_SOURCE_FORMAT, source_formats)
+        if n_bytes_before:
+            self.log_info(
+                fl_ctx,
+                f"Sparsified {len(source_formats)} of {len(dxo.data)} params: "
+                f"{n_bytes_before / (1024 ** 2):.2f} MB to {n_bytes_after / (1024 ** 2):.2f} MB",
+            )
+        return dxo
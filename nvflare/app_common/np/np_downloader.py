@@ -16,27 +16,77 @@ from typing import Any, List, Optional, Tuple
 
 import numpy as np
 
+from nvflare.app_common.np.np_raw_format import byte_view, decode_arrays, encode_arrays, is_raw_format
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.streaming.cacheable import CacheableObject, ItemConsumer
 from nvflare.fuel.f3.streaming.download_service import download_object
 from nvflare.fuel.f3.streaming.obj_downloader import ObjectDownloader
+from nvflare.fuel.f3.streaming.ranged_item import RangedItemAssembler, encode_ranged_item, is_ranged_item, split_ranges
 
 _TWO_MB = 2 * 1024 * 1024
 
 
 class ArrayDownloadable(CacheableObject):
 
-    def __init__(self, arrays: dict[str, np.ndarray], max_chunk_size: int):
-        self.size = len(arrays)
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        max_chunk_size: int,
+        raw_format: bool = False,
+        split_large_arrays: bool = False,
+    ):
+        """Constructor of ArrayDownloadable.
+
+        Args:
+            arrays: the arrays to be downloaded
+            max_chunk_size: max number of bytes for each chunk
+            raw_format: whether to encode the arrays in the raw buffer format; if False, npz is used. Only set
+                this if all receivers understand the raw format
+            split_large_arrays: whether to send arrays larger than max_chunk_size as multiple ranged items, in the
+                raw format only. Only set this if all receivers understand ranged items
+
+        Notes: in the raw format, an array larger than max_chunk_size is sent as multiple ranged items, each
+        carrying one byte range of the array, so the array is never serialized or buffered as a whole.
+        """
         self.keys = list(arrays.keys())
+        self.raw_format = raw_format
+        self.split_large_arrays = split_large_arrays
+
+        # each item is (key, start, end); start and end are None if the whole array is sent in one item
+        self.items = []
+        for key, arr in arrays.items():
+            if self._should_split(arr, max_chunk_size):
+                self.items.extend((key, start, end) for start, end in split_ranges(arr.nbytes, max_chunk_size))
+            else:
+                self.items.append((key, None, None))
         super().__init__(arrays, max_chunk_size)
 
+    def _should_split(self, arr, max_chunk_size: int) -> bool:
+        return (
+            self.raw_format
+            and self.split_large_arrays
+            and max_chunk_size > 0
+            and isinstance(arr, np.ndarray)
+            and arr.nbytes > max_chunk_size
+            and not arr.dtype.hasobject
+            and (arr.flags.c_contiguous or arr.flags.f_contiguous)
+        )
+
     def get_item_count(self) -> int:
-        return self.size
+        return len(self.items)
 
     def produce_item(self, index: int) -> bytes:
-        key = self.keys[index]
+        key, start, end = self.items[index]
+        if start is not None:
+            arr = self.base_obj[key]
+            view, order = byte_view(arr)
+            meta = [np.lib.format.dtype_to_descr(arr.dtype), list(arr.shape), order]
+            return encode_ranged_item(key, meta, view.nbytes, start, view[start:end])
+
         arrays_to_send = {key: self.base_obj[key]}
+        if self.raw_format:
+            return encode_arrays(arrays_to_send)
+
         stream = BytesIO()
         np.savez(allow_pickle=False, file=stream, **arrays_to_send)
         return stream.getvalue()
@@ -50,9 +100,29 @@ class ArrayConsumer(ItemConsumer):
         self.cb_kwargs = cb_kwargs
         if arrays_received_cb is not None and not callable(arrays_received_cb):
             raise ValueError("arrays_received_cb must be callable")
+        self.assembler = RangedItemAssembler()
+
+    @staticmethod
+    def _allocate(key: str, meta, total_size: int):
+        descr, shape, order = meta
+        arr = np.empty(shape, dtype=np.lib.format.descr_to_dtype(descr), order=order)
+        view, _ = byte_view(arr)
+        if view.nbytes != total_size:
+            raise ValueError(f"size of array '{key}' is {view.nbytes} but expected {total_size}")
+
+        def _write(start: int, data):
+            view[start : start + len(data)] = np.frombuffer(data, dtype=np.uint8)
+
+        return arr, _write
 
     @staticmethod
     def _to_dict(item: bytes) -> dict:
+        if is_raw_format(item):
+            # the received arrays are given to the app, which may modify them like arrays loaded from npz.
+            # They are only copied if the item is read-only: received frames are writable, so normally they are not.
+            return decode_arrays(item, writeable=True)
+
+        # npz item from a sender that does not use the raw format
         result = {}
         stream = BytesIO(item)
         with np.load(stream, allow_pickle=False) as npz_obj:
@@ -67,11 +137,21 @@ class ArrayConsumer(ItemConsumer):
 
         arrays = {}
         for item in items:
+            if is_ranged_item(item):
+                key, arr = self.assembler.add(item, self._allocate)
+                if arr is not None:
+                    arrays[key] = arr
+                continue
+
             td = self._to_dict(item)
             if not isinstance(td, dict):
                 raise ValueError("cannot load received bytes to arrays")
             arrays.update(td)
 
+        if not arrays:
+            # only ranges of incomplete arrays were received
+            return result
+
         if self.arrays_received_cb is not None:
             cb_result = self.arrays_received_cb(arrays, **self.cb_kwargs)
             if isinstance(cb_result, dict):
@@ -80,11 +160,20 @@ class ArrayConsumer(ItemConsumer):
             result.update(arrays)
         return result
 
+    def download_completed(self, ref_id: str):
+        incomplete = self.assembler.incomplete_keys()
+        if incomplete:
+            self.download_failed(ref_id, f"incomplete arrays {incomplete}")
+            return
+        super().download_completed(ref_id)
+
 
 def add_arrays(
     downloader: ObjectDownloader,
     arrays: dict[str, np.ndarray],
     max_chunk_size: int = _TWO_MB,
+    raw_format: bool = False,
+    split_large_arrays: bool = False,
 ) -> str:
     """Add arrays to be downloaded to the specified downloader.
 
@@ -92,11 +181,14 @@ def add_arrays(
         downloader: the downloader to add arrays to.
         arrays: arrays to be downloaded
         max_chunk_size: max chunk size
+        raw_format: whether to send the arrays in the raw buffer format instead of npz. Only set this if all
+            receivers understand the raw format
+        split_large_arrays: whether to send arrays larger than max_chunk_size as multiple ranged items
 
     Returns: reference id for the arrays.
 
     """
-    obj = ArrayDownloadable(arrays, max_chunk_size)
+    obj = ArrayDownloadable(arrays, max_chunk_size, raw_format, split_large_arrays)
     return downloader.add_object(obj)
 
 
@@ -0,0 +1,148 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact raw-buffer wire format for numpy arrays.
+
+Unlike np.save/np.savez, the arrays are not wrapped in a zip container: the encoded data is a small header
+followed by the raw bytes of each array, so the receiver can create the arrays with np.frombuffer directly
+over the received data.
+
+The layout is:
+
+    MAGIC (6 bytes) | header_len (4 bytes, big-endian) | msgpack header | padding | array data ...
+
+The header is a list of [key, dtype_descr, shape, order, offset, nbytes], one per array. The offset is from the
+start of the encoded data, and is aligned to ALIGNMENT bytes.
+"""
+
+import struct
+from typing import Dict, Union
+
+import msgpack
+import numpy as np
+
+MAGIC = b"NVNPR1"
+ALIGNMENT = 64
+
+_LEN_STRUCT = struct.Struct(">I")
+_PREAMBLE_LEN = len(MAGIC) + _LEN_STRUCT.size
+
+
+def is_raw_format(data) -> bool:
+    """Check whether the data is encoded in the raw format.
+
+    Args:
+        data: the encoded data
+
+    Returns: whether the data starts with the raw format magic
+    """
+    return len(data) >= _PREAMBLE_LEN and bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def _align(n: int) -> int:
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def byte_view(arr: np.ndarray):
+    """Get the array data as a flat uint8 array without copy if possible, and its memory order."""
+    if arr.flags.c_contiguous:
+        order = "C"
+    elif arr.flags.f_contiguous:
+        order = "F"
+        arr = arr.T
+    else:
+        order = "C"
+        arr = np.ascontiguousarray(arr)
+    return arr.reshape(-1).view(np.uint8), order
+
+
+def encode_arrays(arrays: Dict[str, np.ndarray]) -> bytes:
+    """Encode a dict of arrays into the raw format.
+
+    Args:
+        arrays: the arrays to be encoded
+
+    Returns: the encoded bytes
+    """
+    entries = []
+    views = []
+    for key, arr in arrays.items():
+        if not isinstance(arr, np.ndarray):
+            raise TypeError(f"value of '{key}' must be np.ndarray but got {type(arr)}")
+
+        if arr.dtype.hasobject:
+            raise ValueError(f"array '{key}' has object dtype which cannot be encoded without pickle")
+
+        view, order = byte_view(arr)
+        entries.append([key, np.lib.format.dtype_to_descr(arr.dtype), list(arr.shape), order])
+        views.append(view)
+
+    # Offsets depend on the header size, and the header contains the offsets. Placeholders of the max size
+    # are used to compute the header size first so the offsets can be filled in.
+    placeholder = [e + [0xFFFFFFFFFFFFFFFF, 0xFFFFFFFFFFFFFFFF] for e in entries]
+    data_start = _align(_PREAMBLE_LEN + len(msgpack.packb(placeholder)))
+
+    offset = data_start
+    for entry, view in zip(entries, views):
+        entry.extend([offset, view.nbytes])
+        offset = _align(offset + view.nbytes)
+
+    header = msgpack.packb(entries)
+    parts = [MAGIC, _LEN_STRUCT.pack(len(header)), header]
+    pos = _PREAMBLE_LEN + len(header)
+    for entry, view in zip(entries, views):
+        start = entry[4]
+        if start > pos:
+            parts.append(bytes(start - pos))
+        parts.append(view)
+        pos = start + view.nbytes
+
+    return b"".join(parts)
+
+
+def decode_arrays(data: Union[bytes, bytearray, memoryview], writeable: bool = False) -> Dict[str, np.ndarray]:
+    """Decode arrays from data in the raw format.
+
+    The arrays are created with np.frombuffer over the data, so no data is copied by default: the arrays are
+    read-only if the data buffer is. If writable arrays are required, each array over a read-only buffer is copied
+    once so it can be modified by the caller.
+
+    Args:
+        data: the encoded data
+        writeable: whether the returned arrays must be writable, even if the data buffer is read-only
+
+    Returns: a dict of arrays
+    """
+    if not is_raw_format(data):
+        raise ValueError("data is not in numpy raw format")
+
+    (header_len,) = _LEN_STRUCT.unpack_from(data, len(MAGIC))
+    header = msgpack.unpackb(data[_PREAMBLE_LEN : _PREAMBLE_LEN + header_len])
+
+    result = {}
+    for key, descr, shape, order, offset, nbytes in header:
+        dtype = np.lib.format.descr_to_dtype(descr)
+        if not nbytes:
+            result[key] = np.empty(shape, dtype=dtype, order=order)
+            continue
+
+        if offset + nbytes > len(data):
+            raise ValueError(f"array '{key}' exceeds the data size")
+
+        arr = np.frombuffer(data, dtype=dtype, count=nbytes // dtype.itemsize, offset=offset)
+        arr = arr.reshape(shape, order=order)
+        if writeable and not arr.flags.writeable:
+            arr = arr.copy(order="K")
+        result[key] = arr
+    return result
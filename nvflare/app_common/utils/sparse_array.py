@@ -0,0 +1,110 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Tuple
+
+import numpy as np
+
+# delta-encoded indices are stored as uint32
+MAX_SPARSE_SIZE = 1 << 32
+
+
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Get the sorted flat indices of the k values of the largest magnitude."""
+    flat = values.reshape(-1)
+    if k >= flat.size:
+        return np.arange(flat.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    # argpartition finds the k largest in linear time, without sorting all values
+    indices = np.argpartition(np.abs(flat), flat.size - k)[flat.size - k :]
+    indices.sort()
+    return indices
+
+
+def threshold_indices(values: np.ndarray, threshold: float) -> np.ndarray:
+    """Get the sorted flat indices of the values whose magnitude is at least the threshold."""
+    return np.flatnonzero(np.abs(values.reshape(-1)) >= threshold)
+
+
+class SparseArray:
+    def __init__(self, shape: Tuple[int, ...], index_deltas: np.ndarray, values: np.ndarray):
+        """An array of which only some values are kept, e.g. the largest values of a model update.
+
+        The flat indices of the kept values are sorted and delta-encoded: the first delta is the first index, and
+        each following one is the distance to the previous index. This keeps them in uint32 for any array of less
+        than 2**32 values, and makes them compress well.
+
+        Args:
+            shape: shape of the dense array
+            index_deltas: uint32 delta-encoded flat indices of the kept values
+            values: the kept values, in the order of their indices
+        """
+        self.shape = tuple(shape)
+        self.index_deltas = index_deltas
+        self.values = values
+
+    @staticmethod
+    def from_dense(dense: np.ndarray, indices: np.ndarray) -> "SparseArray":
+        """Create a SparseArray that keeps the values of the dense array at the given sorted flat indices."""
+        if dense.size >= MAX_SPARSE_SIZE:
+            raise ValueError(f"array of {dense.size} values is too large for a SparseArray")
+        index_deltas = np.diff(indices, prepend=0).astype(np.uint32)
+        values = dense.reshape(-1)[indices]
+        return SparseArray(dense.shape, index_deltas, values)
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def size(self) -> int:
+        """Number of values of the dense array."""
+        return int(np.prod(self.shape))
+
+    @property
+    def nnz(self) -> int:
+        """Number of kept values."""
+        return self.values.size
+
+    @property
+    def nbytes(self) -> int:
+        return self.index_deltas.nbytes + self.values.nbytes
+
+    def indices(self) -> np.ndarray:
+        """Get the flat indices of the kept values."""
+        return np.cumsum(self.index_deltas, dtype=np.int64)
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=self.dtype)
+        self.add_to(dense)
+        return dense
+
+    def add_to(self, dense, alpha: float = 1.0):
+        """Add the kept values, multiplied by alpha, to a contiguous NumPy array or PyTorch tensor in place.
+
+        Only the kept values are touched: the work does not depend on the size of the dense array.
+        """
+        indices = self.indices()
+        if isinstance(dense, np.ndarray):
+            flat = dense.reshape(-1)
+            if not np.shares_memory(flat, dense):
+                raise ValueError("can only add to a contiguous array")
+            # the indices are unique, so a fancy-indexed add does not lose any value
+            flat[indices] += self.values * alpha if alpha != 1.0 else self.values
+        else:
+            import torch
+
+            values = torch.from_numpy(self.values).to(dtype=dense.dtype, device=dense.device)
+            dense.view(-1).index_add_(0, torch.from_numpy(indices).to(dense.device), values, alpha=alpha)
+        return dense
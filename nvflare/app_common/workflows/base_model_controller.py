@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import random
+import threading
 from abc import ABC, abstractmethod
 from typing import Callable, List, Optional, Union
 
@@ -81,6 +82,11 @@ class BaseModelController(Controller, FLComponentWrapper, ABC):
         self._current_num_targets = 0  # Total number of clients targeted for this task
         self._current_failed_clients = set()  # Set of client names that returned errors in this task
 
+        # Whether the results of different clients can be processed at the same time. If set, the result callback
+        # given to send_model must be thread-safe. The events fired for the tasks and results are still serialized.
+        self._concurrent_results = False
+        self._result_lock = threading.Lock()
+
     def start_controller(self, fl_ctx: FLContext) -> None:
         self.fl_ctx = fl_ctx
         self.info("Initializing BaseModelController workflow.")
@@ -218,14 +224,16 @@ class BaseModelController(Controller, FLComponentWrapper, ABC):
             timeout=timeout,
             before_task_sent_cb=self._prepare_task_data,
             result_received_cb=self._process_result,
+            concurrent_callbacks=self._concurrent_results,
         )
 
         return task
 
     def _prepare_task_data(self, client_task: ClientTask, fl_ctx: FLContext) -> None:
-        self.fire_event_with_data(
-            AppEventType.BEFORE_TRAIN_TASK, fl_ctx, AppConstants.TRAIN_SHAREABLE, client_task.task.data
-        )
+        with self._result_lock:
+            self.fire_event_with_data(
+                AppEventType.BEFORE_TRAIN_TASK, fl_ctx, AppConstants.TRAIN_SHAREABLE, client_task.task.data
+            )
 
     @staticmethod
     def _set_ctx_prop_preserving_attrs(
@@ -249,7 +257,6 @@ class BaseModelController(Controller, FLComponentWrapper, ABC):
             )
 
     def _process_result(self, client_task: ClientTask, fl_ctx: FLContext) -> None:
-        self.fl_ctx = fl_ctx
         result = client_task.result
         client_name = client_task.client.name
 
@@ -260,13 +267,16 @@ class BaseModelController(Controller, FLComponentWrapper, ABC):
         if current_round is not None:
             self._set_ctx_prop_preserving_attrs(fl_ctx, AppConstants.CURRENT_ROUND, current_round)
 
-        # Check return code and handle errors first
-        try:
-            self.event(AppEventType.BEFORE_CONTRIBUTION_ACCEPT)
-            accepted = self._accept_train_result(client_name=client_name, result=result, fl_ctx=fl_ctx)
-            self.event(AppEventType.AFTER_CONTRIBUTION_ACCEPT)
-        finally:
-            self._clear_training_result(fl_ctx)
+        # Check return code and handle errors first.
+        # The event handlers and the error tracking are not thread-safe: only the result callback runs concurrently.
+        with self._result_lock:
+            self.fl_ctx = fl_ctx
+            try:
+                self.event(AppEventType.BEFORE_CONTRIBUTION_ACCEPT)
+                accepted = self._accept_train_result(client_name=client_name, result=result, fl_ctx=fl_ctx)
+                self.event(AppEventType.AFTER_CONTRIBUTION_ACCEPT)
+            finally:
+                self._clear_training_result(fl_ctx)
 
         # If result was rejected (error ignored or panic), skip further processing
         if not accepted:
@@ -438,17 +448,20 @@ class BaseModelController(Controller, FLComponentWrapper, ABC):
         """Get current app directory."""
         return self.engine.get_workspace().get_app_dir(self.fl_ctx.get_job_id())
 
-    def save_model(self, model):
+    def save_model(self, model, fl_ctx: Optional[FLContext] = None):
+        # a model persisted by another thread has its own fl_ctx: self.fl_ctx is replaced by result callbacks
+        if fl_ctx is None:
+            fl_ctx = self.fl_ctx
         if self.persistor:
-            self.info("Start persist model on server.")
-            self.event(AppEventType.BEFORE_LEARNABLE_PERSIST)
+            self.log_info(fl_ctx, "Start persist model on server.")
+            self.fire_event(AppEventType.BEFORE_LEARNABLE_PERSIST, fl_ctx)
             # persistor uses Learnable format to save model
             ml = make_model_learnable(weights=model.params, meta_props=model.meta)
-            self.persistor.save(ml, self.fl_ctx)
-            self.event(AppEventType.AFTER_LEARNABLE_PERSIST)
-            self.info("End persist model on server.")
+            self.persistor.save(ml, fl_ctx)
+            self.fire_event(AppEventType.AFTER_LEARNABLE_PERSIST, fl_ctx)
+            self.log_info(fl_ctx, "End persist model on server.")
         else:
-            self.error("persistor not configured, model will not be saved")
+            self.log_error(fl_ctx, "persistor not configured, model will not be saved")
 
     def sample_clients(self, num_clients: int = None) -> List[str]:
         clients = [client.name for client in self.engine.get_clients()]
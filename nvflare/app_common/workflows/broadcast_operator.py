@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import threading
-import time
 from typing import Dict, List, Optional, Union
 
 from nvflare.apis.client import Client
@@ -70,7 +69,7 @@ class BroadcastAndWait(FLComponent):
                 self.log_info(fl_ctx, "Abort signal triggered. Finishing multicasts_and_wait.")
                 return
             self.log_debug(fl_ctx, "Checking standing tasks to see if multicasts_and_wait finished.")
-            time.sleep(task_check_period)
+            self.controller.wait_for_standing_tasks(timeout=task_check_period)
 
         return self.results
 
@@ -15,7 +15,6 @@
 import json
 import os
 import shutil
-import time
 
 from nvflare.app_common.abstract.fl_model import FLModel
 from nvflare.app_common.abstract.model_persistor import ModelPersistor
@@ -130,7 +129,7 @@ class CrossSiteEval(ModelController):
                 self.info("Abort signal triggered. Finishing cross site validation.")
                 return
             self.debug("Checking standing tasks to see if cross site validation finished.")
-            time.sleep(self._task_check_period)
+            self.wait_for_standing_tasks(timeout=self._task_check_period)
 
         self.save_results()
         self.info("Stop Cross-Site Evaluation.")
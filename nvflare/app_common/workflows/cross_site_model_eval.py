@@ -14,7 +14,9 @@
 
 import os
 import shutil
+import threading
 import time
+from collections import deque
 from typing import Union
 
 from nvflare.apis.client import Client
@@ -34,6 +36,8 @@ from nvflare.app_common.utils.file_utils import resolve_path_under_root
 from nvflare.security.logging import secure_format_exception
 from nvflare.widgets.info_collector import GroupInfoCollector, InfoCollector
 
+_TASK_KEY_MODEL = "__model_to_validate"
+
 
 class CrossSiteModelEval(Controller):
     def __init__(
@@ -49,6 +53,7 @@ class CrossSiteModelEval(Controller):
         cleanup_models=False,
         participating_clients=None,
         wait_for_clients_timeout=300,
+        max_models_in_flight: int = 0,
     ):
         """Cross Site Model Evaluation workflow.
 
@@ -69,6 +74,9 @@ class CrossSiteModelEval(Controller):
             participating_clients (list, optional): List of participating client names. If not provided, defaults
                 to all clients connected at start of controller.
             wait_for_clients_timeout (int, optional): Timeout for clients to appear. Defaults to 300 secs
+            max_models_in_flight (int, optional): Max number of models that are sent for validation at the same
+                time. Each model is loaded once and kept in memory while it is validated; other models wait on disk
+                until a model is validated by all clients. 0 means no limit. Defaults to 0.
         """
         super().__init__(task_check_period=task_check_period)
 
@@ -103,6 +111,10 @@ class CrossSiteModelEval(Controller):
             raise ValueError("model_validate_timeout must be greater than or equal to 0.")
         if wait_for_clients_timeout < 0:
             raise ValueError("wait_for_clients_timeout must be greater than or equal to 0.")
+        if not isinstance(max_models_in_flight, int):
+            raise TypeError("max_models_in_flight must be int but got {}".format(type(max_models_in_flight)))
+        if max_models_in_flight < 0:
+            raise ValueError("max_models_in_flight must be greater than or equal to 0.")
 
         self._cross_val_dir = cross_val_dir
         self._model_locator_id = model_locator_id
@@ -114,11 +126,17 @@ class CrossSiteModelEval(Controller):
         self._wait_for_clients_timeout = wait_for_clients_timeout
         self._cleanup_models = cleanup_models
         self._participating_clients = participating_clients
+        self._max_models_in_flight = max_models_in_flight
 
         self._val_results = {}
         self._server_models = {}
         self._client_models = {}
 
+        # names of models that wait for validation tasks when max_models_in_flight models are being validated
+        self._pending_models = deque()
+        self._num_models_in_flight = 0
+        self._models_lock = threading.Lock()
+
         self._formatter = None
         self._cross_val_models_dir = None
         self._cross_val_results_dir = None
@@ -228,12 +246,16 @@ class CrossSiteModelEval(Controller):
             else:
                 self.log_info(fl_ctx, "ModelLocator not present. No server models will be included.")
 
-            while self.get_num_standing_tasks():
+            while self.get_num_standing_tasks() or self._get_num_models_in_flight():
                 if abort_signal.triggered:
                     self.log_info(fl_ctx, "Abort signal triggered. Finishing cross site validation.")
                     return
                 self.log_debug(fl_ctx, "Checking standing tasks to see if cross site validation finished.")
-                time.sleep(self._task_check_period)
+                if self.get_num_standing_tasks():
+                    self.wait_for_standing_tasks(timeout=self._task_check_period)
+                else:
+                    # the validation task of the next pending model is being scheduled
+                    time.sleep(self._task_check_period)
         except Exception as e:
             error_msg = f"Exception in cross site validator control_flow: {secure_format_exception(e)}"
             self.log_exception(fl_ctx, error_msg)
@@ -265,25 +287,29 @@ class CrossSiteModelEval(Controller):
     def _before_send_validate_task_cb(self, client_task: ClientTask, fl_ctx: FLContext):
         model_name = client_task.task.props[AppConstants.MODEL_OWNER]
 
-        try:
-            model_dxo: DXO = self._load_validation_content(model_name, self._cross_val_models_dir, fl_ctx)
-        except ValueError as e:
-            reason = f"Error in loading model shareable for {model_name}: {secure_format_exception(e)}. CrossSiteModelEval exiting."
-            self.log_error(fl_ctx, reason)
-            self.system_panic(reason, fl_ctx)
-            return
-
-        if not model_dxo:
-            self.system_panic(
-                f"Model contents for {model_name} not found in {self._cross_val_models_dir}. "
-                "CrossSiteModelEval exiting",
-                fl_ctx=fl_ctx,
-            )
-            return
-
-        model_shareable = model_dxo.to_shareable()
-        model_shareable.set_header(AppConstants.MODEL_OWNER, model_name)
-        model_shareable.add_cookie(AppConstants.MODEL_OWNER, model_name)
+        # the model is loaded only once for all clients, and is kept until the task is done
+        model_shareable = client_task.task.props.get(_TASK_KEY_MODEL)
+        if model_shareable is None:
+            try:
+                model_dxo: DXO = self._load_validation_content(model_name, self._cross_val_models_dir, fl_ctx)
+            except ValueError as e:
+                reason = f"Error in loading model shareable for {model_name}: {secure_format_exception(e)}. CrossSiteModelEval exiting."
+                self.log_error(fl_ctx, reason)
+                self.system_panic(reason, fl_ctx)
+                return
+
+            if not model_dxo:
+                self.system_panic(
+                    f"Model contents for {model_name} not found in {self._cross_val_models_dir}. "
+                    "CrossSiteModelEval exiting",
+                    fl_ctx=fl_ctx,
+                )
+                return
+
+            model_shareable = model_dxo.to_shareable()
+            model_shareable.set_header(AppConstants.MODEL_OWNER, model_name)
+            model_shareable.add_cookie(AppConstants.MODEL_OWNER, model_name)
+            client_task.task.props[_TASK_KEY_MODEL] = model_shareable
         client_task.task.data = model_shareable
 
         fl_ctx.set_prop(AppConstants.DATA_CLIENT, client_task.client, private=True, sticky=False)
@@ -391,7 +417,34 @@ class CrossSiteModelEval(Controller):
         # Send a model to this client to validate
         self._send_validation_task(model_name, fl_ctx)
 
+    def _get_num_models_in_flight(self) -> int:
+        with self._models_lock:
+            return self._num_models_in_flight
+
     def _send_validation_task(self, model_name: str, fl_ctx: FLContext):
+        with self._models_lock:
+            if self._max_models_in_flight and self._num_models_in_flight >= self._max_models_in_flight:
+                self._pending_models.append(model_name)
+                self.log_info(
+                    fl_ctx,
+                    f"{self._num_models_in_flight} models are being validated: {model_name} model will be sent "
+                    f"for validation later ({len(self._pending_models)} models pending).",
+                )
+                return
+            self._num_models_in_flight += 1
+        self._broadcast_validation_task(model_name, fl_ctx)
+
+    def _validate_task_done_cb(self, task: Task, fl_ctx: FLContext):
+        # release the model, and send the next pending model in its place
+        task.props.pop(_TASK_KEY_MODEL, None)
+        with self._models_lock:
+            if not self._pending_models:
+                self._num_models_in_flight -= 1
+                return
+            model_name = self._pending_models.popleft()
+        self._broadcast_validation_task(model_name, fl_ctx)
+
+    def _broadcast_validation_task(self, model_name: str, fl_ctx: FLContext):
         self.log_info(fl_ctx, f"Sending {model_name} model to all participating clients for validation.")
 
         # Create validation task and broadcast to all participating clients.
@@ -401,6 +454,7 @@ class CrossSiteModelEval(Controller):
             before_task_sent_cb=self._before_send_validate_task_cb,
             after_task_sent_cb=self._after_send_validate_task_cb,
             result_received_cb=self._receive_val_result_cb,
+            task_done_cb=self._validate_task_done_cb,
             timeout=self._validation_timeout,
             props={AppConstants.MODEL_OWNER: model_name},
         )
@@ -12,23 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
+import threading
 import time
 from typing import Any, Dict, Optional, Set, Union
 
 from nvflare.apis.fl_constant import FLMetaKey
+from nvflare.apis.fl_context import FLContext
 from nvflare.app_common.abstract.fl_model import FLModel
 from nvflare.app_common.aggregators.model_aggregator import ModelAggregator
 from nvflare.app_common.aggregators.weighted_aggregation_helper import (
+    ShardedWeightedAggregationHelper,
     WeightedAggregationHelper,
     filter_aggregatable_metrics,
 )
 from nvflare.app_common.app_constant import AppConstants
 from nvflare.app_common.app_event_type import AppEventType
+from nvflare.app_common.filters.sparsify_update import SPARSE_SOURCE_FORMAT
+from nvflare.app_common.utils.async_writer import AsyncWriter
 from nvflare.app_common.utils.math_utils import parse_compare_criteria
 from nvflare.app_common.utils.tensor_disk_offload_context import cleanup_tensor_disk_offload, setup_tensor_disk_offload
 from nvflare.fuel.utils import fobs
 from nvflare.fuel.utils.log_utils import center_message
+from nvflare.security.logging import secure_format_exception
 
 from .base_fedavg import (
     BaseFedAvg,
@@ -86,6 +93,19 @@ class FedAvg(BaseFedAvg):
             instead of deserializing into memory. Reduces peak server memory from ~N× to ~1×
             model size during aggregation. When used with a custom aggregator, lazy refs are
             passed through directly and must be handled by that aggregator. Defaults to False.
+        flat_buffer_aggregation (bool, optional): Aggregate floating-point params in one contiguous buffer per
+            dtype, accumulating each client result with one vectorized multiply-add instead of one operation
+            per param. Speeds up aggregation of models with many params at the cost of one extra model-sized
+            buffer. Only used when no custom aggregator is provided. Defaults to False.
+        aggregation_shards (int, optional): Number of shards the params are partitioned into for aggregation.
+            Each shard has its own lock and worker thread, so every client result is folded in on multiple
+            cores, and the results of different clients, which are processed at the same time, are folded in
+            concurrently on different shards. Only used when no custom aggregator is provided. Defaults to 1
+            (no sharding).
+        async_persist (bool, optional): Save the global model on a background writer, so the next round is
+            dispatched while the model of the previous round is being persisted. At most one save is pending; the
+            pending save is finished before the next aggregation, since persistor event handlers may use the
+            aggregation state. The background save uses its own FLContext from the engine. Defaults to False.
     """
 
     def __init__(
@@ -100,6 +120,9 @@ class FedAvg(BaseFedAvg):
         exclude_vars: Optional[str] = None,
         aggregation_weights: Optional[Dict[str, float]] = None,
         enable_tensor_disk_offload: bool = False,
+        flat_buffer_aggregation: bool = False,
+        aggregation_shards: int = 1,
+        async_persist: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
@@ -110,6 +133,9 @@ class FedAvg(BaseFedAvg):
 
         # Custom aggregator (optional)
         self.aggregator = aggregator
+        # the built-in aggregation is thread-safe, so client results are aggregated as they arrive, at the same time.
+        # A custom aggregator may not be, so its results are aggregated one at a time.
+        self._concurrent_results = aggregator is None
 
         # Early stopping configuration
         self.stop_cond = stop_cond
@@ -120,6 +146,13 @@ class FedAvg(BaseFedAvg):
         self.exclude_vars = exclude_vars
         self.aggregation_weights = aggregation_weights or {}
         self.enable_tensor_disk_offload = enable_tensor_disk_offload
+        self.flat_buffer_aggregation = flat_buffer_aggregation
+        self.aggregation_shards = aggregation_shards
+        self.async_persist = async_persist
+
+        # per-round time (in seconds) of the phases: round => {"dispatch", "wait", "aggregate", "persist"}
+        self.round_timings: Dict[int, Dict[str, Optional[float]]] = {}
+        self._writer: Optional[AsyncWriter] = None
 
         # Parse stop condition
         if self.stop_cond:
@@ -132,7 +165,8 @@ class FedAvg(BaseFedAvg):
         self.best_target_metric_value: Any = None
 
         # InTime aggregation helpers (reset each round, used only when no custom aggregator)
-        self._aggr_helper: Optional[WeightedAggregationHelper] = None
+        self._aggr_helper: Optional[Union[WeightedAggregationHelper, ShardedWeightedAggregationHelper]] = None
+        self._sharded_aggr_helper: Optional[ShardedWeightedAggregationHelper] = None
         self._aggr_metrics_helper: Optional[WeightedAggregationHelper] = None
         self._all_metrics: bool = True
         self._warned_metric_keys: Set[str] = set()  # warn at most once per key (across clients/rounds)
@@ -140,6 +174,7 @@ class FedAvg(BaseFedAvg):
         self._expected_count: int = 0
         self._params_type = None  # Only store params_type, not full result
         self._site_metric_weights: Dict[str, Dict[str, Any]] = {}
+        self._aggr_lock = threading.Lock()  # protects the round state above while results are aggregated
 
     def run(self) -> None:
         disk_offload_context = None
@@ -174,6 +209,9 @@ class FedAvg(BaseFedAvg):
             model.start_round = self.start_round
             model.total_rounds = self.num_rounds
 
+            if self.async_persist:
+                self._writer = AsyncWriter(max_pending=1, name="fedavg_model_writer")
+
             for self.current_round in range(self.start_round, self.start_round + self.num_rounds):
                 self.info(center_message(message=f"Round {self.current_round} started.", boarder_str="-"))
 
@@ -193,7 +231,7 @@ class FedAvg(BaseFedAvg):
                     self.aggregator.reset_stats()
                 else:
                     # Use built-in InTime aggregation
-                    self._aggr_helper = WeightedAggregationHelper(exclude_vars=self.exclude_vars)
+                    self._aggr_helper = self._new_aggr_helper()
                     self._aggr_metrics_helper = WeightedAggregationHelper()
                     self._all_metrics = True  # Only used by built-in aggregation
                 # Shared state for both aggregator types
@@ -202,21 +240,36 @@ class FedAvg(BaseFedAvg):
                 self._params_type = None
                 self._site_metric_weights = {}
 
+                timings = {}
+                self.round_timings[self.current_round] = timings
+
                 # Non-blocking send with callback for streaming aggregation
+                start = time.perf_counter()
                 self.send_model(
                     task_name=self.task_name,
                     targets=clients,
                     data=model,
                     callback=self._aggregate_one_result,
                 )
+                timings["dispatch"] = time.perf_counter() - start
 
                 # Wait for all results to be processed
+                start = time.perf_counter()
                 while self.get_num_standing_tasks():
                     if self.abort_signal.triggered:
                         self.info("Abort signal triggered. Finishing FedAvg.")
                         return
-                    time.sleep(self._task_check_period)
+                    self.wait_for_standing_tasks(timeout=self._task_check_period)
 
+                timings["wait"] = time.perf_counter() - start
+
+                if self._writer:
+                    # the model of the previous round must be persisted before persistor event handlers run again
+                    start = time.perf_counter()
+                    self._writer.flush()
+                    timings["flush"] = time.perf_counter() - start
+
+                start = time.perf_counter()
                 self.event(AppEventType.BEFORE_AGGREGATION)
 
                 # Get final aggregated result
@@ -226,14 +279,16 @@ class FedAvg(BaseFedAvg):
                 )
 
                 model = self.update_model(model, aggregate_results)
+                timings["aggregate"] = time.perf_counter() - start
 
                 # Early stopping: check if current model is better
+                stop = False
                 if self.stop_condition:
                     self.info(f"Round {self.current_round} global metrics: {model.metrics}")
 
                     if self.is_curr_model_better(model):
                         self.info("New best model found.")
-                        self.save_model(model)
+                        self._persist_model(model, timings)
                     else:
                         if self.patience:
                             self.info(
@@ -241,20 +296,71 @@ class FedAvg(BaseFedAvg):
                                 f"{self.num_fl_rounds_without_improvement}"
                             )
                     # Check if we should stop early
-                    if self.should_stop(model.metrics):
-                        self.info(f"Stopping at round={self.current_round} out of total_rounds={self.num_rounds}.")
-                        break
+                    stop = self.should_stop(model.metrics)
                 else:
                     # No early stopping: save model every round
-                    self.save_model(model)
+                    self._persist_model(model, timings)
+
+                self._log_round_timings(self.current_round, timings)
+                if stop:
+                    self.info(f"Stopping at round={self.current_round} out of total_rounds={self.num_rounds}.")
+                    break
 
                 # Memory cleanup at end of round (if configured)
                 self._maybe_cleanup_memory()
 
+            if self._writer:
+                start = time.perf_counter()
+                self._writer.flush()
+                self.info(f"Waited {time.perf_counter() - start:.3f}s for the last model to be persisted")
             self.info(center_message("Finished FedAvg."))
         finally:
+            if self._writer:
+                self._writer.shutdown()
+                self._writer = None
+            if self._sharded_aggr_helper:
+                self._sharded_aggr_helper.close()
             cleanup_tensor_disk_offload(engine=getattr(self, "engine", None), context=disk_offload_context)
 
+    def _persist_model(self, model: FLModel, timings: Dict[str, float]) -> None:
+        """Save the model of the current round, in the background if async_persist is enabled."""
+        if not self._writer:
+            start = time.perf_counter()
+            self.save_model(model)
+            timings["persist"] = time.perf_counter() - start
+            return
+
+        # the model object and its dicts are updated by the next round: the writer gets a snapshot of them.
+        # Param values are replaced (not modified in place) by model updates, so they are not copied.
+        snapshot = copy.copy(model)
+        snapshot.params = dict(model.params) if model.params is not None else None
+        snapshot.meta = dict(model.meta) if model.meta is not None else None
+        snapshot.metrics = dict(model.metrics) if model.metrics is not None else None
+        timings["persist"] = None  # set by the writer when the model is persisted
+        self._writer.submit(self._save_model_in_background, snapshot, self.current_round, timings)
+
+    def _save_model_in_background(self, model: FLModel, current_round: int, timings: Dict[str, float]) -> None:
+        # self.fl_ctx is replaced and updated by the workflow and result callbacks: the writer uses its own context
+        with self.engine.new_context() as fl_ctx:
+            fl_ctx.set_prop(AppConstants.CURRENT_ROUND, current_round, private=True, sticky=False)
+            start = time.perf_counter()
+            try:
+                self.save_model(model, fl_ctx)
+            except Exception as e:
+                self.log_error(
+                    fl_ctx, f"Failed to persist the model of round {current_round}: {secure_format_exception(e)}"
+                )
+                raise
+            timings["persist"] = time.perf_counter() - start
+            self.log_info(fl_ctx, f"Round {current_round} model persisted in {timings['persist']:.3f}s")
+
+    def _log_round_timings(self, current_round: int, timings: Dict[str, float]) -> None:
+        phases = []
+        for k in ("dispatch", "wait", "flush", "aggregate", "persist"):
+            if k in timings:
+                phases.append(f"{k}=async" if timings[k] is None else f"{k}={timings[k]:.3f}s")
+        self.info(f"Round {current_round} timings: {', '.join(phases)}")
+
     def _aggregate_one_result(self, result: FLModel) -> None:
         """Callback: aggregate ONE client result immediately (InTime aggregation)."""
         if not result.params:
@@ -262,14 +368,14 @@ class FedAvg(BaseFedAvg):
             self.warning(f"Empty result from client {client_name}, skipping.")
             return
 
-        # Store only params_type from first result (not the full model)
-        if self._params_type is None:
-            self._params_type = result.params_type
-
         client_name = _get_client_name(result)
         if self.aggregator:
             # Use custom aggregator
-            self.aggregator.accept_model(result)
+            with self._aggr_lock:
+                self._set_params_type(result)
+                self.aggregator.accept_model(result)
+                self._received_count += 1
+                received_count = self._received_count
         else:
             # Built-in InTime aggregation: add() materializes lazy refs on-demand.
             # Cleanup relies on lazy ref object lifetime / GC.
@@ -280,43 +386,71 @@ class FedAvg(BaseFedAvg):
                 aggregation_weight = 1.0
 
             weight = aggregation_weight * _get_num_steps_weight(result)
-            self._site_metric_weights[client_name] = {
-                "name": client_name,
-                "weight": weight,
-                "weight_key": "effective_fedavg_metric_weight",
-            }
 
+            # the aggregation helpers are thread-safe: results of different clients are folded in at the same time
             self._aggr_helper.add(
                 data=result.params,
                 weight=weight,
                 contributor_name=client_name,
                 contribution_round=self.current_round,
+                source_formats=(result.meta or {}).get(SPARSE_SOURCE_FORMAT),
             )
 
-            # Add to metrics aggregation if available (only aggregatable values;
-            # non-aggregatable metrics like dicts are still in result.metrics for collection)
-            # If a client omits metrics entirely (None), disable round-level metrics
-            # aggregation instead of mixing present/absent metric coverage.
-            if result.metrics is None:
-                self._all_metrics = False
-            if self._all_metrics and result.metrics:
-                # Non-empty metric dicts are treated as "present"; unsupported values are
-                # filtered per key while allowing other aggregatable keys to contribute.
-                aggregatable = filter_aggregatable_metrics(
-                    result.metrics,
-                    warn_skipped=lambda k, tn: self.warning(f"Metric '{k}' ({tn}) skipped for aggregation."),
-                    warned_metric_keys=self._warned_metric_keys,
-                )
-                if aggregatable:
-                    self._aggr_metrics_helper.add(
-                        data=aggregatable,
-                        weight=weight,
-                        contributor_name=client_name,
-                        contribution_round=self.current_round,
+            with self._aggr_lock:
+                self._set_params_type(result)
+                self._site_metric_weights[client_name] = {
+                    "name": client_name,
+                    "weight": weight,
+                    "weight_key": "effective_fedavg_metric_weight",
+                }
+
+                # Add to metrics aggregation if available (only aggregatable values;
+                # non-aggregatable metrics like dicts are still in result.metrics for collection)
+                # If a client omits metrics entirely (None), disable round-level metrics
+                # aggregation instead of mixing present/absent metric coverage.
+                if result.metrics is None:
+                    self._all_metrics = False
+                if self._all_metrics and result.metrics:
+                    # Non-empty metric dicts are treated as "present"; unsupported values are
+                    # filtered per key while allowing other aggregatable keys to contribute.
+                    aggregatable = filter_aggregatable_metrics(
+                        result.metrics,
+                        warn_skipped=lambda k, tn: self.warning(f"Metric '{k}' ({tn}) skipped for aggregation."),
+                        warned_metric_keys=self._warned_metric_keys,
                     )
+                    if aggregatable:
+                        self._aggr_metrics_helper.add(
+                            data=aggregatable,
+                            weight=weight,
+                            contributor_name=client_name,
+                            contribution_round=self.current_round,
+                        )
+
+                self._received_count += 1
+                received_count = self._received_count
+
+        self.info(f"Aggregated {received_count}/{self._expected_count} results")
+
+    def _set_params_type(self, result: FLModel) -> None:
+        # Store only params_type from first result (not the full model)
+        if self._params_type is None:
+            self._params_type = result.params_type
+
+    def _new_aggr_helper(self) -> Union[WeightedAggregationHelper, ShardedWeightedAggregationHelper]:
+        if self._sharded_aggr_helper:
+            # the sharded helper keeps its worker threads and key assignment across rounds
+            self._sharded_aggr_helper.reset_stats()
+            return self._sharded_aggr_helper
+
+        if self.aggregation_shards > 1:
+            self._sharded_aggr_helper = ShardedWeightedAggregationHelper(
+                num_shards=self.aggregation_shards,
+                exclude_vars=self.exclude_vars,
+                flat_buffer=self.flat_buffer_aggregation,
+            )
+            return self._sharded_aggr_helper
 
-        self._received_count += 1
-        self.info(f"Aggregated {self._received_count}/{self._expected_count} results")
+        return WeightedAggregationHelper(exclude_vars=self.exclude_vars, flat_buffer=self.flat_buffer_aggregation)
 
     def _get_aggregated_result(self) -> FLModel:
         """Get the final aggregated result after all clients have responded."""
@@ -333,6 +467,8 @@ class FedAvg(BaseFedAvg):
         else:
             # Use built-in InTime aggregation
             aggr_params = self._aggr_helper.get_result()
+            # the round is over: do not keep idle worker threads until the next one
+            self._aggr_helper.close()
             aggr_metrics = self._aggr_metrics_helper.get_result() if self._all_metrics else None
             aggr_metrics = aggr_metrics or None
 
@@ -470,24 +606,27 @@ class FedAvg(BaseFedAvg):
             self.warning("No persistor or save_filename configured")
             return FLModel(params={})
 
-    def save_model(self, model: FLModel) -> None:
+    def save_model(self, model: FLModel, fl_ctx: Optional[FLContext] = None) -> None:
         """Save model. Uses persistor if available, otherwise uses save_model_file.
 
         Override `save_model_file` for framework-specific serialization (e.g., torch.save).
 
         Args:
             model (FLModel): model to save
+            fl_ctx (FLContext, optional): context to persist the model with. Defaults to the fl_ctx of the controller.
         """
+        if fl_ctx is None:
+            fl_ctx = self.fl_ctx
         if self.persistor:
             # Use persistor (parent class behavior)
-            super().save_model(model)
+            super().save_model(model, fl_ctx)
         elif self.save_filename:
             # Use simple file-based saving
             filepath = os.path.join(self.get_run_dir(), self.save_filename)
             self.save_model_file(model, filepath)
-            self.info(f"Model saved to {filepath}")
+            self.log_info(fl_ctx, f"Model saved to {filepath}")
         else:
-            self.warning("No persistor or save_filename configured, model not saved")
+            self.log_warning(fl_ctx, "No persistor or save_filename configured, model not saved")
 
     def save_model_file(self, model: FLModel, filepath: str) -> None:
         """Save model to file. Override this for framework-specific serialization.
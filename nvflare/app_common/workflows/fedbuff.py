@@ -0,0 +1,337 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Union
+
+from nvflare.apis.controller_spec import Task
+from nvflare.apis.fl_constant import ReturnCode
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
+from nvflare.app_common.app_constant import AppConstants
+from nvflare.app_common.app_event_type import AppEventType
+from nvflare.app_common.utils.error_handling_utils import get_error_handling_message, should_ignore_result_error
+from nvflare.fuel.utils.log_utils import center_message
+from nvflare.fuel.utils.validation_utils import check_non_negative_int, check_positive_int
+
+from .base_fedavg import BaseFedAvg, _get_client_name
+
+
+class _SiteDone:
+    def __init__(self, site_name: str):
+        self.site_name = site_name
+
+
+class FedBuff(BaseFedAvg):
+    """Controller for asynchronous buffered FedAvg. *Note*: This class is based on `ModelController`.
+    Implements [FedBuff](https://arxiv.org/abs/2106.06639).
+
+    Every site trains on the newest global model available when its previous task finished, so sites do not wait
+    for each other. The updates of the sites are buffered: once `buffer_size` updates are received, they are
+    averaged with staleness weights and applied to the global model, which becomes a new model version. The
+    staleness of an update is the number of model versions generated since the model it was trained on.
+
+    Updates can be sent as DIFF (the change of the model) or FULL params: the change is then computed from the
+    model version the site trained on.
+
+    A site that returns an error is given the newest model again, like any site that finished its task. With the
+    default `ignore_result_error=None`, errors are ignored as long as the last task of at least one site was
+    successful. `False` makes any error fatal, and `True` ignores all errors.
+
+    Provides the implementations for the `run` routine, controlling the main workflow:
+        - def run(self)
+
+    The parent classes provide the default implementations for other routines.
+
+    Args:
+        num_clients (int, optional): The number of clients to train concurrently. Defaults to 3.
+        num_rounds (int, optional): The number of global model versions to generate. Defaults to 5.
+        start_round (int, optional): The version of the initial model.
+        persistor_id (str, optional): ID of the persistor component. Defaults to "persistor".
+        model (dict or FLModel, optional): Initial model parameters. If provided, this is used instead of loading
+            from persistor. Defaults to None.
+        buffer_size (int, optional): The number of updates (K) that make a new model version. Defaults to 3.
+        server_lr (float, optional): The server learning rate the averaged update is scaled with. Defaults to 1.0.
+        staleness_exponent (float, optional): An update of staleness s is weighted with 1 / (1 + s) ** exponent.
+            Set to 0 to disable staleness weighting. Defaults to 0.5.
+        max_staleness (int, optional): Updates staler than this are dropped. Defaults to None (no limit).
+        task_name (str, optional): Task name for training. Defaults to "train".
+        task_timeout (int, optional): Time a site is given to finish its training task. Defaults to 0 (no timeout).
+    """
+
+    def __init__(
+        self,
+        *args,
+        model: Optional[Union[Dict, FLModel]] = None,
+        buffer_size: int = 3,
+        server_lr: float = 1.0,
+        staleness_exponent: float = 0.5,
+        max_staleness: Optional[int] = None,
+        task_name: Optional[str] = "train",
+        task_timeout: int = 0,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        check_positive_int("buffer_size", buffer_size)
+        check_non_negative_int("task_timeout", task_timeout)
+        if max_staleness is not None:
+            check_non_negative_int("max_staleness", max_staleness)
+        if staleness_exponent < 0:
+            raise ValueError(f"staleness_exponent must be >= 0, but got {staleness_exponent}")
+
+        self.model = model
+        self.buffer_size = buffer_size
+        self.server_lr = server_lr
+        self.staleness_exponent = staleness_exponent
+        self.max_staleness = max_staleness
+        self.task_name = task_name
+        self.task_timeout = task_timeout
+
+        # results and finished tasks are reported by task callbacks, and processed by the run routine
+        self._events = queue.Queue()
+
+        self._global_model: Optional[FLModel] = None
+        self._version_params: Dict[int, Dict[str, Any]] = {}  # model version => params of the version
+        self._site_versions: Dict[str, int] = {}  # site name => model version the site is training on
+
+        # buffered updates: sum of the weighted updates, and the number of them
+        self._buffer: Dict[str, Any] = {}
+        self._num_buffered = 0
+
+        # stats
+        self.staleness_histogram: Counter = Counter()  # staleness => number of accepted updates
+        self.num_updates = 0
+        self.num_dropped_updates = 0
+        self.num_failed_updates = 0
+
+        # sites whose last task failed, updated by the result callbacks
+        self._failed_sites = set()
+        self._num_sites = 0
+        self._failed_sites_lock = threading.Lock()
+        self._start_time = None
+        self._version_start_time = None
+
+    def run(self) -> None:
+        self.info(center_message("Start FedBuff."))
+        self.fl_ctx.set_prop(AppConstants.NUM_ROUNDS, self.num_rounds, private=True, sticky=False)
+
+        if self.model is not None:
+            if isinstance(self.model, FLModel):
+                model = self.model
+            else:
+                model = FLModel(params_type=ParamsType.FULL, params=self.model)
+            self.info("Using provided model")
+        else:
+            model = self.load_model()
+
+        model.start_round = self.start_round
+        model.total_rounds = self.num_rounds
+        self._set_global_model(model, self.start_round)
+
+        self._start_time = self._version_start_time = time.time()
+        site_names = self.sample_clients(self.num_clients)
+        self._num_sites = len(site_names)
+        for site_name in site_names:
+            self._dispatch(site_name)
+
+        last_version = self.start_round + self.num_rounds
+        while self.current_round < last_version:
+            if self.abort_signal.triggered:
+                self.info("Abort signal triggered. Finishing FedBuff.")
+                return
+
+            try:
+                item = self._events.get(timeout=self._task_check_period)
+            except queue.Empty:
+                continue
+
+            if isinstance(item, _SiteDone):
+                # re-dispatch the newest model to the site right away
+                self._site_versions.pop(item.site_name, None)
+                self._prune_versions()
+                self._dispatch(item.site_name)
+            else:
+                self._accept_update(item)
+                if self._num_buffered >= self.buffer_size:
+                    self._generate_new_version()
+
+        # tasks still standing would only produce updates for a model that is not trained anymore
+        self.cancel_all_tasks(fl_ctx=self.fl_ctx)
+        self.info(f"FedBuff finished: {self.num_updates} updates, {self._get_throughput():.1f} updates/min")
+        self.info(center_message("Finished FedBuff."))
+
+    def _dispatch(self, site_name: str) -> None:
+        if self.current_round >= self.start_round + self.num_rounds:
+            return
+
+        # the global model is replaced (not modified) by new versions, so the task can share its params
+        model = copy.copy(self._global_model)
+        self._site_versions[site_name] = self.current_round
+        self.send_model(
+            task_name=self.task_name,
+            targets=[site_name],
+            data=model,
+            timeout=self.task_timeout,
+            callback=self._result_received,
+        )
+
+    def _prepare_task(self, data: FLModel, task_name: str, timeout: int, callback) -> Task:
+        task = super()._prepare_task(data=data, task_name=task_name, timeout=timeout, callback=callback)
+        task.task_done_cb = self._task_done
+        return task
+
+    def _result_received(self, result: FLModel) -> None:
+        self._events.put(result)
+
+    def _task_done(self, task: Task, fl_ctx: FLContext) -> None:
+        # called after the result of the task (if any) is received
+        for site_name in task.targets or []:
+            self._events.put(_SiteDone(site_name))
+
+    def _accept_train_result(
+        self, client_name: str, result: Shareable, fl_ctx: FLContext, is_unknown_task: bool = False
+    ) -> bool:
+        # The error tolerance of BaseModelController is based on the targets of the last sent task, which is a
+        # single site here. FedBuff tolerates errors as long as one site still works instead.
+        rc = result.get_return_code()
+        if is_unknown_task or not rc or rc == ReturnCode.OK:
+            accepted = super()._accept_train_result(client_name, result, fl_ctx, is_unknown_task)
+            if accepted and not is_unknown_task:
+                with self._failed_sites_lock:
+                    self._failed_sites.discard(client_name)
+            return accepted
+
+        self.fl_ctx = fl_ctx
+        with self._failed_sites_lock:
+            self.num_failed_updates += 1
+            should_ignore = should_ignore_result_error(
+                ignore_result_error=self._ignore_result_error,
+                client_name=client_name,
+                failed_clients=self._failed_sites,
+                num_targets=self._num_sites,
+                min_responses=1,
+            )
+            msg = get_error_handling_message(
+                ignore_result_error=self._ignore_result_error,
+                client_name=client_name,
+                error_code=rc,
+                current_round=result.get_header(AppConstants.CURRENT_ROUND, None),
+                controller_name=self.__class__.__name__,
+                failed_clients=self._failed_sites,
+                num_targets=self._num_sites,
+                min_responses=1,
+            )
+
+        if should_ignore:
+            # the site gets a new task when this one is done
+            self.warning(msg)
+        else:
+            self.panic(msg)
+        return False
+
+    def _accept_update(self, result: FLModel) -> None:
+        site_name = _get_client_name(result)
+        if not result.params:
+            self.warning(f"Empty result from site {site_name}, skipping.")
+            return
+
+        version = self._site_versions.get(site_name)
+        if version is None:
+            self.warning(f"Result from site {site_name} that is not training, skipping.")
+            return
+
+        staleness = self.current_round - version
+        if self.max_staleness is not None and staleness > self.max_staleness:
+            self.warning(f"Dropped update of site {site_name}: staleness {staleness} > {self.max_staleness}")
+            self.num_dropped_updates += 1
+            return
+
+        if result.params_type == ParamsType.DIFF:
+            update = result.params
+        else:
+            base_params = self._version_params[version]
+            update = {k: v - base_params[k] for k, v in result.params.items() if k in base_params}
+
+        weight = 1.0 / (1.0 + staleness) ** self.staleness_exponent
+        for k, v in update.items():
+            if k in self._buffer:
+                self._buffer[k] += weight * v
+            else:
+                self._buffer[k] = weight * v
+
+        self._num_buffered += 1
+        self.num_updates += 1
+        self.staleness_histogram[staleness] += 1
+        self.info(f"Buffered update {self._num_buffered}/{self.buffer_size} of site {site_name}: {staleness=}")
+
+    def _generate_new_version(self) -> None:
+        self.event(AppEventType.BEFORE_AGGREGATION)
+        scale = self.server_lr / self._num_buffered
+        aggr_result = FLModel(
+            params_type=ParamsType.DIFF,
+            params={k: v * scale for k, v in self._buffer.items() if k in self._global_model.params},
+            current_round=self.current_round,
+            meta={"nr_aggregated": self._num_buffered, "current_round": self.current_round},
+        )
+        self._set_metrics_aggregation_info(aggr_result)
+        self._buffer = {}
+        self._num_buffered = 0
+        self.fire_event_with_data(
+            AppEventType.AFTER_AGGREGATION, self.fl_ctx, AppConstants.AGGREGATION_RESULT, aggr_result
+        )
+
+        # the params of the old version may still be used by tasks and updates: update a copy of them
+        model = copy.copy(self._global_model)
+        model.params = dict(model.params)
+        model = self.update_model(model, aggr_result)
+
+        now = time.time()
+        histogram = dict(sorted(self.staleness_histogram.items()))
+        self.info(
+            f"Model version {self.current_round + 1} generated in {now - self._version_start_time:.1f}s: "
+            f"{self._get_throughput():.1f} updates/min, staleness histogram: {histogram}"
+        )
+        self._version_start_time = now
+
+        self._set_global_model(model, self.current_round + 1)
+        self._prune_versions()
+        if self.persistor:
+            self.save_model(model)
+        self._maybe_cleanup_memory()
+
+    def _set_global_model(self, model: FLModel, version: int) -> None:
+        model.current_round = version
+        self._global_model = model
+        self._version_params[version] = model.params
+        self.current_round = version
+        self.fl_ctx.set_prop(AppConstants.CURRENT_ROUND, version, private=True, sticky=False)
+        self.event(AppEventType.ROUND_STARTED)
+
+    def _prune_versions(self) -> None:
+        # the params of a version are kept while sites train on it, to compute the change of FULL updates
+        in_use = set(self._site_versions.values())
+        in_use.add(self.current_round)
+        for version in [v for v in self._version_params if v not in in_use]:
+            self._version_params.pop(version)
+
+    def _get_throughput(self) -> float:
+        """Number of updates received per minute since the start of the run."""
+        elapsed = time.time() - self._start_time
+        return self.num_updates * 60.0 / elapsed if elapsed > 0 else 0.0
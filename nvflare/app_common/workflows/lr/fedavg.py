@@ -19,6 +19,7 @@ from typing import List, Optional
 
 import numpy as np
 
+from nvflare.apis.fl_context import FLContext
 from nvflare.app_common.abstract.fl_model import FLModel
 from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
 from nvflare.app_common.app_constant import AppConstants
@@ -226,8 +227,8 @@ class FedAvgLR(BaseFedAvg):
 
         return model
 
-    def save_model(self, model: FLModel) -> None:
+    def save_model(self, model: FLModel, fl_ctx: Optional[FLContext] = None) -> None:
         if self.persistor is None:
             self.persistor = self._default_persistor
 
-        super().save_model(model)
+        super().save_model(model, fl_ctx)
@@ -13,8 +13,9 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Callable, List, Union
+from typing import Callable, List, Optional, Union
 
+from nvflare.apis.fl_context import FLContext
 from nvflare.app_common.abstract.fl_model import FLModel
 from nvflare.app_common.app_constant import AppConstants
 from nvflare.app_common.workflows.base_model_controller import BaseModelController
@@ -112,16 +113,17 @@ class ModelController(BaseModelController, ABC):
         """
         return super().load_model()
 
-    def save_model(self, model: FLModel) -> None:
+    def save_model(self, model: FLModel, fl_ctx: Optional[FLContext] = None) -> None:
         """Saves model with persistor. If persistor is not configured, does not save.
 
         Args:
             model (FLModel): model to save.
+            fl_ctx (FLContext, optional): context to persist the model with. Defaults to the fl_ctx of the controller.
 
         Returns:
             None
         """
-        super().save_model(model)
+        super().save_model(model, fl_ctx)
 
     def sample_clients(self, num_clients: int = None) -> List[str]:
         """Returns a list of `num_clients` clients.
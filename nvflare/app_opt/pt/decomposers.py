@@ -17,7 +17,9 @@ from typing import Tuple, Union
 import torch
 from safetensors.torch import load, save
 
+import nvflare.fuel.utils.app_config_utils as acu
 import nvflare.fuel.utils.fobs.dots as dots
+from nvflare.apis.fl_constant import ConfigVarName
 from nvflare.fuel.f3.streaming.download_service import Downloadable
 from nvflare.fuel.utils.fobs.datum import DatumManager
 from nvflare.fuel.utils.fobs.decomposers.via_downloader import ViaDownloaderDecomposer
@@ -45,7 +47,8 @@ class TensorDecomposer(ViaDownloaderDecomposer):
         return dots.TENSOR_DOWNLOAD
 
     def to_downloadable(self, items: dict, max_chunk_size: int, fobs_ctx: dict) -> Downloadable:
-        return TensorDownloadable(items, max_chunk_size)
+        split_large_tensors = acu.get_bool_var(self._config_var_name(ConfigVarName.USE_RANGED_ITEMS), False)
+        return TensorDownloadable(items, max_chunk_size, split_large_tensors)
 
     def download(
         self,
@@ -0,0 +1,248 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""CPU implementation of the block-wise 8-bit and 4-bit (FP4 / NF4) formats of bitsandbytes.
+
+Values are split into blocks, scaled by the absmax of their block to [-1, 1], and replaced by the index of the
+nearest value of a codebook. The quantized data, absmax and codebook have the same layout as the ones produced by
+bitsandbytes, so data quantized on CPU can be dequantized by bitsandbytes on GPU and vice versa.
+
+Tensors are processed in chunks of whole blocks, so the temporary memory does not grow with the tensor size.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import torch
+
+BLOCKWISE8_BLOCKSIZE = 4096
+BLOCKWISE4_BLOCKSIZE = 64
+
+# number of values processed at once
+_CHUNK_SIZE = 1 << 20
+
+_NF4_CODE = [
+    -1.0,
+    -0.6961928009986877,
+    -0.5250730514526367,
+    -0.39491748809814453,
+    -0.28444138169288635,
+    -0.18477343022823334,
+    -0.09105003625154495,
+    0.0,
+    0.07958029955625534,
+    0.16093020141124725,
+    0.24611230194568634,
+    0.33791524171829224,
+    0.44070982933044434,
+    0.5626170039176941,
+    0.7229568362236023,
+    1.0,
+]
+
+# indexed by the bits of the FP4 value: sign, 2 exponent bits and 1 mantissa bit
+_FP4_CODE = [0, 0.0625, 8.0, 12.0, 4.0, 6.0, 2.0, 3.0, -0, -0.0625, -8.0, -12.0, -4.0, -6.0, -2.0, -3.0]
+
+
+def create_dynamic_map() -> torch.Tensor:
+    """Create the signed dynamic 8-bit codebook used by default for block-wise 8-bit quantization.
+
+    Each of the 7 decades from 1e-6 to 1 is split into a number of evenly spaced values that doubles with every
+    decade, for both signs. With 0 and 1, these are 256 values.
+    """
+    max_exponent_bits = 7
+    data = []
+    for i in range(max_exponent_bits):
+        boundaries = torch.linspace(0.1, 1, 2**i + 1, dtype=torch.float32)
+        means = (boundaries[:-1] + boundaries[1:]) / 2.0
+        data += ((10 ** (-(max_exponent_bits - 1) + i)) * means).tolist()
+        data += (-(10 ** (-(max_exponent_bits - 1) + i)) * means).tolist()
+    data.append(0)
+    data.append(1.0)
+    data.sort()
+    return torch.tensor(data, dtype=torch.float32)
+
+
+def get_4bit_code(quant_type: str) -> torch.Tensor:
+    """Get the codebook of a 4-bit format ("fp4" or "nf4"), indexed by the 4-bit value."""
+    if quant_type == "nf4":
+        code = torch.tensor(_NF4_CODE, dtype=torch.float32)
+    elif quant_type == "fp4":
+        code = torch.tensor(_FP4_CODE, dtype=torch.float32)
+    else:
+        raise ValueError(f"Invalid 4-bit quant_type: {quant_type}, valid: fp4, nf4")
+    return code.div_(code.abs().max())
+
+
+def _make_lookup(code: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    # sorted distinct code values, and the first index of each value in the code (0.0 and -0.0 are the same value)
+    first_index = {}
+    for i, v in enumerate(code.tolist()):
+        first_index.setdefault(v, i)
+    values = sorted(first_index)
+    return torch.tensor(values, dtype=torch.float32), torch.tensor([first_index[v] for v in values])
+
+
+def _nearest_index(scaled: torch.Tensor, lookup: Tuple[torch.Tensor, torch.Tensor]) -> torch.Tensor:
+    # index of the nearest code value. Of equally near values, the one with the lowest index is taken.
+    values, indices = lookup
+    hi = torch.searchsorted(values, scaled).clamp_(max=len(values) - 1)
+    lo = (hi - 1).clamp_(min=0)
+    d_hi = (values[hi] - scaled).abs_()
+    d_lo = (scaled - values[lo]).abs_()
+    idx_hi = indices[hi]
+    idx_lo = indices[lo]
+    pick_hi = (d_hi < d_lo) | ((d_hi == d_lo) & (idx_hi < idx_lo))
+    return torch.where(pick_hi, idx_hi, idx_lo).to(torch.uint8)
+
+
+def _scale_blocks(values: torch.Tensor, blocksize: int) -> Tuple[torch.Tensor, torch.Tensor]:
+    # values is a 1-D chunk that starts at a block boundary. Returns the values scaled to [-1, 1] and block absmax.
+    n = values.numel()
+    num_blocks = math.ceil(n / blocksize)
+    pad = num_blocks * blocksize - n
+    blocks = values.float()
+    if pad:
+        blocks = torch.nn.functional.pad(blocks, (0, pad))
+    blocks = blocks.view(num_blocks, blocksize)
+    absmax = blocks.abs().amax(dim=1)
+    # blocks of zeros are scaled to zeros
+    scale = torch.where(absmax > 0, 1 / absmax, torch.zeros_like(absmax))
+    scaled = (blocks * scale.view(-1, 1)).clamp_(-1, 1).view(-1)
+    return scaled[:n], absmax
+
+
+def _scale_back(values: torch.Tensor, absmax: torch.Tensor, blocksize: int) -> torch.Tensor:
+    # values is a 1-D float32 chunk that starts at a block boundary
+    n = values.numel()
+    num_full = n // blocksize
+    out = torch.empty_like(values)
+    if num_full:
+        full = values[: num_full * blocksize].view(num_full, blocksize)
+        torch.mul(full, absmax[:num_full].view(-1, 1), out=out[: num_full * blocksize].view(num_full, blocksize))
+    if n > num_full * blocksize:
+        torch.mul(values[num_full * blocksize :], absmax[num_full], out=out[num_full * blocksize :])
+    return out
+
+
+def _chunks(n: int, blocksize: int):
+    step = max(1, _CHUNK_SIZE // blocksize) * blocksize
+    for start in range(0, n, step):
+        yield start, min(start + step, n)
+
+
+def quantize_blockwise(
+    values: torch.Tensor, code: Optional[torch.Tensor] = None, blocksize: int = BLOCKWISE8_BLOCKSIZE
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Block-wise 8-bit quantization.
+
+    Args:
+        values: the tensor to be quantized
+        code: the 8-bit codebook. Defaults to the dynamic map.
+        blocksize: number of values per block
+
+    Returns: the quantized uint8 tensor of the shape of the values, the float32 absmax of the blocks, and the code
+    """
+    if code is None:
+        code = create_dynamic_map()
+    lookup = _make_lookup(code)
+    flat = values.detach().reshape(-1)
+    n = flat.numel()
+    absmax = torch.empty(math.ceil(n / blocksize), dtype=torch.float32)
+    quantized = torch.empty(n, dtype=torch.uint8)
+    for start, end in _chunks(n, blocksize):
+        scaled, absmax[start // blocksize : math.ceil(end / blocksize)] = _scale_blocks(flat[start:end], blocksize)
+        quantized[start:end] = _nearest_index(scaled, lookup)
+    return quantized.view(values.shape), absmax, code
+
+
+def dequantize_blockwise(
+    quantized: torch.Tensor, absmax: torch.Tensor, code: torch.Tensor, blocksize: int = BLOCKWISE8_BLOCKSIZE
+) -> torch.Tensor:
+    """Dequantize the result of block-wise 8-bit quantization.
+
+    Returns: the float32 tensor of the shape of the quantized tensor
+    """
+    flat = quantized.reshape(-1)
+    code = code.float()
+    absmax = absmax.float()
+    out = torch.empty(flat.numel(), dtype=torch.float32)
+    for start, end in _chunks(flat.numel(), blocksize):
+        values = code[flat[start:end].long()]
+        out[start:end] = _scale_back(values, absmax[start // blocksize :], blocksize)
+    return out.view(quantized.shape)
+
+
+def quantize_4bit(
+    values: torch.Tensor, quant_type: str = "fp4", blocksize: int = BLOCKWISE4_BLOCKSIZE
+) -> Tuple[torch.Tensor, dict]:
+    """Block-wise 4-bit quantization. Two 4-bit values are packed per byte, the first one in the high bits.
+
+    Args:
+        values: the tensor to be quantized
+        quant_type: the 4-bit format, "fp4" or "nf4"
+        blocksize: number of values per block. Must be even.
+
+    Returns: the packed uint8 tensor of shape ((n + 1) // 2, 1), and the quantization state, in the format of the
+        dict of the bitsandbytes QuantState
+    """
+    code = get_4bit_code(quant_type)
+    lookup = _make_lookup(code)
+    flat = values.detach().reshape(-1)
+    n = flat.numel()
+    absmax = torch.empty(math.ceil(n / blocksize), dtype=torch.float32)
+    packed = torch.empty((n + 1) // 2, dtype=torch.uint8)
+    for start, end in _chunks(n, blocksize):
+        scaled, absmax[start // blocksize : math.ceil(end / blocksize)] = _scale_blocks(flat[start:end], blocksize)
+        quantized = _nearest_index(scaled, lookup)
+        if quantized.numel() % 2:
+            quantized = torch.nn.functional.pad(quantized, (0, 1))
+        packed[start // 2 : (end + 1) // 2] = (quantized[0::2] << 4) | quantized[1::2]
+
+    state = {
+        "quant_type": quant_type,
+        "absmax": absmax,
+        "blocksize": blocksize,
+        "quant_map": code,
+        "dtype": str(values.dtype).split(".")[1],
+        "shape": tuple(values.shape),
+    }
+    return packed.view(-1, 1), state
+
+
+def dequantize_4bit(
+    packed: torch.Tensor,
+    absmax: torch.Tensor,
+    code: torch.Tensor,
+    blocksize: int,
+    dtype: torch.dtype,
+    shape: Tuple[int, ...],
+) -> torch.Tensor:
+    """Dequantize the result of block-wise 4-bit quantization.
+
+    Returns: the tensor of the given dtype and shape
+    """
+    flat = packed.reshape(-1)
+    code = code.float()
+    absmax = absmax.float()
+    n = math.prod(shape)
+    out = torch.empty(n, dtype=dtype)
+    for start, end in _chunks(n, blocksize):
+        chunk = flat[start // 2 : (end + 1) // 2]
+        quantized = torch.empty(chunk.numel() * 2, dtype=torch.uint8)
+        quantized[0::2] = chunk >> 4
+        quantized[1::2] = chunk & 0xF
+        values = code[quantized[: end - start].long()]
+        out[start:end] = _scale_back(values, absmax[start // blocksize :], blocksize)
+    return out.view(shape)
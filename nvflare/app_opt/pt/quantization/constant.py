@@ -25,5 +25,6 @@ DATA_TYPE = [
 # Supported Quantization Type to reduce the above input data types
 # The quantization types are mainly for reducing the model size,
 # Hence, we support 16-, 8-, and 4-bits quantization.
-# Note that 8- and 4-bits quantization needs GPU support.
+# 8- and 4-bits quantization uses the GPU kernels of bitsandbytes if available,
+# and a CPU implementation of the same formats otherwise.
 QUANTIZATION_TYPE = ["FLOAT16", "BLOCKWISE8", "FLOAT4", "NORMFLOAT4", "ADAQUANT"]
@@ -17,15 +17,18 @@ from typing import Union
 
 import numpy as np
 import torch
-from bitsandbytes.functional import QuantState, dequantize_4bit, dequantize_blockwise
 
 from nvflare.apis.dxo import DXO, DataKind, MetaKey
 from nvflare.apis.dxo_filter import DXOFilter
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
 from nvflare.app_opt.pt.quantization.constant import QUANTIZATION_TYPE
+from nvflare.fuel.utils.import_utils import optional_import
 
 from .ada_quant import AdaQuantizer
+from .block_quant import dequantize_4bit, dequantize_blockwise
+
+bnb_functional, bnb_available = optional_import(module="bitsandbytes.functional")
 
 
 class ModelDequantizer(DXOFilter):
@@ -42,6 +45,10 @@ class ModelDequantizer(DXOFilter):
         super().__init__(supported_data_kinds=data_kinds, data_kinds_to_filter=data_kinds)
         self.logger.info("Using model dequantizer.")
 
+        # 8- and 4-bits dequantization uses the GPU kernels of bitsandbytes if available, the CPU implementation
+        # of the same formats otherwise
+        self._use_bnb = bnb_available and torch.cuda.is_available()
+
     def dequantization(
         self,
         params: dict,
@@ -93,49 +100,44 @@ class ModelDequantizer(DXOFilter):
                 # direct assign and convert back to higher precision
                 params[param_name] = values
             elif quantization_type in ["blockwise8", "float4", "normfloat4"]:
-                # use bitsandbytes to dequantize the values
-                # need GPU for general support
                 # extract quantization state
+                param_quant_state = quant_state[param_name]
+                quantized = torch.as_tensor(values)
+                absmax = torch.as_tensor(param_quant_state["absmax"])
                 if quantization_type == "blockwise8":
-                    if source_data_format == "numpy":
-                        # first convert numpy array to tensor if numpy
-                        quantized = torch.as_tensor(values).cuda()
-                        absmax = torch.as_tensor(quant_state[param_name]["absmax"]).cuda()
-                        code = torch.as_tensor(quant_state[param_name]["code"]).cuda()
-                    elif source_data_format == "torch":
-                        quantized = values.cuda()
-                        absmax = quant_state[param_name]["absmax"].cuda()
-                        code = quant_state[param_name]["code"].cuda()
-                    # de-quanitze
-                    dequantized = dequantize_blockwise(quantized, absmax=absmax, code=code)
+                    code = torch.as_tensor(param_quant_state["code"])
+                    if self._use_bnb:
+                        dequantized = bnb_functional.dequantize_blockwise(
+                            quantized.cuda(), absmax=absmax.cuda(), code=code.cuda()
+                        )
+                    else:
+                        dequantized = dequantize_blockwise(quantized, absmax=absmax, code=code)
                 else:
-                    if source_data_format == "numpy":
-                        # first convert numpy array to tensor, need to use GPU
-                        quantized = torch.as_tensor(values).cuda()
-                        # create QuantState object
-                        quantize_state = QuantState(
-                            quant_type=quant_state[param_name]["quant_type"],
-                            absmax=torch.as_tensor(quant_state[param_name]["absmax"]).cuda(),
-                            blocksize=quant_state[param_name]["blocksize"],
-                            code=torch.as_tensor(quant_state[param_name]["quant_map"]).cuda(),
-                            dtype=getattr(torch, quant_state[param_name]["dtype"]),
-                            shape=torch.Size(quant_state[param_name]["shape"]),
+                    quant_type = "fp4" if quantization_type == "float4" else "nf4"
+                    code = torch.as_tensor(param_quant_state["quant_map"])
+                    dtype = getattr(torch, param_quant_state["dtype"])
+                    shape = torch.Size(param_quant_state["shape"])
+                    if self._use_bnb:
+                        quantize_state = bnb_functional.QuantState(
+                            quant_type=param_quant_state["quant_type"],
+                            absmax=absmax.cuda(),
+                            blocksize=param_quant_state["blocksize"],
+                            code=code.cuda(),
+                            dtype=dtype,
+                            shape=shape,
                         )
-                    elif source_data_format == "torch":
-                        quantized = values.cuda()
-                        quantize_state = QuantState(
-                            quant_type=quant_state[param_name]["quant_type"],
-                            absmax=quant_state[param_name]["absmax"].cuda(),
-                            blocksize=quant_state[param_name]["blocksize"],
-                            code=quant_state[param_name]["quant_map"].cuda(),
-                            dtype=getattr(torch, quant_state[param_name]["dtype"]),
-                            shape=torch.Size(quant_state[param_name]["shape"]),
+                        dequantized = bnb_functional.dequantize_4bit(
+                            quantized.cuda(), quantize_state, quant_type=quant_type
                         )
-                    # de-quantize
-                    if quantization_type == "float4":
-                        dequantized = dequantize_4bit(quantized, quantize_state, quant_type="fp4")
                     else:
-                        dequantized = dequantize_4bit(quantized, quantize_state, quant_type="nf4")
+                        dequantized = dequantize_4bit(
+                            quantized,
+                            absmax=absmax,
+                            code=code,
+                            blocksize=param_quant_state["blocksize"],
+                            dtype=dtype,
+                            shape=shape,
+                        )
 
                 if source_data_format == "numpy":
                     params[param_name] = dequantized.cpu().numpy()
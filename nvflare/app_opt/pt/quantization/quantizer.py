@@ -18,15 +18,18 @@ from typing import Union
 
 import numpy as np
 import torch
-from bitsandbytes.functional import quantize_4bit, quantize_blockwise
 
 from nvflare.apis.dxo import DXO, DataKind, MetaKey
 from nvflare.apis.dxo_filter import DXOFilter
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
 from nvflare.app_opt.pt.quantization.constant import DATA_TYPE, QUANTIZATION_TYPE
+from nvflare.fuel.utils.import_utils import optional_import
 
 from .ada_quant import AdaQuantizer
+from .block_quant import quantize_4bit, quantize_blockwise
+
+bnb_functional, bnb_available = optional_import(module="bitsandbytes.functional")
 
 
 class ModelQuantizer(DXOFilter):
@@ -53,6 +56,10 @@ class ModelQuantizer(DXOFilter):
 
         self.quantization_type = quantization_type
 
+        # 8- and 4-bits quantization uses the GPU kernels of bitsandbytes if available, the CPU implementation
+        # of the same formats otherwise
+        self._use_bnb = bnb_available and torch.cuda.is_available()
+
         # quantization constants
         self.NP_FP16_MIN = np.finfo(np.float16).min
         self.NP_FP16_MAX = np.finfo(np.float16).max
@@ -135,57 +142,38 @@ class ModelQuantizer(DXOFilter):
                     values = values.to(torch.float16)
                 params[param_name] = values
             elif self.quantization_type in ["blockwise8", "float4", "normfloat4"]:
-                # use bitsandbytes to quantize the values
-                # input is a tensor, output is a tuple of (quantized tensor, quantized_state)
-
-                # CPU has limited support for 8- and 4-bits quantization
-                # For general purpose, here we use GPU
-                if source_data_format == "numpy":
-                    # if numpy, first convert numpy array to tensor, need to use GPU
-                    values_tensor = torch.as_tensor(values).cuda()
-                elif source_data_format == "torch":
-                    # if torch, directly use the tensor, need to use GPU
-                    values_tensor = values.cuda()
+                # input is a tensor, output is the quantized tensor and the quantization state
+                values_tensor = torch.as_tensor(values)
 
                 if self.quantization_type == "blockwise8":
-                    # quantize the tensor
-                    quantized, quantized_state = quantize_blockwise(values_tensor)
-                    # add the quantization state and values, keep source data format
-                    if source_data_format == "numpy":
-                        quant_state[param_name]["absmax"] = quantized_state.absmax.cpu().numpy()
-                        quant_state[param_name]["code"] = quantized_state.code.cpu().numpy()
-                        values = quantized.cpu().numpy()
-                    elif source_data_format == "torch":
-                        quant_state[param_name]["absmax"] = quantized_state.absmax.cpu()
-                        quant_state[param_name]["code"] = quantized_state.code.cpu()
-                        values = quantized.cpu()
-                    n_bytes_meta += quant_state[param_name]["absmax"].nbytes
-                    n_bytes_meta += quant_state[param_name]["code"].nbytes
+                    if self._use_bnb:
+                        quantized, quantized_state = bnb_functional.quantize_blockwise(values_tensor.cuda())
+                        state = {"absmax": quantized_state.absmax, "code": quantized_state.code}
+                    else:
+                        quantized, absmax, code = quantize_blockwise(values_tensor)
+                        state = {"absmax": absmax, "code": code}
                 else:
-                    # then quantize the tensor
-                    if self.quantization_type == "float4":
-                        quantized, quantized_state = quantize_4bit(values_tensor, quant_type="fp4")
+                    quant_type = "fp4" if self.quantization_type == "float4" else "nf4"
+                    if self._use_bnb:
+                        quantized, quantized_state = bnb_functional.quantize_4bit(
+                            values_tensor.cuda(), quant_type=quant_type
+                        )
+                        state = quantized_state.as_dict()
                     else:
-                        quantized, quantized_state = quantize_4bit(values_tensor, quant_type="nf4")
-                    # add the quantization state and values, keep source data format
-                    quantized_state = quantized_state.as_dict()
-                    # prepared the message
-                    for state_name, state in quantized_state.items():
-                        if isinstance(state, torch.Tensor):
-                            if source_data_format == "numpy":
-                                # if the state is a tensor, convert it to numpy array
-                                quant_state[param_name][state_name] = state.cpu().numpy()
-                            elif source_data_format == "torch":
-                                # if the state is a tensor, keep it as tensor
-                                quant_state[param_name][state_name] = state.cpu()
-                            n_bytes_meta += state.nbytes
-                        else:
-                            quant_state[param_name][state_name] = state
-                    # add values
-                    if source_data_format == "numpy":
-                        values = quantized.cpu().numpy()
-                    elif source_data_format == "torch":
-                        values = quantized.cpu()
+                        quantized, state = quantize_4bit(values_tensor, quant_type=quant_type)
+
+                # prepare the message, keep source data format
+                for state_name, state_value in state.items():
+                    if isinstance(state_value, torch.Tensor):
+                        state_value = state_value.cpu()
+                        n_bytes_meta += state_value.nbytes
+                        if source_data_format == "numpy":
+                            state_value = state_value.numpy()
+                    quant_state[param_name][state_name] = state_value
+                if source_data_format == "numpy":
+                    values = quantized.cpu().numpy()
+                elif source_data_format == "torch":
+                    values = quantized.cpu()
 
                 params[param_name] = values
             elif self.quantization_type == "adaquant":
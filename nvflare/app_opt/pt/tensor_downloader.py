@@ -19,6 +19,7 @@ import threading
 import weakref
 from typing import Any, List, Optional, Tuple
 
+import numpy as np
 import torch
 from safetensors.torch import load as load_tensors
 from safetensors.torch import save as save_tensors
@@ -28,6 +29,7 @@ from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.streaming.cacheable import CacheableObject, ItemConsumer
 from nvflare.fuel.f3.streaming.download_service import download_object
 from nvflare.fuel.f3.streaming.obj_downloader import ObjectDownloader
+from nvflare.fuel.f3.streaming.ranged_item import RangedItemAssembler, encode_ranged_item, is_ranged_item, split_ranges
 
 from .lazy_tensor_dict import LazyTensorDict, _cleanup_temp_dir
 
@@ -35,6 +37,20 @@ _TWO_MB = 2 * 1024 * 1024
 _ACTIVE_DISK_TENSOR_CONSUMERS = weakref.WeakSet()
 _ACTIVE_DISK_TENSOR_CONSUMERS_LOCK = threading.Lock()
 
+# Safetensors names of the dtypes that tensors can be sent as ranged items with
+_SAFETENSORS_DTYPES = {
+    torch.float64: "F64",
+    torch.float32: "F32",
+    torch.float16: "F16",
+    torch.bfloat16: "BF16",
+    torch.int64: "I64",
+    torch.int32: "I32",
+    torch.int16: "I16",
+    torch.int8: "I8",
+    torch.uint8: "U8",
+    torch.bool: "BOOL",
+}
+
 
 def cleanup_active_disk_tensor_downloads(reason: str = "download aborted") -> None:
     """Clean partial tensor offload dirs still owned by active disk consumers."""
@@ -45,20 +61,78 @@ def cleanup_active_disk_tensor_downloads(reason: str = "download aborted") -> No
         consumer.download_failed("active_disk_tensor_download", reason)
 
 
+def _flat_bytes(tensor: torch.Tensor) -> torch.Tensor:
+    """Get the data of a contiguous tensor as a flat uint8 tensor without copy."""
+    return tensor.detach().reshape(-1).view(torch.uint8)
+
+
+def _allocate_tensor(key: str, meta, total_size: int):
+    dtype_name, shape = meta
+    dtype = getattr(torch, dtype_name, None)
+    if dtype not in _SAFETENSORS_DTYPES:
+        raise ValueError(f"unsupported dtype '{dtype_name}' of tensor '{key}'")
+
+    tensor = torch.empty(shape, dtype=dtype)
+    view = _flat_bytes(tensor).numpy()
+    if view.nbytes != total_size:
+        raise ValueError(f"size of tensor '{key}' is {view.nbytes} but expected {total_size}")
+
+    def _write(start: int, data):
+        view[start : start + len(data)] = np.frombuffer(data, dtype=np.uint8)
+
+    return tensor, _write
+
+
 class TensorDownloadable(CacheableObject):
 
-    def __init__(self, tensors: dict[str, torch.Tensor], max_chunk_size: int):
-        self.size = len(tensors)
+    def __init__(self, tensors: dict[str, torch.Tensor], max_chunk_size: int, split_large_tensors: bool = False):
+        """Constructor of TensorDownloadable.
+
+        Args:
+            tensors: the tensors to be downloaded
+            max_chunk_size: max number of bytes for each chunk
+            split_large_tensors: whether to send tensors larger than max_chunk_size as multiple ranged items,
+                each carrying one byte range of the tensor, instead of one safetensors item. Only set this if all
+                receivers understand ranged items
+
+        """
         self.keys = list(tensors.keys())
+
+        # each item is (key, start, end); start and end are None if the whole tensor is sent in one item
+        self.items = []
+        for key, tensor in tensors.items():
+            if split_large_tensors and self._can_split(tensor, max_chunk_size):
+                nbytes = tensor.numel() * tensor.element_size()
+                self.items.extend((key, start, end) for start, end in split_ranges(nbytes, max_chunk_size))
+            else:
+                self.items.append((key, None, None))
         super().__init__(tensors, max_chunk_size)
 
+    @staticmethod
+    def _can_split(tensor, max_chunk_size: int) -> bool:
+        return (
+            max_chunk_size > 0
+            and isinstance(tensor, torch.Tensor)
+            and tensor.layout == torch.strided
+            and tensor.dtype in _SAFETENSORS_DTYPES
+            and tensor.is_contiguous()
+            and tensor.numel() * tensor.element_size() > max_chunk_size
+        )
+
     def get_item_count(self) -> int:
-        return self.size
+        return len(self.items)
 
     def produce_item(self, index: int) -> bytes:
-        key = self.keys[index]
-        tensor_to_send = {key: self.base_obj[key]}
-        return save_tensors(tensor_to_send)
+        key, start, end = self.items[index]
+        tensor = self.base_obj[key]
+        if start is None:
+            return save_tensors({key: tensor})
+
+        flat = _flat_bytes(tensor)
+        meta = [str(tensor.dtype).split(".")[-1], list(tensor.shape)]
+        # only the range is copied to host memory if the tensor is on a device
+        data = flat[start:end].cpu().numpy()
+        return encode_ranged_item(key, meta, flat.numel(), start, data)
 
 
 class TensorConsumer(ItemConsumer):
@@ -69,6 +143,7 @@ class TensorConsumer(ItemConsumer):
         self.cb_kwargs = cb_kwargs
         if tensors_received_cb is not None and not callable(tensors_received_cb):
             raise ValueError("tensors_received_cb must be callable")
+        self.assembler = RangedItemAssembler()
 
     def consume_items(self, items: List[Any], result: Any) -> Any:
         if not isinstance(items, list):
@@ -78,11 +153,21 @@ class TensorConsumer(ItemConsumer):
 
         tensors = {}
         for item in items:
+            if is_ranged_item(item):
+                key, tensor = self.assembler.add(item, _allocate_tensor)
+                if tensor is not None:
+                    tensors[key] = tensor
+                continue
+
             td = load_tensors(item)
             if not isinstance(td, dict):
                 raise ValueError("cannot load received bytes to tensors")
             tensors.update(td)
 
+        if not tensors:
+            # only ranges of incomplete tensors were received
+            return result
+
         if self.tensors_received_cb:
             cb_result = self.tensors_received_cb(tensors, **self.cb_kwargs)
             if isinstance(cb_result, dict):
@@ -91,11 +176,19 @@ class TensorConsumer(ItemConsumer):
             result.update(tensors)
         return result
 
+    def download_completed(self, ref_id: str):
+        incomplete = self.assembler.incomplete_keys()
+        if incomplete:
+            self.download_failed(ref_id, f"incomplete tensors {incomplete}")
+            return
+        super().download_completed(ref_id)
+
 
 def add_tensors(
     downloader: ObjectDownloader,
     tensors: dict[str, torch.Tensor],
     max_chunk_size: int = _TWO_MB,
+    split_large_tensors: bool = False,
 ) -> str:
     """Add tensors to be downloaded to the specified downloader.
 
@@ -103,11 +196,12 @@ def add_tensors(
         downloader: the downloader to add tensors to.
         tensors: state dict to be downloaded
         max_chunk_size: max chunk size
+        split_large_tensors: whether to send tensors larger than max_chunk_size as multiple ranged items
 
     Returns: reference id for the state dict.
 
     """
-    obj = TensorDownloadable(tensors, max_chunk_size)
+    obj = TensorDownloadable(tensors, max_chunk_size, split_large_tensors)
     return downloader.add_object(obj)
 
 
@@ -185,9 +279,40 @@ class DiskTensorConsumer(ItemConsumer):
         self._temp_dir = temp_dir
         self._cleaned = False
         self._file_counter = 0
+        self.assembler = RangedItemAssembler()
         with _ACTIVE_DISK_TENSOR_CONSUMERS_LOCK:
             _ACTIVE_DISK_TENSOR_CONSUMERS.add(self)
 
+    def _next_file_path(self) -> str:
+        file_path = os.path.join(self._temp_dir, f"chunk_{self._file_counter}.safetensors")
+        self._file_counter += 1
+        return file_path
+
+    def _allocate_file(self, key: str, meta, total_size: int):
+        """Create a single-tensor safetensors file of the full size, to be filled in range by range."""
+        dtype_name, shape = meta
+        st_dtype = _SAFETENSORS_DTYPES.get(getattr(torch, dtype_name, None))
+        if not st_dtype:
+            raise ValueError(f"unsupported dtype '{dtype_name}' of tensor '{key}'")
+
+        header = json.dumps({key: {"dtype": st_dtype, "shape": shape, "data_offsets": [0, total_size]}}).encode()
+        # safetensors requires the data to start at a multiple of 8 bytes
+        header += b" " * (-len(header) % 8)
+        data_start = 8 + len(header)
+
+        file_path = self._next_file_path()
+        with open(file_path, "wb") as f:
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.truncate(data_start + total_size)
+
+        def _write(start: int, data):
+            with open(file_path, "r+b") as wf:
+                wf.seek(data_start + start)
+                wf.write(data)
+
+        return file_path, _write
+
     def release(self) -> None:
         with _ACTIVE_DISK_TENSOR_CONSUMERS_LOCK:
             _ACTIVE_DISK_TENSOR_CONSUMERS.discard(self)
@@ -209,21 +334,36 @@ class DiskTensorConsumer(ItemConsumer):
             result = {}
 
         for item in items:
+            if is_ranged_item(item):
+                key, file_path = self.assembler.add(item, self._allocate_file)
+                if file_path is not None:
+                    self._add_key(result, key, file_path)
+                continue
+
             keys = _extract_safetensors_keys(item)
-            file_path = os.path.join(self._temp_dir, f"chunk_{self._file_counter}.safetensors")
-            self._file_counter += 1
+            file_path = self._next_file_path()
             with open(file_path, "wb") as f:
                 f.write(item)
             for key in keys:
-                if key in result:
-                    raise ValueError(
-                        f"Duplicate tensor key '{key}' seen in multiple safetensors chunks; "
-                        "streaming data may be malformed."
-                    )
-                result[key] = (file_path, key)
+                self._add_key(result, key, file_path)
 
         return result
 
+    @staticmethod
+    def _add_key(result: dict, key: str, file_path: str):
+        if key in result:
+            raise ValueError(
+                f"Duplicate tensor key '{key}' seen in multiple safetensors chunks; streaming data may be malformed."
+            )
+        result[key] = (file_path, key)
+
+    def download_completed(self, ref_id: str):
+        incomplete = self.assembler.incomplete_keys()
+        if incomplete:
+            self.download_failed(ref_id, f"incomplete tensors {incomplete}")
+            return
+        super().download_completed(ref_id)
+
     def download_failed(self, ref_id, reason: str):
         super().download_failed(ref_id, reason)
         # Eager cleanup on download callback error; the outer caller may also
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
 
 
 class Aggregator:
@@ -33,7 +34,24 @@ class Aggregator:
         else:
             aggr[bin_id] = self.add(current_value, sample_value)
 
-    def aggregate(self, gh_values: list, sample_bin_assignment, num_bins, sample_ids):
+    def aggregate(self, gh_values, sample_bin_assignment, num_bins, sample_ids):
+        """Compute the histogram of the gh values: the sum of the values of the samples in each bin.
+
+        If the gh values are a NumPy array of plain-text numbers (float, or int for fixed-point values), the
+        histogram is computed with vectorized NumPy operations. Otherwise (e.g. for a list of cipher-text numbers),
+        the values are added one by one with the add method.
+
+        Args:
+            gh_values: the gh value of each sample
+            sample_bin_assignment: the bin of each sample; samples of a negative bin are not counted
+            num_bins: number of bins
+            sample_ids: the ids of the samples to count. All samples are counted if empty or None.
+
+        Returns: list of the sums of the bins
+        """
+        if isinstance(gh_values, np.ndarray) and gh_values.dtype.kind in "iuf":
+            return self._aggregate_array(gh_values, sample_bin_assignment, num_bins, sample_ids)
+
         aggr_result = [self.initial_value] * num_bins
         if not sample_ids:
             for sample_id in range(len(gh_values)):
@@ -42,3 +60,29 @@ class Aggregator:
             for sample_id in sample_ids:
                 self._update_aggregation(gh_values, sample_bin_assignment, sample_id, aggr_result)
         return aggr_result
+
+    @staticmethod
+    def _aggregate_array(gh_values: np.ndarray, sample_bin_assignment, num_bins, sample_ids):
+        bins = np.asarray(sample_bin_assignment)
+        if sample_ids is not None and len(sample_ids) > 0:
+            sample_ids = np.asarray(sample_ids)
+            bins = bins[sample_ids]
+            values = gh_values[sample_ids]
+        else:
+            bins = bins[: len(gh_values)]
+            values = gh_values
+
+        counted = bins >= 0
+        if not counted.all():
+            bins = bins[counted]
+            values = values[counted]
+
+        if values.dtype.kind == "f":
+            aggr_result = np.bincount(bins, weights=values, minlength=num_bins)
+            if len(aggr_result) > num_bins:
+                raise IndexError(f"bin {len(aggr_result) - 1} is out of range for {num_bins} bins")
+        else:
+            # fixed-point values are summed as integers, so the sums are exact
+            aggr_result = np.zeros(num_bins, dtype=np.int64)
+            np.add.at(aggr_result, bins, values.astype(np.int64, copy=False))
+        return aggr_result.tolist()
@@ -14,6 +14,7 @@
 import os
 import time
 
+import numpy as np
 import xgboost
 from packaging import version
 
@@ -74,6 +75,7 @@ class ClientSecurityHandler(SecurityHandler):
         self.data_converter = ProcessorDataConverter()
         self.encrypted_ghs = None
         self.clear_ghs = None  # for label client: list of tuples (g, h)
+        self.clear_gh_arrays = None  # for label client: int64 arrays of the fixed-point g and h of the samples
         self.original_gh_buffer = None
         self.feature_masks = None
         self.aggregator = Aggregator()
@@ -108,6 +110,9 @@ class ClientSecurityHandler(SecurityHandler):
 
         # encrypt clear-text gh pairs and send to server
         self.clear_ghs = [combine(clear_ghs[i][0], clear_ghs[i][1]) for i in range(len(clear_ghs))]
+        # the combined values do not fit in int64: g and h are aggregated separately in clear text
+        gh_array = np.array(clear_ghs, dtype=np.int64).reshape(-1, 2)
+        self.clear_gh_arrays = (gh_array[:, 0].copy(), gh_array[:, 1].copy())
         t = time.time()
         encrypted_values = self.encryptor.encrypt(self.clear_ghs)
         self.info(fl_ctx, f"encrypted gh pairs: {len(encrypted_values)}, took {time.time() - t} secs")
@@ -185,7 +190,11 @@ class ClientSecurityHandler(SecurityHandler):
             m = []
             if aggr_ctx.features:
                 for f in aggr_ctx.features:
-                    m.append((f.feature_id, f.sample_bin_assignment, f.num_bins))
+                    bin_assignment = f.sample_bin_assignment
+                    if self.clear_ghs:
+                        # the label client aggregates in clear text with NumPy
+                        bin_assignment = np.asarray(bin_assignment)
+                    m.append((f.feature_id, bin_assignment, f.num_bins))
             self.feature_masks = m
             self.info(fl_ctx, f"got feature ctx: {len(m)}")
 
@@ -256,21 +265,29 @@ class ClientSecurityHandler(SecurityHandler):
             return
 
         t = time.time()
+        groups = [(gid, np.asarray(sample_ids, dtype=np.int64)) for gid, sample_ids in groups]
         aggr_result = []  # list of (fid, gid, GH_list)
         for fm in self.feature_masks:
             fid, masks, num_bins = fm
             if not groups:
                 gid = 0
-                gh_list = self.aggregator.aggregate(self.clear_ghs, masks, num_bins, None)
+                gh_list = self._aggregate_clear_ghs(masks, num_bins, None)
                 aggr_result.append((fid, gid, gh_list))
             else:
                 for grp in groups:
                     gid, sample_ids = grp
-                    gh_list = self.aggregator.aggregate(self.clear_ghs, masks, num_bins, sample_ids)
+                    gh_list = self._aggregate_clear_ghs(masks, num_bins, sample_ids)
                     aggr_result.append((fid, gid, gh_list))
         self.info(fl_ctx, f"aggregated clear-text in {time.time() - t} secs")
         self.aggr_result = aggr_result
 
+    def _aggregate_clear_ghs(self, masks, num_bins, sample_ids):
+        g_values, h_values = self.clear_gh_arrays
+        g_list = self.aggregator.aggregate(g_values, masks, num_bins, sample_ids)
+        h_list = self.aggregator.aggregate(h_values, masks, num_bins, sample_ids)
+        # same as the sums of the combined values: combine is linear
+        return [combine(g, h) for g, h in zip(g_list, h_list)]
+
     def _decrypt_aggr_result(self, encoded, fl_ctx: FLContext):
         # decrypt aggr result from a client
         if not isinstance(encoded, str):
@@ -461,5 +478,7 @@ class ClientSecurityHandler(SecurityHandler):
                     fl_ctx.set_prop(Constant.PARAM_KEY_CONFIG_ERROR, tenseal_error, private=True, sticky=False)
         elif event_type == EventType.END_RUN:
             self.tenseal_context = None
+            if self.adder:
+                self.adder.shutdown()
         else:
             super().handle_event(event_type, fl_ctx)
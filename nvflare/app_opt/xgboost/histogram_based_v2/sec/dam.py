@@ -13,7 +13,9 @@
 # limitations under the License.
 import struct
 from io import BytesIO
-from typing import List
+from typing import List, Union
+
+import numpy as np
 
 SIGNATURE = "NVDADAM1"  # DAM (Direct Accessible Marshalling) V1
 PREFIX_LEN = 24
@@ -24,6 +26,10 @@ DATA_TYPE_STRING = 3
 DATA_TYPE_INT_ARRAY = 257
 DATA_TYPE_FLOAT_ARRAY = 258
 
+# array elements are packed like struct "q" and "d": 8 bytes in native byte order
+_INT_DTYPE = np.dtype("=i8")
+_FLOAT_DTYPE = np.dtype("=f8")
+
 
 class DamEncoder:
     def __init__(self, data_set_id: int):
@@ -31,10 +37,10 @@ class DamEncoder:
         self.entries = []
         self.buffer = BytesIO()
 
-    def add_int_array(self, value: List[int]):
+    def add_int_array(self, value: Union[List[int], np.ndarray]):
         self.entries.append((DATA_TYPE_INT_ARRAY, value))
 
-    def add_float_array(self, value: List[float]):
+    def add_float_array(self, value: Union[List[float], np.ndarray]):
         self.entries.append((DATA_TYPE_FLOAT_ARRAY, value))
 
     def finish(self) -> bytes:
@@ -51,12 +57,10 @@ class DamEncoder:
             data_type, value = entry
             self.write_int64(data_type)
             self.write_int64(len(value))
-
-            for x in value:
-                if data_type == DATA_TYPE_INT_ARRAY:
-                    self.write_int64(x)
-                else:
-                    self.write_float(x)
+            if data_type == DATA_TYPE_INT_ARRAY:
+                self.write_int64_array(value)
+            else:
+                self.write_float_array(value)
 
         return self.buffer.getvalue()
 
@@ -66,6 +70,19 @@ class DamEncoder:
     def write_float(self, value: float):
         self.buffer.write(struct.pack("d", value))
 
+    def write_int64_array(self, value):
+        array = np.asarray(value)
+        if array.size and array.dtype.kind not in "iub":
+            raise TypeError(f"int array expected but got array of {array.dtype}")
+        self._write_array(array.astype(_INT_DTYPE, copy=False))
+
+    def write_float_array(self, value):
+        self._write_array(np.asarray(value, dtype=_FLOAT_DTYPE))
+
+    def _write_array(self, array: np.ndarray):
+        # the memory of the array is written without an intermediate bytes copy
+        self.buffer.write(np.ascontiguousarray(array).data)
+
     def write_str(self, value: str):
         self.buffer.write(value.encode("utf-8"))
 
@@ -89,29 +106,39 @@ class DamDecoder:
     def get_data_set_id(self):
         return self.data_set_id
 
-    def decode_int_array(self) -> List[int]:
+    def decode_int_array(self, as_array: bool = False) -> Union[List[int], np.ndarray]:
+        """Decode the next entry as an int array.
+
+        Args:
+            as_array: return a read-only int64 NumPy array instead of a list. The array is not a copy: it
+                shares the memory of the buffer, so the buffer must not be modified while the array is used
+
+        Returns: the int array
+        """
         data_type = self.read_int64()
         if data_type != DATA_TYPE_INT_ARRAY:
             raise RuntimeError("Invalid data type for int array")
 
         num = self.read_int64()
-        result = [0] * num
-        for i in range(num):
-            result[i] = self.read_int64()
+        result = self.read_array(num, _INT_DTYPE)
+        return result if as_array else result.tolist()
 
-        return result
+    def decode_float_array(self, as_array: bool = False) -> Union[List[float], np.ndarray]:
+        """Decode the next entry as a float array.
 
-    def decode_float_array(self):
+        Args:
+            as_array: return a read-only float64 NumPy array instead of a list. The array is not a copy: it
+                shares the memory of the buffer, so the buffer must not be modified while the array is used
+
+        Returns: the float array
+        """
         data_type = self.read_int64()
         if data_type != DATA_TYPE_FLOAT_ARRAY:
             raise RuntimeError("Invalid data type for float array")
 
         num = self.read_int64()
-        result = [0.0] * num
-        for i in range(num):
-            result[i] = self.read_float()
-
-        return result
+        result = self.read_array(num, _FLOAT_DTYPE)
+        return result if as_array else result.tolist()
 
     def read_string(self, length: int) -> str:
         result = self.buffer[self.pos : self.pos + length].decode("latin1")
@@ -123,6 +150,15 @@ class DamDecoder:
         self.pos += 8
         return result
 
+    def read_array(self, num: int, dtype: np.dtype) -> np.ndarray:
+        if num < 0 or self.pos + num * dtype.itemsize > len(self.buffer):
+            raise RuntimeError(f"Invalid array size {num}")
+        result = np.frombuffer(self.buffer, dtype=dtype, count=num, offset=self.pos)
+        # a view of a writable buffer (e.g. bytearray) would be writable too
+        result.flags.writeable = False
+        self.pos += num * dtype.itemsize
+        return result
+
     def read_float(self) -> float:
         (result,) = struct.unpack_from("d", self.buffer, self.pos)
         self.pos += 8
@@ -18,17 +18,49 @@ from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
 
 from .util import encode_encrypted_numbers_to_str
 
+# state of a worker process: the encrypted numbers and features of the current Adder state
+_worker_numbers = None
+_worker_features = None
+
+
+def _init_worker(encrypted_numbers, features):
+    global _worker_numbers, _worker_features
+    _worker_numbers = encrypted_numbers
+    _worker_features = features
+
 
 class Adder:
     def __init__(self, max_workers=10):
-        self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        """Add encrypted numbers of samples into histograms, with a pool of worker processes.
+
+        The encrypted numbers and the features (with their masks) are shipped to each worker once, when the pool is
+        started, instead of with every task: the pool is restarted when they change (e.g. once per boosting
+        round). Tasks only carry the indices of their features and the sample groups.
+
+        Args:
+            max_workers: number of worker processes
+        """
+        self.exe = None
         self.num_workers = max_workers
+        self._encrypted_numbers = None
+        self._features = None
+
+    def _get_executor(self, encrypted_numbers, features):
+        if self.exe is None or encrypted_numbers is not self._encrypted_numbers or features is not self._features:
+            self.shutdown()
+            self.exe = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.num_workers, initializer=_init_worker, initargs=(encrypted_numbers, features)
+            )
+            self._encrypted_numbers = encrypted_numbers
+            self._features = features
+        return self.exe
 
     def add(self, encrypted_numbers, features, sample_groups=None, encode_sum=True):
         """
 
         Args:
-            encrypted_numbers: list of encrypted numbers (combined gh), one for each sample
+            encrypted_numbers: list of encrypted numbers (combined gh), one for each sample.
+                    Pass the same list object for all adds of a boosting round, so it is only shipped once.
             features: list of tuples of (feature_id, mask, num_bins), one for each feature.
                     size of mask = size of encrypted_numbers: there is a bin number for each sample
                     num_bins specifies the number of bins for the feature
@@ -40,40 +72,47 @@ class Adder:
             samples in the group for the feature.
 
         """
-        items = []
+        exe = self._get_executor(encrypted_numbers, features)
+        if not sample_groups:
+            sample_groups = [(0, None)]
+
+        # each task covers a range of features for all groups, so the groups are sent once per task
+        num_tasks = min(len(features), self.num_workers * 4)
+        if num_tasks == 0:
+            return []
+        size = (len(features) - 1) // num_tasks + 1
+        items = [
+            (encode_sum, start, min(start + size, len(features)), sample_groups)
+            for start in range(0, len(features), size)
+        ]
 
-        for f in features:
-            fid, mask, num_bins = f
-            if not sample_groups:
-                items.append((encode_sum, fid, encrypted_numbers, mask, num_bins, 0, None))
-            else:
-                for g in sample_groups:
-                    gid, sample_id_list = g
-                    items.append((encode_sum, fid, encrypted_numbers, mask, num_bins, gid, sample_id_list))
-
-        chunk_size = int((len(items) - 1) / self.num_workers) + 1
-
-        results = self.exe.map(_do_add, items, chunksize=chunk_size)
         rl = []
-        for r in results:
-            rl.append(r)
+        for results in exe.map(_do_add, items):
+            rl.extend(results)
         return rl
 
+    def shutdown(self):
+        if self.exe is not None:
+            self.exe.shutdown(wait=True)
+            self.exe = None
+
 
 def _do_add(item):
-    encode_sum, fid, encrypted_numbers, mask, num_bins, gid, sample_id_list = item
-    # bins = [0 for _ in range(num_bins)]
+    encode_sum, start, end, sample_groups = item
     aggr = Aggregator()
-
-    bins = aggr.aggregate(
-        gh_values=encrypted_numbers,
-        sample_bin_assignment=mask,
-        num_bins=num_bins,
-        sample_ids=sample_id_list,
-    )
-
-    if encode_sum:
-        sums = encode_encrypted_numbers_to_str(bins)
-    else:
-        sums = bins
-    return fid, gid, sums
+    results = []
+    for fid, mask, num_bins in _worker_features[start:end]:
+        for gid, sample_id_list in sample_groups:
+            bins = aggr.aggregate(
+                gh_values=_worker_numbers,
+                sample_bin_assignment=mask,
+                num_bins=num_bins,
+                sample_ids=sample_id_list,
+            )
+
+            if encode_sum:
+                sums = encode_encrypted_numbers_to_str(bins)
+            else:
+                sums = bins
+            results.append((fid, gid, sums))
+    return results
@@ -13,6 +13,8 @@
 # limitations under the License.
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 from nvflare.apis.fl_context import FLContext
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.data_converter import (
@@ -47,14 +49,12 @@ class ProcessorDataConverter(DataConverter):
         if decoder.get_data_set_id() != DATA_SET_GH_PAIRS:
             raise RuntimeError(f"Data is not for GH Pairs: {decoder.get_data_set_id()}")
 
-        float_array = decoder.decode_float_array()
-        result = []
+        float_array = decoder.decode_float_array(as_array=True)
         self.num_samples = int(len(float_array) / 2)
 
-        for i in range(self.num_samples):
-            result.append((self.float_to_int(float_array[2 * i]), self.float_to_int(float_array[2 * i + 1])))
-
-        return result
+        # same as float_to_int of each value: the scaled values are truncated toward zero
+        int_array = (float_array[: 2 * self.num_samples] * SCALE_FACTOR).astype(np.int64)
+        return list(zip(int_array[0::2].tolist(), int_array[1::2].tolist()))
 
     def decode_aggregation_context(self, buffer: bytes, fl_ctx: FLContext) -> AggregationContext:
         decoder = DamDecoder(buffer)
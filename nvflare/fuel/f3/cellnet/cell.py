@@ -89,7 +89,6 @@ class Adapter:
     def call(self, future, *args, **kwargs):  # this will be called by StreamCell upon receiving the first byte of blob
         headers = future.headers
         stream_req_id = headers.get(StreamHeaderKey.STREAM_REQ_ID, "")
-        origin = headers.get(MessageHeaderKey.ORIGIN, None)
         result = future.result()
         self.logger.debug(f"{stream_req_id=}: {headers=}, incoming data={result}")
         request = Message(headers, result)
@@ -123,9 +122,6 @@ class Adapter:
         request.set_header(MessageHeaderKey.TOPIC, topic)
         self.logger.debug(f"Call back on {stream_req_id=}: {channel=}, {topic=}")
 
-        req_id = request.get_header(MessageHeaderKey.REQ_ID, "")
-        secure = request.get_header(MessageHeaderKey.SECURE, False)
-        optional = request.get_header(MessageHeaderKey.OPTIONAL, False)
         self.logger.debug(f"{stream_req_id=}: on {channel=}, {topic=}")
         response = self.cb(request, *args, **kwargs)
         self.logger.debug(f"response available: {stream_req_id=}: on {channel=}, {topic=}")
@@ -135,20 +131,37 @@ class Adapter:
             self.logger.debug("Do not send reply because there is no stream_req_id!")
             return
 
-        response.add_headers(
-            {
-                MessageHeaderKey.REQ_ID: req_id,
-                MessageHeaderKey.MSG_TYPE: MessageType.REPLY,
-                StreamHeaderKey.STREAM_REQ_ID: stream_req_id,
-            }
-        )
-
-        encode_payload(response, StreamHeaderKey.PAYLOAD_ENCODING, fobs_ctx=self.cell.get_fobs_context())
-        self.logger.debug(f"sending: {stream_req_id=}: {response.headers=}, target={origin}")
-        reply_future = self.cell.send_blob(
-            CellChannel.RETURN_ONLY, f"{channel}:{topic}", origin, response, secure, optional
-        )
-        self.logger.debug(f"Done sending: {stream_req_id=}: {reply_future=}")
+        if response is None:
+            if request.get_prop(MessagePropKey.REPLY_DEFERRED):
+                # the CB will send the reply later with cell.reply_to_request
+                self.logger.debug(f"{stream_req_id=}: reply deferred by the CB")
+                return
+            self.logger.error(f"{stream_req_id=}: request CB for {channel=}, {topic=} returned no reply")
+            response = make_reply(ReturnCode.PROCESS_EXCEPTION, "no reply from request CB")
+
+        _send_stream_reply(self.cell, request, response, self.logger)
+
+
+def _send_stream_reply(cell, request: Message, response: Message, logger):
+    stream_req_id = request.get_header(StreamHeaderKey.STREAM_REQ_ID, "")
+    origin = request.get_header(MessageHeaderKey.ORIGIN, None)
+    channel = request.get_header(MessageHeaderKey.CHANNEL)
+    topic = request.get_header(MessageHeaderKey.TOPIC)
+    req_id = request.get_header(MessageHeaderKey.REQ_ID, "")
+    secure = request.get_header(MessageHeaderKey.SECURE, False)
+    optional = request.get_header(MessageHeaderKey.OPTIONAL, False)
+    response.add_headers(
+        {
+            MessageHeaderKey.REQ_ID: req_id,
+            MessageHeaderKey.MSG_TYPE: MessageType.REPLY,
+            StreamHeaderKey.STREAM_REQ_ID: stream_req_id,
+        }
+    )
+
+    encode_payload(response, StreamHeaderKey.PAYLOAD_ENCODING, fobs_ctx=cell.get_fobs_context())
+    logger.debug(f"sending: {stream_req_id=}: {response.headers=}, target={origin}")
+    reply_future = cell.send_blob(CellChannel.RETURN_ONLY, f"{channel}:{topic}", origin, response, secure, optional)
+    logger.debug(f"Done sending: {stream_req_id=}: {reply_future=}")
 
 
 class Cell(StreamCell):
@@ -505,6 +518,48 @@ class Cell(StreamCell):
         waiter.receiving_future = future
         waiter.in_receiving.set()
 
+    @staticmethod
+    def defer_reply(request: Message):
+        """Mark the request as to be replied later with reply_to_request.
+
+        A request CB that is not ready to reply (e.g. waiting for some condition) may keep the request, call this
+        method and return None. Without it, a None result of the CB of a streamed request is replied as an error.
+
+        Args:
+            request: the request received by the request CB
+        """
+        request.set_prop(MessagePropKey.REPLY_DEFERRED, True)
+
+    def reply_to_request(self, request: Message, reply: Message):
+        """Send the reply to a request for which the request CB called defer_reply and returned None.
+
+        Args:
+            request: the request received by the request CB
+            reply: the reply message
+
+        Returns: an error message if any
+        """
+        if not reply.get_header(MessageHeaderKey.RETURN_CODE):
+            reply.set_header(MessageHeaderKey.RETURN_CODE, ReturnCode.OK)
+
+        if request.get_header(StreamHeaderKey.STREAM_REQ_ID):
+            _send_stream_reply(self, request, reply, self.logger)
+            return ""
+
+        reply.add_headers(
+            {
+                MessageHeaderKey.CHANNEL: request.get_header(MessageHeaderKey.CHANNEL, ""),
+                MessageHeaderKey.TOPIC: request.get_header(MessageHeaderKey.TOPIC, ""),
+            }
+        )
+        return self.core_cell.send_reply(
+            reply,
+            to_cell=request.get_header(MessageHeaderKey.ORIGIN),
+            for_req_ids=[request.get_header(MessageHeaderKey.REQ_ID, "")],
+            secure=request.get_header(MessageHeaderKey.SECURE, False),
+            optional=request.get_header(MessageHeaderKey.OPTIONAL, False),
+        )
+
     def _register_request_cb(self, channel: str, topic: str, cb, *args, **kwargs):
         """
         Register a callback for handling request. The CB must follow request_cb_signature.
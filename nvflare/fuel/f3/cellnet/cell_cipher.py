@@ -13,6 +13,9 @@
 # limitations under the License.
 
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
 
 from cryptography.exceptions import InvalidKey, InvalidSignature
 from cryptography.hazmat.primitives import asymmetric, ciphers, hashes, padding
@@ -29,6 +32,24 @@ KEY_ENC_LENGTH = 256
 SIGNATURE_LENGTH = 256
 SIMPLE_HEADER_LENGTH = NONCE_LENGTH + KEY_ENC_LENGTH + SIGNATURE_LENGTH
 
+# Chunked AES-GCM mode
+GCM_NONCE_LENGTH = 12
+GCM_TAG_LENGTH = 16
+GCM_CHUNK_SIZE_STRUCT = struct.Struct(">I")
+GCM_AAD_STRUCT = struct.Struct(">QII")  # clear payload size, chunk size, chunk index
+GCM_HEADER_LENGTH = GCM_NONCE_LENGTH + KEY_ENC_LENGTH + SIGNATURE_LENGTH + GCM_CHUNK_SIZE_STRUCT.size
+DEFAULT_GCM_CHUNK_SIZE = 256 * 1024
+
+# update_into requires the output buffer to be this much larger than the input
+_UPDATE_INTO_EXTRA = 15
+
+BytesAlike = Union[bytes, bytearray, memoryview]
+
+
+class CipherMode:
+    CBC = "cbc"
+    GCM = "gcm"
+
 
 def get_hash(value):
     hash = hashes.Hash(hashes.SHA256())
@@ -114,6 +135,121 @@ def _sym_dec(k: bytes, n: bytes, m: bytes):
     return unpadder.update(plain_text) + unpadder.finalize()
 
 
+def _gcm_chunk_nonce(base_nonce: int, index: int) -> bytes:
+    return (base_nonce ^ index).to_bytes(GCM_NONCE_LENGTH, "big")
+
+
+def _gcm_encrypt_chunk(key: bytes, base_nonce: int, aad_prefix: tuple, index: int, data, out):
+    """Encrypt one chunk into out, which has room for the cipher text and the tag"""
+    encryptor = ciphers.Cipher(
+        ciphers.algorithms.AES(key), ciphers.modes.GCM(_gcm_chunk_nonce(base_nonce, index))
+    ).encryptor()
+    encryptor.authenticate_additional_data(GCM_AAD_STRUCT.pack(*aad_prefix, index))
+    encryptor.update_into(data, out)
+    encryptor.finalize()
+    out[len(data) : len(data) + GCM_TAG_LENGTH] = encryptor.tag
+
+
+def _gcm_decrypt_chunk(key: bytes, base_nonce: int, aad_prefix: tuple, index: int, data, tag: bytes, out):
+    """Decrypt one chunk into out and verify its tag. InvalidTag is raised if the chunk is not authentic."""
+    decryptor = ciphers.Cipher(
+        ciphers.algorithms.AES(key), ciphers.modes.GCM(_gcm_chunk_nonce(base_nonce, index), bytes(tag))
+    ).decryptor()
+    decryptor.authenticate_additional_data(GCM_AAD_STRUCT.pack(*aad_prefix, index))
+    decryptor.update_into(data, out)
+    decryptor.finalize()
+
+
+def _num_gcm_chunks(size: int, chunk_size: int) -> int:
+    # an empty payload still has one chunk, so it is authenticated
+    return max(1, (size + chunk_size - 1) // chunk_size)
+
+
+def _run_chunks(func, num_chunks: int, executor: Optional[ThreadPoolExecutor]):
+    if executor and num_chunks > 1:
+        # consume the results to raise the first error
+        for _ in executor.map(func, range(num_chunks)):
+            pass
+    else:
+        for i in range(num_chunks):
+            func(i)
+
+
+def _chunked_sym_enc(
+    k: bytes, header: bytes, m: BytesAlike, chunk_size: int, executor: Optional[ThreadPoolExecutor] = None
+) -> bytearray:
+    """Encrypt the message in AES-GCM chunks into a preallocated buffer.
+
+    The layout of the result is header | nonce | chunk_size | (cipher text | tag) of each chunk.
+    Each chunk is encrypted with its own nonce derived from the random nonce of the message, and authenticates
+    the message size, chunk size and its index, so chunks cannot be truncated, reordered or mixed.
+    """
+    m = memoryview(m).cast("B")
+    size = len(m)
+    num_chunks = _num_gcm_chunks(size, chunk_size)
+    nonce = os.urandom(GCM_NONCE_LENGTH)
+    base_nonce = int.from_bytes(nonce, "big")
+    aad_prefix = (size, chunk_size)
+
+    prefix = header + nonce + GCM_CHUNK_SIZE_STRUCT.pack(chunk_size)
+    body_start = len(prefix)
+    out = bytearray(body_start + size + num_chunks * GCM_TAG_LENGTH + _UPDATE_INTO_EXTRA)
+    out[:body_start] = prefix
+    out_view = memoryview(out)
+
+    def _encrypt(i):
+        start = i * chunk_size
+        end = min(start + chunk_size, size)
+        out_start = body_start + start + i * GCM_TAG_LENGTH
+        out_end = out_start + end - start + GCM_TAG_LENGTH + _UPDATE_INTO_EXTRA
+        _gcm_encrypt_chunk(k, base_nonce, aad_prefix, i, m[start:end], out_view[out_start:out_end])
+
+    _run_chunks(_encrypt, num_chunks, executor)
+    out_view.release()
+    del out[-_UPDATE_INTO_EXTRA:]
+    return out
+
+
+def _chunked_sym_dec(k: bytes, m: BytesAlike, executor: Optional[ThreadPoolExecutor] = None) -> memoryview:
+    """Decrypt the body (after the header) of a message encrypted by _chunked_sym_enc."""
+    m = memoryview(m).cast("B")
+    if len(m) < GCM_NONCE_LENGTH + GCM_CHUNK_SIZE_STRUCT.size + GCM_TAG_LENGTH:
+        raise ValueError(f"encrypted payload is too short: {len(m)} bytes")
+
+    base_nonce = int.from_bytes(m[:GCM_NONCE_LENGTH], "big")
+    (chunk_size,) = GCM_CHUNK_SIZE_STRUCT.unpack_from(m, GCM_NONCE_LENGTH)
+    if chunk_size <= 0:
+        raise ValueError(f"invalid chunk size {chunk_size}")
+
+    body = m[GCM_NONCE_LENGTH + GCM_CHUNK_SIZE_STRUCT.size :]
+    num_chunks = _num_gcm_chunks(len(body), chunk_size + GCM_TAG_LENGTH)
+    size = len(body) - num_chunks * GCM_TAG_LENGTH
+    if size < 0 or _num_gcm_chunks(size, chunk_size) != num_chunks:
+        raise ValueError(f"invalid encrypted payload size {len(body)} for chunk size {chunk_size}")
+
+    aad_prefix = (size, chunk_size)
+    out = bytearray(size + _UPDATE_INTO_EXTRA)
+    out_view = memoryview(out)
+
+    def _decrypt(i):
+        start = i * chunk_size
+        end = min(start + chunk_size, size)
+        in_start = start + i * GCM_TAG_LENGTH
+        in_end = in_start + end - start
+        _gcm_decrypt_chunk(
+            k,
+            base_nonce,
+            aad_prefix,
+            i,
+            body[in_start:in_end],
+            body[in_end : in_end + GCM_TAG_LENGTH],
+            out_view[start : end + _UPDATE_INTO_EXTRA],
+        )
+
+    _run_chunks(_decrypt, num_chunks, executor)
+    return out_view[:size]
+
+
 class SessionKeyManager:
     def __init__(self, root_ca):
         self.key_hash_dict = dict()
@@ -166,7 +302,27 @@ class SessionKeyManager:
 
 
 class SimpleCellCipher:
-    def __init__(self, root_ca: Certificate, pri_key: asymmetric.rsa.RSAPrivateKey, cert):
+    def __init__(
+        self,
+        root_ca: Certificate,
+        pri_key: asymmetric.rsa.RSAPrivateKey,
+        cert,
+        chunk_size: int = DEFAULT_GCM_CHUNK_SIZE,
+        num_threads: int = 1,
+    ):
+        """Encrypts and decrypts cell message payloads with session keys exchanged with certificates.
+
+        Args:
+            root_ca: the root CA certificate
+            pri_key: the private key of this cell
+            cert: the certificate (or certificate chain) of this cell
+            chunk_size: chunk size for the chunked AES-GCM mode
+            num_threads: number of threads to encrypt/decrypt the chunks of a payload in the chunked AES-GCM mode
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive but got {chunk_size}")
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(num_threads, thread_name_prefix="cell_cipher") if num_threads > 1 else None
         self._root_ca = root_ca
         self._root_ca_pub_key = root_ca.public_key()
         self._pri_key = pri_key
@@ -190,7 +346,7 @@ class SimpleCellCipher:
 
         return cert_chain[0]
 
-    def encrypt(self, message: bytes, target_cert):
+    def _get_enc_secret(self, target_cert):
         target_cert_chain = _normalize_cert_chain(target_cert)
         if not target_cert_chain:
             raise InvalidCertChain("cert chain must contain at least one certificate")
@@ -206,17 +362,30 @@ class SimpleCellCipher:
             self._cached_enc[cert_hash] = (key, key_enc, signature)
         else:
             (key, key_enc, signature) = secret
+        return key, key_enc, signature
+
+    def encrypt(self, message: bytes, target_cert):
+        key, key_enc, signature = self._get_enc_secret(target_cert)
         nonce = os.urandom(NONCE_LENGTH)
         ct = nonce + key_enc + signature + _sym_enc(key, nonce, message)
         return ct
 
-    def decrypt(self, message: bytes, origin_cert):
-        nonce, key_enc, signature = (
-            message[:NONCE_LENGTH],
-            message[NONCE_LENGTH : NONCE_LENGTH + KEY_ENC_LENGTH],
-            message[NONCE_LENGTH + KEY_ENC_LENGTH : SIMPLE_HEADER_LENGTH],
-        )
+    def encrypt_chunked(self, message: BytesAlike, target_cert) -> bytearray:
+        """Encrypt the message with chunked AES-GCM.
+
+        Unlike encrypt, the message can be any bytes-like object and is not copied or padded. The cipher text is
+        written into one preallocated buffer, and the chunks may be encrypted in parallel.
+
+        Args:
+            message: the message to be encrypted
+            target_cert: the certificate (or certificate chain) of the receiver
 
+        Returns: the encrypted message
+        """
+        key, key_enc, signature = self._get_enc_secret(target_cert)
+        return _chunked_sym_enc(key, key_enc + signature, message, self.chunk_size, self._executor)
+
+    def _get_dec_key(self, key_enc, signature, origin_cert):
         if not isinstance(key_enc, bytes):
             key_enc = bytes(key_enc)
 
@@ -230,4 +399,30 @@ class SimpleCellCipher:
             self._cached_dec[key_hash] = key
         else:
             key = dec
+        return key
+
+    def decrypt(self, message: bytes, origin_cert):
+        nonce, key_enc, signature = (
+            message[:NONCE_LENGTH],
+            message[NONCE_LENGTH : NONCE_LENGTH + KEY_ENC_LENGTH],
+            message[NONCE_LENGTH + KEY_ENC_LENGTH : SIMPLE_HEADER_LENGTH],
+        )
+        key = self._get_dec_key(key_enc, signature, origin_cert)
         return _sym_dec(key, nonce, message[SIMPLE_HEADER_LENGTH:])
+
+    def decrypt_chunked(self, message: BytesAlike, origin_cert) -> memoryview:
+        """Decrypt a message encrypted with encrypt_chunked.
+
+        Args:
+            message: the encrypted message
+            origin_cert: the certificate (or certificate chain) of the sender
+
+        Returns: the decrypted message
+
+        Raises: InvalidTag if the message is not authentic
+        """
+        message = memoryview(message).cast("B")
+        key_enc = message[:KEY_ENC_LENGTH]
+        signature = message[KEY_ENC_LENGTH : KEY_ENC_LENGTH + SIGNATURE_LENGTH]
+        key = self._get_dec_key(key_enc, signature, origin_cert)
+        return _chunked_sym_dec(key, message[KEY_ENC_LENGTH + SIGNATURE_LENGTH :], self._executor)
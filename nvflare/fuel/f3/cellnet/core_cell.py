@@ -23,6 +23,7 @@ from typing import Dict, List, Tuple, Union
 from urllib.parse import urlparse
 
 from nvflare.apis.fl_constant import ConnectionSecurity
+from nvflare.fuel.f3.cellnet.cell_cipher import CipherMode
 from nvflare.fuel.f3.cellnet.connector_manager import ConnectorManager
 from nvflare.fuel.f3.cellnet.credential_manager import CredentialManager
 from nvflare.fuel.f3.cellnet.defs import (
@@ -1033,23 +1034,28 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         if not target:
             raise RuntimeError("Message destination missing")
 
+        cipher_mode = self.credential_manager.cipher_mode
         if message.payload is None:
             message.payload = bytes(0)
         elif isinstance(message.payload, memoryview) or isinstance(message.payload, bytearray):
-            message.payload = bytes(message.payload)
+            # The chunked GCM cipher reads the buffer in place, there is no need to copy it
+            if cipher_mode != CipherMode.GCM:
+                message.payload = bytes(message.payload)
         elif not isinstance(message.payload, bytes):
             raise RuntimeError(f"Payload type of {type(message.payload)} is not supported.")
 
         payload_len = len(message.payload)
-        message.add_headers(
-            {
-                MessageHeaderKey.CLEAR_PAYLOAD_LEN: payload_len,
-                MessageHeaderKey.ENCRYPTED: True,
-            }
-        )
+        headers = {
+            MessageHeaderKey.CLEAR_PAYLOAD_LEN: payload_len,
+            MessageHeaderKey.ENCRYPTED: True,
+        }
+        if cipher_mode != CipherMode.CBC:
+            # Receivers without the header use CBC, so CBC messages can still be read by older peers
+            headers[MessageHeaderKey.CIPHER_MODE] = cipher_mode
+        message.add_headers(headers)
 
         target_cert = self.cert_ex.get_certificate(target)
-        message.payload = self.credential_manager.encrypt(target_cert, message.payload)
+        message.payload = self.credential_manager.encrypt(target_cert, message.payload, cipher_mode)
         self.logger.debug(f"Payload ({payload_len} bytes) is encrypted ({len(message.payload)} bytes)")
 
     def decrypt_payload(self, message: Message):
@@ -1063,6 +1069,8 @@ class CoreCell(MessageReceiver, EndpointMonitor):
             return
 
         message.remove_header(MessageHeaderKey.ENCRYPTED)
+        cipher_mode = message.get_header(MessageHeaderKey.CIPHER_MODE, CipherMode.CBC)
+        message.remove_header(MessageHeaderKey.CIPHER_MODE)
 
         origin = message.get_header(MessageHeaderKey.ORIGIN)
         if not origin:
@@ -1070,7 +1078,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
 
         payload_len = message.get_header(MessageHeaderKey.CLEAR_PAYLOAD_LEN)
         origin_cert = self.cert_ex.get_certificate(origin)
-        message.payload = self.credential_manager.decrypt(origin_cert, message.payload)
+        message.payload = self.credential_manager.decrypt(origin_cert, message.payload, cipher_mode)
         if len(message.payload) != payload_len:
             raise RuntimeError(f"Payload size changed after decryption {len(message.payload)} <> {payload_len}")
 
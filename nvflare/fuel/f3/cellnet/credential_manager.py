@@ -13,15 +13,17 @@
 # limitations under the License.
 import logging
 import threading
+from typing import Union
 
 from cryptography import x509
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from cryptography.x509 import Certificate
 
-from nvflare.fuel.f3.cellnet.cell_cipher import SimpleCellCipher
+from nvflare.fuel.f3.cellnet.cell_cipher import DEFAULT_GCM_CHUNK_SIZE, CipherMode, SimpleCellCipher
 from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
 from nvflare.fuel.f3.cellnet.identity import CellIdentityResolver, get_cert_common_name_from_pem
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
 from nvflare.fuel.f3.endpoint import Endpoint
 from nvflare.fuel.f3.message import Message
@@ -52,6 +54,13 @@ class CredentialManager:
         self.identity_resolver = identity_resolver if identity_resolver else CellIdentityResolver(local_endpoint.name)
         self.enforce_identity = enforce_identity
 
+        comm_configurator = CommConfigurator()
+        self.cipher_mode = comm_configurator.get_cell_cipher_mode(CipherMode.CBC).lower()
+        if self.cipher_mode not in (CipherMode.CBC, CipherMode.GCM):
+            raise ValueError(f"unsupported cell cipher mode '{self.cipher_mode}'")
+        self.cipher_chunk_size = comm_configurator.get_cell_cipher_chunk_size(DEFAULT_GCM_CHUNK_SIZE)
+        self.cipher_threads = comm_configurator.get_cell_cipher_threads(1)
+
         conn_props = self.local_endpoint.conn_props
         ca_cert_path = conn_props.get(DriverParams.CA_CERT)
         server_cert_path = conn_props.get(DriverParams.SERVER_CERT)
@@ -78,21 +87,33 @@ class CredentialManager:
             log.debug("Certificate is not configured, secure message is not supported")
             self.cell_cipher = None
         else:
-            self.cell_cipher = SimpleCellCipher(self.get_ca_cert(), self.get_local_key(), self.get_local_cert_chain())
+            self.cell_cipher = SimpleCellCipher(
+                self.get_ca_cert(),
+                self.get_local_key(),
+                self.get_local_cert_chain(),
+                chunk_size=self.cipher_chunk_size,
+                num_threads=self.cipher_threads,
+            )
 
-    def encrypt(self, target_cert: bytes, payload: bytes) -> bytes:
+    def encrypt(self, target_cert: bytes, payload: Union[bytes, bytearray, memoryview], mode: str = CipherMode.CBC):
 
         if not self.cell_cipher:
             raise RuntimeError("Secure message not supported, Cell not running in secure mode")
 
-        return self.cell_cipher.encrypt(payload, x509.load_pem_x509_certificates(target_cert))
+        target_cert_chain = x509.load_pem_x509_certificates(target_cert)
+        if mode == CipherMode.GCM:
+            return self.cell_cipher.encrypt_chunked(payload, target_cert_chain)
+        return self.cell_cipher.encrypt(payload, target_cert_chain)
 
-    def decrypt(self, origin_cert: bytes, cipher: bytes) -> bytes:
+    def decrypt(self, origin_cert: bytes, cipher: Union[bytes, bytearray, memoryview], mode: str = CipherMode.CBC):
 
         if not self.cell_cipher:
             raise RuntimeError("Secure message not supported, Cell not running in secure mode")
 
-        return self.cell_cipher.decrypt(cipher, x509.load_pem_x509_certificates(origin_cert))
+        origin_cert_chain = x509.load_pem_x509_certificates(origin_cert)
+        if mode == CipherMode.GCM:
+            return self.cell_cipher.decrypt_chunked(cipher, origin_cert_chain)
+        return self.cell_cipher.decrypt(cipher, origin_cert_chain)
 
     def get_certificate(self, fqcn: str) -> bytes:
         if not self.cell_cipher:
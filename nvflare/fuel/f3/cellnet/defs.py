@@ -44,6 +44,7 @@ class MessageHeaderKey:
     PAYLOAD_LEN = CELLNET_PREFIX + "payload_len"
     CLEAR_PAYLOAD_LEN = CELLNET_PREFIX + "clear_payload_len"
     ENCRYPTED = CELLNET_PREFIX + "encrypted"
+    CIPHER_MODE = CELLNET_PREFIX + "cipher_mode"
     OPTIONAL = CELLNET_PREFIX + "optional"
     MSG_ROOT_ID = CELLNET_PREFIX + "msg_root_id"
     MSG_ROOT_TTL = CELLNET_PREFIX + "msg_root_ttl"
@@ -65,6 +66,7 @@ class MessagePropKey:
     ENDPOINT = CELLNET_PREFIX + "endpoint"
     COMMON_NAME = CELLNET_PREFIX + "common_name"
     FUTURES = CELLNET_PREFIX + "futures"
+    REPLY_DEFERRED = CELLNET_PREFIX + "reply_deferred"
 
 
 class Encoding:
@@ -50,6 +50,12 @@ class VarName:
     SFM_SEND_STALL_TIMEOUT = "sfm_send_stall_timeout"
     SFM_CLOSE_STALLED_CONNECTION = "sfm_close_stalled_connection"
     SFM_SEND_STALL_CONSECUTIVE_CHECKS = "sfm_send_stall_consecutive_checks"
+    SFM_FRAME_POOL_ENABLED = "sfm_frame_pool_enabled"
+    SFM_FRAME_POOL_MAX_BYTES = "sfm_frame_pool_max_bytes"
+    SFM_FRAME_POOL_MAX_BUFFER_SIZE = "sfm_frame_pool_max_buffer_size"
+    CELL_CIPHER_MODE = "cell_cipher_mode"
+    CELL_CIPHER_CHUNK_SIZE = "cell_cipher_chunk_size"
+    CELL_CIPHER_THREADS = "cell_cipher_threads"
 
 
 class CommConfigurator:
@@ -158,6 +164,24 @@ class CommConfigurator:
     def get_sfm_send_stall_consecutive_checks(self, default=3):
         return ConfigService.get_int_var(VarName.SFM_SEND_STALL_CONSECUTIVE_CHECKS, self.config, default=default)
 
+    def get_sfm_frame_pool_enabled(self, default=True):
+        return ConfigService.get_bool_var(VarName.SFM_FRAME_POOL_ENABLED, self.config, default=default)
+
+    def get_sfm_frame_pool_max_bytes(self, default):
+        return ConfigService.get_int_var(VarName.SFM_FRAME_POOL_MAX_BYTES, self.config, default=default)
+
+    def get_sfm_frame_pool_max_buffer_size(self, default):
+        return ConfigService.get_int_var(VarName.SFM_FRAME_POOL_MAX_BUFFER_SIZE, self.config, default=default)
+
+    def get_cell_cipher_mode(self, default):
+        return ConfigService.get_str_var(VarName.CELL_CIPHER_MODE, self.config, default=default)
+
+    def get_cell_cipher_chunk_size(self, default):
+        return ConfigService.get_int_var(VarName.CELL_CIPHER_CHUNK_SIZE, self.config, default=default)
+
+    def get_cell_cipher_threads(self, default=1):
+        return ConfigService.get_int_var(VarName.CELL_CIPHER_THREADS, self.config, default=default)
+
     def get_int_var(self, name: str, default=None):
         return ConfigService.get_int_var(name, self.config, default=default)
 
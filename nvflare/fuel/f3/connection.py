@@ -15,7 +15,7 @@ import logging
 import threading
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Union
+from typing import List, Union
 
 from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo, Mode
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
@@ -93,6 +93,21 @@ class Connection(ABC):
         """
         pass
 
+    def send_frame_parts(self, parts: List[BytesAlike]):
+        """Send a SFM frame that is given as a list of buffers (prefix, headers, payload).
+
+        The buffers are sent back-to-back as one frame. Drivers that can write multiple buffers
+        at once (e.g. with sendmsg) should override this method to avoid assembling the frame
+        in a new buffer. The default implementation joins the parts and calls send_frame.
+
+        Args:
+            parts: The buffers that make up the frame, in order
+
+        Raises:
+            CommError: If any error happens while sending the frame
+        """
+        self.send_frame(b"".join(parts))
+
     def register_frame_receiver(self, receiver: FrameReceiver):
         """Register frame receiver
 
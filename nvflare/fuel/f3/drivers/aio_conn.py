@@ -13,6 +13,7 @@
 # limitations under the License.
 import logging
 from asyncio import CancelledError, IncompleteReadError, StreamReader, StreamWriter
+from typing import List
 
 from nvflare.fuel.f3.comm_error import CommError
 from nvflare.fuel.f3.connection import BytesAlike, Connection
@@ -20,6 +21,7 @@ from nvflare.fuel.f3.drivers.aio_context import AioContext
 from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
 from nvflare.fuel.f3.drivers.net_utils import MAX_FRAME_SIZE
+from nvflare.fuel.f3.sfm.frame_pool import get_frame_pool
 from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
 from nvflare.fuel.hci.security import get_certificate_common_name
 from nvflare.security.logging import secure_format_exception
@@ -43,6 +45,7 @@ class AioConnection(Connection):
         self.closing = False
         self.secure = secure
         self.conn_props = self._get_aio_properties()
+        self.frame_pool = get_frame_pool()
 
     def get_conn_properties(self) -> dict:
         return self.conn_props
@@ -62,6 +65,12 @@ class AioConnection(Connection):
         except Exception as ex:
             log.error(f"Error calling send coroutine for connection {self}: {secure_format_exception(ex)}")
 
+    def send_frame_parts(self, parts: List[BytesAlike]):
+        try:
+            self.aio_ctx.run_coro(self._async_send_frame_parts(parts))
+        except Exception as ex:
+            log.error(f"Error calling send coroutine for connection {self}: {secure_format_exception(ex)}")
+
     async def read_loop(self):
         try:
             while not self.closing:
@@ -87,6 +96,15 @@ class AioConnection(Connection):
             if not self.closing:
                 log.error(f"Error sending frame for connection {self}: {secure_format_exception(ex)}")
 
+    async def _async_send_frame_parts(self, parts: List[BytesAlike]):
+        try:
+            # writelines lets the transport gather the buffers without building a frame first
+            self.writer.writelines(parts)
+            await self.writer.drain()
+        except Exception as ex:
+            if not self.closing:
+                log.error(f"Error sending frame for connection {self}: {secure_format_exception(ex)}")
+
     async def _async_read_frame(self):
 
         prefix_buf = await self.reader.readexactly(PREFIX_LEN)
@@ -102,9 +120,22 @@ class AioConnection(Connection):
         if prefix.length > MAX_FRAME_SIZE:
             raise CommError(CommError.BAD_DATA, f"Frame exceeds limit ({prefix.length} > {MAX_FRAME_SIZE}")
 
-        remaining = await self.reader.readexactly(prefix.length - PREFIX_LEN)
-
-        return prefix_buf + remaining
+        if not self.frame_pool:
+            remaining = await self.reader.readexactly(prefix.length - PREFIX_LEN)
+            return prefix_buf + remaining
+
+        # Copy the data into a pooled buffer as it arrives instead of assembling the frame from a full-size read
+        frame = self.frame_pool.acquire(prefix.length)
+        frame[0:PREFIX_LEN] = prefix_buf
+        offset = PREFIX_LEN
+        while offset < prefix.length:
+            data = await self.reader.read(prefix.length - offset)
+            if not data:
+                raise IncompleteReadError(bytes(frame[:offset]), prefix.length)
+            frame[offset : offset + len(data)] = data
+            offset += len(data)
+
+        return frame
 
     def _get_aio_properties(self) -> dict:
 
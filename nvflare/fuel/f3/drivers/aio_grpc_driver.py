@@ -118,7 +118,7 @@ class AioStreamSession(Connection):
         try:
             AioStreamSession.seq_num += 1
             seq = AioStreamSession.seq_num
-            f = Frame(seq=seq, data=bytes(frame))
+            f = Frame(seq=seq, data=frame if isinstance(frame, bytes) else bytes(frame))
             self.aio_ctx.run_coro(self.oq.put(f))
         except Exception as ex:
             self.logger.debug(f"exception send_frame: {self}: {secure_format_exception(ex)}")
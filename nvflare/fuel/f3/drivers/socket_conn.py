@@ -15,9 +15,10 @@ import errno
 import logging
 import select
 import socket
+import ssl
 import time
 from socketserver import BaseRequestHandler
-from typing import Any, Union
+from typing import Any, List, Union
 
 from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.comm_error import CommError
@@ -25,6 +26,7 @@ from nvflare.fuel.f3.connection import BytesAlike, Connection
 from nvflare.fuel.f3.drivers.driver import ConnectorInfo
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
 from nvflare.fuel.f3.drivers.net_utils import MAX_FRAME_SIZE
+from nvflare.fuel.f3.sfm.frame_pool import get_frame_pool
 from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
 from nvflare.fuel.hci.security import get_certificate_common_name
 from nvflare.security.logging import secure_format_exception
@@ -40,6 +42,9 @@ class SocketConnection(Connection):
         self.closing = False
         self.conn_props = self._get_socket_properties()
         self.send_timeout = CommConfigurator().get_streaming_send_timeout(30.0)
+        # SSL sockets don't support sendmsg so the frame parts are written one by one
+        self.vectored = hasattr(sock, "sendmsg") and not isinstance(sock, ssl.SSLSocket)
+        self.frame_pool = get_frame_pool()
 
     def get_conn_properties(self) -> dict:
         return self.conn_props
@@ -56,8 +61,11 @@ class SocketConnection(Connection):
             self.sock.close()
 
     def send_frame(self, frame: BytesAlike):
+        self.send_frame_parts([frame])
+
+    def send_frame_parts(self, parts: List[BytesAlike]):
         try:
-            self._send_with_timeout(frame, self.send_timeout)
+            self._send_with_timeout(parts, self.send_timeout)
         except CommError as error:
             if not self.closing:
                 # A send timeout may occur after partial bytes are already written to the stream.
@@ -101,17 +109,30 @@ class SocketConnection(Connection):
 
         return False
 
-    def _send_with_timeout(self, frame: BytesAlike, timeout_sec: float):
-        view = frame if isinstance(frame, memoryview) else memoryview(frame)
+    def _send_with_timeout(self, parts: List[BytesAlike], timeout_sec: float):
         deadline = time.monotonic() + timeout_sec
-        while view:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                raise CommError(CommError.TIMEOUT, f"send_frame timeout after {timeout_sec} seconds on {self.name}")
+        if len(parts) == 1:
+            frame = parts[0]
+            self._send_view(frame if isinstance(frame, memoryview) else memoryview(frame), deadline, timeout_sec)
+        elif self.vectored:
+            self._send_views(parts, deadline, timeout_sec)
+        else:
+            # Prefix and headers are small, combine them so they don't go out as separate records
+            self._send_view(memoryview(b"".join(parts[:-1])), deadline, timeout_sec)
+            self._send_view(memoryview(parts[-1]), deadline, timeout_sec)
 
-            _, writable, _ = select.select([], [self.sock], [], remaining)
-            if not writable:
-                raise CommError(CommError.TIMEOUT, f"send_frame timeout after {timeout_sec} seconds on {self.name}")
+    def _wait_writable(self, deadline: float, timeout_sec: float):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise CommError(CommError.TIMEOUT, f"send_frame timeout after {timeout_sec} seconds on {self.name}")
+
+        _, writable, _ = select.select([], [self.sock], [], remaining)
+        if not writable:
+            raise CommError(CommError.TIMEOUT, f"send_frame timeout after {timeout_sec} seconds on {self.name}")
+
+    def _send_view(self, view: memoryview, deadline: float, timeout_sec: float):
+        while view:
+            self._wait_writable(deadline, timeout_sec)
 
             sent = self.sock.send(view)
             if sent <= 0:
@@ -119,6 +140,24 @@ class SocketConnection(Connection):
 
             view = view[sent:]
 
+    def _send_views(self, buffers: List[BytesAlike], deadline: float, timeout_sec: float):
+        """Send all buffers with scatter/gather I/O, no frame buffer is assembled"""
+        views = [memoryview(b).cast("B") for b in buffers if len(b)]
+        while views:
+            self._wait_writable(deadline, timeout_sec)
+
+            sent = self.sock.sendmsg(views)
+            if sent <= 0:
+                raise CommError(CommError.CLOSED, f"Connection {self.name} is closed while sending")
+
+            # Drop the fully sent buffers and trim the partially sent one
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+
+            if sent:
+                views[0] = views[0][sent:]
+
     def read_loop(self):
         try:
             self.read_frame_loop()
@@ -154,7 +193,8 @@ class SocketConnection(Connection):
         if prefix.length > MAX_FRAME_SIZE:
             raise CommError(CommError.BAD_DATA, f"Frame exceeds limit ({prefix.length} > {MAX_FRAME_SIZE}")
 
-        frame = bytearray(prefix.length)
+        # Pooled buffers are released by ConnManager after the frame is processed
+        frame = self.frame_pool.acquire(prefix.length) if self.frame_pool else bytearray(prefix.length)
         frame[0:PREFIX_LEN] = prefix_buf
         self.read_into(frame, PREFIX_LEN, prefix.length - PREFIX_LEN)
 
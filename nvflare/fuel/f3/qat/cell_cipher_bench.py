@@ -0,0 +1,87 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import time
+
+from nvflare.fuel.f3.cellnet.cell_cipher import DEFAULT_GCM_CHUNK_SIZE, SimpleCellCipher
+from nvflare.lighter.utils import Identity, generate_cert, generate_keys
+
+"""
+This tool compares the throughput of encrypting and decrypting secure cell message payloads with the
+AES-CBC cipher and the chunked AES-GCM cipher.
+
+    -s: payload size in MB. Default 64.
+    -n: number of payloads to encrypt and decrypt. Default 5.
+    -c: chunk size in KB of the GCM cipher. Default 256.
+    -t: comma-separated numbers of threads of the GCM cipher. Default 1,4.
+
+For reference, the tool also prints the throughput of copying the payload. For each cipher, the tool prints
+the throughput in MB/s of encryption and decryption.
+"""
+
+
+def _make_cipher(chunk_size: int, num_threads: int):
+    root_key, root_pub_key = generate_keys()
+    root_cert = generate_cert(Identity("root"), Identity("root"), root_key, root_pub_key, ca=True)
+    key, pub_key = generate_keys()
+    cert = generate_cert(Identity("site"), Identity("root"), root_key, pub_key)
+    return SimpleCellCipher(root_cert, key, cert, chunk_size=chunk_size, num_threads=num_threads), cert
+
+
+def _time(func, count: int):
+    # the first call exchanges and caches the session key
+    result = func()
+    start = time.perf_counter()
+    for _ in range(count):
+        result = func()
+    return time.perf_counter() - start, result
+
+
+def _report(name: str, size: int, count: int, enc_time: float, dec_time: float):
+    mb = size * count / (1024 * 1024)
+    print(f"{name:>16}: encrypt={mb / enc_time:9.1f} MB/s  decrypt={mb / dec_time:9.1f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", "-s", type=float, help="payload size in MB", required=False, default=64)
+    parser.add_argument("--num", "-n", type=int, help="number of payloads", required=False, default=5)
+    parser.add_argument(
+        "--chunk", "-c", type=int, help="chunk size in KB", required=False, default=DEFAULT_GCM_CHUNK_SIZE // 1024
+    )
+    parser.add_argument("--threads", "-t", type=str, help="numbers of threads", required=False, default="1,4")
+    args = parser.parse_args()
+
+    size = int(args.size * 1024 * 1024)
+    payload = os.urandom(size)
+
+    copy_time, _ = _time(lambda: bytes(bytearray(payload)), args.num)
+    print(f"{'copy':>16}: {size * args.num / (1024 * 1024) / copy_time:9.1f} MB/s")
+
+    cipher, cert = _make_cipher(args.chunk * 1024, 1)
+    enc_time, encrypted = _time(lambda: cipher.encrypt(payload, cert), args.num)
+    dec_time, _ = _time(lambda: cipher.decrypt(encrypted, cert), args.num)
+    _report("cbc", size, args.num, enc_time, dec_time)
+
+    for num_threads in [int(t) for t in args.threads.split(",")]:
+        cipher, cert = _make_cipher(args.chunk * 1024, num_threads)
+        enc_time, encrypted = _time(lambda: cipher.encrypt_chunked(payload, cert), args.num)
+        dec_time, _ = _time(lambda: cipher.decrypt_chunked(encrypted, cert), args.num)
+        _report(f"gcm {num_threads} threads", size, args.num, enc_time, dec_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import socket
+import threading
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import psutil
+
+from nvflare.fuel.f3.drivers.connector_info import Mode
+from nvflare.fuel.f3.drivers.socket_conn import SocketConnection
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
+from nvflare.fuel.f3.sfm.sfm_conn import SfmConnection
+
+"""
+This tool compares the throughput and memory usage of sending SFM frames over a local socket pair
+with the legacy path (frame assembled in a new buffer) and the vectored path (prefix, headers and
+payload sent with sendmsg without assembling the frame).
+
+    -s: payload size in MB of each frame. Default 2.
+    -n: number of frames to send. Default 500.
+
+For each mode, the tool prints the throughput in MB/s, the peak memory allocated by Python during
+the run and the RSS growth of the process.
+"""
+
+
+class LegacySfmConnection(SfmConnection):
+    """SfmConnection that assembles each frame in a new buffer like the old implementation"""
+
+    def send_frame(self, prefix: Prefix, headers, payload):
+        headers_bytes = self.headers_to_bytes(headers)
+        header_len = len(headers_bytes) if headers_bytes else 0
+
+        length = PREFIX_LEN + header_len + len(payload)
+        prefix.length = length
+        prefix.header_len = header_len
+        prefix.sequence = self.next_sequence()
+
+        buffer = bytearray(length)
+        prefix.to_buffer(buffer, 0)
+        offset = PREFIX_LEN
+        if headers_bytes:
+            buffer[offset:] = headers_bytes
+            offset += header_len
+        buffer[offset:] = payload
+
+        with self.lock:
+            self.conn.send_frame(buffer)
+
+
+def _drain(sock: socket.socket, total: int, done: threading.Event):
+    buf = bytearray(1024 * 1024)
+    received = 0
+    while received < total:
+        n = sock.recv_into(buf)
+        if n == 0:
+            break
+        received += n
+    done.set()
+
+
+def _run(mode: str, payload: bytes, count: int) -> dict:
+    sender, receiver = socket.socketpair()
+    connector = SimpleNamespace(mode=Mode.ACTIVE)
+    conn = SocketConnection(sender, connector)
+    sfm_class = LegacySfmConnection if mode == "legacy" else SfmConnection
+    sfm_conn = sfm_class(conn, Endpoint("bench"))
+    headers = {"bench": mode}
+
+    # Each frame carries prefix and headers on top of the payload
+    frame_len = PREFIX_LEN + len(SfmConnection.headers_to_bytes(headers)) + len(payload)
+    done = threading.Event()
+    reader = threading.Thread(target=_drain, args=(receiver, frame_len * count, done), daemon=True)
+    reader.start()
+
+    process = psutil.Process()
+    rss_start = process.memory_info().rss
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(count):
+        sfm_conn.send_data(1, i & 0xFFFF, headers, payload)
+    done.wait()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_growth = process.memory_info().rss - rss_start
+
+    sender.close()
+    receiver.close()
+
+    mb = len(payload) * count / (1024 * 1024)
+    return {
+        "mode": mode,
+        "mb_per_sec": mb / duration,
+        "peak_alloc_mb": peak / (1024 * 1024),
+        "rss_growth_mb": rss_growth / (1024 * 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", "-s", type=float, help="payload size in MB", required=False, default=2)
+    parser.add_argument("--num_frames", "-n", type=int, help="number of frames", required=False, default=500)
+    args = parser.parse_args()
+
+    payload = bytes(int(args.size * 1024 * 1024))
+    for mode in ("legacy", "vectored"):
+        result = _run(mode, payload, args.num_frames)
+        print(
+            f"{mode:>8}: {result['mb_per_sec']:10.1f} MB/s  "
+            f"peak_alloc={result['peak_alloc_mb']:8.2f} MB  "
+            f"rss_growth={result['rss_growth_mb']:8.2f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
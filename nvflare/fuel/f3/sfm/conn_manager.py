@@ -31,6 +31,7 @@ from nvflare.fuel.f3.drivers.net_utils import ssl_required
 from nvflare.fuel.f3.endpoint import Endpoint, EndpointMonitor, EndpointState
 from nvflare.fuel.f3.message import Message, MessageReceiver
 from nvflare.fuel.f3.sfm.constants import HandshakeKeys, Types
+from nvflare.fuel.f3.sfm.frame_pool import get_frame_pool
 from nvflare.fuel.f3.sfm.heartbeat_monitor import HeartbeatMonitor
 from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
 from nvflare.fuel.f3.sfm.sfm_conn import SfmConnection
@@ -97,6 +98,7 @@ class ConnManager(ConnMonitor):
                 "sfm_send_frame", "SFM send_frame time in secs", scope=local_endpoint.name
             )
         self.send_frame_stats = stats
+        self.frame_pool = get_frame_pool()
         self.heartbeat_monitor = HeartbeatMonitor(self.sfm_conns)
 
     def add_connector(self, driver: Driver, params: dict, mode: Mode) -> str:
@@ -339,10 +341,11 @@ class ConnManager(ConnMonitor):
 
     def process_frame_task(self, sfm_conn: SfmConnection, frame: BytesAlike):
 
-        if self.stopped:
-            return
-
         try:
+            if self.stopped:
+                # the pooled frame buffer is still released below
+                return
+
             prefix = Prefix.from_bytes(frame)
             log.debug(f"Received frame: {prefix} on {sfm_conn.conn}")
 
@@ -364,6 +367,7 @@ class ConnManager(ConnMonitor):
                 # No action is needed for PONG. The last_activity is already updated
             elif prefix.type == Types.DATA:
                 if prefix.length > PREFIX_LEN + prefix.header_len:
+                    # For pooled frames, this is a view of the buffer, which the pool doesn't reuse while it's alive
                     payload = frame[PREFIX_LEN + prefix.header_len :]
                 else:
                     payload = None
@@ -375,6 +379,9 @@ class ConnManager(ConnMonitor):
                 else:
                     log.debug(f"No receiver registered for App ID {prefix.app_id}, message ignored")
 
+                # Drop the local references, so the buffer can be reused right away if the receiver is done with it
+                message = payload = None
+
             else:
                 log.error(f"Received unsupported frame type {prefix.type} on {sfm_conn.get_name()}")
         except RuntimeError as ex:
@@ -386,6 +393,9 @@ class ConnManager(ConnMonitor):
         except Exception as ex:
             log.error(f"Error processing frame: {secure_format_exception(ex)}")
             log.debug(secure_format_traceback())
+        finally:
+            if self.frame_pool:
+                self.frame_pool.release(frame)
 
     def process_frame(self, sfm_conn: SfmConnection, frame: BytesAlike):
         if self.stopped:
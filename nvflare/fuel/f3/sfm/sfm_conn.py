@@ -131,18 +131,16 @@ class SfmConnection:
         prefix.header_len = header_len
         prefix.sequence = self.next_sequence()
 
-        buffer: bytearray = bytearray(length)
-
-        offset = 0
-        prefix.to_buffer(buffer, offset)
-        offset += PREFIX_LEN
+        # The frame is sent as a list of buffers so the payload is never copied into a frame buffer.
+        prefix_buf = bytearray(PREFIX_LEN)
+        prefix.to_buffer(prefix_buf, 0)
+        parts = [prefix_buf]
 
         if headers_bytes:
-            buffer[offset:] = headers_bytes
-            offset += header_len
+            parts.append(headers_bytes)
 
         if payload:
-            buffer[offset:] = payload
+            parts.append(payload)
 
         log.debug(f"Sending frame: {prefix} on {self.conn}")
         # Only one thread can send data on a connection. Otherwise, the frames may interleave.
@@ -150,7 +148,7 @@ class SfmConnection:
             with self.send_state_lock:
                 self.send_started_at = time.monotonic()
             try:
-                self.conn.send_frame(buffer)
+                self.conn.send_frame_parts(parts)
             finally:
                 with self.send_state_lock:
                     self.send_started_at = 0.0
@@ -0,0 +1,186 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ranged items for streaming objects that are larger than the chunk size.
+
+A CacheableObject always sends at least one whole item per chunk, so an object that is much larger than the chunk
+size (e.g. a big embedding matrix) would be fully serialized by the sender and fully buffered by the receiver.
+Instead, such an object can be sent as multiple ranged items, each carrying one byte range of the object's
+contiguous buffer and a small header that describes the object.
+
+The layout of a ranged item is:
+
+    MAGIC (6 bytes) | header_len (4 bytes, big-endian) | msgpack header | data
+
+The header is [key, meta, total_size, start]. The meta is defined by the producer of the items (e.g. dtype and
+shape) and is used by the receiver to allocate the destination once, on the first range of the object.
+"""
+
+import bisect
+import struct
+from typing import Any, Callable, Dict, List, Tuple
+
+import msgpack
+
+from nvflare.fuel.utils.validation_utils import check_positive_int
+
+MAGIC = b"NVRNG1"
+
+_LEN_STRUCT = struct.Struct(">I")
+_PREAMBLE_LEN = len(MAGIC) + _LEN_STRUCT.size
+
+# An allocator is called with the key, meta and total size of an object, and returns the destination object and
+# a writer that is called with (start, data) to write each range into the destination.
+Allocator = Callable[[str, Any, int], Tuple[Any, Callable]]
+
+
+def split_ranges(total_size: int, range_size: int) -> List[Tuple[int, int]]:
+    """Split the total size into consecutive byte ranges.
+
+    Args:
+        total_size: total number of bytes
+        range_size: max number of bytes of each range
+
+    Returns: list of (start, end) of the ranges
+    """
+    check_positive_int("range_size", range_size)
+    return [(start, min(start + range_size, total_size)) for start in range(0, total_size, range_size)]
+
+
+def encode_ranged_item(key: str, meta: Any, total_size: int, start: int, data) -> bytes:
+    """Encode one range of an object into a ranged item.
+
+    Args:
+        key: key of the object
+        meta: msgpack-able description of the object used by the receiver to allocate the destination
+        total_size: total number of bytes of the object
+        start: offset of the range in the object's buffer
+        data: bytes-like data of the range
+
+    Returns: the encoded item
+    """
+    header = msgpack.packb([key, meta, total_size, start])
+    return b"".join([MAGIC, _LEN_STRUCT.pack(len(header)), header, data])
+
+
+def is_ranged_item(item) -> bool:
+    """Check whether the item is a ranged item.
+
+    Args:
+        item: the received item
+
+    Returns: whether the item starts with the ranged item magic
+    """
+    return len(item) >= _PREAMBLE_LEN and bytes(item[: len(MAGIC)]) == MAGIC
+
+
+def decode_ranged_item(item) -> Tuple[str, Any, int, int, memoryview]:
+    """Decode a ranged item.
+
+    Args:
+        item: the ranged item
+
+    Returns: tuple of (key, meta, total_size, start, data), where data is a memoryview of the item
+    """
+    if not is_ranged_item(item):
+        raise ValueError("item is not a ranged item")
+
+    (header_len,) = _LEN_STRUCT.unpack_from(item, len(MAGIC))
+    data_start = _PREAMBLE_LEN + header_len
+    key, meta, total_size, start = msgpack.unpackb(item[_PREAMBLE_LEN:data_start])
+    data = memoryview(item)[data_start:]
+    if start < 0 or start + len(data) > total_size:
+        raise ValueError(f"range [{start}, {start + len(data)}) of '{key}' exceeds total size {total_size}")
+    return key, meta, total_size, start, data
+
+
+class _Coverage:
+    """The byte ranges of an object that have been received, kept as sorted, disjoint and merged intervals."""
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.size = 0
+
+    def add(self, start: int, end: int) -> bool:
+        """Add the range [start, end). Returns False if it overlaps with a received range."""
+        i = bisect.bisect_right(self.starts, start)
+        if (i > 0 and self.ends[i - 1] > start) or (i < len(self.starts) and self.starts[i] < end):
+            return False
+
+        self.size += end - start
+        if i > 0 and self.ends[i - 1] == start:
+            # extends the previous interval
+            i -= 1
+            self.ends[i] = end
+        else:
+            self.starts.insert(i, start)
+            self.ends.insert(i, end)
+
+        if i + 1 < len(self.starts) and self.starts[i + 1] == end:
+            # joins the next interval
+            self.ends[i] = self.ends.pop(i + 1)
+            self.starts.pop(i + 1)
+        return True
+
+
+class RangedItemAssembler:
+    """Assembles ranged items into destination objects on the receiving side.
+
+    The destination of an object is allocated when its first range is received, and each range is written into
+    the destination right away, so the receiver never buffers more than one range of the object. The received
+    ranges of each object are tracked: a range that overlaps with a received one (e.g. a duplicate) is rejected,
+    and an object is complete only when all of its bytes are covered.
+    """
+
+    def __init__(self):
+        # key => [destination, writer, total_size, coverage]
+        self.pending: Dict[str, list] = {}
+
+    def add(self, item, allocator: Allocator) -> Tuple[str, Any]:
+        """Add a ranged item.
+
+        Args:
+            item: the ranged item
+            allocator: called to allocate the destination for the first range of an object
+
+        Returns: tuple of (key, destination) if the object is complete; (key, None) otherwise
+        """
+        key, meta, total_size, start, data = decode_ranged_item(item)
+        if not data:
+            raise ValueError(f"empty range at {start} of '{key}'")
+
+        entry = self.pending.get(key)
+        if entry is None:
+            dest, writer = allocator(key, meta, total_size)
+            entry = [dest, writer, total_size, _Coverage()]
+            self.pending[key] = entry
+        elif entry[2] != total_size:
+            raise ValueError(f"inconsistent total size of '{key}': {total_size} vs {entry[2]}")
+
+        dest, writer, _, coverage = entry
+        end = start + len(data)
+        if not coverage.add(start, end):
+            raise ValueError(f"range [{start}, {end}) of '{key}' overlaps with a received range")
+
+        writer(start, data)
+        if coverage.size < total_size:
+            return key, None
+
+        self.pending.pop(key)
+        return key, dest
+
+    def incomplete_keys(self) -> List[str]:
+        """Get the keys of objects that have not received all of their ranges."""
+        return list(self.pending.keys())
@@ -39,6 +39,7 @@ BUILTIN_DECOMPOSERS: set[str] = {
     "nvflare.fuel.utils.fobs.decomposer.EnumTypeDecomposer",
     "nvflare.fuel.utils.fobs.decomposers.core_decomposers.DatetimeDecomposer",
     "nvflare.fuel.utils.fobs.decomposers.core_decomposers.OrderedDictDecomposer",
+    "nvflare.fuel.utils.fobs.decomposers.core_decomposers.PreEncodedDecomposer",
     "nvflare.fuel.utils.fobs.decomposers.core_decomposers.SetDecomposer",
     "nvflare.fuel.utils.fobs.decomposers.core_decomposers.TupleDecomposer",
 }
@@ -69,6 +70,7 @@ BUILTIN_TYPES: set[str] = {
     "nvflare.apis.shareable.Shareable",
     "nvflare.app_common.abstract.learnable.Learnable",
     "nvflare.app_common.abstract.model.ModelLearnable",
+    "nvflare.fuel.utils.fobs.pre_encoded.PreEncoded",
     # --- Data classes registered in flare_decomposers.py ---
     "nvflare.apis.client.Client",
     "nvflare.apis.fl_snapshot.RunSnapshot",
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Decomposers for Python builtin objects."""
+import copy
 from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
 from nvflare.fuel.utils.fobs.datum import DatumManager
 from nvflare.fuel.utils.fobs.decomposer import Decomposer
+from nvflare.fuel.utils.fobs.lobs import load_from_bytes
+from nvflare.fuel.utils.fobs.pre_encoded import PreEncoded
 
 
 class TupleDecomposer(Decomposer):
@@ -62,3 +65,16 @@ class DatetimeDecomposer(Decomposer):
 
     def recompose(self, data: Any, manager: DatumManager = None) -> datetime:
         return datetime.fromisoformat(data)
+
+
+class PreEncodedDecomposer(Decomposer):
+    def supported_type(self):
+        return PreEncoded
+
+    def decompose(self, target: PreEncoded, manager: DatumManager = None) -> Any:
+        return target.data
+
+    def recompose(self, data: Any, manager: DatumManager = None) -> Any:
+        # the encoded object has its own datums: keep their state out of the context of the enclosing object
+        fobs_ctx = copy.copy(manager.fobs_ctx) if manager else None
+        return load_from_bytes(data, fobs_ctx=fobs_ctx)
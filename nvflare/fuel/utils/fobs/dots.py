@@ -22,3 +22,4 @@ NUMPY_DOWNLOAD = 3
 TENSOR_BYTES = 4
 TENSOR_FILE = 5
 TENSOR_DOWNLOAD = 6
+NUMPY_RAW_DOWNLOAD = 7
@@ -13,6 +13,7 @@
 # limitations under the License.
 import io
 import os.path
+import stat
 import struct
 import uuid
 from typing import Any, BinaryIO, Optional, Union
@@ -34,6 +35,7 @@ MARKER_DATUM_FILE = 103
 
 DATUM_ID_LEN = 16
 MAX_BYTES_PER_READ = 1024 * 1024  # 1MB
+MAX_BYTES_PER_COPY = 64 * 1024 * 1024  # 64MB, for kernel copies between files
 
 DATUM_DIR_CONFIG_VAR = "datum_dir"
 
@@ -69,6 +71,85 @@ def _write_datum_header(stream: BinaryIO, marker, dot, datum_id: str, value_size
     stream.write(datum_id_bytes)
 
 
+def _get_file_no(stream) -> Optional[int]:
+    """Get the file descriptor of the stream if it is a seekable regular file.
+
+    Args:
+        stream: the stream
+
+    Returns: the file descriptor, or None if the stream is not a regular file (e.g. BytesIO or a socket)
+    """
+    try:
+        if not stream.seekable():
+            return None
+        fd = stream.fileno()
+        if stat.S_ISREG(os.fstat(fd).st_mode):
+            return fd
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is both OSError and ValueError
+        pass
+    return None
+
+
+def _copy_file_range(src_fd: int, src_offset: int, dst_fd: int, size: int) -> int:
+    """Copy data between files in the kernel, without reading it into memory.
+
+    The data is written at the current position of dst_fd.
+
+    Returns: number of bytes copied, which is less than size if the copy is not supported
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    copied = 0
+    while copied < size:
+        count = min(size - copied, MAX_BYTES_PER_COPY)
+        try:
+            if copy_range:
+                n = copy_range(src_fd, dst_fd, count, src_offset + copied)
+            else:
+                n = os.sendfile(dst_fd, src_fd, src_offset + copied, count)
+        except OSError:
+            # not supported between these files (e.g. different file systems on old kernels)
+            break
+
+        if n <= 0:
+            break
+        copied += n
+    return copied
+
+
+def _copy_stream(src: BinaryIO, dst: BinaryIO, size: int):
+    """Copy size bytes from the current position of the src stream to the dst stream.
+
+    If both streams are regular files, the data is copied by the kernel. Otherwise, it is copied in windows of
+    MAX_BYTES_PER_READ bytes, so no more than one window is in memory at any time.
+
+    Args:
+        src: the stream to copy from
+        dst: the stream to copy to
+        size: number of bytes to copy
+    """
+    src_fd = _get_file_no(src)
+    dst_fd = _get_file_no(dst)
+    if src_fd is not None and dst_fd is not None:
+        dst.flush()
+        src_offset = src.tell()
+        dst_offset = dst.tell()
+        os.lseek(dst_fd, dst_offset, os.SEEK_SET)
+        copied = _copy_file_range(src_fd, src_offset, dst_fd, size)
+
+        # sync the positions of the streams with the data copied by the kernel
+        src.seek(src_offset + copied)
+        dst.seek(dst_offset + copied)
+        size -= copied
+
+    while size > 0:
+        data = src.read(min(size, MAX_BYTES_PER_READ))
+        if not data:
+            raise RuntimeError(f"expect {size} more bytes but got none")
+        dst.write(data)
+        size -= len(data)
+
+
 def dump_to_stream(obj: Any, stream: BinaryIO, max_value_size=None, fobs_ctx: Optional[dict] = None):
     """
     Serialize the specified object to a stream of bytes. If the object contains any datums, they will be included
@@ -78,6 +159,10 @@ def dump_to_stream(obj: Any, stream: BinaryIO, max_value_size=None, fobs_ctx: Op
     - the 1st section is the main body (serialized with fobs/msgpack) of the object
     - if the object contains large binary data, they will be converted to datums, and each datum has one section
 
+    File datums are copied into the stream in bounded windows (or by the kernel if the stream is a regular file), so
+    their data is never held in memory as a whole. BLOB and TEXT datums are held in memory by the object already and
+    are written from their values (TEXT values are encoded to utf-8 first).
+
     During serialization, large values are represented by datum references in the serialized main body. The input
     object is not modified.
 
@@ -121,11 +206,7 @@ def dump_to_stream(obj: Any, stream: BinaryIO, max_value_size=None, fobs_ctx: Op
             file_size = os.path.getsize(file_path)
             _write_datum_header(stream, MARKER_DATUM_FILE, datum.dot, datum_id, file_size)
             with open(file_path, "rb") as f:
-                while True:
-                    bytes_read = f.read(MAX_BYTES_PER_READ)
-                    if not bytes_read:
-                        break
-                    stream.write(bytes_read)
+                _copy_stream(f, stream, file_size)
 
 
 def _get_datum_id(stream: BinaryIO, header: _Header):
@@ -158,21 +239,21 @@ def _get_datum_id(stream: BinaryIO, header: _Header):
     return str(uuid.UUID(uuid_str))  # this str version has "-" between parts
 
 
-def _get_one_section(stream: BinaryIO, expect_datum: bool):
+def _get_section_header(stream: BinaryIO, expect_datum: bool):
     """
-    Get one data section from the stream. A section represents a complete item: the main body of the serialized object
-    or a Datum.
+    Get the header of the next data section from the stream. The stream is positioned at the start of the section
+    data after the call.
 
     Args:
         stream: the stream that contains the data
         expect_datum: whether the section is expected to be a Datum.
 
-    Returns: a tuple of (header, datum_id, data_bytes)
+    Returns: a tuple of (header, datum_id); (None, None) if there are no more sections
 
     """
     buf = stream.read(HEADER_LEN)
     if not buf:
-        return None, None, None
+        return None, None
 
     if len(buf) != HEADER_LEN:
         raise RuntimeError(f"cannot get {HEADER_LEN} header bytes")
@@ -191,15 +272,60 @@ def _get_one_section(stream: BinaryIO, expect_datum: bool):
     datum_id = None
     if expect_datum:
         datum_id = _get_datum_id(stream, header)
+    return header, datum_id
 
-    data = stream.read(header.size)
-    if not data:
-        raise RuntimeError(f"cannot get {header.size} data bytes")
 
-    if len(data) != header.size:
-        raise RuntimeError(f"expect {header.size} bytes but got {len(data)}")
+def _read_section_data(stream: BinaryIO, header: _Header):
+    """Read the data of the section into one buffer.
 
-    return header, datum_id, data
+    If the stream supports readinto, the data is read into a buffer of the section size in windows of
+    MAX_BYTES_PER_READ bytes, so no intermediate copies are made. Otherwise (e.g. BufListStream, which returns views
+    of its buffers), the data is read in one call.
+
+    Args:
+        stream: the stream that contains the data
+        header: the header of the section
+
+    Returns: the section data
+
+    """
+    readinto = getattr(stream, "readinto", None)
+    if not readinto:
+        data = stream.read(header.size)
+        if not data:
+            raise RuntimeError(f"cannot get {header.size} data bytes")
+
+        if len(data) != header.size:
+            raise RuntimeError(f"expect {header.size} bytes but got {len(data)}")
+        return data
+
+    data = bytearray(header.size)
+    received = 0
+    with memoryview(data) as view:
+        while received < header.size:
+            n = readinto(view[received : received + MAX_BYTES_PER_READ])
+            if not n:
+                raise RuntimeError(f"expect {header.size} bytes but got {received}")
+            received += n
+    return data
+
+
+def _get_one_section(stream: BinaryIO, expect_datum: bool):
+    """
+    Get one data section from the stream. A section represents a complete item: the main body of the serialized object
+    or a Datum.
+
+    Args:
+        stream: the stream that contains the data
+        expect_datum: whether the section is expected to be a Datum.
+
+    Returns: a tuple of (header, datum_id, data_bytes)
+
+    """
+    header, datum_id = _get_section_header(stream, expect_datum)
+    if not header:
+        return None, None, None
+    return header, datum_id, _read_section_data(stream, header)
 
 
 def get_datum_dir():
@@ -228,6 +354,12 @@ def load_from_stream(stream: BinaryIO, fobs_ctx: Optional[dict] = None):
     - The 1st section contains the main body of the object (serialized with fobs/msgpack)
     - Optionally, more datum sections follow, each representing a datum that is referenced in the main body.
 
+    File datums are copied from the stream into their files in bounded windows (or by the kernel if the stream is
+    a regular file), without reading the whole section into memory. The main body, BLOB and TEXT sections are read
+    in bounded windows into one buffer of the section size, which becomes the BLOB value (a bytearray instead of
+    bytes), so the value is not copied again. The value is still held in memory as a whole: large values that must
+    not be should be sent as file datums.
+
     Args:
         stream: the stream that contains data to be deserialized.
         fobs_ctx: contextual info for decomposers
@@ -244,7 +376,7 @@ def load_from_stream(stream: BinaryIO, fobs_ctx: Optional[dict] = None):
 
     # try to get datums
     while True:
-        header, datum_id, body = _get_one_section(stream, expect_datum=True)
+        header, datum_id = _get_section_header(stream, expect_datum=True)
         if not header:
             # all done
             break
@@ -252,16 +384,16 @@ def load_from_stream(stream: BinaryIO, fobs_ctx: Optional[dict] = None):
         assert isinstance(header, _Header)
         if header.marker == MARKER_DATUM_TEXT:
             # the body is utf-8 encoded bytes
-            text = body.decode("utf-8")
+            text = _read_section_data(stream, header).decode("utf-8")
             datum = Datum.text_datum(text, header.dot)
         elif header.marker == MARKER_DATUM_BLOB:
-            datum = Datum.blob_datum(body, header.dot)
+            datum = Datum.blob_datum(_read_section_data(stream, header), header.dot)
         else:
             # put the value in a file
             datum_dir = get_datum_dir()
             file_path = os.path.join(datum_dir, f"{datum_id}.dat")
             with open(file_path, "wb") as f:
-                f.write(body)
+                _copy_stream(stream, f, header.size)
             datum = Datum.file_datum(file_path, header.dot)
 
         datum.datum_id = datum_id
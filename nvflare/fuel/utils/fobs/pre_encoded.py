@@ -0,0 +1,44 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, Optional
+
+from nvflare.fuel.utils.fobs.lobs import dump_to_bytes
+
+
+class PreEncoded:
+    def __init__(self, data: bytes):
+        """An object that is already serialized with FOBS.
+
+        A PreEncoded object is serialized as its encoded bytes, so an object that is sent to many receivers can be
+        serialized only once. The receiver gets the original object, not the PreEncoded.
+
+        The receiver must have the builtin PreEncodedDecomposer to decode it: receivers of older versions cannot.
+        Only send PreEncoded objects to receivers that are known to have it.
+
+        Args:
+            data: the object serialized with fobs.dumps
+        """
+        self.data = data
+
+    @staticmethod
+    def encode(obj: Any, fobs_ctx: Optional[dict] = None) -> "PreEncoded":
+        """Serialize the object.
+
+        Args:
+            obj: the object to be serialized
+            fobs_ctx: contextual info for decomposers
+
+        Returns: a PreEncoded object
+        """
+        return PreEncoded(dump_to_bytes(obj, fobs_ctx=fobs_ctx))
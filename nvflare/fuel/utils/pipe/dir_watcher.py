@@ -0,0 +1,202 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Directory change notification for FilePipe.
+
+On Linux, the InotifyDirWatcher uses inotify to wait for files to be added to or removed from a directory, so the
+waiter is woken up as soon as the directory changes instead of polling it. The watcher is created with
+create_dir_watcher, which returns None when inotify is not available, in which case the caller should poll.
+
+Note that inotify does not report changes made by other hosts on network file systems.
+"""
+
+import ctypes
+import logging
+import os
+import select
+import sys
+import threading
+import time
+from ctypes import CDLL
+from functools import lru_cache
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# inotify constants from <sys/inotify.h>
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+_READ_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=1)
+def _get_libc() -> Optional[CDLL]:
+    """Get the libc handle with the inotify functions configured, or None if inotify is not available."""
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = CDLL(None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class InotifyDirWatcher:
+    def __init__(self, path: str):
+        """Watches a directory for files being added or removed.
+
+        Each change increments the generation of the watcher. To wait for the directory to change without missing
+        any change, a waiter gets the generation before checking the directory, and then calls wait_for_change with
+        that generation if the directory is not in the expected state.
+
+        Multiple threads may wait on the same watcher at the same time.
+
+        Args:
+            path: the directory to be watched. It must exist.
+        """
+        libc = _get_libc()
+        if not libc:
+            raise OSError("inotify is not available")
+
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+
+        if libc.inotify_add_watch(fd, os.fsencode(path), _WATCH_MASK) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed for {path}: {os.strerror(err)}")
+
+        self.path = path
+        self.generation = 0
+        self._fd = fd
+        # used to wake up the polling thread when the watcher is closed
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._cond = threading.Condition()
+        self._polling = False
+        self._closed = False
+
+    def wait_for_change(self, generation: int, timeout: Optional[float] = None) -> bool:
+        """Wait until the directory is changed after the specified generation, or timed out.
+
+        Args:
+            generation: the generation of the watcher when the caller last checked the directory
+            timeout: max number of seconds to wait. None means to wait until the directory is changed.
+
+        Returns:
+            whether the directory has changed. True is also returned if the watcher is closed.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while True:
+                if self.generation != generation or self._closed:
+                    return True
+
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+
+                if self._polling:
+                    # another thread is polling and will notify all waiters of the change
+                    self._cond.wait(remaining)
+                    continue
+
+                self._polling = True
+                changed = False
+                self._cond.release()
+                try:
+                    changed = self._poll(remaining)
+                finally:
+                    self._cond.acquire()
+                    self._polling = False
+                    if changed:
+                        self.generation += 1
+                    if self._closed:
+                        self._close_fds()
+                    self._cond.notify_all()
+
+    def _poll(self, timeout: Optional[float]) -> bool:
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wakeup_r, select.POLLIN)
+        if not poller.poll(None if timeout is None else max(int(timeout * 1000), 1)):
+            return False
+
+        # drain all pending events - only the fact that the directory changed matters
+        changed = False
+        while True:
+            try:
+                if not os.read(self._fd, _READ_SIZE):
+                    break
+                changed = True
+            except BlockingIOError:
+                break
+        return changed
+
+    def close(self):
+        """Close the watcher. Threads waiting on the watcher are woken up."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            if self._polling:
+                # the polling thread closes the fds when it's done polling
+                os.write(self._wakeup_w, b"x")
+            else:
+                self._close_fds()
+            self._cond.notify_all()
+
+    def _close_fds(self):
+        for fd in (self._fd, self._wakeup_r, self._wakeup_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd = self._wakeup_r = self._wakeup_w = -1
+
+
+def create_dir_watcher(path: str) -> Optional[InotifyDirWatcher]:
+    """Create a watcher for the directory.
+
+    Args:
+        path: the directory to be watched
+
+    Returns:
+        an InotifyDirWatcher, or None if inotify is not available (e.g. not on Linux, or the inotify limits are
+        reached), in which case the caller should poll the directory.
+    """
+    if not _get_libc():
+        return None
+
+    try:
+        return InotifyDirWatcher(path)
+    except OSError as e:
+        logger.debug(f"cannot watch {path} with inotify: {e}")
+        return None
@@ -15,10 +15,11 @@
 import os
 import shutil
 import time
-from typing import Tuple
+from typing import Dict, Tuple
 
 from nvflare.fuel.utils.attributes_exportable import ExportMode
 from nvflare.fuel.utils.constants import Mode
+from nvflare.fuel.utils.pipe.dir_watcher import InotifyDirWatcher, create_dir_watcher
 from nvflare.fuel.utils.pipe.file_accessor import FileAccessor
 from nvflare.fuel.utils.pipe.file_name_utils import file_name_to_message, message_to_file_name
 from nvflare.fuel.utils.pipe.fobs_file_accessor import FobsFileAccessor
@@ -27,7 +28,7 @@ from nvflare.fuel.utils.validation_utils import check_object_type, check_positiv
 
 
 class FilePipe(Pipe):
-    def __init__(self, mode: Mode, root_path: str, file_check_interval=0.1):
+    def __init__(self, mode: Mode, root_path: str, file_check_interval=0.1, use_inotify: bool = True):
         """Implementation of communication through the file system.
 
         Args:
@@ -36,6 +37,11 @@ class FilePipe(Pipe):
             root_path (str): root path for this file pipe, folders and files will be created under this root_path
                 for communication.
             file_check_interval (float): how often should to check the file exists.
+                When the pipe directories are watched with inotify, this is the max time to wait for a notification
+                before checking again, since changes made from another host (e.g. on NFS) are not notified.
+            use_inotify (bool): whether to use inotify to get notified of file changes instead of polling the pipe
+                directories. Falls back to polling if inotify is not available (e.g. not on Linux).
+                Set to False if the two endpoints are on different hosts sharing a network file system.
         """
         super().__init__(mode=mode)
         check_positive_number("file_check_interval", file_check_interval)
@@ -44,6 +50,8 @@ class FilePipe(Pipe):
         self._remove_root = False
         self.root_path = root_path
         self.file_check_interval = file_check_interval
+        self.use_inotify = use_inotify
+        self._watchers: Dict[str, InotifyDirWatcher] = {}
         self.pipe_path = None
         self.x_path = None
         self.y_path = None
@@ -101,11 +109,42 @@ class FilePipe(Pipe):
         if not os.path.exists(t_path):
             self._make_dir(t_path)
 
+        if self.use_inotify:
+            for p in (x_path, y_path):
+                if p not in self._watchers:
+                    watcher = create_dir_watcher(p)
+                    if watcher:
+                        self._watchers[p] = watcher
+
         self.pipe_path = pipe_path
         self.x_path = x_path
         self.y_path = y_path
         self.t_path = t_path
 
+    def _wait_for_change(self, path: str, generation, timeout):
+        """Wait for the directory to change, for at most the file check interval.
+
+        Args:
+            path: the directory
+            generation: the generation of the directory watcher before the directory was checked
+            timeout: max time to wait. None means no limit.
+        """
+        wait = self.file_check_interval
+        if timeout is not None:
+            wait = min(wait, timeout)
+
+        watcher = self._watchers.get(path)
+        if watcher and generation is not None:
+            # the watcher is closed when the pipe is closed, which wakes up the waiter.
+            # the wait is still capped since inotify misses changes made by other hosts on a network file system.
+            watcher.wait_for_change(generation, wait)
+        else:
+            time.sleep(wait)
+
+    def _get_generation(self, path: str):
+        watcher = self._watchers.get(path)
+        return watcher.generation if watcher else None
+
     @staticmethod
     def _clear_dir(p: str):
         file_list = os.listdir(p)
@@ -145,22 +184,28 @@ class FilePipe(Pipe):
         Returns:
             whether the file has been read and removed
         """
+        dir_path = os.path.dirname(file_path)
         start = time.time()
         while True:
             if not self.pipe_path:
                 raise BrokenPipeError("pipe broken")
 
+            generation = self._get_generation(dir_path)
             if not os.path.exists(file_path):
                 return True
-            if timeout and time.time() - start > timeout:
-                # timed out - try to delete the file
-                try:
-                    os.remove(file_path)
-                except FileNotFoundError:
-                    # the file is read by the peer!
-                    return True
-                return False
-            time.sleep(self.file_check_interval)
+
+            remaining = None
+            if timeout:
+                remaining = timeout - (time.time() - start)
+                if remaining < 0:
+                    # timed out - try to delete the file
+                    try:
+                        os.remove(file_path)
+                    except FileNotFoundError:
+                        # the file is read by the peer!
+                        return True
+                    return False
+            self._wait_for_change(dir_path, generation, remaining)
 
     def x_put(self, msg: Message, timeout) -> bool:
         """
@@ -233,14 +278,16 @@ class FilePipe(Pipe):
             return self._get_next(from_dir)
 
         start = time.time()
-        while True:
+        while self.pipe_path:
+            generation = self._get_generation(from_dir)
             msg = self._get_next(from_dir)
             if msg:
                 return msg
 
-            if time.time() - start >= timeout:
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
                 break
-            time.sleep(self.file_check_interval)
+            self._wait_for_change(from_dir, generation, remaining)
 
         return None
 
@@ -285,6 +332,10 @@ class FilePipe(Pipe):
     def close(self):
         pipe_path = self.pipe_path
         self.pipe_path = None
+        watchers = self._watchers
+        self._watchers = {}
+        for watcher in watchers.values():
+            watcher.close()
         if self.mode == Mode.PASSIVE:
             if pipe_path and os.path.exists(pipe_path):
                 shutil.rmtree(pipe_path, ignore_errors=True)
@@ -300,5 +351,10 @@ class FilePipe(Pipe):
         else:
             mode = Mode.ACTIVE if self.mode == Mode.PASSIVE else Mode.PASSIVE
 
-        export_args = {"mode": mode, "root_path": self.root_path}
+        export_args = {
+            "mode": mode,
+            "root_path": self.root_path,
+            "file_check_interval": self.file_check_interval,
+            "use_inotify": self.use_inotify,
+        }
         return f"{self.__module__}.{self.__class__.__name__}", export_args
@@ -342,8 +342,15 @@ class PipeHandler(object):
 
     def _try_read(self):
         self._last_heartbeat_received_time = time.time()
+        next_read_time = time.time() + self.read_interval
         while not self.asked_to_stop:
-            time.sleep(self.read_interval)
+            # Read at most once per read_interval. The pipe is asked to wait up to read_interval for a message,
+            # so pipes that are notified of new messages (e.g. CellPipe, FilePipe with inotify) return it right
+            # away and spend the idle time waiting in receive() instead of here.
+            delay = next_read_time - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            next_read_time = time.time() + self.read_interval
             if self.asked_to_stop:
                 break
             if self._pause:
@@ -358,7 +365,7 @@ class PipeHandler(object):
                 continue
 
             try:
-                msg = p.receive()
+                msg = p.receive(timeout=self.read_interval)
             except BrokenPipeError as e:
                 if not self.asked_to_stop:
                     self._add_message(
@@ -0,0 +1,306 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from nvflare.fuel.utils.attributes_exportable import ExportMode
+from nvflare.fuel.utils.constants import Mode
+from nvflare.fuel.utils.import_utils import optional_import
+from nvflare.fuel.utils.pipe.file_pipe import FilePipe
+from nvflare.fuel.utils.pipe.pipe import Message
+from nvflare.fuel.utils.validation_utils import check_positive_int
+
+# key of the dict that replaces an array placed in shared memory
+SHM_REF_KEY = "__nvflare_shm_ref__"
+
+_KIND_NUMPY = "np"
+_KIND_TORCH = "pt"
+_ALIGNMENT = 64
+_DEFAULT_SHM_ROOT = "/dev/shm"
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class _SegmentWriter:
+    """Collects the arrays of a message and writes them into one shared memory segment."""
+
+    def __init__(self, min_size: int):
+        self.min_size = min_size
+        self.size = 0
+        self.views = []
+        self.refs = []
+
+    def _add(self, view: np.ndarray, ref: dict) -> dict:
+        ref["offset"] = self.size
+        ref["nbytes"] = view.nbytes
+        self.size = _align(self.size + view.nbytes)
+        self.views.append(view)
+        self.refs.append(ref)
+        return {SHM_REF_KEY: ref}
+
+    def convert(self, value):
+        if isinstance(value, np.ndarray):
+            if value.nbytes < self.min_size or value.dtype.hasobject:
+                return value
+            if value.flags.f_contiguous and not value.flags.c_contiguous:
+                order = "F"
+                flat = value.T.reshape(-1)
+            else:
+                order = "C"
+                flat = np.ascontiguousarray(value).reshape(-1)
+            ref = {
+                "kind": _KIND_NUMPY,
+                "dtype": np.lib.format.dtype_to_descr(value.dtype),
+                "shape": list(value.shape),
+                "order": order,
+            }
+            return self._add(flat.view(np.uint8), ref)
+
+        torch = sys.modules.get("torch")
+        if torch is not None and isinstance(value, torch.Tensor):
+            if value.layout != torch.strided or value.is_sparse or value.requires_grad or value.device.type != "cpu":
+                # e.g. GPU tensors are left in the message, so they are not moved to the CPU without notice
+                return value
+            nbytes = value.numel() * value.element_size()
+            if nbytes < self.min_size:
+                return value
+            flat = value.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy()
+            ref = {"kind": _KIND_TORCH, "dtype": str(value.dtype).split(".")[-1], "shape": list(value.shape)}
+            return self._add(flat, ref)
+
+        if isinstance(value, dict):
+            result = None
+            for k, v in value.items():
+                new_v = self.convert(v)
+                if new_v is not v:
+                    if result is None:
+                        # shallow copy keeps the type (e.g. Shareable) and does not change the caller's data
+                        result = copy.copy(value)
+                    result[k] = new_v
+            return value if result is None else result
+
+        if type(value) in (list, tuple):
+            items = [self.convert(v) for v in value]
+            if any(new_v is not v for new_v, v in zip(items, value)):
+                return type(value)(items)
+        return value
+
+    def write(self, path: str):
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.ftruncate(fd, self.size)
+            with mmap.mmap(fd, self.size) as mm:
+                dest = np.frombuffer(mm, dtype=np.uint8)
+                for view, ref in zip(self.views, self.refs):
+                    dest[ref["offset"] : ref["offset"] + ref["nbytes"]] = view
+                del dest
+        finally:
+            os.close(fd)
+
+        for ref in self.refs:
+            ref["segment"] = path
+
+
+def _map_segment(path: str) -> mmap.mmap:
+    """Map the segment and remove its name. The memory is released when the last array over it is released."""
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        raise BrokenPipeError(f"shared memory segment {path} is gone")
+
+    try:
+        return mmap.mmap(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+
+def _check_segment(path, segment_prefix: str) -> str:
+    """Check that the segment is in a segment dir of the pipe, so the peer cannot have any other file mapped and
+    removed. Returns the resolved path of the segment.
+    """
+    if not isinstance(path, str):
+        raise ValueError(f"invalid shared memory segment {path!r}")
+    real_path = os.path.realpath(path)
+    segment_dir = os.path.dirname(real_path)
+    if os.path.dirname(segment_dir) != os.path.dirname(segment_prefix) or not os.path.basename(segment_dir).startswith(
+        os.path.basename(segment_prefix)
+    ):
+        raise ValueError(f"shared memory segment {path} is not in a segment dir of the pipe")
+    return real_path
+
+
+def _from_ref(ref: dict, segments: Dict[str, mmap.mmap], segment_prefix: str):
+    path = _check_segment(ref["segment"], segment_prefix)
+    mm = segments.get(path)
+    if mm is None:
+        mm = _map_segment(path)
+        segments[path] = mm
+
+    if ref["kind"] == _KIND_TORCH:
+        torch, ok = optional_import("torch")
+        if not ok:
+            raise RuntimeError("torch is required to receive tensors in shared memory")
+        dtype = getattr(torch, ref["dtype"])
+        count = ref["nbytes"] // torch.empty(0, dtype=dtype).element_size()
+        return torch.frombuffer(mm, dtype=dtype, count=count, offset=ref["offset"]).view(ref["shape"])
+
+    dtype = np.lib.format.descr_to_dtype(ref["dtype"])
+    arr = np.frombuffer(mm, dtype=dtype, count=ref["nbytes"] // dtype.itemsize, offset=ref["offset"])
+    return arr.reshape(ref["shape"], order=ref["order"])
+
+
+def _restore(value, segments: Dict[str, mmap.mmap], segment_prefix: str):
+    if isinstance(value, dict):
+        ref = value.get(SHM_REF_KEY)
+        if ref is not None and len(value) == 1:
+            return _from_ref(ref, segments, segment_prefix)
+        for k, v in value.items():
+            new_v = _restore(v, segments, segment_prefix)
+            if new_v is not v:
+                value[k] = new_v
+        return value
+
+    if type(value) is list:
+        for i, v in enumerate(value):
+            value[i] = _restore(v, segments, segment_prefix)
+    elif type(value) is tuple:
+        return tuple(_restore(v, segments, segment_prefix) for v in value)
+    return value
+
+
+class SharedMemoryPipe(FilePipe):
+    def __init__(
+        self,
+        mode: Mode,
+        root_path: str,
+        file_check_interval=0.1,
+        use_inotify: bool = True,
+        min_shm_size: int = 1024 * 1024,
+        shm_path: Optional[str] = None,
+    ):
+        """A FilePipe that passes large arrays and tensors through shared memory.
+
+        The numpy arrays and CPU torch tensors of at least min_shm_size bytes in the message data are written into
+        a shared memory segment, and are replaced with small references in the message that is sent through the
+        file pipe. The receiver maps the segment and creates the arrays and tensors over the mapped memory in place,
+        so the weights are neither serialized nor copied through the file system. Tensors that are not on the CPU
+        (e.g. on a GPU) are not placed in shared memory and are sent in the message as usual.
+
+        Arrays and tensors are found in the message data and its nested dicts (e.g. Shareable and DXO data),
+        lists and tuples. Both endpoints must be on the same host and run as the same user.
+
+        Args:
+            mode (Mode): Mode of the endpoint.
+            root_path (str): root path for the control files of the pipe.
+            file_check_interval (float): how often to check the control files, when not using inotify.
+            use_inotify (bool): whether to use inotify to get notified of control file changes.
+            min_shm_size (int): min number of bytes of an array or tensor to be placed in shared memory.
+            shm_path (str): directory for shared memory segments. Defaults to /dev/shm, or the temp dir if
+                /dev/shm does not exist.
+        """
+        super().__init__(
+            mode=mode, root_path=root_path, file_check_interval=file_check_interval, use_inotify=use_inotify
+        )
+        check_positive_int("min_shm_size", min_shm_size)
+        self.min_shm_size = min_shm_size
+        self.shm_path = shm_path
+        self._segment_dir = None
+        self._segment_prefix = None
+
+    def open(self, name: str):
+        super().open(name)
+        shm_root = self.shm_path
+        if not shm_root:
+            shm_root = _DEFAULT_SHM_ROOT if os.path.isdir(_DEFAULT_SHM_ROOT) else tempfile.gettempdir()
+
+        # segments sent by this endpoint; removed when the pipe is closed
+        prefix = f"nvflare_{name}_"
+        self._segment_dir = tempfile.mkdtemp(prefix=prefix, dir=shm_root)
+
+        # the segments received from the peer must be in its segment dir of the pipe
+        self._segment_prefix = os.path.join(os.path.realpath(shm_root), prefix)
+
+    def _export_arrays(self, data: Any) -> Tuple[Any, List[str]]:
+        writer = _SegmentWriter(self.min_shm_size)
+        new_data = writer.convert(data)
+        if not writer.refs:
+            return data, []
+
+        path = os.path.join(self._segment_dir, uuid.uuid4().hex)
+        writer.write(path)
+        return new_data, [path]
+
+    def send(self, msg: Message, timeout=None) -> bool:
+        if not self.pipe_path:
+            raise BrokenPipeError("pipe is not open")
+
+        data, segments = self._export_arrays(msg.data)
+        if segments:
+            msg = copy.copy(msg)
+            msg.data = data
+
+        sent = False
+        try:
+            sent = super().send(msg, timeout)
+            return sent
+        finally:
+            if not sent:
+                # the peer did not take the message - the segment is not going to be mapped
+                for path in segments:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+
+    def receive(self, timeout=None):
+        msg = super().receive(timeout)
+        if msg is not None and msg.data is not None:
+            msg.data = _restore(msg.data, {}, self._segment_prefix)
+        return msg
+
+    def close(self):
+        segment_dir = self._segment_dir
+        self._segment_dir = None
+        super().close()
+        if segment_dir:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+    def export(self, export_mode: str) -> Tuple[str, dict]:
+        if export_mode == ExportMode.SELF:
+            mode = self.mode
+        else:
+            mode = Mode.ACTIVE if self.mode == Mode.PASSIVE else Mode.PASSIVE
+
+        export_args = {
+            "mode": mode,
+            "root_path": self.root_path,
+            "file_check_interval": self.file_check_interval,
+            "use_inotify": self.use_inotify,
+            "min_shm_size": self.min_shm_size,
+        }
+        if self.shm_path:
+            export_args["shm_path"] = self.shm_path
+        return f"{self.__module__}.{self.__class__.__name__}", export_args
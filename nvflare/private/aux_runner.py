@@ -56,6 +56,8 @@ class AuxRunner(FLComponent):
     def __init__(self, engine):
         """To init the AuxRunner."""
         FLComponent.__init__(self)
+        # does not handle any events
+        self.subscribe_events([])
         self.engine = engine
         self.topic_table = {}  # topic => handler
         self.reg_lock = Lock()
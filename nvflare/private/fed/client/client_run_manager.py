@@ -27,7 +27,7 @@ from nvflare.fuel.f3.cellnet.defs import ReturnCode as CellReturnCode
 from nvflare.fuel.utils.job_utils import build_client_hierarchy
 from nvflare.fuel.utils.log_utils import get_obj_logger
 from nvflare.private.aux_runner import AuxMsgTarget, AuxRunner
-from nvflare.private.event import fire_event
+from nvflare.private.event import EventDispatcher
 from nvflare.private.fed.utils.fed_utils import create_job_processing_context_properties
 from nvflare.private.stream_runner import ObjectStreamer
 from nvflare.widgets.fed_event import ClientFedEventRunner
@@ -80,6 +80,7 @@ class ClientRunManager(ClientEngineExecutorSpec, StreamableEngine):
 
         self.client = client
         self.handlers = handlers
+        self.event_dispatcher = EventDispatcher(scope=job_id)
         self.workspace = workspace
         self.components = components
         self.aux_runner = AuxRunner(self)
@@ -201,7 +202,7 @@ class ClientRunManager(ClientEngineExecutorSpec, StreamableEngine):
         return self.widgets.get(widget_id)
 
     def fire_event(self, event_type: str, fl_ctx: FLContext):
-        fire_event(event=event_type, handlers=self.handlers, ctx=fl_ctx)
+        self.event_dispatcher.fire_event(event_type, self.handlers, fl_ctx)
 
     def add_handler(self, handler: FLComponent):
         self.handlers.append(handler)
@@ -17,7 +17,7 @@ from typing import List, Optional
 
 from nvflare.apis.event_type import EventType
 from nvflare.apis.filter import Filter
-from nvflare.apis.fl_constant import FLContextKey, FLMetaKey, ReservedKey
+from nvflare.apis.fl_constant import ConfigVarName, FLContextKey, FLMetaKey, ReservedKey
 from nvflare.apis.fl_constant import ReturnCode as ShareableRC
 from nvflare.apis.fl_constant import SecureTrainConst, ServerCommandKey, ServerCommandNames
 from nvflare.apis.fl_context import FLContext
@@ -32,6 +32,7 @@ from nvflare.fuel.f3.cellnet.fqcn import FQCN
 from nvflare.fuel.f3.cellnet.utils import format_size
 from nvflare.fuel.f3.message import Message as CellMessage
 from nvflare.fuel.sec.authn import set_add_auth_headers_filters
+from nvflare.fuel.utils.app_config_utils import get_positive_float_var
 from nvflare.fuel.utils.log_utils import get_obj_logger
 from nvflare.private.defs import (
     CellChannel,
@@ -92,6 +93,7 @@ class Communicator:
         self.engine = None
         self.last_task_id = None  # ID of the last task received
         self.pending_task = None  # the task currently being processed
+        self.long_poll_timeout = None  # how long the server may hold getTask requests; read from config when needed
         self.logger = get_obj_logger(self)
         self._state_lock = threading.Lock()
         tmp_ctx = FLContext()
@@ -377,6 +379,12 @@ class Communicator:
         if self.last_task_id:
             shareable.set_header(ServerCommandKey.LAST_TASK_ID, self.last_task_id)
 
+        if self.long_poll_timeout is None:
+            self.long_poll_timeout = get_positive_float_var(ConfigVarName.GET_TASK_LONG_POLL_TIMEOUT, 0.0)
+        if self.long_poll_timeout:
+            # the server may hold the request until a task is available; servers that don't support it reply now
+            shareable.set_header(ServerCommandKey.LONG_POLL_TIMEOUT, self.long_poll_timeout)
+
         task_message = new_cell_message(
             {
                 CellMessageHeaderKeys.PROJECT_NAME: project_name,
@@ -392,6 +400,7 @@ class Communicator:
             timeout = self.timeout
         else:
             timeout = max(timeout, self.timeout)
+        timeout += self.long_poll_timeout
 
         parent_fqcn = determine_parent_fqcn(self.client_config, fl_ctx)
         self.logger.debug(f"pulling task from parent FQCN: {parent_fqcn}")
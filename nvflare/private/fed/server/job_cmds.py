@@ -184,6 +184,13 @@ class JobCommandModule(CommandModule, CommandUtil, BinaryTransfer):
                     handler_func=self.list_jobs,
                     authz_func=self.command_authz_required,
                 ),
+                CommandSpec(
+                    name=AdminCommandNames.REBUILD_JOB_INDEX,
+                    description="rebuild the job index from the job store",
+                    usage=AdminCommandNames.REBUILD_JOB_INDEX,
+                    handler_func=self.rebuild_job_index,
+                    authz_func=self.must_be_project_admin,
+                ),
                 CommandSpec(
                     name=AdminCommandNames.GET_JOB_LOG,
                     description="get job log text from the server-side log store",
@@ -428,7 +435,7 @@ class JobCommandModule(CommandModule, CommandUtil, BinaryTransfer):
                         fl_ctx,
                     )
                 else:
-                    jobs = job_def_manager.get_all_jobs(fl_ctx)
+                    jobs = self._get_jobs_to_list(conn, job_def_manager, parsed_args, requested_study, fl_ctx)
             if jobs:
                 id_prefix = parsed_args.job_id
                 name_prefix = parsed_args.n
@@ -476,6 +483,47 @@ class JobCommandModule(CommandModule, CommandUtil, BinaryTransfer):
 
         conn.append_success("")
 
+    @staticmethod
+    def _get_jobs_to_list(conn: Connection, job_def_manager: JobDefManagerSpec, parsed_args, study: str, fl_ctx):
+        query_jobs = getattr(job_def_manager, "query_jobs", None)
+        if not callable(query_jobs):
+            return job_def_manager.get_all_jobs(fl_ctx)
+
+        # Let the job def manager apply the filters and the limit, so the metas of other jobs are not loaded.
+        # The newest jobs are selected either way, and the result is sorted by the caller.
+        return query_jobs(
+            fl_ctx,
+            submitter=(conn.get_prop(ConnProps.USER_NAME, "") or None) if parsed_args.u else None,
+            study=study,
+            job_id_prefix=parsed_args.job_id,
+            name_prefix=parsed_args.n,
+            newest_first=True,
+            limit=parsed_args.m if parsed_args.m and parsed_args.m > 0 else None,
+        )
+
+    def rebuild_job_index(self, conn: Connection, args: List[str]):
+        engine = conn.app_ctx
+        job_def_manager = engine.job_def_manager
+        rebuild_index = getattr(job_def_manager, "rebuild_index", None)
+        if not callable(rebuild_index):
+            conn.append_error(
+                "job_def_manager does not support job index",
+                meta=make_meta(MetaStatusValue.ERROR, "job index not supported"),
+            )
+            return
+
+        try:
+            with engine.new_context() as fl_ctx:
+                count = rebuild_index(fl_ctx)
+        except Exception as e:
+            conn.append_error(
+                f"exception occurred: {secure_format_exception(e)}",
+                meta=make_meta(MetaStatusValue.INTERNAL_ERROR, f"exception {type(e)}"),
+            )
+            return
+        conn.append_string(f"Job index rebuilt with {count} jobs.")
+        conn.append_success("")
+
     def delete_job(self, conn: Connection, args: List[str]):
         job = conn.get_prop(self.JOB)
         if not job:
@@ -22,7 +22,7 @@ from nvflare.apis.fl_context import FLContext, FLContextManager
 from nvflare.apis.server_engine_spec import ServerEngineSpec
 from nvflare.apis.workspace import Workspace
 from nvflare.private.aux_runner import AuxRunner
-from nvflare.private.event import fire_event
+from nvflare.private.event import EventDispatcher
 from nvflare.private.fed.utils.fed_utils import create_job_processing_context_properties
 from nvflare.private.stream_runner import ObjectStreamer
 
@@ -57,6 +57,7 @@ class RunManager(EngineSpec):
 
         self.client_manager = client_manager
         self.handlers = handlers
+        self.event_dispatcher = EventDispatcher(scope=job_id or server_name)
         self.aux_runner = AuxRunner(self)
         self.object_streamer = ObjectStreamer(self.aux_runner)
         self.add_handler(self.aux_runner)
@@ -101,7 +102,7 @@ class RunManager(EngineSpec):
         self.components[component_id] = component
 
     def fire_event(self, event_type: str, fl_ctx: FLContext):
-        fire_event(event=event_type, handlers=self.handlers, ctx=fl_ctx)
+        self.event_dispatcher.fire_event(event_type, self.handlers, fl_ctx)
 
     def add_handler(self, handler: FLComponent):
         self.handlers.append(handler)
@@ -12,14 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nvflare.apis.fl_constant import ServerCommandKey
+import functools
+
+from nvflare.apis.fl_constant import FLContextKey, ServerCommandKey, ServerCommandNames
+from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import ReservedHeaderKey, Shareable
 from nvflare.apis.utils.fl_context_utils import gen_new_peer_ctx
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.cellnet.core_cell import MessageHeaderKey, ReturnCode, make_reply
 from nvflare.fuel.f3.message import Message as CellMessage
 from nvflare.fuel.utils.log_utils import get_obj_logger
-from nvflare.private.defs import CellChannel, CellMessageHeaderKeys, new_cell_message
+from nvflare.private.defs import CellChannel, CellMessageHeaderKeys, SpecialTaskName, TaskConstant, new_cell_message
 
 from .server_commands import ServerCommands
 
@@ -83,24 +86,77 @@ class ServerCommandAgent(object):
                     if error:
                         return make_reply(ReturnCode.AUTHENTICATION_ERROR, error, None)
 
-                reply = command.process(data=data, fl_ctx=new_fl_ctx)
-                if reply is not None:
-                    return_message = new_cell_message({}, reply)
-                    return_message.set_header(MessageHeaderKey.RETURN_CODE, ReturnCode.OK)
-
-                    if isinstance(reply, Shareable):
-                        msg_root_id = reply.get_header(ReservedHeaderKey.MSG_ROOT_ID)
-                        msg_root_ttl = reply.get_header(ReservedHeaderKey.MSG_ROOT_TTL)
-                        if msg_root_id:
-                            return_message.set_header(MessageHeaderKey.MSG_ROOT_ID, msg_root_id)
-                        if msg_root_ttl:
-                            return_message.set_header(MessageHeaderKey.MSG_ROOT_TTL, msg_root_ttl)
+                long_poll_timeout = None
+                if command_name == ServerCommandNames.GET_TASK:
+                    long_poll_timeout = data.get_header(ServerCommandKey.LONG_POLL_TIMEOUT)
+                if long_poll_timeout:
+                    reply, parked = self._get_task(command, request, data, long_poll_timeout, new_fl_ctx)
+                    if parked:
+                        # the reply will be sent when a task is available
+                        return None
                 else:
-                    return_message = make_reply(ReturnCode.PROCESS_EXCEPTION, "No process results", None)
-                return return_message
+                    reply = command.process(data=data, fl_ctx=new_fl_ctx)
+                return self._make_reply_message(reply)
         else:
             return make_reply(ReturnCode.INVALID_REQUEST, "No server command found", None)
 
+    @staticmethod
+    def _make_reply_message(reply) -> CellMessage:
+        if reply is None:
+            return make_reply(ReturnCode.PROCESS_EXCEPTION, "No process results", None)
+
+        return_message = new_cell_message({}, reply)
+        return_message.set_header(MessageHeaderKey.RETURN_CODE, ReturnCode.OK)
+
+        if isinstance(reply, Shareable):
+            msg_root_id = reply.get_header(ReservedHeaderKey.MSG_ROOT_ID)
+            msg_root_ttl = reply.get_header(ReservedHeaderKey.MSG_ROOT_TTL)
+            if msg_root_id:
+                return_message.set_header(MessageHeaderKey.MSG_ROOT_ID, msg_root_id)
+            if msg_root_ttl:
+                return_message.set_header(MessageHeaderKey.MSG_ROOT_TTL, msg_root_ttl)
+        return return_message
+
+    def _get_task(self, command, request: CellMessage, data: Shareable, long_poll_timeout: float, fl_ctx: FLContext):
+        """Process a getTask request that allows the server to hold it until a task is available.
+
+        Returns: a tuple of the reply and whether the request is parked. The reply is None if the request is parked.
+        """
+        server_runner = fl_ctx.get_prop(FLContextKey.RUNNER)
+        parker = getattr(server_runner, "task_request_parker", None)
+        if not parker:
+            return command.process(data=data, fl_ctx=fl_ctx), False
+
+        # the peer context is replaced when the request is processed - keep it for processing the request again
+        peer_ctx = data.get_peer_context()
+        seq = parker.get_seq()
+        reply = command.process(data=data, fl_ctx=fl_ctx)
+        if reply is None:
+            return None, False
+
+        if reply.get_header(ServerCommandKey.TASK_NAME) != SpecialTaskName.TRY_AGAIN:
+            # the client waits for its next task here, not before asking for it
+            reply.set_header(TaskConstant.WAIT_TIME, 0.0)
+            return reply, False
+
+        client = data.get_header(ServerCommandKey.FL_CLIENT)
+        resume_cb = functools.partial(self._resume_get_task, command, request, data, peer_ctx)
+        # mark the request before parking it: it may be resumed and replied before park returns
+        self.cell.defer_reply(request)
+        if parker.park(client.name, resume_cb, float(long_poll_timeout), seq):
+            return None, True
+        return reply, False
+
+    def _resume_get_task(self, command, request: CellMessage, data: Shareable, peer_ctx):
+        data.set_peer_context(peer_ctx)
+        with self.engine.new_context() as fl_ctx:
+            reply = command.process(data=data, fl_ctx=fl_ctx)
+        if reply is not None:
+            reply.set_header(TaskConstant.WAIT_TIME, 0.0)
+        err = self.cell.reply_to_request(request, self._make_reply_message(reply))
+        if err:
+            self.logger.warning(f"failed to send task reply to {request.get_header(MessageHeaderKey.ORIGIN)}: {err}")
+
     def _get_client(self, token):
         fl_server = self.engine.server
         client_manager = fl_server.client_manager
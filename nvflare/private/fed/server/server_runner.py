@@ -15,20 +15,28 @@
 import threading
 import time
 
+import nvflare.fuel.utils.app_config_utils as acu
 from nvflare.apis.client import Client
 from nvflare.apis.event_type import EventType
+from nvflare.apis.filter import Filter
 from nvflare.apis.fl_component import FLComponent
-from nvflare.apis.fl_constant import FilterKey, FLContextKey, ReservedKey, ReservedTopic, ReturnCode
+from nvflare.apis.fl_constant import ConfigVarName, FilterKey, FLContextKey, ReservedKey, ReservedTopic, ReturnCode
 from nvflare.apis.fl_context import FLContext
+from nvflare.apis.impl.wf_comm_server import WFCommServer
 from nvflare.apis.server_engine_spec import ServerEngineSpec
-from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_reply
+from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_copy, make_reply
 from nvflare.apis.signal import Signal
 from nvflare.apis.utils.fl_context_utils import add_job_audit_event
 from nvflare.apis.utils.reliable_message import ReliableMessage
-from nvflare.apis.utils.task_utils import apply_filters
+from nvflare.apis.utils.task_utils import apply_filters, get_filters
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.cellnet.utils import new_cell_message
 from nvflare.fuel.f3.streaming.download_service import DownloadService
+from nvflare.fuel.utils.fobs import FOBSContextKey
 from nvflare.fuel.utils.job_utils import build_client_hierarchy
 from nvflare.private.defs import SpecialTaskName, TaskConstant
+from nvflare.private.fed.server.broadcast_payload_cache import BroadcastPayload, BroadcastPayloadCache, encode_content
+from nvflare.private.fed.server.task_request_parker import TaskRequestParker
 from nvflare.private.fed.tbi import TBI
 from nvflare.private.privacy_manager import Scope
 from nvflare.security.logging import secure_format_exception
@@ -106,6 +114,13 @@ class ServerRunner(TBI):
         # track tasks currently being processed (during filtering) to prevent duplicate assignments
         self._processing_tasks = {}  # client_name => task_id
         self._processing_tasks_lock = threading.Lock()  # protect _processing_tasks from race conditions
+        # getTask requests held until tasks are available for the clients
+        self.task_request_parker = TaskRequestParker(
+            max_parked=self.get_positive_int_var(ConfigVarName.MAX_PARKED_TASK_REQUESTS, 1000)
+        )
+        # opt-in: clients of older versions cannot decode the pre-encoded task data
+        self.broadcast_payload_cache_enabled = acu.get_bool_var(ConfigVarName.BROADCAST_PAYLOAD_CACHE, False)
+        self.broadcast_payload_cache = BroadcastPayloadCache(scope=job_id)
         self._register_aux_message_handler(engine)
 
     def _register_aux_message_handler(self, engine):
@@ -133,7 +148,10 @@ class ServerRunner(TBI):
 
                     fl_ctx.set_prop(FLContextKey.WORKFLOW, wf.id, sticky=True)
 
-                    wf.controller.communicator.initialize_run(fl_ctx)
+                    communicator = wf.controller.communicator
+                    if isinstance(communicator, WFCommServer):
+                        communicator.set_new_task_cb(self.task_request_parker.notify)
+                    communicator.initialize_run(fl_ctx)
                     wf.controller.initialize(fl_ctx)
 
                     self.log_info(fl_ctx, "Workflow {} ({}) started".format(wf.id, type(wf.controller)))
@@ -144,6 +162,7 @@ class ServerRunner(TBI):
                     with self.wf_lock:
                         # we only set self.current_wf to open for business after successful initialize_run!
                         self.current_wf = wf
+                    self.task_request_parker.notify()
 
                 with self.engine.new_context() as fl_ctx:
                     wf.controller.control_flow(self.abort_signal, fl_ctx)
@@ -203,6 +222,10 @@ class ServerRunner(TBI):
         finally:
             # use wf_lock to ensure state of current_wf!
             self.status = "done"
+
+            # parked task requests are answered with END_RUN
+            self.task_request_parker.close()
+            self.broadcast_payload_cache.clear()
             with self.wf_lock:
                 with self.engine.new_context() as fl_ctx:
                     self.fire_event(EventType.ABOUT_TO_END_RUN, fl_ctx)
@@ -323,21 +346,38 @@ class ServerRunner(TBI):
             with self._processing_tasks_lock:
                 self._processing_tasks[client.name] = task_id
 
+            # the data of a broadcast task is filtered and serialized only once for all its targets
+            payload = self._get_broadcast_payload(task_name, task_data, fl_ctx)
+            is_producer = False
+
             # filter task data
             self.log_debug(fl_ctx, "firing event EventType.BEFORE_TASK_DATA_FILTER")
             self.fire_event(EventType.BEFORE_TASK_DATA_FILTER, fl_ctx)
 
             try:
                 filter_name = Scope.TASK_DATA_FILTERS_NAME
-                task_data = apply_filters(
-                    filter_name, task_data, fl_ctx, self.config.task_data_filters, task_name, FilterKey.OUT
-                )
+                if payload:
+                    client_data = task_data
+                    filtered, is_producer = payload.get_filtered(
+                        lambda: apply_filters(
+                            filter_name, client_data, fl_ctx, self.config.task_data_filters, task_name, FilterKey.OUT
+                        )
+                    )
+                    task_data = make_copy(filtered)
+                    task_data.set_header(ReservedHeaderKey.TASK_ID, client_data.get_header(ReservedHeaderKey.TASK_ID))
+                    fl_ctx.set_prop(FLContextKey.TASK_DATA, value=task_data, private=True, sticky=False)
+                else:
+                    task_data = apply_filters(
+                        filter_name, task_data, fl_ctx, self.config.task_data_filters, task_name, FilterKey.OUT
+                    )
             except Exception as e:
                 self.log_exception(
                     fl_ctx,
                     "processing error in task data filter {}; "
                     "asked client to try again later".format(secure_format_exception(e)),
                 )
+                if is_producer:
+                    payload.set_content(None)
                 with self.wf_lock:
                     if self.current_wf:
                         self.current_wf.controller.communicator.handle_exception(task_id, fl_ctx)
@@ -347,7 +387,12 @@ class ServerRunner(TBI):
                 return self._task_try_again()
 
             self.log_debug(fl_ctx, "firing event EventType.AFTER_TASK_DATA_FILTER")
-            self.fire_event(EventType.AFTER_TASK_DATA_FILTER, fl_ctx)
+            try:
+                self.fire_event(EventType.AFTER_TASK_DATA_FILTER, fl_ctx)
+            finally:
+                # the producer must set the content even if the event fails, since other clients wait for it
+                if payload:
+                    self._use_broadcast_content(payload, is_producer, task_data, fl_ctx)
             self.log_info(fl_ctx, f"sent task assignment to client. client_name:{client.name} task_id:{task_id}")
 
             audit_event_id = add_job_audit_event(fl_ctx=fl_ctx, msg=f'sent task to client "{client.name}"')
@@ -369,6 +414,63 @@ class ServerRunner(TBI):
                 self._processing_tasks.pop(client.name, None)
             return self._task_try_again()
 
+    def _get_broadcast_payload(self, task_name: str, task_data: Shareable, fl_ctx: FLContext):
+        if not self.broadcast_payload_cache_enabled:
+            return None
+
+        targets = fl_ctx.get_prop(FLContextKey.BROADCAST_TASK_TARGETS)
+        msg_root_id = task_data.get_header(ReservedHeaderKey.MSG_ROOT_ID)
+        if targets is None or not msg_root_id:
+            return None
+
+        filters = get_filters(
+            Scope.TASK_DATA_FILTERS_NAME, fl_ctx, self.config.task_data_filters, task_name, FilterKey.OUT
+        )
+        for f in filters:
+            if not isinstance(f, Filter) or not f.is_client_independent():
+                # the data must be filtered for each client
+                return None
+
+        capacity = len(targets) if targets else len(self.engine.get_clients())
+        return self.broadcast_payload_cache.get_payload(msg_root_id, task_name, capacity)
+
+    def _use_broadcast_content(self, payload: BroadcastPayload, is_producer: bool, task_data: Shareable, fl_ctx):
+        """Replace the content of the task data with the serialized content of the payload."""
+        if is_producer:
+            content = None
+            try:
+                content = encode_content(task_data, self._get_broadcast_fobs_ctx(payload, task_data))
+            except Exception as e:
+                self.log_warning(
+                    fl_ctx,
+                    f"cannot serialize the data of broadcast task {payload.task_name}: {secure_format_exception(e)}; "
+                    "it will be serialized for each client",
+                )
+            finally:
+                payload.set_content(content)
+            hit = False
+        else:
+            content = payload.wait_content()
+            hit = content is not None
+
+        self.broadcast_payload_cache.record(payload, hit)
+        if content:
+            task_data.update(content)
+
+    def _get_broadcast_fobs_ctx(self, payload: BroadcastPayload, task_data: Shareable):
+        cell = self.engine.get_cell()
+        if not cell:
+            return None
+
+        # tensors are downloaded by all clients of the payload from one download transaction of the task
+        msg = new_cell_message(
+            {
+                MessageHeaderKey.MSG_ROOT_ID: task_data.get_header(ReservedHeaderKey.MSG_ROOT_ID),
+                MessageHeaderKey.MSG_ROOT_TTL: task_data.get_header(ReservedHeaderKey.MSG_ROOT_TTL),
+            }
+        )
+        return cell.get_fobs_context({FOBSContextKey.NUM_RECEIVERS: payload.capacity, FOBSContextKey.MESSAGE: msg})
+
     def _try_to_get_task(self, client, fl_ctx, timeout=None, retry_interval=0.005):
         start = time.time()
         while True:
@@ -114,6 +114,8 @@ class _ConsumerInfo:
 class ObjectStreamer(FLComponent):
     def __init__(self, aux_runner: AuxRunner):
         FLComponent.__init__(self)
+        # does not handle any events
+        self.subscribe_events([])
         self.aux_runner = aux_runner
         self.registry = Registry()
         self.tx_lock = Lock()
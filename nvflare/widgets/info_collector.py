@@ -62,6 +62,16 @@ class InfoCollector(Widget):
         super().__init__()
         self.categories = {}
         self.engine = None
+        self.subscribe_events(
+            [
+                EventType.START_RUN,
+                EventType.END_RUN,
+                EventType.CRITICAL_LOG_AVAILABLE,
+                EventType.ERROR_LOG_AVAILABLE,
+                EventType.WARNING_LOG_AVAILABLE,
+                EventType.EXCEPTION_LOG_AVAILABLE,
+            ]
+        )
 
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.START_RUN:
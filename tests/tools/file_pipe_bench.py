@@ -0,0 +1,108 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+
+from nvflare.fuel.utils.constants import Mode
+from nvflare.fuel.utils.pipe.file_pipe import FilePipe
+from nvflare.fuel.utils.pipe.pipe import Message
+
+"""
+This tool compares the round-trip latency of FilePipe when the pipe directories are polled and when
+they are watched with inotify.
+
+    -n: number of round trips for each message size. Default 50.
+    -s: comma-separated message sizes in KB. Default 1,16384.
+    -i: file check interval in seconds used when polling. Default 0.1.
+    -d: seconds to measure the CPU time of an idle receiver. Default 2.
+
+One endpoint sends a request and waits for the reply; the other endpoint receives the request and sends
+it back. For each mode and message size, the tool prints the median and p95 round-trip latency in ms.
+It also prints the CPU time used by a receiver waiting on an idle pipe.
+"""
+
+
+def _echo(pipe: FilePipe, count: int):
+    for _ in range(count):
+        req = None
+        while req is None:
+            req = pipe.receive(timeout=10.0)
+        pipe.send(Message.new_reply(req.topic, req.data, req.msg_id), timeout=10.0)
+
+
+def _round_trips(use_inotify: bool, size: int, count: int, interval: float) -> list:
+    with tempfile.TemporaryDirectory() as root:
+        passive = FilePipe(Mode.PASSIVE, root, file_check_interval=interval, use_inotify=use_inotify)
+        passive.open("bench")
+        active = FilePipe(Mode.ACTIVE, root, file_check_interval=interval, use_inotify=use_inotify)
+        active.open("bench")
+
+        echo = threading.Thread(target=_echo, args=(passive, count), daemon=True)
+        echo.start()
+
+        payload = bytes(size)
+        latencies = []
+        for _ in range(count):
+            start = time.perf_counter()
+            active.send(Message.new_request("bench", payload), timeout=10.0)
+            reply = None
+            while reply is None:
+                reply = active.receive(timeout=10.0)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        echo.join()
+        active.close()
+        passive.close()
+        return latencies
+
+
+def _idle_cpu(use_inotify: bool, duration: float, interval: float) -> float:
+    with tempfile.TemporaryDirectory() as root:
+        pipe = FilePipe(Mode.PASSIVE, root, file_check_interval=interval, use_inotify=use_inotify)
+        pipe.open("bench")
+        start = time.process_time()
+        pipe.receive(timeout=duration)
+        cpu = time.process_time() - start
+        pipe.close()
+        return cpu
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trips", "-n", type=int, help="number of round trips", required=False, default=50)
+    parser.add_argument("--sizes", "-s", type=str, help="message sizes in KB", required=False, default="1,16384")
+    parser.add_argument("--interval", "-i", type=float, help="file check interval", required=False, default=0.1)
+    parser.add_argument("--idle", "-d", type=float, help="idle seconds", required=False, default=2.0)
+    args = parser.parse_args()
+
+    sizes = [int(float(s) * 1024) for s in args.sizes.split(",")]
+    for use_inotify in (False, True):
+        mode = "inotify" if use_inotify else "polling"
+        for size in sizes:
+            latencies = sorted(_round_trips(use_inotify, size, args.num_trips, args.interval))
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(
+                f"{mode:>8}: size={size // 1024:>8} KB  "
+                f"median={statistics.median(latencies):9.3f} ms  p95={p95:9.3f} ms"
+            )
+        cpu = _idle_cpu(use_inotify, args.idle, args.interval)
+        print(f"{mode:>8}: idle receiver CPU time over {args.idle} secs = {cpu * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import time
+
+import numpy as np
+
+from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
+
+"""
+This tool compares the clear-text histogram aggregation of the label client of secure XGBoost, done per sample
+(with lists) and with NumPy (with arrays).
+
+    -d: path of the HIGGS csv file. The rows are read with the HIGGS data loader (needs pandas and xgboost).
+        Default: random data with the shape of HIGGS (28 features).
+    -n: number of rows. Default 1000000.
+    -b: number of bins per feature. Default 256.
+    -g: number of sample groups (tree nodes) the rows are split into. Default 4.
+    -f: number of features to aggregate. Default all.
+
+The gradient and hessian of each row are those of the logistic loss at the initial prediction 0.5, as fixed-point
+ints. For each implementation, the tool prints the time to aggregate all features for all groups, and checks that
+both give the same histograms.
+"""
+
+# fixed-point scale of the processor data converter
+_SCALE_FACTOR = 1000000.0
+
+
+def _load_features(data_path: str, num_rows: int):
+    if data_path:
+        from nvflare.app_opt.xgboost.higgs_data_loader import _read_higgs_with_pandas
+
+        x, y, _ = _read_higgs_with_pandas(data_path, 0, num_rows)
+        return x.to_numpy(), y.to_numpy()
+
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((num_rows, 28)), rng.integers(0, 2, num_rows).astype(float)
+
+
+def _bin_features(x: np.ndarray, num_bins: int) -> np.ndarray:
+    # quantile cuts, like the histogram method of XGBoost
+    bins = np.empty(x.shape, dtype=np.int64)
+    for i in range(x.shape[1]):
+        cuts = np.unique(np.quantile(x[:, i], np.linspace(0, 1, num_bins + 1)[1:-1]))
+        bins[:, i] = np.searchsorted(cuts, x[:, i])
+    return bins
+
+
+def _run(aggregator: Aggregator, g, h, masks, num_bins, groups):
+    result = []
+    for mask in masks:
+        for sample_ids in groups:
+            g_list = aggregator.aggregate(g, mask, num_bins, sample_ids)
+            h_list = aggregator.aggregate(h, mask, num_bins, sample_ids)
+            result.append((g_list, h_list))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data_path", "-d", type=str, default="")
+    parser.add_argument("--num_rows", "-n", type=int, default=1000000)
+    parser.add_argument("--num_bins", "-b", type=int, default=256)
+    parser.add_argument("--num_groups", "-g", type=int, default=4)
+    parser.add_argument("--num_features", "-f", type=int, default=0)
+    args = parser.parse_args()
+
+    x, y = _load_features(args.data_path, args.num_rows)
+    if args.num_features:
+        x = x[:, : args.num_features]
+    bins = _bin_features(x, args.num_bins)
+    num_rows, num_features = bins.shape
+
+    g = ((0.5 - y) * _SCALE_FACTOR).astype(np.int64)
+    h = np.full(num_rows, int(0.25 * _SCALE_FACTOR), dtype=np.int64)
+    groups = np.array_split(np.random.default_rng(1).permutation(num_rows), args.num_groups)
+    print(f"{num_rows} rows, {num_features} features, {args.num_bins} bins, {args.num_groups} groups")
+
+    aggregator = Aggregator()
+    masks = [bins[:, i] for i in range(num_features)]
+    start = time.perf_counter()
+    vectorized = _run(aggregator, g, h, masks, args.num_bins, groups)
+    vectorized_time = time.perf_counter() - start
+    print(f"numpy:      {vectorized_time:.3f} secs")
+
+    start = time.perf_counter()
+    per_item = _run(
+        aggregator,
+        g.tolist(),
+        h.tolist(),
+        [m.tolist() for m in masks],
+        args.num_bins,
+        [ids.tolist() for ids in groups],
+    )
+    per_item_time = time.perf_counter() - start
+    print(f"per sample: {per_item_time:.3f} secs")
+
+    if per_item != vectorized:
+        raise RuntimeError("the histograms are different")
+    print(f"same histograms; speedup: {per_item_time / vectorized_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -240,7 +240,7 @@ class TestController:
     RELAY = ["relay", "relay_and_wait"]
     ALL_APIS = NO_RELAY + RELAY
     # Non-broadcast methods - for tests where per-client data modification is needed
-    # (broadcast uses _broadcast_data which is copied before callbacks run)
+    # (broadcast uses _broadcast_data which is frozen before callbacks run)
     NON_BROADCAST = ["send", "send_and_wait", "relay", "relay_and_wait"]
 
     @pytest.fixture(autouse=True)
@@ -708,7 +708,7 @@ def clients_pull_and_submit_result(controller, ctx, clients, task_name):
 
 class TestCallback(TestController):
     # Note: before_task_sent_cb data modifications are captured only for the first client
-    # in broadcast because _broadcast_data (deep copy) is created after the first callback runs
+    # in broadcast because _broadcast_data (read-only view) is created after the first callback runs
     # and reused for all subsequent clients. Per-client data customization is not supported.
     @pytest.mark.parametrize("method", TestController.NON_BROADCAST)
     def test_before_task_sent_cb(self, method):
@@ -20,7 +20,7 @@ from unittest import mock
 
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.impl.job_def_manager import SimpleJobDefManager
-from nvflare.apis.job_def import JobMetaKey, job_from_meta
+from nvflare.apis.job_def import JobMetaKey, RunStatus, job_from_meta
 from nvflare.apis.storage import WORKSPACE, StorageException
 from nvflare.app_common.storages.filesystem_storage import FilesystemStorage
 from nvflare.fuel.utils.zip_utils import zip_directory_to_bytes
@@ -30,13 +30,17 @@ from nvflare.private.fed.server.job_meta_validator import JobMetaValidator
 class TestJobManager(unittest.TestCase):
     def setUp(self) -> None:
         dir_path = os.path.dirname(os.path.realpath(__file__))
-        self.uri_root = tempfile.mkdtemp()
+        # the submit records are kept beside the uri_root
+        self.root_dir = tempfile.mkdtemp()
+        self.uri_root = os.path.join(self.root_dir, "jobs")
         self.data_folder = os.path.join(dir_path, "../../data/jobs")
         self.job_manager = SimpleJobDefManager(uri_root=self.uri_root)
         self.fl_ctx = FLContext()
 
     def tearDown(self) -> None:
-        shutil.rmtree(self.uri_root)
+        if self.job_manager.job_index:
+            self.job_manager.job_index.close()
+        shutil.rmtree(self.root_dir)
 
     def test_create_job(self):
         with mock.patch("nvflare.apis.impl.job_def_manager.SimpleJobDefManager._get_job_store") as mock_store:
@@ -91,3 +95,129 @@ class TestJobManager(unittest.TestCase):
 
             content = self.job_manager.get_content(meta, self.fl_ctx)
             assert content == data
+
+
+class TestJobIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root_dir = tempfile.mkdtemp()
+        self.uri_root = os.path.join(self.root_dir, "jobs")
+        self.index_path = os.path.join(self.root_dir, "workspace", "jobs_meta_index.sqlite")
+        self.job_manager = SimpleJobDefManager(uri_root=self.uri_root, index_path=self.index_path)
+        self.fl_ctx = FLContext()
+        patcher = mock.patch(
+            "nvflare.apis.impl.job_def_manager.SimpleJobDefManager._get_job_store", return_value=FilesystemStorage()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        if self.job_manager.job_index:
+            self.job_manager.job_index.close()
+        shutil.rmtree(self.root_dir)
+
+    def _create(self, name, submitter="alice", study=None, job_manager=None):
+        meta = {JobMetaKey.JOB_NAME.value: name, JobMetaKey.SUBMITTER_NAME.value: submitter}
+        if study:
+            meta[JobMetaKey.STUDY.value] = study
+        return (job_manager or self.job_manager).create(meta, b"data", self.fl_ctx)[JobMetaKey.JOB_ID.value]
+
+    def _ids(self, jobs):
+        return [job.job_id for job in jobs]
+
+    def test_queries_follow_updates(self):
+        j1 = self._create("train-a")
+        j2 = self._create("train-b", submitter="bob", study="s1")
+        j3 = self._create("eval-c")
+
+        assert os.path.isfile(self.job_manager.job_index.db_path)
+        assert self._ids(self.job_manager.get_jobs_to_schedule(self.fl_ctx)) == [j1, j2, j3]
+
+        self.job_manager.set_status(j1, RunStatus.RUNNING, self.fl_ctx)
+        self.job_manager.update_meta(j3, {JobMetaKey.JOB_NAME.value: "train-c"}, self.fl_ctx)
+        assert self._ids(self.job_manager.get_jobs_to_schedule(self.fl_ctx)) == [j2, j3]
+        assert self._ids(self.job_manager.get_jobs_by_status([RunStatus.RUNNING], self.fl_ctx)) == [j1]
+        assert self._ids(self.job_manager.query_jobs(self.fl_ctx, name_prefix="TRAIN-")) == [j1, j2, j3]
+        assert self._ids(self.job_manager.query_jobs(self.fl_ctx, submitter="bob")) == [j2]
+        assert self._ids(self.job_manager.query_jobs(self.fl_ctx, study="default")) == [j1, j3]
+        assert self._ids(self.job_manager.query_jobs(self.fl_ctx, job_id_prefix=j2[:8].upper())) == [j2]
+        assert self._ids(self.job_manager.query_jobs(self.fl_ctx, newest_first=True, limit=2)) == [j3, j2]
+        assert self._ids(self.job_manager.query_jobs(self.fl_ctx, limit=1, offset=1)) == [j2]
+
+        self.job_manager.delete(j2, self.fl_ctx)
+        assert self._ids(self.job_manager.get_all_jobs(self.fl_ctx)) == [j1, j3]
+
+    def test_same_results_without_index(self):
+        self._create("train-a")
+        self._create("train-b", submitter="bob")
+        self._create("eval-c", study="s1")
+        no_index = SimpleJobDefManager(uri_root=self.uri_root, use_index=False)
+        for kwargs in [{}, {"submitter": "alice"}, {"study": "s1"}, {"name_prefix": "train"}, {"limit": 2}]:
+            assert self._ids(no_index.query_jobs(self.fl_ctx, **kwargs)) == self._ids(
+                self.job_manager.query_jobs(self.fl_ctx, **kwargs)
+            )
+
+    def test_index_catches_up_with_store(self):
+        j1 = self._create("a")
+        # jobs written by a manager without index, e.g. before the index existed
+        no_index = SimpleJobDefManager(uri_root=self.uri_root, use_index=False)
+        j2 = self._create("b", job_manager=no_index)
+
+        # a new manager builds the index from the store when it's first used
+        job_manager = SimpleJobDefManager(uri_root=self.uri_root, index_path=self.index_path)
+        assert self._ids(job_manager.get_all_jobs(self.fl_ctx)) == [j1, j2]
+
+        j3 = self._create("c", job_manager=no_index)
+        no_index.delete(j1, self.fl_ctx)
+        job_manager.job_index.close()
+
+        # an existing index is synced with the job IDs in the store
+        job_manager = SimpleJobDefManager(uri_root=self.uri_root, index_path=self.index_path)
+        assert self._ids(job_manager.get_all_jobs(self.fl_ctx)) == [j2, j3]
+        job_manager.job_index.close()
+
+    def test_index_follows_store_changes_by_others(self):
+        j1 = self._create("a")
+        assert self._ids(self.job_manager.get_all_jobs(self.fl_ctx)) == [j1]
+
+        # e.g. another server sharing the job store
+        other = SimpleJobDefManager(uri_root=self.uri_root, use_index=False)
+        j2 = self._create("b", job_manager=other)
+        other.delete(j1, self.fl_ctx)
+
+        # the job IDs in the store are not listed every time the index is used
+        with mock.patch.object(self.job_manager, "_list_job_ids") as list_job_ids:
+            self.job_manager.get_all_jobs(self.fl_ctx)
+            list_job_ids.assert_not_called()
+
+        self.job_manager._index_sync_time -= self.job_manager.index_sync_interval
+        assert self._ids(self.job_manager.get_jobs_to_schedule(self.fl_ctx)) == [j2]
+
+    def test_default_index_path_in_workspace(self):
+        workspace_root = os.path.join(self.root_dir, "site_ws")
+        engine = mock.MagicMock()
+        engine.get_workspace.return_value.get_root_dir.return_value = workspace_root
+        fl_ctx = mock.MagicMock()
+        fl_ctx.get_engine.return_value = engine
+
+        job_manager = SimpleJobDefManager(uri_root=self.uri_root)
+        job_manager.create({JobMetaKey.JOB_NAME.value: "a"}, b"data", fl_ctx)
+        assert job_manager.job_index.db_path == os.path.join(workspace_root, "jobs_meta_index.sqlite")
+        assert os.path.isfile(job_manager.job_index.db_path)
+        job_manager.job_index.close()
+
+    def test_no_index_without_workspace(self):
+        j1 = self._create("a")
+        job_manager = SimpleJobDefManager(uri_root=self.uri_root)
+        assert self._ids(job_manager.get_all_jobs(self.fl_ctx)) == [j1]
+        assert job_manager.job_index is None
+
+    def test_rebuild_index(self):
+        j1 = self._create("a")
+        assert self._ids(self.job_manager.get_jobs_to_schedule(self.fl_ctx)) == [j1]
+
+        # the index is out of sync with the store
+        self.job_manager.job_index.put({JobMetaKey.JOB_ID.value: j1, JobMetaKey.STATUS.value: "BOGUS"})
+        assert self.job_manager.get_jobs_to_schedule(self.fl_ctx) == []
+
+        assert self.job_manager.rebuild_index(self.fl_ctx) == 1
+        assert self._ids(self.job_manager.get_jobs_to_schedule(self.fl_ctx)) == [j1]
@@ -12,14 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
 from unittest.mock import Mock
 
+import numpy as np
+import pytest
+
 from nvflare.apis.client import Client
+from nvflare.apis.controller_spec import Task, TaskCompletionStatus
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
 from nvflare.apis.fl_constant import FLContextKey
 from nvflare.apis.fl_context import FLContextManager
 from nvflare.apis.impl.wf_comm_server import WFCommServer, _DeadClientStatus
 from nvflare.apis.job_def import JobMetaKey
 from nvflare.apis.server_engine_spec import ServerEngineSpec
+from nvflare.apis.shareable import Shareable
 
 
 def _make_wf_comm(clients, dead_names, min_sites=1, required_sites=None):
@@ -70,3 +78,259 @@ class TestJobPolicyViolated:
         clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
         wf = _make_wf_comm(clients, dead_names=["site-1"], min_sites=1, required_sites=["site-1"])
         assert wf._job_policy_violated() is True
+
+
+class TestTaskCompletionWakeup:
+    def test_wait_for_standing_tasks_no_tasks(self):
+        wf = WFCommServer(task_check_period=10)
+        start = time.time()
+        assert wf.wait_for_standing_tasks(timeout=5) is True
+        assert time.time() - start < 1
+
+    def test_wait_for_standing_tasks_timeout(self):
+        wf = WFCommServer()
+        wf._tasks.append(Task(name="train", data=Shareable()))
+        assert wf.wait_for_standing_tasks(timeout=0.05) is False
+        assert wf.wait_for_standing_tasks(timeout=0.05, max_num_tasks=1) is True
+
+    def test_wait_for_standing_tasks_woken_on_removal(self):
+        wf = WFCommServer()
+        task = Task(name="train", data=Shareable())
+        wf._tasks.append(task)
+
+        def _remove():
+            time.sleep(0.1)
+            with wf._task_lock:
+                wf._tasks.remove(task)
+            wf._notify_tasks_removed()
+
+        t = threading.Thread(target=_remove, daemon=True)
+        t.start()
+        start = time.time()
+        assert wf.wait_for_standing_tasks(timeout=10) is True
+        assert time.time() - start < 5
+        t.join()
+
+    def test_wait_for_task_woken_on_done(self):
+        """wait_for_task returns when the task is done, without waiting for the check period."""
+        wf = WFCommServer(task_check_period=10)
+        done_calls = []
+        task = Task(name="train", data=Shareable(), task_done_cb=lambda task, fl_ctx: done_calls.append(task))
+
+        waiter = threading.Thread(target=wf.wait_for_task, args=(task, None), daemon=True)
+        waiter.start()
+        time.sleep(0.1)
+        start = time.time()
+        task.task_done_cb(task=task, fl_ctx=None)
+        waiter.join(timeout=5)
+        assert not waiter.is_alive()
+        assert time.time() - start < 5
+        assert done_calls == [task]
+
+
+class TestNewTaskNotification:
+    def test_schedule_task_notifies_targets(self):
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        notified = []
+        wf.set_new_task_cb(notified.append)
+        fl_ctx = wf._engine.new_context()
+
+        wf.broadcast(Task(name="train", data=Shareable()), fl_ctx, targets=["site-2"])
+        wf.broadcast(Task(name="validate", data=Shareable()), fl_ctx)
+        assert notified == [["site-2"], ["site-1", "site-2"]]
+
+        wf.set_new_task_cb(None)
+        wf.broadcast(Task(name="train", data=Shareable()), fl_ctx)
+        assert len(notified) == 2
+
+
+class TestBroadcastTaskTargets:
+    def test_broadcast_task_marks_shared_data(self):
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        wf.broadcast(Task(name="train", data=Shareable()), fl_ctx)
+
+        task_name, _, _ = wf.process_task_request(clients[0], fl_ctx)
+        assert task_name == "train"
+        assert fl_ctx.get_prop(FLContextKey.BROADCAST_TASK_TARGETS) == ["site-1", "site-2"]
+
+    def test_send_task_does_not_mark_shared_data(self):
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        wf.send(Task(name="train", data=Shareable()), fl_ctx, targets=["site-1"])
+
+        task_name, _, _ = wf.process_task_request(clients[0], fl_ctx)
+        assert task_name == "train"
+        assert fl_ctx.get_prop(FLContextKey.BROADCAST_TASK_TARGETS) is None
+
+
+class TestClientTaskIndex:
+    def test_candidate_tasks_of_client(self):
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        t1 = Task(name="t1", data=Shareable())
+        t2 = Task(name="t2", data=Shareable())
+        t3 = Task(name="t3", data=Shareable())
+        wf.send(t1, fl_ctx, targets=["site-2"])
+        wf.relay(t2, fl_ctx, targets=["site-1"], dynamic_targets=True)
+        wf.broadcast(t3, fl_ctx, targets=["site-1"])
+
+        assert wf._get_candidate_tasks("site-1") == [t2, t3]
+        assert wf._get_candidate_tasks("site-2") == [t1, t2]
+        assert wf._get_candidate_tasks("site-3") == [t2]
+
+        wf.cancel_task(t2)
+        wf.check_tasks()
+        assert wf._get_candidate_tasks("site-1") == [t3]
+        assert wf._get_candidate_tasks("site-3") == []
+
+        wf._clear_standing_tasks()
+        assert wf._get_candidate_tasks("site-1") == []
+        assert wf._get_candidate_tasks("site-2") == []
+
+    def test_requests_of_different_tasks_do_not_block(self):
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        sending = threading.Event()
+        release = threading.Event()
+
+        def _before_task_sent(client_task, fl_ctx):
+            sending.set()
+            release.wait(10)
+
+        wf.send(Task(name="t1", data=Shareable(), before_task_sent_cb=_before_task_sent), fl_ctx, targets=["site-1"])
+        wf.send(Task(name="t2", data=Shareable()), fl_ctx, targets=["site-2"])
+
+        results = []
+        requester = threading.Thread(
+            target=lambda: results.append(wf.process_task_request(clients[0], wf._engine.new_context()))
+        )
+        requester.start()
+        assert sending.wait(5)
+
+        # site-1 is still getting its task: site-2 can get its task and submit the result
+        task_name, task_id, _ = wf.process_task_request(clients[1], fl_ctx)
+        assert task_name == "t2"
+        wf.process_submission(clients[1], task_name, task_id, Shareable(), fl_ctx)
+        assert wf._client_task_map[task_id].result_received_time is not None
+
+        release.set()
+        requester.join(5)
+        assert results[0][0] == "t1"
+
+
+class TestBroadcastData:
+    def test_broadcast_data_shared_read_only(self):
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        w = np.arange(10, dtype=np.float32)
+        task = Task(name="train", data=DXO(data_kind=DataKind.WEIGHTS, data={"w": w}).to_shareable())
+        wf.broadcast(task, fl_ctx)
+
+        for client in clients:
+            _, _, data = wf.process_task_request(client, fl_ctx)
+            assert np.shares_memory(from_shareable(data).data["w"], w)
+        assert not w.flags.writeable
+
+        wf.cancel_task(task)
+        wf.check_tasks()
+        assert w.flags.writeable
+        assert not hasattr(task, "_broadcast_data")
+
+    def test_modified_tensors_not_sent(self):
+        torch = pytest.importorskip("torch")
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        t = torch.zeros(10)
+        task = Task(name="train", data=DXO(data_kind=DataKind.WEIGHTS, data={"t": t}).to_shareable())
+        wf.broadcast(task, fl_ctx)
+
+        task_name, _, _ = wf.process_task_request(clients[0], fl_ctx)
+        assert task_name == "train"
+        t.add_(1.0)
+        task_name, _, _ = wf.process_task_request(clients[1], fl_ctx)
+        assert task_name == ""
+        assert task.completion_status == TaskCompletionStatus.ERROR
+
+
+class TestTaskCallbacks:
+    def test_concurrent_result_callbacks(self):
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        barrier = threading.Barrier(2, timeout=5)
+        received = []
+
+        def _result_received(client_task, fl_ctx):
+            # both results must be in the callback at the same time to pass the barrier
+            barrier.wait()
+            received.append(client_task.client.name)
+
+        task = Task(name="t", data=Shareable(), result_received_cb=_result_received, concurrent_callbacks=True)
+        wf.broadcast(task, fl_ctx, min_responses=2)
+        task_ids = [wf.process_task_request(client, fl_ctx)[1] for client in clients]
+
+        submitters = [
+            threading.Thread(
+                target=wf.process_submission, args=(client, "t", task_id, Shareable(), wf._engine.new_context())
+            )
+            for client, task_id in zip(clients, task_ids)
+        ]
+        for t in submitters:
+            t.start()
+        for t in submitters:
+            t.join(10)
+
+        assert sorted(received) == ["site-1", "site-2"]
+        wf.check_tasks()
+        assert task.completion_status == TaskCompletionStatus.OK
+
+    def test_task_exit_waits_for_result_callback(self):
+        clients = [Client("site-1", "tok-1")]
+        wf = _make_wf_comm(clients, dead_names=[])
+        fl_ctx = wf._engine.new_context()
+        receiving = threading.Event()
+        release = threading.Event()
+        events = []
+
+        def _result_received(client_task, fl_ctx):
+            receiving.set()
+            release.wait(10)
+            events.append("result")
+
+        task = Task(
+            name="t",
+            data=Shareable(),
+            timeout=1,
+            result_received_cb=_result_received,
+            task_done_cb=lambda task, fl_ctx: events.append("done"),
+        )
+        wf.send(task, fl_ctx, targets=["site-1"])
+        _, task_id, _ = wf.process_task_request(clients[0], fl_ctx)
+        submitter = threading.Thread(
+            target=wf.process_submission, args=(clients[0], "t", task_id, Shareable(), wf._engine.new_context())
+        )
+        submitter.start()
+        assert receiving.wait(5)
+
+        # a duplicate submission is dropped while the result is being processed
+        wf.process_submission(clients[0], "t", task_id, Shareable(), fl_ctx)
+
+        # the task is still checked while the callback runs, but it exits only after the callback is done
+        task.schedule_time -= 2
+        wf.check_tasks()
+        assert task.completion_status == TaskCompletionStatus.TIMEOUT
+        assert task in wf._tasks
+
+        release.set()
+        submitter.join(5)
+        wf.check_tasks()
+        assert task not in wf._tasks
+        assert events == ["result", "done"]
@@ -0,0 +1,77 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
+from nvflare.apis.shareable import Shareable
+from nvflare.apis.utils.frozen_data import FrozenData
+
+
+def _make_data(params):
+    return DXO(data_kind=DataKind.WEIGHTS, data=params, meta={"round": 1}).to_shareable()
+
+
+class TestFrozenData:
+    def test_arrays_shared_read_only(self):
+        w = np.arange(10, dtype=np.float32)
+        source = _make_data({"w": w, "names": ["a", "b"]})
+        frozen = FrozenData(source)
+
+        assert isinstance(frozen.data, Shareable)
+        view = from_shareable(frozen.data).data["w"]
+        assert np.shares_memory(view, w)
+        with pytest.raises(ValueError):
+            view[0] = 1.0
+        with pytest.raises(ValueError):
+            w[0] = 1.0
+
+        # containers are copied: entries replaced in the source are not seen by the view
+        from_shareable(source).data["w"] = np.zeros(10)
+        source.set_header("k", "v")
+        assert from_shareable(frozen.data).data["w"] is view
+        assert frozen.data.get_header("k") is None
+        assert frozen.is_intact()
+
+        frozen.release()
+        w[0] = 1.0
+        with pytest.raises(ValueError):
+            view[0] = 1.0
+
+    def test_shared_arrays_released_by_last_view(self):
+        w = np.arange(10, dtype=np.float32)
+        frozen1 = FrozenData(_make_data({"w": w}))
+        frozen2 = FrozenData(_make_data({"w": w}))
+        frozen1.release()
+        frozen1.release()
+        assert not w.flags.writeable
+        frozen2.release()
+        assert w.flags.writeable
+
+        # arrays that are read-only already stay read-only
+        w.flags.writeable = False
+        FrozenData(_make_data({"w": w})).release()
+        assert not w.flags.writeable
+
+    def test_tensor_mutation_detected(self):
+        torch = pytest.importorskip("torch")
+        t = torch.zeros(10)
+        frozen = FrozenData(_make_data({"t": t}))
+        view = from_shareable(frozen.data).data["t"]
+        assert view.data_ptr() == t.data_ptr()
+        assert frozen.is_intact()
+
+        t.add_(1.0)
+        assert not frozen.is_intact()
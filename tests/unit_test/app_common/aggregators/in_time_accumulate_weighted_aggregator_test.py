@@ -19,9 +19,11 @@ import numpy as np
 import pytest
 
 from nvflare.apis.dxo import DXO, DataKind, MetaKey, from_shareable
+from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_constant import ReservedKey
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
+from nvflare.app_common.aggregators.dxo_aggregator import DXOAggregator
 from nvflare.app_common.aggregators.intime_accumulate_model_aggregator import InTimeAccumulateWeightedAggregator
 from nvflare.app_common.app_constant import AppConstants
 
@@ -325,3 +327,30 @@ class TestInTimeAccumulateWeightedAggregator:
             np.testing.assert_allclose(
                 result_dxo.data[dxo_name].data["var1"], weighted_sum[dxo_name] / sum_of_weights[dxo_name]
             )
+
+    @pytest.mark.parametrize("aggregation_shards", [0, -1, 1.5, "2"])
+    def test_invalid_aggregation_shards(self, aggregation_shards):
+        with pytest.raises(ValueError, match="aggregation_shards"):
+            DXOAggregator(aggregation_shards=aggregation_shards)
+
+    def test_sharded_workers_stopped(self):
+        agg = InTimeAccumulateWeightedAggregator(aggregation_shards=2)
+        fl_ctx = FLContext()
+        agg.handle_event(EventType.START_RUN, fl_ctx)
+        fl_ctx.set_prop(AppConstants.CURRENT_ROUND, 0)
+        for client_name in ("client_0", "client_1"):
+            s = Shareable()
+            s.set_peer_props({ReservedKey.IDENTITY_NAME: client_name})
+            s.add_cookie(AppConstants.CONTRIBUTION_ROUND, 0)
+            dxo = DXO(DataKind.WEIGHT_DIFF, data={"var1": np.ones(4), "var2": np.ones(2)})
+            agg.accept(dxo.update_shareable(s), fl_ctx)
+
+        helper = agg.dxo_aggregators[agg._single_dxo_key].aggregation_helper
+        assert helper.executor is not None
+        agg.aggregate(fl_ctx)
+        assert helper.executor is None
+
+        agg.accept(dxo.update_shareable(s), fl_ctx)
+        assert helper.executor is not None
+        agg.handle_event(EventType.END_RUN, fl_ctx)
+        assert helper.executor is None
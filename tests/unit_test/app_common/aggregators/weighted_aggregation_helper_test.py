@@ -12,15 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+
 import numpy as np
 import pytest
 import torch
 
 from nvflare.app_common.aggregators.weighted_aggregation_helper import (
+    ShardedWeightedAggregationHelper,
     WeightedAggregationHelper,
     _is_aggregatable_metric_value,
     filter_aggregatable_metrics,
 )
+from nvflare.app_common.utils.sparse_array import SparseArray, top_k_indices
 
 
 class TestIsAggregatableMetricValue:
@@ -443,3 +447,302 @@ class TestWeightedAggregationHelper:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestFlatBufferAggregation:
+    """Test the flat buffer mode gives the same result as per-key aggregation."""
+
+    @staticmethod
+    def _make_data(seed):
+        rng = np.random.default_rng(seed)
+        return {
+            "conv.weight": torch.from_numpy(rng.standard_normal((4, 3, 3, 3)).astype(np.float32)),
+            "conv.bias": torch.from_numpy(rng.standard_normal(4).astype(np.float32)),
+            "bn.num_batches_tracked": torch.tensor(seed + 10, dtype=torch.long),
+            "fc.weight": rng.standard_normal((5, 6)),
+            "fc.bias": rng.standard_normal(5).astype(np.float32),
+            "step": 3,
+        }
+
+    def _aggregate(self, contributions, **kwargs):
+        helper = WeightedAggregationHelper(**kwargs)
+        for i, (data, weight) in enumerate(contributions):
+            helper.add(data, weight=weight, contributor_name=f"site-{i}", contribution_round=0)
+        return helper.get_result()
+
+    @staticmethod
+    def _assert_same(result, expected):
+        assert list(result.keys()) == list(expected.keys())
+        for k, v in expected.items():
+            if isinstance(v, torch.Tensor):
+                assert result[k].dtype == v.dtype
+                assert torch.allclose(result[k], v)
+            else:
+                np.testing.assert_allclose(result[k], v, rtol=1e-6)
+                assert np.asarray(result[k]).dtype == np.asarray(v).dtype
+
+    @pytest.mark.parametrize("weigh_by_local_iter", [True, False])
+    def test_same_result_as_per_key(self, weigh_by_local_iter):
+        contributions = [(self._make_data(i), float(i + 1)) for i in range(3)]
+        # integer tensors can only be aggregated when weighted
+        exclude_vars = "step" if weigh_by_local_iter else "step|num_batches"
+        expected = self._aggregate(contributions, exclude_vars=exclude_vars, weigh_by_local_iter=weigh_by_local_iter)
+        result = self._aggregate(
+            contributions, exclude_vars=exclude_vars, weigh_by_local_iter=weigh_by_local_iter, flat_buffer=True
+        )
+        assert "step" not in result
+        self._assert_same(result, expected)
+
+    def test_inputs_not_modified(self):
+        data = self._make_data(0)
+        original = {k: v.clone() if isinstance(v, torch.Tensor) else np.copy(v) for k, v in data.items()}
+        self._aggregate([(data, 2.0), (self._make_data(1), 1.0)], flat_buffer=True)
+        for k, v in original.items():
+            if isinstance(v, torch.Tensor):
+                assert torch.equal(data[k], v)
+            else:
+                np.testing.assert_array_equal(data[k], v)
+
+    def test_tensor_results_do_not_share_storage(self):
+        result = self._aggregate([(self._make_data(0), 1.0)], flat_buffer=True)
+        assert result["conv.weight"].untyped_storage().data_ptr() != result["conv.bias"].untyped_storage().data_ptr()
+
+    def test_mismatched_contribution_falls_back_to_per_key(self):
+        data1 = self._make_data(0)
+        data2 = self._make_data(1)
+        data3 = self._make_data(2)
+        del data3["fc.bias"]
+        contributions = [(data1, 1.0), (data2, 2.0), (data3, 3.0)]
+
+        expected = self._aggregate(contributions)
+        result = self._aggregate(contributions, flat_buffer=True)
+        self._assert_same(result, expected)
+
+    def test_changed_shape_or_dtype_falls_back_to_per_key(self):
+        def _reshaped(seed):
+            data = self._make_data(seed)
+            data["fc.weight"] = data["fc.weight"].reshape(6, 5)
+            return data
+
+        helper = WeightedAggregationHelper(flat_buffer=True)
+        helper.add(self._make_data(0), weight=1.0, contributor_name="site-0", contribution_round=0)
+        helper.get_result()
+
+        # same keys as the layout of the previous round, but another shape
+        assert not helper.layout.matches(_reshaped(1))
+        # another dtype
+        data3 = _reshaped(3)
+        data3["fc.bias"] = data3["fc.bias"].astype(np.float64)
+        data3["conv.bias"] = data3["conv.bias"].double()
+        contributions = [(_reshaped(1), 1.0), (_reshaped(2), 2.0), (data3, 3.0)]
+        for i, (data, weight) in enumerate(contributions):
+            helper.add(data, weight=weight, contributor_name=f"site-{i}", contribution_round=1)
+        assert not helper.layout.matches(data3)
+        result = helper.get_result()
+
+        assert result["fc.weight"].shape == (6, 5)
+        self._assert_same(result, self._aggregate(contributions))
+
+    def test_lazy_ref_of_other_size_falls_back_to_per_key(self):
+        class _LazyRef:
+            def __init__(self, value):
+                self.value = value
+
+            def materialize(self):
+                return self.value
+
+        helper = WeightedAggregationHelper(flat_buffer=True)
+        helper.add(self._make_data(0), weight=1.0, contributor_name="site-1", contribution_round=0)
+        helper.get_result()
+
+        # the layout of the previous round matches the keys, but the first flatten of this round fails
+        contributions = []
+        for i in range(2):
+            data = self._make_data(i + 1)
+            data["conv.bias"] = _LazyRef(torch.ones(5) * i)
+            contributions.append((data, 1.0))
+            helper.add(data, weight=1.0, contributor_name=f"site-{i}", contribution_round=1)
+        result = helper.get_result()
+
+        assert torch.allclose(result["conv.bias"], torch.full((5,), 0.5))
+        expected = self._aggregate(contributions)
+        self._assert_same(result, expected)
+
+    def test_layout_reused_across_rounds(self):
+        helper = WeightedAggregationHelper(flat_buffer=True)
+        for round_num in range(2):
+            helper.add(self._make_data(round_num), weight=1.0, contributor_name="site-1", contribution_round=round_num)
+            helper.add(self._make_data(5), weight=1.0, contributor_name="site-2", contribution_round=round_num)
+            layout = helper.layout
+            result = helper.get_result()
+            expected = (self._make_data(round_num)["fc.weight"] + self._make_data(5)["fc.weight"]) / 2
+            np.testing.assert_allclose(result["fc.weight"], expected)
+        assert helper.layout is layout
+
+
+class TestSparseAggregation:
+    """Test sparse contributions are aggregated like their dense form."""
+
+    @staticmethod
+    def _make_sparse(seed, k=5):
+        dense = np.random.default_rng(seed).standard_normal((4, 6)).astype(np.float32)
+        return SparseArray.from_dense(dense, top_k_indices(dense, k))
+
+    @pytest.mark.parametrize("flat_buffer", [False, True])
+    @pytest.mark.parametrize("weigh_by_local_iter", [True, False])
+    def test_same_result_as_dense(self, flat_buffer, weigh_by_local_iter):
+        contributions = [self._make_sparse(i) for i in range(3)]
+        sparse_helper = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter, flat_buffer=flat_buffer)
+        dense_helper = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter)
+        for i, sparse in enumerate(contributions):
+            bias = np.full(3, float(i), dtype=np.float32)
+            sparse_helper.add({"w": sparse, "b": bias}, weight=i + 1.0, contributor_name=f"s{i}", contribution_round=0)
+            dense_helper.add(
+                {"w": sparse.to_dense(), "b": bias}, weight=i + 1.0, contributor_name=f"s{i}", contribution_round=0
+            )
+
+        result = sparse_helper.get_result()
+        expected = dense_helper.get_result()
+        assert list(result.keys()) == ["w", "b"]
+        for k in expected:
+            np.testing.assert_allclose(result[k], expected[k], rtol=1e-6)
+
+    def test_sparse_added_to_dense_total(self):
+        sparse = self._make_sparse(1)
+        dense_np = np.random.default_rng(0).standard_normal((4, 6)).astype(np.float32)
+        expected = (dense_np * 2.0 + sparse.to_dense()) / 3.0
+        for dense in (dense_np, torch.from_numpy(dense_np)):
+            helper = WeightedAggregationHelper()
+            helper.add({"w": dense}, weight=2.0, contributor_name="s1", contribution_round=0)
+            helper.add({"w": sparse}, weight=1.0, contributor_name="s2", contribution_round=0)
+            np.testing.assert_allclose(np.asarray(helper.get_result()["w"]), expected, rtol=1e-6)
+
+    @pytest.mark.parametrize("num_shards", [1, 2])
+    @pytest.mark.parametrize("flat_buffer", [False, True])
+    def test_torch_source_total_is_tensor(self, num_shards, flat_buffer):
+        if num_shards > 1:
+            helper = ShardedWeightedAggregationHelper(num_shards=num_shards, flat_buffer=flat_buffer)
+        else:
+            helper = WeightedAggregationHelper(flat_buffer=flat_buffer)
+        contributions = [self._make_sparse(i) for i in range(2)]
+        for i, sparse in enumerate(contributions):
+            helper.add(
+                {"w": sparse, "b": torch.full((3,), float(i))},
+                weight=1.0,
+                contributor_name=f"s{i}",
+                contribution_round=0,
+                source_formats={"w": "torch"},
+            )
+        result = helper.get_result()
+        helper.close()
+        assert isinstance(result["w"], torch.Tensor)
+        assert isinstance(result["b"], torch.Tensor)
+        expected = (contributions[0].to_dense() + contributions[1].to_dense()) / 2.0
+        np.testing.assert_allclose(result["w"].numpy(), expected, rtol=1e-6)
+
+    def test_numpy_source_total_is_array(self):
+        helper = WeightedAggregationHelper()
+        helper.add({"w": self._make_sparse(0)}, 1.0, "s1", 0, source_formats={"w": "numpy"})
+        assert isinstance(helper.get_result()["w"], np.ndarray)
+
+
+class TestShardedWeightedAggregationHelper:
+    """Test the sharded helper gives the same result as the unsharded helper."""
+
+    @staticmethod
+    def _make_data(seed, num_keys=20):
+        rng = np.random.default_rng(seed)
+        data = {f"layer{i}.weight": rng.standard_normal((i + 1, 8)) for i in range(num_keys)}
+        data["layer0.bias"] = torch.from_numpy(rng.standard_normal(4).astype(np.float32))
+        data["steps"] = 5
+        return data
+
+    @pytest.mark.parametrize("num_shards", [1, 2, 4])
+    @pytest.mark.parametrize("flat_buffer", [False, True])
+    def test_same_result_as_unsharded(self, num_shards, flat_buffer):
+        contributions = [(self._make_data(i), float(i + 1)) for i in range(4)]
+        helper = WeightedAggregationHelper(exclude_vars="steps")
+        sharded = ShardedWeightedAggregationHelper(num_shards, exclude_vars="steps", flat_buffer=flat_buffer)
+        for i, (data, weight) in enumerate(contributions):
+            helper.add(data, weight=weight, contributor_name=f"site-{i}", contribution_round=0)
+            sharded.add(data, weight=weight, contributor_name=f"site-{i}", contribution_round=0)
+
+        assert sharded.get_len() == 4
+        expected = helper.get_result()
+        result = sharded.get_result()
+        assert list(result.keys()) == list(expected.keys())
+        for k, v in expected.items():
+            if isinstance(v, torch.Tensor):
+                assert torch.allclose(result[k], v)
+            else:
+                np.testing.assert_allclose(result[k], v)
+        assert sharded.get_len() == 0
+
+    def test_keys_balanced_across_shards(self):
+        sharded = ShardedWeightedAggregationHelper(4)
+        sharded.add(self._make_data(0), weight=1.0, contributor_name="site-1", contribution_round=0)
+        assert set(sharded.key_shards.values()) == {0, 1, 2, 3}
+        assert max(sharded.shard_loads) - min(sharded.shard_loads) <= 20 * 8 * 8
+
+    def test_concurrent_contributions(self):
+        contributions = [self._make_data(i) for i in range(16)]
+        sharded = ShardedWeightedAggregationHelper(4)
+        threads = [
+            threading.Thread(target=sharded.add, args=(data, 1.0, f"site-{i}", 0))
+            for i, data in enumerate(contributions)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        result = sharded.get_result()
+        expected = np.mean([data["layer7.weight"] for data in contributions], axis=0)
+        np.testing.assert_allclose(result["layer7.weight"], expected)
+        assert result["steps"] == 5
+
+    def test_contributions_start_at_different_shards(self):
+        sharded = ShardedWeightedAggregationHelper(4)
+        data = self._make_data(0)
+        starts = [sharded.shards.index(sharded._partition(data)[0][0]) for _ in range(5)]
+        assert starts == [0, 1, 2, 3, 0]
+
+    def test_caller_folds_parts_not_picked_up_by_workers(self):
+        sharded = ShardedWeightedAggregationHelper(2)
+        sharded.add(self._make_data(0), weight=1.0, contributor_name="site-1", contribution_round=0)
+
+        # the only worker is busy, e.g. with another contribution
+        release = threading.Event()
+        busy = sharded.executor.submit(release.wait)
+        try:
+            adder = threading.Thread(target=sharded.add, args=(self._make_data(1), 1.0, "site-2", 0), daemon=True)
+            adder.start()
+            adder.join(timeout=10.0)
+            assert not adder.is_alive()
+        finally:
+            release.set()
+            busy.result()
+
+        result = sharded.get_result()
+        expected = (self._make_data(0)["layer3.weight"] + self._make_data(1)["layer3.weight"]) / 2
+        np.testing.assert_allclose(result["layer3.weight"], expected)
+
+    def test_close(self):
+        sharded = ShardedWeightedAggregationHelper(2)
+        sharded.add(self._make_data(0), weight=1.0, contributor_name="site-1", contribution_round=0)
+        executor = sharded.executor
+        sharded.close()
+        assert sharded.executor is None
+        assert executor._shutdown
+
+        # the workers are started again for the next round
+        sharded.add(self._make_data(1), weight=1.0, contributor_name="site-1", contribution_round=1)
+        assert sharded.executor is not None
+        result = sharded.get_result()
+        expected = (self._make_data(0)["layer3.weight"] + self._make_data(1)["layer3.weight"]) / 2
+        np.testing.assert_allclose(result["layer3.weight"], expected)
+        sharded.close()
+
+    def test_invalid_num_shards(self):
+        with pytest.raises(ValueError, match="num_shards"):
+            ShardedWeightedAggregationHelper(0)
@@ -23,6 +23,7 @@ from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
 from nvflare.app_common.abstract.learnable import Learnable
 from nvflare.app_common.abstract.model import ModelLearnable
 from nvflare.app_common.decomposers import common_decomposers
+from nvflare.app_common.utils.sparse_array import SparseArray
 from nvflare.app_common.widgets.event_recorder import _CtxPropReq, _EventReq, _EventStats
 from nvflare.fuel.utils import fobs
 
@@ -108,6 +109,17 @@ class TestCommonDecomposers:
 
         assert (new_npa == npa).all()
 
+    def test_sparse_array(self):
+        dense = np.random.default_rng(0).standard_normal((10, 20)).astype(np.float32)
+        sparse = SparseArray.from_dense(dense, np.array([0, 7, 150, 199]))
+
+        new_sparse = self._run_fobs(sparse)
+
+        assert isinstance(new_sparse, SparseArray)
+        assert new_sparse.shape == sparse.shape
+        np.testing.assert_array_equal(new_sparse.index_deltas, sparse.index_deltas)
+        np.testing.assert_array_equal(new_sparse.values, sparse.values)
+
     def test_ctx_prop_req(self):
 
         cpr = _CtxPropReq("data_type", True, False, True)
@@ -0,0 +1,86 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.filters import DensifyUpdate, SparsifyUpdate
+from nvflare.app_common.utils.sparse_array import SparseArray
+
+
+def _filter(f, data, data_kind=DataKind.WEIGHT_DIFF):
+    dxo = data if isinstance(data, DXO) else DXO(data_kind=data_kind, data=data)
+    return from_shareable(f.process(dxo.to_shareable(), FLContext()))
+
+
+class TestSparsifyUpdate:
+    def test_top_k(self):
+        values = np.random.default_rng(0).standard_normal(1000).astype(np.float32)
+        dxo = _filter(SparsifyUpdate(ratio=0.05, error_feedback=False), {"w": values.copy(), "n": 3})
+
+        sparse = dxo.data["w"]
+        assert isinstance(sparse, SparseArray) and sparse.nnz == 50
+        assert np.abs(sparse.values).min() >= np.sort(np.abs(values))[-50]
+        assert dxo.data["n"] == 3
+
+    def test_threshold(self):
+        values = np.zeros(100, dtype=np.float32)
+        values[[3, 50, 97]] = [1.0, -2.0, 0.5]
+        dxo = _filter(SparsifyUpdate(mode="threshold", threshold=0.8), {"w": values})
+        np.testing.assert_array_equal(dxo.data["w"].indices(), [3, 50])
+
+    def test_kept_dense_when_not_smaller(self):
+        values = np.ones(10, dtype=np.float32)
+        dxo = _filter(SparsifyUpdate(ratio=0.8), {"w": values})
+        np.testing.assert_array_equal(dxo.data["w"], values)
+
+    def test_error_feedback(self):
+        f = SparsifyUpdate(ratio=0.1)
+        values = np.random.default_rng(1).standard_normal(100).astype(np.float32)
+        original = values.copy()
+
+        sent = np.zeros_like(values)
+        for _ in range(10):
+            sent += _filter(f, {"w": values}).data["w"].to_dense()
+
+        np.testing.assert_array_equal(values, original)
+        # everything not sent yet is in the residual
+        np.testing.assert_allclose(sent + f._residuals["w"], original * 10, rtol=1e-5, atol=1e-5)
+
+    def test_torch_round_trip(self):
+        values = torch.randn(32, 32)
+        sparse_dxo = _filter(SparsifyUpdate(ratio=0.01), {"w": values})
+        sparse = sparse_dxo.data["w"]
+        assert isinstance(sparse, SparseArray)
+
+        dense = _filter(DensifyUpdate(), sparse_dxo).data["w"]
+        assert isinstance(dense, torch.Tensor) and dense.shape == (32, 32)
+        assert torch.equal(dense.reshape(-1)[sparse.indices()], values.reshape(-1)[sparse.indices()])
+        assert torch.count_nonzero(dense) == sparse.nnz
+
+    def test_weights_not_filtered(self):
+        values = np.random.default_rng(0).standard_normal(1000)
+        dxo = _filter(SparsifyUpdate(), {"w": values}, data_kind=DataKind.WEIGHTS)
+        assert isinstance(dxo.data["w"], np.ndarray)
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            SparsifyUpdate(mode="random")
+        with pytest.raises(ValueError):
+            SparsifyUpdate(ratio=0.0)
+        with pytest.raises(ValueError):
+            SparsifyUpdate(mode="threshold")
@@ -19,8 +19,11 @@ not in ArrayDownloadable itself. These tests verify the Downloadable's basic beh
 """
 
 import numpy as np
+import pytest
 
-from nvflare.app_common.np.np_downloader import ArrayDownloadable
+from nvflare.app_common.np.np_downloader import ArrayConsumer, ArrayDownloadable
+from nvflare.app_common.np.np_raw_format import is_raw_format
+from nvflare.fuel.f3.streaming.ranged_item import is_ranged_item
 
 
 class TestArrayDownloadableBasic:
@@ -68,3 +71,81 @@ class TestArrayDownloadableBasic:
 
         # Downloadable IS affected (this is expected - protection is at broadcast level)
         assert downloadable.base_obj["model"][0] == 999.0
+
+
+class TestArrayItemFormat:
+    """Test the wire format of the items produced by ArrayDownloadable."""
+
+    def test_raw_format_item(self):
+        arrays = {"w": np.arange(6, dtype=np.float32).reshape(2, 3)}
+        item = ArrayDownloadable(arrays=arrays, max_chunk_size=1024, raw_format=True).produce_item(0)
+        assert is_raw_format(item)
+
+        result = ArrayConsumer._to_dict(item)
+        np.testing.assert_array_equal(result["w"], arrays["w"])
+
+    def test_npz_item_still_accepted(self):
+        arrays = {"w": np.arange(6, dtype=np.float32).reshape(2, 3)}
+        item = ArrayDownloadable(arrays=arrays, max_chunk_size=1024).produce_item(0)
+        assert not is_raw_format(item)
+
+        result = ArrayConsumer._to_dict(item)
+        np.testing.assert_array_equal(result["w"], arrays["w"])
+
+
+class TestRangedArrayItems:
+    """Test that arrays larger than the chunk size are sent as ranged items."""
+
+    @staticmethod
+    def _produce_all(downloadable):
+        return [downloadable.produce_item(i) for i in range(downloadable.get_item_count())]
+
+    def test_large_array_split_into_ranges(self):
+        arrays = {"big": np.zeros((64, 32), dtype=np.float32), "small": np.ones(4)}
+        downloadable = ArrayDownloadable(arrays=arrays, max_chunk_size=1000, raw_format=True, split_large_arrays=True)
+
+        assert downloadable.get_item_count() == 10
+        items = self._produce_all(downloadable)
+        assert all(is_ranged_item(item) and len(item) < 1100 for item in items[:9])
+        assert is_raw_format(items[9])
+
+    def test_not_split_by_default(self):
+        arrays = {"big": np.zeros((64, 32), dtype=np.float32)}
+        downloadable = ArrayDownloadable(arrays=arrays, max_chunk_size=1000, raw_format=True)
+        assert downloadable.get_item_count() == 1
+
+    def test_npz_format_not_split(self):
+        arrays = {"big": np.zeros((64, 32), dtype=np.float32)}
+        downloadable = ArrayDownloadable(arrays=arrays, max_chunk_size=1000, raw_format=False, split_large_arrays=True)
+        assert downloadable.get_item_count() == 1
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_consumer_assembles_ranges(self, order):
+        big = np.asarray(np.arange(50 * 37, dtype=np.float64).reshape(50, 37), order=order)
+        arrays = {"big": big, "small": np.array([1, 2, 3], dtype=np.int16)}
+        items = self._produce_all(
+            ArrayDownloadable(arrays=arrays, max_chunk_size=512, raw_format=True, split_large_arrays=True)
+        )
+
+        consumer = ArrayConsumer(None, {})
+        result = None
+        for item in items:
+            result = consumer.consume_items([item], result)
+
+        np.testing.assert_array_equal(result["big"], big)
+        np.testing.assert_array_equal(result["small"], arrays["small"])
+        assert result["big"].flags.writeable
+
+        consumer.download_completed("ref")
+        assert consumer.error is None
+
+    def test_incomplete_ranges_fail_download(self):
+        items = self._produce_all(
+            ArrayDownloadable(
+                arrays={"big": np.zeros(1000)}, max_chunk_size=1000, raw_format=True, split_large_arrays=True
+            )
+        )
+        consumer = ArrayConsumer(None, {})
+        consumer.consume_items(items[:-1], None)
+        consumer.download_completed("ref")
+        assert "big" in consumer.error
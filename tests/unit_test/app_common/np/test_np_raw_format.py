@@ -0,0 +1,67 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nvflare.app_common.np.np_raw_format import ALIGNMENT, decode_arrays, encode_arrays, is_raw_format
+
+ARRAYS = {
+    "float32": np.arange(12, dtype=np.float32).reshape(3, 4),
+    "fortran": np.asfortranarray(np.arange(6, dtype=np.float64).reshape(2, 3)),
+    "strided": np.arange(20, dtype=np.int64)[::2],
+    "empty": np.zeros((0, 3), dtype=np.float32),
+    "scalar": np.array(5, dtype=np.int32),
+    "big_endian": np.arange(4, dtype=">i4"),
+    "structured": np.zeros(3, dtype=[("x", "<i4"), ("y", "<f8")]),
+    "bool": np.array([True, False, True]),
+}
+
+
+class TestNumpyRawFormat:
+    def test_round_trip(self):
+        data = encode_arrays(ARRAYS)
+        assert is_raw_format(data)
+
+        result = decode_arrays(data)
+        assert list(result.keys()) == list(ARRAYS.keys())
+        for k, v in ARRAYS.items():
+            assert result[k].dtype == v.dtype
+            assert result[k].shape == v.shape
+            np.testing.assert_array_equal(result[k], v)
+
+    def test_fortran_order_kept(self):
+        result = decode_arrays(encode_arrays({"f": ARRAYS["fortran"]}))
+        assert result["f"].flags.f_contiguous
+
+    def test_no_copy_over_writable_buffer(self):
+        data = bytearray(encode_arrays({"a": ARRAYS["float32"]}))
+        result = decode_arrays(data)
+        assert result["a"].flags.writeable
+        assert np.shares_memory(result["a"], np.frombuffer(data, dtype=np.uint8))
+        assert result["a"].ctypes.data % ALIGNMENT == np.frombuffer(data, dtype=np.uint8).ctypes.data % ALIGNMENT
+
+    def test_read_only_buffer(self):
+        data = encode_arrays({"a": ARRAYS["float32"]})
+        assert not decode_arrays(data)["a"].flags.writeable
+        assert decode_arrays(data, writeable=True)["a"].flags.writeable
+
+    def test_object_dtype_rejected(self):
+        with pytest.raises(ValueError):
+            encode_arrays({"o": np.array([1, "a"], dtype=object)})
+
+    def test_not_raw_format(self):
+        assert not is_raw_format(b"PK\x03\x04")
+        with pytest.raises(ValueError):
+            decode_arrays(b"\x93NUMPY" + bytes(20))
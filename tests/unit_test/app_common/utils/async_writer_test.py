@@ -0,0 +1,65 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+from nvflare.app_common.utils.async_writer import AsyncWriter
+
+
+class TestAsyncWriter:
+    def test_jobs_run_in_order(self):
+        writer = AsyncWriter(max_pending=2)
+        results = []
+        for i in range(5):
+            writer.submit(results.append, i)
+        writer.flush()
+        assert results == [0, 1, 2, 3, 4]
+
+        writer.shutdown()
+        with pytest.raises(RuntimeError):
+            writer.submit(results.append, 5)
+
+    def test_submit_blocks_when_queue_is_full(self):
+        writer = AsyncWriter(max_pending=1)
+        release = threading.Event()
+        writer.submit(release.wait)
+
+        # the first job is running, the second one is pending: the third one cannot be queued
+        writer.submit(lambda: None)
+        blocked = threading.Thread(target=writer.submit, args=(lambda: None,), daemon=True)
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(timeout=5.0)
+        assert not blocked.is_alive()
+        writer.shutdown()
+
+    def test_error_raised_by_flush(self):
+        writer = AsyncWriter()
+
+        def fail(msg):
+            raise ValueError(msg)
+
+        writer.submit(fail, "first")
+        writer.submit(fail, "second")
+        with pytest.raises(ValueError, match="first"):
+            writer.flush()
+
+        # errors are cleared by flush
+        writer.flush()
+        writer.shutdown()
@@ -0,0 +1,61 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from nvflare.app_common.utils.sparse_array import SparseArray, threshold_indices, top_k_indices
+
+
+class TestSparseArray:
+    def test_top_k_indices(self):
+        values = np.array([[0.1, -5.0, 2.0], [-0.5, 3.0, 0.0]])
+        np.testing.assert_array_equal(top_k_indices(values, 3), [1, 2, 4])
+        np.testing.assert_array_equal(top_k_indices(values, 10), np.arange(6))
+        assert top_k_indices(values, 0).size == 0
+
+    def test_threshold_indices(self):
+        values = np.array([0.1, -5.0, 2.0, -0.5])
+        np.testing.assert_array_equal(threshold_indices(values, 0.5), [1, 2, 3])
+
+    def test_round_trip(self):
+        dense = np.random.default_rng(0).standard_normal((8, 16)).astype(np.float32)
+        indices = top_k_indices(dense, 20)
+        sparse = SparseArray.from_dense(dense, indices)
+
+        assert sparse.index_deltas.dtype == np.uint32
+        assert sparse.shape == (8, 16) and sparse.nnz == 20 and sparse.dtype == np.float32
+        np.testing.assert_array_equal(sparse.indices(), indices)
+
+        expected = np.zeros_like(dense)
+        expected.reshape(-1)[indices] = dense.reshape(-1)[indices]
+        np.testing.assert_array_equal(sparse.to_dense(), expected)
+
+    def test_add_to(self):
+        dense = np.arange(6, dtype=np.float32)
+        sparse = SparseArray.from_dense(dense, np.array([1, 4]))
+
+        total = np.ones(6, dtype=np.float32)
+        sparse.add_to(total, 2.0)
+        np.testing.assert_array_equal(total, [1, 3, 1, 1, 9, 1])
+
+        total = torch.ones(2, 3, dtype=torch.float64)
+        sparse.add_to(total, 2.0)
+        assert torch.equal(total, torch.tensor([[1, 3, 1], [1, 9, 1]], dtype=torch.float64))
+
+    def test_add_to_non_contiguous(self):
+        sparse = SparseArray.from_dense(np.ones((3, 3)), np.array([0]))
+        with pytest.raises(ValueError):
+            sparse.add_to(np.zeros((3, 3)).T)
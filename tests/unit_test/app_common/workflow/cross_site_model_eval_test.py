@@ -17,6 +17,9 @@ from unittest.mock import Mock
 
 import pytest
 
+from nvflare.apis.client import Client
+from nvflare.apis.controller_spec import ClientTask
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
 from nvflare.apis.fl_context import FLContext
 from nvflare.app_common.app_constant import AppConstants
 from nvflare.app_common.workflows.cross_site_model_eval import CrossSiteModelEval
@@ -54,3 +57,51 @@ class TestCrossSiteModelEvalPaths:
         run_dir = os.path.realpath(str(tmp_path / "run"))
         assert os.path.isdir(os.path.join(run_dir, AppConstants.CROSS_VAL_DIR, AppConstants.CROSS_VAL_MODEL_DIR_NAME))
         assert os.path.isdir(os.path.join(run_dir, AppConstants.CROSS_VAL_DIR, AppConstants.CROSS_VAL_RESULTS_DIR_NAME))
+
+
+class TestCrossSiteModelEvalStreaming:
+    @staticmethod
+    def _make_controller(tmp_path, **kwargs):
+        engine, fl_ctx = _make_engine_and_ctx(tmp_path / "run")
+        controller = CrossSiteModelEval(participating_clients=["site-1", "site-2"], **kwargs)
+        controller._engine = engine
+        controller.fire_event = Mock()
+        controller.start_controller(fl_ctx)
+        controller.broadcast = Mock()
+        return controller, fl_ctx
+
+    def test_models_in_flight_limited(self, tmp_path):
+        controller, fl_ctx = self._make_controller(tmp_path, max_models_in_flight=2)
+        for name in ["site-1", "site-2", "SRV_server"]:
+            controller._send_validation_task(name, fl_ctx)
+
+        tasks = [c.kwargs["task"] for c in controller.broadcast.call_args_list]
+        assert [t.props[AppConstants.MODEL_OWNER] for t in tasks] == ["site-1", "site-2"]
+        assert controller._get_num_models_in_flight() == 2
+
+        # the pending model is sent when a model is validated
+        tasks[0].task_done_cb(task=tasks[0], fl_ctx=fl_ctx)
+        tasks = [c.kwargs["task"] for c in controller.broadcast.call_args_list]
+        assert tasks[-1].props[AppConstants.MODEL_OWNER] == "SRV_server"
+        assert controller._get_num_models_in_flight() == 2
+
+        for t in tasks[1:]:
+            t.task_done_cb(task=t, fl_ctx=fl_ctx)
+        assert controller._get_num_models_in_flight() == 0
+
+    def test_model_loaded_once_for_all_clients(self, tmp_path):
+        controller, fl_ctx = self._make_controller(tmp_path)
+        controller._save_client_model("site-1", DXO(data_kind=DataKind.WEIGHTS, data={"w": 1.0}), fl_ctx)
+        task = controller.broadcast.call_args.kwargs["task"]
+        controller._load_validation_content = Mock(wraps=controller._load_validation_content)
+
+        for client_name in ["site-1", "site-2"]:
+            client_task = ClientTask(client=Client(client_name, None), task=task)
+            task.before_task_sent_cb(client_task=client_task, fl_ctx=fl_ctx)
+            assert from_shareable(task.data).data == {"w": 1.0}
+            assert task.data.get_header(AppConstants.MODEL_OWNER) == "site-1"
+            task.after_task_sent_cb(client_task=client_task, fl_ctx=fl_ctx)
+        assert controller._load_validation_content.call_count == 1
+
+        task.task_done_cb(task=task, fl_ctx=fl_ctx)
+        assert not task.props.get("__model_to_validate")
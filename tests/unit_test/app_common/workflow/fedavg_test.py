@@ -13,7 +13,8 @@
 # limitations under the License.
 
 import copy
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pytest
@@ -22,7 +23,9 @@ import nvflare.app_common.utils.tensor_disk_offload_context as tensor_disk_offlo
 from nvflare.apis.client import Client
 from nvflare.apis.controller_spec import ClientTask, Task
 from nvflare.apis.fl_constant import FLMetaKey, ReservedKey
-from nvflare.apis.fl_context import FLContext
+from nvflare.apis.fl_context import FLContext, FLContextManager
+from nvflare.apis.impl.wf_comm_server import WFCommServer
+from nvflare.apis.server_engine_spec import ServerEngineSpec
 from nvflare.apis.shareable import Shareable
 from nvflare.apis.signal import Signal
 from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
@@ -398,6 +401,94 @@ class TestFedAvgAggregation:
         aggr_result = controller._get_aggregated_result()
         assert aggr_result.params["w"] == 2.0  # (1+3)/2
 
+    def test_aggregate_one_result_sharded(self):
+        """Test built-in aggregation with sharded helper reuses the helper across rounds."""
+        from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+
+        controller = FedAvg(num_clients=2, aggregation_shards=2, flat_buffer_aggregation=True)
+        helper = controller._new_aggr_helper()
+        assert controller._new_aggr_helper() is helper
+
+        controller._aggr_helper = helper
+        controller._aggr_metrics_helper = WeightedAggregationHelper()
+        controller._all_metrics = True
+        controller._received_count = 0
+        controller._expected_count = 2
+        controller._params_type = None
+        controller.current_round = 0
+
+        for name, value in (("site-1", 1.0), ("site-2", 3.0)):
+            controller._aggregate_one_result(
+                FLModel(
+                    params={"w": np.full(4, value), "b": np.full(2, value * 2)},
+                    params_type=ParamsType.FULL,
+                    meta={"client_name": name, FLMetaKey.NUM_STEPS_CURRENT_ROUND: 10},
+                )
+            )
+
+        aggr_result = controller._get_aggregated_result()
+        np.testing.assert_allclose(aggr_result.params["w"], np.full(4, 2.0))
+        np.testing.assert_allclose(aggr_result.params["b"], np.full(2, 4.0))
+        # the worker threads are stopped at the end of the round
+        assert helper.executor is None
+
+    def test_results_aggregated_concurrently(self):
+        """Test results submitted at the same time are folded in at the same time by the sharded helper."""
+        from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+
+        clients = [Client("site-1", "tok-1"), Client("site-2", "tok-2")]
+        engine = Mock(spec=ServerEngineSpec)
+        engine.get_clients.return_value = clients
+        fl_ctx_mgr = FLContextManager(
+            engine=engine, identity_name="server", job_id="job", public_stickers={}, private_stickers={}
+        )
+        engine.new_context.side_effect = fl_ctx_mgr.new_context
+        communicator = WFCommServer()
+        communicator._engine = engine
+
+        controller = FedAvg(num_clients=2, aggregation_shards=2)
+        controller.set_communicator(communicator)
+        controller.fl_ctx = fl_ctx_mgr.new_context()
+        controller._aggr_helper = controller._new_aggr_helper()
+        controller._aggr_metrics_helper = WeightedAggregationHelper()
+        controller._all_metrics = True
+        controller._received_count = 0
+        controller._expected_count = 2
+        controller.current_round = 0
+
+        # both results must be folded in at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        helper_add = controller._aggr_helper.add
+
+        def add(**kwargs):
+            barrier.wait()
+            helper_add(**kwargs)
+
+        controller._aggr_helper.add = add
+        controller.send_model(
+            targets=["site-1", "site-2"],
+            data=FLModel(params={"w": np.zeros(4)}, current_round=0),
+            callback=controller._aggregate_one_result,
+        )
+
+        submitters = []
+        for client, value in zip(clients, (1.0, 3.0)):
+            _, task_id, _ = communicator.process_task_request(client, fl_ctx_mgr.new_context())
+            result = FLModelUtils.to_shareable(FLModel(params={"w": np.full(4, value)}, params_type=ParamsType.FULL))
+            submitters.append(
+                threading.Thread(
+                    target=communicator.process_submission,
+                    args=(client, AppConstants.TASK_TRAIN, task_id, result, fl_ctx_mgr.new_context()),
+                )
+            )
+        for t in submitters:
+            t.start()
+        for t in submitters:
+            t.join(10)
+
+        assert controller._received_count == 2
+        np.testing.assert_allclose(controller._get_aggregated_result().params["w"], np.full(4, 2.0))
+
     def test_aggregate_one_result_filters_non_aggregatable_metrics(self):
         """Test built-in aggregation filters non-aggregatable metrics."""
         controller = FedAvg(num_clients=2)
@@ -1773,6 +1864,94 @@ class TestFedAvgAggregationWeights:
         assert aggr_result.params["b"] == 2.0
 
 
+class TestFedAvgAsyncPersist:
+    @staticmethod
+    def _make_controller(num_rounds, **kwargs):
+        controller = FedAvg(num_clients=1, num_rounds=num_rounds, model={"w": 0.0}, **kwargs)
+        controller.engine = _MockEngine(cell=None)
+        controller.engine.new_context = FLContext
+        controller.fl_ctx = FLContext()
+        controller.abort_signal = Signal()
+        controller.sample_clients = lambda _: ["site-1"]
+        controller.get_num_standing_tasks = lambda: 0
+        controller._get_aggregated_result = lambda: FLModel(params={"w": 1.0})
+        controller.update_model = lambda model, aggr_result: FLModel(
+            params={"w": model.params["w"] + aggr_result.params["w"]}
+        )
+        return controller
+
+    def test_next_round_dispatched_while_persisting(self):
+        controller = self._make_controller(num_rounds=3, async_persist=True)
+        dispatched = threading.Event()
+        saved = []
+
+        def save_model(model, fl_ctx=None):
+            # round r is persisted while round r + 1 is dispatched
+            if len(saved) < 2:
+                assert dispatched.wait(timeout=10.0)
+                dispatched.clear()
+            saved.append(model.params["w"])
+
+        def send_model(**kwargs):
+            if kwargs["data"].current_round > 0:
+                dispatched.set()
+
+        controller.save_model = save_model
+        controller.send_model = send_model
+        controller.run()
+
+        # every model is persisted once the run is finished
+        assert saved == [1.0, 2.0, 3.0]
+        assert sorted(controller.round_timings) == [0, 1, 2]
+        for timings in controller.round_timings.values():
+            assert set(timings) == {"dispatch", "wait", "flush", "aggregate", "persist"}
+            assert all(t is not None and t >= 0.0 for t in timings.values())
+        assert controller._writer is None
+
+    def test_background_persist_uses_own_context(self):
+        controller = self._make_controller(num_rounds=2, async_persist=True)
+        controller.send_model = lambda **kwargs: None
+        controller.persistor = MagicMock()
+        events = []
+        controller.fire_event = lambda event_type, fl_ctx: events.append((event_type, fl_ctx))
+
+        controller.run()
+
+        saved_contexts = [c.args[1] for c in controller.persistor.save.call_args_list]
+        assert len(saved_contexts) == 2
+        assert all(ctx is not controller.fl_ctx for ctx in saved_contexts)
+        assert [ctx.get_prop(AppConstants.CURRENT_ROUND) for ctx in saved_contexts] == [0, 1]
+        persist_events = [
+            (event_type, ctx)
+            for event_type, ctx in events
+            if event_type in (AppEventType.BEFORE_LEARNABLE_PERSIST, AppEventType.AFTER_LEARNABLE_PERSIST)
+        ]
+        assert [ctx for _, ctx in persist_events] == [c for c in saved_contexts for _ in range(2)]
+
+    def test_persist_error_is_raised(self):
+        controller = self._make_controller(num_rounds=2, async_persist=True)
+        controller.send_model = lambda **kwargs: None
+
+        def save_model(model, fl_ctx=None):
+            raise OSError("disk full")
+
+        controller.save_model = save_model
+        with pytest.raises(OSError, match="disk full"):
+            controller.run()
+        assert controller._writer is None
+
+    def test_sync_persist_timings(self):
+        controller = self._make_controller(num_rounds=2)
+        controller.send_model = lambda **kwargs: None
+        controller.save_model = lambda model: None
+
+        controller.run()
+        assert controller._writer is None
+        assert sorted(controller.round_timings) == [0, 1]
+        for timings in controller.round_timings.values():
+            assert set(timings) == {"dispatch", "wait", "aggregate", "persist"}
+
+
 class TestFedAvgLoadSaveModel:
     """Test FedAvg load_model and save_model overrides."""
 
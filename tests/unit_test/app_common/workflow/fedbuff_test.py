@@ -0,0 +1,153 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from nvflare.apis.fl_constant import ReturnCode
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import make_reply
+from nvflare.apis.signal import Signal
+from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
+from nvflare.app_common.workflows.fedbuff import FedBuff
+
+
+def _make_controller(params_type, **kwargs):
+    """FedBuff with a fast site that returns its result right away, and a slow one that returns it later.
+
+    Every update adds 1.0 to the model it was trained on. The slow site returns its first update when the fast
+    site gets its 4th task.
+    """
+    controller = FedBuff(num_clients=2, model={"w": 0.0}, **kwargs)
+    controller.engine = MagicMock()
+    controller.fl_ctx = FLContext()
+    controller.abort_signal = Signal()
+    controller.sample_clients = lambda _: ["fast", "slow"]
+    controller.cancel_all_tasks = MagicMock()
+    dispatched = []
+    slow_tasks = []
+
+    def _finish(site_name, model, callback):
+        if params_type == ParamsType.DIFF:
+            params = {"w": 1.0}
+        else:
+            params = {"w": model.params["w"] + 1.0}
+        callback(FLModel(params_type=params_type, params=params, meta={"client_name": site_name}))
+        controller._task_done(SimpleNamespace(targets=[site_name]), controller.fl_ctx)
+
+    def send_model(task_name, targets, data, timeout, callback):
+        site_name = targets[0]
+        dispatched.append((site_name, data.current_round))
+        if site_name == "slow":
+            slow_tasks.append((data, callback))
+            return
+
+        _finish(site_name, data, callback)
+        if len([d for d in dispatched if d[0] == "fast"]) == 4:
+            model, slow_callback = slow_tasks.pop(0)
+            _finish("slow", model, slow_callback)
+
+    controller.send_model = send_model
+    return controller, dispatched
+
+
+def _make_failing_controller(failing_sites, num_rounds=2, **kwargs):
+    """FedBuff with two sites that return their results right away. The failing sites return an error instead."""
+    controller = FedBuff(num_clients=2, model={"w": 0.0}, num_rounds=num_rounds, buffer_size=1, **kwargs)
+    controller.engine = MagicMock()
+    controller.fl_ctx = FLContext()
+    controller.abort_signal = Signal()
+    controller.sample_clients = lambda _: ["site-1", "site-2"]
+    controller.cancel_all_tasks = MagicMock()
+    controller.panic = MagicMock(side_effect=lambda msg: controller.abort_signal.trigger(msg))
+    dispatched = []
+
+    def send_model(task_name, targets, data, timeout, callback):
+        site_name = targets[0]
+        dispatched.append(site_name)
+        if site_name in failing_sites:
+            result = make_reply(ReturnCode.EXECUTION_EXCEPTION)
+        else:
+            result = make_reply(ReturnCode.OK)
+        if controller._accept_train_result(site_name, result, controller.fl_ctx):
+            callback(FLModel(params_type=ParamsType.DIFF, params={"w": 1.0}, meta={"client_name": site_name}))
+        controller._task_done(SimpleNamespace(targets=[site_name]), controller.fl_ctx)
+
+    controller.send_model = send_model
+    return controller, dispatched
+
+
+class TestFedBuff:
+    @pytest.mark.parametrize("params_type", [ParamsType.DIFF, ParamsType.FULL])
+    def test_staleness_weighted_updates(self, params_type):
+        controller, dispatched = _make_controller(params_type, num_rounds=3, buffer_size=2)
+        controller.run()
+
+        # the fast site is not gated on the slow one, and gets the newest model every time
+        assert [v for s, v in dispatched if s == "fast"] == [0, 0, 1, 1, 2]
+        assert [v for s, v in dispatched if s == "slow"] == [0, 2]
+
+        # the update of the slow site was trained on version 0 and is applied to version 2
+        expected = 2.0 + (1.0 / math.sqrt(3.0) + 1.0) / 2
+        assert controller.current_round == 3
+        assert controller._global_model.params["w"] == pytest.approx(expected)
+        assert controller.staleness_histogram == {0: 5, 2: 1}
+        assert controller.num_updates == 6
+        controller.cancel_all_tasks.assert_called_once()
+
+        # only the versions sites are training on are kept
+        assert sorted(controller._version_params) == [2, 3]
+
+    def test_stale_updates_dropped(self):
+        controller, dispatched = _make_controller(ParamsType.DIFF, num_rounds=3, buffer_size=2, max_staleness=1)
+        controller.run()
+
+        assert controller._global_model.params["w"] == pytest.approx(3.0)
+        assert controller.num_dropped_updates == 1
+        assert controller.staleness_histogram == {0: 6}
+
+    def test_site_error_is_ignored(self):
+        # the tasks of the failing site are done before the other site's, so it is re-dispatched first
+        controller, dispatched = _make_failing_controller({"site-1"})
+        controller.run()
+
+        controller.panic.assert_not_called()
+        assert controller.current_round == 2
+        assert controller._global_model.params["w"] == pytest.approx(2.0)
+        assert controller.num_updates == 2
+        assert controller.num_failed_updates >= 1
+        assert dispatched.count("site-1") >= 2
+
+    def test_all_sites_failing_is_fatal(self):
+        controller, _ = _make_failing_controller({"site-1", "site-2"})
+        controller.run()
+
+        controller.panic.assert_called_once()
+        assert controller.current_round == 0
+
+    def test_strict_mode_is_fatal(self):
+        controller, _ = _make_failing_controller({"site-1"}, ignore_result_error=False)
+        controller.run()
+
+        controller.panic.assert_called_once()
+        assert controller.num_updates == 0
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            FedBuff(buffer_size=0)
+        with pytest.raises(ValueError):
+            FedBuff(staleness_exponent=-1.0)
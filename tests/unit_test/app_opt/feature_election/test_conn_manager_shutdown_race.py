@@ -135,3 +135,13 @@ class TestShutdownRaceGuards:
         with patch("nvflare.fuel.f3.sfm.conn_manager.Prefix.from_bytes") as mock_parse:
             mgr.process_frame_task(sfm_conn, b"\x00" * 8)
             mock_parse.assert_not_called()
+
+    def test_process_frame_task_stopped_releases_pooled_frame(self):
+        """A pooled frame discarded after stop() must still be given back to the frame pool."""
+        mgr = _make_conn_manager()
+        mgr.frame_pool = MagicMock()
+        mgr.stopped = True
+
+        frame = b"\x00" * 8
+        mgr.process_frame_task(_make_sfm_conn(), frame)
+        mgr.frame_pool.release.assert_called_once_with(frame)
@@ -18,9 +18,12 @@ Note: Deep copy protection is now handled at broadcast level in WFCommServer,
 not in TensorDownloadable itself. These tests verify the Downloadable's basic behavior.
 """
 
+import pytest
 import torch
+from safetensors.torch import load as load_tensors
 
-from nvflare.app_opt.pt.tensor_downloader import TensorDownloadable
+from nvflare.app_opt.pt.tensor_downloader import DiskTensorConsumer, TensorConsumer, TensorDownloadable
+from nvflare.fuel.f3.streaming.ranged_item import is_ranged_item
 
 
 class TestTensorDownloadableBasic:
@@ -68,3 +71,80 @@ class TestTensorDownloadableBasic:
 
         # Downloadable IS affected (this is expected - protection is at broadcast level)
         assert downloadable.base_obj["model"][0].item() == 999.0
+
+
+def _produce_all(downloadable):
+    return [downloadable.produce_item(i) for i in range(downloadable.get_item_count())]
+
+
+class TestRangedTensorItems:
+    """Test that tensors larger than the chunk size are sent as ranged items."""
+
+    def test_large_tensor_split_into_ranges(self):
+        tensors = {"big": torch.randn(64, 32), "small": torch.randn(4)}
+        downloadable = TensorDownloadable(tensors=tensors, max_chunk_size=1000, split_large_tensors=True)
+
+        # 8192 bytes in ranges of 1000 bytes, plus one item for the small tensor
+        assert downloadable.get_item_count() == 10
+        items = _produce_all(downloadable)
+        assert all(is_ranged_item(item) for item in items[:9])
+        assert all(len(item) < 1100 for item in items[:9])
+        assert not is_ranged_item(items[9])
+
+    def test_not_split_by_default(self):
+        tensors = {"big": torch.randn(64, 32)}
+        downloadable = TensorDownloadable(tensors=tensors, max_chunk_size=1000)
+        assert downloadable.get_item_count() == 1
+
+    def test_non_contiguous_tensor_not_split(self):
+        tensors = {"t": torch.randn(64, 32).t()}
+        downloadable = TensorDownloadable(tensors=tensors, max_chunk_size=1000, split_large_tensors=True)
+        assert downloadable.get_item_count() == 1
+
+    @pytest.mark.parametrize("dtype", [torch.float32, torch.bfloat16, torch.int64, torch.bool])
+    def test_consumer_assembles_ranges(self, dtype):
+        tensors = {
+            "big": torch.randint(0, 2, (50, 37)).to(dtype),
+            "small": torch.tensor([1.0, 2.0]),
+        }
+        items = _produce_all(TensorDownloadable(tensors=tensors, max_chunk_size=512, split_large_tensors=True))
+
+        received = []
+        consumer = TensorConsumer(lambda t: received.append(set(t.keys())), {})
+        consumer.consume_items(items[:2], None)
+        assert received == []
+        consumer.consume_items(items[2:], None)
+        assert received[-1] == {"big", "small"}
+
+        consumer = TensorConsumer(None, {})
+        result = None
+        for item in items:
+            result = consumer.consume_items([item], result)
+        assert result["big"].dtype == dtype
+        assert torch.equal(result["big"], tensors["big"])
+        assert torch.equal(result["small"], tensors["small"])
+
+        consumer.download_completed("ref")
+        assert consumer.error is None
+
+    def test_incomplete_ranges_fail_download(self):
+        items = _produce_all(
+            TensorDownloadable(tensors={"big": torch.randn(1000)}, max_chunk_size=1000, split_large_tensors=True)
+        )
+        consumer = TensorConsumer(None, {})
+        consumer.consume_items(items[:-1], None)
+        consumer.download_completed("ref")
+        assert "big" in consumer.error
+
+    def test_disk_consumer_writes_safetensors_file(self, tmp_path):
+        tensors = {"big": torch.randn(33, 17).to(torch.float16), "small": torch.randn(3)}
+        items = _produce_all(TensorDownloadable(tensors=tensors, max_chunk_size=256, split_large_tensors=True))
+
+        consumer = DiskTensorConsumer(str(tmp_path))
+        result = consumer.consume_items(items, None)
+        consumer.release()
+
+        file_path, key = result["big"]
+        with open(file_path, "rb") as f:
+            loaded = load_tensors(f.read())
+        assert torch.equal(loaded[key], tensors["big"])
@@ -0,0 +1,143 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_opt.pt.quantization import block_quant
+from nvflare.app_opt.pt.quantization.block_quant import (
+    create_dynamic_map,
+    dequantize_4bit,
+    dequantize_blockwise,
+    get_4bit_code,
+    quantize_4bit,
+    quantize_blockwise,
+)
+from nvflare.app_opt.pt.quantization.dequantizer import ModelDequantizer
+from nvflare.app_opt.pt.quantization.quantizer import ModelQuantizer
+
+
+def _reference_quantize(values: torch.Tensor, code: torch.Tensor, blocksize: int):
+    """Reference of the block-wise format: per-block absmax scaling and argmin over the whole codebook."""
+    flat = values.reshape(-1).float()
+    indices = []
+    absmax = []
+    for start in range(0, flat.numel(), blocksize):
+        block = flat[start : start + blocksize]
+        block_absmax = block.abs().max()
+        scaled = torch.clamp(block * (1 / block_absmax), -1, 1)
+        indices.append(torch.argmin((scaled.unsqueeze(-1) - code).abs(), dim=-1).to(torch.uint8))
+        absmax.append(block_absmax)
+    return torch.cat(indices), torch.stack(absmax)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # make tensors span several chunks
+    monkeypatch.setattr(block_quant, "_CHUNK_SIZE", 1000)
+
+
+class TestBlockQuant:
+    @pytest.mark.parametrize("dtype", [torch.float32, torch.float16, torch.bfloat16])
+    def test_blockwise8_bit_exact(self, small_chunks, dtype):
+        values = torch.randn(3, 10001).to(dtype)
+        quantized, absmax, code = quantize_blockwise(values, blocksize=256)
+        ref_quantized, ref_absmax = _reference_quantize(values, code, 256)
+
+        assert quantized.dtype == torch.uint8 and quantized.shape == values.shape
+        assert torch.equal(quantized.reshape(-1), ref_quantized)
+        assert torch.equal(absmax, ref_absmax)
+
+        dequantized = dequantize_blockwise(quantized, absmax, code, blocksize=256)
+        expected = (code[ref_quantized.long()] * ref_absmax.repeat_interleave(256)[: values.numel()]).view(3, 10001)
+        assert torch.equal(dequantized, expected)
+
+    @pytest.mark.parametrize("quant_type", ["fp4", "nf4"])
+    @pytest.mark.parametrize("shape", [(64, 33), (1001,)])
+    def test_4bit_bit_exact(self, small_chunks, quant_type, shape):
+        values = torch.randn(shape)
+        packed, state = quantize_4bit(values, quant_type=quant_type)
+        ref_quantized, ref_absmax = _reference_quantize(values, get_4bit_code(quant_type), 64)
+        if ref_quantized.numel() % 2:
+            ref_quantized = torch.cat([ref_quantized, torch.zeros(1, dtype=torch.uint8)])
+
+        assert packed.shape == ((values.numel() + 1) // 2, 1)
+        assert torch.equal(packed.reshape(-1), (ref_quantized[0::2] << 4) | ref_quantized[1::2])
+        assert torch.equal(state["absmax"], ref_absmax)
+        assert state["quant_type"] == quant_type and state["blocksize"] == 64
+        assert state["dtype"] == "float32" and state["shape"] == shape
+
+        dequantized = dequantize_4bit(
+            packed, state["absmax"], state["quant_map"], state["blocksize"], torch.float32, state["shape"]
+        )
+        assert dequantized.shape == values.shape
+        # the max error of a 4-bit value is half the largest gap of the codebook
+        max_gap = get_4bit_code(quant_type).sort().values.diff().max()
+        assert torch.all(
+            (dequantized - values).abs()
+            <= state["absmax"].repeat_interleave(64)[: values.numel()].view(shape) * max_gap / 2 + 1e-6
+        )
+
+    def test_codebooks(self):
+        code = create_dynamic_map()
+        assert code.shape == (256,) and code[-1] == 1.0
+        assert len(set(code.tolist())) == 256
+        fp4 = get_4bit_code("fp4")
+        assert fp4[3] == 1.0 and fp4[11] == -1.0
+
+        bnb_functional = pytest.importorskip("bitsandbytes.functional")
+        assert torch.equal(code, bnb_functional.create_dynamic_map())
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="bitsandbytes kernels need GPU")
+    def test_same_as_bitsandbytes(self):
+        bnb_functional = pytest.importorskip("bitsandbytes.functional")
+        values = torch.randn(100000)
+
+        quantized, absmax, code = quantize_blockwise(values)
+        bnb_quantized, bnb_state = bnb_functional.quantize_blockwise(values.cuda())
+        assert torch.equal(quantized, bnb_quantized.cpu())
+        assert torch.equal(absmax, bnb_state.absmax.cpu())
+
+        for quant_type in ["fp4", "nf4"]:
+            packed, state = quantize_4bit(values, quant_type=quant_type)
+            bnb_packed, bnb_state = bnb_functional.quantize_4bit(values.cuda(), quant_type=quant_type)
+            assert torch.equal(packed, bnb_packed.cpu())
+            assert torch.equal(state["absmax"], bnb_state.absmax.cpu())
+
+
+class TestModelQuantizerOnCPU:
+    @pytest.mark.parametrize("quantization_type", ["blockwise8", "float4", "normfloat4"])
+    @pytest.mark.parametrize("source_format", ["numpy", "torch"])
+    def test_roundtrip(self, monkeypatch, quantization_type, source_format):
+        fl_ctx = FLContext()
+        quantizer = ModelQuantizer(quantization_type=quantization_type)
+        dequantizer = ModelDequantizer()
+        monkeypatch.setattr(quantizer, "_use_bnb", False)
+        monkeypatch.setattr(dequantizer, "_use_bnb", False)
+
+        original = {"w": torch.randn(100, 30), "b": torch.randn(7)}
+        if source_format == "numpy":
+            original = {k: v.numpy() for k, v in original.items()}
+        params, quant_state, source_datatype = quantizer.quantization(dict(original), fl_ctx)
+        for v in params.values():
+            assert v.dtype in (np.uint8, torch.uint8)
+
+        result = dequantizer.dequantization(params, quant_state, quantization_type, source_datatype, fl_ctx)
+        for k, v in original.items():
+            assert type(result[k]) is type(v)
+            assert result[k].shape == v.shape
+            # the largest gap of the codebooks is 1/3 of the absmax of a block (between the 2 largest FP4 values)
+            assert np.abs(np.asarray(result[k]) - np.asarray(v)).max() <= np.abs(np.asarray(v)).max() / 6 + 1e-6
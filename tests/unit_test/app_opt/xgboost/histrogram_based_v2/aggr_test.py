@@ -0,0 +1,59 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
+
+NUM_SAMPLES = 1000
+NUM_BINS = 16
+
+
+def _make_data(dtype):
+    rng = np.random.default_rng(0)
+    bins = rng.integers(-1, NUM_BINS, NUM_SAMPLES)
+    if dtype == np.int64:
+        values = rng.integers(-(10**12), 10**12, NUM_SAMPLES)
+    else:
+        values = rng.standard_normal(NUM_SAMPLES)
+    return values, bins
+
+
+class TestAggregator:
+    @pytest.mark.parametrize("dtype", [np.int64, np.float64])
+    @pytest.mark.parametrize("sample_ids", [None, [], [3, 7, 100, 999, 500]])
+    def test_array_same_as_per_item(self, dtype, sample_ids):
+        values, bins = _make_data(dtype)
+        aggr = Aggregator()
+        expected = aggr.aggregate(values.tolist(), bins.tolist(), NUM_BINS, sample_ids)
+        result = aggr.aggregate(values, bins, NUM_BINS, sample_ids)
+
+        assert len(result) == NUM_BINS
+        if dtype == np.int64:
+            # fixed-point sums are exact
+            assert result == expected
+        else:
+            np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    def test_large_fixed_point_sums(self):
+        values = np.full(4, 2**61, dtype=np.int64)
+        result = Aggregator().aggregate(values, np.array([0, 0, 0, 1]), 2, None)
+        assert result == [3 * 2**61, 2**61]
+        assert all(isinstance(v, int) for v in result)
+
+    def test_bin_out_of_range(self):
+        for values in (np.ones(3), np.ones(3, dtype=np.int64)):
+            with pytest.raises(IndexError):
+                Aggregator().aggregate(values, np.array([0, 1, 5]), 2, None)
@@ -0,0 +1,58 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.adder import Adder
+
+NUM_SAMPLES = 500
+NUM_BINS = 8
+
+# large ints stand in for the encrypted numbers: they are added one by one like cipher-text
+NUMBERS = [random.randint(1, 10**30) for _ in range(NUM_SAMPLES)]
+FEATURES = [(fid, [random.randint(-1, NUM_BINS - 1) for _ in range(NUM_SAMPLES)], NUM_BINS) for fid in range(11)]
+GROUPS = [(3, random.sample(range(NUM_SAMPLES), 100)), (7, random.sample(range(NUM_SAMPLES), 20))]
+
+
+@pytest.fixture
+def adder():
+    adder = Adder(max_workers=2)
+    yield adder
+    adder.shutdown()
+
+
+class TestAdder:
+    @pytest.mark.parametrize("groups", [None, GROUPS])
+    def test_add(self, adder, groups):
+        result = adder.add(NUMBERS, FEATURES, groups, encode_sum=False)
+
+        expected = []
+        for fid, mask, num_bins in FEATURES:
+            for gid, sample_ids in groups or [(0, None)]:
+                expected.append((fid, gid, Aggregator().aggregate(NUMBERS, mask, num_bins, sample_ids)))
+        assert result == expected
+
+    def test_pool_restarted_for_new_numbers(self, adder):
+        adder.add(NUMBERS, FEATURES, GROUPS, encode_sum=False)
+        exe = adder.exe
+        adder.add(NUMBERS, FEATURES, GROUPS, encode_sum=False)
+        assert adder.exe is exe
+
+        numbers = [n + 1 for n in NUMBERS]
+        result = adder.add(numbers, FEATURES, None, encode_sum=False)
+        assert adder.exe is not exe
+        assert result[0][2] == Aggregator().aggregate(numbers, FEATURES[0][1], NUM_BINS, None)
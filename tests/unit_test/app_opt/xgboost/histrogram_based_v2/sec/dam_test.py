@@ -11,7 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
+import struct
+
+import numpy as np
+import pytest
+
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import (
+    DATA_TYPE_FLOAT_ARRAY,
+    DATA_TYPE_INT_ARRAY,
+    SIGNATURE,
+    DamDecoder,
+    DamEncoder,
+)
 
 DATA_SET = 123456
 INT_ARRAY = [123, 456, 789]
@@ -34,3 +45,66 @@ class TestDam:
 
         float_array = decoder.decode_float_array()
         assert float_array == FLOAT_ARRAY
+
+    def test_byte_layout(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(INT_ARRAY)
+        encoder.add_float_array(FLOAT_ARRAY)
+        buffer = encoder.finish()
+
+        # each element is packed like struct "q" / "d"
+        expected = SIGNATURE.encode("utf-8") + struct.pack("qq", len(buffer), DATA_SET)
+        expected += struct.pack("qq", DATA_TYPE_INT_ARRAY, len(INT_ARRAY)) + struct.pack("3q", *INT_ARRAY)
+        expected += struct.pack("qq", DATA_TYPE_FLOAT_ARRAY, len(FLOAT_ARRAY)) + struct.pack("4d", *FLOAT_ARRAY)
+        assert buffer == expected
+
+    def test_numpy_arrays(self):
+        ints = np.array(INT_ARRAY, dtype=np.int32)
+        floats = np.array(FLOAT_ARRAY, dtype=np.float32)
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(ints)
+        encoder.add_float_array(floats)
+        buffer = encoder.finish()
+
+        decoder = DamDecoder(buffer)
+        int_array = decoder.decode_int_array(as_array=True)
+        assert int_array.dtype == np.int64
+        np.testing.assert_array_equal(int_array, INT_ARRAY)
+        assert decoder.decode_float_array() == floats.astype(np.float64).tolist()
+
+    def test_empty_arrays(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array([])
+        encoder.add_float_array([])
+        decoder = DamDecoder(encoder.finish())
+        assert decoder.decode_int_array() == []
+        assert decoder.decode_float_array() == []
+
+    def test_invalid_int_array(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array([1.5, 2.5])
+        with pytest.raises(TypeError):
+            encoder.finish()
+
+    def test_truncated_buffer(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_float_array(FLOAT_ARRAY)
+        decoder = DamDecoder(encoder.finish()[:-8])
+        with pytest.raises(RuntimeError):
+            decoder.decode_float_array()
+
+    def test_decoded_array_is_read_only(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(INT_ARRAY)
+        buffer = bytearray(encoder.finish())
+        int_array = DamDecoder(buffer).decode_int_array(as_array=True)
+        assert not int_array.flags.writeable
+        with pytest.raises(ValueError):
+            int_array[0] = 0
+
+    def test_large_array(self):
+        values = np.arange(10_000_000, dtype=np.float64) * 0.5
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_float_array(values)
+        decoded = DamDecoder(encoder.finish()).decode_float_array(as_array=True)
+        assert np.array_equal(decoded, values)
@@ -0,0 +1,141 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+from types import SimpleNamespace
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import serialization
+
+from nvflare.fuel.f3.cellnet.cell_cipher import GCM_TAG_LENGTH, CipherMode, SimpleCellCipher
+from nvflare.fuel.f3.cellnet.core_cell import CoreCell
+from nvflare.fuel.f3.cellnet.credential_manager import CredentialManager
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.drivers.driver_params import DriverParams
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.message import Message
+from nvflare.lighter.utils import Identity, generate_cert, generate_keys
+
+
+@pytest.fixture(scope="module")
+def certs():
+    root_key, root_pub_key = generate_keys()
+    root_cert = generate_cert(Identity("root"), Identity("root"), root_key, root_pub_key, ca=True)
+    site_key, site_pub_key = generate_keys()
+    site_cert = generate_cert(Identity("site-1"), Identity("root"), root_key, site_pub_key)
+    return root_cert, site_key, site_cert
+
+
+def _cipher(certs, **kwargs):
+    root_cert, site_key, site_cert = certs
+    return SimpleCellCipher(root_cert, site_key, site_cert, **kwargs)
+
+
+class TestChunkedCellCipher:
+    @pytest.mark.parametrize("size", [0, 1, 1000, 1024, 1025, 10 * 1024 + 7])
+    @pytest.mark.parametrize("num_threads", [1, 3])
+    def test_round_trip(self, certs, size, num_threads):
+        cipher = _cipher(certs, chunk_size=1024, num_threads=num_threads)
+        cert = certs[2]
+        data = os.urandom(size)
+        encrypted = cipher.encrypt_chunked(data, cert)
+        assert bytes(cipher.decrypt_chunked(encrypted, cert)) == data
+
+    def test_buffer_input(self, certs):
+        cipher = _cipher(certs, chunk_size=1024)
+        cert = certs[2]
+        data = bytearray(os.urandom(5000))
+        encrypted = cipher.encrypt_chunked(memoryview(data)[100:], cert)
+        assert bytes(cipher.decrypt_chunked(memoryview(encrypted), cert)) == data[100:]
+
+    def test_chunks_are_authenticated(self, certs):
+        cipher = _cipher(certs, chunk_size=1024)
+        cert = certs[2]
+        encrypted = cipher.encrypt_chunked(os.urandom(4000), cert)
+
+        tampered = bytearray(encrypted)
+        tampered[-2000] ^= 1
+        with pytest.raises(InvalidTag):
+            cipher.decrypt_chunked(tampered, cert)
+
+        # drop the last chunk: the message size is authenticated in every chunk
+        truncated = encrypted[: -(4000 - 3 * 1024) - GCM_TAG_LENGTH]
+        with pytest.raises(InvalidTag):
+            cipher.decrypt_chunked(truncated, cert)
+
+        with pytest.raises(InvalidTag):
+            cipher.decrypt_chunked(encrypted[:-1], cert)
+
+        with pytest.raises(ValueError):
+            cipher.decrypt_chunked(encrypted[:530], cert)
+
+    def test_cbc_unchanged(self, certs):
+        cipher = _cipher(certs, chunk_size=1024, num_threads=2)
+        cert = certs[2]
+        data = os.urandom(3000)
+        assert cipher.decrypt(cipher.encrypt(data, cert), cert) == data
+
+    def test_invalid_chunk_size(self, certs):
+        with pytest.raises(ValueError):
+            _cipher(certs, chunk_size=0)
+
+
+def _secure_cell(certs, tmp_path, cipher_mode):
+    root_cert, site_key, site_cert = certs
+    files = {
+        DriverParams.CA_CERT: root_cert.public_bytes(serialization.Encoding.PEM),
+        DriverParams.CLIENT_CERT: site_cert.public_bytes(serialization.Encoding.PEM),
+        DriverParams.CLIENT_KEY: site_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ),
+    }
+    conn_props = {}
+    for key, content in files.items():
+        path = tmp_path / key.value
+        path.write_bytes(content)
+        conn_props[key] = str(path)
+
+    cell = CoreCell.__new__(CoreCell)
+    cell.logger = logging.getLogger("cell_cipher_test")
+    cell.credential_manager = CredentialManager(Endpoint("site-1", conn_props=conn_props))
+    cell.credential_manager.cipher_mode = cipher_mode
+    cell.cert_ex = SimpleNamespace(get_certificate=lambda fqcn: files[DriverParams.CLIENT_CERT])
+    return cell
+
+
+@pytest.mark.parametrize("cipher_mode", [CipherMode.CBC, CipherMode.GCM])
+def test_secure_message_payload(certs, tmp_path, cipher_mode):
+    cell = _secure_cell(certs, tmp_path, cipher_mode)
+    payload = bytearray(os.urandom(300 * 1024))
+    message = Message(
+        headers={
+            MessageHeaderKey.SECURE: True,
+            MessageHeaderKey.DESTINATION: "site-1",
+            MessageHeaderKey.ORIGIN: "site-1",
+        },
+        payload=payload,
+    )
+
+    cell.encrypt_payload(message)
+    assert message.get_header(MessageHeaderKey.ENCRYPTED)
+    assert message.get_header(MessageHeaderKey.CIPHER_MODE) == (None if cipher_mode == CipherMode.CBC else cipher_mode)
+
+    # the receiver picks the mode from the message, not from its own config
+    cell.credential_manager.cipher_mode = CipherMode.CBC
+    cell.decrypt_payload(message)
+    assert bytes(message.payload) == payload
+    assert message.get_header(MessageHeaderKey.ENCRYPTED) is None
+    assert message.get_header(MessageHeaderKey.CIPHER_MODE) is None
@@ -0,0 +1,56 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock, patch
+
+from nvflare.fuel.f3.cellnet.cell import Adapter, Cell
+from nvflare.fuel.f3.cellnet.defs import CellChannel, MessageHeaderKey, ReturnCode
+from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
+
+
+def _call_adapter(cb):
+    cell = MagicMock()
+    cell.decode_pass_through_channels = set()
+    future = MagicMock()
+    future.headers = {
+        StreamHeaderKey.STREAM_REQ_ID: "stream-1",
+        StreamHeaderKey.CHANNEL: "server_command",
+        StreamHeaderKey.TOPIC: "get_task",
+        MessageHeaderKey.ORIGIN: "site-1",
+        MessageHeaderKey.REQ_ID: "req-1",
+    }
+    future.result.return_value = b""
+    adapter = Adapter(cb=cb, my_info=None, cell=cell)
+    with patch("nvflare.fuel.f3.cellnet.cell.decode_payload"), patch("nvflare.fuel.f3.cellnet.cell.encode_payload"):
+        adapter.call(future)
+    return cell
+
+
+class TestDeferredReply:
+    def test_no_reply_without_defer_is_an_error(self):
+        cell = _call_adapter(MagicMock(return_value=None))
+
+        cell.send_blob.assert_called_once()
+        channel, _, target, reply = cell.send_blob.call_args[0][:4]
+        assert channel == CellChannel.RETURN_ONLY
+        assert target == "site-1"
+        assert reply.get_header(MessageHeaderKey.RETURN_CODE) == ReturnCode.PROCESS_EXCEPTION
+
+    def test_deferred_reply_is_not_sent(self):
+        def cb(request):
+            Cell.defer_reply(request)
+            return None
+
+        cell = _call_adapter(cb)
+        cell.send_blob.assert_not_called()
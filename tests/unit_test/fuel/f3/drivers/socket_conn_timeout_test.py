@@ -15,6 +15,7 @@
 import threading
 from types import SimpleNamespace
 
+import msgpack
 import pytest
 
 from nvflare.fuel.f3.comm_config import CommConfigurator
@@ -23,6 +24,7 @@ from nvflare.fuel.f3.drivers.connector_info import Mode
 from nvflare.fuel.f3.drivers.socket_conn import SocketConnection
 from nvflare.fuel.f3.endpoint import Endpoint
 from nvflare.fuel.f3.sfm.constants import Types
+from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
 from nvflare.fuel.f3.sfm.sfm_conn import SfmConnection
 
 
@@ -53,11 +55,19 @@ class FakeSocket:
         return len(view)
 
 
+class FakeVectorSocket(FakeSocket):
+    def sendmsg(self, buffers):
+        data = b"".join(bytes(b) for b in buffers)
+        sent = self.send_returns.pop(0) if self.send_returns else len(data)
+        self.sent_chunks.append(data[:sent])
+        return sent
+
+
 class TestSocketConnectionSendTimeout:
-    def _make_conn(self, monkeypatch, timeout_sec, send_returns=None):
+    def _make_conn(self, monkeypatch, timeout_sec, send_returns=None, sock_class=FakeSocket):
         monkeypatch.setattr(CommConfigurator, "get_streaming_send_timeout", lambda self, default: float(timeout_sec))
         connector = SimpleNamespace(mode=Mode.ACTIVE, driver=SimpleNamespace(get_name=lambda: "tcp"))
-        sock = FakeSocket(send_returns=send_returns)
+        sock = sock_class(send_returns=send_returns)
         conn = SocketConnection(sock=sock, connector=connector, secure=False)
         return conn, sock
 
@@ -78,6 +88,51 @@ class TestSocketConnectionSendTimeout:
         # Negative path for close-on-timeout change: success send must not close.
         assert conn.closing is False
 
+    def test_send_frame_parts_with_sendmsg_partial_writes(self, monkeypatch):
+        conn, sock = self._make_conn(monkeypatch, timeout_sec=2.0, send_returns=[3, 4, 5], sock_class=FakeVectorSocket)
+        assert conn.vectored
+
+        monkeypatch.setattr(
+            "nvflare.fuel.f3.drivers.socket_conn.select.select",
+            lambda _r, _w, _x, _t: ([], [sock], []),
+        )
+
+        conn.send_frame_parts([b"pre", bytearray(b"head"), memoryview(b"payload")])
+        assert sock.sent_chunks == [b"pre", b"head", b"paylo", b"ad"]
+
+    def test_send_frame_parts_without_sendmsg(self, monkeypatch):
+        conn, sock = self._make_conn(monkeypatch, timeout_sec=2.0)
+        assert not conn.vectored
+
+        monkeypatch.setattr(
+            "nvflare.fuel.f3.drivers.socket_conn.select.select",
+            lambda _r, _w, _x, _t: ([], [sock], []),
+        )
+
+        conn.send_frame_parts([b"pre", b"head", memoryview(b"payload")])
+        assert b"".join(sock.sent_chunks) == b"preheadpayload"
+
+    def test_sfm_frame_parts_match_assembled_frame(self, monkeypatch):
+        conn, sock = self._make_conn(monkeypatch, timeout_sec=2.0, sock_class=FakeVectorSocket)
+        sfm_conn = SfmConnection(conn=conn, local_endpoint=Endpoint("local"))
+
+        monkeypatch.setattr(
+            "nvflare.fuel.f3.drivers.socket_conn.select.select",
+            lambda _r, _w, _x, _t: ([], [sock], []),
+        )
+
+        payload = bytes(range(256)) * 10
+        sfm_conn.send_data(3, 7, {"k": "v"}, memoryview(payload))
+
+        frame = b"".join(sock.sent_chunks)
+        prefix = Prefix.from_bytes(frame)
+        assert prefix.length == len(frame)
+        assert prefix.app_id == 3
+        assert prefix.stream_id == 7
+        headers = msgpack.unpackb(frame[PREFIX_LEN : PREFIX_LEN + prefix.header_len])
+        assert headers == {"k": "v"}
+        assert frame[PREFIX_LEN + prefix.header_len :] == payload
+
     def test_send_frame_timeout_when_socket_not_writable(self, monkeypatch):
         conn, sock = self._make_conn(monkeypatch, timeout_sec=0.01)
 
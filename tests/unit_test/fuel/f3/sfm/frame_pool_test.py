@@ -0,0 +1,191 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from nvflare.fuel.f3.drivers.connector_info import Mode
+from nvflare.fuel.f3.drivers.socket_conn import SocketConnection
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.sfm.conn_manager import ConnManager
+from nvflare.fuel.f3.sfm.constants import Types
+from nvflare.fuel.f3.sfm.frame_pool import MIN_POOLED_SIZE, FramePool
+from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
+from nvflare.fuel.f3.stats_pool import CounterPool
+
+MB = 1024 * 1024
+
+
+class TestFramePool:
+    @pytest.mark.parametrize(
+        "size, expected",
+        [
+            (100, MIN_POOLED_SIZE),
+            (MIN_POOLED_SIZE, MIN_POOLED_SIZE),
+            (2 * MB, 2 * MB),
+            (2 * MB + 100, 2 * MB + MB // 2),
+            (3 * MB + 1, 3 * MB + MB // 2),
+        ],
+    )
+    def test_size_class(self, size, expected):
+        assert FramePool.size_class(size) == expected
+        assert expected - size < max(expected // 4, MIN_POOLED_SIZE)
+
+    def test_reuse_after_release(self):
+        stats = CounterPool("test", "test", [])
+        pool = FramePool(stats=stats)
+
+        frame = pool.acquire(2 * MB + 100)
+        assert len(frame) == 2 * MB + 100
+        assert FramePool.owns(frame)
+        buffer = frame.obj
+        pool.release(frame)
+
+        frame2 = pool.acquire(2 * MB + 200)
+        assert frame2.obj is buffer
+        counters = stats.cat_counters["2560KB"]
+        assert counters["miss"] == 1
+        assert counters["hit"] == 1
+
+    def test_buffers_not_shared_while_in_use(self):
+        pool = FramePool()
+        frame1 = pool.acquire(MB)
+        frame2 = pool.acquire(MB)
+        assert frame1.obj is not frame2.obj
+
+    def test_small_and_large_frames_not_pooled(self):
+        pool = FramePool(max_buffer_size=4 * MB)
+        small = pool.acquire(100)
+        large = pool.acquire(5 * MB)
+        assert isinstance(small, bytearray)
+        assert isinstance(large, bytearray)
+        assert not FramePool.owns(small)
+        assert not FramePool.owns(large)
+
+        # releasing a frame that is not from the pool is a no-op
+        pool.release(small)
+        pool.release(b"abc")
+        assert pool.idle_bytes == 0
+
+    def test_idle_bytes_bounded(self):
+        stats = CounterPool("test", "test", [])
+        pool = FramePool(max_pool_bytes=3 * MB, stats=stats)
+        frames = [pool.acquire(MB) for _ in range(4)]
+        for f in frames:
+            pool.release(f)
+
+        assert pool.idle_bytes == 3 * MB
+        assert stats.cat_counters["1024KB"]["discard"] == 1
+
+    def test_buffer_not_reused_while_payload_alive(self):
+        pool = FramePool()
+        frame = pool.acquire(MB)
+        buffer = frame.obj
+        payload = frame[PREFIX_LEN:]
+        pool.release(frame)
+        assert pool.idle_bytes == 0
+        assert pool.lent_bytes == MB
+
+        frame2 = pool.acquire(MB)
+        assert frame2.obj is not buffer
+        payload[0] = 1
+        assert frame2[PREFIX_LEN] == 0
+
+    def test_lent_buffer_reused_after_payload_dropped(self):
+        pool = FramePool()
+        frame = pool.acquire(MB)
+        buffer = frame.obj
+        array = np.frombuffer(frame[PREFIX_LEN:], dtype=np.uint8)
+        pool.release(frame)
+        assert pool.acquire(MB).obj is not buffer
+
+        del array
+        assert pool.acquire(MB).obj is buffer
+        assert pool.lent_bytes == 0
+
+    def test_lent_bytes_bounded(self):
+        stats = CounterPool("test", "test", [])
+        pool = FramePool(max_pool_bytes=2 * MB, stats=stats)
+        frames = [pool.acquire(MB) for _ in range(3)]
+        payloads = [f[PREFIX_LEN:] for f in frames]
+        for f in frames:
+            pool.release(f)
+
+        assert len(payloads) == 3
+        assert pool.lent_bytes == 2 * MB
+        assert stats.cat_counters["1024KB"]["discard"] == 1
+
+    def test_double_release_ignored(self):
+        pool = FramePool()
+        frame = pool.acquire(MB)
+        pool.release(frame)
+        pool.release(frame)
+        assert pool.idle_bytes == MB
+        assert pool.acquire(MB).obj is not pool.acquire(MB).obj
+
+
+class TestConnManagerPayload:
+    def test_data_payload_is_not_copied(self):
+        pool = FramePool()
+        mgr = ConnManager(local_endpoint=Endpoint(name="test-endpoint"))
+        mgr.frame_pool = pool
+        received = []
+        mgr.receivers[1] = SimpleNamespace(process_message=lambda *args: received.append(args[3]))
+
+        frame = pool.acquire(MB)
+        Prefix(length=MB, type=Types.DATA, app_id=1).to_buffer(frame, 0)
+        frame[PREFIX_LEN:] = b"\x01" * (MB - PREFIX_LEN)
+        buffer = frame.obj
+        mgr.process_frame_task(MagicMock(), frame)
+
+        payload = received[0].payload
+        assert payload.obj is buffer
+        assert len(payload) == MB - PREFIX_LEN
+        assert pool.lent_bytes == MB
+
+        # the buffer is reused once the message is dropped
+        received.clear()
+        del payload
+        assert pool.acquire(MB).obj is buffer
+
+
+class TestSocketReadFrame:
+    def test_read_frame_into_pooled_buffer(self):
+        sender, receiver = socket.socketpair()
+        try:
+            conn = SocketConnection(receiver, SimpleNamespace(mode=Mode.PASSIVE))
+            pool = FramePool()
+            conn.frame_pool = pool
+
+            payload = bytes(range(256)) * 1024
+            prefix = Prefix(length=PREFIX_LEN + len(payload))
+            prefix_buf = bytearray(PREFIX_LEN)
+            prefix.to_buffer(prefix_buf, 0)
+            t = threading.Thread(target=sender.sendall, args=(prefix_buf + payload,), daemon=True)
+            t.start()
+
+            frame = conn.read_frame()
+            t.join()
+            assert FramePool.owns(frame)
+            assert len(frame) == prefix.length
+            assert frame[PREFIX_LEN:] == payload
+            pool.release(frame)
+        finally:
+            sender.close()
+            receiver.close()
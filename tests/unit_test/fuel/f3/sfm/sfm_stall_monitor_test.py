@@ -66,7 +66,7 @@ class DummySendConn:
         self.should_raise = should_raise
         self.send_calls = 0
 
-    def send_frame(self, _frame):
+    def send_frame_parts(self, _parts):
         self.send_calls += 1
         if self.should_raise:
             raise RuntimeError("send failed")
@@ -87,7 +87,7 @@ class BlockingSendConn:
         # Simulate close unblocking a blocked send call.
         self.release_send.set()
 
-    def send_frame(self, _frame):
+    def send_frame_parts(self, _parts):
         self.send_calls += 1
         if self.send_calls == 1:
             self.first_send_entered.set()
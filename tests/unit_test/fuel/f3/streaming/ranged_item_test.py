@@ -0,0 +1,105 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from nvflare.fuel.f3.streaming.ranged_item import (
+    RangedItemAssembler,
+    decode_ranged_item,
+    encode_ranged_item,
+    is_ranged_item,
+    split_ranges,
+)
+
+
+def _bytearray_allocator(key, meta, total_size):
+    dest = bytearray(total_size)
+
+    def _write(start, data):
+        dest[start : start + len(data)] = data
+
+    return dest, _write
+
+
+class TestRangedItem:
+    @pytest.mark.parametrize(
+        "total, size, expected",
+        [
+            (10, 4, [(0, 4), (4, 8), (8, 10)]),
+            (8, 4, [(0, 4), (4, 8)]),
+            (3, 4, [(0, 3)]),
+            (0, 4, []),
+        ],
+    )
+    def test_split_ranges(self, total, size, expected):
+        assert split_ranges(total, size) == expected
+
+    def test_encode_decode(self):
+        item = encode_ranged_item("w", ["float32", [2, 3]], 24, 8, b"abcdefgh")
+        assert is_ranged_item(item)
+        key, meta, total, start, data = decode_ranged_item(item)
+        assert (key, meta, total, start) == ("w", ["float32", [2, 3]], 24, 8)
+        assert bytes(data) == b"abcdefgh"
+
+    def test_range_beyond_total_size(self):
+        item = encode_ranged_item("w", None, 10, 8, b"abcd")
+        with pytest.raises(ValueError, match="exceeds total size"):
+            decode_ranged_item(item)
+
+    def test_not_ranged_item(self):
+        assert not is_ranged_item(b"abc")
+        assert not is_ranged_item(b"NVNPR1" + bytes(10))
+
+    def test_assembler(self):
+        payload = bytes(range(100))
+        items = [encode_ranged_item("k", None, len(payload), s, payload[s:e]) for s, e in split_ranges(100, 30)]
+
+        assembler = RangedItemAssembler()
+        # ranges may arrive in any order
+        for item in reversed(items[1:]):
+            assert assembler.add(item, _bytearray_allocator) == ("k", None)
+        assert assembler.incomplete_keys() == ["k"]
+
+        key, dest = assembler.add(items[0], _bytearray_allocator)
+        assert key == "k"
+        assert dest == payload
+        assert assembler.incomplete_keys() == []
+
+    def test_duplicate_range_rejected(self):
+        payload = bytes(range(100))
+        items = [encode_ranged_item("k", None, len(payload), s, payload[s:e]) for s, e in split_ranges(100, 30)]
+
+        assembler = RangedItemAssembler()
+        assembler.add(items[0], _bytearray_allocator)
+        assembler.add(items[2], _bytearray_allocator)
+        with pytest.raises(ValueError):
+            assembler.add(items[0], _bytearray_allocator)
+        # the sizes of the received ranges add up to the total size, but [60, 90) is missing
+        with pytest.raises(ValueError):
+            assembler.add(encode_ranged_item("k", None, 100, 20, payload[20:60]), _bytearray_allocator)
+        assert assembler.incomplete_keys() == ["k"]
+
+        assert assembler.add(items[1], _bytearray_allocator) == ("k", None)
+        assert assembler.add(items[3], _bytearray_allocator) == ("k", payload)
+
+    def test_received_ranges_merged(self):
+        payload = bytes(range(100))
+        items = [encode_ranged_item("k", None, len(payload), s, payload[s:e]) for s, e in split_ranges(100, 10)]
+
+        assembler = RangedItemAssembler()
+        for i in (1, 3, 5, 7, 9, 2, 4, 6, 8):
+            assembler.add(items[i], _bytearray_allocator)
+        coverage = assembler.pending["k"][3]
+        assert (coverage.starts, coverage.ends) == ([10], [100])
+        assert assembler.add(items[0], _bytearray_allocator) == ("k", payload)
@@ -0,0 +1,95 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+
+import pytest
+
+from nvflare.fuel.utils.fobs import lobs
+from nvflare.fuel.utils.fobs.datum import Datum, DatumType
+
+
+@pytest.fixture
+def datum_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(lobs, "get_datum_dir", lambda: str(tmp_path / "datums"))
+    os.makedirs(tmp_path / "datums")
+    path = str(tmp_path / "src.dat")
+    with open(path, "wb") as f:
+        f.write(os.urandom(3 * 1024 * 1024 + 17))
+    return path
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class TestLobsStreaming:
+    def test_file_datum_via_file(self, tmp_path, datum_file):
+        obj = {"file": Datum.file_datum(datum_file), "blob": b"x" * 2048, "text": "y" * 2048}
+        out_path = str(tmp_path / "obj.lobs")
+        lobs.dump_to_file(obj, out_path, max_value_size=1024)
+
+        result = lobs.load_from_file(out_path)
+        assert result["blob"] == obj["blob"]
+        assert result["text"] == obj["text"]
+        datum = result["file"]
+        assert datum.datum_type == DatumType.FILE
+        assert _read(datum.value) == _read(datum_file)
+
+    def test_file_datum_via_bytes(self, datum_file, monkeypatch):
+        """Without a real file, file datums are copied in windows of MAX_BYTES_PER_READ."""
+        monkeypatch.setattr(lobs, "MAX_BYTES_PER_READ", 64 * 1024)
+        reads = []
+
+        class _Stream(io.BytesIO):
+            def read(self, n=-1):
+                reads.append(n)
+                return super().read(n)
+
+        data = lobs.dump_to_bytes({"file": Datum.file_datum(datum_file)})
+        datum = lobs.load_from_stream(_Stream(data))["file"]
+        assert _read(datum.value) == _read(datum_file)
+        assert max(reads) <= 64 * 1024
+
+    def test_truncated_file_datum(self, tmp_path, datum_file):
+        out_path = str(tmp_path / "obj.lobs")
+        lobs.dump_to_file({"file": Datum.file_datum(datum_file)}, out_path)
+        with open(out_path, "r+b") as f:
+            f.truncate(os.path.getsize(out_path) - 10)
+
+        with pytest.raises(RuntimeError):
+            lobs.load_from_file(out_path)
+
+    def test_blob_datum_read_in_windows(self, monkeypatch):
+        """BLOB sections are read into one buffer of the section size, in windows of MAX_BYTES_PER_READ."""
+        monkeypatch.setattr(lobs, "MAX_BYTES_PER_READ", 1024)
+        reads = []
+
+        class _Stream(io.RawIOBase):
+            # returns fewer bytes than requested, like a socket or a pipe
+            def __init__(self, data):
+                self._src = io.BytesIO(data)
+
+            def readinto(self, b):
+                reads.append(len(b))
+                data = self._src.read(min(len(b), 700))
+                b[: len(data)] = data
+                return len(data)
+
+        blob = os.urandom(10 * 1024 + 3)
+        result = lobs.load_from_stream(_Stream(lobs.dump_to_bytes({"blob": blob}, max_value_size=1024)))
+        assert result["blob"] == blob
+        assert max(reads) <= 1024
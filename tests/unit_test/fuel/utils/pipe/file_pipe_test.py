@@ -13,11 +13,15 @@
 # limitations under the License.
 
 import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from nvflare.fuel.utils.attributes_exportable import ExportMode
 from nvflare.fuel.utils.constants import Mode
+from nvflare.fuel.utils.pipe.dir_watcher import create_dir_watcher
 from nvflare.fuel.utils.pipe.file_pipe import FilePipe
 from nvflare.fuel.utils.pipe.pipe import Message, Topic
 
@@ -194,3 +198,119 @@ class TestFilePipeSendHeartbeatTimeout:
         msg = Message.new_request(Topic.ABORT, "")
         pipe.send(msg, timeout=None)
         pipe.put_f.assert_called_once_with(msg, None)
+
+
+def _inotify_available(tmp_path):
+    watcher = create_dir_watcher(str(tmp_path))
+    if not watcher:
+        return False
+    watcher.close()
+    return True
+
+
+class TestFilePipeNotification:
+    """With inotify, FilePipe must wake up on file changes instead of waiting for the file check interval."""
+
+    def _open_pipes(self, tmp_path, use_inotify=True):
+        root = str(tmp_path / "pipe_root")
+        # a long check interval makes sure the pipes are not woken up by polling
+        passive = FilePipe(mode=Mode.PASSIVE, root_path=root, file_check_interval=5.0, use_inotify=use_inotify)
+        passive.open("test_pipe")
+        active = FilePipe(mode=Mode.ACTIVE, root_path=root, file_check_interval=5.0, use_inotify=use_inotify)
+        active.open("test_pipe")
+        return active, passive
+
+    def test_receive_wakes_up_on_new_file(self, tmp_path):
+        if not _inotify_available(tmp_path):
+            pytest.skip("inotify is not available")
+
+        active, passive = self._open_pipes(tmp_path)
+        try:
+            msg = Message.new_request("train", {"x": 1})
+            sender = threading.Thread(target=active.send, args=(msg, 10.0), daemon=True)
+
+            start = time.time()
+            sender.start()
+            received = passive.receive(timeout=10.0)
+            assert received is not None
+            assert received.msg_id == msg.msg_id
+            assert received.data == {"x": 1}
+
+            # the sender is notified that the file is read
+            sender.join(timeout=10.0)
+            assert not sender.is_alive()
+            assert time.time() - start < 2.0
+        finally:
+            active.close()
+            passive.close()
+
+    def test_receive_times_out(self, tmp_path):
+        active, passive = self._open_pipes(tmp_path)
+        try:
+            passive.file_check_interval = 0.05
+            start = time.time()
+            assert passive.receive(timeout=0.2) is None
+            assert time.time() - start >= 0.2
+        finally:
+            active.close()
+            passive.close()
+
+    def test_close_wakes_up_receiver(self, tmp_path):
+        if not _inotify_available(tmp_path):
+            pytest.skip("inotify is not available")
+
+        active, passive = self._open_pipes(tmp_path)
+        results = []
+        receiver = threading.Thread(target=lambda: results.append(active.receive(timeout=30.0)), daemon=True)
+        receiver.start()
+        time.sleep(0.1)
+        active.close()
+        receiver.join(timeout=5.0)
+        assert not receiver.is_alive()
+        assert results == [None]
+        passive.close()
+
+    def test_polling_fallback(self, tmp_path):
+        active, passive = self._open_pipes(tmp_path, use_inotify=False)
+        try:
+            assert not passive._watchers
+            active.file_check_interval = passive.file_check_interval = 0.05
+            msg = Message.new_request("train", "data")
+            sender = threading.Thread(target=active.send, args=(msg, 10.0), daemon=True)
+            sender.start()
+            received = passive.receive(timeout=10.0)
+            sender.join(timeout=10.0)
+            assert received.msg_id == msg.msg_id
+            assert received.data == "data"
+        finally:
+            active.close()
+            passive.close()
+
+    def test_watched_wait_is_capped_at_check_interval(self, tmp_path):
+        pipe = FilePipe(mode=Mode.PASSIVE, root_path=str(tmp_path), file_check_interval=0.5)
+        watcher = MagicMock()
+        pipe._watchers["d"] = watcher
+
+        # changes made from another host are not notified, so a wait without timeout must not block forever
+        pipe._wait_for_change("d", 3, None)
+        watcher.wait_for_change.assert_called_once_with(3, 0.5)
+
+        watcher.reset_mock()
+        pipe._wait_for_change("d", 3, 0.2)
+        watcher.wait_for_change.assert_called_once_with(3, 0.2)
+
+
+class TestFilePipeExport:
+    @pytest.mark.parametrize(
+        "export_mode, expected_mode", [(ExportMode.SELF, Mode.PASSIVE), (ExportMode.PEER, Mode.ACTIVE)]
+    )
+    def test_export_keeps_wait_settings(self, tmp_path, export_mode, expected_mode):
+        pipe = FilePipe(mode=Mode.PASSIVE, root_path=str(tmp_path), file_check_interval=2.0, use_inotify=False)
+        class_path, args = pipe.export(export_mode)
+        assert class_path == "nvflare.fuel.utils.pipe.file_pipe.FilePipe"
+        assert args == {
+            "mode": expected_mode,
+            "root_path": str(tmp_path),
+            "file_check_interval": 2.0,
+            "use_inotify": False,
+        }
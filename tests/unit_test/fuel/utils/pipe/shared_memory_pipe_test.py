@@ -0,0 +1,155 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
+from nvflare.app_common.decomposers import common_decomposers
+from nvflare.app_common.decomposers.numpy_decomposers import NumpyArrayDecomposer
+from nvflare.fuel.utils import fobs
+from nvflare.fuel.utils.attributes_exportable import ExportMode
+from nvflare.fuel.utils.constants import Mode
+from nvflare.fuel.utils.pipe.pipe import Message
+from nvflare.fuel.utils.pipe.shared_memory_pipe import SHM_REF_KEY, SharedMemoryPipe
+
+MIN_SHM_SIZE = 1024
+
+
+@pytest.fixture
+def pipes(tmp_path):
+    common_decomposers.register()
+    # register() is a no-op once it has run, even if another test reset fobs since
+    fobs.register(NumpyArrayDecomposer)
+    root = str(tmp_path / "pipe_root")
+    shm_path = str(tmp_path / "shm")
+    os.makedirs(shm_path)
+    passive = SharedMemoryPipe(Mode.PASSIVE, root, min_shm_size=MIN_SHM_SIZE, shm_path=shm_path)
+    passive.open("test_pipe")
+    active = SharedMemoryPipe(Mode.ACTIVE, root, min_shm_size=MIN_SHM_SIZE, shm_path=shm_path)
+    active.open("test_pipe")
+    yield active, passive
+    active.close()
+    passive.close()
+
+
+def _send_and_receive(sender, receiver, data):
+    msg = Message.new_request("train", data)
+    result = {}
+    t = threading.Thread(target=lambda: result.update(sent=sender.send(msg, timeout=10.0)), daemon=True)
+    t.start()
+    received = receiver.receive(timeout=10.0)
+    t.join(timeout=10.0)
+    assert result["sent"] is True
+    return received
+
+
+class TestSharedMemoryPipe:
+    def test_arrays_round_trip(self, pipes):
+        active, passive = pipes
+        weights = {
+            "c": np.arange(4096, dtype=np.float32).reshape(64, 64),
+            "f": np.asfortranarray(np.random.rand(40, 30)),
+            "small": np.ones(3),
+            "nested": [np.arange(1000, dtype=np.int64)],
+        }
+        shareable = DXO(data_kind=DataKind.WEIGHTS, data=weights).to_shareable()
+
+        received = _send_and_receive(active, passive, shareable)
+        result = from_shareable(received.data).data
+        for key in ("c", "f", "small"):
+            np.testing.assert_array_equal(result[key], weights[key])
+            assert result[key].dtype == weights[key].dtype
+        np.testing.assert_array_equal(result["nested"][0], weights["nested"][0])
+        assert result["f"].flags.f_contiguous
+
+        # the arrays are created over the shared memory, and are writable
+        assert not result["c"].flags.owndata
+        result["c"][0, 0] = -1.0
+        assert weights["c"][0, 0] == 0.0
+
+        # the sender's data is not changed
+        assert isinstance(shareable["DXO"]["data"]["c"], np.ndarray)
+
+        # the receiver removes the segment once it's mapped
+        assert os.listdir(active._segment_dir) == []
+
+    def test_tensors_round_trip(self, pipes):
+        torch = pytest.importorskip("torch")
+        active, passive = pipes
+        weights = {
+            "w": torch.randn(64, 64),
+            "bf16": torch.randn(32, 64).to(torch.bfloat16),
+            "t": torch.randn(64, 32).t(),
+        }
+
+        received = _send_and_receive(active, passive, weights)
+        for key, value in weights.items():
+            assert isinstance(received.data[key], torch.Tensor)
+            assert received.data[key].dtype == value.dtype
+            assert torch.equal(received.data[key], value)
+
+    def test_non_cpu_tensors_not_in_shared_memory(self, pipes):
+        torch = pytest.importorskip("torch")
+        active, _ = pipes
+        data = {"w": torch.empty(64, 64, device="meta")}
+        new_data, segments = active._export_arrays(data)
+        assert new_data is data
+        assert segments == []
+
+    def test_segment_removed_when_not_received(self, pipes):
+        active, _ = pipes
+        sent = active.send(Message.new_request("train", {"x": np.zeros(1024)}), timeout=0.1)
+        assert sent is False
+        assert os.listdir(active._segment_dir) == []
+
+    def test_small_data_not_in_shared_memory(self, pipes):
+        active, _ = pipes
+        data = {"x": np.zeros(4)}
+        new_data, segments = active._export_arrays(data)
+        assert new_data is data
+        assert segments == []
+
+        new_data, segments = active._export_arrays({"x": np.zeros(1024)})
+        assert SHM_REF_KEY in new_data["x"]
+        assert len(segments) == 1
+        os.remove(segments[0])
+
+    @pytest.mark.parametrize("segment", ["other", "nvflare_other_pipe_x/seg", "nvflare_test_pipe_x/../seg"])
+    def test_segment_outside_pipe_dirs_rejected(self, pipes, segment):
+        active, passive = pipes
+        path = os.path.join(os.path.dirname(passive._segment_dir), segment)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(bytes(1024))
+
+        ref = {"kind": "np", "dtype": "<f8", "shape": [128], "order": "C", "offset": 0, "nbytes": 1024}
+        ref["segment"] = path
+        with pytest.raises(ValueError):
+            _send_and_receive(active, passive, {"x": {SHM_REF_KEY: ref}})
+        # the file is neither mapped nor removed
+        assert os.path.exists(path)
+
+    def test_export(self, pipes):
+        active, _ = pipes
+        class_path, args = active.export(ExportMode.PEER)
+        assert class_path == "nvflare.fuel.utils.pipe.shared_memory_pipe.SharedMemoryPipe"
+        assert args["mode"] == Mode.PASSIVE
+        assert args["min_shm_size"] == MIN_SHM_SIZE
+        assert args["shm_path"] == active.shm_path
+        assert args["file_check_interval"] == active.file_check_interval
+        assert args["use_inotify"] == active.use_inotify
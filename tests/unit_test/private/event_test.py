@@ -0,0 +1,96 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from nvflare.apis.fl_component import FLComponent
+from nvflare.apis.fl_context import FLContext
+from nvflare.private.event import EventDispatcher
+
+
+class _Handler(FLComponent):
+    def __init__(self, events=None):
+        super().__init__()
+        self.received = []
+        if events is not None:
+            self.subscribe_events(events)
+
+    def handle_event(self, event_type: str, fl_ctx: FLContext):
+        self.received.append(event_type)
+
+
+class _CallbackHandler(_Handler):
+    def __init__(self):
+        super().__init__(events=[])
+        self.register_event_handler("cb_event", self._cb)
+
+    def _cb(self, event_type: str, fl_ctx: FLContext):
+        self.received.append(f"cb:{event_type}")
+
+
+class TestEventDispatcher:
+    def test_events_go_to_subscribers(self):
+        all_events = _Handler()
+        only_a = _Handler(events=["a"])
+        no_events = _Handler(events=[])
+        with_cb = _CallbackHandler()
+        handlers = [all_events, only_a, no_events, with_cb]
+        dispatcher = EventDispatcher(scope="event_test_subscribers")
+
+        for event in ["a", "b", "cb_event"]:
+            dispatcher.fire_event(event, handlers, FLContext())
+
+        assert all_events.received == ["a", "b", "cb_event"]
+        assert only_a.received == ["a"]
+        assert no_events.received == []
+        assert with_cb.received == ["cb:cb_event"]
+        assert dispatcher.get_subscribers("b", handlers) == [all_events]
+
+    def test_table_follows_added_handlers(self):
+        handlers = [_Handler(events=["a"])]
+        dispatcher = EventDispatcher(scope="event_test_added")
+        assert dispatcher.get_subscribers("a", handlers) == handlers
+
+        late = _Handler(events=["a"])
+        handlers.append(late)
+        dispatcher.fire_event("a", handlers, FLContext())
+        assert late.received == ["a"]
+
+    def test_table_follows_subscriptions(self):
+        handler = _Handler(events=["a"])
+        handlers = [handler]
+        dispatcher = EventDispatcher(scope="event_test_subscriptions")
+        dispatcher.fire_event("b", handlers, FLContext())
+        assert handler.received == []
+
+        # subscribing after the first fire of the event must not be missed
+        handler.subscribe_events("b")
+        dispatcher.fire_event("b", handlers, FLContext())
+        assert handler.received == ["b"]
+
+        handler.register_event_handler("c", lambda event_type, fl_ctx: handler.received.append(f"cb:{event_type}"))
+        dispatcher.fire_event("c", handlers, FLContext())
+        assert handler.received == ["b", "cb:c"]
+
+    def test_timing_stats(self):
+        handler = _Handler(events=["a"])
+        dispatcher = EventDispatcher(scope="event_test_stats")
+        dispatcher.fire_event("a", [handler, _Handler(events=[])], FLContext())
+
+        assert "a" in dispatcher.dispatch_stats_pool.cat_bins
+        assert list(dispatcher.handling_stats_pool.cat_bins.keys()) == ["a:_Handler"]
+
+    def test_invalid_handler(self):
+        with pytest.raises(TypeError):
+            EventDispatcher(scope="event_test_invalid").fire_event("a", [object()], FLContext())
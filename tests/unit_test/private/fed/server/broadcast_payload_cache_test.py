@@ -0,0 +1,108 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import uuid
+
+import numpy as np
+
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
+from nvflare.apis.shareable import ReservedHeaderKey, make_copy
+from nvflare.app_common.decomposers.numpy_decomposers import NumpyArrayDecomposer
+from nvflare.fuel.utils import fobs
+from nvflare.fuel.utils.fobs.pre_encoded import PreEncoded
+from nvflare.fuel.utils.msg_root_utils import delete_msg_root
+from nvflare.private.fed.server.broadcast_payload_cache import BroadcastPayloadCache, encode_content
+
+
+def _task_data():
+    data = DXO(data_kind=DataKind.WEIGHTS, data={"w": np.arange(1000, dtype=np.float32)}).to_shareable()
+    data.set_header(ReservedHeaderKey.TASK_ID, "t1")
+    return data
+
+
+class TestBroadcastPayloadCache:
+    def test_encoded_content_is_decoded_as_original(self):
+        fobs.register(NumpyArrayDecomposer)
+        data = _task_data()
+        content = encode_content(data)
+        assert all(isinstance(v, PreEncoded) for v in content.values())
+
+        for task_id in ["t1", "t2"]:
+            client_data = make_copy(data)
+            client_data.update(content)
+            client_data.set_header(ReservedHeaderKey.TASK_ID, task_id)
+
+            result = fobs.loads(fobs.dumps(client_data))
+            assert result.get_header(ReservedHeaderKey.TASK_ID) == task_id
+            dxo = from_shareable(result)
+            assert dxo.data_kind == DataKind.WEIGHTS
+            np.testing.assert_array_equal(dxo.data["w"], np.arange(1000, dtype=np.float32))
+
+    def test_filtered_and_encoded_once(self):
+        cache = BroadcastPayloadCache()
+        msg_root_id = str(uuid.uuid4())
+        num_clients = 4
+        filter_calls = []
+        results = []
+        lock = threading.Lock()
+
+        def _filter():
+            filter_calls.append(1)
+            return _task_data()
+
+        def _get_task():
+            payload = cache.get_payload(msg_root_id, "train", num_clients)
+            filtered, is_producer = payload.get_filtered(_filter)
+            if is_producer:
+                content = encode_content(filtered)
+                payload.set_content(content)
+            else:
+                content = payload.wait_content()
+            cache.record(payload, not is_producer)
+            with lock:
+                results.append(content)
+
+        threads = [threading.Thread(target=_get_task) for _ in range(num_clients)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(filter_calls) == 1
+        assert len(results) == num_clients
+        assert all(r is results[0] for r in results)
+        assert cache.get_task_stats(msg_root_id) == (num_clients - 1, 1)
+
+        # the payload was used by all targets: another request of the task gets a new payload
+        assert cache.get_num_payloads() == 0
+        payload = cache.get_payload(msg_root_id, "train", num_clients)
+        _, is_producer = payload.get_filtered(_task_data)
+        assert is_producer
+
+        delete_msg_root(msg_root_id)
+        assert cache.get_num_payloads() == 0
+        assert cache.get_task_stats(msg_root_id) == (0, 0)
+
+    def test_failed_producer(self):
+        cache = BroadcastPayloadCache()
+        payload = cache.get_payload(str(uuid.uuid4()), "train", 2)
+        _, is_producer = payload.get_filtered(_task_data)
+        assert is_producer
+        payload.set_content(None)
+
+        # the other client does not wait forever, and serializes the data itself
+        _, is_producer = payload.get_filtered(_task_data)
+        assert not is_producer
+        assert payload.wait_content() is None
@@ -25,13 +25,16 @@ from nvflare.apis.app_validation import AppValidationKey
 from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_constant import (
     SUBMIT_TOKEN_JOB_DELETED_STATUS,
+    AdminCommandNames,
     FLContextKey,
     ReturnCode,
     ServerCommandKey,
     WorkspaceConstants,
 )
+from nvflare.apis.impl.job_def_manager import SimpleJobDefManager
 from nvflare.apis.job_def import JobMetaKey, RunStatus, SubmitRecordKey, SubmitRecordState
 from nvflare.apis.shareable import Shareable
+from nvflare.app_common.storages.filesystem_storage import FilesystemStorage
 from nvflare.fuel.hci.proto import MetaKey, MetaStatusValue
 from nvflare.fuel.hci.server.authz import PreAuthzReturnCode
 from nvflare.fuel.hci.server.constants import ConnProps
@@ -1176,6 +1179,33 @@ def test_list_jobs_filters_legacy_jobs_into_default_study(monkeypatch):
     assert conn.tables[0].rows[0][1][MetaKey.JOB_ID] == "legacy-job"
 
 
+def test_list_jobs_from_job_index(monkeypatch, tmp_path):
+    monkeypatch.setattr(job_cmds_module, "JobDefManagerSpec", object)
+    job_def_manager = SimpleJobDefManager(
+        uri_root=str(tmp_path / "jobs"), index_path=str(tmp_path / "workspace" / "jobs_meta_index.sqlite")
+    )
+    monkeypatch.setattr(job_def_manager, "_get_job_store", lambda fl_ctx: FilesystemStorage())
+    engine = _FakeListEngine([])
+    engine.job_def_manager = job_def_manager
+    job_ids = []
+    for name in ["a", "b", "c"]:
+        meta = job_def_manager.create({JobMetaKey.JOB_NAME.value: name}, b"data", engine.new_context())
+        job_ids.append(meta[JobMetaKey.JOB_ID.value])
+
+    conn = _MockConnection(app_ctx=engine, props={ConnProps.ACTIVE_STUDY: "default"})
+    JobCommandModule().list_jobs(conn, ["list_jobs", "-m", "2"])
+
+    assert conn.errors == []
+    assert [row[1][MetaKey.JOB_ID] for row in conn.tables[0].rows] == job_ids[1:]
+
+    conn = _MockConnection(app_ctx=engine)
+    JobCommandModule().rebuild_job_index(conn, [AdminCommandNames.REBUILD_JOB_INDEX])
+
+    assert conn.errors == []
+    assert conn.strings[0][0] == "Job index rebuilt with 3 jobs."
+    job_def_manager.job_index.close()
+
+
 def test_list_jobs_defaults_to_default_study_when_session_study_missing(monkeypatch):
     monkeypatch.setattr(job_cmds_module, "JobDefManagerSpec", object)
     jobs = [
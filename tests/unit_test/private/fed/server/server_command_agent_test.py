@@ -12,12 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from unittest.mock import MagicMock
 
+from nvflare.apis.client import Client
+from nvflare.apis.fl_constant import FLContextKey, ServerCommandKey, ServerCommandNames
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
 from nvflare.fuel.f3.cellnet.core_cell import ReturnCode
 from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
 from nvflare.fuel.f3.message import Message as CellMessage
+from nvflare.private.defs import CellMessageHeaderKeys, SpecialTaskName, TaskConstant
 from nvflare.private.fed.server.server_command_agent import ServerCommandAgent
+from nvflare.private.fed.server.server_commands import ServerCommands
+from nvflare.private.fed.server.task_request_parker import TaskRequestParker
 
 
 class TestAuxCommunicateAuthCheck:
@@ -45,3 +53,105 @@ class TestAuxCommunicateAuthCheck:
         assert not mock_engine.dispatch.called, "engine.dispatch should NOT be called when authentication fails"
         assert result is not None, "aux_communicate should return an error reply, not None"
         assert result.get_header(MessageHeaderKey.RETURN_CODE) == ReturnCode.AUTHENTICATION_ERROR
+
+
+class _GetTaskCommand:
+    """Gives out a task once one is available, like GetTaskCommand."""
+
+    def __init__(self):
+        self.task_available = False
+        self.peer_ctxs = []
+
+    def get_state_check(self, fl_ctx):
+        return {}
+
+    def process(self, data, fl_ctx):
+        self.peer_ctxs.append(data.get_peer_context())
+        data.set_peer_context(FLContext())
+        reply = Shareable()
+        reply.set_header(TaskConstant.WAIT_TIME, 2.0)
+        reply.set_header(ServerCommandKey.TASK_NAME, "train" if self.task_available else SpecialTaskName.TRY_AGAIN)
+        return reply
+
+
+class TestGetTaskLongPoll:
+    def _make_agent(self, monkeypatch, parker):
+        command = _GetTaskCommand()
+        monkeypatch.setattr(ServerCommands, "get_command", staticmethod(lambda name: command))
+
+        runner = MagicMock()
+        runner.task_request_parker = parker
+        fl_ctx = FLContext()
+        fl_ctx.set_prop(FLContextKey.RUNNER, runner, private=True, sticky=False)
+        engine = MagicMock()
+        engine.new_context.return_value.__enter__ = MagicMock(return_value=fl_ctx)
+        engine.new_context.return_value.__exit__ = MagicMock(return_value=False)
+        engine.server.authentication_check.return_value = None
+        engine.server.client_manager.clients = {"tok-1": Client("site-1", "tok-1")}
+
+        agent = ServerCommandAgent(engine, MagicMock())
+        return agent, command
+
+    @staticmethod
+    def _make_request(long_poll_timeout):
+        data = Shareable()
+        data.set_peer_context(FLContext())
+        if long_poll_timeout:
+            data.set_header(ServerCommandKey.LONG_POLL_TIMEOUT, long_poll_timeout)
+        request = CellMessage(payload=data)
+        request.set_header(MessageHeaderKey.TOPIC, ServerCommandNames.GET_TASK)
+        request.set_header(CellMessageHeaderKeys.TOKEN, "tok-1")
+        return request
+
+    def test_request_parked_until_task_available(self, monkeypatch):
+        parker = TaskRequestParker()
+        agent, command = self._make_agent(monkeypatch, parker)
+        request = self._make_request(30.0)
+
+        assert agent.execute_command(request) is None
+        assert parker.get_num_parked() == 1
+        agent.cell.defer_reply.assert_called_once_with(request)
+        assert not agent.cell.reply_to_request.called
+
+        command.task_available = True
+        parker.notify(["site-1"])
+        deadline = time.time() + 5.0
+        while not agent.cell.reply_to_request.called and time.time() < deadline:
+            time.sleep(0.01)
+        parker.close()
+
+        replied_request, reply = agent.cell.reply_to_request.call_args[0]
+        assert replied_request is request
+        assert reply.get_header(MessageHeaderKey.RETURN_CODE) == ReturnCode.OK
+        assert reply.payload.get_header(ServerCommandKey.TASK_NAME) == "train"
+        assert reply.payload.get_header(TaskConstant.WAIT_TIME) == 0.0
+
+        # the request is processed again with the peer context of the client
+        assert command.peer_ctxs[0] is command.peer_ctxs[1]
+
+    def test_no_long_poll(self, monkeypatch):
+        parker = TaskRequestParker()
+        agent, _ = self._make_agent(monkeypatch, parker)
+
+        reply = agent.execute_command(self._make_request(None))
+        assert reply.payload.get_header(ServerCommandKey.TASK_NAME) == SpecialTaskName.TRY_AGAIN
+        assert reply.payload.get_header(TaskConstant.WAIT_TIME) == 2.0
+        assert parker.get_num_parked() == 0
+
+    def test_parker_full(self, monkeypatch):
+        parker = TaskRequestParker(max_parked=0)
+        agent, _ = self._make_agent(monkeypatch, parker)
+
+        reply = agent.execute_command(self._make_request(30.0))
+        assert reply.payload.get_header(ServerCommandKey.TASK_NAME) == SpecialTaskName.TRY_AGAIN
+        assert reply.payload.get_header(TaskConstant.WAIT_TIME) == 2.0
+
+    def test_no_process_result(self, monkeypatch):
+        parker = TaskRequestParker()
+        agent, command = self._make_agent(monkeypatch, parker)
+        command.process = MagicMock(return_value=None)
+
+        reply = agent.execute_command(self._make_request(30.0))
+        assert reply.get_header(MessageHeaderKey.RETURN_CODE) == ReturnCode.PROCESS_EXCEPTION
+        assert parker.get_num_parked() == 0
+        assert not agent.cell.defer_reply.called
@@ -0,0 +1,97 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from nvflare.private.fed.server.task_request_parker import TaskRequestParker
+
+
+class _Resumed:
+    def __init__(self):
+        self.names = []
+        self.event = threading.Event()
+
+    def cb(self, name):
+        def _resume():
+            self.names.append(name)
+            self.event.set()
+
+        return _resume
+
+    def wait(self, count, timeout=5.0):
+        deadline = time.time() + timeout
+        while len(self.names) < count and time.time() < deadline:
+            time.sleep(0.01)
+        return sorted(self.names)
+
+
+@pytest.fixture
+def parker():
+    p = TaskRequestParker(max_parked=2)
+    yield p
+    p.close()
+
+
+class TestTaskRequestParker:
+    def test_notify_resumes_clients(self, parker):
+        resumed = _Resumed()
+        seq = parker.get_seq()
+        assert parker.park("site-1", resumed.cb("site-1"), 30.0, seq)
+        assert parker.park("site-2", resumed.cb("site-2"), 30.0, seq)
+        assert parker.get_num_parked() == 2
+
+        parker.notify(["site-2", "site-3"])
+        assert resumed.wait(1) == ["site-2"]
+        assert parker.get_num_parked() == 1
+
+        parker.notify()
+        assert resumed.wait(2) == ["site-1", "site-2"]
+        assert parker.get_num_parked() == 0
+
+    def test_timeout_resumes_request(self, parker):
+        resumed = _Resumed()
+        start = time.time()
+        assert parker.park("site-1", resumed.cb("site-1"), 0.2, parker.get_seq())
+        assert resumed.event.wait(5.0)
+        assert time.time() - start >= 0.2
+        assert parker.get_num_parked() == 0
+
+    def test_notified_since_seq(self, parker):
+        resumed = _Resumed()
+        seq = parker.get_seq()
+        parker.notify(["site-1"])
+
+        # a task became available while the request was being processed
+        assert parker.park("site-1", resumed.cb("site-1"), 30.0, seq)
+        assert resumed.wait(1) == ["site-1"]
+        assert parker.get_num_parked() == 0
+
+    def test_limits(self, parker):
+        resumed = _Resumed()
+        seq = parker.get_seq()
+        assert not parker.park("site-1", resumed.cb("site-1"), 0, seq)
+        assert parker.park("site-1", resumed.cb("old"), 30.0, seq)
+        assert parker.park("site-2", resumed.cb("site-2"), 30.0, seq)
+        assert not parker.park("site-3", resumed.cb("site-3"), 30.0, seq)
+
+        # a new request of the same client replaces the old one
+        assert parker.park("site-1", resumed.cb("site-1"), 30.0, seq)
+        assert resumed.wait(1) == ["old"]
+
+        parker.close()
+        assert resumed.wait(3) == ["old", "site-1", "site-2"]
+        assert not parker.park("site-1", resumed.cb("site-1"), 30.0, parker.get_seq())